@@ -883,7 +883,9 @@ void CCompositionProcessorEngine::SetupConfiguration()
     _isWildcard = TRUE;
     _isDisableWildcardAtFirst = TRUE;
     _hasMakePhraseFromText = TRUE;
-    _isKeystrokeSort = TRUE;
+    // The dictionary is written in candidate order by read_sign_list.py, so
+    // candidates come out of the lookup already sorted.
+    _isKeystrokeSort = FALSE;
     _candidateWndWidth = CAND_WIDTH;
 
     SetInitialCandidateListRange();
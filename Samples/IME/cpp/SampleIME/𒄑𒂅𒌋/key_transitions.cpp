@@ -0,0 +1,27 @@
+﻿#include "𒄑𒂅𒌋/key_transitions.h"
+
+#include <bit>
+
+#include "𒄑𒂅𒌋/key_transitions_table.h"
+
+namespace 𒄑𒂅𒌋 {
+
+std::optional<int> NextKeyState(int const state, wchar_t const c) {
+  // The layout has 47 keys, so this is a bounded search.
+  auto const key = key_transition_layout.find(c);
+  if (key == std::wstring_view::npos) {
+    return std::nullopt;
+  }
+  auto const next_keys = key_transition_table[state].next_keys;
+  if ((next_keys >> key & 1) == 0) {
+    return std::nullopt;
+  }
+  return key_transition_table[state].first_child +
+         std::popcount(next_keys & ((std::uint64_t{1} << key) - 1));
+}
+
+bool IsCompleteKeyState(int const state) {
+  return key_transition_table[state].complete;
+}
+
+}  // namespace 𒄑𒂅𒌋
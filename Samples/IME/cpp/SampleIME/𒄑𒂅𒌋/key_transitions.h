@@ -0,0 +1,31 @@
+﻿#pragma once
+
+#include <cstdint>
+#include <optional>
+
+namespace 𒄑𒂅𒌋 {
+
+// A prefix of the compositions as typed on the layout of
+// key_transitions_table.h, generated by key_transitions.py.  The initial
+// state, the empty prefix, is 0.
+struct KeyTransitionState {
+  // Bit i is set if typing the character at position i of the layout can
+  // still lead to a composition.
+  std::uint64_t next_keys;
+  // The state after the first of the next keys; those after the others
+  // follow in key order.
+  int first_child;
+  // Whether the prefix is itself a composition.
+  bool complete;
+};
+
+// The state after typing c in state, or nullopt if no composition starts with
+// the prefix of state followed by c.  The keystroke buffer can then be
+// rejected without looking up the dictionary.  c must be lowercase, as the
+// compositions are compared case-insensitively.
+std::optional<int> NextKeyState(int state, wchar_t c);
+
+// Whether the prefix of state is a composition.
+bool IsCompleteKeyState(int state);
+
+}  // namespace 𒄑𒂅𒌋
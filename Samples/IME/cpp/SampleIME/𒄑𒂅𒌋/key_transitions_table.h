@@ -0,0 +1,12398 @@
+﻿// Generated by read_sign_list.py from sign_list.csv and layout.txt; do not
+// edit.
+// The states are the prefixes of the compositions, numbered breadth-first; see
+// key_transitions.h.
+
+#pragma once
+
+#include <array>
+#include <string_view>
+
+#include "𒄑𒂅𒌋/key_transitions.h"
+
+namespace 𒄑𒂅𒌋 {
+
+inline constexpr std::wstring_view key_transition_layout{L"⫶1234567890-=qwertyuiop[]\\asdfgḫjkl:ʾzxšvbnmṣṭ/"};
+
+inline constexpr std::array<KeyTransitionState, 12378> key_transition_table{{
+    {0x7EBFFC5BE3FF, 1, false},
+    {0x000000000000, 0, true},
+    {0x4280441887FE, 38, true},
+    {0x4280441887FE, 56, true},
+    {0x0280441807FE, 74, true},
+    {0x0380441807FE, 90, true},
+    {0x4280441807FE, 107, true},
+    {0x028044080756, 124, true},
+    {0x0380440803AE, 136, true},
+    {0x038044080154, 149, true},
+    {0x0380440806EC, 159, true},
+    {0x000004188000, 172, false},
+    {0x000004188000, 176, false},
+    {0x3EB6DC4363FE, 180, true},
+    {0x000004188000, 209, false},
+    {0x000004188000, 213, false},
+    {0x3EB6DC5363FE, 217, true},
+    {0x3EB7DC5BE3FE, 247, true},
+    {0x000004188000, 280, false},
+    {0x3EB7D85363FE, 284, true},
+    {0x000004188000, 314, false},
+    {0x040004188000, 318, true},
+    {0x000000000000, 0, true},
+    {0x000004188000, 323, false},
+    {0x000004188000, 327, false},
+    {0x000004188000, 331, false},
+    {0x000004188000, 335, false},
+    {0x000004188000, 339, false},
+    {0x010000000000, 343, true},
+    {0x000004188000, 344, false},
+    {0x000004188000, 348, false},
+    {0x000004188000, 352, false},
+    {0x000004188000, 356, false},
+    {0x000004188000, 360, false},
+    {0x000004188000, 364, true},
+    {0x000004188000, 368, false},
+    {0x000004188000, 372, false},
+    {0x000000000000, 0, true},
+    {0x028040000576, 376, true},
+    {0x0280400006EC, 386, true},
+    {0x02804000014C, 396, true},
+    {0x038040000490, 403, true},
+    {0x028040000552, 410, true},
+    {0x028040000324, 418, true},
+    {0x038040000054, 425, true},
+    {0x0380400004C8, 432, true},
+    {0x038040000514, 440, true},
+    {0x02804000053E, 448, true},
+    {0x008000000000, 458, false},
+    {0x000000000000, 0, true},
+    {0x000200000000, 459, false},
+    {0x008000000000, 460, false},
+    {0x000000008000, 461, false},
+    {0x000004000000, 462, false},
+    {0x000004080000, 463, false},
+    {0x00000000011C, 465, false},
+    {0x028040000444, 469, true},
+    {0x028040000104, 475, true},
+    {0x028040000090, 480, true},
+    {0x038040000440, 485, true},
+    {0x028040000304, 491, true},
+    {0x028040000010, 497, true},
+    {0x038040000440, 501, true},
+    {0x038040000504, 507, true},
+    {0x038040000010, 514, true},
+    {0x028040000132, 519, true},
+    {0x008000000000, 526, false},
+    {0x000000000000, 0, true},
+    {0x000200000000, 527, false},
+    {0x008000000000, 528, false},
+    {0x000000008000, 529, false},
+    {0x000004000000, 530, false},
+    {0x000004080000, 531, false},
+    {0x000000000008, 533, false},
+    {0x028040000104, 534, true},
+    {0x028040000010, 539, true},
+    {0x028040000440, 543, true},
+    {0x038040000124, 548, true},
+    {0x028040000010, 555, true},
+    {0x028040000480, 559, true},
+    {0x038040000000, 564, true},
+    {0x038040000100, 568, true},
+    {0x038040000040, 573, true},
+    {0x028040000444, 578, true},
+    {0x000000000000, 0, true},
+    {0x000200000000, 584, false},
+    {0x008000000000, 585, false},
+    {0x000000008000, 586, false},
+    {0x000004000000, 587, false},
+    {0x000004080000, 588, false},
+    {0x038040000400, 590, true},
+    {0x038040000400, 595, true},
+    {0x038040000004, 600, true},
+    {0x038040000000, 605, true},
+    {0x038040000008, 609, true},
+    {0x038040000100, 614, true},
+    {0x038040000020, 619, true},
+    {0x038040000400, 624, true},
+    {0x038040000040, 629, true},
+    {0x038040000000, 634, true},
+    {0x010000000000, 638, true},
+    {0x000200000000, 639, false},
+    {0x008000000000, 640, false},
+    {0x000000008000, 641, false},
+    {0x000004000000, 642, false},
+    {0x000000000002, 643, false},
+    {0x000004080000, 644, false},
+    {0x038040000100, 646, true},
+    {0x038040000000, 651, true},
+    {0x038040000000, 655, true},
+    {0x038040000400, 659, true},
+    {0x038040000000, 664, true},
+    {0x038040000002, 668, true},
+    {0x038040000040, 673, true},
+    {0x038040000008, 678, true},
+    {0x038040000000, 683, true},
+    {0x038040000010, 687, true},
+    {0x010000000000, 692, true},
+    {0x000200000000, 693, false},
+    {0x008000000000, 694, false},
+    {0x000000008000, 695, false},
+    {0x000004000000, 696, false},
+    {0x000004080000, 697, false},
+    {0x000000000040, 699, false},
+    {0x000000000004, 700, false},
+    {0x000000000040, 701, false},
+    {0x000000000100, 702, false},
+    {0x000000000600, 703, false},
+    {0x000000000010, 705, false},
+    {0x000000000002, 706, false},
+    {0x000000000410, 707, true},
+    {0x010000000000, 709, true},
+    {0x008000000000, 710, false},
+    {0x000000008000, 711, false},
+    {0x000004000000, 712, false},
+    {0x000000080000, 713, false},
+    {0x000000000004, 714, false},
+    {0x000000000400, 715, false},
+    {0x000000000010, 716, false},
+    {0x000000000040, 717, false},
+    {0x000000000080, 718, false},
+    {0x000000000400, 719, false},
+    {0x000000000204, 720, false},
+    {0x010000000000, 722, true},
+    {0x008000000000, 723, false},
+    {0x000000008000, 724, false},
+    {0x000004000000, 725, false},
+    {0x000000000002, 726, false},
+    {0x000000080000, 727, false},
+    {0x000000000500, 728, false},
+    {0x000000000404, 730, false},
+    {0x000000000010, 732, false},
+    {0x000000000020, 733, false},
+    {0x010000000000, 734, true},
+    {0x008000000000, 735, false},
+    {0x000000008000, 736, false},
+    {0x000004000000, 737, false},
+    {0x000000000002, 738, false},
+    {0x000000080000, 739, false},
+    {0x000000000100, 740, false},
+    {0x000000000040, 741, false},
+    {0x000000000400, 742, false},
+    {0x000000000400, 743, false},
+    {0x000000000004, 744, false},
+    {0x000000000008, 745, false},
+    {0x000000000480, 746, false},
+    {0x010000000000, 748, true},
+    {0x008000000000, 749, false},
+    {0x000000008000, 750, false},
+    {0x000004000000, 751, false},
+    {0x000000000002, 752, false},
+    {0x000000080000, 753, false},
+    {0x02040003001C, 754, true},
+    {0x0E04104300EC, 761, true},
+    {0x2E841843207C, 774, true},
+    {0x0E041043207C, 791, true},
+    {0x000000000004, 805, true},
+    {0x00820000001C, 806, true},
+    {0x008400010034, 811, true},
+    {0x0C840001005C, 817, false},
+    {0x00000000040E, 826, false},
+    {0x001000000000, 830, true},
+    {0x001000000000, 831, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 832, true},
+    {0x080400000000, 833, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x02000418805E, 835, true},
+    {0x000004000000, 845, true},
+    {0x000000100004, 846, true},
+    {0x000000000000, 0, true},
+    {0x00000C10803C, 848, true},
+    {0x00000418801C, 856, true},
+    {0x00000418800C, 863, true},
+    {0x00000010800C, 869, true},
+    {0x000000100000, 873, true},
+    {0x00040410800C, 874, true},
+    {0x000000008000, 880, true},
+    {0x00000010802C, 881, true},
+    {0x00865C0283FE, 886, true},
+    {0x000400180004, 904, true},
+    {0x0E825C1A81FC, 908, true},
+    {0x080000008018, 928, true},
+    {0x000000000008, 932, true},
+    {0x000000000000, 0, true},
+    {0x0A90180020CE, 933, true},
+    {0x2A82D00023FE, 945, true},
+    {0x2E82D842237E, 963, true},
+    {0x2AA2D842207C, 984, true},
+    {0x1E84C84103FE, 1002, true},
+    {0x0E86D84323FE, 1022, true},
+    {0x1EA6584323FE, 1045, true},
+    {0x1EA6D84321FC, 1069, true},
+    {0x0000000007FE, 1092, false},
+    {0x00100000040E, 1102, true},
+    {0x001000000000, 1107, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000020, 1108, true},
+    {0x000000000000, 0, true},
+    {0x02A05C1B03FE, 1109, true},
+    {0x0000041A0074, 1129, true},
+    {0x000004000000, 1137, false},
+    {0x000000000004, 1138, true},
+    {0x00000000001C, 1139, true},
+    {0x01001C18003C, 1142, true},
+    {0x04000019807C, 1152, true},
+    {0x0400040901FC, 1162, true},
+    {0x0000800800FC, 1173, true},
+    {0x0002101A0000, 1181, true},
+    {0x0014041801FE, 1186, true},
+    {0x000004180010, 1199, true},
+    {0x0100140800FC, 1203, true},
+    {0x03C0040A83FE, 1213, true},
+    {0x00000419007C, 1230, true},
+    {0x00020008003C, 1239, true},
+    {0x0A000408000C, 1245, true},
+    {0x000000000014, 1251, true},
+    {0x000000000000, 0, true},
+    {0x000000000476, 1253, false},
+    {0x001000000000, 1259, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0202C41202FE, 1260, true},
+    {0x000004180214, 1275, true},
+    {0x080400000004, 1281, false},
+    {0x080400000008, 1284, false},
+    {0x000000100004, 1287, true},
+    {0x0804000003FE, 1289, false},
+    {0x00020410003C, 1300, true},
+    {0x0000101003FC, 1307, true},
+    {0x00000418800C, 1317, true},
+    {0x000000000004, 1323, true},
+    {0x000104188000, 1324, false},
+    {0x000000080000, 1329, true},
+    {0x03049418037E, 1330, true},
+    {0x000000000000, 0, true},
+    {0x00020018800C, 1346, true},
+    {0x0006801203FE, 1352, true},
+    {0x020000100004, 1366, true},
+    {0x0E005C1A0074, 1369, true},
+    {0x0800C01000FC, 1383, true},
+    {0x00000000000C, 1393, true},
+    {0x000000000000, 0, true},
+    {0x00840003003C, 1395, true},
+    {0x08A6D803215E, 1403, true},
+    {0x2486D80321FE, 1421, true},
+    {0x2686D04B23FE, 1441, true},
+    {0x00000000041E, 1464, false},
+    {0x001000000000, 1469, true},
+    {0x001000000000, 1470, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 1471, true},
+    {0x000000000000, 0, true},
+    {0x0002D419006C, 1472, true},
+    {0x0000000A0064, 1484, true},
+    {0x000004188000, 1489, true},
+    {0x00000010000C, 1493, true},
+    {0x00040410007C, 1496, true},
+    {0x00021400007C, 1504, true},
+    {0x00000409000C, 1512, true},
+    {0x00008418007C, 1517, true},
+    {0x000104188000, 1526, false},
+    {0x008204020008, 1531, true},
+    {0x0A14C41883EC, 1536, true},
+    {0x000004080000, 1553, true},
+    {0x00040408000C, 1555, true},
+    {0x0486540A03FE, 1560, true},
+    {0x06244C09001C, 1578, true},
+    {0x02A054180004, 1590, true},
+    {0x0E00041A80FC, 1599, true},
+    {0x00000000000C, 1613, true},
+    {0x000000000004, 1615, true},
+    {0x0400D801020E, 1616, true},
+    {0x0EA6D843A3FE, 1626, true},
+    {0x0EA6D84B21FE, 1651, true},
+    {0x2E06D84323FE, 1675, true},
+    {0x0C848003037C, 1698, true},
+    {0x0E86D84323FE, 1712, true},
+    {0x0EA6D84123FE, 1735, true},
+    {0x0E86D84323FE, 1758, true},
+    {0x000004000000, 1781, false},
+    {0x0CA4000103FE, 1782, true},
+    {0x0EA6D44123FE, 1797, true},
+    {0x3EA6584323FE, 1820, true},
+    {0x3EB6D85381FE, 1845, true},
+    {0x048040010004, 1872, true},
+    {0x2EA4D843003C, 1877, true},
+    {0x028400010004, 1895, true},
+    {0x3EA49853017C, 1900, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 1921, true},
+    {0x000000000000, 0, true},
+    {0x0C840043005C, 1923, true},
+    {0x3EA65C5303FE, 1934, true},
+    {0x3E86584301FC, 1960, true},
+    {0x3EA6584323FE, 1981, true},
+    {0x0A040040231E, 2006, true},
+    {0x2E06D04203FC, 2017, true},
+    {0x2AA6D84323FE, 2036, true},
+    {0x2E16D043A1FE, 2060, true},
+    {0x000000000002, 2083, false},
+    {0x00000000001C, 2084, true},
+    {0x00000000003C, 2087, true},
+    {0x00000000001C, 2091, true},
+    {0x00000000001C, 2094, true},
+    {0x0226900100C4, 2097, true},
+    {0x0A86C801A3FC, 2107, true},
+    {0x0E26D84121BC, 2126, true},
+    {0x0E26D04121FC, 2145, true},
+    {0x1E86D80123FE, 2164, true},
+    {0x2EA6D04320FE, 2186, true},
+    {0x3EA6D84320FC, 2208, true},
+    {0x3E86D84323FE, 2231, true},
+    {0x0084000301FC, 2256, true},
+    {0x0EA6C00303FE, 2267, true},
+    {0x26A6580322FC, 2287, true},
+    {0x2E96D043A3FE, 2307, true},
+    {0x2C82180101FC, 2332, true},
+    {0x0CA0580103FE, 2347, true},
+    {0x2E865843A3FE, 2364, true},
+    {0x2EA2D04321FC, 2388, true},
+    {0x36A4D80303FE, 2409, true},
+    {0x2CA6DC5323FE, 2431, true},
+    {0x3E84D803003C, 2457, true},
+    {0x3E96D80303FE, 2474, true},
+    {0x000080010004, 2498, true},
+    {0x080000010004, 2501, true},
+    {0x1E048041020C, 2504, true},
+    {0x02068041000C, 2515, true},
+    {0x08000041007C, 2523, true},
+    {0x0E86C041007C, 2531, true},
+    {0x0E840041007C, 2546, true},
+    {0x0E069043001C, 2558, true},
+    {0x000000000040, 2571, false},
+    {0x000000000008, 2572, false},
+    {0x000000000410, 2573, false},
+    {0x000000000004, 2575, false},
+    {0x000000000040, 2576, false},
+    {0x000000000100, 2577, false},
+    {0x000000000002, 2578, false},
+    {0x000000008000, 2579, false},
+    {0x000004000000, 2580, false},
+    {0x000000080000, 2581, false},
+    {0x000000000010, 2582, false},
+    {0x000000000002, 2583, false},
+    {0x000000000004, 2584, false},
+    {0x000000000400, 2585, false},
+    {0x000000000010, 2586, false},
+    {0x000000000040, 2587, false},
+    {0x000000000600, 2588, true},
+    {0x000000008000, 2590, false},
+    {0x000004000000, 2591, false},
+    {0x000000080000, 2592, false},
+    {0x000000000400, 2593, false},
+    {0x000000000004, 2594, false},
+    {0x000000000100, 2595, false},
+    {0x000000000400, 2596, false},
+    {0x000000008000, 2597, false},
+    {0x000004000000, 2598, false},
+    {0x000000080000, 2599, false},
+    {0x000000000400, 2600, false},
+    {0x000000000040, 2601, false},
+    {0x000000000010, 2602, false},
+    {0x000000008000, 2603, false},
+    {0x000004000000, 2604, false},
+    {0x000000000002, 2605, false},
+    {0x000000080000, 2606, false},
+    {0x000000000004, 2607, false},
+    {0x000000000100, 2608, false},
+    {0x000000000400, 2609, false},
+    {0x000000000010, 2610, false},
+    {0x000000000400, 2611, false},
+    {0x000000008000, 2612, false},
+    {0x000004000000, 2613, false},
+    {0x000000080000, 2614, false},
+    {0x000000000400, 2615, false},
+    {0x000000000040, 2616, false},
+    {0x000000000400, 2617, false},
+    {0x000000000004, 2618, false},
+    {0x000000008000, 2619, false},
+    {0x000004000000, 2620, false},
+    {0x000000080000, 2621, false},
+    {0x000000000100, 2622, false},
+    {0x000000000400, 2623, false},
+    {0x000000000010, 2624, false},
+    {0x000000008000, 2625, false},
+    {0x000004000000, 2626, false},
+    {0x000000000002, 2627, false},
+    {0x000000080000, 2628, false},
+    {0x000000000040, 2629, false},
+    {0x000000000400, 2630, false},
+    {0x000000000004, 2631, false},
+    {0x000000000400, 2632, true},
+    {0x000000008000, 2633, false},
+    {0x000004000000, 2634, false},
+    {0x000000000002, 2635, false},
+    {0x000000080000, 2636, false},
+    {0x000000000400, 2637, false},
+    {0x000000000010, 2638, false},
+    {0x000000000400, 2639, false},
+    {0x000000000100, 2640, false},
+    {0x000000008000, 2641, false},
+    {0x000004000000, 2642, false},
+    {0x000000000002, 2643, false},
+    {0x000000080000, 2644, false},
+    {0x000000000020, 2645, false},
+    {0x000000000400, 2646, false},
+    {0x000000000040, 2647, false},
+    {0x000000000010, 2648, false},
+    {0x000000000100, 2649, false},
+    {0x000000000400, 2650, false},
+    {0x000000000100, 2651, false},
+    {0x000000008000, 2652, false},
+    {0x000004000000, 2653, false},
+    {0x000000080000, 2654, false},
+    {0x000000008000, 2655, false},
+    {0x000000080000, 2656, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2657, false},
+    {0x000000010000, 2658, false},
+    {0x000000010000, 2659, false},
+    {0x040000010000, 2660, false},
+    {0x000000100000, 2662, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 2663, false},
+    {0x000000100000, 2664, false},
+    {0x000000000010, 2665, false},
+    {0x000000000400, 2666, false},
+    {0x000000000400, 2667, false},
+    {0x000000008000, 2668, false},
+    {0x000004000000, 2669, false},
+    {0x000000080000, 2670, false},
+    {0x000000000400, 2671, false},
+    {0x000000000400, 2672, false},
+    {0x000000008000, 2673, false},
+    {0x000004000000, 2674, false},
+    {0x000000080000, 2675, false},
+    {0x000000000400, 2676, false},
+    {0x000000000040, 2677, false},
+    {0x000000008000, 2678, false},
+    {0x000004000000, 2679, false},
+    {0x000000080000, 2680, false},
+    {0x000000000400, 2681, false},
+    {0x000000000400, 2682, true},
+    {0x000000008000, 2683, false},
+    {0x000004000000, 2684, false},
+    {0x000000000002, 2685, false},
+    {0x000000080000, 2686, false},
+    {0x000000000400, 2687, false},
+    {0x000000000400, 2688, false},
+    {0x000000000004, 2689, false},
+    {0x000000008000, 2690, false},
+    {0x000004000000, 2691, false},
+    {0x000000080000, 2692, false},
+    {0x000000000400, 2693, false},
+    {0x000000008000, 2694, false},
+    {0x000004000000, 2695, false},
+    {0x000000080000, 2696, false},
+    {0x000000000400, 2697, false},
+    {0x000000000400, 2698, false},
+    {0x000000008000, 2699, false},
+    {0x000004000000, 2700, false},
+    {0x000000000002, 2701, false},
+    {0x000000080000, 2702, false},
+    {0x000000000400, 2703, false},
+    {0x000000000400, 2704, false},
+    {0x000000000100, 2705, false},
+    {0x000000008000, 2706, false},
+    {0x000004000000, 2707, false},
+    {0x000000000002, 2708, false},
+    {0x000000080000, 2709, false},
+    {0x000000000400, 2710, false},
+    {0x000000008000, 2711, false},
+    {0x000004000000, 2712, false},
+    {0x000000000002, 2713, false},
+    {0x000000080000, 2714, false},
+    {0x000000000040, 2715, false},
+    {0x000000000400, 2716, false},
+    {0x000000000004, 2717, false},
+    {0x000000000100, 2718, false},
+    {0x000000008000, 2719, false},
+    {0x000004000000, 2720, false},
+    {0x000000080000, 2721, false},
+    {0x000000008000, 2722, false},
+    {0x000000080000, 2723, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2724, false},
+    {0x000000010000, 2725, false},
+    {0x000000010000, 2726, false},
+    {0x040000010000, 2727, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2729, false},
+    {0x000000000400, 2730, false},
+    {0x000000008000, 2731, false},
+    {0x000004000000, 2732, false},
+    {0x000000080000, 2733, false},
+    {0x000000000400, 2734, false},
+    {0x000000008000, 2735, false},
+    {0x000004000000, 2736, false},
+    {0x000000080000, 2737, false},
+    {0x000000000400, 2738, false},
+    {0x000000000400, 2739, false},
+    {0x000000008000, 2740, false},
+    {0x000004000000, 2741, false},
+    {0x000000080000, 2742, false},
+    {0x000000000400, 2743, false},
+    {0x000000000040, 2744, false},
+    {0x000000000400, 2745, false},
+    {0x000000008000, 2746, false},
+    {0x000004000000, 2747, false},
+    {0x000000000002, 2748, false},
+    {0x000000080000, 2749, false},
+    {0x000000000400, 2750, false},
+    {0x000000008000, 2751, false},
+    {0x000004000000, 2752, false},
+    {0x000000080000, 2753, false},
+    {0x000000000004, 2754, false},
+    {0x000000000400, 2755, true},
+    {0x000000008000, 2756, false},
+    {0x000004000000, 2757, false},
+    {0x000000080000, 2758, false},
+    {0x000000008000, 2759, false},
+    {0x000004000000, 2760, false},
+    {0x000000000002, 2761, false},
+    {0x000000080000, 2762, false},
+    {0x000000000100, 2763, false},
+    {0x000000008000, 2764, false},
+    {0x000004000000, 2765, false},
+    {0x000000000002, 2766, false},
+    {0x000000080000, 2767, false},
+    {0x000000000400, 2768, false},
+    {0x000000008000, 2769, false},
+    {0x000004000000, 2770, false},
+    {0x000000000002, 2771, false},
+    {0x000000080000, 2772, false},
+    {0x000000000010, 2773, false},
+    {0x000000000400, 2774, false},
+    {0x000000000400, 2775, true},
+    {0x000000008000, 2776, false},
+    {0x000004000000, 2777, false},
+    {0x000000080000, 2778, false},
+    {0x000000080000, 2779, false},
+    {0x010000000000, 2780, true},
+    {0x008000000000, 2781, false},
+    {0x000000010000, 2782, false},
+    {0x000000010000, 2783, false},
+    {0x040000010000, 2784, false},
+    {0x000000000010, 2786, false},
+    {0x000000008000, 2787, false},
+    {0x000004000000, 2788, false},
+    {0x000000000002, 2789, false},
+    {0x000000080000, 2790, false},
+    {0x000000000000, 0, true},
+    {0x000000008000, 2791, false},
+    {0x000004000000, 2792, false},
+    {0x000000000002, 2793, false},
+    {0x000000080000, 2794, false},
+    {0x000000000400, 2795, false},
+    {0x000000008000, 2796, false},
+    {0x000004000000, 2797, false},
+    {0x000000000002, 2798, false},
+    {0x000000080000, 2799, false},
+    {0x000000008000, 2800, false},
+    {0x000004000000, 2801, false},
+    {0x00000000000E, 2802, false},
+    {0x000000080000, 2805, false},
+    {0x000000000040, 2806, false},
+    {0x000000008000, 2807, false},
+    {0x000004000000, 2808, false},
+    {0x000000000002, 2809, false},
+    {0x000000080000, 2810, false},
+    {0x000000000400, 2811, false},
+    {0x000000008000, 2812, false},
+    {0x000004000000, 2813, false},
+    {0x000000000002, 2814, false},
+    {0x000000080000, 2815, false},
+    {0x000000000004, 2816, false},
+    {0x000000008000, 2817, false},
+    {0x000004000000, 2818, false},
+    {0x00000000000E, 2819, false},
+    {0x000000080000, 2822, false},
+    {0x000000000000, 0, true},
+    {0x000000008000, 2823, false},
+    {0x000004000000, 2824, false},
+    {0x00000000000E, 2825, false},
+    {0x000000080000, 2828, false},
+    {0x000000000100, 2829, false},
+    {0x000000008000, 2830, false},
+    {0x000004000000, 2831, false},
+    {0x00000000000E, 2832, false},
+    {0x000000080000, 2835, false},
+    {0x000000008000, 2836, false},
+    {0x000004000000, 2837, false},
+    {0x000000000002, 2838, false},
+    {0x000000080000, 2839, false},
+    {0x000000000002, 2840, false},
+    {0x000000080000, 2841, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2842, false},
+    {0x000000010000, 2843, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 2844, false},
+    {0x040000010000, 2845, false},
+    {0x000000000010, 2847, false},
+    {0x000000008000, 2848, false},
+    {0x000004000000, 2849, false},
+    {0x000000000002, 2850, false},
+    {0x000000080000, 2851, false},
+    {0x000000008000, 2852, false},
+    {0x000004000000, 2853, false},
+    {0x000000000002, 2854, false},
+    {0x000000080000, 2855, false},
+    {0x000000008000, 2856, false},
+    {0x000004000000, 2857, false},
+    {0x000000000002, 2858, false},
+    {0x000000080000, 2859, false},
+    {0x000000000400, 2860, true},
+    {0x000000008000, 2861, false},
+    {0x000004000000, 2862, false},
+    {0x00000000000E, 2863, false},
+    {0x000000080000, 2866, false},
+    {0x000000008000, 2867, false},
+    {0x000004000000, 2868, false},
+    {0x000000000002, 2869, false},
+    {0x000000080000, 2870, false},
+    {0x000000000040, 2871, false},
+    {0x000000008000, 2872, false},
+    {0x000004000000, 2873, false},
+    {0x000000000002, 2874, false},
+    {0x000000080000, 2875, false},
+    {0x000000000400, 2876, false},
+    {0x000000008000, 2877, false},
+    {0x000004000000, 2878, false},
+    {0x00000000000E, 2879, false},
+    {0x000000080000, 2882, false},
+    {0x000000000004, 2883, false},
+    {0x000000008000, 2884, false},
+    {0x000004000000, 2885, false},
+    {0x00000000000E, 2886, false},
+    {0x000000080000, 2889, false},
+    {0x000000008000, 2890, false},
+    {0x000004000000, 2891, false},
+    {0x00000000000E, 2892, false},
+    {0x000000080000, 2895, false},
+    {0x000000000400, 2896, false},
+    {0x000000008000, 2897, false},
+    {0x000004000000, 2898, false},
+    {0x000000000002, 2899, false},
+    {0x000000080000, 2900, false},
+    {0x000000000002, 2901, false},
+    {0x000000080000, 2902, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2903, false},
+    {0x000000010000, 2904, false},
+    {0x000000010000, 2905, false},
+    {0x040000000000, 2906, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2907, false},
+    {0x000000000010, 2908, false},
+    {0x000000000400, 2909, false},
+    {0x000000000040, 2910, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2911, false},
+    {0x000000000004, 2912, false},
+    {0x000000000100, 2913, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 2914, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2915, false},
+    {0x000000010000, 2916, false},
+    {0x000000010000, 2917, false},
+    {0x000000000100, 2918, false},
+    {0x000000000400, 2919, true},
+    {0x000000000010, 2920, false},
+    {0x000000000400, 2921, false},
+    {0x000000000040, 2922, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2923, false},
+    {0x000000000004, 2924, false},
+    {0x000000000002, 2925, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2926, false},
+    {0x000000010000, 2927, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 2928, false},
+    {0x000000000400, 2929, false},
+    {0x000000000100, 2930, false},
+    {0x000000000010, 2931, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2932, false},
+    {0x000000000040, 2933, false},
+    {0x000000000002, 2934, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2935, false},
+    {0x000000010000, 2936, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 2937, false},
+    {0x000000000100, 2938, false},
+    {0x000000000400, 2939, false},
+    {0x000000000010, 2940, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 2941, false},
+    {0x000000000040, 2942, false},
+    {0x000000000004, 2943, false},
+    {0x000000000400, 2944, true},
+    {0x000000000002, 2945, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 2946, false},
+    {0x000000010000, 2947, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 2948, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000002A, 2949, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 2952, true},
+    {0x000000080000, 2955, true},
+    {0x00000000000C, 2956, true},
+    {0x080000000000, 2958, true},
+    {0x000000000004, 2959, true},
+    {0x00000000000C, 2960, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 2962, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000001003CE, 2964, true},
+    {0x00000000000C, 2972, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 2974, true},
+    {0x000000100004, 2977, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 2979, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000400003C, 2981, true},
+    {0x0000041001FC, 2986, true},
+    {0x000000020004, 2995, true},
+    {0x08000000005C, 2997, true},
+    {0x00000000001C, 3002, true},
+    {0x00000000000C, 3005, true},
+    {0x000000000004, 3007, true},
+    {0x00000000000C, 3008, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3010, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3012, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3014, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3016, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 3017, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000408, 3018, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C8000000000, 3020, false},
+    {0x08000400003C, 3023, true},
+    {0x0F801000001A, 3029, true},
+    {0x000010000018, 3038, true},
+    {0x000004080000, 3041, false},
+    {0x080000000000, 3043, false},
+    {0x000000000000, 0, true},
+    {0x000040010000, 3044, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 3046, false},
+    {0x020240010000, 3047, true},
+    {0x000040000000, 3051, true},
+    {0x000004000000, 3052, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 3053, false},
+    {0x000000010000, 3054, false},
+    {0x0C0000000000, 3055, true},
+    {0x080200000000, 3057, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010004, 3059, true},
+    {0x000000000000, 0, true},
+    {0x000004010004, 3061, true},
+    {0x000000010004, 3064, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000000, 3066, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3067, true},
+    {0x080000000000, 3068, true},
+    {0x080400000000, 3069, true},
+    {0x000004100000, 3071, false},
+    {0x000400000000, 3073, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 3074, true},
+    {0x0C0000000000, 3076, false},
+    {0x0000000007FE, 3078, false},
+    {0x00000000040E, 3088, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000000001C, 3092, true},
+    {0x000000080000, 3096, false},
+    {0x000000000004, 3097, true},
+    {0x000004000000, 3098, false},
+    {0x000004000000, 3099, false},
+    {0x000004100000, 3100, false},
+    {0x000000100000, 3102, false},
+    {0x000000080000, 3103, false},
+    {0x000004088000, 3104, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 3107, false},
+    {0x000080010000, 3108, false},
+    {0x000004000000, 3110, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080040000000, 3111, false},
+    {0x000000008000, 3113, false},
+    {0x000000000000, 0, true},
+    {0x080040000000, 3114, true},
+    {0x000000002000, 3116, false},
+    {0x000000100000, 3117, false},
+    {0x000000180000, 3118, false},
+    {0x000004180000, 3120, false},
+    {0x000004080000, 3123, false},
+    {0x000004000000, 3125, false},
+    {0x000000100000, 3126, false},
+    {0x000004100000, 3127, false},
+    {0x000000008000, 3129, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00A0100001FC, 3130, true},
+    {0x000004108000, 3140, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3143, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000108000, 3144, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008004, 3146, true},
+    {0x00000000040E, 3148, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3152, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3153, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000400000, 3154, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3156, true},
+    {0x000000000000, 0, true},
+    {0x00000000040E, 3158, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3162, true},
+    {0x000000000000, 0, true},
+    {0x000000000014, 3163, true},
+    {0x000000000004, 3165, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000003FE, 3166, true},
+    {0x000004000000, 3175, true},
+    {0x000000000016, 3176, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000400007C, 3179, true},
+    {0x00000010003C, 3185, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 3190, true},
+    {0x000000100004, 3192, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3194, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3195, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3196, false},
+    {0x000000080004, 3197, true},
+    {0x00000410001C, 3199, true},
+    {0x00000400000C, 3204, true},
+    {0x000000000000, 0, true},
+    {0x000000000402, 3207, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3209, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3211, false},
+    {0x000000000000, 0, true},
+    {0x00000002003C, 3213, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3218, false},
+    {0x000000100008, 3219, false},
+    {0x000000100000, 3221, false},
+    {0x080000000000, 3222, true},
+    {0x020400000004, 3223, false},
+    {0x000000100000, 3226, true},
+    {0x00000000000C, 3227, true},
+    {0x000000008000, 3229, true},
+    {0x000000000004, 3230, false},
+    {0x0000000007FE, 3231, false},
+    {0x00000000043E, 3241, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3247, true},
+    {0x0000040801FC, 3249, true},
+    {0x000200000000, 3258, false},
+    {0x000000000004, 3259, true},
+    {0x000000000000, 0, true},
+    {0x000000080004, 3260, true},
+    {0x00000008019C, 3262, true},
+    {0x00000008000C, 3268, true},
+    {0x0000000802BC, 3271, true},
+    {0x0000000081FC, 3278, true},
+    {0x000000008004, 3286, true},
+    {0x000004000004, 3288, true},
+    {0x00005008001C, 3290, true},
+    {0x0000040803BE, 3296, true},
+    {0x000000000400, 3306, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3307, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3309, true},
+    {0x00000018003C, 3310, true},
+    {0x000004000000, 3316, false},
+    {0x000000000000, 0, true},
+    {0x000200000004, 3317, true},
+    {0x040004100000, 3319, true},
+    {0x000000180014, 3322, true},
+    {0x000200000004, 3326, true},
+    {0x0904840003FC, 3328, true},
+    {0x000000000004, 3341, true},
+    {0x000200500004, 3342, true},
+    {0x040000180000, 3346, true},
+    {0x000000080008, 3349, true},
+    {0x00000008000C, 3351, true},
+    {0x000000000004, 3354, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3355, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3357, true},
+    {0x00004418002C, 3359, true},
+    {0x000000020000, 3366, true},
+    {0x000004000008, 3367, true},
+    {0x000200000000, 3369, true},
+    {0x000000000000, 0, true},
+    {0x00000400001C, 3370, true},
+    {0x00000400000C, 3374, true},
+    {0x00000400003C, 3377, true},
+    {0x00000402003C, 3382, true},
+    {0x000000000000, 0, true},
+    {0x00020400000C, 3388, true},
+    {0x010004100034, 3392, true},
+    {0x0000040000DC, 3398, true},
+    {0x00000000007C, 3404, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3409, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3411, false},
+    {0x080400000000, 3413, false},
+    {0x000000000000, 0, true},
+    {0x00000000001E, 3415, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3419, false},
+    {0x000004000000, 3420, false},
+    {0x0884541303FE, 3421, true},
+    {0x0C000000003C, 3439, true},
+    {0x088000000002, 3445, false},
+    {0x000000080000, 3448, false},
+    {0x000004080000, 3449, false},
+    {0x000000180000, 3451, false},
+    {0x000000080000, 3453, false},
+    {0x000004000000, 3454, false},
+    {0x000000100000, 3455, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3456, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3457, false},
+    {0x00065400003C, 3458, true},
+    {0x080000000000, 3467, false},
+    {0x0002C0000000, 3468, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0400D0010004, 3471, true},
+    {0x000440000000, 3477, true},
+    {0x050000010000, 3479, true},
+    {0x000004080000, 3482, false},
+    {0x000000080000, 3484, false},
+    {0x000000000002, 3485, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3486, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 3487, false},
+    {0x000004000000, 3488, false},
+    {0x060440000004, 3489, true},
+    {0x040000000000, 3494, false},
+    {0x000000100000, 3495, false},
+    {0x010000000000, 3496, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 3497, false},
+    {0x04041001003C, 3498, true},
+    {0x0A0400010004, 3506, false},
+    {0x000000100000, 3511, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3512, true},
+    {0x000000080000, 3513, false},
+    {0x000000100000, 3514, false},
+    {0x08800001003C, 3515, true},
+    {0x000000020000, 3522, false},
+    {0x000000100000, 3523, false},
+    {0x000000100000, 3524, false},
+    {0x000000000402, 3525, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0A841002001C, 3527, true},
+    {0x010400000000, 3536, true},
+    {0x000400000004, 3538, true},
+    {0x000000080000, 3540, false},
+    {0x000000080000, 3541, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00004000003C, 3542, true},
+    {0x000440000008, 3547, true},
+    {0x000000080000, 3550, false},
+    {0x000000000002, 3551, false},
+    {0x0000000007FE, 3552, false},
+    {0x010000000000, 3562, true},
+    {0x010000000000, 3563, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 3564, false},
+    {0x000000080000, 3565, false},
+    {0x0A800001000C, 3566, true},
+    {0x000000010000, 3572, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 3573, false},
+    {0x000000000002, 3574, false},
+    {0x000004080000, 3575, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3577, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 3579, false},
+    {0x080410010004, 3580, false},
+    {0x008408000004, 3585, true},
+    {0x00000001002C, 3589, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000400003FE, 3593, true},
+    {0x000000108000, 3603, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C8080000004, 3605, true},
+    {0x040080000000, 3610, true},
+    {0x000004100000, 3612, false},
+    {0x000004088000, 3614, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000048A, 3617, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3621, false},
+    {0x070040000112, 3622, true},
+    {0x000000000004, 3629, false},
+    {0x000000100000, 3630, false},
+    {0x000004000000, 3631, false},
+    {0x000004000000, 3632, false},
+    {0x000000080000, 3633, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010010034, 3634, true},
+    {0x0900000000FC, 3639, true},
+    {0x000000000030, 3647, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 3649, false},
+    {0x000000000400, 3650, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3651, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0E800000000C, 3652, true},
+    {0x000200000000, 3658, false},
+    {0x000000100000, 3659, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0D004000000C, 3660, true},
+    {0x000000100000, 3666, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 3667, false},
+    {0x000000000000, 0, true},
+    {0x00800001000C, 3668, true},
+    {0x080400010000, 3672, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004188000, 3675, false},
+    {0x000000000004, 3679, true},
+    {0x000000000400, 3680, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000008, 3681, false},
+    {0x0804000000EC, 3684, false},
+    {0x000000010004, 3691, true},
+    {0x000004080000, 3693, false},
+    {0x000004000000, 3695, false},
+    {0x000004180000, 3696, false},
+    {0x000000000002, 3699, false},
+    {0x000004000000, 3700, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 3701, false},
+    {0x040000000000, 3702, true},
+    {0x060000000004, 3703, true},
+    {0x000000100000, 3706, false},
+    {0x000000000406, 3707, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3710, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 3712, false},
+    {0x060000000004, 3713, true},
+    {0x000004080000, 3716, false},
+    {0x000000180000, 3718, false},
+    {0x000004100000, 3720, false},
+    {0x000000000000, 0, true},
+    {0x000400010000, 3722, false},
+    {0x000004100000, 3724, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3726, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 3727, false},
+    {0x000000000004, 3728, true},
+    {0x080000000014, 3729, true},
+    {0x040000000004, 3732, true},
+    {0x000000100000, 3734, false},
+    {0x000004000000, 3735, false},
+    {0x000004000000, 3736, false},
+    {0x000000100000, 3737, false},
+    {0x000004100000, 3738, false},
+    {0x000000008000, 3740, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000404000000, 3741, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000004, 3743, true},
+    {0x000004000000, 3745, false},
+    {0x000000080000, 3746, false},
+    {0x000004108000, 3747, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3750, true},
+    {0x000000000004, 3752, true},
+    {0x000000000024, 3753, true},
+    {0x0080000003FE, 3755, true},
+    {0x000000000002, 3765, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 3766, false},
+    {0x000000080006, 3767, true},
+    {0x000004188000, 3770, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 3774, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 3775, true},
+    {0x000000080000, 3777, false},
+    {0x00000000001C, 3778, true},
+    {0x080400000000, 3781, false},
+    {0x000000000402, 3783, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3785, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000018004C, 3787, true},
+    {0x000000010004, 3792, true},
+    {0x000004000000, 3794, true},
+    {0x000000000004, 3795, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3796, true},
+    {0x000000000000, 0, true},
+    {0x0000000000FC, 3797, true},
+    {0x000004000076, 3803, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000406, 3809, false},
+    {0x010000000000, 3812, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000C1000FC, 3813, true},
+    {0x000004010004, 3822, true},
+    {0x040000000000, 3825, false},
+    {0x040004000000, 3826, true},
+    {0x00000400007C, 3828, true},
+    {0x000000010000, 3834, true},
+    {0x00000000000C, 3835, true},
+    {0x000000000000, 0, true},
+    {0x000404100000, 3837, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000400000C, 3840, true},
+    {0x000000000004, 3843, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 3844, false},
+    {0x080400000000, 3845, false},
+    {0x04000000006C, 3847, true},
+    {0x0204900303FC, 3852, true},
+    {0x000004000000, 3866, false},
+    {0x000004000000, 3867, false},
+    {0x000000080000, 3868, false},
+    {0x000004000000, 3869, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3870, true},
+    {0x010000000000, 3871, true},
+    {0x000000080000, 3872, false},
+    {0x080000000000, 3873, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004188000, 3874, true},
+    {0x00000000001C, 3878, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 3881, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 3882, true},
+    {0x000400010000, 3883, true},
+    {0x000004000000, 3885, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3886, false},
+    {0x010000000000, 3888, true},
+    {0x0E0000010000, 3889, true},
+    {0x000004180000, 3893, false},
+    {0x000000100000, 3896, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000180000, 3897, false},
+    {0x000000000000, 0, true},
+    {0x0C000001000C, 3899, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 3904, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000410000000, 3906, false},
+    {0x080400000004, 3908, false},
+    {0x00000000000C, 3911, true},
+    {0x000000080000, 3913, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004188000, 3914, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 3918, false},
+    {0x04000001001C, 3919, true},
+    {0x000004100000, 3924, false},
+    {0x000004000000, 3926, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 3927, true},
+    {0x0E045040000C, 3928, true},
+    {0x000004000000, 3937, false},
+    {0x000004000000, 3938, false},
+    {0x000004000000, 3939, false},
+    {0x000004000000, 3940, false},
+    {0x000004000000, 3941, false},
+    {0x000000080000, 3942, false},
+    {0x001000000000, 3943, false},
+    {0x000000000008, 3944, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000240000004, 3945, true},
+    {0x000450000000, 3948, true},
+    {0x000004000000, 3951, false},
+    {0x000000000402, 3952, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 3954, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004008000, 3955, false},
+    {0x000040000000, 3957, false},
+    {0x00004000002C, 3958, true},
+    {0x000004000000, 3962, false},
+    {0x000004000000, 3963, false},
+    {0x000000180000, 3964, false},
+    {0x000004080000, 3966, false},
+    {0x000004000000, 3968, false},
+    {0x000004000000, 3969, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 3970, false},
+    {0x000400000000, 3971, false},
+    {0x000000000018, 3972, true},
+    {0x000000100000, 3974, false},
+    {0x000004000000, 3975, false},
+    {0x000004000000, 3976, false},
+    {0x000000080000, 3977, false},
+    {0x000004000000, 3978, false},
+    {0x000000100000, 3979, false},
+    {0x000000000000, 0, true},
+    {0x0A0400000000, 3980, false},
+    {0x000040000000, 3983, false},
+    {0x00000000000C, 3984, true},
+    {0x000000080000, 3986, false},
+    {0x000000080000, 3987, false},
+    {0x000004080000, 3988, false},
+    {0x000000188000, 3990, false},
+    {0x000000100000, 3993, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000004, 3994, true},
+    {0x000000080000, 3996, false},
+    {0x008000000000, 3997, false},
+    {0x000000000000, 0, true},
+    {0x08844003007C, 3998, true},
+    {0x000004000000, 4009, false},
+    {0x000004000000, 4010, false},
+    {0x000004008000, 4011, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000406, 4013, false},
+    {0x0000000005F0, 4016, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000008, 4022, true},
+    {0x000000000000, 0, true},
+    {0x0000001001FC, 4024, true},
+    {0x0000400003DE, 4032, true},
+    {0x000000000004, 4041, true},
+    {0x040000000000, 4042, false},
+    {0x0000000007FE, 4043, false},
+    {0x000000000400, 4053, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 4054, false},
+    {0x0000040903FE, 4055, true},
+    {0x000000080000, 4067, false},
+    {0x000000000004, 4068, false},
+    {0x020400080004, 4069, true},
+    {0x00000000003C, 4073, true},
+    {0x0000041803FE, 4077, true},
+    {0x0000801801FE, 4089, true},
+    {0x000204080028, 4100, true},
+    {0x00044008001C, 4105, true},
+    {0x020000000000, 4111, true},
+    {0x00000000000C, 4112, true},
+    {0x0000041800FC, 4114, true},
+    {0x0000440000FC, 4123, true},
+    {0x00000408007C, 4131, true},
+    {0x0000000003FE, 4138, false},
+    {0x00000000040E, 4147, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000C1900BC, 4151, true},
+    {0x000000000004, 4162, false},
+    {0x000000000000, 0, true},
+    {0x00000400001C, 4163, true},
+    {0x000200100000, 4167, true},
+    {0x000000080004, 4169, true},
+    {0x0000440003FE, 4171, true},
+    {0x00000000003C, 4182, true},
+    {0x000000100004, 4186, true},
+    {0x0040041003EE, 4188, true},
+    {0x000200000000, 4199, false},
+    {0x000000000000, 0, true},
+    {0x00000410000C, 4200, true},
+    {0x00000000000C, 4204, true},
+    {0x00000018803C, 4206, true},
+    {0x0000000003F6, 4213, false},
+    {0x000000000402, 4221, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 4223, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000040001FC, 4224, true},
+    {0x000004000000, 4232, true},
+    {0x00000000000C, 4233, true},
+    {0x000000100000, 4235, true},
+    {0x00000000001C, 4236, true},
+    {0x0882541A03FE, 4239, true},
+    {0x0000040000FC, 4257, true},
+    {0x000204000048, 4264, true},
+    {0x00000408001C, 4268, true},
+    {0x000004080000, 4273, true},
+    {0x08044002000C, 4275, false},
+    {0x000004000000, 4281, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 4282, true},
+    {0x000000008000, 4283, false},
+    {0x00000010000C, 4284, true},
+    {0x080400088004, 4287, true},
+    {0x00800000003C, 4292, true},
+    {0x000000000000, 0, true},
+    {0x080004088004, 4297, false},
+    {0x0000000006FE, 4302, false},
+    {0x000000000478, 4311, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 4316, true},
+    {0x0A02441803FE, 4317, true},
+    {0x000000020000, 4333, false},
+    {0x000000000004, 4334, true},
+    {0x000008180000, 4335, false},
+    {0x000014000000, 4338, true},
+    {0x00004018003C, 4340, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 4347, true},
+    {0x0000000803FE, 4348, true},
+    {0x000008000004, 4358, true},
+    {0x02000408000C, 4360, true},
+    {0x00004000007C, 4365, true},
+    {0x000040080018, 4371, true},
+    {0x000000000006, 4375, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00004010001C, 4377, true},
+    {0x000004000000, 4382, true},
+    {0x000200000000, 4383, false},
+    {0x040414100004, 4384, true},
+    {0x020000100004, 4390, true},
+    {0x00000010000C, 4393, true},
+    {0x000000000000, 0, true},
+    {0x080000188000, 4396, true},
+    {0x000200000000, 4400, false},
+    {0x000000000024, 4401, true},
+    {0x000000180004, 4403, true},
+    {0x00004010000C, 4406, true},
+    {0x0C004C1803FE, 4410, true},
+    {0x00000000040E, 4426, false},
+    {0x010000000000, 4430, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000048, 4431, true},
+    {0x00000419807C, 4433, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 4443, true},
+    {0x000000000000, 0, true},
+    {0x000004010000, 4445, true},
+    {0x00004401007C, 4447, true},
+    {0x000000000004, 4455, true},
+    {0x000204000008, 4456, true},
+    {0x00048400000C, 4459, true},
+    {0x00000000001C, 4464, true},
+    {0x00001410007C, 4467, true},
+    {0x0420040000FC, 4475, true},
+    {0x00000408000C, 4484, true},
+    {0x040000000000, 4488, false},
+    {0x0000000007FE, 4489, false},
+    {0x00000000057E, 4499, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000800E, 4507, true},
+    {0x000000128024, 4511, true},
+    {0x000000000000, 0, true},
+    {0x0682945A001C, 4516, true},
+    {0x040004008088, 4530, true},
+    {0x000000008008, 4535, true},
+    {0x00000000047A, 4537, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000141803FE, 4543, true},
+    {0x000000000004, 4556, true},
+    {0x040000000000, 4557, false},
+    {0x0800041803FE, 4558, true},
+    {0x00000418007C, 4571, true},
+    {0x008000000000, 4579, false},
+    {0x000200100004, 4580, true},
+    {0x00000008000C, 4583, true},
+    {0x00200400000C, 4586, true},
+    {0x000200080000, 4590, true},
+    {0x02040409003C, 4592, true},
+    {0x04000018003C, 4601, true},
+    {0x00004008001C, 4608, true},
+    {0x0000000005C6, 4613, false},
+    {0x0000000000A0, 4619, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0020041883FE, 4621, true},
+    {0x000400000004, 4635, true},
+    {0x000000000004, 4637, false},
+    {0x00024C000000, 4638, true},
+    {0x00040011805C, 4642, true},
+    {0x00000419001C, 4650, true},
+    {0x000200000000, 4657, true},
+    {0x00044418000C, 4658, true},
+    {0x002204000000, 4665, true},
+    {0x0E82C012000C, 4668, true},
+    {0x00000018000C, 4679, true},
+    {0x0400440001FC, 4683, true},
+    {0x0000001001FC, 4693, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 4701, true},
+    {0x000000000036, 4702, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 4706, false},
+    {0x00200C1803FE, 4707, true},
+    {0x00000000000C, 4721, true},
+    {0x008000000000, 4723, false},
+    {0x000000100004, 4724, true},
+    {0x000004100004, 4726, true},
+    {0x080004180000, 4729, true},
+    {0x000044110000, 4733, true},
+    {0x000004180000, 4737, false},
+    {0x000200100000, 4740, true},
+    {0x00044410033E, 4742, true},
+    {0x000004108000, 4753, false},
+    {0x00000410000C, 4756, true},
+    {0x088004000000, 4760, true},
+    {0x00000408000C, 4763, true},
+    {0x0A200C08008C, 4767, true},
+    {0x0A000408003C, 4776, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 4784, false},
+    {0x000000000024, 4785, true},
+    {0x022010000000, 4787, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080408080000, 4790, false},
+    {0x000000000004, 4794, false},
+    {0x000000000004, 4795, true},
+    {0x000000000004, 4796, true},
+    {0x02000008001C, 4797, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 4802, false},
+    {0x00000048001C, 4803, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 4808, true},
+    {0x000080080004, 4810, true},
+    {0x000000100000, 4813, true},
+    {0x000000080000, 4814, true},
+    {0x000000000004, 4815, false},
+    {0x000000000000, 0, true},
+    {0x000000100034, 4816, true},
+    {0x000000100004, 4820, true},
+    {0x00000000001C, 4822, true},
+    {0x000000100000, 4825, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00800408005C, 4826, true},
+    {0x000004000000, 4833, true},
+    {0x000004080000, 4834, false},
+    {0x000000000004, 4836, true},
+    {0x00000000000C, 4837, true},
+    {0x00000400001C, 4839, true},
+    {0x000004000000, 4843, false},
+    {0x020004180004, 4844, true},
+    {0x000004000004, 4849, true},
+    {0x00008000001C, 4851, true},
+    {0x000004010004, 4855, true},
+    {0x022000100000, 4858, false},
+    {0x000004080000, 4861, false},
+    {0x000000000004, 4863, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000000C0, 4864, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008008, 4866, true},
+    {0x00001010839E, 4868, true},
+    {0x000000000008, 4878, false},
+    {0x000000000000, 0, true},
+    {0x00000000047A, 4879, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 4885, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0402040803FE, 4886, true},
+    {0x000000080004, 4899, true},
+    {0x000004000000, 4901, false},
+    {0x00000000001C, 4902, true},
+    {0x000000010004, 4905, true},
+    {0x000200000004, 4907, true},
+    {0x00000000004C, 4909, true},
+    {0x000004080000, 4912, true},
+    {0x080608080004, 4914, false},
+    {0x000400080004, 4920, true},
+    {0x02000008000C, 4923, true},
+    {0x0004500803FE, 4927, true},
+    {0x00000400001C, 4940, true},
+    {0x0000401803BE, 4944, true},
+    {0x00000000003C, 4955, true},
+    {0x000000000004, 4959, false},
+    {0x000000000004, 4960, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000041003FE, 4961, true},
+    {0x000000100206, 4972, true},
+    {0x000000000000, 0, true},
+    {0x00040C100004, 4976, true},
+    {0x0000000003FE, 4981, true},
+    {0x000004000004, 4990, false},
+    {0x000600000000, 4992, true},
+    {0x00000010001C, 4994, true},
+    {0x00000410833E, 4998, true},
+    {0x00800C100000, 5008, true},
+    {0x0A00500001FC, 5012, true},
+    {0x00000010007C, 5023, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000047A, 5029, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5035, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00020400003C, 5036, true},
+    {0x0000040000FC, 5042, true},
+    {0x00000403000C, 5049, true},
+    {0x0202040000FC, 5054, true},
+    {0x0000000101FC, 5063, true},
+    {0x000000000004, 5071, true},
+    {0x000204090004, 5072, true},
+    {0x00000400001C, 5077, true},
+    {0x020004000304, 5081, true},
+    {0x02800000007C, 5086, true},
+    {0x000004020004, 5093, true},
+    {0x00020400007C, 5096, true},
+    {0x01000408001C, 5103, true},
+    {0x08040000000C, 5109, false},
+    {0x000000000030, 5113, true},
+    {0x000000000400, 5115, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 5116, false},
+    {0x000400000014, 5117, false},
+    {0x000000000000, 0, true},
+    {0x000000000010, 5120, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 5121, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080004, 5122, true},
+    {0x008000080000, 5125, true},
+    {0x000000080000, 5127, false},
+    {0x000000180000, 5128, true},
+    {0x000000080000, 5130, true},
+    {0x000040000000, 5131, true},
+    {0x0100C008001C, 5132, true},
+    {0x000000080000, 5139, true},
+    {0x00000000000E, 5140, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5143, false},
+    {0x080400000000, 5145, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 5147, true},
+    {0x000000180000, 5149, true},
+    {0x000000100000, 5151, true},
+    {0x00000010000C, 5152, true},
+    {0x000000100000, 5155, true},
+    {0x000010100004, 5156, true},
+    {0x000000100004, 5159, true},
+    {0x00000000001C, 5161, true},
+    {0x000000100004, 5164, true},
+    {0x0004001001EC, 5166, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000010003C, 5174, true},
+    {0x08000018000C, 5179, true},
+    {0x000000100004, 5184, true},
+    {0x000000000406, 5186, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5189, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000C000000, 5191, true},
+    {0x000004000000, 5193, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 5194, true},
+    {0x0080840300FC, 5195, true},
+    {0x000004000000, 5206, true},
+    {0x00140400007C, 5207, true},
+    {0x000000080000, 5215, false},
+    {0x000004000004, 5216, true},
+    {0x000000000000, 0, true},
+    {0x0A00C40000FC, 5218, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5229, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5231, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000008, 5233, true},
+    {0x000000000008, 5235, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 5236, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5237, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 5239, false},
+    {0x00200008017C, 5240, true},
+    {0x000000080000, 5248, false},
+    {0x08040008001C, 5249, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 5255, true},
+    {0x000000080000, 5256, true},
+    {0x000000080000, 5257, false},
+    {0x000000180004, 5258, true},
+    {0x000000000004, 5261, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5262, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000010000C, 5263, true},
+    {0x08000011000C, 5266, true},
+    {0x000004000000, 5271, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 5272, true},
+    {0x00000400000C, 5273, true},
+    {0x000000000000, 0, true},
+    {0x00000408000C, 5276, true},
+    {0x000000080004, 5280, true},
+    {0x04000408003C, 5282, true},
+    {0x00000010001C, 5289, true},
+    {0x000004000000, 5293, false},
+    {0x020000000000, 5294, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000014, 5295, true},
+    {0x00000410007C, 5297, true},
+    {0x000004000004, 5304, true},
+    {0x000000110000, 5306, false},
+    {0x00004010000C, 5308, true},
+    {0x00000400000C, 5312, true},
+    {0x000000000004, 5315, true},
+    {0x000404000004, 5316, true},
+    {0x040004000000, 5319, true},
+    {0x000004000000, 5321, true},
+    {0x06005C000000, 5322, false},
+    {0x004000100000, 5328, false},
+    {0x0000000007FE, 5330, false},
+    {0x0000000007FE, 5340, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 5350, false},
+    {0x02000019029E, 5351, true},
+    {0x000004000000, 5361, true},
+    {0x0000000803FA, 5362, true},
+    {0x0000040003FA, 5371, true},
+    {0x000000000000, 0, true},
+    {0x040000000004, 5380, false},
+    {0x000000000010, 5382, false},
+    {0x00840000003C, 5383, true},
+    {0x000000180004, 5389, true},
+    {0x06000000007C, 5392, true},
+    {0x0A06000080FC, 5399, true},
+    {0x000000000000, 0, true},
+    {0x00000000047E, 5410, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5417, false},
+    {0x000000000000, 0, true},
+    {0x00000018007C, 5419, true},
+    {0x000004080004, 5426, true},
+    {0x00000000000C, 5429, true},
+    {0x00000008801C, 5431, true},
+    {0x0A0000000000, 5436, true},
+    {0x000000080004, 5438, true},
+    {0x00020409000C, 5440, true},
+    {0x00040000000C, 5446, true},
+    {0x020000100000, 5449, true},
+    {0x0A804409007C, 5451, true},
+    {0x0000040A01FC, 5463, true},
+    {0x00000000001C, 5473, true},
+    {0x08000408803C, 5476, true},
+    {0x000000000004, 5484, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5485, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000014, 5487, true},
+    {0x00000418037E, 5489, true},
+    {0x00000410800C, 5500, true},
+    {0x000000000008, 5505, true},
+    {0x000000000000, 0, true},
+    {0x00000010001C, 5506, true},
+    {0x000004000064, 5510, true},
+    {0x080400000004, 5514, false},
+    {0x000004100044, 5517, true},
+    {0x00040410001C, 5521, true},
+    {0x020000000000, 5527, true},
+    {0x000000000004, 5528, true},
+    {0x00000010000C, 5529, true},
+    {0x000014100004, 5532, true},
+    {0x0A0000008004, 5536, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 5540, true},
+    {0x0000000007DE, 5542, false},
+    {0x00000000003E, 5551, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080008, 5556, true},
+    {0x0000541901FC, 5559, true},
+    {0x00000402000C, 5572, true},
+    {0x000000010024, 5576, true},
+    {0x080400000000, 5579, false},
+    {0x00000410000C, 5581, true},
+    {0x000044180078, 5585, true},
+    {0x00000400000C, 5593, true},
+    {0x000204100048, 5596, true},
+    {0x00040400003C, 5601, true},
+    {0x080604000000, 5607, false},
+    {0x000004010074, 5611, true},
+    {0x00004402000C, 5617, true},
+    {0x02000400001C, 5622, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5627, false},
+    {0x000000000000, 0, true},
+    {0x000000000084, 5629, true},
+    {0x000000080000, 5631, true},
+    {0x000000100004, 5632, true},
+    {0x000000000002, 5634, false},
+    {0x0000000004FE, 5635, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5643, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5644, false},
+    {0x000000000000, 0, true},
+    {0x00000408017E, 5646, true},
+    {0x000000188000, 5655, false},
+    {0x000000100000, 5658, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000408003C, 5659, true},
+    {0x000000080000, 5665, false},
+    {0x000000000004, 5666, true},
+    {0x020000008000, 5667, false},
+    {0x000040100004, 5669, true},
+    {0x08040000000C, 5672, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5676, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000001003FE, 5677, true},
+    {0x00000010000C, 5687, true},
+    {0x000004000004, 5690, false},
+    {0x00000000000C, 5692, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0004000A001C, 5694, true},
+    {0x000000008000, 5700, true},
+    {0x000000008000, 5701, true},
+    {0x000004018000, 5702, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 5705, true},
+    {0x00000000043E, 5706, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5712, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5713, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 5714, false},
+    {0x0000440801FE, 5715, true},
+    {0x00000408002C, 5726, true},
+    {0x000000500000, 5731, true},
+    {0x00000010003C, 5733, true},
+    {0x000000000008, 5738, true},
+    {0x00000400000C, 5739, true},
+    {0x000000100000, 5742, true},
+    {0x00040410001C, 5743, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x02000400000C, 5749, true},
+    {0x08841810801C, 5753, true},
+    {0x000000100000, 5763, false},
+    {0x000000000004, 5764, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5765, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040100000, 5766, true},
+    {0x000004000004, 5768, true},
+    {0x000004000000, 5770, false},
+    {0x000000000004, 5771, false},
+    {0x000004000004, 5772, true},
+    {0x050200100200, 5774, true},
+    {0x000000080004, 5779, true},
+    {0x000000000000, 0, true},
+    {0x00000000040E, 5781, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004190000, 5785, true},
+    {0x000208000000, 5789, true},
+    {0x000000000000, 0, true},
+    {0x000000000014, 5791, true},
+    {0x000000000000, 0, true},
+    {0x000200000000, 5793, false},
+    {0x0C005448000C, 5794, true},
+    {0x000010080004, 5803, true},
+    {0x000000000400, 5806, false},
+    {0x010000000000, 5807, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5808, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 5809, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 5811, true},
+    {0x008000000000, 5812, false},
+    {0x0000040000FC, 5813, true},
+    {0x000404000004, 5820, true},
+    {0x000000000004, 5823, false},
+    {0x00000C100004, 5824, true},
+    {0x020404000000, 5828, true},
+    {0x000044190044, 5831, true},
+    {0x000004000024, 5838, true},
+    {0x000000100000, 5841, false},
+    {0x000004000004, 5842, true},
+    {0x080400010004, 5844, false},
+    {0x0C02541A02FE, 5848, true},
+    {0x00004418803C, 5865, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100008, 5874, true},
+    {0x000004000004, 5876, true},
+    {0x00000000000C, 5878, true},
+    {0x00000000000C, 5880, true},
+    {0x000044000004, 5882, true},
+    {0x000000000004, 5885, true},
+    {0x00000000000C, 5886, true},
+    {0x000000100000, 5888, false},
+    {0x008000000000, 5889, true},
+    {0x00000000001C, 5890, true},
+    {0x05804410000C, 5893, true},
+    {0x08000001001C, 5901, true},
+    {0x000000000004, 5906, true},
+    {0x000000000402, 5907, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 5909, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000010801C, 5910, true},
+    {0x000000028004, 5916, true},
+    {0x00000400000C, 5919, true},
+    {0x000010000000, 5922, false},
+    {0x000000100000, 5923, false},
+    {0x000000100000, 5924, true},
+    {0x080400108008, 5925, false},
+    {0x000000008000, 5930, true},
+    {0x00000000000C, 5931, true},
+    {0x000000080000, 5933, false},
+    {0x02000400003C, 5934, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000041E, 5940, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 5945, true},
+    {0x0000401801CE, 5946, true},
+    {0x000000000004, 5955, true},
+    {0x000004000000, 5956, false},
+    {0x000004000000, 5957, false},
+    {0x000000020000, 5958, true},
+    {0x000008080100, 5959, true},
+    {0x0004000901FC, 5962, true},
+    {0x00000000000C, 5972, true},
+    {0x000004000014, 5974, true},
+    {0x000000000008, 5977, true},
+    {0x00040008003C, 5978, true},
+    {0x000000188000, 5984, false},
+    {0x0082101283FC, 5987, true},
+    {0x00A008080074, 6001, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100024, 6009, true},
+    {0x0000000A0000, 6012, true},
+    {0x000004000000, 6014, true},
+    {0x000010010004, 6015, true},
+    {0x000000100000, 6018, false},
+    {0x000000000000, 0, true},
+    {0x000400100000, 6019, true},
+    {0x08040000000C, 6021, false},
+    {0x000000080000, 6025, false},
+    {0x0200040001FC, 6026, true},
+    {0x00000000001C, 6035, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6038, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00001408007C, 6039, true},
+    {0x00000000000C, 6047, true},
+    {0x000008000000, 6049, true},
+    {0x000404000000, 6050, true},
+    {0x000004000000, 6052, false},
+    {0x00000400000C, 6053, true},
+    {0x000204000000, 6056, false},
+    {0x02044400001C, 6058, true},
+    {0x000000000000, 0, true},
+    {0x00025000001C, 6065, true},
+    {0x000000100000, 6071, false},
+    {0x00004408000C, 6072, true},
+    {0x08000000000C, 6077, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000180000, 6080, true},
+    {0x000000000004, 6082, true},
+    {0x000000000000, 0, true},
+    {0x000000080004, 6083, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6085, true},
+    {0x000000000004, 6086, true},
+    {0x000000000004, 6087, true},
+    {0x00000000001C, 6088, true},
+    {0x000000100004, 6091, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000400000C, 6093, true},
+    {0x000004000000, 6096, true},
+    {0x000000000004, 6097, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6098, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 6099, true},
+    {0x000000000004, 6104, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 6105, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6106, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6107, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 6108, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6112, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6113, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6114, true},
+    {0x010000000000, 6115, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 6116, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6118, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000058, 6119, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6122, true},
+    {0x000000000400, 6123, false},
+    {0x000000000004, 6124, false},
+    {0x000000000100, 6125, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6126, false},
+    {0x000000000010, 6127, false},
+    {0x000000000400, 6128, false},
+    {0x000000000040, 6129, false},
+    {0x008000000000, 6130, false},
+    {0x000000010000, 6131, false},
+    {0x000000010000, 6132, false},
+    {0x000000000400, 6133, false},
+    {0x000000000004, 6134, false},
+    {0x000000000100, 6135, false},
+    {0x000000000400, 6136, true},
+    {0x000000000010, 6137, false},
+    {0x000000000400, 6138, false},
+    {0x000000000040, 6139, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6140, false},
+    {0x000000010000, 6141, false},
+    {0x000000010000, 6142, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6143, false},
+    {0x000000000400, 6144, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6145, false},
+    {0x000000010000, 6146, false},
+    {0x000000010000, 6147, false},
+    {0x000000000400, 6148, true},
+    {0x000000000400, 6149, false},
+    {0x000000000400, 6150, false},
+    {0x008000000000, 6151, false},
+    {0x000000010000, 6152, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6153, false},
+    {0x000000000400, 6154, false},
+    {0x000000000400, 6155, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6156, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6157, false},
+    {0x000000010000, 6158, false},
+    {0x000000010000, 6159, false},
+    {0x000000000400, 6160, true},
+    {0x000000000400, 6161, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6162, false},
+    {0x008000000000, 6163, false},
+    {0x000000010000, 6164, false},
+    {0x000000010000, 6165, false},
+    {0x000000000400, 6166, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6167, false},
+    {0x008000000000, 6168, false},
+    {0x000000010000, 6169, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6170, false},
+    {0x000000000400, 6171, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6172, false},
+    {0x000000000400, 6173, true},
+    {0x008000000000, 6174, false},
+    {0x000000010000, 6175, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6176, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6177, false},
+    {0x000000000400, 6178, true},
+    {0x000000000400, 6179, false},
+    {0x008000000000, 6180, false},
+    {0x000000010000, 6181, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6182, false},
+    {0x000000000004, 6183, false},
+    {0x000000000000, 0, true},
+    {0x000000000100, 6184, false},
+    {0x000000000400, 6185, false},
+    {0x000000000010, 6186, false},
+    {0x000000000400, 6187, true},
+    {0x000000000400, 6188, false},
+    {0x008000000000, 6189, false},
+    {0x000000010000, 6190, false},
+    {0x000000010000, 6191, false},
+    {0x000000000008, 6192, false},
+    {0x000000000000, 0, true},
+    {0x000000080004, 6193, false},
+    {0x000240080004, 6195, false},
+    {0x000000080008, 6199, false},
+    {0x000000100000, 6201, false},
+    {0x000000000004, 6202, false},
+    {0x000200000000, 6203, false},
+    {0x000200000000, 6204, false},
+    {0x000200000000, 6205, false},
+    {0x000000000400, 6206, false},
+    {0x000000000400, 6207, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6208, false},
+    {0x000000010000, 6209, false},
+    {0x000000010000, 6210, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6211, false},
+    {0x000000010000, 6212, false},
+    {0x000000010000, 6213, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6214, false},
+    {0x008000000000, 6215, false},
+    {0x000000010000, 6216, false},
+    {0x000000010000, 6217, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6218, false},
+    {0x000000010000, 6219, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6220, false},
+    {0x000000000400, 6221, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6222, false},
+    {0x008000000000, 6223, false},
+    {0x000000010000, 6224, false},
+    {0x000000010000, 6225, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6226, false},
+    {0x000000010000, 6227, false},
+    {0x000000010000, 6228, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6229, false},
+    {0x000000010000, 6230, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6231, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6232, true},
+    {0x000000000400, 6233, false},
+    {0x008000000000, 6234, false},
+    {0x000000010000, 6235, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6236, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6237, false},
+    {0x000000010000, 6238, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6239, false},
+    {0x000000000400, 6240, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6241, false},
+    {0x000000000400, 6242, false},
+    {0x008000000000, 6243, false},
+    {0x000000010000, 6244, false},
+    {0x000000010000, 6245, false},
+    {0x000000000008, 6246, false},
+    {0x000000000000, 0, true},
+    {0x000000080004, 6247, false},
+    {0x000240080004, 6249, false},
+    {0x000000080008, 6253, false},
+    {0x000000100000, 6255, false},
+    {0x000000000004, 6256, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6257, false},
+    {0x000000010000, 6258, false},
+    {0x000000010000, 6259, false},
+    {0x000000000400, 6260, true},
+    {0x008000000000, 6261, false},
+    {0x000000010000, 6262, false},
+    {0x000000010000, 6263, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6264, false},
+    {0x000000010000, 6265, false},
+    {0x000000010000, 6266, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6267, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6268, false},
+    {0x000000010000, 6269, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6270, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6271, false},
+    {0x000000010000, 6272, false},
+    {0x000000010000, 6273, false},
+    {0x000000000400, 6274, false},
+    {0x000000000400, 6275, true},
+    {0x008000000000, 6276, false},
+    {0x000000010000, 6277, false},
+    {0x000000010000, 6278, false},
+    {0x008000000000, 6279, false},
+    {0x000000010000, 6280, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6281, false},
+    {0x000000000400, 6282, false},
+    {0x008000000000, 6283, false},
+    {0x000000010000, 6284, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6285, false},
+    {0x000000000400, 6286, false},
+    {0x008000000000, 6287, false},
+    {0x000000010000, 6288, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6289, false},
+    {0x000000000400, 6290, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 6291, false},
+    {0x000000010000, 6292, false},
+    {0x000000010000, 6293, false},
+    {0x010000000000, 6294, true},
+    {0x000000000002, 6295, false},
+    {0x000000080004, 6296, false},
+    {0x000240080004, 6298, false},
+    {0x000000080008, 6302, false},
+    {0x000000100000, 6304, false},
+    {0x000000000004, 6305, false},
+    {0x000000000400, 6306, false},
+    {0x008000000000, 6307, false},
+    {0x000000010000, 6308, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6309, false},
+    {0x008000000000, 6310, false},
+    {0x000000010000, 6311, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6312, false},
+    {0x000000000400, 6313, false},
+    {0x008000000000, 6314, false},
+    {0x000000010000, 6315, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6316, false},
+    {0x008000000000, 6317, false},
+    {0x000000010000, 6318, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6319, false},
+    {0x000000000400, 6320, false},
+    {0x008000000000, 6321, false},
+    {0x000000010000, 6322, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6323, false},
+    {0x000000000400, 6324, false},
+    {0x008000000000, 6325, false},
+    {0x000000010000, 6326, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6327, false},
+    {0x000000000400, 6328, false},
+    {0x008000000000, 6329, false},
+    {0x000000010000, 6330, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6331, false},
+    {0x008000000000, 6332, false},
+    {0x000000010000, 6333, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6334, false},
+    {0x000000000400, 6335, false},
+    {0x008000000000, 6336, false},
+    {0x000000010000, 6337, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6338, false},
+    {0x008000000000, 6339, false},
+    {0x000000010000, 6340, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6341, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080004, 6342, false},
+    {0x000240080004, 6344, false},
+    {0x000000080008, 6348, false},
+    {0x000000100000, 6350, false},
+    {0x000000000004, 6351, false},
+    {0x000000000400, 6352, false},
+    {0x008000000000, 6353, false},
+    {0x000000010000, 6354, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6355, false},
+    {0x008000000000, 6356, false},
+    {0x000000010000, 6357, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6358, false},
+    {0x008000000000, 6359, false},
+    {0x000000010000, 6360, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6361, false},
+    {0x000000000400, 6362, false},
+    {0x008000000000, 6363, false},
+    {0x000000010000, 6364, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6365, false},
+    {0x008000000000, 6366, false},
+    {0x000000010000, 6367, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6368, false},
+    {0x000000000400, 6369, false},
+    {0x008000000000, 6370, false},
+    {0x000000010000, 6371, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6372, false},
+    {0x000000000400, 6373, false},
+    {0x008000000000, 6374, false},
+    {0x000000010000, 6375, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6376, false},
+    {0x000000000400, 6377, false},
+    {0x008000000000, 6378, false},
+    {0x000000010000, 6379, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6380, false},
+    {0x008000000000, 6381, false},
+    {0x000000010000, 6382, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6383, false},
+    {0x000000000400, 6384, false},
+    {0x008000000000, 6385, false},
+    {0x000000010000, 6386, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6387, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080004, 6388, false},
+    {0x000240080004, 6390, false},
+    {0x000000080008, 6394, false},
+    {0x000000000004, 6396, false},
+    {0x000000000400, 6397, false},
+    {0x000000000400, 6398, false},
+    {0x000000000400, 6399, false},
+    {0x000000000400, 6400, false},
+    {0x000000000400, 6401, false},
+    {0x000000000400, 6402, false},
+    {0x000000000400, 6403, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6404, false},
+    {0x000240000004, 6405, false},
+    {0x000000000008, 6408, false},
+    {0x000000000400, 6409, false},
+    {0x000000000400, 6410, true},
+    {0x000000000400, 6411, false},
+    {0x000000000400, 6412, false},
+    {0x000000000400, 6413, false},
+    {0x000000000400, 6414, false},
+    {0x000000000400, 6415, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6416, false},
+    {0x000240000004, 6417, false},
+    {0x000000000008, 6420, false},
+    {0x000000000400, 6421, false},
+    {0x000000000400, 6422, false},
+    {0x000000000400, 6423, false},
+    {0x000000000400, 6424, false},
+    {0x000000000400, 6425, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6426, false},
+    {0x000240000004, 6427, false},
+    {0x000000000008, 6430, false},
+    {0x000000000400, 6431, false},
+    {0x000000000400, 6432, false},
+    {0x000000000400, 6433, false},
+    {0x000000000400, 6434, false},
+    {0x000000000400, 6435, false},
+    {0x000000000400, 6436, false},
+    {0x000000000400, 6437, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6438, false},
+    {0x000240000004, 6439, false},
+    {0x000000000008, 6442, false},
+    {0x000000000400, 6443, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6444, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 6445, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6446, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6448, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000018, 6449, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6451, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6452, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6453, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6454, true},
+    {0x000000000000, 0, true},
+    {0x01000000003C, 6455, true},
+    {0x000004000004, 6460, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6462, true},
+    {0x00000000001C, 6463, true},
+    {0x00000000007E, 6466, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 6472, false},
+    {0x0100000000D4, 6474, true},
+    {0x000000000002, 6479, false},
+    {0x000000080000, 6480, true},
+    {0x0000040002FC, 6481, true},
+    {0x0000000000FC, 6489, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6495, false},
+    {0x010000000000, 6496, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 6497, true},
+    {0x000000000004, 6500, true},
+    {0x000000000000, 0, true},
+    {0x00008000003C, 6501, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6506, false},
+    {0x000000100000, 6507, false},
+    {0x000000020004, 6508, true},
+    {0x000010000000, 6510, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6511, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6512, false},
+    {0x000000080000, 6513, false},
+    {0x000000000000, 0, true},
+    {0x00000400007C, 6514, true},
+    {0x000000000000, 0, true},
+    {0x00000400007C, 6520, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6526, true},
+    {0x000004000000, 6527, true},
+    {0x000080000000, 6528, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6529, false},
+    {0x000000000004, 6530, true},
+    {0x000200080000, 6531, true},
+    {0x000400000000, 6533, false},
+    {0x080040000004, 6534, false},
+    {0x000400000000, 6537, false},
+    {0x000000000010, 6538, true},
+    {0x000000000000, 0, true},
+    {0x000004080004, 6539, true},
+    {0x000000000004, 6542, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6543, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6545, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000108000, 6546, false},
+    {0x020000000000, 6548, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 6549, false},
+    {0x00000000000C, 6550, true},
+    {0x000000010000, 6552, false},
+    {0x000400010000, 6553, false},
+    {0x000000010000, 6555, false},
+    {0x000040000000, 6556, false},
+    {0x020000000000, 6557, false},
+    {0x004000000000, 6558, true},
+    {0x004000000004, 6559, false},
+    {0x010000000000, 6561, true},
+    {0x00000000001C, 6562, true},
+    {0x000000000004, 6565, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6566, false},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 6567, false},
+    {0x000000100000, 6569, false},
+    {0x000000000004, 6570, true},
+    {0x000004000000, 6571, false},
+    {0x00000000000C, 6572, true},
+    {0x020000010000, 6574, false},
+    {0x020000000000, 6576, false},
+    {0x000000010000, 6577, false},
+    {0x082000000000, 6578, false},
+    {0x000000010000, 6580, false},
+    {0x080000000000, 6581, true},
+    {0x000000010000, 6582, false},
+    {0x000010000000, 6583, false},
+    {0x000000010000, 6584, false},
+    {0x040040000000, 6585, true},
+    {0x080400000000, 6587, false},
+    {0x040000000000, 6589, true},
+    {0x010000000000, 6590, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6591, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080004, 6593, false},
+    {0x000000100000, 6596, false},
+    {0x000000000004, 6597, true},
+    {0x040000000000, 6598, false},
+    {0x040000000000, 6599, false},
+    {0x000000000004, 6600, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6601, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6602, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6603, false},
+    {0x000004000000, 6604, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6605, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6607, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000040A, 6608, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6611, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6613, false},
+    {0x000000000008, 6614, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6615, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6616, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6617, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400002000, 6618, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000020000, 6620, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6621, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6622, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 6623, true},
+    {0x08040000001C, 6625, false},
+    {0x000000080000, 6630, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6631, false},
+    {0x000000100000, 6632, false},
+    {0x000000010000, 6633, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000004, 6634, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6636, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6638, true},
+    {0x000000000000, 0, true},
+    {0x000000188000, 6639, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6642, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 6643, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 6644, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6645, true},
+    {0x000000000000, 0, true},
+    {0x0C0400010074, 6646, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00800000000C, 6654, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6657, false},
+    {0x000004000000, 6658, false},
+    {0x000004000000, 6659, false},
+    {0x000000000406, 6660, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6663, false},
+    {0x00000000000C, 6665, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6667, true},
+    {0x000040000000, 6668, false},
+    {0x020000000000, 6669, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6670, false},
+    {0x040000000000, 6671, false},
+    {0x020000000000, 6672, false},
+    {0x000000080000, 6673, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 6674, true},
+    {0x010010000004, 6676, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6679, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6680, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 6681, true},
+    {0x000004000000, 6682, false},
+    {0x000004080000, 6683, false},
+    {0x000000000002, 6685, false},
+    {0x000000080000, 6686, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6687, false},
+    {0x000004000000, 6688, false},
+    {0x000004000000, 6689, false},
+    {0x000400000000, 6690, false},
+    {0x000000010000, 6691, false},
+    {0x000000080000, 6692, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6693, false},
+    {0x080400000000, 6694, false},
+    {0x080400000000, 6696, false},
+    {0x000004000000, 6698, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6699, false},
+    {0x000000000020, 6701, true},
+    {0x000000000000, 0, true},
+    {0x000080000008, 6702, true},
+    {0x000000080000, 6704, false},
+    {0x000004000000, 6705, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6706, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6707, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000010, 6709, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6710, true},
+    {0x000004000000, 6711, false},
+    {0x000000000004, 6712, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6713, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6714, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6715, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6716, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6717, true},
+    {0x020000000000, 6718, false},
+    {0x000000000000, 0, true},
+    {0x0000000007FE, 6719, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6729, false},
+    {0x000004000000, 6730, false},
+    {0x008000000000, 6731, false},
+    {0x000200000000, 6732, true},
+    {0x000004080000, 6733, true},
+    {0x000004000000, 6735, false},
+    {0x000400000000, 6736, false},
+    {0x000000108000, 6737, false},
+    {0x0000000003FC, 6739, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6747, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6748, false},
+    {0x000000000000, 0, true},
+    {0x000000000024, 6750, true},
+    {0x000000000060, 6752, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6754, true},
+    {0x020000000000, 6755, false},
+    {0x000000000004, 6756, true},
+    {0x080400000004, 6757, false},
+    {0x000000000004, 6760, true},
+    {0x000400000000, 6761, false},
+    {0x020000000000, 6762, false},
+    {0x000000000000, 0, true},
+    {0x040040000000, 6763, false},
+    {0x000000000002, 6765, false},
+    {0x01020000007C, 6766, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 6773, true},
+    {0x000000100000, 6775, false},
+    {0x000000000004, 6776, true},
+    {0x000000100000, 6777, false},
+    {0x0000000002FE, 6778, true},
+    {0x000004000000, 6786, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 6787, false},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 6790, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 6794, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6798, false},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 6799, true},
+    {0x000000000002, 6802, false},
+    {0x00000000003C, 6803, true},
+    {0x01000000000C, 6807, true},
+    {0x01000000000C, 6810, true},
+    {0x000080000000, 6813, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6814, false},
+    {0x008000000000, 6815, false},
+    {0x00000000000C, 6816, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6818, true},
+    {0x0000000002FE, 6819, true},
+    {0x00000000000C, 6827, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6829, false},
+    {0x080000000000, 6830, false},
+    {0x000000000002, 6831, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6832, true},
+    {0x000000100000, 6833, false},
+    {0x000004080000, 6834, false},
+    {0x00000008000C, 6836, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6839, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6840, false},
+    {0x040000000000, 6841, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x01000011003C, 6842, true},
+    {0x000000000004, 6849, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6850, false},
+    {0x040000000000, 6851, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 6852, false},
+    {0x000000100000, 6853, true},
+    {0x000000000004, 6854, true},
+    {0x000000100000, 6855, false},
+    {0x000004000000, 6856, false},
+    {0x000004000000, 6857, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6858, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 6859, false},
+    {0x000400000000, 6861, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 6862, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 6866, false},
+    {0x000004000000, 6867, false},
+    {0x000080000000, 6868, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6869, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6871, false},
+    {0x000000000002, 6872, false},
+    {0x000004000000, 6873, false},
+    {0x000040000004, 6874, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000034, 6876, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x004040000000, 6879, true},
+    {0x00000000001C, 6881, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6884, false},
+    {0x000000010000, 6885, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6886, true},
+    {0x080000000004, 6887, true},
+    {0x000000000000, 0, true},
+    {0x00000408001C, 6889, true},
+    {0x000000100000, 6894, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6895, false},
+    {0x000400000000, 6896, false},
+    {0x000004000000, 6897, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6898, true},
+    {0x000004000000, 6899, false},
+    {0x000000000406, 6900, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6903, false},
+    {0x080400000000, 6905, false},
+    {0x080400000000, 6907, false},
+    {0x01000010001C, 6909, true},
+    {0x040000000000, 6914, false},
+    {0x040000000000, 6915, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0804040003FE, 6916, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040008000000, 6928, false},
+    {0x000000010000, 6930, false},
+    {0x000010000000, 6931, false},
+    {0x000010000008, 6932, true},
+    {0x040000000004, 6934, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6936, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 6937, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6939, false},
+    {0x000000000004, 6940, true},
+    {0x000004000000, 6941, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6942, false},
+    {0x020000000000, 6943, false},
+    {0x000000010000, 6944, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 6945, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 6946, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6948, false},
+    {0x000004000000, 6949, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 6950, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 6951, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6953, true},
+    {0x00000408000C, 6954, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6958, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6959, false},
+    {0x000000000002, 6960, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6961, true},
+    {0x000000010000, 6962, false},
+    {0x000000020000, 6963, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 6964, false},
+    {0x000000020000, 6966, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 6967, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6968, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x09000000000C, 6969, true},
+    {0x000040000000, 6973, false},
+    {0x000000000000, 0, true},
+    {0x000400010000, 6974, true},
+    {0x000400000000, 6976, false},
+    {0x080040030000, 6977, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 6981, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6982, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6983, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 6984, false},
+    {0x000000010000, 6985, false},
+    {0x000000010000, 6986, false},
+    {0x000400000000, 6987, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 6988, false},
+    {0x000004000000, 6989, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6990, false},
+    {0x000000000002, 6991, false},
+    {0x000000000008, 6992, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 6993, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 6994, false},
+    {0x00000000000C, 6995, true},
+    {0x000040000038, 6997, true},
+    {0x000000010000, 7001, false},
+    {0x000000010000, 7002, false},
+    {0x040000000000, 7003, false},
+    {0x040000000000, 7004, true},
+    {0x040000000000, 7005, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x01000400000C, 7006, true},
+    {0x000040000000, 7010, false},
+    {0x000000010000, 7011, false},
+    {0x040400000000, 7012, false},
+    {0x040000000000, 7014, false},
+    {0x00040000000C, 7015, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000040E, 7018, false},
+    {0x010000000000, 7022, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 7023, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 7024, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7025, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7026, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7027, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7028, false},
+    {0x040040000000, 7029, false},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 7031, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7035, true},
+    {0x000000000400, 7036, false},
+    {0x010000000000, 7037, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7038, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 7039, false},
+    {0x0804400003FE, 7040, false},
+    {0x000004000000, 7052, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7053, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7054, false},
+    {0x00000000000C, 7055, false},
+    {0x000000080000, 7057, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7058, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7059, false},
+    {0x08040000001C, 7060, false},
+    {0x000000100000, 7065, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000400000, 7066, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7067, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000100000, 7068, false},
+    {0x000000020000, 7070, false},
+    {0x00000000000C, 7071, true},
+    {0x00000000001C, 7073, true},
+    {0x000004100000, 7076, false},
+    {0x080400000000, 7078, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7080, false},
+    {0x008000000000, 7081, false},
+    {0x020000000000, 7082, false},
+    {0x000000000002, 7083, false},
+    {0x000000000002, 7084, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000404000078, 7085, true},
+    {0x000000180000, 7091, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7093, false},
+    {0x010000000000, 7094, true},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 7095, false},
+    {0x00000000000C, 7098, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004188000, 7100, false},
+    {0x00000000001C, 7104, false},
+    {0x000000010000, 7107, false},
+    {0x01000000001C, 7108, true},
+    {0x040000000000, 7112, false},
+    {0x040000000000, 7113, false},
+    {0x000040000000, 7114, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00004010007C, 7115, true},
+    {0x000000000004, 7122, true},
+    {0x010000000000, 7123, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7124, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7125, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 7126, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7127, true},
+    {0x00000010000C, 7128, true},
+    {0x000400000000, 7131, false},
+    {0x000010000000, 7132, false},
+    {0x000200000000, 7133, false},
+    {0x010004000000, 7134, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 7136, true},
+    {0x000000000000, 0, true},
+    {0x00000400001C, 7138, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000080000, 7142, true},
+    {0x080000000000, 7144, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7145, false},
+    {0x000000000004, 7146, true},
+    {0x000000000004, 7147, true},
+    {0x000000080000, 7148, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7149, false},
+    {0x040000000000, 7150, false},
+    {0x000000000004, 7151, true},
+    {0x000000000004, 7152, true},
+    {0x000004000000, 7153, false},
+    {0x000040000000, 7154, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7155, false},
+    {0x000000000004, 7156, true},
+    {0x080400000000, 7157, false},
+    {0x000000100000, 7159, false},
+    {0x080400000000, 7160, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7162, false},
+    {0x020000000000, 7163, false},
+    {0x000010000000, 7164, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7165, false},
+    {0x000040000000, 7166, false},
+    {0x00000000000C, 7167, true},
+    {0x040000000000, 7169, false},
+    {0x000040000000, 7170, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7171, false},
+    {0x000400000000, 7172, false},
+    {0x000400000000, 7173, false},
+    {0x000000000000, 0, true},
+    {0x000000010004, 7174, true},
+    {0x000000000004, 7176, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7177, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 7178, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7179, false},
+    {0x000000010000, 7180, false},
+    {0x000010000004, 7181, true},
+    {0x000400000000, 7183, false},
+    {0x010000000004, 7184, true},
+    {0x000000000004, 7186, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7187, false},
+    {0x010000000000, 7188, true},
+    {0x000000080000, 7189, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7190, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7191, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 7192, false},
+    {0x000000080000, 7193, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7194, false},
+    {0x000000000004, 7195, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7196, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7197, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7198, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000005F6, 7199, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7207, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7208, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7209, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7210, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7212, true},
+    {0x000000000416, 7213, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7217, false},
+    {0x080040008020, 7219, false},
+    {0x010000000202, 7223, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7226, false},
+    {0x000000080000, 7227, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7228, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 7230, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7231, false},
+    {0x040000000000, 7232, false},
+    {0x000400000000, 7233, false},
+    {0x000000000400, 7234, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7235, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x028400010000, 7236, false},
+    {0x000000010000, 7240, false},
+    {0x000000080000, 7241, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008010000078, 7242, true},
+    {0x000400000000, 7248, false},
+    {0x000004000000, 7249, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0800C0000000, 7250, true},
+    {0x000004000000, 7253, false},
+    {0x000004100000, 7254, false},
+    {0x000000180000, 7256, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7258, true},
+    {0x000000010000, 7259, false},
+    {0x000000010000, 7260, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7261, false},
+    {0x000000100000, 7262, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040240012000, 7263, true},
+    {0x008000000000, 7268, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7269, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7270, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7271, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000180000, 7272, false},
+    {0x080000000000, 7274, true},
+    {0x080008000000, 7275, false},
+    {0x008000010000, 7277, false},
+    {0x000000100000, 7279, false},
+    {0x000000080000, 7280, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000004, 7281, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7283, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7284, false},
+    {0x0000000005FE, 7285, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000010, 7294, true},
+    {0x000004000000, 7295, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040400000004, 7296, true},
+    {0x000000000402, 7299, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7301, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080040000000, 7302, false},
+    {0x00044000005A, 7304, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7310, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7311, false},
+    {0x000010000000, 7312, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7313, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 7314, false},
+    {0x000040000000, 7315, false},
+    {0x000040000000, 7316, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7317, false},
+    {0x080400000000, 7319, false},
+    {0x080400000000, 7321, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7323, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7324, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7326, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7327, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7328, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7329, false},
+    {0x008008000000, 7330, true},
+    {0x000400000000, 7332, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7333, false},
+    {0x000004000000, 7334, false},
+    {0x000000080000, 7335, false},
+    {0x000000080000, 7336, false},
+    {0x000004180000, 7337, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0600000100C0, 7340, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7345, false},
+    {0x000004000000, 7346, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7347, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010010000, 7348, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7350, false},
+    {0x000004080000, 7351, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040040000000, 7353, false},
+    {0x000000080000, 7355, false},
+    {0x000000010000, 7356, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 7357, true},
+    {0x000000000000, 0, true},
+    {0x040000000010, 7360, true},
+    {0x000000010000, 7362, true},
+    {0x000000080000, 7363, false},
+    {0x000000080000, 7364, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7365, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7366, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7367, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7369, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000402, 7370, false},
+    {0x010000000000, 7372, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0D00000002F4, 7373, true},
+    {0x004000000000, 7382, true},
+    {0x040080000000, 7383, false},
+    {0x000000080000, 7385, false},
+    {0x000000080000, 7386, false},
+    {0x000004000000, 7387, false},
+    {0x000000008000, 7388, false},
+    {0x000000080000, 7389, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7390, true},
+    {0x000000000004, 7391, true},
+    {0x000004080000, 7392, false},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7394, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 7396, true},
+    {0x040000000000, 7397, false},
+    {0x000004000000, 7398, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 7399, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7400, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400010000, 7401, false},
+    {0x000410000000, 7403, true},
+    {0x000004100000, 7405, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7407, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7409, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000004, 7410, true},
+    {0x000000080000, 7412, false},
+    {0x000000010000, 7413, false},
+    {0x000000080000, 7414, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000004, 7415, true},
+    {0x000004000000, 7417, false},
+    {0x000004100000, 7418, false},
+    {0x000000080000, 7420, false},
+    {0x000000000000, 0, true},
+    {0x000000010004, 7421, true},
+    {0x000000100000, 7423, false},
+    {0x080400000000, 7424, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7426, false},
+    {0x040000000000, 7428, false},
+    {0x000000010000, 7429, true},
+    {0x0E0000000014, 7430, true},
+    {0x000000080000, 7435, false},
+    {0x000000080000, 7436, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7437, false},
+    {0x000000010000, 7438, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7439, true},
+    {0x000000100000, 7440, false},
+    {0x00000000040E, 7441, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7445, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7446, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7448, true},
+    {0x000000010000, 7449, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7450, false},
+    {0x000000080000, 7451, false},
+    {0x000004000000, 7452, false},
+    {0x000004080000, 7453, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7455, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7456, false},
+    {0x000000100000, 7457, false},
+    {0x080000000024, 7458, true},
+    {0x000000000024, 7461, true},
+    {0x00000000003C, 7463, true},
+    {0x000000000000, 0, true},
+    {0x000000010004, 7467, false},
+    {0x000000080000, 7469, false},
+    {0x000040000000, 7470, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 7471, false},
+    {0x040400000000, 7472, false},
+    {0x000004000000, 7474, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7475, false},
+    {0x000004000000, 7476, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 7477, false},
+    {0x000004000000, 7480, false},
+    {0x000004000000, 7481, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7482, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7484, false},
+    {0x048000000000, 7485, false},
+    {0x000004000000, 7487, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7488, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 7490, true},
+    {0x000000080000, 7492, false},
+    {0x000004000000, 7493, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 7494, false},
+    {0x000400000000, 7497, true},
+    {0x040000000000, 7498, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7499, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7500, false},
+    {0x080400000000, 7502, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000020, 7504, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7505, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 7506, false},
+    {0x000004000000, 7507, false},
+    {0x000000000008, 7508, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004180000, 7509, false},
+    {0x080008000000, 7512, false},
+    {0x000404000000, 7514, false},
+    {0x000004080000, 7516, false},
+    {0x008000000000, 7518, false},
+    {0x000000080000, 7519, false},
+    {0x000004080000, 7520, false},
+    {0x000004000000, 7522, false},
+    {0x000000100000, 7523, false},
+    {0x000004080000, 7524, false},
+    {0x000000180000, 7526, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7528, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 7529, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000007FE, 7531, false},
+    {0x000000000004, 7541, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C84100000EE, 7542, false},
+    {0x040000000000, 7553, false},
+    {0x000000000100, 7554, false},
+    {0x000000080000, 7555, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7556, false},
+    {0x000000000400, 7557, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000036, 7558, false},
+    {0x020000000000, 7562, false},
+    {0x00000000000C, 7563, false},
+    {0x000004000000, 7565, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7566, false},
+    {0x080400000000, 7568, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000004, 7570, true},
+    {0x0C0000000000, 7572, false},
+    {0x000000010000, 7574, false},
+    {0x000000080000, 7575, false},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 7576, false},
+    {0x000004000000, 7578, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7579, false},
+    {0x000000010000, 7580, false},
+    {0x000000100000, 7581, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7582, false},
+    {0x000000000008, 7583, true},
+    {0x000400000004, 7584, true},
+    {0x000004000000, 7586, false},
+    {0x000004000000, 7587, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000018, 7588, false},
+    {0x040000000000, 7590, false},
+    {0x000000180000, 7591, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7593, true},
+    {0x000000080000, 7594, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7595, false},
+    {0x0000000004FE, 7597, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7605, false},
+    {0x080000000008, 7606, false},
+    {0x0C800000016E, 7608, true},
+    {0x0000C000000C, 7617, true},
+    {0x000004000000, 7621, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7622, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7623, false},
+    {0x000000080000, 7624, false},
+    {0x000004000000, 7625, false},
+    {0x000000100000, 7626, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7627, false},
+    {0x000000180000, 7628, false},
+    {0x080000000068, 7630, false},
+    {0x000004000000, 7634, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 7635, false},
+    {0x000000010000, 7636, false},
+    {0x010000010004, 7637, true},
+    {0x080000000000, 7640, false},
+    {0x000000100000, 7641, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 7642, false},
+    {0x0A040000001C, 7643, false},
+    {0x000400000000, 7649, false},
+    {0x000004000000, 7650, false},
+    {0x000000100000, 7651, false},
+    {0x000400000000, 7652, false},
+    {0x000000100000, 7653, false},
+    {0x000004080000, 7654, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7656, false},
+    {0x080000000000, 7658, false},
+    {0x000004000000, 7659, false},
+    {0x000004080000, 7660, false},
+    {0x000004100000, 7662, false},
+    {0x000000100000, 7664, false},
+    {0x000004080000, 7665, false},
+    {0x000000180000, 7667, false},
+    {0x000004000000, 7669, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7670, false},
+    {0x000400010000, 7671, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7673, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7675, false},
+    {0x080400000000, 7677, false},
+    {0x000000000000, 0, true},
+    {0x040000000008, 7679, true},
+    {0x000000100000, 7681, false},
+    {0x000004000000, 7682, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7683, true},
+    {0x0000000006DE, 7684, false},
+    {0x080400000000, 7692, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C0040000000, 7694, false},
+    {0x00821000025E, 7697, true},
+    {0x000000080000, 7706, false},
+    {0x000004080000, 7707, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7709, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020208000000, 7710, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7713, true},
+    {0x020000000000, 7714, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7715, false},
+    {0x000000100000, 7716, false},
+    {0x080044010000, 7717, false},
+    {0x006000010000, 7721, false},
+    {0x000000080000, 7724, false},
+    {0x000000010000, 7725, false},
+    {0x000400000000, 7726, false},
+    {0x000400000000, 7727, false},
+    {0x080000000000, 7728, false},
+    {0x000000080000, 7729, false},
+    {0x000000000400, 7730, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7731, false},
+    {0x08440000017E, 7732, false},
+    {0x000004000000, 7742, false},
+    {0x000004000000, 7743, false},
+    {0x008000000000, 7744, false},
+    {0x008000000000, 7745, false},
+    {0x002000000000, 7746, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x07004000000C, 7747, true},
+    {0x000040000004, 7753, true},
+    {0x0C0000000000, 7755, false},
+    {0x000000080000, 7757, false},
+    {0x000000080000, 7758, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7759, false},
+    {0x000000010000, 7760, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7761, true},
+    {0x08000000007C, 7762, true},
+    {0x000000100000, 7768, false},
+    {0x000000108000, 7769, false},
+    {0x000004000000, 7771, false},
+    {0x000000080000, 7772, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7773, true},
+    {0x000000010004, 7774, false},
+    {0x000000100000, 7776, false},
+    {0x000000088000, 7777, false},
+    {0x000400000000, 7779, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7780, true},
+    {0x000000080000, 7781, false},
+    {0x000000108000, 7782, false},
+    {0x000000080000, 7784, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7785, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7786, false},
+    {0x000000080000, 7787, false},
+    {0x000010000000, 7788, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080080000000, 7789, true},
+    {0x000004000000, 7791, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 7792, false},
+    {0x000000080000, 7793, false},
+    {0x040000000000, 7794, false},
+    {0x002080000000, 7795, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 7797, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7799, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x002008010000, 7800, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7803, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x030000000010, 7804, true},
+    {0x00000000003C, 7807, true},
+    {0x000000080000, 7811, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7812, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 7813, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7814, false},
+    {0x020000000000, 7815, false},
+    {0x000000000000, 0, true},
+    {0x000004180000, 7816, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7819, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7820, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7821, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 7822, false},
+    {0x000004000000, 7823, false},
+    {0x000000090000, 7824, false},
+    {0x040000000000, 7826, false},
+    {0x040000000000, 7827, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000100, 7828, false},
+    {0x010000000000, 7829, true},
+    {0x080400000000, 7830, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000014, 7832, false},
+    {0x00000000001A, 7834, false},
+    {0x000004000000, 7837, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7838, false},
+    {0x000000000426, 7839, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7843, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7844, true},
+    {0x0C80100000B6, 7845, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7854, false},
+    {0x000000080000, 7855, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 7856, true},
+    {0x010000000000, 7857, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 7858, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 7860, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000010000, 7861, true},
+    {0x000400000000, 7863, false},
+    {0x080400000000, 7864, false},
+    {0x008410000000, 7866, false},
+    {0x000000080000, 7869, false},
+    {0x000000180000, 7870, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7872, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7873, true},
+    {0x000000180000, 7874, false},
+    {0x000000000400, 7876, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7877, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x09000000001C, 7878, true},
+    {0x000000100000, 7883, false},
+    {0x000000100000, 7884, false},
+    {0x000000080000, 7885, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 7886, false},
+    {0x000000000400, 7887, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7888, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040040000000, 7889, false},
+    {0x000004100000, 7891, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000004FE, 7893, false},
+    {0x080400000000, 7901, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7903, false},
+    {0x000000000000, 0, true},
+    {0x0800180003FC, 7905, true},
+    {0x008000000000, 7916, false},
+    {0x000000000400, 7917, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 7918, false},
+    {0x000000000000, 0, true},
+    {0x080440000000, 7919, false},
+    {0x000400000000, 7922, false},
+    {0x000004000000, 7923, false},
+    {0x000004000000, 7924, false},
+    {0x000000000400, 7925, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7926, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7927, false},
+    {0x000000108000, 7928, false},
+    {0x000004000000, 7930, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0E0000000008, 7931, true},
+    {0x0000000000C0, 7935, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 7937, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000010000, 7938, false},
+    {0x0200000003FA, 7940, true},
+    {0x000040000004, 7949, true},
+    {0x000000010000, 7951, false},
+    {0x008000000000, 7952, false},
+    {0x000000080000, 7953, false},
+    {0x000000080000, 7954, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7955, false},
+    {0x000004080000, 7956, false},
+    {0x000000080000, 7958, false},
+    {0x000000008000, 7959, false},
+    {0x010000000000, 7960, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 7961, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 7962, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008010000054, 7963, true},
+    {0x000004000000, 7968, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 7969, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 7970, false},
+    {0x000000080000, 7971, false},
+    {0x000000010000, 7972, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7973, false},
+    {0x000000100000, 7974, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004180000, 7975, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 7978, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 7980, false},
+    {0x000000080000, 7981, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08004000003C, 7982, true},
+    {0x010000000000, 7988, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x022000000000, 7989, false},
+    {0x000000100000, 7991, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 7992, false},
+    {0x000000100000, 7993, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 7994, false},
+    {0x000000010000, 7995, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 7996, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0800000000EC, 7998, true},
+    {0x000004000000, 8004, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8005, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 8006, false},
+    {0x008000000020, 8007, true},
+    {0x000000000002, 8009, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000108000, 8010, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010010000, 8012, false},
+    {0x000400000000, 8014, true},
+    {0x080000000000, 8015, true},
+    {0x000004080000, 8016, false},
+    {0x000000010000, 8018, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8019, false},
+    {0x040010000000, 8020, false},
+    {0x000004100000, 8022, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 8024, true},
+    {0x000000100000, 8025, false},
+    {0x000004000000, 8026, false},
+    {0x000000000002, 8027, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0800000001FC, 8028, true},
+    {0x0000000001FC, 8036, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 8043, false},
+    {0x0C0400000000, 8044, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8047, false},
+    {0x000004000000, 8048, false},
+    {0x000000000000, 0, true},
+    {0x080010000000, 8049, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x022008000000, 8051, false},
+    {0x000004188000, 8054, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8058, true},
+    {0x048000030000, 8059, true},
+    {0x010000000000, 8063, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8064, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8065, false},
+    {0x000004000000, 8066, false},
+    {0x000000000000, 0, true},
+    {0x028408010000, 8067, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8072, false},
+    {0x000004000000, 8074, false},
+    {0x000000010008, 8075, false},
+    {0x000000080000, 8077, false},
+    {0x000000080000, 8078, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8079, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000004, 8081, false},
+    {0x000004000000, 8083, false},
+    {0x000000080000, 8084, false},
+    {0x0000000000FC, 8085, true},
+    {0x000000000000, 0, true},
+    {0x040000020000, 8091, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8093, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00008001000C, 8094, true},
+    {0x000004000000, 8098, false},
+    {0x000000080000, 8099, false},
+    {0x000000100000, 8100, false},
+    {0x000004080000, 8101, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8103, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 8104, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8106, true},
+    {0x000004000000, 8107, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8108, true},
+    {0x000000000232, 8109, true},
+    {0x000000080000, 8113, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 8114, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8115, true},
+    {0x0800C0000000, 8116, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010010000, 8119, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8121, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8122, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8123, false},
+    {0x002080000000, 8124, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8126, false},
+    {0x000000000000, 0, true},
+    {0x020000010000, 8128, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000010000, 8130, false},
+    {0x000000010000, 8132, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8133, false},
+    {0x010000000000, 8134, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8135, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8137, false},
+    {0x000004000000, 8138, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8139, false},
+    {0x040000000000, 8140, false},
+    {0x000000100000, 8141, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000000, 8142, false},
+    {0x00008001006C, 8143, false},
+    {0x000000000000, 0, true},
+    {0x000080000000, 8149, false},
+    {0x000000080000, 8150, false},
+    {0x080000000000, 8151, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8152, true},
+    {0x040000000000, 8153, false},
+    {0x000004000000, 8154, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x04000000000C, 8155, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8158, true},
+    {0x000000100000, 8159, false},
+    {0x040000000000, 8160, false},
+    {0x000004000000, 8161, false},
+    {0x020400010000, 8162, false},
+    {0x000000010000, 8165, false},
+    {0x000000080000, 8166, false},
+    {0x000004000000, 8167, false},
+    {0x000004000000, 8168, false},
+    {0x000000080000, 8169, false},
+    {0x000004000000, 8170, false},
+    {0x040000000000, 8171, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8172, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8173, false},
+    {0x080400000000, 8175, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8177, false},
+    {0x080400000000, 8179, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8181, false},
+    {0x080400000000, 8183, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8185, true},
+    {0x010000000000, 8186, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8187, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 8188, false},
+    {0x000000000000, 0, true},
+    {0x0C0010000000, 8189, false},
+    {0x000004000000, 8192, false},
+    {0x000040000000, 8193, false},
+    {0x0000000004FE, 8194, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8202, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000001000C, 8203, true},
+    {0x00000000041E, 8206, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8211, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000200, 8212, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8213, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8214, false},
+    {0x000000008000, 8215, false},
+    {0x000000000000, 0, true},
+    {0x002000000000, 8216, false},
+    {0x000000010000, 8217, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8218, false},
+    {0x000000080000, 8219, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8220, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 8221, false},
+    {0x000004000000, 8222, false},
+    {0x000000100000, 8223, false},
+    {0x000000180000, 8224, false},
+    {0x000000088000, 8226, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8228, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C000040004C, 8230, true},
+    {0x0C0000400000, 8236, false},
+    {0x000000000000, 0, true},
+    {0x0C0440010000, 8239, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8244, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 8246, false},
+    {0x0C0440000008, 8247, false},
+    {0x000004000000, 8252, false},
+    {0x000004000000, 8253, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 8254, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8255, false},
+    {0x0C0000010000, 8256, true},
+    {0x000400000000, 8259, false},
+    {0x000004000000, 8260, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8261, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8262, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8263, false},
+    {0x080000010000, 8264, false},
+    {0x040000000000, 8266, false},
+    {0x000000100000, 8267, false},
+    {0x000000080000, 8268, false},
+    {0x000004000000, 8269, false},
+    {0x000004000000, 8270, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8271, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8273, false},
+    {0x040400010000, 8274, false},
+    {0x00000001003C, 8277, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8282, false},
+    {0x04004000000C, 8283, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8287, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8288, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8289, true},
+    {0x080000000000, 8290, true},
+    {0x080000000000, 8291, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8292, false},
+    {0x080000000000, 8293, true},
+    {0x00000000007C, 8294, true},
+    {0x080400000000, 8299, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8301, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8302, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8303, false},
+    {0x040080000000, 8304, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8306, false},
+    {0x080000000000, 8307, false},
+    {0x000004000000, 8308, false},
+    {0x000000080000, 8309, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8310, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8311, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 8312, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 8313, false},
+    {0x000000180000, 8314, false},
+    {0x000000088000, 8316, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8318, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8320, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 8321, true},
+    {0x080400000004, 8323, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000180000, 8326, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8328, false},
+    {0x0400000000FC, 8329, true},
+    {0x000000100000, 8336, false},
+    {0x000004008000, 8337, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8339, false},
+    {0x080000000000, 8340, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8341, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8342, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8344, false},
+    {0x020000000000, 8346, false},
+    {0x000400000000, 8347, false},
+    {0x050000010000, 8348, true},
+    {0x000000100000, 8351, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8352, false},
+    {0x060000000000, 8354, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8356, false},
+    {0x040000010000, 8357, false},
+    {0x000004000000, 8359, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 8360, false},
+    {0x000004080000, 8361, false},
+    {0x080000000000, 8363, false},
+    {0x000000180000, 8364, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8366, false},
+    {0x000400000000, 8367, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8368, false},
+    {0x020000000000, 8369, false},
+    {0x000004080000, 8370, false},
+    {0x000000000076, 8372, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x048040000000, 8377, false},
+    {0x000000100000, 8380, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8381, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8382, false},
+    {0x000000000004, 8383, false},
+    {0x080400000000, 8384, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8386, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8388, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000041E, 8389, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8394, false},
+    {0x010000000000, 8396, true},
+    {0x000000000000, 0, true},
+    {0x0400800003FE, 8397, true},
+    {0x040000000000, 8408, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8409, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000C0000000, 8410, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8412, false},
+    {0x080400000000, 8413, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8415, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8416, false},
+    {0x000000080000, 8417, false},
+    {0x010000000000, 8418, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8419, false},
+    {0x000000000400, 8420, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8421, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040040000000, 8422, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000180000, 8424, false},
+    {0x000010000000, 8426, false},
+    {0x000000080000, 8427, false},
+    {0x080040000000, 8428, false},
+    {0x020000000000, 8430, false},
+    {0x080400000000, 8431, false},
+    {0x000004100000, 8433, false},
+    {0x000010000000, 8435, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8436, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 8438, false},
+    {0x000000000002, 8440, false},
+    {0x000000000000, 0, true},
+    {0x000000000006, 8441, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8443, true},
+    {0x040000000000, 8444, false},
+    {0x0400400003FE, 8445, true},
+    {0x000000100000, 8456, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8457, false},
+    {0x000000100000, 8458, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8459, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8460, false},
+    {0x000000010000, 8461, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000000, 8462, false},
+    {0x000040000000, 8463, true},
+    {0x000004000000, 8464, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000001000C, 8465, false},
+    {0x000004000000, 8468, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 8469, false},
+    {0x000004000000, 8470, false},
+    {0x000000080000, 8471, false},
+    {0x000004100000, 8472, false},
+    {0x000000100000, 8474, false},
+    {0x000000080000, 8475, false},
+    {0x000000100000, 8476, false},
+    {0x040000000000, 8477, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8478, false},
+    {0x000040000000, 8479, false},
+    {0x000004000000, 8480, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8481, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8482, true},
+    {0x080000000000, 8483, false},
+    {0x000000080000, 8484, false},
+    {0x000000000002, 8485, false},
+    {0x000004100000, 8486, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8488, false},
+    {0x010000000000, 8489, true},
+    {0x010000000000, 8490, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8491, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8492, false},
+    {0x000004080000, 8493, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8495, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x002008010000, 8497, true},
+    {0x000000008000, 8500, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8501, false},
+    {0x000000100000, 8502, false},
+    {0x000000080000, 8503, false},
+    {0x000000008000, 8504, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8505, true},
+    {0x000000080000, 8506, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8507, false},
+    {0x000000000002, 8508, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000008, 8509, true},
+    {0x000000000000, 0, true},
+    {0x00048000001C, 8511, true},
+    {0x000004000000, 8516, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8517, true},
+    {0x020040000000, 8518, false},
+    {0x000004000000, 8520, false},
+    {0x020400000000, 8521, true},
+    {0x000004000000, 8523, false},
+    {0x000004000000, 8524, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8525, false},
+    {0x000000000000, 0, true},
+    {0x040010010084, 8526, true},
+    {0x000000000004, 8531, true},
+    {0x000000100000, 8532, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8533, true},
+    {0x080000000000, 8534, false},
+    {0x000000000000, 0, true},
+    {0x000200000000, 8535, false},
+    {0x080400000000, 8536, false},
+    {0x000000180000, 8538, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8540, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8541, false},
+    {0x000004000000, 8542, false},
+    {0x0C000000003C, 8543, true},
+    {0x00004000000C, 8549, true},
+    {0x000004080000, 8552, false},
+    {0x000000100000, 8554, false},
+    {0x000000080000, 8555, false},
+    {0x000004180000, 8556, false},
+    {0x000000080000, 8559, false},
+    {0x010000000000, 8560, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8561, false},
+    {0x000000010000, 8562, false},
+    {0x040000000000, 8563, false},
+    {0x040000000000, 8564, true},
+    {0x000000100000, 8565, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00041001001C, 8566, true},
+    {0x000004000000, 8572, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 8573, false},
+    {0x080400000000, 8574, false},
+    {0x010000000000, 8576, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8577, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 8578, false},
+    {0x080000000000, 8579, false},
+    {0x000004000000, 8580, false},
+    {0x000000008000, 8581, false},
+    {0x000000000002, 8582, false},
+    {0x000004000000, 8583, false},
+    {0x010000000000, 8584, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8585, false},
+    {0x000000100000, 8587, false},
+    {0x000004080000, 8588, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8590, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000008, 8591, false},
+    {0x000000008000, 8593, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8594, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8596, false},
+    {0x000010000000, 8598, false},
+    {0x000010000000, 8599, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8600, false},
+    {0x000000000004, 8601, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080040010004, 8602, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8606, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8607, false},
+    {0x000000080000, 8608, false},
+    {0x080400000000, 8609, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8611, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0A000000037E, 8612, true},
+    {0x080000000000, 8622, true},
+    {0x000000180000, 8623, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8625, false},
+    {0x000000180000, 8626, false},
+    {0x000000000000, 0, true},
+    {0x020040010000, 8628, false},
+    {0x000004000000, 8631, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8632, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8633, false},
+    {0x000400000000, 8635, false},
+    {0x000004080000, 8636, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8638, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000010, 8639, true},
+    {0x000004000000, 8640, false},
+    {0x000000010000, 8641, false},
+    {0x000040000000, 8642, false},
+    {0x000000010000, 8643, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 8644, false},
+    {0x000004080000, 8645, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8647, false},
+    {0x000000080000, 8648, false},
+    {0x000004000000, 8649, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00200800027C, 8650, true},
+    {0x000000080000, 8658, false},
+    {0x000000088000, 8659, false},
+    {0x000000080000, 8661, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8662, false},
+    {0x080000000000, 8664, false},
+    {0x000400000000, 8665, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8666, false},
+    {0x000004080000, 8667, false},
+    {0x000000010000, 8669, false},
+    {0x000000000004, 8670, true},
+    {0x000004000000, 8671, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8672, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8673, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 8674, true},
+    {0x000000080000, 8675, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000020, 8676, true},
+    {0x00001000002C, 8678, true},
+    {0x000000080000, 8682, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8683, false},
+    {0x000400000000, 8684, false},
+    {0x000004080000, 8685, false},
+    {0x040000010000, 8687, false},
+    {0x080400000000, 8689, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 8691, true},
+    {0x008000000000, 8692, false},
+    {0x000004000000, 8693, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 8694, true},
+    {0x000004000000, 8695, false},
+    {0x000004000000, 8696, false},
+    {0x000004000000, 8697, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 8698, false},
+    {0x000000100000, 8700, false},
+    {0x000000100000, 8701, false},
+    {0x00000000000C, 8702, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 8704, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 8705, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8706, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8707, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 8709, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 8711, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8712, false},
+    {0x000000000400, 8713, false},
+    {0x000000000400, 8714, false},
+    {0x000000000400, 8715, false},
+    {0x000000000400, 8716, false},
+    {0x000000000400, 8717, false},
+    {0x000000000400, 8718, false},
+    {0x000000000004, 8719, false},
+    {0x000040000004, 8720, false},
+    {0x000000000008, 8722, false},
+    {0x000000000400, 8723, false},
+    {0x000000000400, 8724, false},
+    {0x000000000400, 8725, false},
+    {0x000000000400, 8726, false},
+    {0x000000000400, 8727, false},
+    {0x000000000400, 8728, false},
+    {0x000000000400, 8729, false},
+    {0x000000000004, 8730, false},
+    {0x000040000004, 8731, false},
+    {0x000000000008, 8733, false},
+    {0x000000000400, 8734, false},
+    {0x000000000400, 8735, false},
+    {0x000000000004, 8736, false},
+    {0x000040000004, 8737, false},
+    {0x000000000008, 8739, false},
+    {0x000000000400, 8740, true},
+    {0x000000000400, 8741, false},
+    {0x000000000400, 8742, false},
+    {0x000000000004, 8743, false},
+    {0x000040000004, 8744, false},
+    {0x000000000008, 8746, false},
+    {0x000000000400, 8747, false},
+    {0x000000000400, 8748, false},
+    {0x000000000400, 8749, false},
+    {0x000000000004, 8750, false},
+    {0x000040000004, 8751, false},
+    {0x000000000008, 8753, false},
+    {0x000000000400, 8754, false},
+    {0x000000000400, 8755, false},
+    {0x000000000400, 8756, false},
+    {0x000000000004, 8757, false},
+    {0x000040000004, 8758, false},
+    {0x000000000008, 8760, false},
+    {0x000000000400, 8761, false},
+    {0x000000000400, 8762, false},
+    {0x000000000004, 8763, false},
+    {0x000040000004, 8764, false},
+    {0x000000000008, 8766, false},
+    {0x000000000400, 8767, false},
+    {0x000000000400, 8768, false},
+    {0x000000000400, 8769, true},
+    {0x000000000004, 8770, false},
+    {0x000040000004, 8771, false},
+    {0x000000000008, 8773, false},
+    {0x000000000400, 8774, false},
+    {0x000000000400, 8775, false},
+    {0x000000000400, 8776, false},
+    {0x000000000004, 8777, false},
+    {0x000040000004, 8778, false},
+    {0x000000000008, 8780, false},
+    {0x000000000400, 8781, false},
+    {0x000000000400, 8782, false},
+    {0x000000000400, 8783, false},
+    {0x000000000400, 8784, false},
+    {0x010000000400, 8785, true},
+    {0x000000000400, 8787, false},
+    {0x000000000004, 8788, false},
+    {0x000040000004, 8789, false},
+    {0x000000000008, 8791, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8792, true},
+    {0x000004000000, 8793, false},
+    {0x000000100000, 8794, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8795, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 8796, false},
+    {0x000000080000, 8797, false},
+    {0x000000080000, 8798, false},
+    {0x000000000400, 8799, false},
+    {0x000000000400, 8800, true},
+    {0x000000000004, 8801, false},
+    {0x000040000004, 8802, false},
+    {0x000000000008, 8804, false},
+    {0x000000000004, 8805, false},
+    {0x000040000004, 8806, false},
+    {0x000000000008, 8808, false},
+    {0x000000000400, 8809, false},
+    {0x000000000004, 8810, false},
+    {0x000040000004, 8811, false},
+    {0x000000000008, 8813, false},
+    {0x000000000004, 8814, false},
+    {0x000040000004, 8815, false},
+    {0x000000000008, 8817, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8818, false},
+    {0x000000000004, 8819, false},
+    {0x000040000004, 8820, false},
+    {0x000000000008, 8822, false},
+    {0x000000000004, 8823, false},
+    {0x000040000004, 8824, false},
+    {0x000000000008, 8826, false},
+    {0x000000000004, 8827, false},
+    {0x000040000004, 8828, false},
+    {0x000000000008, 8830, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8831, false},
+    {0x000000000004, 8832, false},
+    {0x000040000004, 8833, false},
+    {0x000000000008, 8835, false},
+    {0x000000000004, 8836, false},
+    {0x000040000004, 8837, false},
+    {0x000000000008, 8839, false},
+    {0x000000000400, 8840, false},
+    {0x000000000400, 8841, false},
+    {0x000000000400, 8842, false},
+    {0x000000000004, 8843, false},
+    {0x000040000004, 8844, false},
+    {0x000000000008, 8846, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8847, true},
+    {0x000004000000, 8848, false},
+    {0x000000100000, 8849, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8850, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8851, false},
+    {0x000040000004, 8852, false},
+    {0x000000000008, 8854, false},
+    {0x000000000400, 8855, true},
+    {0x000000000004, 8856, false},
+    {0x000040000004, 8857, false},
+    {0x000000000008, 8859, false},
+    {0x000000000004, 8860, false},
+    {0x000040000004, 8861, false},
+    {0x000000000008, 8863, false},
+    {0x000000000400, 8864, false},
+    {0x000000000004, 8865, false},
+    {0x000040000004, 8866, false},
+    {0x000000000008, 8868, false},
+    {0x000000000004, 8869, false},
+    {0x000040000004, 8870, false},
+    {0x000000000008, 8872, false},
+    {0x000000000400, 8873, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8874, false},
+    {0x000040000004, 8875, false},
+    {0x000000000008, 8877, false},
+    {0x000000000004, 8878, false},
+    {0x000040000004, 8879, false},
+    {0x000000000008, 8881, false},
+    {0x000000000400, 8882, false},
+    {0x000000000004, 8883, false},
+    {0x000040000004, 8884, false},
+    {0x000000000008, 8886, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8887, false},
+    {0x000040000004, 8888, false},
+    {0x000000000008, 8890, false},
+    {0x000000000400, 8891, false},
+    {0x000000000004, 8892, false},
+    {0x000040000004, 8893, false},
+    {0x000000000008, 8895, false},
+    {0x000000000002, 8896, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8897, true},
+    {0x010040000000, 8898, true},
+    {0x000004000000, 8900, false},
+    {0x000000100000, 8901, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 8902, true},
+    {0x000040000000, 8903, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 8904, false},
+    {0x000000000004, 8905, false},
+    {0x000040000004, 8906, false},
+    {0x000000000008, 8908, false},
+    {0x000000000004, 8909, false},
+    {0x000040000004, 8910, false},
+    {0x000000000008, 8912, false},
+    {0x000000000400, 8913, true},
+    {0x000000000004, 8914, false},
+    {0x000040000004, 8915, false},
+    {0x000000000008, 8917, false},
+    {0x000000000004, 8918, false},
+    {0x000040000004, 8919, false},
+    {0x000000000008, 8921, false},
+    {0x000000000400, 8922, false},
+    {0x000000000004, 8923, false},
+    {0x000040000004, 8924, false},
+    {0x000000000008, 8926, false},
+    {0x010000000000, 8927, true},
+    {0x000000000004, 8928, false},
+    {0x000040000004, 8929, false},
+    {0x000000000008, 8931, false},
+    {0x000000000400, 8932, false},
+    {0x000000000004, 8933, false},
+    {0x000040000004, 8934, false},
+    {0x000000000008, 8936, false},
+    {0x000000000004, 8937, false},
+    {0x000040000004, 8938, false},
+    {0x000000000008, 8940, false},
+    {0x000000000400, 8941, false},
+    {0x000000000004, 8942, false},
+    {0x000040000004, 8943, false},
+    {0x000000000008, 8945, false},
+    {0x000000000004, 8946, false},
+    {0x000040000004, 8947, false},
+    {0x000000000008, 8949, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8950, true},
+    {0x000004000000, 8951, false},
+    {0x000000100000, 8952, false},
+    {0x010000000000, 8953, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 8954, false},
+    {0x010000000000, 8955, true},
+    {0x000000000400, 8956, false},
+    {0x000000000004, 8957, false},
+    {0x000040000004, 8958, false},
+    {0x000000000008, 8960, false},
+    {0x000000000004, 8961, false},
+    {0x000040000004, 8962, false},
+    {0x000000000008, 8964, false},
+    {0x000000000004, 8965, false},
+    {0x000040000004, 8966, false},
+    {0x000000000008, 8968, false},
+    {0x000000000400, 8969, true},
+    {0x000000000004, 8970, false},
+    {0x000040000004, 8971, false},
+    {0x000000000008, 8973, false},
+    {0x000000000004, 8974, false},
+    {0x000040000004, 8975, false},
+    {0x000000000008, 8977, false},
+    {0x000000000400, 8978, false},
+    {0x000000000004, 8979, false},
+    {0x000040000004, 8980, false},
+    {0x000000000008, 8982, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8983, false},
+    {0x000040000004, 8984, false},
+    {0x000000000008, 8986, false},
+    {0x000000000400, 8987, false},
+    {0x000000000004, 8988, false},
+    {0x000040000004, 8989, false},
+    {0x000000000008, 8991, false},
+    {0x000000000004, 8992, false},
+    {0x000040000004, 8993, false},
+    {0x000000000008, 8995, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 8996, false},
+    {0x000040000004, 8997, false},
+    {0x000000000008, 8999, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 9000, true},
+    {0x000004000000, 9001, false},
+    {0x000000100000, 9002, false},
+    {0x010000000000, 9003, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9004, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 9005, false},
+    {0x000000000400, 9006, true},
+    {0x000000000400, 9007, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 9008, false},
+    {0x000000000400, 9009, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9010, false},
+    {0x000000100000, 9011, false},
+    {0x010000000000, 9012, true},
+    {0x000000000400, 9013, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 9014, false},
+    {0x000000000400, 9015, true},
+    {0x000000000400, 9016, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 9017, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9018, false},
+    {0x000000100000, 9019, false},
+    {0x010000000000, 9020, true},
+    {0x010000000000, 9021, true},
+    {0x000000000400, 9022, false},
+    {0x000000000400, 9023, false},
+    {0x000000000400, 9024, true},
+    {0x000000000400, 9025, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9026, false},
+    {0x000000100000, 9027, false},
+    {0x010000000000, 9028, true},
+    {0x000000000400, 9029, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 9030, false},
+    {0x000000000400, 9031, true},
+    {0x000000000400, 9032, false},
+    {0x000000000400, 9033, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9034, false},
+    {0x000000100000, 9035, false},
+    {0x010000000000, 9036, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9037, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9038, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9039, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 9040, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9041, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9042, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9043, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000100, 9045, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9046, false},
+    {0x000000000002, 9047, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9048, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9049, false},
+    {0x000400000000, 9050, false},
+    {0x000000010000, 9051, false},
+    {0x010000000000, 9052, true},
+    {0x000000080000, 9053, false},
+    {0x000000080000, 9054, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9055, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9056, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9058, false},
+    {0x010000000000, 9059, true},
+    {0x000000008000, 9060, false},
+    {0x000000080000, 9061, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9062, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9063, true},
+    {0x000200000000, 9064, false},
+    {0x000004000000, 9065, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9066, true},
+    {0x00000000000C, 9068, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9070, true},
+    {0x000000000002, 9071, false},
+    {0x040000000000, 9072, false},
+    {0x040000000000, 9073, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9074, true},
+    {0x080400000000, 9075, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9077, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9078, false},
+    {0x080400000000, 9079, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9081, true},
+    {0x000000000002, 9082, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9083, true},
+    {0x000004000000, 9085, true},
+    {0x000000008000, 9086, false},
+    {0x040000000000, 9087, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 9088, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9089, true},
+    {0x000004000000, 9090, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010004000000, 9091, true},
+    {0x000004080000, 9093, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9095, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9096, true},
+    {0x000000000002, 9097, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000004, 9098, true},
+    {0x00000000000C, 9100, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9102, true},
+    {0x000000000004, 9103, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9104, false},
+    {0x040000000000, 9105, false},
+    {0x040000000000, 9106, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9107, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9108, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9109, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9110, false},
+    {0x000000080000, 9111, true},
+    {0x080000000000, 9112, false},
+    {0x010000000000, 9113, true},
+    {0x000000000002, 9114, false},
+    {0x080400000000, 9115, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9117, false},
+    {0x000040000000, 9118, false},
+    {0x000000000000, 0, true},
+    {0x000004080000, 9119, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 9121, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9122, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9123, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9124, true},
+    {0x00000400000C, 9126, true},
+    {0x020000000000, 9129, true},
+    {0x020000000000, 9130, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9131, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9132, false},
+    {0x000400000000, 9134, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9135, false},
+    {0x080400000000, 9137, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9139, false},
+    {0x000000000004, 9140, true},
+    {0x000000010000, 9141, false},
+    {0x000000080000, 9142, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9143, true},
+    {0x010000000000, 9144, true},
+    {0x000000000002, 9145, false},
+    {0x010000000000, 9146, true},
+    {0x000400000000, 9147, false},
+    {0x000000000002, 9148, false},
+    {0x040000000000, 9149, false},
+    {0x000000000002, 9150, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9151, false},
+    {0x000000000000, 0, true},
+    {0x00000008003C, 9152, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9157, false},
+    {0x000000080000, 9158, false},
+    {0x000200000000, 9159, false},
+    {0x000000010000, 9160, false},
+    {0x000004000000, 9161, false},
+    {0x00000400003C, 9162, true},
+    {0x080400000000, 9167, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9169, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9171, false},
+    {0x0A0000000000, 9172, false},
+    {0x000000010000, 9174, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9175, false},
+    {0x000400000000, 9176, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9177, false},
+    {0x000004000000, 9178, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9179, false},
+    {0x000000000002, 9180, false},
+    {0x00000000000C, 9181, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9183, false},
+    {0x080000000000, 9184, false},
+    {0x000010000000, 9185, false},
+    {0x000004000000, 9186, false},
+    {0x000000000004, 9187, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9188, false},
+    {0x000004000000, 9189, false},
+    {0x020000000000, 9190, false},
+    {0x020000000000, 9191, false},
+    {0x080400000000, 9192, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9194, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9196, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9197, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9198, false},
+    {0x000000000004, 9199, true},
+    {0x000000080000, 9200, false},
+    {0x000040000000, 9201, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9202, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9204, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9205, false},
+    {0x000000000002, 9206, false},
+    {0x080400000000, 9207, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9209, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9210, true},
+    {0x000000000402, 9211, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9213, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 9214, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9216, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9217, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9218, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9219, false},
+    {0x000004000000, 9220, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9221, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000402, 9222, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9224, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9225, false},
+    {0x000000000004, 9226, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9227, false},
+    {0x000400000000, 9229, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9230, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9231, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9232, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9234, false},
+    {0x040000000000, 9235, false},
+    {0x000000000002, 9236, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 9237, false},
+    {0x0C0000000000, 9239, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9241, false},
+    {0x000000010000, 9242, false},
+    {0x008000000000, 9243, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9244, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9245, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9246, false},
+    {0x000004000000, 9248, false},
+    {0x000240000000, 9249, false},
+    {0x000004000000, 9251, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9252, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9253, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000000FC, 9254, true},
+    {0x0000000000FC, 9260, true},
+    {0x000000000002, 9266, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9267, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9268, false},
+    {0x000040000000, 9269, false},
+    {0x000004000000, 9270, false},
+    {0x000040000000, 9271, false},
+    {0x000000000002, 9272, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9273, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9274, true},
+    {0x000000000002, 9275, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000406, 9276, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9279, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9280, false},
+    {0x000000000002, 9282, false},
+    {0x010000000000, 9283, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9284, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9285, false},
+    {0x000004000000, 9286, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9287, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9288, false},
+    {0x040000000000, 9289, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 9290, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9292, true},
+    {0x000000000010, 9294, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 9295, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9297, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9298, false},
+    {0x000000000000, 0, true},
+    {0x080400000004, 9299, false},
+    {0x000000080000, 9302, false},
+    {0x000000000002, 9303, false},
+    {0x000000080000, 9304, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9305, false},
+    {0x09000400000C, 9306, true},
+    {0x00000000001C, 9311, true},
+    {0x000000080000, 9314, false},
+    {0x000000080000, 9315, false},
+    {0x000000000004, 9316, true},
+    {0x010000000000, 9317, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9318, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9319, false},
+    {0x000000080010, 9320, false},
+    {0x000004000000, 9322, false},
+    {0x000000000000, 0, true},
+    {0x000404100000, 9323, false},
+    {0x000000000004, 9326, true},
+    {0x00000000001C, 9327, true},
+    {0x000000080000, 9330, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9331, false},
+    {0x000004000000, 9332, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9333, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9334, false},
+    {0x000000000004, 9335, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9336, true},
+    {0x000000000002, 9337, false},
+    {0x000004000000, 9338, false},
+    {0x00000000001C, 9339, false},
+    {0x000000100000, 9342, false},
+    {0x000000000000, 0, true},
+    {0x000010000004, 9343, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000000000C, 9345, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9348, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9349, false},
+    {0x00000000003C, 9350, true},
+    {0x01000000001C, 9354, true},
+    {0x010000000000, 9358, true},
+    {0x00000000000C, 9359, true},
+    {0x00000000000C, 9361, true},
+    {0x080400000000, 9363, false},
+    {0x080400000000, 9365, false},
+    {0x080400000000, 9367, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9369, false},
+    {0x080400000000, 9370, false},
+    {0x000000000002, 9372, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000402, 9373, false},
+    {0x080400000000, 9375, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9377, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9378, false},
+    {0x000000000008, 9379, false},
+    {0x000000000004, 9380, true},
+    {0x080400000000, 9381, false},
+    {0x080400000000, 9383, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9385, false},
+    {0x010000000000, 9386, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9387, false},
+    {0x000004000000, 9388, false},
+    {0x000004000000, 9389, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0100000000FC, 9390, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00040000007C, 9397, true},
+    {0x000004000000, 9403, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 9404, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9406, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9407, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 9408, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9410, false},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 9412, false},
+    {0x000004000000, 9414, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9415, false},
+    {0x020000000000, 9416, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9417, true},
+    {0x000000000002, 9418, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9419, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9420, true},
+    {0x010000000000, 9422, true},
+    {0x000000000002, 9423, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9424, true},
+    {0x008000000004, 9426, true},
+    {0x000000080000, 9428, false},
+    {0x000000008000, 9429, false},
+    {0x000000000004, 9430, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9431, false},
+    {0x000004000000, 9432, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 9433, false},
+    {0x0000000000FC, 9434, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9440, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9441, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9442, false},
+    {0x080400000000, 9444, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9446, true},
+    {0x000000000004, 9447, true},
+    {0x00000000000C, 9448, true},
+    {0x000000000004, 9450, true},
+    {0x00000000000C, 9451, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9453, true},
+    {0x000000080000, 9454, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9455, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9456, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9457, false},
+    {0x08040000001C, 9458, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9463, false},
+    {0x008000000000, 9464, false},
+    {0x000000000002, 9465, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9466, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9467, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9468, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9469, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 9470, false},
+    {0x000000000002, 9473, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9474, false},
+    {0x000004000000, 9475, false},
+    {0x000000000000, 0, true},
+    {0x00000000040C, 9476, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9479, false},
+    {0x000040000000, 9480, false},
+    {0x00000000001C, 9481, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000080, 9484, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9485, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9486, true},
+    {0x004000000000, 9488, true},
+    {0x010000000038, 9489, true},
+    {0x000000100000, 9493, false},
+    {0x000008000000, 9494, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9495, true},
+    {0x010000000000, 9496, true},
+    {0x00000000000C, 9497, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9499, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9500, false},
+    {0x080000000000, 9501, false},
+    {0x000000010000, 9502, false},
+    {0x080000000000, 9503, false},
+    {0x000000020000, 9504, false},
+    {0x00000000001C, 9505, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9508, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9509, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9510, false},
+    {0x000004000000, 9511, false},
+    {0x00000000000C, 9512, true},
+    {0x08044400006C, 9514, false},
+    {0x000004000000, 9522, false},
+    {0x000004080004, 9523, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9526, false},
+    {0x000000000002, 9527, false},
+    {0x000000000002, 9528, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 9529, false},
+    {0x000000000000, 0, true},
+    {0x08040000003C, 9530, false},
+    {0x000000000004, 9536, true},
+    {0x000004000000, 9537, false},
+    {0x08040000000C, 9538, false},
+    {0x000000010000, 9542, false},
+    {0x008000000000, 9543, false},
+    {0x010000000000, 9544, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9545, false},
+    {0x000040000004, 9546, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9548, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9549, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9550, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9551, false},
+    {0x0000000000FC, 9552, true},
+    {0x000004000004, 9558, true},
+    {0x000000000002, 9560, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000040, 9561, false},
+    {0x000000010000, 9562, false},
+    {0x000000000004, 9563, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9564, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000006C, 9565, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9569, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9570, false},
+    {0x000240000000, 9571, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010410000000, 9573, true},
+    {0x0000000100FC, 9576, true},
+    {0x000000010000, 9583, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9584, false},
+    {0x040000000000, 9585, false},
+    {0x048000000000, 9586, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010400004, 9588, true},
+    {0x000000000004, 9591, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 9592, false},
+    {0x040000000000, 9595, false},
+    {0x000000080000, 9596, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9597, true},
+    {0x04024000001C, 9599, true},
+    {0x000000000000, 0, true},
+    {0x0000000000FC, 9605, true},
+    {0x08040000006C, 9611, false},
+    {0x00000008003C, 9617, true},
+    {0x000400000000, 9622, false},
+    {0x080000000000, 9623, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 9624, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9626, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9627, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9628, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9629, false},
+    {0x000004000008, 9630, true},
+    {0x000000000004, 9632, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9633, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9634, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9635, true},
+    {0x000004000000, 9636, false},
+    {0x040000000000, 9637, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9638, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000006C, 9639, true},
+    {0x040000000000, 9643, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9644, true},
+    {0x000400000000, 9646, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9647, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9648, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9649, false},
+    {0x000000000004, 9650, true},
+    {0x000000000000, 0, true},
+    {0x004000000000, 9651, false},
+    {0x010000000000, 9652, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9653, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 9654, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 9656, true},
+    {0x000004000000, 9661, true},
+    {0x00000000000C, 9662, false},
+    {0x040000000000, 9664, false},
+    {0x000000010000, 9665, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9666, false},
+    {0x00000000000C, 9667, true},
+    {0x000000010000, 9669, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001E, 9670, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9674, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9675, false},
+    {0x000400000000, 9676, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 9677, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 9678, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9679, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9680, true},
+    {0x080000000000, 9681, false},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 9682, false},
+    {0x000004000000, 9684, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9685, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9686, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9687, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9688, true},
+    {0x000000100000, 9689, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9690, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000004, 9691, true},
+    {0x00000000000C, 9693, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9695, false},
+    {0x000000000002, 9696, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9697, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 9699, false},
+    {0x000000000000, 0, true},
+    {0x00004000001C, 9700, true},
+    {0x040000000000, 9704, false},
+    {0x000000000000, 0, true},
+    {0x000008000000, 9705, false},
+    {0x000000080000, 9706, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9707, false},
+    {0x000000000004, 9708, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 9709, true},
+    {0x000000010000, 9712, false},
+    {0x000000010000, 9713, false},
+    {0x000010000000, 9714, false},
+    {0x000000010000, 9715, false},
+    {0x000000000004, 9716, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9717, true},
+    {0x080000000000, 9718, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9719, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000284, 9720, false},
+    {0x000000000402, 9723, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 9725, true},
+    {0x000000000000, 0, true},
+    {0x01001002003C, 9727, true},
+    {0x0804000001FC, 9734, false},
+    {0x000000000024, 9743, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 9745, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9746, true},
+    {0x000000000404, 9747, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010100000, 9749, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9751, false},
+    {0x000004000000, 9752, false},
+    {0x000000000004, 9753, true},
+    {0x000000100000, 9754, false},
+    {0x080400000004, 9755, false},
+    {0x000000000004, 9758, true},
+    {0x000000000004, 9759, true},
+    {0x000400000000, 9760, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9761, true},
+    {0x040000000000, 9762, false},
+    {0x00000000000C, 9763, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9765, false},
+    {0x000040000000, 9766, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9767, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9768, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9769, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000002C2, 9771, false},
+    {0x000000000402, 9775, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9777, true},
+    {0x000000000000, 0, true},
+    {0x08000400000C, 9779, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9783, false},
+    {0x080000000000, 9784, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9785, false},
+    {0x080000000000, 9786, false},
+    {0x000000020000, 9787, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9788, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9790, false},
+    {0x00000000009C, 9792, true},
+    {0x080000000000, 9796, false},
+    {0x000000000004, 9797, true},
+    {0x000000080000, 9798, false},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 9799, true},
+    {0x000000000002, 9802, false},
+    {0x010000000000, 9803, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9804, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9805, false},
+    {0x000000100000, 9807, false},
+    {0x000000000010, 9808, false},
+    {0x000000000004, 9809, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9810, false},
+    {0x080000000000, 9811, false},
+    {0x00000000000C, 9812, true},
+    {0x080000000000, 9814, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9815, false},
+    {0x000000010000, 9816, false},
+    {0x001000000000, 9817, false},
+    {0x080000000000, 9818, false},
+    {0x000400000000, 9819, false},
+    {0x000000010000, 9820, false},
+    {0x000000010000, 9821, false},
+    {0x080000000000, 9822, false},
+    {0x000010000000, 9823, false},
+    {0x000000010000, 9824, false},
+    {0x040000000000, 9825, false},
+    {0x000000010000, 9826, false},
+    {0x000000000004, 9827, true},
+    {0x080000000000, 9828, false},
+    {0x008000000000, 9829, false},
+    {0x000000080000, 9830, false},
+    {0x000000000004, 9831, true},
+    {0x0000040000FC, 9832, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9839, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9840, false},
+    {0x080400000000, 9842, false},
+    {0x080400000000, 9844, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9846, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9848, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 9849, false},
+    {0x000000000406, 9852, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9855, false},
+    {0x00000000003C, 9856, true},
+    {0x08040000003C, 9860, false},
+    {0x080400000000, 9866, false},
+    {0x000000000004, 9868, true},
+    {0x080400000004, 9869, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9872, true},
+    {0x000000100000, 9873, false},
+    {0x000000100000, 9874, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 9875, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000008000000, 9876, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9877, true},
+    {0x000000000004, 9878, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 9879, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 9880, false},
+    {0x000000100000, 9881, false},
+    {0x000400000000, 9882, false},
+    {0x000000000004, 9883, true},
+    {0x000400000000, 9884, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 9885, false},
+    {0x000000000402, 9886, false},
+    {0x010000000000, 9888, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9889, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9891, true},
+    {0x014000000000, 9892, true},
+    {0x000000000004, 9894, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9895, false},
+    {0x080400000000, 9896, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9898, false},
+    {0x000000000002, 9899, false},
+    {0x000000080000, 9900, false},
+    {0x020000000000, 9901, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 9902, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9903, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9905, true},
+    {0x000000000000, 0, true},
+    {0x000000000070, 9906, false},
+    {0x000008000000, 9909, false},
+    {0x000000010000, 9910, false},
+    {0x000000010000, 9911, false},
+    {0x000000000000, 0, true},
+    {0x008000000000, 9912, false},
+    {0x080400000004, 9913, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 9916, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 9917, false},
+    {0x000000010000, 9919, false},
+    {0x000000010000, 9920, false},
+    {0x000000010000, 9921, false},
+    {0x000000010000, 9922, false},
+    {0x000040000000, 9923, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 9924, true},
+    {0x000010000000, 9926, false},
+    {0x010000000000, 9927, true},
+    {0x020000000000, 9928, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000108000, 9929, false},
+    {0x000000000004, 9931, true},
+    {0x000000000000, 0, true},
+    {0x000000080004, 9932, true},
+    {0x000004000000, 9934, false},
+    {0x000000000004, 9935, true},
+    {0x000000000004, 9936, true},
+    {0x000000000002, 9937, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9938, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9939, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 9940, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9942, false},
+    {0x000000000000, 0, true},
+    {0x020000000000, 9943, false},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 9944, true},
+    {0x00000000007C, 9949, true},
+    {0x00000000007C, 9954, true},
+    {0x000000080000, 9959, false},
+    {0x000000010000, 9960, false},
+    {0x000010000000, 9961, false},
+    {0x00000000000C, 9962, true},
+    {0x000400000000, 9964, false},
+    {0x000000080000, 9965, false},
+    {0x000000010000, 9966, false},
+    {0x000000000000, 0, true},
+    {0x002000000000, 9967, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9968, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000100, 9969, false},
+    {0x080400000000, 9970, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9972, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9973, false},
+    {0x000000000002, 9974, false},
+    {0x00000000005A, 9975, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 9979, true},
+    {0x010004000000, 9980, true},
+    {0x000010000000, 9982, true},
+    {0x00000000007C, 9983, true},
+    {0x0000000000E2, 9988, false},
+    {0x000000000004, 9992, true},
+    {0x040000000000, 9993, false},
+    {0x080400000000, 9994, false},
+    {0x000000000002, 9996, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 9997, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 9998, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 9999, false},
+    {0x000004000000, 10000, false},
+    {0x000004000000, 10001, false},
+    {0x000000000004, 10002, true},
+    {0x008010000024, 10003, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10007, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10008, true},
+    {0x000000000002, 10009, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10010, false},
+    {0x00000000001C, 10011, true},
+    {0x080000000000, 10014, false},
+    {0x080000000000, 10015, false},
+    {0x000040000000, 10016, false},
+    {0x020000000000, 10017, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10018, false},
+    {0x000004000000, 10019, false},
+    {0x00000000000C, 10020, true},
+    {0x00040000000C, 10022, true},
+    {0x08040000000C, 10025, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10029, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000004, 10030, true},
+    {0x000000000000, 0, true},
+    {0x0000000000FC, 10032, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000000, 10038, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10039, false},
+    {0x000400000000, 10040, false},
+    {0x040000000000, 10041, false},
+    {0x040000000000, 10042, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080008, 10043, true},
+    {0x000004000000, 10045, false},
+    {0x010000000004, 10046, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10048, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000004FE, 10049, false},
+    {0x080400000000, 10057, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10059, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 10060, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10062, true},
+    {0x00000000000C, 10063, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 10065, false},
+    {0x000000010000, 10066, false},
+    {0x000040000004, 10067, true},
+    {0x000008000000, 10069, false},
+    {0x000400000000, 10070, true},
+    {0x000000010000, 10071, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10072, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10073, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10074, false},
+    {0x010000000004, 10075, true},
+    {0x000000010000, 10077, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10078, false},
+    {0x000000000000, 0, true},
+    {0x000000000008, 10079, true},
+    {0x000000000008, 10080, true},
+    {0x00000000000C, 10081, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10083, false},
+    {0x008410000000, 10084, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10087, true},
+    {0x000004000004, 10088, true},
+    {0x000000000002, 10090, false},
+    {0x000004000000, 10091, false},
+    {0x000000080004, 10092, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 10094, false},
+    {0x000000010000, 10095, false},
+    {0x010000000000, 10096, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040400000000, 10097, false},
+    {0x000000000002, 10099, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10100, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10101, false},
+    {0x00000000001C, 10102, true},
+    {0x000004000000, 10105, true},
+    {0x080000000000, 10106, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10107, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08040000000C, 10108, false},
+    {0x000000000000, 0, true},
+    {0x08040000000C, 10112, false},
+    {0x000000000004, 10116, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000001FC, 10117, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 10124, false},
+    {0x020000000000, 10127, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 10128, false},
+    {0x000000000002, 10129, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10130, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10131, false},
+    {0x08040000007C, 10132, false},
+    {0x000000000004, 10139, true},
+    {0x080000000004, 10140, true},
+    {0x00000000000C, 10142, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10144, true},
+    {0x000000000004, 10145, true},
+    {0x080000000004, 10146, true},
+    {0x000000000000, 0, true},
+    {0x0C040000007C, 10148, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10156, true},
+    {0x008000000000, 10157, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10158, true},
+    {0x000400000004, 10159, true},
+    {0x0000000000FC, 10161, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10167, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10169, false},
+    {0x080400000000, 10170, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10172, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000054, 10173, true},
+    {0x000000010000, 10177, true},
+    {0x008000000000, 10178, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10179, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10180, false},
+    {0x000000000400, 10181, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 10182, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10183, false},
+    {0x000080000000, 10184, false},
+    {0x000000000000, 0, true},
+    {0x080400000004, 10185, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 10188, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 10189, false},
+    {0x000004000000, 10191, false},
+    {0x000004000000, 10192, false},
+    {0x004004000000, 10193, true},
+    {0x000004080000, 10195, false},
+    {0x000000080000, 10197, false},
+    {0x000000000002, 10198, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10199, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10200, true},
+    {0x000000080000, 10201, false},
+    {0x000000010000, 10202, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10203, false},
+    {0x000000000004, 10204, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10205, false},
+    {0x000010000000, 10206, true},
+    {0x000000000004, 10207, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 10208, false},
+    {0x000004000004, 10211, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10213, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 10214, true},
+    {0x000004000000, 10216, false},
+    {0x000000080000, 10217, false},
+    {0x000000080000, 10218, false},
+    {0x000000010000, 10219, false},
+    {0x000000010000, 10220, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 10221, false},
+    {0x000000010000, 10222, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10223, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10224, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10225, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 10226, false},
+    {0x000000000002, 10228, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 10229, false},
+    {0x000000000000, 0, true},
+    {0x000008000004, 10230, true},
+    {0x000008000004, 10232, true},
+    {0x010000000000, 10234, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10235, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10236, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10237, false},
+    {0x000050000000, 10238, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10240, false},
+    {0x000000010000, 10241, false},
+    {0x000000010000, 10242, true},
+    {0x000000000002, 10243, false},
+    {0x000004000000, 10244, false},
+    {0x008000000000, 10245, false},
+    {0x000400000000, 10246, false},
+    {0x000400000000, 10247, false},
+    {0x002000000000, 10248, true},
+    {0x008000000000, 10249, false},
+    {0x000040000000, 10250, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10251, true},
+    {0x080400000000, 10252, false},
+    {0x000004400000, 10254, false},
+    {0x00000000003C, 10256, true},
+    {0x000000000048, 10260, true},
+    {0x000004400000, 10262, false},
+    {0x000000000030, 10264, false},
+    {0x000000000008, 10266, true},
+    {0x000000080000, 10267, true},
+    {0x000000000004, 10268, true},
+    {0x00000000007C, 10269, true},
+    {0x00000000007C, 10274, true},
+    {0x000000000004, 10279, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10280, true},
+    {0x00000008007C, 10281, true},
+    {0x00000000007C, 10287, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 10292, false},
+    {0x008000000000, 10293, false},
+    {0x000000000004, 10294, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10295, true},
+    {0x000000000008, 10296, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10297, false},
+    {0x000000020000, 10298, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 10299, false},
+    {0x004000000000, 10302, false},
+    {0x000004000000, 10303, false},
+    {0x080000000000, 10304, false},
+    {0x020000000000, 10305, false},
+    {0x000000010000, 10306, false},
+    {0x008000000000, 10307, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000000E8, 10308, false},
+    {0x000004000004, 10312, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10314, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000020000, 10315, false},
+    {0x010000000000, 10316, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10317, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 10319, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10320, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10321, false},
+    {0x00000000000C, 10322, true},
+    {0x000004000000, 10324, false},
+    {0x000040000000, 10325, false},
+    {0x0000000000E0, 10326, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10329, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10330, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10331, false},
+    {0x000004000000, 10332, false},
+    {0x000400000000, 10333, false},
+    {0x00200001000C, 10334, true},
+    {0x008000000000, 10338, false},
+    {0x000040000000, 10339, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10340, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10341, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10342, true},
+    {0x008000000000, 10343, false},
+    {0x008000000000, 10344, false},
+    {0x000010000000, 10345, false},
+    {0x080000000000, 10346, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 10347, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 10349, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10350, true},
+    {0x00000000000C, 10351, true},
+    {0x010004100018, 10353, true},
+    {0x080400000000, 10358, false},
+    {0x00000000003C, 10360, true},
+    {0x040000000000, 10364, false},
+    {0x020000000000, 10365, false},
+    {0x000000010000, 10366, false},
+    {0x080000000000, 10367, false},
+    {0x000004000000, 10368, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 10369, false},
+    {0x040240000000, 10370, false},
+    {0x000004100000, 10373, false},
+    {0x0000000000FC, 10375, true},
+    {0x0100000000FC, 10381, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000020, 10388, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10389, true},
+    {0x000400000000, 10390, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10391, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10392, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10393, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10394, true},
+    {0x000000000002, 10395, false},
+    {0x000000000072, 10396, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10400, false},
+    {0x010000000000, 10402, true},
+    {0x080400000000, 10403, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10405, false},
+    {0x000000080000, 10406, false},
+    {0x00000000001C, 10407, true},
+    {0x00000000017C, 10410, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 10416, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 10420, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10423, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 10424, false},
+    {0x00000000000C, 10427, true},
+    {0x00000000000C, 10429, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10431, false},
+    {0x000010000000, 10432, false},
+    {0x000000000008, 10433, false},
+    {0x000000000008, 10434, false},
+    {0x000004100000, 10435, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10437, true},
+    {0x000000000002, 10438, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 10439, false},
+    {0x080400000000, 10440, false},
+    {0x080400000000, 10442, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10444, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10446, true},
+    {0x000004000000, 10447, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 10448, false},
+    {0x000000100000, 10449, false},
+    {0x00000000003C, 10450, true},
+    {0x000000080000, 10454, false},
+    {0x000004000000, 10455, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10456, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10457, true},
+    {0x000000010000, 10458, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10459, true},
+    {0x000000010000, 10460, false},
+    {0x000400000000, 10461, false},
+    {0x00000000003C, 10462, false},
+    {0x080000000000, 10466, false},
+    {0x000000010000, 10467, false},
+    {0x040000000000, 10468, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10469, false},
+    {0x000400000000, 10470, false},
+    {0x00000000000C, 10471, true},
+    {0x000000000002, 10473, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10474, false},
+    {0x000000000000, 0, true},
+    {0x000000000024, 10475, true},
+    {0x000000000004, 10477, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10478, false},
+    {0x000000000002, 10479, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10480, true},
+    {0x000000000004, 10481, true},
+    {0x000000000004, 10482, true},
+    {0x000000000004, 10483, true},
+    {0x000000010000, 10484, false},
+    {0x000000000000, 0, true},
+    {0x002000000000, 10485, true},
+    {0x000000000000, 0, true},
+    {0x0C0000000000, 10486, true},
+    {0x08040000000C, 10488, false},
+    {0x000000010000, 10492, false},
+    {0x000400000000, 10493, false},
+    {0x00000000000C, 10494, true},
+    {0x0C0000000000, 10496, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10498, false},
+    {0x000000000000, 0, true},
+    {0x00000008000C, 10500, true},
+    {0x000004000000, 10503, false},
+    {0x080000000000, 10504, false},
+    {0x000000000000, 0, true},
+    {0x00004000000C, 10505, true},
+    {0x000004000000, 10508, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10509, false},
+    {0x000004000000, 10510, false},
+    {0x080000000000, 10511, false},
+    {0x000000000004, 10512, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10513, true},
+    {0x00000000000C, 10514, true},
+    {0x000004000000, 10516, false},
+    {0x0100000003FE, 10517, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10527, false},
+    {0x080000000000, 10528, false},
+    {0x000000100000, 10529, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000080000000, 10530, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 10531, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10532, true},
+    {0x000004000000, 10533, false},
+    {0x000000000004, 10534, true},
+    {0x00000001001C, 10535, true},
+    {0x0C041000000C, 10539, false},
+    {0x080000000000, 10545, false},
+    {0x000000000014, 10546, true},
+    {0x0800000001FC, 10548, false},
+    {0x000000000004, 10556, true},
+    {0x008000000000, 10557, false},
+    {0x000000000002, 10558, false},
+    {0x00000000003C, 10559, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 10563, true},
+    {0x000010000000, 10565, false},
+    {0x040040010000, 10566, false},
+    {0x080400000000, 10569, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10571, true},
+    {0x000004000000, 10572, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10573, false},
+    {0x000000000002, 10574, false},
+    {0x000040000000, 10575, false},
+    {0x000000000004, 10576, true},
+    {0x00000001007C, 10577, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010014, 10583, true},
+    {0x000000000002, 10586, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 10587, false},
+    {0x000000010000, 10588, false},
+    {0x000000000004, 10589, true},
+    {0x000000000004, 10590, true},
+    {0x080400000004, 10591, false},
+    {0x000000000004, 10594, true},
+    {0x000014000000, 10595, false},
+    {0x000004180000, 10597, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10600, false},
+    {0x000000100000, 10601, false},
+    {0x000400000000, 10602, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 10603, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 10606, true},
+    {0x084400000072, 10610, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 10617, true},
+    {0x008000000000, 10619, false},
+    {0x000000010000, 10620, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10621, false},
+    {0x00000000000C, 10622, true},
+    {0x080400000000, 10624, false},
+    {0x000000000002, 10626, false},
+    {0x08000000007C, 10627, true},
+    {0x080400000068, 10633, false},
+    {0x080400000000, 10638, false},
+    {0x080400000000, 10640, false},
+    {0x000000000000, 0, true},
+    {0x000010000000, 10642, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10643, true},
+    {0x000000000000, 0, true},
+    {0x000000000034, 10644, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000004, 10647, true},
+    {0x020000400000, 10649, false},
+    {0x080000000000, 10651, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 10652, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10653, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 10655, false},
+    {0x000000010000, 10656, false},
+    {0x000000010000, 10657, false},
+    {0x020000000000, 10658, false},
+    {0x000000000004, 10659, true},
+    {0x000000000004, 10660, true},
+    {0x000000000004, 10661, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 10662, false},
+    {0x080400000004, 10665, false},
+    {0x000000000004, 10668, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10669, false},
+    {0x000000080000, 10671, false},
+    {0x000000000002, 10672, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10673, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10674, true},
+    {0x000200000000, 10675, false},
+    {0x000000000004, 10676, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10677, true},
+    {0x002000000000, 10678, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10679, false},
+    {0x000000000004, 10680, true},
+    {0x008000000000, 10681, false},
+    {0x000004000000, 10682, false},
+    {0x010000000000, 10683, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 10684, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10687, false},
+    {0x080400000000, 10688, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 10690, false},
+    {0x00000000000C, 10691, true},
+    {0x000000000002, 10693, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10694, true},
+    {0x000000000400, 10695, false},
+    {0x000000000400, 10696, false},
+    {0x010000000000, 10697, true},
+    {0x000000000400, 10698, false},
+    {0x010000000400, 10699, true},
+    {0x000000000400, 10701, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10702, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10703, true},
+    {0x000000000400, 10704, false},
+    {0x000000000400, 10705, false},
+    {0x010000000000, 10706, true},
+    {0x000000000400, 10707, false},
+    {0x010000000400, 10708, true},
+    {0x000000000400, 10710, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10711, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10712, true},
+    {0x010000000000, 10713, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10714, true},
+    {0x000004000000, 10715, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10716, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10717, false},
+    {0x010000000000, 10718, true},
+    {0x000000000400, 10719, true},
+    {0x010000000000, 10720, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10721, false},
+    {0x010000000000, 10722, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10723, false},
+    {0x010000000000, 10724, true},
+    {0x000000000400, 10725, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10726, false},
+    {0x010000000000, 10727, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10728, false},
+    {0x010000000000, 10729, true},
+    {0x000000000400, 10730, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10731, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10732, false},
+    {0x010000000000, 10733, true},
+    {0x000000000400, 10734, false},
+    {0x000000000400, 10735, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 10736, false},
+    {0x010000000400, 10737, true},
+    {0x000000000002, 10739, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10740, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10741, false},
+    {0x000400000000, 10742, false},
+    {0x000010000000, 10743, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000400, 10744, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10746, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10747, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 10748, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10749, true},
+    {0x000004000000, 10750, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10751, false},
+    {0x010000000000, 10752, true},
+    {0x000000000400, 10753, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10754, false},
+    {0x010000000000, 10755, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10756, false},
+    {0x010000000000, 10757, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10758, false},
+    {0x010000000000, 10759, true},
+    {0x000000000400, 10760, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10761, false},
+    {0x010000000000, 10762, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10763, false},
+    {0x010000000000, 10764, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10765, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10766, false},
+    {0x000400000000, 10767, false},
+    {0x000010000000, 10768, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10769, true},
+    {0x000004000000, 10770, false},
+    {0x010000000000, 10771, true},
+    {0x000000000400, 10772, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10773, true},
+    {0x000004000000, 10774, false},
+    {0x010000000000, 10775, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10776, true},
+    {0x000004000000, 10777, false},
+    {0x010000000000, 10778, true},
+    {0x000000000400, 10779, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10780, true},
+    {0x000004000000, 10781, false},
+    {0x010000000000, 10782, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10783, true},
+    {0x000004000000, 10784, false},
+    {0x010000000000, 10785, true},
+    {0x000000000400, 10786, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10787, true},
+    {0x000004000000, 10788, false},
+    {0x010000000000, 10789, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10790, true},
+    {0x000004000000, 10791, false},
+    {0x010000000000, 10792, true},
+    {0x000000000400, 10793, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10794, true},
+    {0x000004000000, 10795, false},
+    {0x010000000000, 10796, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10797, true},
+    {0x000004000000, 10798, false},
+    {0x010000000000, 10799, true},
+    {0x000000000400, 10800, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10801, true},
+    {0x000004000000, 10802, false},
+    {0x010000000000, 10803, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10804, false},
+    {0x000004000000, 10805, false},
+    {0x000000000002, 10806, false},
+    {0x000400000000, 10807, false},
+    {0x000010000000, 10808, false},
+    {0x000000000002, 10809, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 10810, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10811, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10812, false},
+    {0x000000000000, 0, true},
+    {0x010000000400, 10813, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10815, true},
+    {0x000004000000, 10816, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10817, false},
+    {0x010000000000, 10818, true},
+    {0x000000000400, 10819, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10820, false},
+    {0x010000000000, 10821, true},
+    {0x000000000002, 10822, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10823, false},
+    {0x010000000000, 10824, true},
+    {0x000000000400, 10825, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10826, false},
+    {0x010000000000, 10827, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10828, false},
+    {0x010000000000, 10829, true},
+    {0x000000000400, 10830, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10831, false},
+    {0x010000000000, 10832, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10833, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10834, false},
+    {0x000400000000, 10835, false},
+    {0x000010000000, 10836, false},
+    {0x000000000002, 10837, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10838, false},
+    {0x000000000400, 10839, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10840, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10841, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10842, true},
+    {0x000004000000, 10843, false},
+    {0x000000000000, 0, true},
+    {0x000000000400, 10844, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10845, false},
+    {0x010000000000, 10846, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10847, false},
+    {0x010000000000, 10848, true},
+    {0x000000000400, 10849, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10850, false},
+    {0x010000000000, 10851, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10852, false},
+    {0x010000000000, 10853, true},
+    {0x000000000400, 10854, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10855, false},
+    {0x010000000000, 10856, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10857, false},
+    {0x010000000000, 10858, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10859, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10860, false},
+    {0x000400000000, 10861, false},
+    {0x000010000000, 10862, false},
+    {0x000000000002, 10863, false},
+    {0x000000000002, 10864, false},
+    {0x000000000400, 10865, false},
+    {0x010000000400, 10866, true},
+    {0x000000000400, 10868, false},
+    {0x000000000400, 10869, false},
+    {0x000000000400, 10870, false},
+    {0x000400000000, 10871, false},
+    {0x000010000000, 10872, false},
+    {0x000000000002, 10873, false},
+    {0x000000000400, 10874, false},
+    {0x000000000400, 10875, false},
+    {0x000000000400, 10876, false},
+    {0x000000000400, 10877, false},
+    {0x000000000400, 10878, false},
+    {0x000400000000, 10879, false},
+    {0x000010000000, 10880, false},
+    {0x000000000002, 10881, false},
+    {0x000000000002, 10882, false},
+    {0x000000000400, 10883, false},
+    {0x000000000400, 10884, false},
+    {0x000000000400, 10885, true},
+    {0x000000000400, 10886, false},
+    {0x000400000000, 10887, false},
+    {0x000010000000, 10888, false},
+    {0x000000000002, 10889, false},
+    {0x000000000400, 10890, false},
+    {0x000000000400, 10891, false},
+    {0x000000000400, 10892, false},
+    {0x000000000400, 10893, false},
+    {0x000000000400, 10894, false},
+    {0x000400000000, 10895, false},
+    {0x000010000000, 10896, false},
+    {0x000000000002, 10897, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10898, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10899, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10900, false},
+    {0x000004000000, 10901, false},
+    {0x000400000000, 10902, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10903, false},
+    {0x000000010000, 10904, false},
+    {0x000000000000, 0, true},
+    {0x010000000004, 10905, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10907, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 10908, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 10909, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10910, false},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 10911, true},
+    {0x00000000003C, 10915, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10919, true},
+    {0x000000000002, 10920, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 10921, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10922, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10923, true},
+    {0x000000000002, 10924, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 10925, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10927, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 10928, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10929, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10930, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 10931, true},
+    {0x080400000000, 10932, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 10934, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10935, false},
+    {0x000000100000, 10936, false},
+    {0x040000000000, 10937, false},
+    {0x010000000000, 10938, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10939, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10940, false},
+    {0x000000000000, 0, true},
+    {0x000000000006, 10941, false},
+    {0x000000000002, 10943, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10944, false},
+    {0x000004000000, 10945, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 10946, false},
+    {0x010000000000, 10947, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10948, false},
+    {0x00000000000C, 10949, true},
+    {0x010000000000, 10951, true},
+    {0x010000000000, 10952, true},
+    {0x010000000000, 10953, true},
+    {0x010000000000, 10954, true},
+    {0x000000000004, 10955, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10956, false},
+    {0x010000000000, 10958, true},
+    {0x010000000000, 10959, true},
+    {0x000000100000, 10960, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10961, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10962, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 10964, false},
+    {0x000000080000, 10965, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10966, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 10967, false},
+    {0x080000000000, 10969, false},
+    {0x080400000000, 10970, false},
+    {0x00000000000C, 10972, true},
+    {0x000000080000, 10974, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10975, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10976, false},
+    {0x000000000002, 10977, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10978, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10979, false},
+    {0x000000000002, 10980, false},
+    {0x000000000002, 10981, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10982, false},
+    {0x000000000004, 10983, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10984, true},
+    {0x000000000002, 10985, false},
+    {0x010000000000, 10986, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 10987, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 10988, true},
+    {0x000000000004, 10989, true},
+    {0x000000000004, 10990, true},
+    {0x000000000004, 10991, true},
+    {0x00000000000C, 10992, true},
+    {0x000000000004, 10994, true},
+    {0x000000000004, 10995, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 10996, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10997, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 10998, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 10999, true},
+    {0x000000000004, 11000, true},
+    {0x000000000004, 11001, true},
+    {0x000004000000, 11002, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11003, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11004, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11005, false},
+    {0x000000000002, 11006, false},
+    {0x000040000000, 11007, false},
+    {0x000000000000, 0, true},
+    {0x01000000000C, 11008, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 11011, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11012, false},
+    {0x010000000000, 11013, true},
+    {0x010000000000, 11014, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11015, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 11017, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11021, false},
+    {0x000000000002, 11023, false},
+    {0x000004000000, 11024, false},
+    {0x010000000000, 11025, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11026, false},
+    {0x080400000000, 11028, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11030, false},
+    {0x000004000000, 11031, false},
+    {0x040000000000, 11032, false},
+    {0x000000000000, 0, true},
+    {0x09000000003C, 11033, true},
+    {0x08040000001C, 11039, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11044, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11045, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11046, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11047, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11048, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11050, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11051, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11052, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11054, false},
+    {0x000000000002, 11055, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11056, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11057, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11059, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11060, true},
+    {0x010000000004, 11061, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11063, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 11064, true},
+    {0x000000000004, 11069, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x01000000003C, 11070, true},
+    {0x01000000003C, 11075, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 11080, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11084, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11085, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11086, true},
+    {0x008000000000, 11087, false},
+    {0x000008000000, 11088, false},
+    {0x080400000000, 11089, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11091, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11093, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11094, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 11095, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11096, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008200000000, 11097, false},
+    {0x000000000000, 0, true},
+    {0x000000000006, 11099, false},
+    {0x000000000002, 11101, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 11102, false},
+    {0x000040000000, 11103, false},
+    {0x000400000000, 11104, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11105, false},
+    {0x0C0000000000, 11106, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11108, false},
+    {0x000000000002, 11109, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11110, true},
+    {0x00000000000C, 11112, true},
+    {0x000004000000, 11114, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11115, true},
+    {0x000000000004, 11116, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11117, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11118, false},
+    {0x010000000000, 11120, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11121, false},
+    {0x000004000000, 11122, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11123, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11124, false},
+    {0x000000000004, 11125, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11126, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x04000000007C, 11127, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11133, true},
+    {0x008200000000, 11134, false},
+    {0x000000000002, 11136, false},
+    {0x000000000004, 11137, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11138, false},
+    {0x000000000006, 11139, false},
+    {0x000000000002, 11141, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11142, true},
+    {0x010000000000, 11143, true},
+    {0x010000000000, 11144, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 11145, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11148, true},
+    {0x010000000000, 11149, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11150, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11151, false},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11152, true},
+    {0x00000000001C, 11155, true},
+    {0x000000080000, 11158, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11159, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11160, true},
+    {0x000000080000, 11161, false},
+    {0x002000000000, 11162, false},
+    {0x004000000000, 11163, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11164, false},
+    {0x000000008000, 11166, false},
+    {0x000000080000, 11167, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 11168, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11169, true},
+    {0x00000000001C, 11172, true},
+    {0x000004000000, 11175, true},
+    {0x010000000000, 11176, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11177, false},
+    {0x080400000000, 11179, false},
+    {0x080400000000, 11181, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11183, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11184, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 11185, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11186, true},
+    {0x010000000000, 11187, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11188, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11190, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11191, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11193, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11194, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 11195, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 11198, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11200, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11201, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11202, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11203, false},
+    {0x010000000000, 11205, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11206, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11207, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11208, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11210, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11212, false},
+    {0x000000000002, 11213, false},
+    {0x040000000000, 11214, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11215, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11216, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11217, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11219, false},
+    {0x040000000000, 11220, false},
+    {0x080000000000, 11221, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11222, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11223, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 11224, false},
+    {0x000000000002, 11225, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11226, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11228, true},
+    {0x000000000002, 11229, false},
+    {0x080400000000, 11230, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004100000, 11232, false},
+    {0x000004000000, 11234, false},
+    {0x000000000002, 11235, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11236, true},
+    {0x010000000000, 11237, true},
+    {0x000000000004, 11238, true},
+    {0x000000000002, 11239, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11240, true},
+    {0x000000010000, 11241, false},
+    {0x000000100000, 11242, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 11243, false},
+    {0x080400000000, 11244, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11246, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 11247, false},
+    {0x000004000000, 11248, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11249, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000008, 11250, false},
+    {0x000004000000, 11251, false},
+    {0x000000000000, 0, true},
+    {0x08040000001C, 11252, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11257, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11258, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11260, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11263, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11265, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11266, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11267, true},
+    {0x000000008000, 11268, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11269, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 11270, false},
+    {0x000000080000, 11273, false},
+    {0x000000108000, 11274, false},
+    {0x000004000000, 11276, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11277, true},
+    {0x080400000004, 11278, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11281, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 11282, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11283, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11284, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11285, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11286, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11287, false},
+    {0x000400000000, 11288, false},
+    {0x000000010000, 11289, false},
+    {0x000000100000, 11290, false},
+    {0x000000080000, 11291, false},
+    {0x000000000002, 11292, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11293, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11294, false},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11295, true},
+    {0x000004000000, 11297, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11298, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11299, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11300, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 11301, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11302, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11303, false},
+    {0x000000180000, 11305, false},
+    {0x000004000000, 11307, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11308, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11309, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11310, true},
+    {0x00400000000C, 11311, true},
+    {0x00400000000C, 11314, true},
+    {0x000000000004, 11317, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11318, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11319, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11320, false},
+    {0x000000000004, 11321, true},
+    {0x000000010000, 11322, false},
+    {0x000000010000, 11323, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11324, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11325, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11326, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11328, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11330, false},
+    {0x000000000000, 0, true},
+    {0x00000400001C, 11331, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11335, false},
+    {0x000010000000, 11336, false},
+    {0x000000080000, 11337, false},
+    {0x000000108000, 11338, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11340, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11341, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11342, false},
+    {0x010000000000, 11343, true},
+    {0x000000000002, 11344, false},
+    {0x000004000000, 11345, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 11346, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11347, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11348, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11349, false},
+    {0x080400000000, 11350, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11352, false},
+    {0x000004000000, 11353, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11354, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11355, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11356, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11357, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11358, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11359, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x400000000000, 11361, true},
+    {0x080400000000, 11362, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11364, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11365, false},
+    {0x000000000004, 11366, true},
+    {0x000000000004, 11367, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11368, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11369, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11371, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11372, false},
+    {0x010000000000, 11373, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11374, false},
+    {0x000000100000, 11375, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11376, false},
+    {0x040000000000, 11377, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11378, false},
+    {0x000004000000, 11379, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11380, false},
+    {0x00000000000C, 11381, true},
+    {0x000004000000, 11383, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11384, true},
+    {0x000004100000, 11385, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11387, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11388, false},
+    {0x008000000000, 11389, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11390, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11391, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11392, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11393, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11394, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11395, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 11396, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11401, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11402, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 11404, false},
+    {0x010000000000, 11405, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 11406, false},
+    {0x000000000000, 0, true},
+    {0x008200000000, 11407, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11409, true},
+    {0x00000000000C, 11411, true},
+    {0x000000100000, 11413, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008200000000, 11414, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x020000000000, 11416, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11417, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000020000, 11418, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11419, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11420, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11421, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000000007C, 11422, true},
+    {0x000000000000, 0, true},
+    {0x080000000004, 11428, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11430, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11431, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11432, false},
+    {0x000000000002, 11433, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11434, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11435, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11436, false},
+    {0x000000000002, 11437, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11438, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000010000000, 11439, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11440, false},
+    {0x002000000000, 11441, true},
+    {0x000400000000, 11442, false},
+    {0x000000080000, 11443, false},
+    {0x000000100000, 11444, false},
+    {0x000400000000, 11445, false},
+    {0x080400000008, 11446, false},
+    {0x000000000002, 11449, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11450, false},
+    {0x000200000000, 11451, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11452, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11453, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11454, false},
+    {0x000200000000, 11455, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11456, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11457, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11458, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11459, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11460, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11461, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11462, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11463, false},
+    {0x000000100000, 11464, false},
+    {0x000000000002, 11465, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11466, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11467, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11469, false},
+    {0x000004080000, 11470, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11472, false},
+    {0x010000000000, 11473, true},
+    {0x000000100000, 11474, false},
+    {0x000400000000, 11475, false},
+    {0x000000080000, 11476, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 11477, false},
+    {0x000000100000, 11478, false},
+    {0x000400000000, 11479, false},
+    {0x000000000008, 11480, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 11481, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11482, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11483, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11484, true},
+    {0x01000000000C, 11485, true},
+    {0x000000000002, 11488, false},
+    {0x010000000000, 11489, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11490, false},
+    {0x000000000000, 0, true},
+    {0x0000040000C4, 11492, false},
+    {0x000000100000, 11496, false},
+    {0x000000000000, 0, true},
+    {0x080400000004, 11497, false},
+    {0x040000000000, 11500, false},
+    {0x000004000000, 11501, false},
+    {0x000000000010, 11502, false},
+    {0x000000000010, 11503, true},
+    {0x000004000000, 11504, true},
+    {0x000000000004, 11505, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11506, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11508, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11509, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11510, false},
+    {0x000000000002, 11511, false},
+    {0x00000000001E, 11512, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11516, true},
+    {0x080400000000, 11517, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11519, true},
+    {0x000000000002, 11520, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11521, false},
+    {0x040000000000, 11522, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11523, false},
+    {0x080400000000, 11525, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11527, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 11529, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11531, true},
+    {0x00000000000C, 11533, true},
+    {0x000000000002, 11535, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000408000C, 11536, true},
+    {0x008000000000, 11540, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11541, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11542, true},
+    {0x000000000002, 11543, false},
+    {0x00000000000C, 11544, true},
+    {0x000000100000, 11546, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11547, false},
+    {0x00000000000C, 11548, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11550, false},
+    {0x010000000000, 11551, true},
+    {0x010000000000, 11552, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004080000, 11553, false},
+    {0x000000100000, 11555, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11556, false},
+    {0x000000100000, 11557, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11558, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11560, false},
+    {0x00000000001C, 11561, true},
+    {0x010000000000, 11564, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11565, false},
+    {0x000000000004, 11566, true},
+    {0x080000000000, 11567, false},
+    {0x000000000004, 11568, true},
+    {0x00000000001C, 11569, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11572, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400008000, 11573, true},
+    {0x000000000402, 11576, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11578, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11579, false},
+    {0x040000000000, 11580, false},
+    {0x00000000000C, 11581, true},
+    {0x000000080000, 11583, false},
+    {0x000000000002, 11584, false},
+    {0x000400000000, 11585, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11586, false},
+    {0x000000000000, 0, true},
+    {0x0804000003FE, 11587, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000090, 11598, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11600, false},
+    {0x000040000004, 11601, true},
+    {0x000000010000, 11603, false},
+    {0x0000000003FE, 11604, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11613, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11614, false},
+    {0x00000010001C, 11615, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11619, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 11621, false},
+    {0x000004000000, 11624, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 11625, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11626, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11627, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11628, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11630, false},
+    {0x000004080000, 11631, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11633, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11634, false},
+    {0x080400000000, 11636, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000018, 11638, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 11640, false},
+    {0x000000000002, 11641, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11642, true},
+    {0x000000020000, 11643, false},
+    {0x000000020000, 11644, false},
+    {0x080004000000, 11645, true},
+    {0x000004000000, 11647, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11648, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11650, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000040000000, 11651, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 11652, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11653, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11654, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11655, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11656, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11658, false},
+    {0x080400000000, 11659, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11661, false},
+    {0x000000000400, 11662, false},
+    {0x000000000400, 11663, false},
+    {0x000000000002, 11664, false},
+    {0x000000000400, 11665, false},
+    {0x000000000400, 11666, false},
+    {0x00000000000E, 11667, false},
+    {0x000000000400, 11670, false},
+    {0x000400000000, 11671, false},
+    {0x000000000002, 11672, false},
+    {0x000000000400, 11673, false},
+    {0x000000000400, 11674, false},
+    {0x000000000002, 11675, false},
+    {0x000000000400, 11676, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11677, false},
+    {0x000000000400, 11678, false},
+    {0x000400000000, 11679, false},
+    {0x000000000002, 11680, false},
+    {0x000000000002, 11681, false},
+    {0x000000000002, 11682, false},
+    {0x000400000000, 11683, false},
+    {0x000000000002, 11684, false},
+    {0x000400000000, 11685, false},
+    {0x000000000002, 11686, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11687, false},
+    {0x000400000000, 11688, false},
+    {0x000000000002, 11689, false},
+    {0x000400000000, 11690, false},
+    {0x000000000002, 11691, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11692, false},
+    {0x000000000002, 11693, false},
+    {0x000400000000, 11694, false},
+    {0x000000000002, 11695, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11696, false},
+    {0x000400000000, 11697, false},
+    {0x000000000002, 11698, false},
+    {0x000000000400, 11699, false},
+    {0x000000000400, 11700, false},
+    {0x000000000400, 11701, false},
+    {0x000000000400, 11702, true},
+    {0x000000000002, 11703, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11704, false},
+    {0x000400000000, 11705, false},
+    {0x010000000000, 11706, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11707, false},
+    {0x000400000000, 11708, false},
+    {0x000400000000, 11709, false},
+    {0x010000000000, 11710, true},
+    {0x000000000002, 11711, false},
+    {0x000400000000, 11712, false},
+    {0x000400000000, 11713, false},
+    {0x000000000002, 11714, false},
+    {0x010000000000, 11715, true},
+    {0x000400000000, 11716, false},
+    {0x000000000002, 11717, false},
+    {0x000400000000, 11718, false},
+    {0x000000000002, 11719, false},
+    {0x000400000000, 11720, false},
+    {0x000000000002, 11721, false},
+    {0x010000000000, 11722, true},
+    {0x000400000000, 11723, false},
+    {0x000000000002, 11724, false},
+    {0x000400000000, 11725, false},
+    {0x000000000002, 11726, false},
+    {0x000400000000, 11727, false},
+    {0x000400000000, 11728, false},
+    {0x010000000000, 11729, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11730, false},
+    {0x000400000000, 11731, false},
+    {0x000000000002, 11732, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11733, false},
+    {0x000400000000, 11734, false},
+    {0x000000000002, 11735, false},
+    {0x00000000000E, 11736, false},
+    {0x000400000000, 11739, false},
+    {0x000000000002, 11740, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11741, false},
+    {0x000400000000, 11742, false},
+    {0x00000000000E, 11743, false},
+    {0x000000000002, 11746, false},
+    {0x000400000000, 11747, false},
+    {0x00000000000E, 11748, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11751, false},
+    {0x000400000000, 11752, false},
+    {0x00000000000E, 11753, false},
+    {0x000000000002, 11756, false},
+    {0x000400000000, 11757, false},
+    {0x00000000000E, 11758, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11761, false},
+    {0x000400000000, 11762, false},
+    {0x00000000000E, 11763, false},
+    {0x000000000002, 11766, false},
+    {0x000400000000, 11767, false},
+    {0x00000000000E, 11768, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11771, false},
+    {0x000400000000, 11772, false},
+    {0x000000000002, 11773, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11774, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11775, true},
+    {0x010000000000, 11776, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11777, false},
+    {0x000400000000, 11778, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11779, false},
+    {0x000000000002, 11780, false},
+    {0x000400000000, 11781, false},
+    {0x000400000000, 11782, false},
+    {0x000000000002, 11783, false},
+    {0x010000000000, 11784, true},
+    {0x000400000000, 11785, false},
+    {0x000000000002, 11786, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11787, false},
+    {0x000000000002, 11788, false},
+    {0x010000000000, 11789, true},
+    {0x000400000000, 11790, false},
+    {0x000000000002, 11791, false},
+    {0x000400000000, 11792, false},
+    {0x000000000002, 11793, false},
+    {0x010000000000, 11794, true},
+    {0x000400000000, 11795, false},
+    {0x000000000002, 11796, false},
+    {0x000400000000, 11797, false},
+    {0x000400000000, 11798, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11799, false},
+    {0x000400000000, 11800, false},
+    {0x000000000002, 11801, false},
+    {0x000400000000, 11802, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11803, false},
+    {0x000000000002, 11804, false},
+    {0x000400000000, 11805, false},
+    {0x000000000002, 11806, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11807, false},
+    {0x000000000002, 11808, false},
+    {0x000400000000, 11809, false},
+    {0x000000000002, 11810, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11811, false},
+    {0x000000000002, 11812, false},
+    {0x000400000000, 11813, false},
+    {0x000000000002, 11814, false},
+    {0x000400000000, 11815, false},
+    {0x000400000000, 11816, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11817, true},
+    {0x000000000002, 11818, false},
+    {0x010000000000, 11819, true},
+    {0x010000000000, 11820, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11821, true},
+    {0x010000000000, 11822, true},
+    {0x010000000000, 11823, true},
+    {0x010000000000, 11824, true},
+    {0x010000000000, 11825, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11826, true},
+    {0x010000000000, 11827, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11828, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11829, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11830, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11831, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11832, false},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11833, true},
+    {0x008000000000, 11836, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11837, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11839, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11840, false},
+    {0x080000000000, 11841, false},
+    {0x000000000002, 11842, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11843, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 11846, false},
+    {0x010000000000, 11848, true},
+    {0x010000000000, 11849, true},
+    {0x000400000000, 11850, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11851, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11852, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11853, true},
+    {0x000000000002, 11855, false},
+    {0x000000000006, 11856, false},
+    {0x040000000000, 11858, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11859, false},
+    {0x000000000002, 11860, false},
+    {0x000000000002, 11861, false},
+    {0x000000000002, 11862, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11863, false},
+    {0x000000000002, 11864, false},
+    {0x040000000000, 11865, false},
+    {0x040000000000, 11866, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11867, false},
+    {0x000004000000, 11868, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11869, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11871, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11872, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 11873, false},
+    {0x000004000000, 11875, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11876, false},
+    {0x000000000002, 11877, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 11878, false},
+    {0x000000000002, 11880, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11881, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11883, false},
+    {0x000000000028, 11884, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11886, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11887, false},
+    {0x000004000000, 11888, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11889, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11890, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11891, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11892, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11893, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11894, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11895, false},
+    {0x080400000000, 11897, false},
+    {0x000004000000, 11899, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11900, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11901, false},
+    {0x000000000002, 11902, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11903, false},
+    {0x000000080000, 11904, false},
+    {0x000000080000, 11905, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 11906, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 11907, false},
+    {0x000000000002, 11908, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11909, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11910, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11911, false},
+    {0x000000080000, 11912, false},
+    {0x000000080000, 11913, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11914, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11915, false},
+    {0x000000000002, 11916, false},
+    {0x000000000002, 11917, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11918, false},
+    {0x000000000002, 11919, false},
+    {0x010000000000, 11920, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11921, false},
+    {0x000000108000, 11922, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11924, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 11925, false},
+    {0x020000000000, 11926, false},
+    {0x000000000004, 11927, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11928, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11929, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11930, false},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11931, false},
+    {0x000000000000, 0, true},
+    {0x000000000006, 11932, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11934, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11935, false},
+    {0x000000000002, 11936, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11937, false},
+    {0x000000000006, 11938, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11940, true},
+    {0x000000000002, 11941, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11942, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 11943, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11944, false},
+    {0x000000000002, 11945, false},
+    {0x000000000002, 11946, false},
+    {0x000004000000, 11947, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11948, true},
+    {0x000000000002, 11949, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11950, false},
+    {0x000000000002, 11951, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11952, false},
+    {0x000000000004, 11953, true},
+    {0x080000000000, 11954, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11955, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11956, false},
+    {0x000000000000, 0, true},
+    {0x000000000008, 11957, false},
+    {0x080400000000, 11958, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11960, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11961, false},
+    {0x000000000002, 11962, false},
+    {0x008008000000, 11963, false},
+    {0x000000000002, 11965, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 11966, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 11967, true},
+    {0x000000000004, 11968, true},
+    {0x000000010000, 11969, false},
+    {0x000000000002, 11970, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11971, false},
+    {0x000004000000, 11972, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08000400027E, 11973, false},
+    {0x000000000002, 11982, false},
+    {0x000000000000, 0, true},
+    {0x000400000000, 11983, false},
+    {0x000000000000, 0, true},
+    {0x080000000000, 11984, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 11985, false},
+    {0x010000000000, 11987, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11988, false},
+    {0x000000000002, 11989, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11990, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 11991, true},
+    {0x020000000000, 11994, false},
+    {0x000004000000, 11995, false},
+    {0x000010000000, 11996, false},
+    {0x000000010000, 11997, false},
+    {0x000000010000, 11998, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 11999, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12000, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12001, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12002, true},
+    {0x000000000004, 12003, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12004, false},
+    {0x000000010000, 12005, false},
+    {0x000004000000, 12006, false},
+    {0x000000000002, 12007, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12008, true},
+    {0x000200000000, 12009, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12010, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12011, false},
+    {0x000400000000, 12012, false},
+    {0x000400000000, 12013, false},
+    {0x000000000000, 0, true},
+    {0x08000400027E, 12014, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12023, true},
+    {0x000000000004, 12024, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 12025, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12028, false},
+    {0x000000000000, 0, true},
+    {0x080400000000, 12029, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 12031, false},
+    {0x000000000002, 12033, false},
+    {0x000000000000, 0, true},
+    {0x000000080000, 12034, false},
+    {0x000000080000, 12035, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 12036, true},
+    {0x000000080000, 12038, false},
+    {0x000000080000, 12039, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12040, false},
+    {0x000000080000, 12041, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12042, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000007C, 12043, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12048, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12049, false},
+    {0x000000010000, 12050, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12051, false},
+    {0x000000000000, 0, true},
+    {0x000000100000, 12052, false},
+    {0x000004000000, 12053, false},
+    {0x000040000000, 12054, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12055, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000200000000, 12056, false},
+    {0x000000000004, 12057, true},
+    {0x000000000002, 12058, false},
+    {0x000000000002, 12059, false},
+    {0x000200000000, 12060, false},
+    {0x000000000004, 12061, true},
+    {0x000000000002, 12062, false},
+    {0x000000000002, 12063, false},
+    {0x000000000002, 12064, false},
+    {0x000000000002, 12065, false},
+    {0x000000000002, 12066, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 12067, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12068, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12069, false},
+    {0x0A0000000000, 12070, false},
+    {0x000000000000, 0, true},
+    {0x000040000000, 12072, false},
+    {0x000010000000, 12073, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12074, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12075, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12076, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12077, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000040, 12078, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 12079, false},
+    {0x000400000000, 12080, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12081, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12082, false},
+    {0x010000000000, 12083, true},
+    {0x000000000000, 0, true},
+    {0x00000000001E, 12084, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12088, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12089, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12090, false},
+    {0x00000000000C, 12091, true},
+    {0x000004000000, 12093, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12094, true},
+    {0x008000000000, 12095, false},
+    {0x000000080000, 12096, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12097, true},
+    {0x010000000000, 12098, true},
+    {0x000000000002, 12099, false},
+    {0x000000000002, 12100, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 12101, true},
+    {0x080400000000, 12104, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12106, false},
+    {0x010000000000, 12107, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 12108, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x008000000000, 12111, false},
+    {0x000000100000, 12112, false},
+    {0x000000100000, 12113, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12114, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12115, false},
+    {0x000000000402, 12116, false},
+    {0x080400000000, 12118, false},
+    {0x080400000000, 12120, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 12122, false},
+    {0x000000100000, 12123, false},
+    {0x000000000402, 12124, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 12126, false},
+    {0x00000010001C, 12127, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 12131, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 12134, false},
+    {0x010000000004, 12137, true},
+    {0x000040000000, 12139, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12140, false},
+    {0x010000000000, 12141, true},
+    {0x010000000000, 12142, true},
+    {0x000000000002, 12143, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 12144, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 12145, false},
+    {0x000000100000, 12146, false},
+    {0x000000000004, 12147, true},
+    {0x000004000000, 12148, false},
+    {0x040000000000, 12149, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000004, 12150, true},
+    {0x000040000000, 12152, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12153, true},
+    {0x010000000000, 12154, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12155, true},
+    {0x010000000000, 12156, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12157, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12158, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12159, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12160, true},
+    {0x010000000000, 12161, true},
+    {0x000000000002, 12162, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12163, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12164, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12165, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12166, false},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12167, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12168, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12169, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12170, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12171, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12172, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12173, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12174, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12175, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12176, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12177, true},
+    {0x000000000002, 12178, false},
+    {0x000000000002, 12179, false},
+    {0x010000000000, 12180, true},
+    {0x010000000000, 12181, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12182, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12183, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12184, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12185, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12186, true},
+    {0x010000000000, 12187, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12188, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12189, false},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 12190, false},
+    {0x00000000000E, 12193, false},
+    {0x00000000000E, 12196, false},
+    {0x000000000002, 12199, false},
+    {0x000000000002, 12200, false},
+    {0x000000000002, 12201, false},
+    {0x000000000002, 12202, false},
+    {0x000000000002, 12203, false},
+    {0x000000000002, 12204, false},
+    {0x000000000002, 12205, false},
+    {0x000000000002, 12206, false},
+    {0x000000000002, 12207, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 12208, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12211, false},
+    {0x000000000002, 12212, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000400, 12213, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12214, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 12215, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12216, false},
+    {0x000004000000, 12217, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12218, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12219, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000400000000, 12220, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12221, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 12222, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12225, false},
+    {0x000000010000, 12226, false},
+    {0x000000000002, 12227, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12228, false},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12229, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12230, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12231, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x0000000000FC, 12232, true},
+    {0x000000080000, 12238, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12239, false},
+    {0x000000000002, 12240, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000006, 12241, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000C, 12243, true},
+    {0x00000000000C, 12245, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12247, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12248, false},
+    {0x000000000400, 12249, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12250, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12251, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12252, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12253, true},
+    {0x000004000000, 12254, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x08040000003C, 12255, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12261, false},
+    {0x000000100000, 12262, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12263, true},
+    {0x000404100000, 12264, false},
+    {0x000000000400, 12267, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x010000000000, 12268, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12269, true},
+    {0x000000000000, 0, true},
+    {0x080400000000, 12270, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000003C, 12272, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12276, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12277, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12278, false},
+    {0x00000000003C, 12279, true},
+    {0x000004000000, 12283, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12284, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12285, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12286, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12287, false},
+    {0x000004000000, 12288, false},
+    {0x010000000000, 12289, true},
+    {0x000000000002, 12290, false},
+    {0x000000000002, 12291, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12292, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 12293, false},
+    {0x040000000000, 12294, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12295, false},
+    {0x000000000004, 12296, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12297, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000001C, 12298, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12301, false},
+    {0x010000000004, 12302, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12304, false},
+    {0x000000000002, 12305, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x040000000000, 12306, false},
+    {0x040000000000, 12307, false},
+    {0x010000000000, 12308, true},
+    {0x000000000000, 0, true},
+    {0x000004000000, 12309, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12310, false},
+    {0x010000000004, 12311, true},
+    {0x000000000002, 12313, false},
+    {0x000000000002, 12314, false},
+    {0x000000000002, 12315, false},
+    {0x000000000002, 12316, false},
+    {0x000000000002, 12317, false},
+    {0x000000000002, 12318, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12319, false},
+    {0x000000000002, 12320, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12321, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x00000000000E, 12322, false},
+    {0x00000000000E, 12325, false},
+    {0x00000000000E, 12328, false},
+    {0x000000000002, 12331, false},
+    {0x000000000002, 12332, false},
+    {0x000000000002, 12333, false},
+    {0x000000000002, 12334, false},
+    {0x000000000002, 12335, false},
+    {0x000000000002, 12336, false},
+    {0x000000000002, 12337, false},
+    {0x000000000002, 12338, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12339, false},
+    {0x000000000002, 12340, false},
+    {0x000000000002, 12341, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12342, false},
+    {0x000000000002, 12343, false},
+    {0x000000000002, 12344, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000020000, 12345, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12346, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080400000004, 12347, false},
+    {0x080400000000, 12350, false},
+    {0x080400000000, 12352, false},
+    {0x080400000000, 12354, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000008000000, 12356, false},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12357, true},
+    {0x000000000004, 12358, true},
+    {0x000004100000, 12359, false},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12361, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12362, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x080000000000, 12363, false},
+    {0x000000000000, 0, true},
+    {0x000000010000, 12364, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12365, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12366, false},
+    {0x000000000004, 12367, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000002, 12368, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 12369, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000100000, 12370, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12371, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000080000, 12372, false},
+    {0x000000100000, 12373, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000008000, 12374, false},
+    {0x080000000000, 12375, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+    {0x000000000004, 12376, true},
+    {0x000000000000, 0, true},
+    {0x000000000020, 12377, false},
+    {0x000000000000, 0, true},
+    {0x000000000000, 0, true},
+}};
+
+}  // namespace 𒄑𒂅𒌋
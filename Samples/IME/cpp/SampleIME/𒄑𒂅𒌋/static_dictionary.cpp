@@ -0,0 +1,33 @@
+﻿#include "𒄑𒂅𒌋/static_dictionary.h"
+
+#include <algorithm>
+
+#include "𒄑𒂅𒌋/static_dictionary_table.h"
+
+namespace 𒄑𒂅𒌋 {
+
+std::optional<std::wstring_view> LookUpComposition(
+    std::wstring_view const composition) {
+  auto const it = std::ranges::lower_bound(
+      static_dictionary, composition, {}, &StaticDictionaryEntry::composition);
+  if (it == static_dictionary.end() || it->composition != composition) {
+    return std::nullopt;
+  }
+  return it->sign;
+}
+
+std::span<StaticDictionaryEntry const> EntriesWithPrefix(
+    std::wstring_view const prefix) {
+  // The table is sorted, so the compositions starting with the prefix are the
+  // ones from the first one not less than the prefix up to the first one that
+  // does not start with it.
+  auto const first = std::ranges::lower_bound(
+      static_dictionary, prefix, {}, &StaticDictionaryEntry::composition);
+  auto const last = std::partition_point(
+      first, static_dictionary.end(), [prefix](auto const& entry) {
+        return entry.composition.starts_with(prefix);
+      });
+  return {first, last};
+}
+
+}  // namespace 𒄑𒂅𒌋
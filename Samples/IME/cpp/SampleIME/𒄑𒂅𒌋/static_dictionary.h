@@ -0,0 +1,31 @@
+﻿#pragma once
+
+#include <optional>
+#include <span>
+#include <string_view>
+
+// A compiled-in form of the dictionary.  It is not yet used by
+// CTableDictionaryEngine, which still reads Dictionary/sign_list.txt and
+// compares compositions case-insensitively, while these lookups are
+// case-sensitive.
+
+namespace 𒄑𒂅𒌋 {
+
+struct StaticDictionaryEntry {
+  std::wstring_view composition;
+  std::wstring_view sign;
+  // The position of the entry in the candidate order of the build that
+  // generated the table, that of InputsOrdered unless read_sign_list.py was
+  // run with --frequencies.
+  int rank;
+};
+
+// The sign for the given composition, if any.
+std::optional<std::wstring_view> LookUpComposition(
+    std::wstring_view composition);
+
+// The entries whose composition starts with the given prefix, for completion.
+std::span<StaticDictionaryEntry const> EntriesWithPrefix(
+    std::wstring_view prefix);
+
+}  // namespace 𒄑𒂅𒌋
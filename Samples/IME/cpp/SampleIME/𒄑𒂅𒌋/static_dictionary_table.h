@@ -0,0 +1,8486 @@
+﻿// Generated by read_sign_list.py from sign_list.csv; do not edit.
+// The entries are sorted by UTF-16 code units, so that a composition can be
+// found by binary search, and the compositions with a given prefix form a
+// contiguous range.  Their ranks are their positions in candidate order.
+
+#pragma once
+
+#include <array>
+
+#include "𒄑𒂅𒌋/static_dictionary.h"
+
+namespace 𒄑𒂅𒌋 {
+
+inline constexpr std::array<StaticDictionaryEntry, 8469> static_dictionary{{
+    {L"/", L"𒑰", 0},
+    {L"1", L"𒁹", 451},
+    {L"1/2", L"𒈦", 600},
+    {L"1/2iku", L"𒀹", 601},
+    {L"1/3", L"𒑚", 602},
+    {L"1/4iku", L"𒑠", 621},
+    {L"1/8iku", L"𒑟", 689},
+    {L"10", L"𒌋", 3928},
+    {L"100800", L"𒐭𒐪", 8333},
+    {L"10152000", L"𒐰𒃲𒐩𒃲", 8453},
+    {L"1020", L"𒐞𒐛", 8260},
+    {L"10368000", L"𒐰𒃲𒐪𒃲", 8454},
+    {L"104400", L"𒐭𒐫", 8334},
+    {L"10584000", L"𒐰𒃲𒐫𒃲", 8455},
+    {L"1080", L"𒐞𒐜", 8261},
+    {L"10800", L"𒐤", 8305},
+    {L"108000", L"𒐮", 8335},
+    {L"1080000", L"𒐧𒃲", 8386},
+    {L"10800000", L"𒐱𒃲", 8456},
+    {L"108000v1", L"𒐯", 8336},
+    {L"10800v1", L"𒐥", 8306},
+    {L"10bur3", L"𒐴", 3930},
+    {L"10geš2", L"𒐞", 3931},
+    {L"10šar2", L"𒐬", 3932},
+    {L"10šargal", L"𒐬𒃲", 3933},
+    {L"11", L"𒌋𒁹", 4354},
+    {L"11016000", L"𒐱𒃲𒊹𒃲", 8457},
+    {L"11016000v1", L"𒐱𒃲𒐲", 8458},
+    {L"111600", L"𒐮𒊹", 8337},
+    {L"111600v1", L"𒐯𒊹", 8338},
+    {L"11232000", L"𒐱𒃲𒐣𒃲", 8459},
+    {L"11232000v1", L"𒐱𒃲𒐳", 8460},
+    {L"1140", L"𒐞𒐝", 8262},
+    {L"11448000", L"𒐱𒃲𒐤𒃲", 8461},
+    {L"11448000v1", L"𒐱𒃲𒐥𒃲", 8462},
+    {L"115200", L"𒐮𒐣", 8339},
+    {L"115200v1", L"𒐯𒐣", 8340},
+    {L"11664000", L"𒐱𒃲𒐦𒃲", 8463},
+    {L"118800", L"𒐮𒐤", 8341},
+    {L"11880000", L"𒐱𒃲𒐧𒃲", 8464},
+    {L"118800v1", L"𒐮𒐥", 8342},
+    {L"118800v2", L"𒐯𒐤", 8343},
+    {L"118800v3", L"𒐯𒐥", 8344},
+    {L"11bur3", L"𒐴𒌋", 4355},
+    {L"11geš2", L"𒐞𒐕", 4356},
+    {L"11šar2", L"𒐬𒊹", 4357},
+    {L"11šargal", L"𒐬𒃲𒊹𒃲", 4358},
+    {L"11šargalv1", L"𒐬𒃲𒐲", 4359},
+    {L"12", L"𒌋𒈫", 4768},
+    {L"120", L"𒐖", 8245},
+    {L"1200", L"𒐟", 8263},
+    {L"12096000", L"𒐱𒃲𒐨𒃲", 8465},
+    {L"122400", L"𒐮𒐦", 8345},
+    {L"122400v1", L"𒐯𒐦", 8346},
+    {L"12312000", L"𒐱𒃲𒐩𒃲", 8466},
+    {L"12528000", L"𒐱𒃲𒐪𒃲", 8467},
+    {L"1260", L"𒐟𒐕", 8264},
+    {L"126000", L"𒐮𒐧", 8347},
+    {L"126000v1", L"𒐯𒐧", 8348},
+    {L"12744000", L"𒐱𒃲𒐫𒃲", 8468},
+    {L"129600", L"𒐮𒐨", 8349},
+    {L"1296000", L"𒐨𒃲", 8387},
+    {L"129600v1", L"𒐯𒐨", 8350},
+    {L"12bur3", L"𒐴𒎙", 4769},
+    {L"12geš2", L"𒐞𒐖", 4770},
+    {L"12šar2", L"𒐬𒐣", 4771},
+    {L"12šargal", L"𒐬𒃲𒐣𒃲", 4772},
+    {L"12šargalv1", L"𒐬𒃲𒐳", 4773},
+    {L"13", L"𒌋𒐈", 4985},
+    {L"1320", L"𒐟𒐖", 8265},
+    {L"133200", L"𒐮𒐩", 8351},
+    {L"133200v1", L"𒐯𒐩", 8352},
+    {L"136800", L"𒐮𒐪", 8353},
+    {L"136800v1", L"𒐯𒐪", 8354},
+    {L"1380", L"𒐟𒐗", 8266},
+    {L"13bur3", L"𒐴𒌍", 4986},
+    {L"13geš2", L"𒐞𒐗", 4987},
+    {L"13šar2", L"𒐬𒐤", 4988},
+    {L"13šar2v1", L"𒐬𒐥", 4989},
+    {L"13šargal", L"𒐬𒃲𒐤𒃲", 4990},
+    {L"13šargalv1", L"𒐬𒃲𒐥𒃲", 4991},
+    {L"14", L"𒌋𒐼", 5110},
+    {L"140400", L"𒐮𒐫", 8355},
+    {L"140400v1", L"𒐯𒐫", 8356},
+    {L"1440", L"𒐟𒐘", 8267},
+    {L"14400", L"𒐦", 8307},
+    {L"144000", L"𒐰", 8357},
+    {L"147600", L"𒐰𒊹", 8358},
+    {L"14bur3", L"𒐴𒑩", 5112},
+    {L"14bur3v1", L"𒐴𒐏", 5113},
+    {L"14geš2", L"𒐞𒐘", 5114},
+    {L"14v1", L"𒌋𒐉", 5111},
+    {L"14šar2", L"𒐬𒐦", 5115},
+    {L"14šargal", L"𒐬𒃲𒐦𒃲", 5116},
+    {L"15", L"𒌋𒐊", 5263},
+    {L"1500", L"𒐟𒐙", 8268},
+    {L"151200", L"𒐰𒐣", 8359},
+    {L"1512000", L"𒐩𒃲", 8388},
+    {L"154800", L"𒐰𒐤", 8360},
+    {L"154800v1", L"𒐰𒐥", 8361},
+    {L"1560", L"𒐟𒐚", 8269},
+    {L"158400", L"𒐰𒐦", 8362},
+    {L"15bur3", L"𒐴𒑪", 5264},
+    {L"15bur3v1", L"𒐴𒐐", 5265},
+    {L"15geš2", L"𒐞𒐙", 5266},
+    {L"15šar2", L"𒐬𒐧", 5267},
+    {L"15šargal", L"𒐬𒃲𒐧𒃲", 5268},
+    {L"16", L"𒌋𒐋", 5873},
+    {L"1620", L"𒐟𒐛", 8270},
+    {L"162000", L"𒐰𒐧", 8363},
+    {L"165600", L"𒐰𒐨", 8364},
+    {L"1680", L"𒐟𒐜", 8271},
+    {L"169200", L"𒐰𒐩", 8365},
+    {L"16bur3", L"𒐴𒑫", 5874},
+    {L"16bur3v1", L"𒐴𒐑", 5875},
+    {L"16geš2", L"𒐞𒐚", 5876},
+    {L"16šar2", L"𒐬𒐨", 5877},
+    {L"16šargal", L"𒐬𒃲𒐨𒃲", 5878},
+    {L"17", L"𒌋𒑂", 5928},
+    {L"172800", L"𒐰𒐪", 8366},
+    {L"1728000", L"𒐪𒃲", 8389},
+    {L"1740", L"𒐟𒐝", 8272},
+    {L"176400", L"𒐰𒐫", 8367},
+    {L"17bur3", L"𒐴𒑬", 5930},
+    {L"17bur3v1", L"𒐴𒐒", 5931},
+    {L"17geš2", L"𒐞𒐛", 5932},
+    {L"17v1", L"𒌋𒐌", 5929},
+    {L"17šar2", L"𒐬𒐩", 5933},
+    {L"17šargal", L"𒐬𒃲𒐩𒃲", 5934},
+    {L"18", L"𒌋𒑄", 6587},
+    {L"180", L"𒐗", 8246},
+    {L"1800", L"𒐠", 8273},
+    {L"18000", L"𒐧", 8308},
+    {L"180000", L"𒐱", 8368},
+    {L"183600", L"𒐱𒊹", 8369},
+    {L"1860", L"𒐠𒐕", 8274},
+    {L"187200", L"𒐱𒐣", 8370},
+    {L"18bur3", L"𒐴𒑭", 6589},
+    {L"18bur3v1", L"𒐴𒐓", 6590},
+    {L"18geš2", L"𒐞𒐜", 6591},
+    {L"18v1", L"𒌋𒐍", 6588},
+    {L"18šar2", L"𒐬𒐪", 6592},
+    {L"18šargal", L"𒐬𒃲𒐪𒃲", 6593},
+    {L"19", L"𒌋𒑆", 6977},
+    {L"190800", L"𒐱𒐤", 8371},
+    {L"190800v1", L"𒐱𒐥", 8372},
+    {L"1920", L"𒐠𒐖", 8275},
+    {L"194400", L"𒐱𒐦", 8373},
+    {L"1944000", L"𒐫𒃲", 8390},
+    {L"1980", L"𒐠𒐗", 8276},
+    {L"198000", L"𒐱𒐧", 8374},
+    {L"19bur3", L"𒐴𒑮", 6979},
+    {L"19bur3v1", L"𒐴𒐔", 6980},
+    {L"19geš2", L"𒐞𒐝", 6981},
+    {L"19v1", L"𒌋𒐎", 6978},
+    {L"19šar2", L"𒐬𒐫", 6982},
+    {L"19šargal", L"𒐬𒃲𒐫𒃲", 6983},
+    {L"1aš", L"𒀸", 452},
+    {L"1ban2", L"𒑏", 453},
+    {L"1barig", L"𒁹", 454},
+    {L"1bur3", L"𒌋", 455},
+    {L"1buru", L"𒐴", 456},
+    {L"1eše3", L"𒑘", 457},
+    {L"1geš2", L"𒐕", 458},
+    {L"1gešu", L"𒐞", 459},
+    {L"1iku", L"𒀸", 460},
+    {L"1u", L"𒌋", 467},
+    {L"1šar2", L"𒊹", 461},
+    {L"1šargal", L"𒊹𒃲", 462},
+    {L"1šargalv1", L"𒐲", 463},
+    {L"1šarkid", L"𒊹𒆤", 464},
+    {L"1šaru", L"𒐬", 465},
+    {L"1šarugal", L"𒐬𒃲", 466},
+    {L"2", L"𒈫", 808},
+    {L"2/3", L"𒑛", 951},
+    {L"20", L"𒎙", 7061},
+    {L"201600", L"𒐱𒐨", 8375},
+    {L"2040", L"𒐠𒐘", 8277},
+    {L"205200", L"𒐱𒐩", 8376},
+    {L"208800", L"𒐱𒐪", 8377},
+    {L"20bur3", L"𒐵", 7063},
+    {L"20geš2", L"𒐟", 7071},
+    {L"20šar2", L"𒐭", 7086},
+    {L"20šargal", L"𒐭𒃲", 7087},
+    {L"21", L"𒎙𒁹", 7649},
+    {L"2100", L"𒐠𒐙", 8278},
+    {L"212400", L"𒐱𒐫", 8378},
+    {L"2160", L"𒐠𒐚", 8279},
+    {L"21600", L"𒐨", 8309},
+    {L"216000", L"𒊹𒃲", 8379},
+    {L"2160000", L"𒐬𒃲", 8391},
+    {L"216000v1", L"𒐲", 8380},
+    {L"21bur3", L"𒐵𒌋", 7650},
+    {L"21geš2", L"𒐟𒐕", 7651},
+    {L"21šar2", L"𒐭𒊹", 7652},
+    {L"21šargal", L"𒐭𒃲𒊹𒃲", 7653},
+    {L"21šargalv1", L"𒐭𒃲𒐲", 7654},
+    {L"22", L"𒎙𒈫", 7683},
+    {L"2220", L"𒐠𒐛", 8280},
+    {L"2280", L"𒐠𒐜", 8281},
+    {L"22bur3", L"𒐵𒎙", 7684},
+    {L"22geš2", L"𒐟𒐖", 7685},
+    {L"22šar2", L"𒐭𒐣", 7686},
+    {L"22šargal", L"𒐭𒃲𒐣𒃲", 7687},
+    {L"22šargalv1", L"𒐭𒃲𒐳", 7688},
+    {L"23", L"𒎙𒐈", 7918},
+    {L"2340", L"𒐠𒐝", 8282},
+    {L"2376000", L"𒐬𒃲𒊹𒃲", 8392},
+    {L"2376000v1", L"𒐬𒃲𒐲", 8393},
+    {L"23bur3", L"𒐵𒌍", 7919},
+    {L"23geš2", L"𒐟𒐗", 7920},
+    {L"23šar2", L"𒐭𒐤", 7921},
+    {L"23šar2v1", L"𒐭𒐥", 7922},
+    {L"23šargal", L"𒐭𒃲𒐤𒃲", 7923},
+    {L"23šargalv1", L"𒐭𒃲𒐥𒃲", 7924},
+    {L"24", L"𒎙𒐼", 7944},
+    {L"240", L"𒐘", 8247},
+    {L"2400", L"𒐡", 8283},
+    {L"2460", L"𒐡𒐕", 8284},
+    {L"24bur3", L"𒐵𒑩", 7946},
+    {L"24bur3v1", L"𒐵𒐏", 7947},
+    {L"24geš2", L"𒐟𒐘", 7948},
+    {L"24v1", L"𒎙𒐉", 7945},
+    {L"24šar2", L"𒐭𒐦", 7949},
+    {L"24šargal", L"𒐭𒃲𒐦𒃲", 7950},
+    {L"25", L"𒎙𒐊", 7951},
+    {L"2520", L"𒐡𒐖", 8285},
+    {L"25200", L"𒐩", 8310},
+    {L"2580", L"𒐡𒐗", 8286},
+    {L"2592000", L"𒐬𒃲𒐣𒃲", 8394},
+    {L"2592000v1", L"𒐬𒃲𒐳", 8395},
+    {L"25bur3", L"𒐵𒑪", 7952},
+    {L"25bur3v1", L"𒐵𒐐", 7953},
+    {L"25geš2", L"𒐟𒐙", 7954},
+    {L"25šar2", L"𒐭𒐧", 7955},
+    {L"25šargal", L"𒐭𒃲𒐧𒃲", 7956},
+    {L"26", L"𒎙𒐋", 7957},
+    {L"2640", L"𒐡𒐘", 8287},
+    {L"26bur3", L"𒐵𒑫", 7958},
+    {L"26bur3v1", L"𒐵𒐑", 7959},
+    {L"26geš2", L"𒐟𒐚", 7960},
+    {L"26šar2", L"𒐭𒐨", 7961},
+    {L"26šargal", L"𒐭𒃲𒐨𒃲", 7962},
+    {L"27", L"𒎙𒑂", 7963},
+    {L"2700", L"𒐡𒐙", 8288},
+    {L"2760", L"𒐡𒐚", 8289},
+    {L"27bur3", L"𒐵𒑬", 7965},
+    {L"27bur3v1", L"𒐵𒐒", 7966},
+    {L"27geš2", L"𒐟𒐛", 7967},
+    {L"27v1", L"𒎙𒐌", 7964},
+    {L"27šar2", L"𒐭𒐩", 7968},
+    {L"27šargal", L"𒐭𒃲𒐩𒃲", 7969},
+    {L"28", L"𒎙𒑄", 7970},
+    {L"2808000", L"𒐬𒃲𒐤𒃲", 8396},
+    {L"2808000v1", L"𒐬𒃲𒐥𒃲", 8397},
+    {L"2820", L"𒐡𒐛", 8290},
+    {L"2880", L"𒐡𒐜", 8291},
+    {L"28800", L"𒐪", 8311},
+    {L"28bur3", L"𒐵𒑭", 7972},
+    {L"28bur3v1", L"𒐵𒐓", 7973},
+    {L"28geš2", L"𒐟𒐜", 7974},
+    {L"28v1", L"𒎙𒐍", 7971},
+    {L"28šar2", L"𒐭𒐪", 7975},
+    {L"28šargal", L"𒐭𒃲𒐪𒃲", 7976},
+    {L"29", L"𒎙𒑆", 7977},
+    {L"2940", L"𒐡𒐝", 8292},
+    {L"29bur3", L"𒐵𒑮", 7979},
+    {L"29bur3v1", L"𒐵𒐔", 7980},
+    {L"29geš2", L"𒐟𒐝", 7981},
+    {L"29v1", L"𒎙𒐎", 7978},
+    {L"29šar2", L"𒐭𒐫", 7982},
+    {L"29šargal", L"𒐭𒃲𒐫𒃲", 7983},
+    {L"2aš", L"𒐀", 810},
+    {L"2ban2", L"𒑐", 811},
+    {L"2barig", L"𒑖", 812},
+    {L"2bur3", L"𒎙", 813},
+    {L"2buru", L"𒐵", 814},
+    {L"2eše3", L"𒑙", 815},
+    {L"2geš2", L"𒐖", 816},
+    {L"2gešu", L"𒐟", 817},
+    {L"2iku", L"𒐀", 818},
+    {L"2u", L"𒎙", 825},
+    {L"2šar2", L"𒐣", 819},
+    {L"2šargal", L"𒐣𒃲", 820},
+    {L"2šargalv1", L"𒐳", 821},
+    {L"2šarkid", L"𒐣𒆤", 822},
+    {L"2šaru", L"𒐭", 823},
+    {L"2šarugal", L"𒐭𒃲", 824},
+    {L"3", L"𒐈", 1257},
+    {L"30", L"𒌍", 7984},
+    {L"300", L"𒐙", 8248},
+    {L"3000", L"𒐢", 8293},
+    {L"3024000", L"𒐬𒃲𒐦𒃲", 8398},
+    {L"3060", L"𒐢𒐕", 8294},
+    {L"30bur3", L"𒐶", 7985},
+    {L"30bur3v1", L"𒐷", 7986},
+    {L"30geš2", L"𒐠", 7987},
+    {L"30šar2", L"𒐮", 7988},
+    {L"30šar2v1", L"𒐯", 7989},
+    {L"30šargal", L"𒐮𒃲", 7990},
+    {L"30šargalv1", L"𒐯𒃲", 7991},
+    {L"31", L"𒌍𒁹", 7992},
+    {L"3120", L"𒐢𒐖", 8295},
+    {L"3180", L"𒐢𒐗", 8296},
+    {L"31bur3", L"𒐶𒌋", 7993},
+    {L"31bur3v1", L"𒐷𒌋", 7994},
+    {L"31geš2", L"𒐠𒐕", 7995},
+    {L"31šar2", L"𒐮𒊹", 7996},
+    {L"31šar2v1", L"𒐯𒊹", 7997},
+    {L"31šargal", L"𒐮𒃲𒊹𒃲", 7998},
+    {L"31šargalv1", L"𒐮𒃲𒐲", 7999},
+    {L"31šargalv2", L"𒐯𒃲𒊹𒃲", 8000},
+    {L"31šargalv3", L"𒐯𒃲𒐲", 8001},
+    {L"32", L"𒌍𒈫", 8002},
+    {L"3240", L"𒐢𒐘", 8297},
+    {L"32400", L"𒐫", 8312},
+    {L"3240000", L"𒐬𒃲𒐧𒃲", 8399},
+    {L"32bur3", L"𒐶𒎙", 8003},
+    {L"32bur3v1", L"𒐷𒎙", 8004},
+    {L"32geš2", L"𒐠𒐖", 8005},
+    {L"32šar2", L"𒐮𒐣", 8006},
+    {L"32šar2v1", L"𒐯𒐣", 8007},
+    {L"32šargal", L"𒐮𒃲𒐣𒃲", 8008},
+    {L"32šargalv1", L"𒐮𒃲𒐳", 8009},
+    {L"32šargalv2", L"𒐯𒃲𒐣𒃲", 8010},
+    {L"32šargalv3", L"𒐯𒃲𒐳", 8011},
+    {L"33", L"𒌍𒐈", 8012},
+    {L"3300", L"𒐢𒐙", 8298},
+    {L"3360", L"𒐢𒐚", 8299},
+    {L"33bur3", L"𒐶𒌍", 8013},
+    {L"33bur3v1", L"𒐷𒌍", 8014},
+    {L"33geš2", L"𒐠𒐗", 8015},
+    {L"33šar2", L"𒐮𒐤", 8016},
+    {L"33šar2v1", L"𒐮𒐥", 8017},
+    {L"33šar2v2", L"𒐯𒐤", 8018},
+    {L"33šar2v3", L"𒐯𒐥", 8019},
+    {L"33šargal", L"𒐮𒃲𒐤𒃲", 8020},
+    {L"33šargalv1", L"𒐮𒃲𒐥𒃲", 8021},
+    {L"33šargalv2", L"𒐯𒃲𒐤𒃲", 8022},
+    {L"33šargalv3", L"𒐯𒃲𒐥𒃲", 8023},
+    {L"34", L"𒌍𒐼", 8024},
+    {L"3420", L"𒐢𒐛", 8300},
+    {L"3456000", L"𒐬𒃲𒐨𒃲", 8400},
+    {L"3480", L"𒐢𒐜", 8301},
+    {L"34bur3", L"𒐶𒑩", 8026},
+    {L"34bur3v1", L"𒐶𒐏", 8027},
+    {L"34bur3v2", L"𒐷𒑩", 8028},
+    {L"34bur3v3", L"𒐷𒐏", 8029},
+    {L"34geš2", L"𒐠𒐘", 8030},
+    {L"34v1", L"𒌍𒐉", 8025},
+    {L"34šar2", L"𒐮𒐦", 8031},
+    {L"34šar2v1", L"𒐯𒐦", 8032},
+    {L"34šargal", L"𒐮𒃲𒐦𒃲", 8033},
+    {L"34šargalv1", L"𒐯𒃲𒐦𒃲", 8034},
+    {L"35", L"𒌍𒐊", 8035},
+    {L"3540", L"𒐢𒐝", 8302},
+    {L"35bur3", L"𒐶𒑪", 8036},
+    {L"35bur3v1", L"𒐶𒐐", 8037},
+    {L"35bur3v2", L"𒐷𒑪", 8038},
+    {L"35bur3v3", L"𒐷𒐐", 8039},
+    {L"35geš2", L"𒐠𒐙", 8040},
+    {L"35šar2", L"𒐮𒐧", 8041},
+    {L"35šar2v1", L"𒐯𒐧", 8042},
+    {L"35šargal", L"𒐮𒃲𒐧𒃲", 8043},
+    {L"35šargalv1", L"𒐯𒃲𒐧𒃲", 8044},
+    {L"36", L"𒌍𒐋", 8045},
+    {L"360", L"𒐚", 8249},
+    {L"3600", L"𒊹", 8303},
+    {L"36000", L"𒐬", 8313},
+    {L"3672000", L"𒐬𒃲𒐩𒃲", 8401},
+    {L"36bur3", L"𒐶𒑫", 8046},
+    {L"36bur3v1", L"𒐶𒐑", 8047},
+    {L"36bur3v2", L"𒐷𒑫", 8048},
+    {L"36bur3v3", L"𒐷𒐑", 8049},
+    {L"36geš2", L"𒐠𒐚", 8050},
+    {L"36šar2", L"𒐮𒐨", 8051},
+    {L"36šar2v1", L"𒐯𒐨", 8052},
+    {L"36šargal", L"𒐮𒃲𒐨𒃲", 8053},
+    {L"36šargalv1", L"𒐯𒃲𒐨𒃲", 8054},
+    {L"37", L"𒌍𒑂", 8055},
+    {L"37bur3", L"𒐶𒑬", 8057},
+    {L"37bur3v1", L"𒐶𒐒", 8058},
+    {L"37bur3v2", L"𒐷𒑬", 8059},
+    {L"37bur3v3", L"𒐷𒐒", 8060},
+    {L"37geš2", L"𒐠𒐛", 8061},
+    {L"37v1", L"𒌍𒐌", 8056},
+    {L"37šar2", L"𒐮𒐩", 8062},
+    {L"37šar2v1", L"𒐯𒐩", 8063},
+    {L"37šargal", L"𒐮𒃲𒐩𒃲", 8064},
+    {L"37šargalv1", L"𒐯𒃲𒐩𒃲", 8065},
+    {L"38", L"𒌍𒑄", 8066},
+    {L"3888000", L"𒐬𒃲𒐪𒃲", 8402},
+    {L"38bur3", L"𒐶𒑭", 8068},
+    {L"38bur3v1", L"𒐶𒐓", 8069},
+    {L"38bur3v2", L"𒐷𒑭", 8070},
+    {L"38bur3v3", L"𒐷𒐓", 8071},
+    {L"38geš2", L"𒐠𒐜", 8072},
+    {L"38v1", L"𒌍𒐍", 8067},
+    {L"38šar2", L"𒐮𒐪", 8073},
+    {L"38šar2v1", L"𒐯𒐪", 8074},
+    {L"38šargal", L"𒐮𒃲𒐪𒃲", 8075},
+    {L"38šargalv1", L"𒐯𒃲𒐪𒃲", 8076},
+    {L"39", L"𒌍𒑆", 8077},
+    {L"39600", L"𒐬𒊹", 8314},
+    {L"39bur3", L"𒐶𒑮", 8079},
+    {L"39bur3v1", L"𒐶𒐔", 8080},
+    {L"39bur3v2", L"𒐷𒑮", 8081},
+    {L"39bur3v3", L"𒐷𒐔", 8082},
+    {L"39geš2", L"𒐠𒐝", 8083},
+    {L"39v1", L"𒌍𒐎", 8078},
+    {L"39šar2", L"𒐮𒐫", 8084},
+    {L"39šar2v1", L"𒐯𒐫", 8085},
+    {L"39šargal", L"𒐮𒃲𒐫𒃲", 8086},
+    {L"39šargalv1", L"𒐯𒃲𒐫𒃲", 8087},
+    {L"3aš", L"𒐁", 1259},
+    {L"3ašv1", L"𒐻", 1260},
+    {L"3ban2", L"𒑑", 1261},
+    {L"3barig", L"𒑗", 1262},
+    {L"3bur3", L"𒌍", 1263},
+    {L"3buru", L"𒐶", 1264},
+    {L"3buruv1", L"𒐷", 1265},
+    {L"3geš2", L"𒐗", 1271},
+    {L"3gešu", L"𒐠", 1272},
+    {L"3iku", L"𒐁", 1277},
+    {L"3ikuv1", L"𒐻", 1278},
+    {L"3u", L"𒌍", 1297},
+    {L"3šar2", L"𒐤", 1287},
+    {L"3šar2v1", L"𒐥", 1288},
+    {L"3šargal", L"𒐤𒃲", 1289},
+    {L"3šargalv1", L"𒐥𒃲", 1290},
+    {L"3šarkid", L"𒐤𒆤", 1291},
+    {L"3šarkidv1", L"𒐥𒆤", 1292},
+    {L"3šaru", L"𒐮", 1293},
+    {L"3šarugal", L"𒐮𒃲", 1295},
+    {L"3šarugalv1", L"𒐯𒃲", 1296},
+    {L"3šaruv1", L"𒐯", 1294},
+    {L"4", L"𒐼", 1664},
+    {L"40", L"𒑩", 8088},
+    {L"40bur3", L"𒐸", 8090},
+    {L"40geš2", L"𒐡", 8091},
+    {L"40v1", L"𒐏", 8089},
+    {L"40šar2", L"𒐰", 8092},
+    {L"40šargal", L"𒐰𒃲", 8093},
+    {L"41", L"𒑩𒁹", 8094},
+    {L"4104000", L"𒐬𒃲𒐫𒃲", 8403},
+    {L"41bur3", L"𒐸𒌋", 8096},
+    {L"41geš2", L"𒐡𒐕", 8097},
+    {L"41v1", L"𒐏𒁹", 8095},
+    {L"41šar2", L"𒐰𒊹", 8098},
+    {L"41šargal", L"𒐰𒃲𒊹𒃲", 8099},
+    {L"41šargalv1", L"𒐰𒃲𒐲", 8100},
+    {L"42", L"𒑩𒈫", 8101},
+    {L"420", L"𒐛", 8250},
+    {L"42bur3", L"𒐸𒎙", 8103},
+    {L"42geš2", L"𒐡𒐖", 8104},
+    {L"42v1", L"𒐏𒈫", 8102},
+    {L"42šar2", L"𒐰𒐣", 8105},
+    {L"42šargal", L"𒐰𒃲𒐣𒃲", 8106},
+    {L"42šargalv1", L"𒐰𒃲𒐳", 8107},
+    {L"43", L"𒑩𒐈", 8108},
+    {L"43200", L"𒐬𒐣", 8315},
+    {L"432000", L"𒐣𒃲", 8381},
+    {L"4320000", L"𒐭𒃲", 8404},
+    {L"432000v1", L"𒐳", 8382},
+    {L"43bur3", L"𒐸𒌍", 8110},
+    {L"43geš2", L"𒐡𒐗", 8111},
+    {L"43v1", L"𒐏𒐈", 8109},
+    {L"43šar2", L"𒐰𒐤", 8112},
+    {L"43šar2v1", L"𒐰𒐥", 8113},
+    {L"43šargal", L"𒐰𒃲𒐤𒃲", 8114},
+    {L"43šargalv1", L"𒐰𒃲𒐥𒃲", 8115},
+    {L"44", L"𒑩𒐼", 8116},
+    {L"44bur3", L"𒐸𒑩", 8120},
+    {L"44bur3v1", L"𒐸𒐏", 8121},
+    {L"44geš2", L"𒐡𒐘", 8122},
+    {L"44v1", L"𒑩𒐉", 8117},
+    {L"44v2", L"𒐏𒐼", 8118},
+    {L"44v3", L"𒐏𒐉", 8119},
+    {L"44šar2", L"𒐰𒐦", 8123},
+    {L"44šargal", L"𒐰𒃲𒐦𒃲", 8124},
+    {L"45", L"𒑩𒐊", 8125},
+    {L"4536000", L"𒐭𒃲𒊹𒃲", 8405},
+    {L"4536000v1", L"𒐭𒃲𒐲", 8406},
+    {L"45bur3", L"𒐸𒑪", 8127},
+    {L"45bur3v1", L"𒐸𒐐", 8128},
+    {L"45geš2", L"𒐡𒐙", 8129},
+    {L"45v1", L"𒐏𒐊", 8126},
+    {L"45šar2", L"𒐰𒐧", 8130},
+    {L"45šargal", L"𒐰𒃲𒐧𒃲", 8131},
+    {L"46", L"𒑩𒐋", 8132},
+    {L"46800", L"𒐬𒐤", 8316},
+    {L"46800v1", L"𒐬𒐥", 8317},
+    {L"46bur3", L"𒐸𒑫", 8134},
+    {L"46bur3v1", L"𒐸𒐑", 8135},
+    {L"46geš2", L"𒐡𒐚", 8136},
+    {L"46v1", L"𒐏𒐋", 8133},
+    {L"46šar2", L"𒐰𒐨", 8137},
+    {L"46šargal", L"𒐰𒃲𒐨𒃲", 8138},
+    {L"47", L"𒑩𒑂", 8139},
+    {L"4752000", L"𒐭𒃲𒐣𒃲", 8407},
+    {L"4752000v1", L"𒐭𒃲𒐳", 8408},
+    {L"47bur3", L"𒐸𒑬", 8143},
+    {L"47bur3v1", L"𒐸𒐒", 8144},
+    {L"47geš2", L"𒐡𒐛", 8145},
+    {L"47v1", L"𒑩𒐌", 8140},
+    {L"47v2", L"𒐏𒑂", 8141},
+    {L"47v3", L"𒐏𒐌", 8142},
+    {L"47šar2", L"𒐰𒐩", 8146},
+    {L"47šargal", L"𒐰𒃲𒐩𒃲", 8147},
+    {L"48", L"𒑩𒑄", 8148},
+    {L"480", L"𒐜", 8251},
+    {L"48bur3", L"𒐸𒑭", 8152},
+    {L"48bur3v1", L"𒐸𒐓", 8153},
+    {L"48geš2", L"𒐡𒐜", 8154},
+    {L"48v1", L"𒑩𒐍", 8149},
+    {L"48v2", L"𒐏𒑄", 8150},
+    {L"48v3", L"𒐏𒐍", 8151},
+    {L"48šar2", L"𒐰𒐪", 8155},
+    {L"48šargal", L"𒐰𒃲𒐪𒃲", 8156},
+    {L"49", L"𒑩𒑆", 8157},
+    {L"4968000", L"𒐭𒃲𒐤𒃲", 8409},
+    {L"4968000v1", L"𒐭𒃲𒐥𒃲", 8410},
+    {L"49bur3", L"𒐸𒑮", 8161},
+    {L"49bur3v1", L"𒐸𒐔", 8162},
+    {L"49geš2", L"𒐡𒐝", 8163},
+    {L"49v1", L"𒑩𒐎", 8158},
+    {L"49v2", L"𒐏𒑆", 8159},
+    {L"49v3", L"𒐏𒐎", 8160},
+    {L"49šar2", L"𒐰𒐫", 8164},
+    {L"49šargal", L"𒐰𒃲𒐫𒃲", 8165},
+    {L"4aš", L"𒐂", 1666},
+    {L"4ban2", L"𒑒", 1667},
+    {L"4ban2v1", L"𒑓", 1668},
+    {L"4barig", L"𒐉", 1669},
+    {L"4bur3", L"𒑩", 1670},
+    {L"4bur3v1", L"𒐏", 1671},
+    {L"4buru", L"𒐸", 1672},
+    {L"4geš2", L"𒐘", 1673},
+    {L"4gešu", L"𒐡", 1674},
+    {L"4iku", L"𒐂", 1675},
+    {L"4u", L"𒑩", 1681},
+    {L"4uv1", L"𒐏", 1682},
+    {L"4v1", L"𒐉", 1665},
+    {L"4šar2", L"𒐦", 1676},
+    {L"4šargal", L"𒐦𒃲", 1677},
+    {L"4šarkid", L"𒐦𒆤", 1678},
+    {L"4šaru", L"𒐰", 1679},
+    {L"4šarugal", L"𒐰𒃲", 1680},
+    {L"5", L"𒐊", 2419},
+    {L"5/6", L"𒑜", 2551},
+    {L"50", L"𒑪", 8166},
+    {L"50400", L"𒐬𒐦", 8318},
+    {L"50bur3", L"𒐹", 8168},
+    {L"50geš2", L"𒐢", 8169},
+    {L"50v1", L"𒐐", 8167},
+    {L"50šar2", L"𒐱", 8170},
+    {L"50šargal", L"𒐱𒃲", 8171},
+    {L"51", L"𒑪𒁹", 8172},
+    {L"5184000", L"𒐭𒃲𒐦𒃲", 8411},
+    {L"51bur3", L"𒐹𒌋", 8174},
+    {L"51geš2", L"𒐢𒐕", 8175},
+    {L"51v1", L"𒐐𒁹", 8173},
+    {L"51šar2", L"𒐱𒊹", 8176},
+    {L"51šargal", L"𒐱𒃲𒊹𒃲", 8177},
+    {L"51šargalv1", L"𒐱𒃲𒐲", 8178},
+    {L"52", L"𒑪𒈫", 8179},
+    {L"52bur3", L"𒐹𒎙", 8181},
+    {L"52geš2", L"𒐢𒐖", 8182},
+    {L"52v1", L"𒐐𒈫", 8180},
+    {L"52šar2", L"𒐱𒐣", 8183},
+    {L"52šargal", L"𒐱𒃲𒐣𒃲", 8184},
+    {L"52šargalv1", L"𒐱𒃲𒐳", 8185},
+    {L"53", L"𒑪𒐈", 8186},
+    {L"53bur3", L"𒐹𒌍", 8188},
+    {L"53geš2", L"𒐢𒐗", 8189},
+    {L"53v1", L"𒐐𒐈", 8187},
+    {L"53šar2", L"𒐱𒐤", 8190},
+    {L"53šar2v1", L"𒐱𒐥", 8191},
+    {L"53šargal", L"𒐱𒃲𒐤𒃲", 8192},
+    {L"53šargalv1", L"𒐱𒃲𒐥𒃲", 8193},
+    {L"54", L"𒑪𒐼", 8194},
+    {L"540", L"𒐝", 8252},
+    {L"54000", L"𒐬𒐧", 8319},
+    {L"5400000", L"𒐭𒃲𒐧𒃲", 8412},
+    {L"54bur3", L"𒐹𒑩", 8198},
+    {L"54bur3v1", L"𒐹𒐏", 8199},
+    {L"54geš2", L"𒐢𒐘", 8200},
+    {L"54v1", L"𒑪𒐉", 8195},
+    {L"54v2", L"𒐐𒐼", 8196},
+    {L"54v3", L"𒐐𒐉", 8197},
+    {L"54šar2", L"𒐱𒐦", 8201},
+    {L"54šargal", L"𒐱𒃲𒐦𒃲", 8202},
+    {L"55", L"𒑪𒐊", 8203},
+    {L"55bur3", L"𒐹𒑪", 8205},
+    {L"55bur3v1", L"𒐹𒐐", 8206},
+    {L"55geš2", L"𒐢𒐙", 8207},
+    {L"55v1", L"𒐐𒐊", 8204},
+    {L"55šar2", L"𒐱𒐧", 8208},
+    {L"55šargal", L"𒐱𒃲𒐧𒃲", 8209},
+    {L"56", L"𒑪𒐋", 8210},
+    {L"5616000", L"𒐭𒃲𒐨𒃲", 8413},
+    {L"56bur3", L"𒐹𒑫", 8212},
+    {L"56bur3v1", L"𒐹𒐑", 8213},
+    {L"56geš2", L"𒐢𒐚", 8214},
+    {L"56v1", L"𒐐𒐋", 8211},
+    {L"56šar2", L"𒐱𒐨", 8215},
+    {L"56šargal", L"𒐱𒃲𒐨𒃲", 8216},
+    {L"57", L"𒑪𒑂", 8217},
+    {L"57600", L"𒐬𒐨", 8320},
+    {L"57bur3", L"𒐹𒑬", 8221},
+    {L"57bur3v1", L"𒐹𒐒", 8222},
+    {L"57geš2", L"𒐢𒐛", 8223},
+    {L"57v1", L"𒑪𒐌", 8218},
+    {L"57v2", L"𒐐𒑂", 8219},
+    {L"57v3", L"𒐐𒐌", 8220},
+    {L"57šar2", L"𒐱𒐩", 8224},
+    {L"57šargal", L"𒐱𒃲𒐩𒃲", 8225},
+    {L"58", L"𒑪𒑄", 8226},
+    {L"5832000", L"𒐭𒃲𒐩𒃲", 8414},
+    {L"58bur3", L"𒐹𒑭", 8230},
+    {L"58bur3v1", L"𒐹𒐓", 8231},
+    {L"58geš2", L"𒐢𒐜", 8232},
+    {L"58v1", L"𒑪𒐍", 8227},
+    {L"58v2", L"𒐐𒑄", 8228},
+    {L"58v3", L"𒐐𒐍", 8229},
+    {L"58šar2", L"𒐱𒐪", 8233},
+    {L"58šargal", L"𒐱𒃲𒐪𒃲", 8234},
+    {L"59", L"𒑪𒑆", 8235},
+    {L"59bur3", L"𒐹𒑮", 8239},
+    {L"59bur3v1", L"𒐹𒐔", 8240},
+    {L"59geš2", L"𒐢𒐝", 8241},
+    {L"59v1", L"𒑪𒐎", 8236},
+    {L"59v2", L"𒐐𒑆", 8237},
+    {L"59v3", L"𒐐𒐎", 8238},
+    {L"59šar2", L"𒐱𒐫", 8242},
+    {L"59šargal", L"𒐱𒃲𒐫𒃲", 8243},
+    {L"5aš", L"𒐃", 2420},
+    {L"5ban2", L"𒑔", 2421},
+    {L"5ban2v1", L"𒑕", 2422},
+    {L"5bur3", L"𒑪", 2423},
+    {L"5bur3v1", L"𒐐", 2424},
+    {L"5buru", L"𒐹", 2425},
+    {L"5geš2", L"𒐙", 2426},
+    {L"5gešu", L"𒐢", 2427},
+    {L"5iku", L"𒐃", 2428},
+    {L"5u", L"𒑪", 2434},
+    {L"5uv1", L"𒐐", 2435},
+    {L"5šar2", L"𒐧", 2429},
+    {L"5šargal", L"𒐧𒃲", 2430},
+    {L"5šarkid", L"𒐧𒆤", 2431},
+    {L"5šaru", L"𒐱", 2432},
+    {L"5šarugal", L"𒐱𒃲", 2433},
+    {L"6", L"𒐋", 2624},
+    {L"60", L"𒐕", 8244},
+    {L"600", L"𒐞", 8253},
+    {L"6048000", L"𒐭𒃲𒐪𒃲", 8415},
+    {L"61200", L"𒐬𒐩", 8321},
+    {L"6264000", L"𒐭𒃲𒐫𒃲", 8416},
+    {L"64800", L"𒐬𒐪", 8322},
+    {L"648000", L"𒐤𒃲", 8383},
+    {L"6480000", L"𒐮𒃲", 8417},
+    {L"6480000v1", L"𒐯𒃲", 8418},
+    {L"648000v1", L"𒐥𒃲", 8384},
+    {L"660", L"𒐞𒐕", 8254},
+    {L"6696000", L"𒐮𒃲𒊹𒃲", 8419},
+    {L"6696000v1", L"𒐮𒃲𒐲", 8420},
+    {L"6696000v2", L"𒐯𒃲𒊹𒃲", 8421},
+    {L"6696000v3", L"𒐯𒃲𒐲", 8422},
+    {L"68400", L"𒐬𒐫", 8323},
+    {L"6912000", L"𒐮𒃲𒐣𒃲", 8423},
+    {L"6912000v1", L"𒐮𒃲𒐳", 8424},
+    {L"6912000v2", L"𒐯𒃲𒐣𒃲", 8425},
+    {L"6912000v3", L"𒐯𒃲𒐳", 8426},
+    {L"6aš", L"𒐄", 2626},
+    {L"6bur3", L"𒑫", 2627},
+    {L"6bur3v1", L"𒐑", 2628},
+    {L"6geš2", L"𒐚", 2633},
+    {L"6u", L"𒑫", 2648},
+    {L"6uv1", L"𒐑", 2649},
+    {L"6šar2", L"𒐨", 2645},
+    {L"6šargal", L"𒐨𒃲", 2646},
+    {L"6šarkid", L"𒐨𒆤", 2647},
+    {L"7", L"𒑂", 2994},
+    {L"7128000", L"𒐮𒃲𒐤𒃲", 8427},
+    {L"7128000v1", L"𒐮𒃲𒐥𒃲", 8428},
+    {L"7128000v2", L"𒐯𒃲𒐤𒃲", 8429},
+    {L"7128000v3", L"𒐯𒃲𒐥𒃲", 8430},
+    {L"720", L"𒐞𒐖", 8255},
+    {L"7200", L"𒐣", 8304},
+    {L"72000", L"𒐭", 8324},
+    {L"7344000", L"𒐮𒃲𒐦𒃲", 8431},
+    {L"7344000v1", L"𒐯𒃲𒐦𒃲", 8432},
+    {L"75600", L"𒐭𒊹", 8325},
+    {L"7560000", L"𒐮𒃲𒐧𒃲", 8433},
+    {L"7560000v1", L"𒐯𒃲𒐧𒃲", 8434},
+    {L"7776000", L"𒐮𒃲𒐨𒃲", 8435},
+    {L"7776000v1", L"𒐯𒃲𒐨𒃲", 8436},
+    {L"780", L"𒐞𒐗", 8256},
+    {L"79200", L"𒐭𒐣", 8326},
+    {L"7992000", L"𒐮𒃲𒐩𒃲", 8437},
+    {L"7992000v1", L"𒐯𒃲𒐩𒃲", 8438},
+    {L"7aš", L"𒐅", 2996},
+    {L"7bur3", L"𒑬", 2997},
+    {L"7bur3v1", L"𒐒", 2998},
+    {L"7geš2", L"𒐛", 2999},
+    {L"7u", L"𒑬", 3003},
+    {L"7uv1", L"𒐒", 3004},
+    {L"7v1", L"𒐌", 2995},
+    {L"7šar2", L"𒐩", 3000},
+    {L"7šargal", L"𒐩𒃲", 3001},
+    {L"7šarkid", L"𒐩𒆤", 3002},
+    {L"8", L"𒑄", 3011},
+    {L"8208000", L"𒐮𒃲𒐪𒃲", 8439},
+    {L"8208000v1", L"𒐯𒃲𒐪𒃲", 8440},
+    {L"82800", L"𒐭𒐤", 8327},
+    {L"82800v1", L"𒐭𒐥", 8328},
+    {L"840", L"𒐞𒐘", 8257},
+    {L"8424000", L"𒐮𒃲𒐫𒃲", 8441},
+    {L"8424000v1", L"𒐯𒃲𒐫𒃲", 8442},
+    {L"86400", L"𒐭𒐦", 8329},
+    {L"864000", L"𒐦𒃲", 8385},
+    {L"8640000", L"𒐰𒃲", 8443},
+    {L"8856000", L"𒐰𒃲𒊹𒃲", 8444},
+    {L"8856000v1", L"𒐰𒃲𒐲", 8445},
+    {L"8aš", L"𒐆", 3013},
+    {L"8bur3", L"𒑭", 3014},
+    {L"8bur3v1", L"𒐓", 3015},
+    {L"8geš2", L"𒐜", 3016},
+    {L"8u", L"𒑭", 3020},
+    {L"8uv1", L"𒐓", 3021},
+    {L"8v1", L"𒐍", 3012},
+    {L"8šar2", L"𒐪", 3017},
+    {L"8šargal", L"𒐪𒃲", 3018},
+    {L"8šarkid", L"𒐪𒆤", 3019},
+    {L"9", L"𒑆", 3598},
+    {L"900", L"𒐞𒐙", 8258},
+    {L"90000", L"𒐭𒐧", 8330},
+    {L"9072000", L"𒐰𒃲𒐣𒃲", 8446},
+    {L"9072000v1", L"𒐰𒃲𒐳", 8447},
+    {L"9288000", L"𒐰𒃲𒐤𒃲", 8448},
+    {L"9288000v1", L"𒐰𒃲𒐥𒃲", 8449},
+    {L"93600", L"𒐭𒐨", 8331},
+    {L"9504000", L"𒐰𒃲𒐦𒃲", 8450},
+    {L"960", L"𒐞𒐚", 8259},
+    {L"97200", L"𒐭𒐩", 8332},
+    {L"9720000", L"𒐰𒃲𒐧𒃲", 8451},
+    {L"9936000", L"𒐰𒃲𒐨𒃲", 8452},
+    {L"9aš", L"𒐇", 3600},
+    {L"9bur3", L"𒑮", 3601},
+    {L"9bur3v1", L"𒐔", 3602},
+    {L"9geš2", L"𒐝", 3603},
+    {L"9u", L"𒑮", 3607},
+    {L"9uv1", L"𒐔", 3608},
+    {L"9v1", L"𒐎", 3599},
+    {L"9šar2", L"𒐫", 3604},
+    {L"9šargal", L"𒐫𒃲", 3605},
+    {L"9šarkid", L"𒐫𒆤", 3606},
+    {L":", L"𒑱", 1},
+    {L":v1", L"𒑲", 4},
+    {L"a", L"𒀀", 5},
+    {L"a10", L"𒊷", 16},
+    {L"a11", L"𒀭", 17},
+    {L"a12", L"𒌓", 18},
+    {L"a13", L"𒌗", 19},
+    {L"a14", L"𒂍", 20},
+    {L"a2", L"𒀉", 6},
+    {L"a2ʾ", L"𒄴", 7},
+    {L"a3", L"𒉿", 8},
+    {L"a3ʾ", L"𒂍", 9},
+    {L"a4", L"𒀀𒀭", 10},
+    {L"a5", L"𒀝", 11},
+    {L"a6", L"𒌋", 12},
+    {L"a7", L"𒄩", 13},
+    {L"a8", L"𒌨", 14},
+    {L"a9", L"𒆹", 15},
+    {L"ab", L"𒀊", 21},
+    {L"ab2", L"𒀖", 22},
+    {L"ab3", L"𒀜", 23},
+    {L"ab4", L"𒀔", 24},
+    {L"aba", L"𒀊", 25},
+    {L"aba3", L"𒀜", 26},
+    {L"aba4", L"𒀔", 27},
+    {L"abba", L"𒀊", 28},
+    {L"abba2", L"𒀋", 29},
+    {L"abbar", L"𒆹", 30},
+    {L"abgal", L"𒉣𒈨", 31},
+    {L"abgal2", L"𒉣𒈨𒅤", 32},
+    {L"ablal", L"𒆼", 33},
+    {L"ablal2", L"𒆹", 34},
+    {L"ablal3", L"𒇦", 35},
+    {L"abni", L"𒆠𒉈", 36},
+    {L"abni2", L"𒆠𒉈", 37},
+    {L"abrig", L"𒉣𒈨𒁺", 38},
+    {L"abrig2", L"𒀖𒉣𒈨𒁺", 39},
+    {L"absin", L"𒆠𒀸𒀸", 40},
+    {L"absin2", L"𒀊𒉆", 41},
+    {L"absin3", L"𒀳", 42},
+    {L"abul", L"𒆍𒃲", 43},
+    {L"abzu", L"𒍪𒀊", 44},
+    {L"ad", L"𒀜", 45},
+    {L"ad2", L"𒄉", 46},
+    {L"ad3", L"𒇼", 47},
+    {L"ad4", L"𒍞", 48},
+    {L"ad5L", L"𒇽𒍗", 50},
+    {L"ad5Lv1", L"𒇽𒁁", 51},
+    {L"ad5Lv2", L"𒇿", 52},
+    {L"ad5M", L"𒌑𒄉", 49},
+    {L"ad6", L"𒇽𒁁", 53},
+    {L"ad6v1", L"𒈕", 54},
+    {L"ad6v2", L"𒇿", 55},
+    {L"ad6v3", L"𒎉", 56},
+    {L"ada", L"𒀜", 57},
+    {L"adab", L"𒌓𒉣", 58},
+    {L"adama", L"𒁁𒈪", 59},
+    {L"adamen", L"𒈓", 60},
+    {L"adamen2", L"𒈙", 62},
+    {L"adamen3", L"𒄒", 63},
+    {L"adamen4", L"𒉫", 64},
+    {L"adamen5", L"𒂛", 65},
+    {L"adamenv1", L"𒈒", 61},
+    {L"adamin", L"𒈓", 66},
+    {L"adamin2", L"𒈙", 68},
+    {L"adamin3", L"𒄒", 69},
+    {L"adamin4", L"𒉫", 70},
+    {L"adamin5", L"𒂛", 71},
+    {L"adaminv1", L"𒈒", 67},
+    {L"adamu", L"𒁁𒈪", 72},
+    {L"adan", L"𒌓", 73},
+    {L"adar", L"𒀀𒄠", 74},
+    {L"adar2", L"𒄠", 75},
+    {L"adar3", L"𒃿", 76},
+    {L"adda", L"𒇽𒁁", 77},
+    {L"adda2", L"𒇼", 80},
+    {L"adda3", L"𒌑𒄉", 81},
+    {L"adda4", L"𒄉", 82},
+    {L"addav1", L"𒇿", 78},
+    {L"addav2", L"𒎉", 79},
+    {L"addir", L"𒀀𒉺𒄐𒉻𒋛𒀀", 83},
+    {L"addu2", L"𒌑𒄉", 84},
+    {L"addu3", L"𒄉", 85},
+    {L"addu4", L"𒍞", 86},
+    {L"adkin", L"𒋁", 87},
+    {L"ag", L"𒀝", 88},
+    {L"ag2", L"𒉘", 89},
+    {L"ag3", L"𒋃", 90},
+    {L"aga", L"𒂇", 91},
+    {L"aga2", L"𒉘", 92},
+    {L"aga3", L"𒂆", 93},
+    {L"agam", L"𒀀𒁁", 94},
+    {L"agamv1", L"𒀂", 95},
+    {L"agan", L"𒋺𒄗", 96},
+    {L"agan2", L"𒁛", 97},
+    {L"agar", L"𒀀𒃼", 98},
+    {L"agar2", L"𒇋", 99},
+    {L"agar3", L"𒆻", 100},
+    {L"agar4", L"𒅊", 101},
+    {L"agar5L", L"𒀀𒈖", 103},
+    {L"agar5M", L"𒅐", 102},
+    {L"agar6", L"𒅎𒂂", 104},
+    {L"agargara", L"𒉩", 105},
+    {L"agargara2", L"𒉣𒄩", 106},
+    {L"agarim", L"𒂼𒀭𒈹", 107},
+    {L"agarin", L"𒀌", 108},
+    {L"agarin2", L"𒀎", 109},
+    {L"agarin3", L"𒂼𒂆", 110},
+    {L"agarin4L", L"𒂼𒋋", 112},
+    {L"agarin4M", L"𒂼𒋆", 111},
+    {L"agarin5L", L"𒂼𒋆", 114},
+    {L"agarin5M", L"𒂼𒋋", 113},
+    {L"agrig", L"𒅆𒁾", 115},
+    {L"agrun", L"𒂍𒉣", 116},
+    {L"agu", L"𒂇", 117},
+    {L"ai", L"𒀀𒀀", 134},
+    {L"aia", L"𒀀𒀀", 135},
+    {L"aia2", L"𒀀", 136},
+    {L"aia3", L"𒌨", 137},
+    {L"aia4", L"𒆹", 138},
+    {L"aie", L"𒀀𒀀", 139},
+    {L"aii", L"𒀀𒀀", 140},
+    {L"aiia", L"𒀀𒀀", 141},
+    {L"aiie", L"𒀀𒀀", 142},
+    {L"aiii", L"𒀀𒀀", 143},
+    {L"aiiu", L"𒀀𒀀", 144},
+    {L"aiu", L"𒀀𒀀", 145},
+    {L"aja", L"𒀀𒀀", 146},
+    {L"aje", L"𒀀𒀀", 147},
+    {L"aji", L"𒀀𒀀", 148},
+    {L"ajja", L"𒀀𒀀", 149},
+    {L"ajje", L"𒀀𒀀", 150},
+    {L"ajji", L"𒀀𒀀", 151},
+    {L"ajju", L"𒀀𒀀", 152},
+    {L"aju", L"𒀀𒀀", 153},
+    {L"ak", L"𒀝", 154},
+    {L"ak3", L"𒋃", 155},
+    {L"aka", L"𒀝", 156},
+    {L"aka2", L"𒉘", 157},
+    {L"aka3", L"𒋃", 158},
+    {L"aka4", L"𒆍", 159},
+    {L"akan", L"𒁛", 160},
+    {L"akan2", L"𒆍", 161},
+    {L"akan3", L"𒇖", 162},
+    {L"akani", L"𒁛", 163},
+    {L"akar", L"𒉬", 164},
+    {L"akarv1", L"𒉧", 165},
+    {L"akkad", L"𒆠𒀭𒅎", 166},
+    {L"akkil", L"𒃰𒋺𒋛", 167},
+    {L"akkil2", L"𒀜𒆤", 168},
+    {L"aktum", L"𒀀𒋢", 172},
+    {L"aktum2", L"𒋢𒀀", 173},
+    {L"akšak", L"𒌔", 169},
+    {L"akšak2", L"𒀀𒆵", 170},
+    {L"akšak3", L"𒌗𒆵", 171},
+    {L"al", L"𒀠", 174},
+    {L"al2", L"𒀩", 175},
+    {L"al3", L"𒃷", 176},
+    {L"al5", L"𒌓", 177},
+    {L"al6", L"𒈤", 178},
+    {L"al7", L"𒀭", 179},
+    {L"al8", L"𒌷", 180},
+    {L"al9", L"𒅋", 181},
+    {L"ala", L"𒌷", 182},
+    {L"ala2", L"𒌷𒎌", 183},
+    {L"ala3", L"𒀠", 184},
+    {L"alab", L"𒄞", 185},
+    {L"alad", L"𒆘", 186},
+    {L"alad2", L"𒄨", 187},
+    {L"alad3", L"𒆘", 188},
+    {L"alag", L"𒀩", 189},
+    {L"alal", L"𒋄", 190},
+    {L"alal2", L"𒋃", 191},
+    {L"alal3", L"𒄒", 192},
+    {L"alal4", L"𒄒", 193},
+    {L"alala", L"𒀩", 194},
+    {L"alala2", L"𒋤", 195},
+    {L"alala3", L"𒌓", 196},
+    {L"alam", L"𒀩", 197},
+    {L"alammuš", L"𒋭", 198},
+    {L"alammuš2", L"𒈹𒋭", 199},
+    {L"alamu", L"𒋄", 200},
+    {L"alamu2", L"𒋃", 201},
+    {L"alamuš", L"𒋭", 202},
+    {L"alamuš2", L"𒈹𒋭", 203},
+    {L"alan", L"𒀩", 204},
+    {L"alap", L"𒄞", 205},
+    {L"alba", L"𒂷", 206},
+    {L"alba2", L"𒆜𒆳", 207},
+    {L"ale", L"𒌷", 208},
+    {L"algames", L"𒌓𒊩𒄸", 209},
+    {L"ali", L"𒌷", 211},
+    {L"alim", L"𒄋", 212},
+    {L"alima", L"𒄋", 214},
+    {L"alimav1", L"𒄍", 215},
+    {L"alimv1", L"𒄍", 213},
+    {L"alla", L"𒉄", 216},
+    {L"almu", L"𒋄", 217},
+    {L"almu2", L"𒋃", 218},
+    {L"alu", L"𒌷", 219},
+    {L"alʾal", L"𒄒", 220},
+    {L"alʾal2L", L"𒃹", 222},
+    {L"alʾal2M", L"𒄒", 221},
+    {L"alḫa", L"𒆜𒆳", 210},
+    {L"am", L"𒄠", 223},
+    {L"am2", L"𒉘", 224},
+    {L"am3", L"𒀀𒀭", 225},
+    {L"am4", L"𒃘", 226},
+    {L"am5", L"𒃣", 227},
+    {L"am6", L"𒀭", 228},
+    {L"am7", L"𒉿", 229},
+    {L"ama", L"𒂼", 230},
+    {L"ama2", L"𒄠", 231},
+    {L"ama3", L"𒄀𒇻", 232},
+    {L"ama4", L"𒃘", 233},
+    {L"ama5", L"𒂑", 234},
+    {L"ama5v1", L"𒃣", 235},
+    {L"ama6", L"𒆾", 236},
+    {L"amagi2", L"𒀀𒈹𒁲", 240},
+    {L"amagi3", L"𒍝𒈹𒁲", 241},
+    {L"amagi4", L"𒍝𒈽𒁲", 242},
+    {L"amagiL", L"𒀀𒈹𒁲", 238},
+    {L"amagiLv1", L"𒍝𒈹𒁲", 239},
+    {L"amagiM", L"𒈻", 237},
+    {L"amalu", L"𒂼𒀭𒈹", 243},
+    {L"amam", L"𒈻", 244},
+    {L"amar", L"𒀫", 245},
+    {L"amat", L"𒊩𒆳", 247},
+    {L"amaš", L"𒁦", 246},
+    {L"ambar", L"𒆹", 248},
+    {L"ame", L"𒂼", 249},
+    {L"ame2", L"𒂑", 250},
+    {L"ame2v1", L"𒃣", 251},
+    {L"amedu", L"𒂼𒀀𒌅", 252},
+    {L"ami", L"𒂼", 253},
+    {L"amma", L"𒆳", 254},
+    {L"amme", L"𒀵", 255},
+    {L"amna", L"𒌓", 256},
+    {L"amna2", L"𒎙", 257},
+    {L"amtu", L"𒊩𒆳", 258},
+    {L"amuš", L"𒀇", 259},
+    {L"amuša", L"𒀇", 260},
+    {L"an", L"𒀭", 261},
+    {L"an2", L"𒄒", 262},
+    {L"ana", L"𒁹", 263},
+    {L"ana2", L"𒀭", 264},
+    {L"ana3", L"𒀸", 265},
+    {L"anbir", L"𒀭𒉈", 266},
+    {L"andul", L"𒊨", 267},
+    {L"angur", L"𒇉", 268},
+    {L"anigi", L"𒅎", 269},
+    {L"anuL", L"𒀭𒀀𒉡", 277},
+    {L"anuM", L"𒀭", 276},
+    {L"anubu", L"𒆳", 278},
+    {L"anzalub", L"𒊮𒄀", 279},
+    {L"anzu", L"𒅎𒂂", 280},
+    {L"anzu2", L"𒅎𒈪", 281},
+    {L"anzud", L"𒅎𒂂", 282},
+    {L"anzud2", L"𒅎𒈪", 283},
+    {L"anše", L"𒀲", 270},
+    {L"anše2", L"𒄊", 272},
+    {L"anšev1", L"𒄏", 271},
+    {L"anši", L"𒀲", 273},
+    {L"anšu", L"𒀲", 274},
+    {L"anšu2", L"𒄊", 275},
+    {L"ap", L"𒀊", 284},
+    {L"ap2", L"𒀖", 285},
+    {L"ap3", L"𒀜", 286},
+    {L"apin", L"𒀳", 287},
+    {L"aq", L"𒀝", 288},
+    {L"aqa", L"𒀝", 289},
+    {L"ar", L"𒅈", 290},
+    {L"ar2", L"𒌒", 291},
+    {L"ar3", L"𒄯", 292},
+    {L"ar5", L"𒃵", 293},
+    {L"ar6", L"𒁺", 294},
+    {L"ara", L"𒊭", 295},
+    {L"ara2", L"𒌒", 296},
+    {L"ara3", L"𒄯", 297},
+    {L"ara4", L"𒌓𒁺", 298},
+    {L"ara5", L"𒄯𒄯", 299},
+    {L"ara6", L"𒁺", 300},
+    {L"ara7", L"𒌓", 301},
+    {L"ara8", L"𒅈", 302},
+    {L"ara9", L"𒆂", 303},
+    {L"arabL", L"𒌓𒉣𒄷", 305},
+    {L"arabM", L"𒌓𒉣", 304},
+    {L"arad", L"𒀴", 306},
+    {L"arad2", L"𒀵", 307},
+    {L"arad3", L"𒇵", 308},
+    {L"arala", L"𒂍𒆳𒁁", 313},
+    {L"arali", L"𒂍𒆳𒁁", 314},
+    {L"ararim", L"𒌸", 315},
+    {L"ararma", L"𒌓𒀕", 316},
+    {L"ararma2", L"𒌓𒀊", 317},
+    {L"aratta", L"𒇴𒆳𒊒", 318},
+    {L"aratta2", L"𒇵𒊒", 320},
+    {L"arattav1", L"𒇵𒊒", 319},
+    {L"araḫ", L"𒌗", 309},
+    {L"araḫ2", L"𒌛", 310},
+    {L"araḫ3", L"𒃥", 311},
+    {L"araḫ4", L"𒂍𒍑𒁍𒁕", 312},
+    {L"arda", L"𒀴", 321},
+    {L"argab", L"𒀶", 322},
+    {L"ari", L"𒌵", 331},
+    {L"ari2", L"𒁁", 332},
+    {L"ari3", L"𒉺", 333},
+    {L"ari5", L"𒉺𒎌", 334},
+    {L"ari6", L"𒋧", 335},
+    {L"arina", L"𒈷", 336},
+    {L"arkab", L"𒀶", 337},
+    {L"arrap", L"𒇹", 338},
+    {L"arrapv1", L"𒐂", 339},
+    {L"aruL", L"𒁕𒊑", 341},
+    {L"aruM", L"𒉺", 340},
+    {L"arḫuš", L"𒂑", 323},
+    {L"arḫuš2", L"𒉦", 325},
+    {L"arḫuš3", L"𒉥", 326},
+    {L"arḫuš4", L"𒂼", 327},
+    {L"arḫuš5", L"𒀉𒌉", 328},
+    {L"arḫuš6", L"𒀉𒊩", 329},
+    {L"arḫuš7", L"𒀉𒂑", 330},
+    {L"arḫušv1", L"𒃣", 324},
+    {L"as", L"𒊍", 342},
+    {L"as2", L"𒀾", 343},
+    {L"as3", L"𒀸", 344},
+    {L"as4", L"𒆹", 345},
+    {L"as5", L"𒋓", 346},
+    {L"as6", L"𒄱", 347},
+    {L"asa", L"𒊍", 348},
+    {L"asal", L"𒍂", 349},
+    {L"asar", L"𒍂", 350},
+    {L"asari", L"𒍂", 351},
+    {L"asaru", L"𒍂", 352},
+    {L"asi", L"𒀀𒌁", 353},
+    {L"asil", L"𒂰", 354},
+    {L"asil3", L"𒂢", 355},
+    {L"asil4", L"𒂤", 356},
+    {L"asil5", L"𒂣", 357},
+    {L"asil6", L"𒂴", 358},
+    {L"asila", L"𒂰", 359},
+    {L"asila2", L"𒋆", 360},
+    {L"asila3", L"𒂢", 361},
+    {L"asila4", L"𒂤", 362},
+    {L"asila5", L"𒂣", 363},
+    {L"asila6", L"𒂴", 364},
+    {L"asilal", L"𒂰", 365},
+    {L"asilal2", L"𒋆", 366},
+    {L"asilal3", L"𒂢", 367},
+    {L"asilal4", L"𒂤", 368},
+    {L"asilal5", L"𒂣", 369},
+    {L"asilal6", L"𒂴", 370},
+    {L"asilla2", L"𒋆", 371},
+    {L"aslag", L"𒌆𒌓", 372},
+    {L"at", L"𒀜", 415},
+    {L"at2", L"𒄉", 416},
+    {L"at5", L"𒇽𒁁", 417},
+    {L"at5v1", L"𒇿", 418},
+    {L"at6", L"𒇽𒁁", 419},
+    {L"at6v1", L"𒇿", 420},
+    {L"attu", L"𒌑𒄈", 421},
+    {L"atum", L"𒎎𒆠", 422},
+    {L"aw", L"𒉿", 425},
+    {L"az", L"𒊍", 426},
+    {L"az2", L"𒀾", 427},
+    {L"az3", L"𒀸", 428},
+    {L"aza", L"𒊍", 429},
+    {L"azad", L"𒌑𒀀𒇒𒈣𒋙𒀀", 430},
+    {L"azad2", L"𒋺", 431},
+    {L"azag", L"𒆬𒀭", 432},
+    {L"azag2", L"𒀉𒉺", 433},
+    {L"azalag", L"𒌆𒌓", 434},
+    {L"azlag", L"𒌆𒌓", 435},
+    {L"azlag2", L"𒌆", 436},
+    {L"azlag3", L"𒄑𒌆𒉿𒋼𒀀𒁺", 437},
+    {L"azlag4", L"𒄑𒌆𒋼𒀀𒁺", 438},
+    {L"azlag5", L"𒄑𒌆𒉿𒋼𒀀", 439},
+    {L"azlag6", L"𒄑𒌆𒋼𒀀", 440},
+    {L"azlag7", L"𒇽𒌆", 441},
+    {L"azlag7v1", L"𒈐", 442},
+    {L"azu", L"𒉙", 443},
+    {L"azu2", L"𒋨", 444},
+    {L"azugna", L"𒄯𒊕", 445},
+    {L"azuknaL", L"𒄯𒊕𒊬", 447},
+    {L"azuknaM", L"𒄯𒊕", 446},
+    {L"aš", L"𒀸", 376},
+    {L"aš10", L"𒁹", 386},
+    {L"aš11", L"𒀹", 387},
+    {L"aš2", L"𒀾", 377},
+    {L"aš3", L"𒐋", 378},
+    {L"aš4", L"𒐄", 379},
+    {L"aš5", L"𒋁𒋦", 380},
+    {L"aš6", L"𒀊", 381},
+    {L"aš6v1", L"𒋁", 382},
+    {L"aš7", L"𒋓", 383},
+    {L"aš8", L"𒄱", 384},
+    {L"aš9", L"𒑀", 385},
+    {L"aša", L"𒀸", 388},
+    {L"aša2L", L"𒀀", 390},
+    {L"aša2M", L"𒀾", 389},
+    {L"aša3", L"𒐋", 391},
+    {L"aša5", L"𒃷", 392},
+    {L"ašag", L"𒃷", 393},
+    {L"ašdar", L"𒌋𒁯", 394},
+    {L"ašgab", L"𒀿", 395},
+    {L"aški", L"𒍤𒆸", 396},
+    {L"aškud", L"𒀉𒈽", 397},
+    {L"aškud2", L"𒀉𒈹", 398},
+    {L"ašlagL", L"𒄑𒌆𒉿𒋼𒀀", 400},
+    {L"ašlagLv1", L"𒄑𒌆𒉿𒋼𒀀𒁺", 401},
+    {L"ašlagM", L"𒌆𒌓", 399},
+    {L"ašlug", L"𒂍𒍑𒁍𒁕", 402},
+    {L"ašnan", L"𒊺𒌁", 403},
+    {L"ašnan2", L"𒊺", 404},
+    {L"aštaL", L"𒄑𒃰𒋺", 410},
+    {L"aštaM", L"𒃰𒋺", 409},
+    {L"ašte", L"𒀉𒌋𒆤", 411},
+    {L"ašte2", L"𒆹", 412},
+    {L"ašugi", L"𒈻", 413},
+    {L"ašugi2", L"𒍝𒈹𒁲", 414},
+    {L"ašša", L"𒀸", 405},
+    {L"ašša2L", L"𒄑𒃰𒋺", 407},
+    {L"ašša2M", L"𒃰𒋺", 406},
+    {L"ašša3", L"𒐋", 408},
+    {L"aʾ", L"𒀪", 448},
+    {L"aʾa3", L"𒆹", 449},
+    {L"aʾuʾu", L"𒀀𒉺𒄐𒉻𒋛𒀀", 450},
+    {L"aḫ", L"𒄴", 118},
+    {L"aḫ2", L"𒋀", 119},
+    {L"aḫ3", L"𒌓", 120},
+    {L"aḫ4L", L"𒉽", 122},
+    {L"aḫ4M", L"𒀪", 121},
+    {L"aḫ5", L"𒀉", 123},
+    {L"aḫ6", L"𒌔", 124},
+    {L"aḫa", L"𒄴", 125},
+    {L"aḫa2", L"𒋀", 126},
+    {L"aḫa3", L"𒉽", 127},
+    {L"aḫi2", L"𒀉", 131},
+    {L"aḫiL", L"𒀉", 130},
+    {L"aḫiM", L"𒋀", 129},
+    {L"aḫud", L"𒅒", 132},
+    {L"aḫulab", L"𒈽", 133},
+    {L"aḫḫur", L"𒅆𒁉", 128},
+    {L"aṣ", L"𒊍", 373},
+    {L"aṣ2", L"𒀾", 374},
+    {L"aṣ3", L"𒀸", 375},
+    {L"aṭ", L"𒀜", 423},
+    {L"aṭ2", L"𒄉", 424},
+    {L"ba", L"𒁀", 468},
+    {L"ba10", L"𒉼", 480},
+    {L"ba11", L"𒅤", 481},
+    {L"ba12L", L"𒆃", 483},
+    {L"ba12M", L"𒅤", 482},
+    {L"ba13", L"𒈨", 484},
+    {L"ba14", L"𒉽", 485},
+    {L"ba15", L"𒁇", 486},
+    {L"ba2", L"𒉺", 469},
+    {L"ba3", L"𒌍", 470},
+    {L"ba4", L"𒂷", 471},
+    {L"ba4v1", L"𒀀𒀭𒂷", 472},
+    {L"ba4v2", L"𒍝𒂷𒂷", 473},
+    {L"ba5", L"𒅮", 474},
+    {L"ba6", L"𒁀𒌑", 475},
+    {L"ba6v1", L"𒌑", 476},
+    {L"ba7", L"𒈦", 477},
+    {L"ba8", L"𒂦", 478},
+    {L"ba9", L"𒁁", 479},
+    {L"bab", L"𒉽", 487},
+    {L"bab2", L"𒌓", 488},
+    {L"bab3", L"𒆍", 489},
+    {L"baba2", L"𒆍", 490},
+    {L"baba3", L"𒆍", 491},
+    {L"babar", L"𒌓", 492},
+    {L"babar2", L"𒌓𒌓", 493},
+    {L"babbar", L"𒌓", 494},
+    {L"babbar2", L"𒌓𒌓", 495},
+    {L"bad", L"𒁁", 496},
+    {L"bad2", L"𒉻", 497},
+    {L"bad3", L"𒂦", 498},
+    {L"bad4", L"𒆠𒄨", 499},
+    {L"bad5", L"𒅆", 500},
+    {L"badi", L"𒅆", 501},
+    {L"badiliša", L"𒆯", 502},
+    {L"baeš", L"𒑑", 503},
+    {L"bag", L"𒄷", 504},
+    {L"bag3", L"𒁂", 505},
+    {L"bak", L"𒄷", 514},
+    {L"bakiru", L"𒌋𒊬", 515},
+    {L"bakirum", L"𒌋𒊬", 516},
+    {L"bal", L"𒁄", 517},
+    {L"bal2", L"𒁔", 518},
+    {L"bal3", L"𒀡", 519},
+    {L"bal4", L"𒀦", 520},
+    {L"bala", L"𒁄", 521},
+    {L"balag", L"𒁆", 522},
+    {L"baliḫa", L"𒆜𒆳", 523},
+    {L"balla", L"𒃻𒊕𒅍𒂡𒍑", 524},
+    {L"balla2", L"𒃻𒊕𒅍𒂡𒊩", 525},
+    {L"bamin", L"𒑐", 526},
+    {L"ban", L"𒉼", 527},
+    {L"ban2", L"𒑏", 528},
+    {L"ban3", L"𒌉", 529},
+    {L"ban4", L"𒆕", 530},
+    {L"banda2", L"𒑏", 531},
+    {L"banda3", L"𒌉", 532},
+    {L"banda4", L"𒁁", 533},
+    {L"banda5", L"𒋞𒁁", 534},
+    {L"bandiliša", L"𒆯", 535},
+    {L"baneš", L"𒑑", 536},
+    {L"bania", L"𒑕", 537},
+    {L"baniav1", L"𒑔", 538},
+    {L"banlimmu", L"𒑓", 539},
+    {L"banlimmuv1", L"𒑒", 540},
+    {L"banmin", L"𒑐", 541},
+    {L"bansur", L"𒍎", 542},
+    {L"bansur2", L"𒅃", 543},
+    {L"bansur3", L"𒆒", 544},
+    {L"bansur3v1", L"𒆓", 545},
+    {L"banšur", L"𒍎", 546},
+    {L"banšur2", L"𒅃", 547},
+    {L"banšur3", L"𒆒", 548},
+    {L"banšur3v1", L"𒆓", 549},
+    {L"bap", L"𒉽", 550},
+    {L"bapir", L"𒋋", 551},
+    {L"bappir", L"𒋋", 552},
+    {L"bappir2", L"𒋆", 553},
+    {L"bappir3", L"𒁋", 554},
+    {L"bappira", L"𒋋", 555},
+    {L"bappira2", L"𒋆", 556},
+    {L"bappira3", L"𒁋", 557},
+    {L"bappiru2", L"𒋆", 558},
+    {L"baq", L"𒄷", 559},
+    {L"bar", L"𒁇", 560},
+    {L"bar11", L"𒌓", 569},
+    {L"bar12", L"𒂘", 570},
+    {L"bar12v1", L"𒂙", 571},
+    {L"bar2", L"𒁈", 561},
+    {L"bar3", L"𒁖", 562},
+    {L"bar4", L"𒍴", 563},
+    {L"bar5", L"𒋞", 564},
+    {L"bar6", L"𒌓", 565},
+    {L"bar7", L"𒉈", 566},
+    {L"bar8", L"𒂘", 567},
+    {L"bar8v1", L"𒂙", 568},
+    {L"bara", L"𒁇", 572},
+    {L"bara10", L"𒃖", 584},
+    {L"bara2L", L"𒁁", 574},
+    {L"bara2M", L"𒁈", 573},
+    {L"bara3L", L"𒇃", 576},
+    {L"bara3M", L"𒁖", 575},
+    {L"bara4", L"𒁁", 577},
+    {L"bara5L", L"𒁖", 579},
+    {L"bara5M", L"𒇃", 578},
+    {L"bara6", L"𒇙", 580},
+    {L"bara7", L"𒇋", 581},
+    {L"bara8", L"𒇣", 582},
+    {L"bara9", L"𒇗", 583},
+    {L"barag", L"𒁈", 585},
+    {L"barag2", L"𒁖", 586},
+    {L"barana", L"𒌓𒄒𒉣", 587},
+    {L"bargi", L"𒌐", 588},
+    {L"barun", L"𒇇", 589},
+    {L"bat", L"𒁁", 591},
+    {L"bat2", L"𒉻", 592},
+    {L"bat3", L"𒂦", 593},
+    {L"bat5", L"𒅆", 594},
+    {L"bata", L"𒁁", 595},
+    {L"batu", L"𒌍", 596},
+    {L"baš", L"𒈦", 590},
+    {L"baʾ", L"𒁁", 599},
+    {L"baḫ", L"𒄷", 506},
+    {L"baḫ2", L"𒋳", 507},
+    {L"baḫ3", L"𒈜", 508},
+    {L"baḫar", L"𒄞", 509},
+    {L"baḫar2", L"𒁃", 510},
+    {L"baḫar3", L"𒌋𒂔", 511},
+    {L"baḫar4", L"𒁇𒂔", 512},
+    {L"baḫar5", L"𒁃𒈾", 513},
+    {L"baṭ", L"𒁁", 597},
+    {L"baṭ2", L"𒉻", 598},
+    {L"be", L"𒁁", 603},
+    {L"be2", L"𒁉", 604},
+    {L"be3", L"𒉌", 605},
+    {L"be4", L"𒁀", 606},
+    {L"be5", L"𒆪", 607},
+    {L"be6", L"𒉿", 608},
+    {L"be7L", L"𒉋", 610},
+    {L"be7M", L"𒉈", 609},
+    {L"be8", L"𒉈", 611},
+    {L"bel", L"𒉈", 612},
+    {L"bel2", L"𒉋", 613},
+    {L"belili", L"𒀩", 614},
+    {L"ber", L"𒄵", 615},
+    {L"ber2", L"𒌓", 616},
+    {L"ber7", L"𒊯", 617},
+    {L"bet", L"𒂍", 619},
+    {L"betu2", L"𒂍", 620},
+    {L"beš12", L"𒌓", 618},
+    {L"bi", L"𒁉", 622},
+    {L"bi2", L"𒉈", 623},
+    {L"bi3", L"𒉿", 624},
+    {L"bi4", L"𒁁", 625},
+    {L"bi5", L"𒉋", 626},
+    {L"bi6", L"𒁀", 627},
+    {L"bi6v1", L"𒁀𒌑", 628},
+    {L"bi7", L"𒆪", 629},
+    {L"bi9", L"𒄴", 630},
+    {L"bibad", L"𒊻𒌉", 631},
+    {L"bibeL", L"𒊺𒄷𒌉𒄷", 633},
+    {L"bibeM", L"𒊻𒌉", 632},
+    {L"bibra", L"𒄾", 634},
+    {L"bibri", L"𒄾", 635},
+    {L"bid", L"𒂍", 636},
+    {L"bid2", L"𒁁", 637},
+    {L"bid3", L"𒆪", 638},
+    {L"big", L"𒋝", 639},
+    {L"bik", L"𒋝", 640},
+    {L"bil", L"𒉈", 641},
+    {L"bil2", L"𒉋", 642},
+    {L"bil3", L"𒄑𒉋", 643},
+    {L"bil4", L"𒄑𒉈", 644},
+    {L"billuda", L"𒉺𒀭", 645},
+    {L"billudu", L"𒉺𒀭", 646},
+    {L"bilti", L"𒄘𒌦", 647},
+    {L"biltu", L"𒄘𒌦", 648},
+    {L"biluda", L"𒉺𒀭", 649},
+    {L"bin", L"𒀳", 650},
+    {L"biq", L"𒋝", 651},
+    {L"bir", L"𒄵", 652},
+    {L"bir10", L"𒄊", 664},
+    {L"bir2", L"𒌓", 653},
+    {L"bir3", L"𒎕", 654},
+    {L"bir4", L"𒂔", 655},
+    {L"bir5", L"𒄷𒊺𒂟", 656},
+    {L"bir5v1", L"𒉆", 657},
+    {L"bir5v2", L"𒉆𒂟", 658},
+    {L"bir5v3", L"𒉅", 659},
+    {L"bir6", L"𒊶", 660},
+    {L"bir7", L"𒊯", 661},
+    {L"bir8", L"𒀀𒋤", 662},
+    {L"bir9", L"𒉈", 663},
+    {L"biri", L"𒄵", 665},
+    {L"bis2", L"𒄫", 666},
+    {L"bisag", L"𒂷", 667},
+    {L"bisag2", L"𒋃", 668},
+    {L"bisag3", L"𒋄", 669},
+    {L"bisan", L"𒂷", 670},
+    {L"bisan2", L"𒋃", 671},
+    {L"bisan3", L"𒋄", 672},
+    {L"bit", L"𒂍", 680},
+    {L"bit2", L"𒁁", 681},
+    {L"bit3", L"𒆪", 682},
+    {L"biti", L"𒂍", 683},
+    {L"biz", L"𒁉", 686},
+    {L"bizeg3", L"𒋄", 687},
+    {L"bizem3", L"𒋄", 688},
+    {L"biš", L"𒄫", 673},
+    {L"bišeba", L"𒈗", 674},
+    {L"bišeba2", L"𒀩", 675},
+    {L"bišeba3", L"𒄡", 676},
+    {L"bišebi", L"𒈗", 677},
+    {L"bišebi2", L"𒀩", 678},
+    {L"bišebi3", L"𒄡", 679},
+    {L"biṭ", L"𒂍", 684},
+    {L"biṭ2", L"𒁁", 685},
+    {L"bu", L"𒁍", 690},
+    {L"bu10", L"𒉽𒉽", 701},
+    {L"bu11L", L"𒁆", 704},
+    {L"bu11M", L"𒁀𒌑", 702},
+    {L"bu11Mv1", L"𒌑", 703},
+    {L"bu12", L"𒌋", 705},
+    {L"bu13L", L"𒁔", 707},
+    {L"bu13M", L"𒅮", 706},
+    {L"bu14", L"𒇡", 708},
+    {L"bu15", L"𒉻", 709},
+    {L"bu16", L"𒉌", 710},
+    {L"bu17", L"𒅗", 711},
+    {L"bu2", L"𒆜", 691},
+    {L"bu3", L"𒅤", 692},
+    {L"bu4", L"𒇥", 693},
+    {L"bu5", L"𒇥", 694},
+    {L"bu5v1", L"𒇧", 695},
+    {L"bu6", L"𒅤", 696},
+    {L"bu7", L"𒆪", 697},
+    {L"bu8L", L"𒌑", 699},
+    {L"bu8M", L"𒁔", 698},
+    {L"bu9", L"𒁑", 700},
+    {L"bubbu", L"𒇧𒇧", 712},
+    {L"bube", L"𒆯", 713},
+    {L"bug", L"𒈮", 714},
+    {L"bugin", L"𒆹", 715},
+    {L"bugin2", L"𒇅", 716},
+    {L"bugin3", L"𒇘", 717},
+    {L"bugin4", L"𒇦", 718},
+    {L"buk", L"𒈮", 720},
+    {L"bul", L"𒇧", 721},
+    {L"bul2", L"𒁔", 722},
+    {L"bul3", L"𒁄", 723},
+    {L"bul4", L"𒅮", 724},
+    {L"bul5", L"𒇡", 725},
+    {L"bula", L"𒆪𒉡", 726},
+    {L"bulug", L"𒁑", 727},
+    {L"bulug2", L"𒁔", 728},
+    {L"bulug3", L"𒉽𒉽", 729},
+    {L"bulug4L", L"𒉽𒊺𒉽", 731},
+    {L"bulug4M", L"𒉄", 730},
+    {L"bulug5L", L"𒊺𒉽𒉽", 734},
+    {L"bulug5M", L"𒁆", 732},
+    {L"bulug5Mv1", L"𒂀", 733},
+    {L"bulug6", L"𒋐", 735},
+    {L"bulug8", L"𒋌", 736},
+    {L"buluḫ", L"𒄬", 737},
+    {L"bum2", L"𒁆", 740},
+    {L"bum2v1", L"𒂀", 741},
+    {L"bum3", L"𒅗", 742},
+    {L"bumL", L"𒆃", 739},
+    {L"bumM", L"𒅤", 738},
+    {L"bun", L"𒇌", 743},
+    {L"bun2", L"𒅮", 744},
+    {L"bungu", L"𒍑𒂵", 745},
+    {L"bunin", L"𒆹", 746},
+    {L"bunin2", L"𒇅", 747},
+    {L"bunin3", L"𒇘", 748},
+    {L"bunin4", L"𒇦", 749},
+    {L"bur", L"𒁓", 750},
+    {L"bur10", L"𒇧", 763},
+    {L"bur11", L"𒆠𒂗𒆕", 764},
+    {L"bur12", L"𒁍", 765},
+    {L"bur13", L"𒉽𒉽", 766},
+    {L"bur14", L"𒂘", 767},
+    {L"bur14v1", L"𒂙", 768},
+    {L"bur2", L"𒁔", 751},
+    {L"bur3", L"𒌋", 752},
+    {L"bur4", L"𒋓𒁓", 753},
+    {L"bur5L", L"𒄷𒊺", 759},
+    {L"bur5M", L"𒄷𒊺𒂟", 754},
+    {L"bur5Mv1", L"𒄷𒂟", 755},
+    {L"bur5Mv2", L"𒉆", 756},
+    {L"bur5Mv3", L"𒉆𒂟", 757},
+    {L"bur5Mv4", L"𒉅", 758},
+    {L"bur6", L"𒆦", 760},
+    {L"bur6v1", L"𒆤", 761},
+    {L"bur8", L"𒄬", 762},
+    {L"buranun", L"𒌓𒄒𒉣", 769},
+    {L"buranuna", L"𒌓𒄒𒉣", 770},
+    {L"buru", L"𒁓", 771},
+    {L"buru11", L"𒆠𒂗𒆕", 787},
+    {L"buru14", L"𒂘", 788},
+    {L"buru14v1", L"𒂙", 789},
+    {L"buru15L", L"𒂘", 791},
+    {L"buru15Lv1", L"𒂙", 792},
+    {L"buru15M", L"𒋓𒅕", 790},
+    {L"buru16", L"𒇡", 793},
+    {L"buru2", L"𒁔", 772},
+    {L"buru3", L"𒌋", 773},
+    {L"buru4", L"𒋓𒁓", 774},
+    {L"buru5L", L"𒄷𒊺", 780},
+    {L"buru5M", L"𒄷𒊺𒂟", 775},
+    {L"buru5Mv1", L"𒄷𒂟", 776},
+    {L"buru5Mv2", L"𒉆", 777},
+    {L"buru5Mv3", L"𒉆𒂟", 778},
+    {L"buru5Mv4", L"𒉅", 779},
+    {L"buru6", L"𒆦", 781},
+    {L"buru6v1", L"𒆤", 782},
+    {L"buru7L", L"𒅄", 784},
+    {L"buru7M", L"𒄧", 783},
+    {L"buru8", L"𒄬", 785},
+    {L"buru9", L"𒅃", 786},
+    {L"burunun", L"𒌓𒄒𒉣", 795},
+    {L"buruḫ", L"𒄬", 794},
+    {L"bute", L"𒍠", 799},
+    {L"buti", L"𒍠", 800},
+    {L"butu", L"𒍠", 801},
+    {L"buzur", L"𒌋", 802},
+    {L"buzur2", L"𒎙", 803},
+    {L"buzur3", L"𒌋𒍠", 804},
+    {L"buzur4L", L"𒆃𒊭", 806},
+    {L"buzur4M", L"𒅤𒊭", 805},
+    {L"buzur5", L"𒅤", 807},
+    {L"buš", L"𒆜", 796},
+    {L"buš2L", L"𒉽𒄬", 798},
+    {L"buš2M", L"𒄫", 797},
+    {L"buḫ", L"𒈜", 719},
+    {L"d", L"𒀭", 809},
+    {L"da", L"𒁕", 826},
+    {L"da10", L"𒄭", 836},
+    {L"da11", L"𒅅", 837},
+    {L"da12", L"𒅗", 838},
+    {L"da13", L"𒋺", 839},
+    {L"da2", L"𒋫", 827},
+    {L"da2v1", L"𒋬", 828},
+    {L"da3", L"𒆕", 829},
+    {L"da4", L"𒁮", 830},
+    {L"da5", L"𒍏", 831},
+    {L"da6", L"𒋳", 832},
+    {L"da7", L"𒌓", 833},
+    {L"da8", L"𒁖", 834},
+    {L"da9", L"𒌣", 835},
+    {L"dab", L"𒁳", 840},
+    {L"dab2", L"𒋰", 841},
+    {L"dab3", L"𒄭", 842},
+    {L"dab4", L"𒁾", 843},
+    {L"dab5", L"𒆪", 844},
+    {L"dab6", L"𒍏", 845},
+    {L"daban", L"𒆯", 846},
+    {L"dabašin", L"𒆯", 847},
+    {L"dabda", L"𒅆𒅆", 848},
+    {L"dabda2", L"𒁁𒁁", 849},
+    {L"dabin", L"𒍥𒊺", 850},
+    {L"dabinv1", L"𒂠𒊺", 851},
+    {L"dad", L"𒋺", 852},
+    {L"dadag", L"𒌓𒌓", 853},
+    {L"dadrum", L"𒈘", 854},
+    {L"dag", L"𒁖", 855},
+    {L"dag2", L"𒌓", 856},
+    {L"dag3", L"𒍴", 857},
+    {L"dag4", L"𒆦", 858},
+    {L"dag5", L"𒅗", 859},
+    {L"dag6", L"𒋳", 860},
+    {L"dagal", L"𒂼", 861},
+    {L"dagala", L"𒂼", 862},
+    {L"dagan", L"𒆠𒍇", 863},
+    {L"daggan", L"𒆠𒍇", 864},
+    {L"dagrim", L"𒇑", 865},
+    {L"dagrinL", L"𒇦", 867},
+    {L"dagrinM", L"𒇑", 866},
+    {L"dak", L"𒁖", 870},
+    {L"dak3", L"𒍴", 871},
+    {L"dakan", L"𒆠𒍇", 872},
+    {L"dakkan", L"𒆠𒍇", 873},
+    {L"dal", L"𒊑", 874},
+    {L"dal2", L"𒈦𒄘𒃼", 875},
+    {L"dal3", L"𒀸", 876},
+    {L"dala2", L"𒅆𒆕", 879},
+    {L"dalaL", L"𒅆𒆕", 878},
+    {L"dalaM", L"𒊑", 877},
+    {L"dalla", L"𒈦𒄘𒃼", 887},
+    {L"dalḫamun", L"𒉎𒋖", 880},
+    {L"dalḫamun2", L"𒂛", 881},
+    {L"dalḫamun3", L"𒂛𒅐", 882},
+    {L"dalḫamun4", L"𒀱", 883},
+    {L"dalḫamun5", L"𒀰", 884},
+    {L"dalḫamun6", L"𒅐", 885},
+    {L"dalḫamun7", L"𒉃", 886},
+    {L"dam", L"𒁮", 888},
+    {L"dam2", L"𒌓", 889},
+    {L"dam3", L"𒌈", 890},
+    {L"dama", L"𒁮", 891},
+    {L"damal", L"𒂼", 892},
+    {L"damu2", L"𒅆", 895},
+    {L"damuL", L"𒀀𒌉", 894},
+    {L"damuM", L"𒌉", 893},
+    {L"dan", L"𒄨", 896},
+    {L"dan2", L"𒃞", 897},
+    {L"dan3L", L"𒃡", 899},
+    {L"dan3M", L"𒃩", 898},
+    {L"dan4", L"𒃋", 900},
+    {L"dan5", L"𒁷", 901},
+    {L"dan6", L"𒍕", 902},
+    {L"dan7", L"𒃃", 903},
+    {L"dana", L"𒆜𒁍", 904},
+    {L"dana2", L"𒆜", 905},
+    {L"dana3", L"𒄨", 906},
+    {L"danna", L"𒆜𒁍", 907},
+    {L"danna2", L"𒆜", 908},
+    {L"danna3", L"𒆜𒁍𒁕", 909},
+    {L"danzu", L"𒀭𒅎𒂂", 910},
+    {L"danzu2", L"𒀭𒅎𒈪", 911},
+    {L"danzud", L"𒀭𒅎𒂂", 912},
+    {L"danzud2", L"𒀭𒅎𒈪", 913},
+    {L"dap", L"𒁳", 914},
+    {L"dap2", L"𒋰", 915},
+    {L"dapa2", L"𒋰", 916},
+    {L"dapar", L"𒄞", 917},
+    {L"dapara2", L"𒇽𒂗", 918},
+    {L"dapara3", L"𒈔", 919},
+    {L"daq", L"𒁖", 920},
+    {L"daq3", L"𒍴", 921},
+    {L"daq6", L"𒋳", 922},
+    {L"dar", L"𒁯", 923},
+    {L"dar2", L"𒅁", 924},
+    {L"dar3", L"𒁰", 925},
+    {L"dar4", L"𒁱", 926},
+    {L"dar5", L"𒅊", 927},
+    {L"dar6", L"𒋻", 928},
+    {L"dara", L"𒁯", 929},
+    {L"dara2", L"𒅁", 930},
+    {L"dara3", L"𒁰", 931},
+    {L"dara4", L"𒁱", 932},
+    {L"dara5", L"𒄒", 933},
+    {L"darengal", L"𒌓𒉣", 934},
+    {L"dari", L"𒄒", 935},
+    {L"dari2", L"𒅁", 936},
+    {L"dari5", L"𒄒", 937},
+    {L"darri", L"𒁯", 938},
+    {L"daru", L"𒄒", 939},
+    {L"daru2", L"𒅁", 940},
+    {L"daru5", L"𒄒", 941},
+    {L"darum", L"𒅁", 942},
+    {L"darum2", L"𒅁", 943},
+    {L"das", L"𒌨", 944},
+    {L"dat", L"𒋺", 950},
+    {L"daš", L"𒌨", 945},
+    {L"daš2", L"𒁹", 946},
+    {L"daš3L", L"𒁯", 948},
+    {L"daš3M", L"𒀾", 947},
+    {L"daš4", L"𒁯", 949},
+    {L"daḫ", L"𒈭", 868},
+    {L"daḫ2", L"𒂃", 869},
+    {L"de", L"𒁲", 952},
+    {L"de2", L"𒌣", 953},
+    {L"de3", L"𒉈", 954},
+    {L"de4", L"𒋼", 955},
+    {L"de5", L"𒊑", 956},
+    {L"de6", L"𒁺", 957},
+    {L"de8", L"𒎗", 958},
+    {L"de9", L"𒋾", 959},
+    {L"del", L"𒀸", 967},
+    {L"del2", L"𒇺", 968},
+    {L"dele", L"𒀸", 969},
+    {L"dele4", L"𒀹", 970},
+    {L"delen", L"𒇌", 971},
+    {L"delen2", L"𒋗𒆸𒈾", 972},
+    {L"delena", L"𒇌", 973},
+    {L"delena2", L"𒋗𒆸𒈾", 974},
+    {L"dellu", L"𒈣𒈮", 975},
+    {L"delmun", L"𒉌𒌇", 976},
+    {L"delmunv1", L"𒊩𒄸", 977},
+    {L"delmunv2", L"𒊩𒌇", 978},
+    {L"delu", L"𒈣𒈮", 979},
+    {L"delur", L"𒈣𒈮", 980},
+    {L"dem2", L"𒁶", 981},
+    {L"dema", L"𒅗𒄭", 982},
+    {L"deme", L"𒉁", 983},
+    {L"deme2", L"𒉀", 984},
+    {L"demma", L"𒅗𒄭", 985},
+    {L"demmu", L"𒅗𒄭", 986},
+    {L"demu", L"𒅗𒄭", 987},
+    {L"den", L"𒁷", 988},
+    {L"der", L"𒋛𒀀", 989},
+    {L"dergul", L"𒈣𒈮", 990},
+    {L"determinatie", L"𒁹", 997},
+    {L"deš", L"𒁹", 991},
+    {L"deš2", L"𒀸", 992},
+    {L"deš3", L"𒌨", 993},
+    {L"deš4", L"𒈨", 994},
+    {L"deš5", L"𒀹", 995},
+    {L"deššu", L"𒀾", 996},
+    {L"deḫ", L"𒁾", 960},
+    {L"deḫ2", L"𒌝", 961},
+    {L"deḫ3", L"𒉏", 962},
+    {L"deḫi", L"𒁾", 963},
+    {L"deḫi2", L"𒌝", 964},
+    {L"deḫi3", L"𒉏", 965},
+    {L"deḫi4", L"𒁁", 966},
+    {L"di", L"𒁲", 998},
+    {L"di11", L"𒁴", 1007},
+    {L"di12", L"𒋼", 1008},
+    {L"di2", L"𒎗", 999},
+    {L"di3", L"𒋾", 1000},
+    {L"di4", L"𒌉", 1001},
+    {L"di5", L"𒊑", 1002},
+    {L"di6", L"𒁺", 1003},
+    {L"di7", L"𒉈", 1004},
+    {L"di8", L"𒌣", 1005},
+    {L"di9", L"𒅗", 1006},
+    {L"dib", L"𒁳", 1009},
+    {L"dib2", L"𒆪", 1010},
+    {L"dibi", L"𒁳", 1011},
+    {L"dibira", L"𒍏𒉄", 1012},
+    {L"dibur", L"𒀭", 1013},
+    {L"did", L"𒅎", 1014},
+    {L"did2", L"𒀭𒀀𒇉", 1015},
+    {L"dida", L"𒁉𒌑𒊓", 1016},
+    {L"dida2", L"𒁉𒍑𒊓", 1017},
+    {L"didala2", L"𒁉𒍑𒊓", 1020},
+    {L"didalaL", L"𒊷", 1019},
+    {L"didalaM", L"𒁉𒌑𒊓", 1018},
+    {L"didda", L"𒁉𒌑𒊓", 1021},
+    {L"didda2", L"𒁉𒍑𒊓", 1022},
+    {L"didi", L"𒌉𒌉", 1023},
+    {L"didlax", L"𒌉𒌉𒇲", 1024},
+    {L"didli", L"𒐀", 1025},
+    {L"didnu", L"𒊎", 1026},
+    {L"didnuv1", L"𒄊𒄊", 1027},
+    {L"didnuv2", L"𒊊𒊊", 1028},
+    {L"dig", L"𒉌", 1029},
+    {L"dig2", L"𒉽𒉽", 1030},
+    {L"digbir", L"𒆠𒉈𒀭𒈹", 1031},
+    {L"digi", L"𒉌", 1032},
+    {L"digi2", L"𒆪", 1033},
+    {L"digir", L"𒀭", 1034},
+    {L"dik", L"𒉌", 1041},
+    {L"dil", L"𒀸", 1042},
+    {L"dilen2", L"𒋗𒆸𒈾", 1043},
+    {L"dilena2", L"𒋗𒆸𒈾", 1044},
+    {L"dili", L"𒀸", 1045},
+    {L"dili2", L"𒇺", 1046},
+    {L"dili4", L"𒀹", 1047},
+    {L"dilib", L"𒋃", 1048},
+    {L"dilib2", L"𒆂", 1049},
+    {L"dilib3", L"𒊤", 1050},
+    {L"dilib3v1", L"𒊠", 1051},
+    {L"dilib4", L"𒊞", 1052},
+    {L"dilib5", L"𒊦", 1053},
+    {L"dilib6", L"𒊟", 1054},
+    {L"dilim2", L"𒇺", 1055},
+    {L"dilim3", L"𒇌", 1056},
+    {L"dilin", L"𒇌", 1057},
+    {L"dilina", L"𒇌", 1058},
+    {L"dilmun", L"𒉌𒌇", 1059},
+    {L"dilmunv1", L"𒊩𒄸", 1060},
+    {L"dilmunv2", L"𒊩𒌇", 1061},
+    {L"dilu", L"𒈣𒈮", 1062},
+    {L"dilur", L"𒈣𒈮", 1063},
+    {L"dim", L"𒁴", 1064},
+    {L"dim10", L"𒊐𒄰", 1079},
+    {L"dim11", L"𒈗𒄰", 1080},
+    {L"dim12", L"𒋃", 1081},
+    {L"dim13", L"𒁍", 1082},
+    {L"dim2", L"𒁶", 1065},
+    {L"dim3", L"𒊐𒃵", 1066},
+    {L"dim3v1", L"𒈚", 1067},
+    {L"dim3v2", L"𒈗𒄰", 1068},
+    {L"dim3v3", L"𒇽𒃵", 1069},
+    {L"dim3v4", L"𒈕", 1070},
+    {L"dim4", L"𒉽𒉽", 1071},
+    {L"dim5L", L"𒋻", 1074},
+    {L"dim5M", L"𒁆", 1072},
+    {L"dim5Mv1", L"𒂀", 1073},
+    {L"dim6", L"𒌣", 1075},
+    {L"dim7", L"𒁁", 1076},
+    {L"dim8", L"𒊐𒃶", 1077},
+    {L"dim9", L"𒈗𒃶", 1078},
+    {L"dima", L"𒅗𒄭", 1083},
+    {L"dimgul", L"𒈣𒈮", 1084},
+    {L"dimir", L"𒀭", 1085},
+    {L"dimma", L"𒅗𒄭", 1086},
+    {L"dimmu", L"𒅗𒄭", 1087},
+    {L"dimmuš", L"𒌑𒄑𒈪", 1088},
+    {L"dimna", L"𒌋𒂵", 1089},
+    {L"dimsar", L"𒅉", 1090},
+    {L"dimu", L"𒅗𒄭", 1091},
+    {L"dimuš", L"𒌑𒄑𒈪", 1092},
+    {L"din", L"𒁷", 1093},
+    {L"din2", L"𒄨", 1094},
+    {L"din3", L"𒁶", 1095},
+    {L"dingir", L"𒀭", 1096},
+    {L"dini", L"𒁷", 1097},
+    {L"dinig", L"𒆠𒉈", 1098},
+    {L"dinig2L", L"𒈨𒂗", 1101},
+    {L"dinig2M", L"𒇽𒈨𒂗", 1099},
+    {L"dinig2Mv1", L"𒈋", 1100},
+    {L"dinig3", L"𒇽𒆸", 1102},
+    {L"dinig3v1", L"𒈊", 1103},
+    {L"dip", L"𒁳", 1104},
+    {L"dipar", L"𒄞", 1105},
+    {L"diq", L"𒉌", 1106},
+    {L"dir", L"𒋛𒀀", 1107},
+    {L"dir2", L"𒁯", 1108},
+    {L"dir3", L"𒀭", 1109},
+    {L"dir4", L"𒌁", 1110},
+    {L"dirgul", L"𒈣𒈮", 1111},
+    {L"diri", L"𒋛𒀀", 1112},
+    {L"diri2", L"𒅁", 1113},
+    {L"dirig", L"𒋛𒀀", 1114},
+    {L"diskur", L"𒀬", 1115},
+    {L"dizkur", L"𒀬", 1119},
+    {L"diš", L"𒁹", 1116},
+    {L"diš2", L"𒀸", 1117},
+    {L"diš5", L"𒀹", 1118},
+    {L"diḫ", L"𒁾", 1035},
+    {L"diḫ2L", L"𒉏", 1037},
+    {L"diḫ2M", L"𒌝", 1036},
+    {L"diḫ3", L"𒉏", 1038},
+    {L"diḫiL", L"𒁁", 1040},
+    {L"diḫiM", L"𒁾", 1039},
+    {L"dnanna", L"𒀭𒋀𒆠", 1120},
+    {L"dnannar", L"𒀭𒋀𒆠", 1121},
+    {L"du", L"𒁺", 1122},
+    {L"du10", L"𒄭", 1131},
+    {L"du11", L"𒅗", 1132},
+    {L"du12", L"𒌇", 1133},
+    {L"du13", L"𒌉", 1134},
+    {L"du14", L"𒇽𒉈", 1135},
+    {L"du14v1", L"𒈌", 1136},
+    {L"du15", L"𒄰", 1137},
+    {L"du16", L"𒌗", 1138},
+    {L"du17", L"𒉈", 1139},
+    {L"du19", L"𒌣", 1140},
+    {L"du2", L"𒌅", 1123},
+    {L"du20", L"𒁕", 1141},
+    {L"du23", L"𒀀", 1142},
+    {L"du24", L"𒂄", 1143},
+    {L"du25", L"𒀲𒀴", 1144},
+    {L"du26", L"𒋛𒀀", 1145},
+    {L"du3", L"𒆕", 1124},
+    {L"du4", L"𒌈", 1125},
+    {L"du5", L"𒂅", 1126},
+    {L"du6", L"𒇯", 1127},
+    {L"du7", L"𒌌", 1128},
+    {L"du8", L"𒂃", 1129},
+    {L"du9", L"𒁔", 1130},
+    {L"dub", L"𒁾", 1146},
+    {L"dub2", L"𒂀", 1147},
+    {L"dub3", L"𒄭", 1148},
+    {L"duba", L"𒁾", 1149},
+    {L"dubad", L"𒆠𒄨", 1150},
+    {L"dubal", L"𒀥", 1151},
+    {L"dubal2", L"𒀦", 1152},
+    {L"dubal3", L"𒈅", 1153},
+    {L"dubal5", L"𒇾", 1154},
+    {L"dubal6", L"𒇽𒆠", 1155},
+    {L"dubal6v1", L"𒈈", 1156},
+    {L"dubba", L"𒁾", 1157},
+    {L"dubbin", L"𒌢", 1158},
+    {L"dubul", L"𒋗𒁍", 1159},
+    {L"dubur", L"𒄵", 1160},
+    {L"dubur2L", L"𒐬", 1162},
+    {L"dubur2Lv1", L"𒐭", 1163},
+    {L"dubur2M", L"𒄶", 1161},
+    {L"dud", L"𒉺𒍜", 1164},
+    {L"duda", L"𒉺𒍜", 1165},
+    {L"dudda", L"𒂃", 1166},
+    {L"duddu", L"𒌇𒌇", 1167},
+    {L"dug", L"𒂁", 1168},
+    {L"dug2", L"𒌇", 1169},
+    {L"dug3", L"𒄭", 1170},
+    {L"dug4", L"𒅗", 1171},
+    {L"dug5", L"𒂅", 1172},
+    {L"duggan", L"𒄵", 1173},
+    {L"dugina", L"𒂧", 1174},
+    {L"dugina2", L"𒂨", 1175},
+    {L"dugu", L"𒄭", 1176},
+    {L"dugud", L"𒂂", 1177},
+    {L"dugud2", L"𒈪", 1178},
+    {L"duk", L"𒂁", 1180},
+    {L"duk2", L"𒌇", 1181},
+    {L"dul", L"𒌋𒌆", 1182},
+    {L"dul10", L"𒁍", 1191},
+    {L"dul2", L"𒇥", 1183},
+    {L"dul3", L"𒊨", 1184},
+    {L"dul4", L"𒂈", 1185},
+    {L"dul5", L"𒌆", 1186},
+    {L"dul6", L"𒇯", 1187},
+    {L"dul7", L"𒊕", 1188},
+    {L"dul8", L"𒁳", 1189},
+    {L"dul9", L"𒌪", 1190},
+    {L"dulu", L"𒋗𒁍", 1192},
+    {L"dum", L"𒌈", 1193},
+    {L"dum3", L"𒁮", 1194},
+    {L"dum4", L"𒁴", 1195},
+    {L"dumgal", L"𒋇", 1196},
+    {L"dumu", L"𒌉", 1197},
+    {L"dun", L"𒂄", 1198},
+    {L"dun2", L"𒁷", 1199},
+    {L"dun3", L"𒂅", 1200},
+    {L"dun4", L"𒂈", 1201},
+    {L"dun5", L"𒁔", 1202},
+    {L"dun6", L"𒄨", 1203},
+    {L"dunga", L"𒊕", 1204},
+    {L"dunga2", L"𒈜", 1205},
+    {L"dunga3", L"𒀭𒊌", 1206},
+    {L"dunga3v1", L"𒊌", 1207},
+    {L"dungu", L"𒅎𒋛𒀀", 1208},
+    {L"dup", L"𒁾", 1209},
+    {L"dup2", L"𒂀", 1210},
+    {L"duq", L"𒂁", 1211},
+    {L"duq2", L"𒌇", 1212},
+    {L"dur", L"𒄙", 1213},
+    {L"dur10", L"𒊿", 1223},
+    {L"dur11", L"𒌅", 1224},
+    {L"dur2", L"𒂉", 1214},
+    {L"dur2v1", L"𒆪", 1215},
+    {L"dur3", L"𒀲𒀴", 1216},
+    {L"dur4", L"𒄒", 1217},
+    {L"dur5", L"𒀀", 1218},
+    {L"dur6", L"𒊿", 1219},
+    {L"dur7", L"𒁍", 1220},
+    {L"dur8", L"𒂦", 1221},
+    {L"dur9", L"𒂄", 1222},
+    {L"duran", L"𒄙𒄒", 1226},
+    {L"duraḫ", L"𒁰", 1225},
+    {L"durba", L"𒈢", 1227},
+    {L"durgul", L"𒈣𒈮", 1228},
+    {L"duri", L"𒋓", 1229},
+    {L"durix", L"𒆋", 1230},
+    {L"durku", L"𒈢", 1231},
+    {L"durme", L"𒊕𒂡", 1232},
+    {L"duru", L"𒄙", 1233},
+    {L"duru2", L"𒆪", 1235},
+    {L"duru4", L"𒄒", 1236},
+    {L"duru5", L"𒀀", 1237},
+    {L"duru6", L"𒉺", 1238},
+    {L"duru7", L"𒂍𒀀", 1239},
+    {L"duru9", L"𒂄", 1240},
+    {L"durum2", L"𒆪", 1241},
+    {L"durun", L"𒆪", 1242},
+    {L"durun3", L"𒋗𒆸𒈾", 1243},
+    {L"duruna", L"𒆪", 1244},
+    {L"duruna2", L"𒇌", 1245},
+    {L"duruna3", L"𒋗𒆸𒈾", 1246},
+    {L"duruv1", L"𒊕", 1234},
+    {L"dusi", L"𒅍", 1247},
+    {L"dusi2", L"𒀲𒅇", 1248},
+    {L"dussa2", L"𒀲𒅇", 1249},
+    {L"dussu", L"𒅍", 1250},
+    {L"dusu", L"𒅍", 1251},
+    {L"dusu2", L"𒀲𒅇", 1252},
+    {L"duttu", L"𒌇𒌇", 1256},
+    {L"duš", L"𒆪", 1253},
+    {L"duš2", L"𒁹", 1254},
+    {L"dušsu", L"𒅍", 1255},
+    {L"duḫ", L"𒂃", 1179},
+    {L"e", L"𒂊", 1258},
+    {L"e10", L"𒉄", 1282},
+    {L"e11", L"𒇯𒁺", 1283},
+    {L"e12", L"𒇯𒁽", 1284},
+    {L"e13", L"𒎐", 1285},
+    {L"e13v1", L"𒊩𒈠", 1286},
+    {L"e2", L"𒂍", 1266},
+    {L"e2ʾ", L"𒄴", 1267},
+    {L"e3", L"𒌓𒁺", 1268},
+    {L"e3ʾ", L"𒂍", 1269},
+    {L"e4", L"𒀀", 1270},
+    {L"e5", L"𒎏", 1273},
+    {L"e5v1", L"𒊩𒈠", 1274},
+    {L"e6L", L"𒋢𒋢", 1276},
+    {L"e6M", L"𒋣", 1275},
+    {L"e7", L"𒅗", 1279},
+    {L"e8", L"𒌓", 1280},
+    {L"e9", L"𒈪", 1281},
+    {L"ea", L"𒀀", 1298},
+    {L"eb", L"𒅁", 1299},
+    {L"eb2", L"𒌈", 1300},
+    {L"ebir", L"𒂁", 1303},
+    {L"ebir2", L"𒁉", 1304},
+    {L"ebir3", L"𒀀", 1305},
+    {L"ebir4", L"𒂵", 1306},
+    {L"ebiḫ", L"𒂗𒋾", 1301},
+    {L"ebiḫ2", L"𒂠𒈤", 1302},
+    {L"ebla", L"𒀀𒋻𒀀𒀭", 1307},
+    {L"ebur", L"𒂘", 1308},
+    {L"eburv1", L"𒂙", 1309},
+    {L"ed", L"𒀉", 1310},
+    {L"ed2", L"𒌓𒁺", 1311},
+    {L"ed3", L"𒇯𒁺", 1312},
+    {L"ed4", L"𒇯𒁽", 1313},
+    {L"edakua", L"𒂎", 1314},
+    {L"edakua2", L"𒆺", 1316},
+    {L"edakuav1", L"𒂸", 1315},
+    {L"edamu", L"𒀀𒌉", 1317},
+    {L"eden", L"𒂔", 1318},
+    {L"edi", L"𒃄", 1319},
+    {L"edim", L"𒁁", 1320},
+    {L"edin", L"𒂔", 1321},
+    {L"edur", L"𒀁", 1322},
+    {L"eduru", L"𒀁", 1323},
+    {L"eg", L"𒅅", 1324},
+    {L"eg2", L"𒂊", 1325},
+    {L"eg3", L"𒉘", 1326},
+    {L"ega", L"𒀀𒈪𒀀", 1327},
+    {L"ega2", L"𒉬", 1328},
+    {L"ega2v1", L"𒉧", 1329},
+    {L"egar", L"𒂍𒋞", 1330},
+    {L"egara", L"𒂏", 1331},
+    {L"egarav1", L"𒃌", 1332},
+    {L"ege", L"𒂠", 1333},
+    {L"ege2", L"𒊩𒂠", 1334},
+    {L"eger", L"𒂕", 1335},
+    {L"eger2", L"𒂠", 1336},
+    {L"eger3", L"𒊩𒂠", 1337},
+    {L"eger4", L"𒌈", 1338},
+    {L"eger5", L"𒈱", 1339},
+    {L"eger6", L"𒋞", 1340},
+    {L"egera", L"𒂕", 1341},
+    {L"egi", L"𒂠", 1342},
+    {L"egi2", L"𒊩𒂠", 1343},
+    {L"egia", L"𒃎", 1344},
+    {L"egir", L"𒂕", 1345},
+    {L"egir2", L"𒂠", 1346},
+    {L"egir3L", L"𒌈", 1348},
+    {L"egir3M", L"𒊩𒂠", 1347},
+    {L"egir4", L"𒌈", 1349},
+    {L"egir5", L"𒈱", 1350},
+    {L"egir6", L"𒋞", 1351},
+    {L"egira", L"𒂕", 1352},
+    {L"egu", L"𒀀𒆪", 1353},
+    {L"ek", L"𒅅", 1360},
+    {L"eki", L"𒂊", 1361},
+    {L"el", L"𒂖", 1362},
+    {L"el2", L"𒅋", 1363},
+    {L"el3", L"𒀭", 1364},
+    {L"ela", L"𒀀𒄨", 1365},
+    {L"elal", L"𒋄", 1366},
+    {L"elal2", L"𒋃", 1367},
+    {L"elam", L"𒉏", 1368},
+    {L"elamkuš", L"𒇌", 1369},
+    {L"elamkuš2", L"𒇖", 1370},
+    {L"elamkuš3", L"𒇈", 1371},
+    {L"elamkuš4", L"𒆹", 1372},
+    {L"elamu", L"𒉏", 1373},
+    {L"ele", L"𒌋𒅗", 1374},
+    {L"ele2", L"𒂖", 1375},
+    {L"eli", L"𒌋𒅗", 1376},
+    {L"elimmu", L"𒑆", 1377},
+    {L"ella2", L"𒆸", 1378},
+    {L"ellag", L"𒆸", 1379},
+    {L"ellag2", L"𒄵", 1380},
+    {L"ellamkuš", L"𒇌", 1381},
+    {L"ellamkuš2", L"𒇖", 1382},
+    {L"ellamkuš3", L"𒇈", 1383},
+    {L"ellamkuš4", L"𒆹", 1384},
+    {L"ellil", L"𒂗𒆤", 1385},
+    {L"em", L"𒅎", 1386},
+    {L"em3", L"𒉘", 1387},
+    {L"em4", L"𒅴", 1388},
+    {L"eme", L"𒅴", 1389},
+    {L"eme2", L"𒌝𒈨", 1390},
+    {L"eme2v1", L"𒎘", 1391},
+    {L"eme3", L"𒊩𒀲", 1392},
+    {L"eme4", L"𒂼", 1393},
+    {L"eme5L", L"𒊩𒂗𒀲", 1395},
+    {L"eme5M", L"𒊩𒄸", 1394},
+    {L"eme6", L"𒀲𒊩", 1396},
+    {L"eme7", L"𒊩𒀠", 1397},
+    {L"eme8", L"𒃣", 1398},
+    {L"emed2", L"𒌝𒈨𒁕", 1399},
+    {L"emeda", L"𒌝𒈨", 1400},
+    {L"emeda2", L"𒌝𒈨𒁕", 1401},
+    {L"emeda3", L"𒌟", 1402},
+    {L"emedu", L"𒂼𒌅", 1403},
+    {L"emedu2", L"𒂼𒀀𒌅", 1404},
+    {L"emedub", L"𒃆", 1405},
+    {L"emedub2", L"𒃧", 1406},
+    {L"emezi", L"𒊩𒇬", 1409},
+    {L"emeš", L"𒊩𒇬", 1407},
+    {L"emeš2", L"𒉊", 1408},
+    {L"emma", L"𒆉", 1410},
+    {L"emma2", L"𒅘", 1411},
+    {L"emmen", L"𒆉", 1412},
+    {L"emmen2", L"𒅘", 1413},
+    {L"emmin", L"𒆉", 1414},
+    {L"emmin2", L"𒅘", 1415},
+    {L"en", L"𒂗", 1416},
+    {L"en2", L"𒋙𒀭", 1417},
+    {L"en3", L"𒇷", 1418},
+    {L"en4", L"𒅗", 1419},
+    {L"en5", L"𒑐𒋼", 1420},
+    {L"en6", L"𒅔", 1421},
+    {L"en7", L"𒍠", 1422},
+    {L"en8", L"𒊭", 1423},
+    {L"enaqa", L"𒉎𒎎", 1424},
+    {L"enbir", L"𒈓", 1425},
+    {L"endib", L"𒂗𒈨𒈬", 1426},
+    {L"endibdim", L"𒄯", 1427},
+    {L"endub", L"𒂗𒈨𒈬", 1428},
+    {L"endur", L"𒉺", 1429},
+    {L"enegi", L"𒅎", 1430},
+    {L"enegi2", L"𒂗𒉭𒁶", 1431},
+    {L"enegi3", L"𒂗𒁶𒈨𒉭", 1432},
+    {L"enem", L"𒅗", 1433},
+    {L"engar", L"𒀳", 1434},
+    {L"engima", L"𒂗𒈨𒄀", 1435},
+    {L"engiz", L"𒂗𒈨𒄀", 1436},
+    {L"engiz2", L"𒂚𒄀", 1437},
+    {L"engur", L"𒇉", 1438},
+    {L"eni", L"𒂗", 1439},
+    {L"enigin", L"𒀀𒆸𒆸", 1440},
+    {L"enim", L"𒅗", 1441},
+    {L"enim2", L"𒉏", 1442},
+    {L"enkar", L"𒂘", 1443},
+    {L"enkara", L"𒂘", 1445},
+    {L"enkarav1", L"𒂙", 1446},
+    {L"enkarv1", L"𒂙", 1444},
+    {L"enku", L"𒍠𒄩", 1447},
+    {L"enkum", L"𒂗𒉽𒅊𒉣𒈨𒂬", 1448},
+    {L"enme", L"𒂚", 1449},
+    {L"enmen", L"𒆉", 1450},
+    {L"enmen2", L"𒅘", 1451},
+    {L"ennaL", L"𒎎𒇲𒅊", 1453},
+    {L"ennaM", L"𒎎𒂗", 1452},
+    {L"enni", L"𒅎", 1454},
+    {L"ennigi", L"𒅎", 1455},
+    {L"ennigi2", L"𒂗𒉭𒁶", 1456},
+    {L"ennigi3", L"𒂗𒁶𒈨𒉭", 1457},
+    {L"ennin", L"𒈹", 1458},
+    {L"ensi", L"𒂗𒈨𒇷", 1459},
+    {L"ensi2", L"𒑐𒋼𒋛", 1460},
+    {L"ensi3", L"𒂚𒇷", 1461},
+    {L"entemena", L"𒉉", 1464},
+    {L"enten", L"𒉉", 1465},
+    {L"entena", L"𒉉", 1466},
+    {L"enu", L"𒂗", 1467},
+    {L"enšada", L"𒉺𒌆", 1462},
+    {L"enšadu", L"𒉺𒌆", 1463},
+    {L"ep", L"𒅁", 1468},
+    {L"ep2", L"𒌈", 1469},
+    {L"epig", L"𒋝", 1470},
+    {L"epig2", L"𒂁", 1471},
+    {L"epir", L"𒂁", 1472},
+    {L"epir2", L"𒁉", 1473},
+    {L"epir3", L"𒀀", 1474},
+    {L"epir4", L"𒂵", 1475},
+    {L"eq", L"𒅅", 1476},
+    {L"er", L"𒅕", 1477},
+    {L"er10", L"𒁺", 1482},
+    {L"er13", L"𒎋", 1483},
+    {L"er13v1", L"𒈁", 1484},
+    {L"er2", L"𒀀𒅆", 1478},
+    {L"er3", L"𒀴", 1479},
+    {L"er4", L"𒌷", 1480},
+    {L"er6", L"𒀅", 1481},
+    {L"era", L"𒀴𒊏", 1485},
+    {L"era3", L"𒃞", 1486},
+    {L"era4", L"𒃢", 1487},
+    {L"erad", L"𒀴", 1488},
+    {L"erba", L"𒇹", 1489},
+    {L"erbav1", L"𒐂", 1490},
+    {L"erbura", L"𒉫", 1491},
+    {L"erem", L"𒂟", 1492},
+    {L"eren", L"𒂞", 1493},
+    {L"eren2", L"𒂟", 1494},
+    {L"erena", L"𒂞", 1495},
+    {L"ereš", L"𒎏", 1496},
+    {L"ereš2", L"𒉀", 1498},
+    {L"ereš3", L"𒅕", 1499},
+    {L"ereš4", L"𒀳", 1500},
+    {L"ereš5", L"𒃲𒀭𒍪", 1501},
+    {L"erešv1", L"𒊩𒈠", 1497},
+    {L"eri", L"𒌷", 1502},
+    {L"eri11", L"𒀔", 1506},
+    {L"eri12", L"𒀊", 1507},
+    {L"eri13", L"𒎋", 1508},
+    {L"eri13v1", L"𒈁", 1509},
+    {L"eri14", L"𒅕", 1510},
+    {L"eri15", L"𒃞", 1511},
+    {L"eri16", L"𒃢", 1512},
+    {L"eri3", L"𒀴", 1504},
+    {L"eri4", L"𒌷", 1505},
+    {L"erib", L"𒀿", 1513},
+    {L"eribura", L"𒉫", 1514},
+    {L"erida", L"𒉣", 1515},
+    {L"eridu", L"𒉣", 1516},
+    {L"eridug", L"𒉣", 1517},
+    {L"erim", L"𒂟", 1518},
+    {L"erim2", L"𒉈𒊒", 1519},
+    {L"erim3", L"𒌿", 1520},
+    {L"erim4", L"𒃫", 1521},
+    {L"erim5", L"𒀔", 1522},
+    {L"erim6", L"𒍍", 1523},
+    {L"erim7", L"𒌯", 1524},
+    {L"erin", L"𒂞", 1525},
+    {L"erin2", L"𒂟", 1526},
+    {L"erin3", L"𒌿", 1527},
+    {L"erin4", L"𒃫", 1528},
+    {L"erin5L", L"𒊷", 1530},
+    {L"erin5M", L"𒀔", 1529},
+    {L"erin6", L"𒍍", 1531},
+    {L"erin7", L"𒉈𒊒", 1532},
+    {L"erin9", L"𒌯", 1533},
+    {L"erina", L"𒂞", 1534},
+    {L"erina8", L"𒈷", 1535},
+    {L"eriv1", L"𒅕", 1503},
+    {L"eriš", L"𒎏", 1536},
+    {L"eriš2", L"𒉀", 1538},
+    {L"eriš4", L"𒀳", 1539},
+    {L"eriš6", L"𒄰", 1540},
+    {L"eriš7", L"𒆚", 1541},
+    {L"erišv1", L"𒊩𒈠", 1537},
+    {L"eru", L"𒀴", 1542},
+    {L"eru2", L"𒊕𒊩", 1543},
+    {L"eru3", L"𒊟", 1544},
+    {L"eru4", L"𒀀𒂔", 1545},
+    {L"eru5", L"𒂔", 1546},
+    {L"erua", L"𒀀𒂔", 1547},
+    {L"erua2", L"𒂔", 1548},
+    {L"erum", L"𒀴", 1549},
+    {L"erum2", L"𒊕𒊩", 1550},
+    {L"erum3", L"𒊟", 1551},
+    {L"erum4", L"𒀀𒂔", 1552},
+    {L"es", L"𒄑", 1553},
+    {L"es2", L"𒌍", 1554},
+    {L"es3", L"𒀊", 1555},
+    {L"es4", L"𒀾", 1556},
+    {L"es5", L"𒅖", 1557},
+    {L"esa", L"𒆳𒋾𒆠", 1558},
+    {L"esag", L"𒀈", 1559},
+    {L"esag2", L"𒂒", 1560},
+    {L"esag2v1", L"𒃥", 1561},
+    {L"esagtur", L"𒃦", 1562},
+    {L"eseš", L"𒀀𒅆", 1563},
+    {L"esi", L"𒄨", 1564},
+    {L"esibir", L"𒃊", 1565},
+    {L"esig", L"𒄨", 1566},
+    {L"esikilla", L"𒃈", 1567},
+    {L"esir", L"𒀀𒇒", 1568},
+    {L"esir2", L"𒇒", 1569},
+    {L"esir3", L"𒆒𒆒", 1570},
+    {L"esir3v1", L"𒆓𒆓", 1571},
+    {L"esir4", L"𒄃", 1572},
+    {L"esir5", L"𒄅", 1573},
+    {L"esirḫia", L"𒇓", 1574},
+    {L"essad", L"𒍠𒄩", 1575},
+    {L"essadu", L"𒀊𒄩𒍠𒃮𒄷", 1576},
+    {L"et", L"𒀉", 1642},
+    {L"etam", L"𒃫", 1643},
+    {L"ew", L"𒉿", 1645},
+    {L"ez", L"𒄑", 1646},
+    {L"ez2", L"𒌍", 1647},
+    {L"ez3", L"𒀊", 1648},
+    {L"ez5", L"𒅖", 1649},
+    {L"eze", L"𒁳", 1650},
+    {L"ezem", L"𒂡", 1651},
+    {L"ezen", L"𒂡", 1652},
+    {L"ezen4", L"𒍸", 1653},
+    {L"ezim2", L"𒊺𒌁", 1654},
+    {L"ezin", L"𒂡", 1655},
+    {L"ezin2", L"𒊺𒌁", 1656},
+    {L"ezina2", L"𒊺𒌁", 1657},
+    {L"ezina3", L"𒌁", 1658},
+    {L"ezinu", L"𒊺𒌁", 1659},
+    {L"ezinu2", L"𒊺𒌁", 1660},
+    {L"ezinu3", L"𒌁", 1661},
+    {L"eš", L"𒌍", 1579},
+    {L"eš10", L"𒀀", 1588},
+    {L"eš11", L"𒊑", 1589},
+    {L"eš12", L"𒉊", 1590},
+    {L"eš13", L"𒉉", 1591},
+    {L"eš14", L"𒂖", 1592},
+    {L"eš15", L"𒅖", 1593},
+    {L"eš16L", L"𒅖", 1596},
+    {L"eš16M", L"𒀼", 1594},
+    {L"eš16Mv1", L"𒐺", 1595},
+    {L"eš17", L"𒎌", 1597},
+    {L"eš18", L"𒀹", 1598},
+    {L"eš19", L"𒄑", 1599},
+    {L"eš2", L"𒂠", 1580},
+    {L"eš20", L"𒀸", 1600},
+    {L"eš21", L"𒐻", 1601},
+    {L"eš22", L"𒇵", 1602},
+    {L"eš23", L"𒀼", 1603},
+    {L"eš23v1", L"𒑋", 1604},
+    {L"eš3", L"𒀊", 1581},
+    {L"eš4", L"𒁹", 1582},
+    {L"eš5", L"𒐈", 1583},
+    {L"eš6", L"𒐁", 1584},
+    {L"eš7", L"𒑘", 1585},
+    {L"eš8", L"𒆜", 1586},
+    {L"eš9", L"𒀀𒅆", 1587},
+    {L"eša", L"𒀀𒌁", 1605},
+    {L"eša2", L"𒌍", 1606},
+    {L"ešda", L"𒋖𒄑", 1607},
+    {L"ešda2L", L"𒀊𒁮𒈠", 1609},
+    {L"ešda2M", L"𒋖𒄑𒆪", 1608},
+    {L"ešda3", L"𒋖", 1610},
+    {L"eše", L"𒌍", 1611},
+    {L"eše2", L"𒂠", 1612},
+    {L"eše3", L"𒑘", 1613},
+    {L"eše4", L"𒀀𒌁", 1614},
+    {L"ešemen", L"𒆠𒂊𒉈𒁲", 1615},
+    {L"ešemen2", L"𒆠𒂊𒉈𒁲𒀭𒈹", 1616},
+    {L"ešemen3", L"𒂠𒄾", 1617},
+    {L"ešemen4", L"𒀑", 1618},
+    {L"ešemen5", L"𒑙", 1619},
+    {L"ešemin", L"𒆠𒂊𒉈𒁲", 1620},
+    {L"ešemin2", L"𒆠𒂊𒉈𒁲𒀭𒈹", 1621},
+    {L"ešemin3L", L"𒂠𒄾𒂡𒊏", 1623},
+    {L"ešemin3M", L"𒂠𒄾", 1622},
+    {L"ešemin4", L"𒀑", 1624},
+    {L"ešemin5", L"𒑙", 1625},
+    {L"ešgal", L"𒀍", 1626},
+    {L"ešgar", L"𒀾𒃻", 1627},
+    {L"ešgiri", L"𒌋𒂘", 1628},
+    {L"eškiri", L"𒌋𒂘", 1629},
+    {L"ešlugL", L"𒊬𒄷", 1632},
+    {L"ešlugM", L"𒇽𒆸", 1630},
+    {L"ešlugMv1", L"𒈊", 1631},
+    {L"ešsad", L"𒍠𒄩", 1633},
+    {L"ešsadu", L"𒀊𒄩𒍠𒃮𒄷", 1634},
+    {L"eštub", L"𒄞", 1641},
+    {L"ešša2", L"𒄀", 1635},
+    {L"eššax", L"𒄀", 1636},
+    {L"eššaxv1", L"𒋙", 1637},
+    {L"eššeb", L"𒆠𒅁", 1638},
+    {L"eššu", L"𒀭", 1639},
+    {L"eššux", L"𒀭", 1640},
+    {L"eʾ", L"𒀪", 1662},
+    {L"eʾella", L"𒃈", 1663},
+    {L"eḫ", L"𒄴", 1354},
+    {L"eḫ2", L"𒀪", 1355},
+    {L"eḫ3", L"𒆪𒆪", 1356},
+    {L"eḫe", L"𒀉𒌓𒁺", 1357},
+    {L"eḫeḫḫe", L"𒆪𒆪𒆪", 1358},
+    {L"eḫi", L"𒀉𒌓𒁺", 1359},
+    {L"eṣ", L"𒄑", 1577},
+    {L"eṣ3", L"𒀊", 1578},
+    {L"eṭ", L"𒀉", 1644},
+    {L"f", L"𒊩", 2},
+    {L"ga", L"𒂵", 1683},
+    {L"ga11", L"𒄯", 1691},
+    {L"ga12", L"𒈪", 1692},
+    {L"ga14", L"𒅗", 1693},
+    {L"ga15", L"𒃮", 1694},
+    {L"ga2", L"𒂷", 1684},
+    {L"ga3", L"𒃷", 1685},
+    {L"ga4", L"𒃻", 1686},
+    {L"ga5", L"𒋡", 1687},
+    {L"ga6", L"𒅍", 1688},
+    {L"ga7", L"𒅅", 1689},
+    {L"ga8", L"𒄄", 1690},
+    {L"gab", L"𒃮", 1695},
+    {L"gab2", L"𒆏", 1696},
+    {L"gab3", L"𒅘", 1697},
+    {L"gaba", L"𒃮", 1698},
+    {L"gabar", L"𒑐𒁣", 1699},
+    {L"gaburra", L"𒃂", 1700},
+    {L"gad", L"𒃰", 1701},
+    {L"gada", L"𒃰", 1702},
+    {L"gadi", L"𒃄", 1703},
+    {L"gadibdim", L"𒄯", 1704},
+    {L"gadma", L"𒄞", 1705},
+    {L"gadu", L"𒃰", 1706},
+    {L"gadub", L"𒃆", 1707},
+    {L"gaeš", L"𒂵𒆜", 1708},
+    {L"gaeš2", L"𒆜𒂵", 1709},
+    {L"gag", L"𒆕", 1710},
+    {L"gagar", L"𒆠", 1712},
+    {L"gagax", L"𒉨", 1711},
+    {L"gagazu", L"𒃲𒍪", 1713},
+    {L"gaggu", L"𒉿", 1714},
+    {L"gagia", L"𒃎", 1715},
+    {L"gagig", L"𒂐", 1716},
+    {L"gagigv1", L"𒃟", 1717},
+    {L"gagim", L"𒈮", 1718},
+    {L"gagim2", L"𒄯", 1719},
+    {L"gagirsu", L"𒃐", 1720},
+    {L"gagri", L"𒄄", 1721},
+    {L"gaiš", L"𒂵𒆜", 1725},
+    {L"gaiš2", L"𒆜𒂵", 1726},
+    {L"gak", L"𒆕", 1727},
+    {L"gakim", L"𒈮", 1728},
+    {L"gakim2", L"𒄯", 1729},
+    {L"gakkul", L"𒌋𒁵", 1730},
+    {L"gakkul2", L"𒁵", 1731},
+    {L"gakkul3", L"𒌋𒁴", 1732},
+    {L"gal", L"𒃲", 1733},
+    {L"gal10", L"𒇽𒁹", 1740},
+    {L"gal2", L"𒅅", 1734},
+    {L"gal3", L"𒍇", 1735},
+    {L"gal4", L"𒊩", 1736},
+    {L"gal5", L"𒋼", 1737},
+    {L"gal8", L"𒌓", 1738},
+    {L"gal9", L"𒄨", 1739},
+    {L"gala10", L"𒇽𒁹", 1752},
+    {L"gala11", L"𒇂", 1753},
+    {L"gala2", L"𒊩𒆷", 1744},
+    {L"gala2v1", L"𒊩𒀠", 1745},
+    {L"gala3", L"𒇥", 1746},
+    {L"gala4", L"𒆽", 1747},
+    {L"gala5", L"𒇏", 1748},
+    {L"gala6L", L"𒇽𒋙", 1750},
+    {L"gala6M", L"𒋙", 1749},
+    {L"gala8", L"𒃲", 1751},
+    {L"galaL", L"𒃲", 1743},
+    {L"galaM", L"𒍑𒆪", 1741},
+    {L"galaMv1", L"𒍓", 1742},
+    {L"galam", L"𒃴", 1755},
+    {L"galax", L"𒀴𒆪", 1754},
+    {L"galga", L"𒂏", 1756},
+    {L"galgav1", L"𒃌", 1757},
+    {L"galgax", L"𒉨", 1758},
+    {L"galilla", L"𒃛", 1759},
+    {L"galla", L"𒋼𒇲", 1760},
+    {L"galla2", L"𒊩𒆷", 1761},
+    {L"gam", L"𒃵", 1762},
+    {L"gam2", L"𒄰", 1763},
+    {L"gam3", L"𒆛", 1764},
+    {L"gam4", L"𒃶", 1765},
+    {L"gam5", L"𒁁", 1766},
+    {L"gama2", L"𒄰", 1767},
+    {L"gamar", L"𒉌", 1768},
+    {L"gambiM", L"𒊩𒍑𒁲", 1769},
+    {L"gamme", L"𒊐", 1770},
+    {L"gammu", L"𒊩𒍑𒁲", 1771},
+    {L"gamu", L"𒊩𒍑𒁲", 1772},
+    {L"gamun2", L"𒌁", 1776},
+    {L"gamunL", L"𒁷𒌁𒊬", 1774},
+    {L"gamunLv1", L"𒁷𒌁𒆠", 1775},
+    {L"gamunM", L"𒁷𒌁", 1773},
+    {L"gan", L"𒃶", 1777},
+    {L"gan2", L"𒃷", 1778},
+    {L"gan3", L"𒁽", 1779},
+    {L"gan7", L"𒃵", 1780},
+    {L"gana", L"𒃶", 1781},
+    {L"gana2", L"𒃷", 1782},
+    {L"gana3L", L"𒁽𒀀", 1784},
+    {L"gana3M", L"𒁽", 1783},
+    {L"gana4", L"𒇇", 1785},
+    {L"gana5", L"𒇇", 1786},
+    {L"gana5v1", L"𒇆", 1787},
+    {L"gana6", L"𒁱", 1788},
+    {L"ganam4", L"𒇇", 1789},
+    {L"ganam5", L"𒇇", 1790},
+    {L"ganam5v1", L"𒇆", 1791},
+    {L"ganam6", L"𒁱", 1792},
+    {L"ganba", L"𒆠𒇴", 1793},
+    {L"ganmuš", L"𒋮", 1794},
+    {L"ganmuš2", L"𒋯", 1795},
+    {L"gansis", L"𒋯", 1796},
+    {L"gansisv1", L"𒋮", 1797},
+    {L"ganu", L"𒌋𒂘", 1798},
+    {L"ganun", L"𒃠", 1799},
+    {L"ganzer", L"𒅆𒆳𒍝", 1800},
+    {L"ganzer2", L"𒉈𒋛𒀀", 1801},
+    {L"ganzer3", L"𒅆𒆳", 1802},
+    {L"ganzerx", L"𒋯", 1803},
+    {L"ganzir", L"𒅆𒆳𒍝", 1804},
+    {L"ganzir2", L"𒉈𒋛𒀀", 1805},
+    {L"ganzir3", L"𒅆𒆳", 1806},
+    {L"ganzirx", L"𒋯", 1807},
+    {L"gap", L"𒃮", 1808},
+    {L"gap2", L"𒆏", 1809},
+    {L"gapi", L"𒂺", 1810},
+    {L"gar", L"𒃻", 1811},
+    {L"gar10L", L"𒂵𒉌", 1822},
+    {L"gar10M", L"𒂶", 1821},
+    {L"gar11L", L"𒂵𒀀", 1824},
+    {L"gar11M", L"𒂶", 1823},
+    {L"gar12L", L"𒂵𒁹", 1826},
+    {L"gar12M", L"𒂶", 1825},
+    {L"gar13L", L"𒋼", 1828},
+    {L"gar13M", L"𒋽", 1827},
+    {L"gar14", L"𒋼𒀀", 1829},
+    {L"gar16", L"𒊑", 1830},
+    {L"gar17", L"𒃵", 1831},
+    {L"gar19", L"𒃸", 1832},
+    {L"gar2L", L"𒊓𒉌", 1813},
+    {L"gar2M", L"𒂶", 1812},
+    {L"gar3", L"𒃼", 1814},
+    {L"gar4", L"𒄞", 1815},
+    {L"gar5", L"𒈖", 1816},
+    {L"gar6", L"𒉣", 1817},
+    {L"gar7", L"𒈥", 1818},
+    {L"gar8", L"𒋞", 1819},
+    {L"gar9", L"𒂵", 1820},
+    {L"gara", L"𒃻", 1833},
+    {L"gara10", L"𒂶", 1839},
+    {L"gara11", L"𒂶", 1840},
+    {L"gara12", L"𒂶", 1841},
+    {L"gara2", L"𒂶", 1834},
+    {L"gara3", L"𒃼", 1835},
+    {L"gara4", L"𒄞", 1836},
+    {L"gara6", L"𒉣", 1837},
+    {L"gara9", L"𒂵", 1838},
+    {L"garadin10", L"𒌎", 1851},
+    {L"garadin2", L"𒊼", 1844},
+    {L"garadin3", L"𒊽", 1845},
+    {L"garadin4", L"𒌃𒆸𒆸", 1846},
+    {L"garadin5", L"𒄀𒆸𒆸", 1847},
+    {L"garadin5v1", L"𒆸𒆸", 1848},
+    {L"garadin6", L"𒌃", 1849},
+    {L"garadin9", L"𒌏", 1850},
+    {L"garadinA", L"𒊺𒁓", 1843},
+    {L"garadinM", L"𒌄", 1842},
+    {L"garak", L"𒃸", 1852},
+    {L"garak2", L"𒆽", 1853},
+    {L"garak3", L"𒇥", 1854},
+    {L"garak4", L"𒇏", 1855},
+    {L"garak5", L"𒃻", 1856},
+    {L"garaš2", L"𒆠𒄨𒁁", 1859},
+    {L"garaš2v1", L"𒆠𒆘", 1860},
+    {L"garaš3", L"𒂵𒆜", 1861},
+    {L"garaš4", L"𒆜𒂵", 1862},
+    {L"garaš5", L"𒆠𒄨", 1863},
+    {L"garašL", L"𒃉", 1858},
+    {L"garašM", L"𒃕", 1857},
+    {L"garig", L"𒍮", 1864},
+    {L"garig2", L"𒊪", 1865},
+    {L"garim2", L"𒁘", 1868},
+    {L"garimL", L"𒇉", 1867},
+    {L"garimM", L"𒇑", 1866},
+    {L"garin", L"𒇑", 1869},
+    {L"garsuL", L"𒉺𒋢", 1871},
+    {L"garsuM", L"𒉺𒀭", 1870},
+    {L"garu", L"𒌔", 1872},
+    {L"garza2", L"𒉺𒈗", 1875},
+    {L"garzaL", L"𒉺𒈗", 1874},
+    {L"garzaM", L"𒉺𒀭", 1873},
+    {L"garzu", L"𒉺𒀭", 1876},
+    {L"garzu2", L"𒉺𒈗", 1877},
+    {L"gas", L"𒄤", 1878},
+    {L"gas2", L"𒄣", 1879},
+    {L"gasa", L"𒅪", 1880},
+    {L"gasibir", L"𒃊", 1881},
+    {L"gasikilla", L"𒃈", 1882},
+    {L"gasis", L"𒋯", 1883},
+    {L"gasisv1", L"𒋮", 1884},
+    {L"gat", L"𒃰", 1891},
+    {L"gat2", L"𒆐", 1892},
+    {L"gat3", L"𒆑", 1893},
+    {L"gaz", L"𒄤", 1895},
+    {L"gaz2", L"𒄣", 1896},
+    {L"gaz3", L"𒍶", 1897},
+    {L"gaza", L"𒄤", 1898},
+    {L"gaza2", L"𒅪", 1899},
+    {L"gazag", L"𒃜", 1900},
+    {L"gazi", L"𒃢", 1901},
+    {L"gazi2L", L"𒃢", 1904},
+    {L"gazi2M", L"𒃨", 1903},
+    {L"gazi3", L"𒃤", 1905},
+    {L"gazibuL", L"𒄑𒁍", 1907},
+    {L"gazibuM", L"𒁍", 1906},
+    {L"gazigal", L"𒂾", 1908},
+    {L"gazinbi", L"𒄑𒁍", 1909},
+    {L"gazinbiv1", L"𒁍", 1910},
+    {L"gazinbuL", L"𒄑𒁍", 1912},
+    {L"gazinbuM", L"𒁍", 1911},
+    {L"gaziv1", L"𒍺", 1902},
+    {L"gaš", L"𒁉", 1886},
+    {L"gašam", L"𒉣𒈨𒋳", 1887},
+    {L"gašan", L"𒃽", 1888},
+    {L"gašmu", L"𒂛𒅐", 1889},
+    {L"gaššu", L"𒉣𒈨𒋳", 1890},
+    {L"gaʾazag", L"𒃜", 1913},
+    {L"gaʾeš", L"𒂵𒆜", 1914},
+    {L"gaʾiš", L"𒂵𒆜", 1915},
+    {L"gaḫalla", L"𒃓", 1722},
+    {L"gaḫili", L"𒃔", 1723},
+    {L"gaḫurin", L"𒇩", 1724},
+    {L"gaṣ", L"𒄤", 1885},
+    {L"gaṭ", L"𒃰", 1894},
+    {L"ge", L"𒄀", 1916},
+    {L"ge10", L"𒉋", 1925},
+    {L"ge11", L"𒂆", 1926},
+    {L"ge12", L"𒊩𒆳", 1927},
+    {L"ge13", L"𒁺", 1928},
+    {L"ge14", L"𒌋", 1929},
+    {L"ge15", L"𒀸", 1930},
+    {L"ge16", L"𒄃", 1931},
+    {L"ge17", L"𒍼", 1932},
+    {L"ge18", L"𒁶", 1933},
+    {L"ge19", L"𒎔", 1934},
+    {L"ge19v1", L"𒉾", 1935},
+    {L"ge2", L"𒆤", 1917},
+    {L"ge20", L"𒂵", 1936},
+    {L"ge21", L"𒆳", 1937},
+    {L"ge22L", L"𒀹", 1939},
+    {L"ge22M", L"𒍻", 1938},
+    {L"ge23L", L"𒍻", 1941},
+    {L"ge23M", L"𒀹", 1940},
+    {L"ge24", L"𒀵", 1942},
+    {L"ge25", L"𒍣", 1943},
+    {L"ge26", L"𒂷", 1944},
+    {L"ge28", L"𒁨", 1945},
+    {L"ge3", L"𒁹", 1918},
+    {L"ge4", L"𒄄", 1919},
+    {L"ge5", L"𒆠", 1920},
+    {L"ge6", L"𒈪", 1921},
+    {L"ge7", L"𒂠", 1922},
+    {L"ge8", L"𒅆", 1923},
+    {L"ge9", L"𒉈", 1924},
+    {L"gel", L"𒄃", 1946},
+    {L"gel2", L"𒆸", 1947},
+    {L"gel5", L"𒃲", 1948},
+    {L"gele3", L"𒅲", 1949},
+    {L"geli3", L"𒅲", 1950},
+    {L"geltan", L"𒉿", 1951},
+    {L"gem", L"𒁶", 1952},
+    {L"gem3", L"𒊩𒆳", 1953},
+    {L"geme", L"𒊩", 1954},
+    {L"geme2", L"𒊩𒆳", 1955},
+    {L"geme3", L"𒀵", 1956},
+    {L"gen", L"𒁺", 1957},
+    {L"gen3", L"𒆳", 1958},
+    {L"gen7", L"𒁶", 1959},
+    {L"gena", L"𒌉𒁹", 1960},
+    {L"gene", L"𒆠𒉈", 1961},
+    {L"genna", L"𒌉𒁹", 1962},
+    {L"ger", L"𒄫", 1963},
+    {L"ger15", L"𒂠", 1966},
+    {L"ger2", L"𒄈", 1964},
+    {L"ger3", L"𒄊", 1965},
+    {L"gereš", L"𒄵", 1967},
+    {L"gereš2", L"𒄨", 1968},
+    {L"gereš3", L"𒀵", 1969},
+    {L"gez", L"𒄑", 2007},
+    {L"geš", L"𒄑", 1970},
+    {L"geš2", L"𒐕", 1971},
+    {L"geš3", L"𒍑", 1972},
+    {L"geš4", L"𒀸", 1973},
+    {L"gešaš", L"𒐚", 1974},
+    {L"gešba", L"𒄑𒊒", 1975},
+    {L"gešbu", L"𒄑𒊒", 1976},
+    {L"gešbu2", L"𒋗𒉽𒉽", 1977},
+    {L"gešdu", L"𒉿", 1978},
+    {L"gešdu2", L"𒄑𒌆𒉿", 1979},
+    {L"gešdu3", L"𒄑𒉿𒌆", 1980},
+    {L"gešdu4", L"𒅆𒁺", 1981},
+    {L"gešia", L"𒐙", 1985},
+    {L"gešilimmu", L"𒐝", 1986},
+    {L"geškad", L"𒆓", 1987},
+    {L"gešnimbar", L"𒊷", 1988},
+    {L"gešnu", L"𒋓𒄑", 1989},
+    {L"gešnu2", L"𒋓𒅕", 1990},
+    {L"gešpa", L"𒄑𒊒", 1991},
+    {L"gešpu", L"𒄑𒊒", 1992},
+    {L"gešpu2", L"𒋗𒉽𒉽", 1993},
+    {L"gešta", L"𒐕", 1996},
+    {L"geštin", L"𒃾", 1997},
+    {L"geštu", L"𒉿", 1998},
+    {L"geštu2", L"𒄑𒌆𒉿", 1999},
+    {L"geštu3", L"𒄑𒉿𒌆", 2000},
+    {L"geštu4", L"𒅆𒁺", 2001},
+    {L"geštug", L"𒉿", 2002},
+    {L"geštug2", L"𒄑𒌆𒉿", 2003},
+    {L"geštug3", L"𒄑𒉿𒌆", 2004},
+    {L"gešumun", L"𒐛", 2005},
+    {L"gešussu", L"𒐜", 2006},
+    {L"geššir", L"𒂘", 1994},
+    {L"gešširv1", L"𒂙", 1995},
+    {L"gešḫar", L"𒄓", 1982},
+    {L"gešḫur", L"𒆒", 1983},
+    {L"gešḫurv1", L"𒆓", 1984},
+    {L"gi", L"𒄀", 2008},
+    {L"gi10", L"𒉋", 2017},
+    {L"gi11", L"𒂆", 2018},
+    {L"gi12", L"𒊩𒆳", 2019},
+    {L"gi16", L"𒄃", 2020},
+    {L"gi17", L"𒍼", 2021},
+    {L"gi18", L"𒁶", 2022},
+    {L"gi2", L"𒆤", 2009},
+    {L"gi25", L"𒂂", 2023},
+    {L"gi27L", L"𒍏", 2025},
+    {L"gi27M", L"𒁍", 2024},
+    {L"gi3", L"𒁹", 2010},
+    {L"gi4", L"𒄄", 2011},
+    {L"gi5", L"𒆠", 2012},
+    {L"gi6", L"𒈪", 2013},
+    {L"gi7", L"𒂠", 2014},
+    {L"gi8", L"𒅆", 2015},
+    {L"gi9", L"𒉈", 2016},
+    {L"gib", L"𒄃", 2026},
+    {L"gib2", L"𒄒", 2027},
+    {L"gib3", L"𒍼", 2028},
+    {L"gibil", L"𒉋", 2029},
+    {L"gibil2", L"𒋙𒀾", 2030},
+    {L"gibil3", L"𒆠𒉈", 2031},
+    {L"gibil4", L"𒉈", 2032},
+    {L"gibil5", L"𒃴𒃴", 2033},
+    {L"gibil6", L"𒉈𒄀", 2034},
+    {L"gibil7", L"𒋙𒀭", 2035},
+    {L"gibila", L"𒉋", 2036},
+    {L"gibir", L"𒋙𒀾", 2037},
+    {L"gibir2", L"𒋙𒀭", 2038},
+    {L"giburu", L"𒌋", 2039},
+    {L"giburum", L"𒌋", 2040},
+    {L"gid", L"𒆤", 2041},
+    {L"gid2", L"𒁍", 2042},
+    {L"gid3", L"𒊓", 2043},
+    {L"gid4", L"𒃰", 2044},
+    {L"gid6", L"𒋺", 2045},
+    {L"gidešta", L"𒃻𒑚𒋡", 2046},
+    {L"gideštav1", L"𒃻𒑛𒋡", 2047},
+    {L"gideštav2", L"𒃻𒑜𒋡", 2048},
+    {L"gidi3L", L"𒄑𒁍", 2050},
+    {L"gidi3M", L"𒁍", 2049},
+    {L"gidi5", L"𒋤", 2051},
+    {L"gidi6L", L"𒌓𒃶", 2053},
+    {L"gidi6M", L"𒃶", 2052},
+    {L"gidim", L"𒄇", 2054},
+    {L"gidim2", L"𒈦𒌋", 2055},
+    {L"gidim3L", L"𒄑𒁍", 2057},
+    {L"gidim3M", L"𒁍", 2056},
+    {L"gidim4", L"𒌜", 2058},
+    {L"gidim7", L"𒄞", 2059},
+    {L"gidlam", L"𒊩𒍑𒁮", 2060},
+    {L"gidlam2", L"𒍑𒁮", 2061},
+    {L"gidlam3", L"𒍑𒊩𒁮", 2062},
+    {L"gidlam4", L"𒊩𒍑", 2063},
+    {L"gidri", L"𒉺", 2064},
+    {L"gidru", L"𒉺", 2065},
+    {L"gig", L"𒍼", 2066},
+    {L"gig2", L"𒈪", 2067},
+    {L"gig3", L"𒄃", 2068},
+    {L"gig4", L"𒂆", 2069},
+    {L"gigam", L"𒈒", 2070},
+    {L"gigamv1", L"𒇽𒇽", 2071},
+    {L"gigi", L"𒄅", 2072},
+    {L"gigi2", L"𒈪", 2074},
+    {L"gigir", L"𒇀", 2075},
+    {L"gigir2", L"𒇥", 2076},
+    {L"gigir3", L"𒇕", 2077},
+    {L"gigir4", L"𒇯𒁺", 2078},
+    {L"gigiv1", L"𒄆", 2073},
+    {L"gigri", L"𒁼𒁼", 2079},
+    {L"gigri2", L"𒁽𒁽", 2080},
+    {L"giguru", L"𒌋", 2081},
+    {L"giguru2", L"𒈦𒌋", 2082},
+    {L"giguru3", L"𒆂", 2083},
+    {L"gik", L"𒍼", 2084},
+    {L"gikki", L"𒈪", 2085},
+    {L"gil", L"𒄃", 2086},
+    {L"gil2", L"𒆸", 2087},
+    {L"gil3", L"𒅍", 2088},
+    {L"gilal", L"𒄈𒇲", 2089},
+    {L"gilgames", L"𒄑𒂆𒈦", 2090},
+    {L"gilgames2", L"𒄑𒉋𒂵𒈩", 2091},
+    {L"gilgames3", L"𒄑𒉈𒂵𒈩", 2092},
+    {L"gilgameš", L"𒄑𒂆𒈦", 2093},
+    {L"gilgameš2", L"𒄑𒉋𒂵𒈩", 2094},
+    {L"gilgameš3", L"𒄑𒉈𒂵𒈩", 2095},
+    {L"gili2", L"𒆸", 2096},
+    {L"gili3", L"𒅲", 2097},
+    {L"gili4L", L"𒆸", 2099},
+    {L"gili4M", L"𒅽", 2098},
+    {L"gilib4", L"𒅽", 2100},
+    {L"gilili", L"𒎔", 2101},
+    {L"gililiv1", L"𒉾", 2102},
+    {L"gilim", L"𒄃", 2103},
+    {L"gilim2", L"𒎔", 2104},
+    {L"gilim2v1", L"𒉾", 2105},
+    {L"gillim", L"𒄃", 2106},
+    {L"gilugu", L"𒇉", 2107},
+    {L"gim", L"𒁶", 2108},
+    {L"gim2", L"𒂆", 2109},
+    {L"gim3", L"𒊩𒆳", 2110},
+    {L"gim4", L"𒁽", 2111},
+    {L"gim5", L"𒁼", 2112},
+    {L"gim6", L"𒁺", 2113},
+    {L"gim7", L"𒁍", 2114},
+    {L"gim8", L"𒃰𒋺𒄑", 2115},
+    {L"gimi", L"𒁶", 2116},
+    {L"gin", L"𒁺", 2117},
+    {L"gin2", L"𒂆", 2118},
+    {L"gin3", L"𒆳", 2119},
+    {L"gin4L", L"𒌑𒍤𒆸", 2121},
+    {L"gin4M", L"𒍤𒆸", 2120},
+    {L"gin5", L"𒊩𒆳", 2122},
+    {L"gin6L", L"𒍏", 2124},
+    {L"gin6M", L"𒄀", 2123},
+    {L"gin7L", L"𒄀", 2126},
+    {L"gin7M", L"𒁶", 2125},
+    {L"gin8", L"𒄯", 2127},
+    {L"gina", L"𒌉𒁹", 2128},
+    {L"gina3", L"𒆳", 2129},
+    {L"ginan", L"𒌉𒁹", 2130},
+    {L"gingira", L"𒆩", 2131},
+    {L"ginna", L"𒌉𒁹", 2132},
+    {L"gip2", L"𒄒", 2133},
+    {L"giq", L"𒍼", 2134},
+    {L"gir", L"𒄫", 2135},
+    {L"gir10", L"𒉈", 2144},
+    {L"gir11", L"𒂡", 2145},
+    {L"gir12", L"𒅔", 2146},
+    {L"gir13", L"𒋃", 2147},
+    {L"gir14", L"𒄩", 2148},
+    {L"gir15", L"𒂠", 2149},
+    {L"gir16", L"𒄌", 2150},
+    {L"gir17", L"𒅗", 2151},
+    {L"gir2", L"𒄈", 2136},
+    {L"gir3", L"𒄊", 2137},
+    {L"gir4", L"𒌋𒀜", 2138},
+    {L"gir5", L"𒁽", 2139},
+    {L"gir6", L"𒁼", 2140},
+    {L"gir7", L"𒁺", 2141},
+    {L"gir8", L"𒆸", 2142},
+    {L"gir9", L"𒀚", 2143},
+    {L"gira", L"𒌋𒈦𒆏", 2152},
+    {L"gira2", L"𒄑𒁇", 2153},
+    {L"gira3", L"𒉈𒄀", 2154},
+    {L"girag", L"𒆸", 2155},
+    {L"giraḫ", L"𒋗𒁶", 2156},
+    {L"gireš", L"𒄵", 2157},
+    {L"gireš2", L"𒄨", 2158},
+    {L"gireš3", L"𒀵", 2159},
+    {L"giri", L"𒄫", 2160},
+    {L"giri11", L"𒂡", 2166},
+    {L"giri16", L"𒄌", 2167},
+    {L"giri17", L"𒅗", 2168},
+    {L"giri19", L"𒋗𒇽", 2169},
+    {L"giri2", L"𒄈", 2161},
+    {L"giri20", L"𒋗𒀭", 2170},
+    {L"giri21", L"𒋗𒈗", 2171},
+    {L"giri3", L"𒄊", 2162},
+    {L"giri5", L"𒁽", 2163},
+    {L"giri6", L"𒁼", 2164},
+    {L"giri8", L"𒆸", 2165},
+    {L"girim", L"𒆸", 2172},
+    {L"girim2", L"𒁽", 2173},
+    {L"girim3", L"𒀀𒄩𒋻𒁺", 2174},
+    {L"girima3", L"𒀀𒄩𒋻𒁺", 2175},
+    {L"girimma3", L"𒀀𒄩𒋻𒁺", 2176},
+    {L"girin", L"𒆸", 2177},
+    {L"giriš", L"𒄵", 2178},
+    {L"giriš2", L"𒄨", 2179},
+    {L"giriš3", L"𒀵", 2180},
+    {L"giru3", L"𒄊", 2181},
+    {L"girum", L"𒃵", 2182},
+    {L"girza2", L"𒉺𒈗", 2183},
+    {L"gis", L"𒄑", 2184},
+    {L"gisal", L"𒄐", 2185},
+    {L"gisgal", L"𒍇", 2186},
+    {L"giskim", L"𒅆𒁾", 2187},
+    {L"gissu", L"𒄑𒈪", 2188},
+    {L"git", L"𒆤", 2215},
+    {L"git2", L"𒁍", 2216},
+    {L"gitlam2L", L"𒍑𒊩𒁮", 2220},
+    {L"gitlam2M", L"𒍑𒁮", 2219},
+    {L"gitlam3", L"𒍑𒊩𒁮", 2221},
+    {L"gitlam4", L"𒊩𒍑", 2222},
+    {L"gitlamL", L"𒍑𒁮", 2218},
+    {L"gitlamM", L"𒊩𒍑𒁮", 2217},
+    {L"giz", L"𒄑", 2225},
+    {L"gizal", L"𒄐", 2226},
+    {L"gizal2", L"𒄑𒌆𒉿𒋓𒋡", 2227},
+    {L"gizal2v1", L"𒄑𒌆𒉿𒋔𒋡", 2228},
+    {L"gizal3", L"𒋔𒋡", 2229},
+    {L"gizkim", L"𒅆𒁾", 2230},
+    {L"gizzal2", L"𒋔𒋡", 2234},
+    {L"gizzalL", L"𒎙𒉌", 2233},
+    {L"gizzalM", L"𒄑𒌆𒉿𒋓𒋡", 2231},
+    {L"gizzalMv1", L"𒄑𒌆𒉿𒋔𒋡", 2232},
+    {L"gizzu", L"𒄑𒈪", 2235},
+    {L"giš", L"𒄑", 2190},
+    {L"giš2", L"𒐕", 2191},
+    {L"giš3", L"𒍑", 2192},
+    {L"gišbar", L"𒀣", 2193},
+    {L"gišbun", L"𒆠𒁉𒃻", 2194},
+    {L"gišgal", L"𒍇", 2195},
+    {L"gišimmar", L"𒊷", 2201},
+    {L"giškad", L"𒆓", 2202},
+    {L"giškim", L"𒅆𒁾", 2203},
+    {L"gišmaš", L"𒀣", 2204},
+    {L"gišnimbar", L"𒊷", 2205},
+    {L"gišnu", L"𒋓𒄑", 2206},
+    {L"gišnu2", L"𒋓𒅕", 2207},
+    {L"gištaʾe", L"𒍟", 2210},
+    {L"gištaʾe2", L"𒍝𒆳", 2211},
+    {L"gištaʾi", L"𒍟", 2212},
+    {L"gištaʾi2", L"𒍝𒆳", 2213},
+    {L"gišturu", L"𒉺", 2214},
+    {L"giššir", L"𒂘", 2208},
+    {L"gišširv1", L"𒂙", 2209},
+    {L"gišḫar2", L"𒄓", 2198},
+    {L"gišḫarL", L"𒆒", 2197},
+    {L"gišḫarM", L"𒄓", 2196},
+    {L"gišḫur", L"𒆒", 2199},
+    {L"gišḫurv1", L"𒆓", 2200},
+    {L"giṣ", L"𒄑", 2189},
+    {L"giṭ", L"𒆤", 2223},
+    {L"giṭ2", L"𒁍", 2224},
+    {L"gu", L"𒄖", 2236},
+    {L"gu10", L"𒈬", 2245},
+    {L"gu11", L"𒂵", 2246},
+    {L"gu13", L"𒄯", 2247},
+    {L"gu14", L"𒆠", 2248},
+    {L"gu15", L"𒈝", 2249},
+    {L"gu16", L"𒆍", 2250},
+    {L"gu2", L"𒄘", 2237},
+    {L"gu3", L"𒅗", 2238},
+    {L"gu4", L"𒄞", 2239},
+    {L"gu5", L"𒆪", 2240},
+    {L"gu6", L"𒅘", 2241},
+    {L"gu7", L"𒅥", 2242},
+    {L"gu8", L"𒄣", 2243},
+    {L"gu9", L"𒆰", 2244},
+    {L"guana", L"𒍛", 2251},
+    {L"gub", L"𒁺", 2252},
+    {L"gub2", L"𒇷", 2253},
+    {L"gub3", L"𒆏", 2254},
+    {L"gub4", L"𒉌", 2255},
+    {L"gub5", L"𒀜𒆤", 2256},
+    {L"guba", L"𒁺", 2257},
+    {L"guba2", L"𒇷", 2258},
+    {L"gubalag", L"𒂯", 2259},
+    {L"gubba", L"𒁺", 2260},
+    {L"gubla", L"𒊮", 2261},
+    {L"gublaga", L"𒂯", 2262},
+    {L"gubru", L"𒋗𒄨", 2263},
+    {L"gubru2", L"𒀸", 2264},
+    {L"gubru3", L"𒄒", 2265},
+    {L"gubu", L"𒁺", 2266},
+    {L"gubu3", L"𒆏", 2267},
+    {L"gud", L"𒄞", 2268},
+    {L"gud10", L"𒁆", 2277},
+    {L"gud10v1", L"𒂀", 2278},
+    {L"gud2", L"𒊥", 2269},
+    {L"gud3", L"𒌑𒆠𒋧𒂵", 2270},
+    {L"gud4", L"𒋻", 2271},
+    {L"gud5", L"𒃴", 2272},
+    {L"gud6", L"𒈝", 2273},
+    {L"gud7", L"𒆪", 2274},
+    {L"gud8", L"𒆸", 2275},
+    {L"gud9", L"𒋃", 2276},
+    {L"guda2", L"𒄴𒈨", 2279},
+    {L"guda3", L"𒊥", 2280},
+    {L"gudibdim", L"𒄯", 2281},
+    {L"gudibir", L"𒋺", 2282},
+    {L"gudibir2", L"𒆴", 2283},
+    {L"gudma", L"𒄞", 2284},
+    {L"gudu10", L"𒁆", 2288},
+    {L"gudu10v1", L"𒂀", 2289},
+    {L"gudu12", L"𒄴𒈨", 2290},
+    {L"gudu2", L"𒊥", 2285},
+    {L"gudu4", L"𒄴𒈨", 2286},
+    {L"gudu5", L"𒊳", 2287},
+    {L"gug", L"𒍝𒄢", 2291},
+    {L"gug2", L"𒈖", 2292},
+    {L"gug3L", L"𒋻", 2294},
+    {L"gug3M", L"𒃻𒈖", 2293},
+    {L"gug4L", L"𒌑𒍤𒆸", 2296},
+    {L"gug4M", L"𒍤𒆸", 2295},
+    {L"gug5", L"𒈙", 2297},
+    {L"gug6", L"𒅗𒆕", 2298},
+    {L"gugarid", L"𒄞", 2299},
+    {L"gugim", L"𒈮", 2300},
+    {L"gugim2", L"𒄯", 2301},
+    {L"gugina", L"𒃻𒈖", 2302},
+    {L"gugu", L"𒅗𒅗", 2303},
+    {L"gugu2", L"𒂭", 2304},
+    {L"gugumu", L"𒈝𒈝", 2305},
+    {L"guk", L"𒋻", 2310},
+    {L"guk2", L"𒈖", 2311},
+    {L"gukim", L"𒈮", 2312},
+    {L"gukim2", L"𒄯", 2313},
+    {L"gukin", L"𒇐", 2314},
+    {L"gukin2", L"𒄭", 2315},
+    {L"gukin2v1", L"𒄳", 2316},
+    {L"gukkal", L"𒇻𒄾", 2317},
+    {L"gul", L"𒄢", 2318},
+    {L"gul2", L"𒆰", 2319},
+    {L"gul3", L"𒋼", 2320},
+    {L"gulu", L"𒄢", 2321},
+    {L"gum", L"𒄣", 2322},
+    {L"gum2", L"𒈝", 2323},
+    {L"gum3", L"𒉈", 2324},
+    {L"gum4", L"𒃵", 2325},
+    {L"gumgum", L"𒈞", 2326},
+    {L"gumgumv1", L"𒈞𒋙", 2327},
+    {L"gumu", L"𒈝", 2328},
+    {L"gumuš", L"𒆪", 2329},
+    {L"gun", L"𒄘𒌦", 2330},
+    {L"gun2", L"𒄘", 2331},
+    {L"gun3", L"𒁯", 2332},
+    {L"gun4", L"𒀔", 2333},
+    {L"gun5", L"𒈝", 2334},
+    {L"gunin2", L"𒆹", 2335},
+    {L"gunni", L"𒆠𒉈", 2336},
+    {L"gunnu", L"𒋜", 2337},
+    {L"gunu3", L"𒁯", 2338},
+    {L"gunu4", L"𒀔", 2339},
+    {L"gup", L"𒁺", 2340},
+    {L"gup2", L"𒇷", 2341},
+    {L"guq", L"𒍝𒄢", 2342},
+    {L"gur", L"𒄥", 2343},
+    {L"gur10", L"𒆥", 2352},
+    {L"gur11", L"𒂵", 2353},
+    {L"gur12", L"𒉽", 2354},
+    {L"gur13", L"𒉌", 2355},
+    {L"gur14", L"𒄯", 2356},
+    {L"gur15", L"𒌴", 2357},
+    {L"gur16", L"𒆳", 2358},
+    {L"gur17", L"𒄕", 2359},
+    {L"gur18", L"𒅗", 2360},
+    {L"gur19", L"𒉣𒆠", 2361},
+    {L"gur19v1", L"𒉩𒆠", 2362},
+    {L"gur2", L"𒃵", 2344},
+    {L"gur22", L"𒇉", 2363},
+    {L"gur3", L"𒅍", 2345},
+    {L"gur4", L"𒆸", 2346},
+    {L"gur5", L"𒍀", 2347},
+    {L"gur6", L"𒃸", 2348},
+    {L"gur7", L"𒄦", 2349},
+    {L"gur8", L"𒋽", 2350},
+    {L"gur9", L"𒉒", 2351},
+    {L"gura8", L"𒋽", 2364},
+    {L"gurdub", L"𒃍", 2365},
+    {L"gurdub2", L"𒃎", 2366},
+    {L"gurin", L"𒄧", 2367},
+    {L"guru12", L"𒌋", 2375},
+    {L"guru17", L"𒄕", 2376},
+    {L"guru19L", L"𒂊𒌈", 2379},
+    {L"guru19M", L"𒉣𒆠", 2377},
+    {L"guru19Mv1", L"𒉩𒆠", 2378},
+    {L"guru2", L"𒃵", 2370},
+    {L"guru20", L"𒄧", 2380},
+    {L"guru21", L"𒂊𒌈", 2381},
+    {L"guru3", L"𒅍", 2371},
+    {L"guru5", L"𒍀", 2372},
+    {L"guru6", L"𒃸", 2373},
+    {L"guru7", L"𒄦", 2374},
+    {L"guruL", L"𒄧", 2369},
+    {L"guruM", L"𒄥", 2368},
+    {L"gurud", L"𒉣𒆠", 2382},
+    {L"gurud2", L"𒇽𒆠", 2384},
+    {L"gurud2v1", L"𒈈", 2385},
+    {L"gurudv1", L"𒉩𒆠", 2383},
+    {L"gurum", L"𒃵", 2386},
+    {L"gurum2", L"𒅆𒂟", 2387},
+    {L"gurum2v1", L"𒅆𒃻", 2388},
+    {L"gurum5", L"𒅫", 2389},
+    {L"gurum5v1", L"𒍀", 2390},
+    {L"gurun2", L"𒁁𒅆𒁁", 2393},
+    {L"gurun3", L"𒆸", 2394},
+    {L"gurun4", L"𒇫", 2395},
+    {L"gurun5", L"𒅄", 2396},
+    {L"gurun6", L"𒆥", 2397},
+    {L"gurun7", L"𒂁", 2398},
+    {L"gurun8", L"𒁷", 2399},
+    {L"gurunL", L"𒅄", 2392},
+    {L"gurunM", L"𒄧", 2391},
+    {L"guruš", L"𒄨", 2400},
+    {L"guruš2L", L"𒍑", 2403},
+    {L"guruš2M", L"𒆯", 2402},
+    {L"guruš3", L"𒍀", 2404},
+    {L"guruš4", L"𒋳", 2405},
+    {L"guruš5", L"𒍑", 2406},
+    {L"gurušda", L"𒆯", 2407},
+    {L"gurušta", L"𒆯", 2408},
+    {L"gurušti", L"𒆯", 2409},
+    {L"gurušv1", L"𒆗", 2401},
+    {L"guz", L"𒈝", 2414},
+    {L"guz2", L"𒁍", 2415},
+    {L"guz3", L"𒆪", 2416},
+    {L"guza", L"𒆪𒃻", 2417},
+    {L"guzza", L"𒆪𒃻", 2418},
+    {L"guš", L"𒋢", 2410},
+    {L"guškin", L"𒆬𒄀", 2411},
+    {L"gušur", L"𒃡", 2412},
+    {L"gušur2", L"𒊐𒃲", 2413},
+    {L"guḫšu2L", L"𒋟", 2309},
+    {L"guḫšu2M", L"𒈞𒋙", 2308},
+    {L"guḫšuL", L"𒈞𒋙𒀀", 2307},
+    {L"guḫšuM", L"𒋟", 2306},
+    {L"i", L"𒄿", 2625},
+    {L"i10", L"𒌓𒁺", 2639},
+    {L"i11", L"𒄭", 2640},
+    {L"i12", L"𒇷", 2641},
+    {L"i14", L"𒈬", 2642},
+    {L"i15", L"𒂊", 2643},
+    {L"i16", L"𒉿", 2644},
+    {L"i2", L"𒐊", 2629},
+    {L"i2ʾ", L"𒄴", 2630},
+    {L"i3", L"𒉌", 2631},
+    {L"i4", L"𒎎", 2632},
+    {L"i5", L"𒅗", 2634},
+    {L"i6", L"𒆪", 2635},
+    {L"i7", L"𒀀𒇉", 2636},
+    {L"i8", L"𒇉", 2637},
+    {L"i9", L"𒋖𒄑𒆪", 2638},
+    {L"ia10", L"𒀀", 2661},
+    {L"ia2", L"𒐊", 2652},
+    {L"ia3", L"𒉌", 2653},
+    {L"ia4", L"𒎎", 2654},
+    {L"ia5", L"𒈬", 2655},
+    {L"ia6", L"𒉌𒀀", 2656},
+    {L"ia7", L"𒐃", 2657},
+    {L"ia8", L"𒉿", 2658},
+    {L"ia9", L"𒀼𒋰", 2659},
+    {L"ia9v1", L"𒐺𒋰", 2660},
+    {L"iaL", L"𒉿", 2651},
+    {L"iaM", L"𒅀", 2650},
+    {L"ib", L"𒅁", 2662},
+    {L"ib2", L"𒌈", 2663},
+    {L"ibbanunna", L"𒌓𒄷𒄭𒉣", 2664},
+    {L"ibbi", L"𒅁", 2665},
+    {L"ibila", L"𒌉𒍑", 2666},
+    {L"ibila2", L"𒌉𒀴", 2667},
+    {L"ibila3", L"𒌉𒊕", 2668},
+    {L"ibila4", L"𒌉𒁹", 2669},
+    {L"ibira", L"𒅪", 2670},
+    {L"ibira2", L"𒅛", 2671},
+    {L"id", L"𒀉", 2672},
+    {L"id2", L"𒀀𒇉", 2673},
+    {L"id3", L"𒇉", 2674},
+    {L"id4", L"𒌓𒀭𒋀𒆠", 2675},
+    {L"id5", L"𒀀", 2676},
+    {L"id6", L"𒀀𒇉𒃲", 2677},
+    {L"id7", L"𒀀𒇉𒁲", 2678},
+    {L"id8", L"𒌗", 2679},
+    {L"id9", L"𒌗𒀭𒋀𒆠", 2680},
+    {L"iddir", L"𒀀𒉺𒄐𒉻𒋛𒀀", 2681},
+    {L"idi", L"𒂐", 2682},
+    {L"idi2", L"𒀉", 2684},
+    {L"idi3", L"𒁕", 2685},
+    {L"idigna", L"𒈦𒄘𒃼", 2686},
+    {L"idignu", L"𒈦𒄘𒃼", 2687},
+    {L"idim", L"𒁁", 2688},
+    {L"idimv1", L"𒅂", 2689},
+    {L"idin", L"𒁁", 2690},
+    {L"idiv1", L"𒃟", 2683},
+    {L"ie", L"𒅀", 2691},
+    {L"ig", L"𒅅", 2692},
+    {L"ig2", L"𒂊", 2693},
+    {L"ig3", L"𒉘", 2694},
+    {L"igaL", L"𒅆𒅅", 2696},
+    {L"igaM", L"𒅅", 2695},
+    {L"igar", L"𒂍𒋞", 2697},
+    {L"igeštu", L"𒅆𒁺", 2698},
+    {L"igi", L"𒅆", 2699},
+    {L"igi2", L"𒅊", 2700},
+    {L"igi3", L"𒆠𒊕", 2701},
+    {L"igira2L", L"𒆠𒊕𒊩𒄷", 2705},
+    {L"igira2M", L"𒆠𒊕𒊩", 2704},
+    {L"igiraL", L"𒊕𒉺𒆸", 2703},
+    {L"igiraM", L"𒅆𒁍", 2702},
+    {L"igiru", L"𒆠𒊕𒊩", 2706},
+    {L"igištu", L"𒅆𒁺", 2707},
+    {L"igu", L"𒅆", 2708},
+    {L"ii3", L"𒂊", 2713},
+    {L"iiL", L"𒉿", 2712},
+    {L"iiM", L"𒅀", 2711},
+    {L"ija", L"𒀀𒀀", 2714},
+    {L"ije", L"𒀀𒀀", 2715},
+    {L"iji", L"𒀀𒀀", 2716},
+    {L"ijja", L"𒀀𒀀", 2717},
+    {L"ijje", L"𒀀𒀀", 2718},
+    {L"ijji", L"𒀀𒀀", 2719},
+    {L"ijju", L"𒀀𒀀", 2720},
+    {L"iju", L"𒀀𒀀", 2721},
+    {L"ik", L"𒅅", 2722},
+    {L"iku", L"𒃷", 2723},
+    {L"iku2", L"𒂽", 2724},
+    {L"il", L"𒅋", 2725},
+    {L"il10", L"𒅋", 2734},
+    {L"il10v1", L"𒀠", 2735},
+    {L"il2", L"𒅍", 2727},
+    {L"il3", L"𒀭", 2728},
+    {L"il4", L"𒁹", 2729},
+    {L"il5", L"𒂖", 2730},
+    {L"il6", L"𒀧", 2731},
+    {L"il8", L"𒅌", 2732},
+    {L"il9", L"𒇸", 2733},
+    {L"ila", L"𒀭", 2736},
+    {L"ila2", L"𒅍", 2737},
+    {L"ilar", L"𒊒", 2738},
+    {L"ilba", L"𒂷", 2739},
+    {L"ilba2", L"𒆜𒆳", 2740},
+    {L"ildag", L"𒋥", 2741},
+    {L"ildag2", L"𒄟", 2742},
+    {L"ildag2v1", L"𒀀𒄠", 2743},
+    {L"ildag3", L"𒄠", 2744},
+    {L"ildag4", L"𒃿", 2745},
+    {L"ildu", L"𒅆𒂠𒁺", 2746},
+    {L"ildu2", L"𒅆𒉄𒁍", 2748},
+    {L"ildu3", L"𒉄𒁍", 2749},
+    {L"ildum", L"𒅆𒂠𒁺", 2750},
+    {L"ildum2", L"𒅆𒉄𒁍", 2752},
+    {L"ildum3", L"𒉄𒁍", 2753},
+    {L"ilduma2", L"𒅆𒉄𒁍", 2754},
+    {L"ilduma3", L"𒉄𒁍", 2755},
+    {L"ildumma2", L"𒅆𒉄𒁍", 2756},
+    {L"ildumma3", L"𒉄𒁍", 2757},
+    {L"ildumv1", L"𒅆𒂠𒁺𒂟", 2751},
+    {L"ilduv1", L"𒅆𒂠𒁺𒂟", 2747},
+    {L"ili2", L"𒅍", 2761},
+    {L"ili3", L"𒀭", 2762},
+    {L"ili5", L"𒂖", 2763},
+    {L"ili6", L"𒁹", 2764},
+    {L"ili7", L"𒀭𒎌", 2765},
+    {L"iliL", L"𒅋", 2760},
+    {L"iliM", L"𒀭", 2759},
+    {L"ilimmu", L"𒑆", 2766},
+    {L"ilimmu2", L"𒐇", 2767},
+    {L"ilimmu3", L"𒑇", 2768},
+    {L"ilimmu4", L"𒑈", 2769},
+    {L"ilimmu5", L"𒑉", 2770},
+    {L"illa", L"𒉄", 2771},
+    {L"illag", L"𒆸", 2772},
+    {L"illammaL", L"𒅮", 2774},
+    {L"illammaM", L"𒇌", 2773},
+    {L"illar", L"𒊒", 2775},
+    {L"illarv1", L"𒄑𒊒", 2776},
+    {L"illat", L"𒆜𒆳", 2777},
+    {L"illil", L"𒂗𒆤", 2778},
+    {L"illil2", L"𒐐", 2779},
+    {L"illu", L"𒀀𒄨", 2780},
+    {L"illuluL", L"𒄑𒊒", 2782},
+    {L"illuluM", L"𒊒", 2781},
+    {L"illuruL", L"𒄑𒊒", 2784},
+    {L"illuruM", L"𒊒", 2783},
+    {L"ilu3", L"𒀭", 2787},
+    {L"iluL", L"𒅋", 2786},
+    {L"iluM", L"𒀭", 2785},
+    {L"ilv1", L"𒀧", 2726},
+    {L"ilḫa", L"𒆜𒆳", 2758},
+    {L"im", L"𒅎", 2788},
+    {L"im2", L"𒁽", 2789},
+    {L"im3", L"𒉘", 2790},
+    {L"im4A", L"𒁺", 2791},
+    {L"im4L", L"𒅴", 2792},
+    {L"im5", L"𒁼", 2793},
+    {L"im6", L"𒁺", 2794},
+    {L"im7", L"𒅖𒀀𒋤", 2795},
+    {L"imgaga", L"𒀾𒀀𒀭", 2796},
+    {L"imgaga2", L"𒀾𒀭𒈾", 2797},
+    {L"imgaga3", L"𒀾𒀭", 2798},
+    {L"imi", L"𒅎", 2802},
+    {L"imi2", L"𒂼", 2803},
+    {L"imin", L"𒐌", 2804},
+    {L"imin2", L"𒐅", 2806},
+    {L"imin3", L"𒑁", 2807},
+    {L"imina", L"𒐌", 2808},
+    {L"iminav1", L"𒑂", 2809},
+    {L"iminv1", L"𒑂", 2805},
+    {L"imma", L"𒆉", 2810},
+    {L"imma2", L"𒅘", 2811},
+    {L"imma3", L"𒅊", 2812},
+    {L"immal", L"𒉥", 2813},
+    {L"immal2", L"𒉦", 2814},
+    {L"immal3", L"𒃻𒋗𒂂", 2815},
+    {L"immalmal", L"𒀾𒀀𒀭", 2816},
+    {L"immeli", L"𒅘", 2817},
+    {L"immen", L"𒆉", 2818},
+    {L"immin", L"𒆉", 2819},
+    {L"immin2", L"𒅘", 2820},
+    {L"immindu", L"𒇌", 2821},
+    {L"imḫur2", L"𒅆𒁉", 2799},
+    {L"imḫur3", L"𒅆𒂵", 2800},
+    {L"imḫur4", L"𒅆𒀀", 2801},
+    {L"in", L"𒅔", 2822},
+    {L"in2", L"𒅆", 2823},
+    {L"in4", L"𒂗", 2824},
+    {L"in5", L"𒎏", 2825},
+    {L"in5v1", L"𒊩𒈠", 2826},
+    {L"in6", L"𒀸", 2827},
+    {L"ina", L"𒀸", 2828},
+    {L"ina2", L"𒅆", 2829},
+    {L"inanna", L"𒈹", 2830},
+    {L"inbir", L"𒈓", 2831},
+    {L"inda", L"𒉒", 2832},
+    {L"inda3", L"𒃻", 2833},
+    {L"inda4", L"𒇅", 2834},
+    {L"inda5", L"𒇌", 2835},
+    {L"indagara", L"𒉖", 2836},
+    {L"ingar", L"𒂍𒋞", 2837},
+    {L"ini", L"𒅔", 2838},
+    {L"ini2", L"𒅆", 2839},
+    {L"ini4", L"𒅆𒈫", 2840},
+    {L"inim", L"𒅗", 2841},
+    {L"inimma", L"𒈨𒇷𒂊𒀀", 2842},
+    {L"inmen2", L"𒅘", 2843},
+    {L"inna", L"𒁱", 2844},
+    {L"innana", L"𒈹", 2845},
+    {L"innin", L"𒈹", 2846},
+    {L"insi", L"𒂗𒈨𒇷", 2847},
+    {L"insi2", L"𒑐𒋼𒋛", 2848},
+    {L"insi3", L"𒂚𒇷", 2849},
+    {L"inta3", L"𒃻", 2850},
+    {L"inu", L"𒅗", 2851},
+    {L"inu2", L"𒅆", 2852},
+    {L"ip", L"𒅁", 2853},
+    {L"ip2", L"𒌈", 2854},
+    {L"ipig", L"𒋝", 2855},
+    {L"iq", L"𒅅", 2856},
+    {L"ir", L"𒅕", 2857},
+    {L"ir10", L"𒁺", 2865},
+    {L"ir11", L"𒀵", 2866},
+    {L"ir13", L"𒎋", 2867},
+    {L"ir13v1", L"𒈁", 2868},
+    {L"ir17", L"𒂇", 2869},
+    {L"ir2", L"𒀀𒅆", 2858},
+    {L"ir3", L"𒀴", 2859},
+    {L"ir4", L"𒌷", 2860},
+    {L"ir5", L"𒄯", 2861},
+    {L"ir6", L"𒀅", 2862},
+    {L"ir7", L"𒆜", 2863},
+    {L"ir9", L"𒄊", 2864},
+    {L"ira2", L"𒀀𒅆", 2870},
+    {L"irbura", L"𒉫", 2871},
+    {L"irgi", L"𒄊𒍞", 2872},
+    {L"iri", L"𒌷", 2874},
+    {L"iri11", L"𒀔", 2878},
+    {L"iri12", L"𒀊", 2879},
+    {L"iri4", L"𒌷", 2876},
+    {L"iri8", L"𒁁", 2877},
+    {L"irib", L"𒀿", 2880},
+    {L"irib2", L"𒇗", 2881},
+    {L"irig", L"𒅕", 2882},
+    {L"irina", L"𒈷", 2883},
+    {L"iriv1", L"𒅕", 2875},
+    {L"irkab", L"𒀶", 2884},
+    {L"irtu", L"𒃮", 2885},
+    {L"irḫan", L"𒈲", 2873},
+    {L"is", L"𒄑", 2886},
+    {L"is2", L"𒅖", 2887},
+    {L"is3", L"𒀊", 2888},
+    {L"is4", L"𒀾", 2889},
+    {L"is5", L"𒌍", 2890},
+    {L"isak", L"𒑐𒋼𒋛", 2891},
+    {L"isi", L"𒅖", 2892},
+    {L"isi2", L"𒄢", 2893},
+    {L"isi3", L"𒌋𒀜", 2894},
+    {L"isib", L"𒈨", 2895},
+    {L"isim2", L"𒄢", 2896},
+    {L"isim3", L"𒌋𒀜", 2897},
+    {L"isima", L"𒉽𒅊", 2898},
+    {L"isima4", L"𒉽𒅊𒉣𒈨", 2899},
+    {L"isimu", L"𒉽𒅊", 2900},
+    {L"isimu2", L"𒄢", 2901},
+    {L"isimu2v1", L"𒄢𒊬", 2902},
+    {L"isimu3", L"𒌋𒀜", 2903},
+    {L"isimu3v1", L"𒌋𒀜𒊬", 2904},
+    {L"isin", L"𒑐𒊺", 2905},
+    {L"isin2", L"𒅔", 2906},
+    {L"isiš", L"𒅖", 2907},
+    {L"isiš2", L"𒀀𒅆", 2908},
+    {L"isiš3", L"𒀅", 2909},
+    {L"iskim", L"𒅆𒁾", 2910},
+    {L"it", L"𒀉", 2953},
+    {L"it2", L"𒀀𒇉", 2954},
+    {L"it4", L"𒌓𒀭𒋀𒆠", 2955},
+    {L"it9", L"𒌗𒀭𒋀𒆠", 2956},
+    {L"ita4", L"𒀭𒀀𒇉", 2957},
+    {L"ita5", L"𒀀𒇉", 2958},
+    {L"iti", L"𒌗", 2959},
+    {L"iti2", L"𒌛", 2961},
+    {L"iti3L", L"𒆜𒌓", 2963},
+    {L"iti3M", L"𒆜𒌚", 2962},
+    {L"iti4", L"𒀭𒀀𒇉", 2964},
+    {L"iti5", L"𒀀𒇉", 2965},
+    {L"iti6", L"𒌓𒀭𒋀𒆠", 2966},
+    {L"iti7", L"𒌗𒀭𒋀𒆠", 2967},
+    {L"itima", L"𒂐", 2968},
+    {L"itima2", L"𒌖", 2970},
+    {L"itimav1", L"𒃟", 2969},
+    {L"itiv1", L"𒌚", 2960},
+    {L"itu", L"𒌗", 2971},
+    {L"itu2", L"𒌛", 2972},
+    {L"itu4", L"𒀭𒀀𒇉", 2973},
+    {L"itu5", L"𒀀𒇉", 2974},
+    {L"itud", L"𒌗", 2975},
+    {L"iturungal", L"𒌓𒉣", 2976},
+    {L"iu2", L"𒉿", 2980},
+    {L"iuL", L"𒉿", 2979},
+    {L"iuM", L"𒅀", 2978},
+    {L"iw", L"𒉿", 2981},
+    {L"iz", L"𒄑", 2982},
+    {L"iz2", L"𒅖", 2983},
+    {L"iz3", L"𒀊", 2984},
+    {L"izen", L"𒂡", 2985},
+    {L"izi", L"𒉈", 2986},
+    {L"izi2", L"𒆠𒉈", 2987},
+    {L"izib", L"𒈨", 2988},
+    {L"izin", L"𒂡", 2989},
+    {L"izkim", L"𒅆𒁾", 2990},
+    {L"izu", L"𒉈", 2991},
+    {L"izun", L"𒂡", 2992},
+    {L"iš", L"𒅖", 2914},
+    {L"iš10", L"𒍑", 2924},
+    {L"iš11", L"𒇵", 2925},
+    {L"iš12", L"𒇴", 2926},
+    {L"iš2", L"𒆜", 2915},
+    {L"iš3", L"𒌍", 2916},
+    {L"iš4", L"𒁹", 2917},
+    {L"iš5", L"𒅗", 2918},
+    {L"iš6", L"𒄑", 2919},
+    {L"iš7", L"𒀊", 2920},
+    {L"iš8L", L"𒌋", 2922},
+    {L"iš8M", L"𒀹", 2921},
+    {L"iš9", L"𒂠", 2923},
+    {L"iši", L"𒅖", 2942},
+    {L"iši2", L"𒋙𒀯", 2943},
+    {L"išib", L"𒈨", 2944},
+    {L"išin", L"𒑐𒊺", 2945},
+    {L"iškila", L"𒊯", 2946},
+    {L"iškili", L"𒊯", 2947},
+    {L"iškilla", L"𒊯", 2948},
+    {L"iškur", L"𒅎", 2949},
+    {L"išla", L"𒊯", 2950},
+    {L"išli", L"𒊯", 2951},
+    {L"ištaran", L"𒅗𒁲", 2952},
+    {L"išḫara2", L"𒊮𒆸", 2930},
+    {L"išḫara3", L"𒆸𒆸", 2931},
+    {L"išḫara4", L"𒃢", 2932},
+    {L"išḫaraL", L"𒃢", 2929},
+    {L"išḫaraM", L"𒂏", 2927},
+    {L"išḫaraMv1", L"𒃌", 2928},
+    {L"išḫur4", L"𒃢", 2933},
+    {L"išḫuru", L"𒂏", 2934},
+    {L"išḫuru2", L"𒍂", 2936},
+    {L"išḫuru3", L"𒃷", 2937},
+    {L"išḫuru4", L"𒃢", 2938},
+    {L"išḫuru5", L"𒃗", 2939},
+    {L"išḫurum3", L"𒃷", 2940},
+    {L"išḫurum5", L"𒃗", 2941},
+    {L"išḫuruv1", L"𒃌", 2935},
+    {L"iʾ", L"𒀪", 2993},
+    {L"iḫ", L"𒄴", 2709},
+    {L"iḫ2", L"𒀪", 2710},
+    {L"iṣ", L"𒄑", 2911},
+    {L"iṣ2", L"𒅖", 2912},
+    {L"iṣ3", L"𒀊", 2913},
+    {L"iṭ", L"𒀉", 2977},
+    {L"ja", L"𒉿", 3005},
+    {L"je", L"𒉿", 3006},
+    {L"ji", L"𒉿", 3007},
+    {L"ji2", L"𒅀", 3008},
+    {L"ji3", L"𒂊", 3009},
+    {L"ju", L"𒉿", 3010},
+    {L"ka", L"𒅗", 3022},
+    {L"ka10", L"𒃰", 3032},
+    {L"ka11", L"𒋼𒀀", 3033},
+    {L"ka13", L"𒄰", 3034},
+    {L"ka14", L"𒍪", 3035},
+    {L"ka15", L"𒆕", 3036},
+    {L"ka16", L"𒆚", 3037},
+    {L"ka2", L"𒆍", 3023},
+    {L"ka3", L"𒂵", 3024},
+    {L"ka4", L"𒋡", 3025},
+    {L"ka5", L"𒈜", 3026},
+    {L"ka6", L"𒎔", 3027},
+    {L"ka6v1", L"𒉾", 3028},
+    {L"ka7", L"𒁽", 3029},
+    {L"ka8", L"𒁉", 3030},
+    {L"ka9", L"𒋃", 3031},
+    {L"kab", L"𒆏", 3038},
+    {L"kab2", L"𒅘", 3039},
+    {L"kabar", L"𒑐𒁣", 3040},
+    {L"kabta", L"𒋯", 3041},
+    {L"kabtav1", L"𒋮", 3042},
+    {L"kad", L"𒃰", 3043},
+    {L"kad2", L"𒆐", 3044},
+    {L"kad3", L"𒆑", 3045},
+    {L"kad4", L"𒆒", 3046},
+    {L"kad5", L"𒆓", 3047},
+    {L"kad6", L"𒍦", 3048},
+    {L"kad7", L"𒆒𒋙", 3049},
+    {L"kad8", L"𒀽", 3050},
+    {L"kadra", L"𒃻𒊮𒀀", 3051},
+    {L"kadra2", L"𒃻𒊮", 3052},
+    {L"kadra3", L"𒃻𒊯", 3053},
+    {L"kadri", L"𒃻𒊮𒀀", 3054},
+    {L"kadri3", L"𒃻𒊯", 3055},
+    {L"kadru", L"𒃻𒊮𒀀", 3056},
+    {L"kadru3", L"𒃻𒊯", 3057},
+    {L"kag", L"𒆕", 3058},
+    {L"kag2", L"𒅗", 3059},
+    {L"kak", L"𒆕", 3060},
+    {L"kak2", L"𒄑𒆪", 3061},
+    {L"kakala", L"𒆯", 3062},
+    {L"kakkuda", L"𒆯", 3063},
+    {L"kakkul", L"𒌋𒁵", 3064},
+    {L"kakkul2", L"𒁵", 3065},
+    {L"kakkul3", L"𒌋𒁴", 3066},
+    {L"kakkuša", L"𒆯", 3067},
+    {L"kakra", L"𒅎", 3068},
+    {L"kakru", L"𒅎", 3069},
+    {L"kaku", L"𒁽", 3070},
+    {L"kal", L"𒄨", 3071},
+    {L"kal2", L"𒃲", 3072},
+    {L"kal3", L"𒆕", 3073},
+    {L"kal4", L"𒊩", 3074},
+    {L"kala", L"𒄨", 3075},
+    {L"kala2", L"𒊩𒆷", 3076},
+    {L"kala3", L"𒇥", 3077},
+    {L"kala4", L"𒆽", 3078},
+    {L"kala5", L"𒇏", 3079},
+    {L"kalag", L"𒄨", 3080},
+    {L"kalaga", L"𒄨", 3081},
+    {L"kalam", L"𒌦", 3082},
+    {L"kalam2", L"𒄵", 3083},
+    {L"kalama", L"𒌦", 3084},
+    {L"kam", L"𒄰", 3085},
+    {L"kam2", L"𒆚", 3087},
+    {L"kam3", L"𒆒", 3088},
+    {L"kam3v1", L"𒆓", 3089},
+    {L"kam4", L"𒆛", 3090},
+    {L"kama", L"𒄰", 3091},
+    {L"kama5", L"𒇽𒄰", 3092},
+    {L"kama5v1", L"𒈃", 3093},
+    {L"kamaš", L"𒁽", 3094},
+    {L"kamuš", L"𒄞", 3095},
+    {L"kamv1", L"𒄭𒁁", 3086},
+    {L"kan", L"𒃶", 3096},
+    {L"kan2", L"𒃷", 3097},
+    {L"kan3", L"𒊝", 3098},
+    {L"kan4L", L"𒅸", 3100},
+    {L"kan4M", L"𒆍", 3099},
+    {L"kan5", L"𒅸", 3101},
+    {L"kan6", L"𒅤", 3102},
+    {L"kana", L"𒃶", 3103},
+    {L"kana2", L"𒃷", 3104},
+    {L"kana3", L"𒊝", 3105},
+    {L"kana5", L"𒅸", 3106},
+    {L"kana6", L"𒅤", 3107},
+    {L"kana7", L"𒄕", 3108},
+    {L"kanam", L"𒌦", 3109},
+    {L"kankal", L"𒆠𒄨", 3110},
+    {L"kankan", L"𒆍", 3111},
+    {L"kap", L"𒆏", 3112},
+    {L"kap2", L"𒃮", 3113},
+    {L"kap3", L"𒃮", 3114},
+    {L"kapar", L"𒑐𒁣", 3115},
+    {L"kapru", L"𒍉", 3116},
+    {L"kaptu", L"𒂂", 3117},
+    {L"kaq", L"𒆕", 3118},
+    {L"kar", L"𒋼𒀀", 3119},
+    {L"kar2", L"𒃸", 3120},
+    {L"kar3", L"𒃼", 3121},
+    {L"kar4", L"𒄫", 3122},
+    {L"kar5", L"𒃻", 3123},
+    {L"kara", L"𒋼𒀀", 3124},
+    {L"kara2", L"𒃸", 3125},
+    {L"kara4", L"𒆒", 3126},
+    {L"kara4v1", L"𒆓", 3127},
+    {L"kara6", L"𒄦", 3128},
+    {L"karadin10", L"𒌎", 3138},
+    {L"karadin2", L"𒊼", 3131},
+    {L"karadin3", L"𒊽", 3132},
+    {L"karadin4", L"𒌃𒆸𒆸", 3133},
+    {L"karadin5", L"𒄀𒆸𒆸", 3134},
+    {L"karadin5v1", L"𒆸𒆸", 3135},
+    {L"karadin6", L"𒌃", 3136},
+    {L"karadin9", L"𒌏", 3137},
+    {L"karadinA", L"𒊺𒁓", 3130},
+    {L"karadinM", L"𒌄", 3129},
+    {L"karaš", L"𒆠𒄨𒁁", 3139},
+    {L"karaš2", L"𒆠𒄨", 3141},
+    {L"karašv1", L"𒆠𒆘", 3140},
+    {L"karkar", L"𒅎", 3142},
+    {L"karkara", L"𒅎", 3143},
+    {L"kas", L"𒆜", 3144},
+    {L"kas2", L"𒁉", 3145},
+    {L"kas3", L"𒄤", 3146},
+    {L"kas4", L"𒁽", 3147},
+    {L"kas5", L"𒁼", 3148},
+    {L"kas6", L"𒄣", 3149},
+    {L"kas7", L"𒋃", 3150},
+    {L"kasa", L"𒆜", 3151},
+    {L"kasbi", L"𒌑", 3152},
+    {L"kaskal", L"𒆜", 3153},
+    {L"kat", L"𒃰", 3169},
+    {L"kat2", L"𒆐", 3170},
+    {L"kat3", L"𒆑", 3171},
+    {L"kat4", L"𒆒", 3172},
+    {L"kat5", L"𒆓", 3173},
+    {L"kat6", L"𒋗", 3174},
+    {L"kat7", L"𒋗", 3175},
+    {L"kata3", L"𒆑", 3176},
+    {L"kaz", L"𒄮", 3180},
+    {L"kaz2", L"𒌓", 3181},
+    {L"kaz2v1", L"𒌓𒄯", 3182},
+    {L"kaz8", L"𒄮", 3183},
+    {L"kaz9", L"𒌓𒄯", 3184},
+    {L"kazab", L"𒌑", 3185},
+    {L"kazab2", L"𒌑", 3186},
+    {L"kazabu", L"𒌑", 3187},
+    {L"kazabur", L"𒌑", 3188},
+    {L"kazaza", L"𒄮", 3189},
+    {L"kazbi", L"𒌑", 3190},
+    {L"kaš", L"𒁉", 3158},
+    {L"kaš2", L"𒆜", 3159},
+    {L"kaš3", L"𒍒", 3160},
+    {L"kaš4", L"𒁽", 3161},
+    {L"kaš5", L"𒁺", 3162},
+    {L"kaš6", L"𒄤", 3163},
+    {L"kašbir", L"𒁉𒀀𒋤", 3164},
+    {L"kaššeba", L"𒈗", 3165},
+    {L"kaššeba2", L"𒀩", 3166},
+    {L"kaššebi", L"𒈗", 3167},
+    {L"kaššebi2", L"𒀩", 3168},
+    {L"kaṣ2", L"𒁉", 3156},
+    {L"kaṣ3", L"𒄤", 3157},
+    {L"kaṣL", L"𒄤", 3155},
+    {L"kaṣM", L"𒆜", 3154},
+    {L"kaṭ", L"𒃰", 3177},
+    {L"kaṭ4", L"𒆒", 3178},
+    {L"kaṭ5", L"𒆓", 3179},
+    {L"ke", L"𒆠", 3191},
+    {L"ke2", L"𒄀", 3192},
+    {L"ke3", L"𒀝", 3193},
+    {L"ke4", L"𒆤", 3194},
+    {L"ke6", L"𒁺", 3195},
+    {L"kel", L"𒆸", 3196},
+    {L"kel3", L"𒆸𒆸", 3197},
+    {L"kele", L"𒆸", 3198},
+    {L"kem", L"𒁶", 3199},
+    {L"ken3", L"𒆳", 3200},
+    {L"kep", L"𒄒", 3201},
+    {L"ker", L"𒄫", 3202},
+    {L"ker6", L"𒀘", 3203},
+    {L"ker7", L"𒉑", 3204},
+    {L"ket", L"𒆤", 3222},
+    {L"keš", L"𒆧", 3205},
+    {L"keš18", L"𒌔", 3214},
+    {L"keš2", L"𒂡", 3206},
+    {L"keš2v1", L"𒆟", 3207},
+    {L"keš3L", L"𒋙𒀭𒄲𒆠", 3209},
+    {L"keš3M", L"𒋙𒀭𒄲", 3208},
+    {L"keš4", L"𒊔", 3210},
+    {L"keš7", L"𒁝", 3211},
+    {L"keš8", L"𒁞", 3212},
+    {L"keš9", L"𒁬", 3213},
+    {L"kešda", L"𒂡", 3215},
+    {L"keše2", L"𒂡", 3216},
+    {L"keše4", L"𒊔", 3217},
+    {L"keši18", L"𒌔", 3221},
+    {L"keši3L", L"𒋙𒀭𒄲𒆠", 3219},
+    {L"keši3M", L"𒋙𒀭𒄲", 3218},
+    {L"keši4", L"𒊔", 3220},
+    {L"ki", L"𒆠", 3223},
+    {L"ki2", L"𒄀", 3224},
+    {L"ki3", L"𒀝", 3225},
+    {L"ki4", L"𒆤", 3226},
+    {L"ki5", L"𒁶", 3227},
+    {L"ki6", L"𒍪", 3228},
+    {L"ki7", L"𒆕", 3229},
+    {L"ki8", L"𒄄", 3230},
+    {L"kib", L"𒄒", 3231},
+    {L"kibaš", L"𒀵", 3232},
+    {L"kibir", L"𒋙𒀾", 3233},
+    {L"kibir2", L"𒋙𒀾", 3234},
+    {L"kibir3", L"𒋙𒀭", 3235},
+    {L"kibsur", L"𒃻𒆸𒆸", 3236},
+    {L"kibšur", L"𒃻𒆸𒆸", 3237},
+    {L"kid", L"𒆤", 3238},
+    {L"kid10", L"𒁍", 3248},
+    {L"kid2", L"𒋺", 3239},
+    {L"kid3", L"𒀝", 3240},
+    {L"kid4", L"𒋃", 3241},
+    {L"kid5", L"𒆒", 3242},
+    {L"kid6", L"𒆓", 3243},
+    {L"kid7", L"𒉎𒋺", 3244},
+    {L"kid7v1", L"𒅏", 3245},
+    {L"kid8", L"𒊩𒋺", 3246},
+    {L"kid9", L"𒃰", 3247},
+    {L"kig2", L"𒆥", 3249},
+    {L"kigalla", L"𒆠𒄨", 3250},
+    {L"kik", L"𒍼", 3251},
+    {L"kikken", L"𒄯", 3252},
+    {L"kikken2", L"𒄯𒄯", 3253},
+    {L"kikkin", L"𒄯", 3254},
+    {L"kikkin2", L"𒄯𒄯", 3255},
+    {L"kikla", L"𒆠𒄨", 3256},
+    {L"kil", L"𒆸", 3257},
+    {L"kil2", L"𒄃", 3258},
+    {L"kil3", L"𒆸𒆸", 3259},
+    {L"kil4", L"𒃰𒋺", 3260},
+    {L"kili", L"𒆸", 3261},
+    {L"kili3", L"𒆸𒆸", 3262},
+    {L"kilib", L"𒆸", 3263},
+    {L"kilib3", L"𒆸𒆸", 3264},
+    {L"kilibu", L"𒌑", 3265},
+    {L"kilim", L"𒎔", 3266},
+    {L"kilim2", L"𒄃", 3268},
+    {L"kilimv1", L"𒉾", 3267},
+    {L"kilina", L"𒇌", 3269},
+    {L"kim", L"𒁶", 3270},
+    {L"kim2", L"𒆒", 3271},
+    {L"kim2v1", L"𒆓", 3272},
+    {L"kim3", L"𒁍", 3273},
+    {L"kim4", L"𒁽", 3274},
+    {L"kim5", L"𒁼", 3275},
+    {L"kim6", L"𒁺", 3276},
+    {L"kimin", L"𒆠𒈫", 3277},
+    {L"kin", L"𒆥", 3278},
+    {L"kin2", L"𒄯", 3279},
+    {L"kin3", L"𒆳", 3280},
+    {L"kin4", L"𒆸𒆸", 3281},
+    {L"kin5", L"𒌺", 3282},
+    {L"kin6", L"𒍏", 3283},
+    {L"kin7", L"𒁺", 3284},
+    {L"kin8", L"𒁶", 3285},
+    {L"kinbur", L"𒆼", 3286},
+    {L"kinda", L"𒃱", 3287},
+    {L"kinda2", L"𒌵", 3288},
+    {L"kindagal", L"𒃳", 3289},
+    {L"kindagal2", L"𒃲𒌵", 3290},
+    {L"kinga", L"𒆥", 3291},
+    {L"kingal", L"𒃲𒌺", 3292},
+    {L"kingusila", L"𒑜", 3293},
+    {L"kingusila2", L"𒐐", 3294},
+    {L"kingusili", L"𒑜", 3295},
+    {L"kingusili2", L"𒐐", 3296},
+    {L"kingusilla", L"𒑜", 3297},
+    {L"kingusilla2", L"𒐐", 3298},
+    {L"kingusilli", L"𒑜", 3299},
+    {L"kinme", L"𒁶", 3300},
+    {L"kip", L"𒄒", 3301},
+    {L"kir", L"𒄫", 3302},
+    {L"kir10", L"𒄊", 3313},
+    {L"kir11", L"𒊩𒃢", 3314},
+    {L"kir12", L"𒌋𒂘", 3315},
+    {L"kir13", L"𒌋𒀜", 3316},
+    {L"kir14", L"𒅯", 3317},
+    {L"kir15", L"𒋃", 3318},
+    {L"kir16", L"𒃼", 3319},
+    {L"kir17", L"𒉐", 3320},
+    {L"kir2L", L"𒉐", 3304},
+    {L"kir2M", L"𒀚", 3303},
+    {L"kir3", L"𒆸", 3305},
+    {L"kir4", L"𒅗", 3306},
+    {L"kir5", L"𒁁", 3307},
+    {L"kir6", L"𒀘", 3308},
+    {L"kir7", L"𒉑", 3309},
+    {L"kir8L", L"𒊩𒃢", 3311},
+    {L"kir8M", L"𒋼𒀀", 3310},
+    {L"kir9", L"𒄩", 3312},
+    {L"kiraš", L"𒀵", 3321},
+    {L"kiraši", L"𒀾𒀀𒀭", 3322},
+    {L"kiri", L"𒄫", 3323},
+    {L"kiri2", L"𒃸", 3324},
+    {L"kiri3", L"𒅗", 3325},
+    {L"kiri4", L"𒊯", 3326},
+    {L"kiri5", L"𒄊", 3327},
+    {L"kiri6", L"𒊬", 3328},
+    {L"kiri7", L"𒂡", 3329},
+    {L"kiri8", L"𒋃", 3330},
+    {L"kiri9", L"𒉐", 3331},
+    {L"kirid", L"𒂡", 3332},
+    {L"kirim", L"𒁞", 3333},
+    {L"kiris", L"𒂡", 3334},
+    {L"kis", L"𒆧", 3335},
+    {L"kis2", L"𒄑", 3336},
+    {L"kisal", L"𒆦", 3337},
+    {L"kisiL", L"𒂁𒍒", 3339},
+    {L"kisiM", L"𒍒", 3338},
+    {L"kisig", L"𒂮", 3340},
+    {L"kisig2", L"𒂫", 3341},
+    {L"kisiga", L"𒂮", 3342},
+    {L"kisim", L"𒁬", 3343},
+    {L"kisim2", L"𒁪", 3344},
+    {L"kisim3", L"𒁦", 3345},
+    {L"kisim4", L"𒁞", 3346},
+    {L"kisim5", L"𒆨", 3347},
+    {L"kisim5/kisim5", L"𒆩", 3348},
+    {L"kisim6L", L"𒆠𒆸", 3350},
+    {L"kisim6M", L"𒂵𒆸", 3349},
+    {L"kisim7", L"𒁛", 3351},
+    {L"kislaḫ", L"𒆠𒌓", 3352},
+    {L"kislaḫ2", L"𒆣", 3353},
+    {L"kissa", L"𒆠𒋀𒆕", 3354},
+    {L"kit", L"𒆤", 3396},
+    {L"kit10", L"𒁍", 3399},
+    {L"kit2", L"𒋺", 3397},
+    {L"kit9", L"𒃰", 3398},
+    {L"kitim", L"𒄇", 3400},
+    {L"kiš", L"𒆧", 3356},
+    {L"kiš16", L"𒌑𒄉", 3364},
+    {L"kiš17", L"𒄉", 3365},
+    {L"kiš2", L"𒂡", 3357},
+    {L"kiš3", L"𒋙𒀭𒄲𒆠", 3358},
+    {L"kiš4", L"𒊔", 3359},
+    {L"kiš5", L"𒎔", 3360},
+    {L"kiš5v1", L"𒉾", 3361},
+    {L"kiš8", L"𒁞", 3362},
+    {L"kiš9", L"𒁬", 3363},
+    {L"kiša", L"𒌑𒄉", 3366},
+    {L"kiša2", L"𒄉", 3367},
+    {L"kišag", L"𒂮", 3368},
+    {L"kišaga", L"𒂮", 3369},
+    {L"kišeb", L"𒈩", 3370},
+    {L"kišer", L"𒄊𒁇", 3371},
+    {L"kiši", L"𒆧", 3372},
+    {L"kiši10", L"𒌋𒄊", 3382},
+    {L"kiši10v1", L"𒌋𒊊", 3383},
+    {L"kiši11", L"𒅃", 3384},
+    {L"kiši12", L"𒉣𒊺", 3385},
+    {L"kiši13L", L"𒈯𒆜", 3387},
+    {L"kiši13M", L"𒄴𒆜", 3386},
+    {L"kiši14", L"𒋙𒉀", 3388},
+    {L"kiši15", L"𒆜𒄴", 3389},
+    {L"kiši16", L"𒌑𒄉", 3390},
+    {L"kiši17", L"𒄉", 3391},
+    {L"kiši3L", L"𒋙𒀭𒄲𒆠", 3374},
+    {L"kiši3M", L"𒋙𒀭𒄲", 3373},
+    {L"kiši4", L"𒊔", 3375},
+    {L"kiši5", L"𒎔", 3376},
+    {L"kiši5v1", L"𒉾", 3377},
+    {L"kiši6", L"𒊾", 3378},
+    {L"kiši7", L"𒁝", 3379},
+    {L"kiši8", L"𒁞", 3380},
+    {L"kiši9", L"𒁬", 3381},
+    {L"kišib", L"𒈩", 3392},
+    {L"kišib2", L"𒎔", 3393},
+    {L"kišib2v1", L"𒉾", 3394},
+    {L"kišib3", L"𒁾", 3395},
+    {L"kiṣ", L"𒆧", 3355},
+    {L"kiṭ", L"𒆤", 3401},
+    {L"ku", L"𒆪", 3402},
+    {L"ku10", L"𒈪", 3412},
+    {L"ku11", L"𒆠", 3413},
+    {L"ku13", L"𒄣", 3414},
+    {L"ku14", L"𒆲", 3415},
+    {L"ku15", L"𒄞", 3416},
+    {L"ku16", L"𒉈", 3417},
+    {L"ku2", L"𒅥", 3403},
+    {L"ku3", L"𒆬", 3404},
+    {L"ku4", L"𒆭", 3405},
+    {L"ku4v1", L"𒆮", 3406},
+    {L"ku5", L"𒋻", 3407},
+    {L"ku6", L"𒄩", 3408},
+    {L"ku7", L"𒆯", 3409},
+    {L"ku8", L"𒄖", 3410},
+    {L"ku9", L"𒆰", 3411},
+    {L"kua", L"𒄩", 3418},
+    {L"kua2", L"𒌔", 3419},
+    {L"kuar", L"𒄩𒀀", 3420},
+    {L"kuar2", L"𒀀𒄩", 3421},
+    {L"kuara", L"𒄩𒀀", 3422},
+    {L"kuara2", L"𒀀𒄩", 3423},
+    {L"kub", L"𒁺", 3424},
+    {L"kub2", L"𒄽", 3425},
+    {L"kub3", L"𒄸", 3426},
+    {L"kub4", L"𒆤", 3427},
+    {L"kubabbar", L"𒆬𒌓", 3428},
+    {L"kud", L"𒋻", 3429},
+    {L"kud2", L"𒃰", 3430},
+    {L"kud3", L"𒆪", 3431},
+    {L"kud6", L"𒆑", 3432},
+    {L"kug", L"𒆬", 3433},
+    {L"kugal", L"𒇻𒄾", 3434},
+    {L"kugu", L"𒄭", 3435},
+    {L"kugur", L"𒅬", 3437},
+    {L"kuguv1", L"𒊹", 3436},
+    {L"kuia", L"𒌔", 3438},
+    {L"kuiav1", L"𒆵", 3439},
+    {L"kuk2L", L"𒆬", 3443},
+    {L"kuk2M", L"𒈖", 3442},
+    {L"kukL", L"𒈖", 3441},
+    {L"kukM", L"𒆬", 3440},
+    {L"kukki", L"𒆯𒆯𒆠", 3444},
+    {L"kukku", L"𒆯𒆯", 3445},
+    {L"kukku2", L"𒈪𒈪", 3446},
+    {L"kukku5", L"𒈪", 3447},
+    {L"kukkuda", L"𒆯", 3448},
+    {L"kukkuda2", L"𒅖", 3449},
+    {L"kukkuš", L"𒅖", 3450},
+    {L"kukkuša", L"𒆯", 3451},
+    {L"kukkuša2", L"𒅖", 3452},
+    {L"kuksu", L"𒋻", 3453},
+    {L"kuksu2L", L"𒁕𒁕", 3455},
+    {L"kuksu2M", L"𒆕𒋻", 3454},
+    {L"kukuda2", L"𒅖", 3456},
+    {L"kukula", L"𒆯", 3457},
+    {L"kukuša2", L"𒅖", 3458},
+    {L"kul", L"𒆰", 3459},
+    {L"kul2", L"𒄢", 3460},
+    {L"kulla", L"𒋞", 3461},
+    {L"kulu", L"𒆰", 3462},
+    {L"kum", L"𒄣", 3463},
+    {L"kum2", L"𒉈", 3464},
+    {L"kum3", L"𒉽𒅊𒉣𒈨𒂬", 3465},
+    {L"kum4", L"𒌓", 3466},
+    {L"kum5", L"𒅖", 3467},
+    {L"kun", L"𒆲", 3468},
+    {L"kun10", L"𒆥", 3477},
+    {L"kun2", L"𒉺", 3469},
+    {L"kun3", L"𒄣", 3470},
+    {L"kun4", L"𒄿𒇻", 3471},
+    {L"kun4v1", L"𒄿𒁳", 3472},
+    {L"kun5", L"𒌉𒂠", 3473},
+    {L"kun7", L"𒉈", 3474},
+    {L"kun8", L"𒈧", 3475},
+    {L"kun9", L"𒉈", 3476},
+    {L"kunga2L", L"𒋙𒀯", 3482},
+    {L"kunga2M", L"𒁇𒀭", 3480},
+    {L"kunga2Mv1", L"𒋙𒀭", 3481},
+    {L"kunga3", L"𒀯", 3483},
+    {L"kungaL", L"𒉺", 3479},
+    {L"kungaM", L"𒋙𒀯", 3478},
+    {L"kungal", L"𒇻𒄾", 3484},
+    {L"kungi", L"𒋙𒀯", 3485},
+    {L"kungi2", L"𒁇𒀭", 3486},
+    {L"kungi2v1", L"𒋙𒀭", 3487},
+    {L"kungi3", L"𒀯", 3488},
+    {L"kungil", L"𒌓𒅗𒈦", 3489},
+    {L"kunigara2L", L"𒀀𒇉𒀭𒈲", 3493},
+    {L"kunigara2M", L"𒀭𒈲", 3492},
+    {L"kunigara3L", L"𒀀𒇉𒀭𒌅", 3495},
+    {L"kunigara3M", L"𒀭𒌅", 3494},
+    {L"kunigara4L", L"𒀀𒇉𒀭𒈶", 3497},
+    {L"kunigara4M", L"𒀭𒈶", 3496},
+    {L"kunigara5", L"𒀀𒈖", 3498},
+    {L"kunigaraL", L"𒀀𒇉𒀭𒁈", 3491},
+    {L"kunigaraM", L"𒀭𒁈", 3490},
+    {L"kunin", L"𒇒", 3499},
+    {L"kunin2", L"𒆹", 3500},
+    {L"kunin3", L"𒇁", 3501},
+    {L"kunu", L"𒆲", 3502},
+    {L"kup", L"𒁺", 3503},
+    {L"kup2", L"𒄽", 3504},
+    {L"kup3", L"𒄸", 3505},
+    {L"kup4", L"𒆤", 3506},
+    {L"kur", L"𒆳", 3507},
+    {L"kur10", L"𒉺", 3518},
+    {L"kur11", L"𒉣𒆠", 3519},
+    {L"kur11v1", L"𒉩𒆠", 3520},
+    {L"kur12", L"𒍀", 3521},
+    {L"kur15", L"𒂵", 3522},
+    {L"kur2", L"𒉽", 3508},
+    {L"kur3", L"𒄥", 3509},
+    {L"kur4", L"𒆸", 3510},
+    {L"kur5", L"𒋻", 3511},
+    {L"kur6", L"𒉻", 3512},
+    {L"kur7", L"𒅆𒂟", 3513},
+    {L"kur7v1", L"𒅆𒃻", 3514},
+    {L"kur8", L"𒅥", 3515},
+    {L"kur9", L"𒆭", 3516},
+    {L"kur9v1", L"𒋽", 3517},
+    {L"kura", L"𒆳", 3523},
+    {L"kurku", L"𒈨𒀭𒊺𒉀", 3524},
+    {L"kurku2", L"𒅗𒀭𒉌𒋛", 3525},
+    {L"kurnun", L"𒇳", 3526},
+    {L"kuru", L"𒆳", 3527},
+    {L"kuru11", L"𒉣𒆠", 3533},
+    {L"kuru11v1", L"𒉩𒆠", 3534},
+    {L"kuru13", L"𒄦", 3535},
+    {L"kuru14", L"𒂊𒌈", 3536},
+    {L"kuru16", L"𒂊𒋤", 3537},
+    {L"kuru2", L"𒉽", 3528},
+    {L"kuru4", L"𒆸", 3529},
+    {L"kuru5", L"𒋻", 3530},
+    {L"kuru7", L"𒅆𒂟", 3531},
+    {L"kuru7v1", L"𒅆𒃻", 3532},
+    {L"kurud", L"𒉣𒆠", 3538},
+    {L"kuruda", L"𒉣𒆠", 3540},
+    {L"kurudav1", L"𒉩𒆠", 3541},
+    {L"kurudv1", L"𒉩𒆠", 3539},
+    {L"kurum10", L"𒂁", 3546},
+    {L"kurum5", L"𒋻", 3542},
+    {L"kurum6", L"𒉻", 3543},
+    {L"kurum7", L"𒅆𒂟", 3544},
+    {L"kurum7v1", L"𒅆𒃻", 3545},
+    {L"kurun", L"𒁉𒁷", 3547},
+    {L"kurun2", L"𒁷", 3548},
+    {L"kurun3", L"𒂁", 3549},
+    {L"kurun4", L"𒃾", 3550},
+    {L"kurun5", L"𒁉𒈪", 3551},
+    {L"kurun6", L"𒄧", 3552},
+    {L"kuruš", L"𒆯", 3553},
+    {L"kurušda", L"𒆯", 3554},
+    {L"kus", L"𒋢", 3555},
+    {L"kus2", L"𒈝", 3556},
+    {L"kuski", L"𒆬𒄀", 3557},
+    {L"kut", L"𒋻", 3584},
+    {L"kut2", L"𒃰", 3585},
+    {L"kutu", L"𒋻", 3586},
+    {L"kutu2L", L"𒇽𒊏𒊏", 3588},
+    {L"kutu2M", L"𒊏𒊏", 3587},
+    {L"kuz", L"𒋢", 3591},
+    {L"kuz2", L"𒈝", 3592},
+    {L"kuz3", L"𒆪", 3593},
+    {L"kuzbi", L"𒌑", 3594},
+    {L"kuzbu", L"𒌑", 3595},
+    {L"kuzu", L"𒌋𒄊", 3596},
+    {L"kuzuv1", L"𒌋𒊊", 3597},
+    {L"kuš", L"𒋢", 3559},
+    {L"kuš10", L"𒎔", 3569},
+    {L"kuš10v1", L"𒉾", 3570},
+    {L"kuš2", L"𒊨", 3560},
+    {L"kuš3", L"𒌑", 3561},
+    {L"kuš4", L"𒉺𒀭", 3562},
+    {L"kuš5", L"𒌋𒄊", 3563},
+    {L"kuš5v1", L"𒌋𒊊", 3564},
+    {L"kuš6", L"𒆯", 3565},
+    {L"kuš7", L"𒅖", 3566},
+    {L"kuš8", L"𒄾", 3567},
+    {L"kuš9", L"𒆵", 3568},
+    {L"kušdim", L"𒄞", 3571},
+    {L"kušgim", L"𒄞", 3572},
+    {L"kušlug", L"𒆠𒉈", 3573},
+    {L"kušu", L"𒌋𒄊", 3574},
+    {L"kušu2", L"𒆵", 3576},
+    {L"kušu3", L"𒌔", 3577},
+    {L"kušu4", L"𒊨", 3578},
+    {L"kušum", L"𒁉𒈜", 3579},
+    {L"kušum2", L"𒈜", 3580},
+    {L"kušum3", L"𒄞", 3581},
+    {L"kušum4", L"𒌋𒄊", 3582},
+    {L"kušum4v1", L"𒌋𒊊", 3583},
+    {L"kušuv1", L"𒌋𒊊", 3575},
+    {L"kuṣ2", L"𒈝", 3558},
+    {L"kuṭ", L"𒋻", 3589},
+    {L"kuṭ2", L"𒃰", 3590},
+    {L"la", L"𒆷", 3609},
+    {L"la10", L"𒋃", 3618},
+    {L"la11", L"𒇴", 3619},
+    {L"la12", L"𒇴", 3620},
+    {L"la2", L"𒇲", 3610},
+    {L"la3", L"𒉡", 3611},
+    {L"la4L", L"𒁻", 3613},
+    {L"la4M", L"𒁺𒁺", 3612},
+    {L"la5", L"𒇳", 3614},
+    {L"la6", L"𒄨", 3615},
+    {L"la7", L"𒌓", 3616},
+    {L"la8", L"𒂔", 3617},
+    {L"lab", L"𒄨", 3621},
+    {L"lab2", L"𒈜", 3622},
+    {L"laban", L"𒂯", 3623},
+    {L"labat", L"𒆒𒋙", 3624},
+    {L"lad", L"𒆳", 3625},
+    {L"lae", L"𒆷", 3626},
+    {L"lag", L"𒋃", 3627},
+    {L"lagab", L"𒆸", 3628},
+    {L"lagab2", L"𒇥", 3629},
+    {L"lagal", L"𒇬", 3630},
+    {L"lagar", L"𒇬", 3631},
+    {L"lagar2", L"𒊩𒈨", 3632},
+    {L"lagar3", L"𒊩𒄸", 3633},
+    {L"lagas", L"𒋓𒁓𒆷", 3634},
+    {L"lagaš", L"𒋓𒁓𒆷", 3635},
+    {L"lagaša", L"𒋓𒁓𒆷", 3636},
+    {L"lak", L"𒋃", 3668},
+    {L"laka", L"𒋃", 3669},
+    {L"lal", L"𒇲", 3670},
+    {L"lal2", L"𒇳", 3671},
+    {L"lal3", L"𒋭", 3672},
+    {L"lal4L", L"𒋭", 3674},
+    {L"lal4M", L"𒇸", 3673},
+    {L"lal5", L"𒋙𒌍", 3675},
+    {L"lal6", L"𒋙𒉈", 3676},
+    {L"lala2", L"𒄨", 3677},
+    {L"lalaḫ", L"𒁻𒁻", 3678},
+    {L"lalaḫ2", L"𒁺𒁺", 3679},
+    {L"lalla", L"𒇳", 3680},
+    {L"lalla2", L"𒅆𒅆", 3681},
+    {L"lallal", L"𒇳", 3682},
+    {L"lalʾu", L"𒇳", 3683},
+    {L"lalʾu2", L"𒇳𒀀", 3684},
+    {L"lalʾu3", L"𒇳𒉌", 3685},
+    {L"lalʾu4", L"𒇳𒆕", 3686},
+    {L"lalʾu5L", L"𒇳𒌋", 3688},
+    {L"lalʾu5M", L"𒇲𒀀", 3687},
+    {L"lalʾu6", L"𒇲𒉌", 3689},
+    {L"lalʾu7", L"𒇲𒆕", 3690},
+    {L"lam", L"𒇴", 3691},
+    {L"lam2", L"𒉈", 3692},
+    {L"lam3", L"𒁮", 3693},
+    {L"lam4", L"𒇹", 3694},
+    {L"lam4v1", L"𒐂", 3695},
+    {L"lam5", L"𒅆", 3696},
+    {L"lam6", L"𒉆", 3697},
+    {L"lam7", L"𒇵", 3698},
+    {L"lama", L"𒇴", 3699},
+    {L"lama2L", L"𒄨", 3701},
+    {L"lama2M", L"𒉈", 3700},
+    {L"lama3", L"𒄨", 3702},
+    {L"lamar", L"𒄨", 3705},
+    {L"lamaḫušL", L"𒌆𒍤𒆸", 3704},
+    {L"lamaḫušM", L"𒍤𒆸", 3703},
+    {L"lambi", L"𒊬", 3706},
+    {L"lamga", L"𒉄", 3707},
+    {L"lamma", L"𒄨", 3709},
+    {L"lammar", L"𒄨", 3710},
+    {L"lammu", L"𒐼", 3711},
+    {L"lammu2", L"𒇹", 3712},
+    {L"lammu2v1", L"𒐂", 3713},
+    {L"lammu4", L"𒇇", 3714},
+    {L"lammu6", L"𒇉", 3715},
+    {L"lammubi", L"𒄴", 3716},
+    {L"lamḫu", L"𒆴", 3708},
+    {L"lan", L"𒇸", 3717},
+    {L"lap", L"𒄨", 3718},
+    {L"laq", L"𒋃", 3719},
+    {L"lar", L"𒉺", 3720},
+    {L"larag", L"𒌓𒌓𒀝", 3721},
+    {L"larag2", L"𒌓𒌓", 3722},
+    {L"larsa", L"𒌓𒀕", 3723},
+    {L"larsa2", L"𒌓𒀊", 3724},
+    {L"larsam", L"𒌓𒀕", 3725},
+    {L"larsam2", L"𒌓𒀊", 3726},
+    {L"lat", L"𒆳", 3727},
+    {L"lata", L"𒆳", 3728},
+    {L"laʾu", L"𒇳", 3730},
+    {L"laʾu2", L"𒇳𒀀", 3731},
+    {L"laʾu3", L"𒇳𒉌", 3732},
+    {L"laʾu4", L"𒇳𒆕", 3733},
+    {L"laʾu5L", L"𒇳𒌋", 3735},
+    {L"laʾu5M", L"𒇲𒀀", 3734},
+    {L"laʾu6", L"𒇲𒉌", 3736},
+    {L"laʾu7", L"𒇲𒆕", 3737},
+    {L"laḫ", L"𒌓", 3637},
+    {L"laḫ2", L"𒎕", 3638},
+    {L"laḫ3", L"𒈛", 3639},
+    {L"laḫ4", L"𒁻", 3640},
+    {L"laḫ5", L"𒁺𒁺", 3641},
+    {L"laḫ6", L"𒁺", 3642},
+    {L"laḫ7", L"𒁽", 3643},
+    {L"laḫa3", L"𒈛", 3644},
+    {L"laḫar", L"𒇇", 3645},
+    {L"laḫar2", L"𒁱", 3646},
+    {L"laḫra", L"𒀾𒀀𒀭", 3648},
+    {L"laḫru", L"𒇇", 3649},
+    {L"laḫru2", L"𒁱", 3650},
+    {L"laḫrum", L"𒇇", 3651},
+    {L"laḫrum2L", L"𒋠", 3653},
+    {L"laḫrum2M", L"𒁱", 3652},
+    {L"laḫta2", L"𒉶", 3657},
+    {L"laḫta3", L"𒉹", 3658},
+    {L"laḫta4", L"𒉵", 3659},
+    {L"laḫta5", L"𒉰", 3660},
+    {L"laḫta6", L"𒁤", 3661},
+    {L"laḫtaL", L"𒁤", 3656},
+    {L"laḫtaM", L"𒉴", 3655},
+    {L"laḫtan", L"𒉴", 3662},
+    {L"laḫtan2", L"𒉶", 3663},
+    {L"laḫtan3", L"𒉹", 3664},
+    {L"laḫtan4", L"𒉵", 3665},
+    {L"laḫtan5", L"𒉰", 3666},
+    {L"laḫtan6", L"𒁤", 3667},
+    {L"laḫšu", L"𒇱", 3654},
+    {L"laḫḫušu", L"𒋟", 3647},
+    {L"laṭ", L"𒆳", 3729},
+    {L"le", L"𒇷", 3738},
+    {L"le10", L"𒁕", 3744},
+    {L"le2", L"𒉌", 3739},
+    {L"le3", L"𒅆", 3740},
+    {L"le4", L"𒀭", 3741},
+    {L"le8", L"𒀖", 3742},
+    {L"le9", L"𒉈", 3743},
+    {L"leb", L"𒈜", 3745},
+    {L"lel2", L"𒆤", 3746},
+    {L"lel4", L"𒆦", 3747},
+    {L"lelle", L"𒅆𒅆", 3748},
+    {L"lelli", L"𒅆𒅆", 3749},
+    {L"lem", L"𒅆", 3750},
+    {L"lem4", L"𒉈", 3751},
+    {L"lep2", L"𒄨", 3752},
+    {L"leq", L"𒌨", 3753},
+    {L"li", L"𒇷", 3754},
+    {L"li11", L"𒉣", 3765},
+    {L"li12", L"𒇺", 3766},
+    {L"li13", L"𒉋", 3767},
+    {L"li2", L"𒉌", 3755},
+    {L"li3", L"𒅆", 3756},
+    {L"li4", L"𒀭", 3757},
+    {L"li5L", L"𒁹", 3759},
+    {L"li5M", L"𒊭", 3758},
+    {L"li6L", L"𒁹", 3761},
+    {L"li6M", L"𒃶", 3760},
+    {L"li7", L"𒌨", 3762},
+    {L"li8", L"𒀖", 3763},
+    {L"li9", L"𒉈", 3764},
+    {L"lib", L"𒈜", 3768},
+    {L"lib2", L"𒄨", 3769},
+    {L"lib3", L"𒊮", 3770},
+    {L"lib4", L"𒅆", 3771},
+    {L"lib5", L"𒊤", 3772},
+    {L"lib5v1", L"𒊠", 3773},
+    {L"libi", L"𒈜", 3774},
+    {L"libin", L"𒂱", 3775},
+    {L"libir", L"𒅆𒂠", 3776},
+    {L"libit", L"𒁀", 3778},
+    {L"libitv1", L"𒁀𒌑", 3779},
+    {L"libiš", L"𒀚", 3777},
+    {L"lid", L"𒀖", 3780},
+    {L"lid2", L"𒉌", 3781},
+    {L"lidda2", L"𒊮𒁹", 3784},
+    {L"liddaL", L"𒋖𒄑", 3783},
+    {L"liddaM", L"𒋖", 3782},
+    {L"lidim", L"𒀢", 3785},
+    {L"lig", L"𒌨", 3786},
+    {L"lig2", L"𒋃", 3787},
+    {L"ligidba2", L"𒋆𒀭𒈦", 3790},
+    {L"ligidbaL", L"𒋆𒀭𒈦", 3789},
+    {L"ligidbaM", L"𒋆𒀭𒎏𒅁", 3788},
+    {L"ligim", L"𒅆𒌉𒌉", 3791},
+    {L"lik", L"𒌨", 3796},
+    {L"lik2", L"𒋃", 3797},
+    {L"liki", L"𒌨", 3798},
+    {L"lil", L"𒇸", 3799},
+    {L"lil2", L"𒆤", 3800},
+    {L"lil3", L"𒋙𒌍", 3801},
+    {L"lil5", L"𒋙𒉈", 3802},
+    {L"lil6", L"𒄘", 3803},
+    {L"lil7", L"𒁃", 3804},
+    {L"lil8", L"𒈑", 3805},
+    {L"lilib", L"𒅆𒅆", 3806},
+    {L"lilis", L"𒀗", 3807},
+    {L"liliz", L"𒀗", 3808},
+    {L"lillan", L"𒈗", 3809},
+    {L"lille", L"𒅆𒅆", 3810},
+    {L"lilli", L"𒅆𒅆", 3811},
+    {L"lillu", L"𒁃", 3812},
+    {L"lim", L"𒅆", 3813},
+    {L"lim2", L"𒇹", 3814},
+    {L"lim2v1", L"𒐂", 3815},
+    {L"lim3", L"𒇴", 3816},
+    {L"limi", L"𒅆", 3817},
+    {L"limmu2", L"𒇹", 3820},
+    {L"limmu2v1", L"𒐂", 3821},
+    {L"limmu3", L"𒐏", 3822},
+    {L"limmu4", L"𒐽", 3823},
+    {L"limmu5", L"𒐉", 3824},
+    {L"limmu6", L"𒑖", 3825},
+    {L"limmuL", L"𒐏", 3819},
+    {L"limmuM", L"𒐼", 3818},
+    {L"limu", L"𒐼", 3826},
+    {L"lip", L"𒈜", 3827},
+    {L"lip2", L"𒄨", 3828},
+    {L"lip3", L"𒊮", 3829},
+    {L"lipiš", L"𒀚", 3830},
+    {L"liq", L"𒌨", 3831},
+    {L"liq2", L"𒋃", 3832},
+    {L"liq3", L"𒀀𒄷𒋛", 3833},
+    {L"lir", L"𒉪", 3834},
+    {L"liri", L"𒋗𒄨", 3835},
+    {L"liri2", L"𒀸", 3836},
+    {L"liri3", L"𒄒", 3837},
+    {L"liri4", L"𒀉𒄨", 3838},
+    {L"liri5", L"𒀉𒀸", 3839},
+    {L"liri6", L"𒉫", 3840},
+    {L"liri7", L"𒆙", 3841},
+    {L"liri8", L"𒌩", 3842},
+    {L"liru", L"𒋗𒄨", 3843},
+    {L"liru2", L"𒀸", 3844},
+    {L"liru3", L"𒄒", 3845},
+    {L"liru4", L"𒀉𒄨", 3846},
+    {L"liru5", L"𒀉𒀸", 3847},
+    {L"liru6", L"𒉫", 3848},
+    {L"liru7", L"𒆙", 3849},
+    {L"liru8", L"𒌩", 3850},
+    {L"lirum", L"𒋗𒄨", 3851},
+    {L"lirum2", L"𒀸", 3852},
+    {L"lirum3", L"𒄒", 3853},
+    {L"lirum4", L"𒀉𒄨", 3854},
+    {L"lirum5", L"𒀉𒀸", 3855},
+    {L"lirum6", L"𒉫", 3856},
+    {L"lirum7", L"𒆙", 3857},
+    {L"lirum8", L"𒌩", 3858},
+    {L"lis", L"𒇺", 3859},
+    {L"lisiL", L"𒉈", 3861},
+    {L"lisiM", L"𒉈𒋜", 3860},
+    {L"lisin", L"𒉈𒋜", 3862},
+    {L"lit", L"𒀖", 3864},
+    {L"liti", L"𒀖", 3865},
+    {L"liz", L"𒇺", 3869},
+    {L"liš", L"𒇺", 3863},
+    {L"liḫ", L"𒌓", 3792},
+    {L"liḫ2", L"𒎕", 3793},
+    {L"liḫ3", L"𒈛", 3794},
+    {L"liḫ4", L"𒇺", 3795},
+    {L"liṭ", L"𒀖", 3866},
+    {L"liṭ2", L"𒂁", 3867},
+    {L"liṭi", L"𒀖", 3868},
+    {L"lu", L"𒇻", 3870},
+    {L"lu2", L"𒇽", 3871},
+    {L"lu3", L"𒈖", 3872},
+    {L"lu4", L"𒈝", 3873},
+    {L"lu5", L"𒈜", 3874},
+    {L"lu6", L"𒌨", 3875},
+    {L"lu7", L"𒍇", 3876},
+    {L"lu8", L"𒌷", 3877},
+    {L"lu9", L"𒉺", 3878},
+    {L"lub", L"𒈜", 3879},
+    {L"lubud", L"𒁶", 3880},
+    {L"lubun", L"𒂲", 3881},
+    {L"lud", L"𒂁", 3882},
+    {L"lug", L"𒇻", 3883},
+    {L"lug2", L"𒉺", 3884},
+    {L"luga", L"𒉺𒂷", 3885},
+    {L"lugal", L"𒈗", 3886},
+    {L"lugala", L"𒈗", 3887},
+    {L"lugud", L"𒁁𒌓", 3888},
+    {L"lugud2", L"𒆸", 3889},
+    {L"lugud3", L"𒈟", 3890},
+    {L"lugud4", L"𒇮", 3891},
+    {L"luguruš", L"𒇽𒍑", 3892},
+    {L"lukur", L"𒊩𒈨", 3899},
+    {L"lul", L"𒈜", 3900},
+    {L"lulim", L"𒄎", 3901},
+    {L"lulima", L"𒄎", 3902},
+    {L"lulu", L"𒈜", 3903},
+    {L"lum", L"𒈝", 3904},
+    {L"lum2", L"𒅆", 3906},
+    {L"lum3", L"𒂁", 3907},
+    {L"lum4", L"𒇴", 3908},
+    {L"lumgi2", L"𒋇", 3911},
+    {L"lumgi3", L"𒋋", 3912},
+    {L"lumgiL", L"𒋋", 3910},
+    {L"lumgiM", L"𒋆", 3909},
+    {L"lumu", L"𒈝", 3915},
+    {L"lumu3", L"𒂁", 3916},
+    {L"lumv1", L"𒋞", 3905},
+    {L"lumḫa", L"𒂀", 3913},
+    {L"lumḫa2", L"𒂕", 3914},
+    {L"lun", L"𒉺", 3917},
+    {L"lunga2", L"𒋇", 3920},
+    {L"lunga3", L"𒋋", 3921},
+    {L"lungaL", L"𒋇", 3919},
+    {L"lungaM", L"𒋆", 3918},
+    {L"lungi", L"𒋋", 3922},
+    {L"lup", L"𒈜", 3923},
+    {L"lut", L"𒂁", 3924},
+    {L"lutu", L"𒂁", 3925},
+    {L"luḫ", L"𒈛", 3893},
+    {L"luḫu", L"𒈛", 3896},
+    {L"luḫum", L"𒈝𒈝", 3897},
+    {L"luḫummu", L"𒄑𒈪", 3898},
+    {L"luḫša", L"𒄴𒈨𒌋", 3894},
+    {L"luḫšu", L"𒄴𒈨𒌋", 3895},
+    {L"luṭ", L"𒂁", 3926},
+    {L"luṭu", L"𒂁", 3927},
+    {L"m", L"𒁹", 3929},
+    {L"ma", L"𒈠", 3934},
+    {L"ma10", L"𒎙", 3943},
+    {L"ma2", L"𒈣", 3935},
+    {L"ma3", L"𒂷", 3936},
+    {L"ma4", L"𒊬", 3937},
+    {L"ma5", L"𒅡", 3938},
+    {L"ma6", L"𒈨", 3939},
+    {L"ma7", L"𒈦", 3940},
+    {L"ma8", L"𒅿", 3941},
+    {L"ma9", L"𒉿", 3942},
+    {L"mabi", L"𒈻", 3944},
+    {L"mabi2L", L"𒍝𒈹𒁲", 3946},
+    {L"mabi2M", L"𒀀𒈹𒁲", 3945},
+    {L"mabi3", L"𒍝𒈹𒁲", 3947},
+    {L"mad", L"𒆳", 3948},
+    {L"madal", L"𒁍", 3949},
+    {L"madla", L"𒁍", 3950},
+    {L"madlu", L"𒁍", 3951},
+    {L"maganza", L"𒁗", 3952},
+    {L"magar", L"𒁑", 3953},
+    {L"magara", L"𒁑", 3954},
+    {L"makaš", L"𒁹", 3961},
+    {L"makaš2", L"𒀸", 3962},
+    {L"makkaš", L"𒁹", 3963},
+    {L"makkaš2", L"𒀸", 3964},
+    {L"mal", L"𒂷", 3965},
+    {L"mal2", L"𒋛𒀀", 3966},
+    {L"mal3", L"𒅅", 3967},
+    {L"mal4", L"𒇺", 3968},
+    {L"mala", L"𒂷", 3969},
+    {L"malala", L"𒋤", 3970},
+    {L"malba", L"𒆠𒇴", 3971},
+    {L"malga", L"𒂏", 3972},
+    {L"malgav1", L"𒃌", 3973},
+    {L"malla", L"𒁍", 3974},
+    {L"mam", L"𒎙", 3975},
+    {L"mam2", L"𒊩", 3976},
+    {L"mam3", L"𒊩𒈠", 3977},
+    {L"mammi", L"𒈻", 3978},
+    {L"mammi2L", L"𒍝𒈹𒁲", 3980},
+    {L"mammi2M", L"𒀀𒈹𒁲", 3979},
+    {L"mammi3", L"𒍝𒈹𒁲", 3981},
+    {L"man", L"𒎙", 3982},
+    {L"man2", L"𒊩", 3983},
+    {L"man3", L"𒐀", 3984},
+    {L"mana", L"𒎙", 3985},
+    {L"mangaga", L"𒅾", 3986},
+    {L"manu", L"𒉽𒉽", 3987},
+    {L"mar", L"𒈥", 3988},
+    {L"mar2", L"𒀫", 3989},
+    {L"mar3", L"𒃻", 3990},
+    {L"mar4", L"𒋞", 3991},
+    {L"mar5", L"𒌉", 3992},
+    {L"mar6", L"𒄯", 3993},
+    {L"mara", L"𒈥", 3994},
+    {L"mara2", L"𒀫", 3995},
+    {L"mara3", L"𒃻", 3996},
+    {L"mara5", L"𒌉", 3997},
+    {L"marad", L"𒀫", 3998},
+    {L"marad2", L"𒀫𒁕", 3999},
+    {L"marduk", L"𒀫𒌓", 4000},
+    {L"maru", L"𒌉", 4001},
+    {L"maru5", L"𒌉", 4002},
+    {L"marun", L"𒇇", 4003},
+    {L"mas", L"𒈦", 4004},
+    {L"massa", L"𒁥", 4005},
+    {L"massa2", L"𒁗", 4006},
+    {L"mat", L"𒆳", 4021},
+    {L"mat2", L"𒁁", 4022},
+    {L"mat3", L"𒄷𒄭", 4023},
+    {L"maš", L"𒈦", 4008},
+    {L"maš2", L"𒈧", 4009},
+    {L"maš3", L"𒈦𒉺", 4010},
+    {L"maš4", L"𒉺", 4011},
+    {L"mašda", L"𒈦𒆕", 4012},
+    {L"mašda2", L"𒈦𒂗𒆕", 4013},
+    {L"mašda3", L"𒈦𒆕𒂗", 4014},
+    {L"mašda4", L"𒂗𒈦𒆕", 4015},
+    {L"mašdu", L"𒈦𒅄", 4016},
+    {L"mašgi", L"𒌐", 4017},
+    {L"maškim", L"𒑐𒁽", 4018},
+    {L"maškim2", L"𒑐𒁼", 4019},
+    {L"maškim3", L"𒑐𒁺", 4020},
+    {L"maʾ", L"𒈣", 4025},
+    {L"maḫ", L"𒈤", 3955},
+    {L"maḫ2L", L"𒅆", 3957},
+    {L"maḫ2M", L"𒀠", 3956},
+    {L"maḫ3", L"𒌋𒅗", 3958},
+    {L"maḫa", L"𒈤", 3959},
+    {L"maḫar2", L"𒌋𒊬", 3960},
+    {L"maṣ", L"𒈦", 4007},
+    {L"maṭ", L"𒆳", 4024},
+    {L"me", L"𒈨", 4026},
+    {L"me10", L"𒅎", 4036},
+    {L"me11", L"𒀟", 4037},
+    {L"me2", L"𒈪", 4027},
+    {L"me3", L"𒅠", 4028},
+    {L"me3v1", L"𒀞", 4029},
+    {L"me4", L"𒁁", 4030},
+    {L"me5", L"𒀀", 4031},
+    {L"me6", L"𒀝", 4032},
+    {L"me7", L"𒃙", 4033},
+    {L"me8", L"𒉿", 4034},
+    {L"me9", L"𒇞", 4035},
+    {L"mebulug", L"𒍏", 4038},
+    {L"mebulug2", L"𒁒", 4040},
+    {L"mebulugv1", L"𒁾", 4039},
+    {L"medda", L"𒆪𒀭", 4041},
+    {L"medda2", L"𒆪𒁁", 4042},
+    {L"meddu2L", L"𒄑𒆪𒁁", 4046},
+    {L"meddu2M", L"𒆪𒁁", 4045},
+    {L"medduL", L"𒄑𒆪𒀭", 4044},
+    {L"medduM", L"𒆪𒀭", 4043},
+    {L"megida2", L"𒋰𒆲", 4049},
+    {L"megidaL", L"𒋰𒀭𒌋", 4048},
+    {L"megidaM", L"𒋰𒋾", 4047},
+    {L"megidda2", L"𒋰𒆲", 4052},
+    {L"megiddaL", L"𒋰𒀭𒌋", 4051},
+    {L"megiddaM", L"𒋰𒋾", 4050},
+    {L"mel3", L"𒆠𒉈", 4059},
+    {L"melL", L"𒆠𒉈", 4058},
+    {L"melM", L"𒅖", 4057},
+    {L"mele2", L"𒅲", 4060},
+    {L"meli2", L"𒅲", 4061},
+    {L"men", L"𒃞", 4062},
+    {L"men2", L"𒈨", 4063},
+    {L"men3", L"𒁺", 4064},
+    {L"men4", L"𒇙", 4065},
+    {L"men5", L"𒎙", 4066},
+    {L"menari", L"𒃻", 4067},
+    {L"menbulug", L"𒍏", 4068},
+    {L"menbulug2", L"𒁒", 4070},
+    {L"menbulugv1", L"𒁾", 4069},
+    {L"mer", L"𒂇", 4071},
+    {L"mer2", L"𒅎", 4072},
+    {L"mer3", L"𒄈", 4073},
+    {L"mer4", L"𒋃", 4074},
+    {L"mere", L"𒂇", 4075},
+    {L"meri3", L"𒄈", 4076},
+    {L"merimer", L"𒂛", 4077},
+    {L"merimer2", L"𒂝", 4078},
+    {L"merimer3", L"𒅐", 4079},
+    {L"merimer4", L"𒅒", 4080},
+    {L"merimeri", L"𒂛", 4081},
+    {L"merimeri2", L"𒂝", 4082},
+    {L"merimeri3", L"𒅐", 4083},
+    {L"merimeri4", L"𒅒", 4084},
+    {L"mermer", L"𒂛", 4085},
+    {L"mermer2", L"𒂝", 4086},
+    {L"mermer3", L"𒅐", 4087},
+    {L"mermer4", L"𒅒", 4088},
+    {L"mermeri", L"𒂛", 4089},
+    {L"mermeri2", L"𒂝", 4090},
+    {L"mermeri3", L"𒅐", 4091},
+    {L"mermeri4", L"𒅒", 4092},
+    {L"mes", L"𒈩", 4093},
+    {L"mes2", L"𒁾", 4094},
+    {L"mes3", L"𒎌", 4095},
+    {L"mesa", L"𒈩", 4096},
+    {L"met", L"𒁁", 4101},
+    {L"met2", L"𒂍", 4102},
+    {L"mete", L"𒋼𒈨", 4103},
+    {L"metta", L"𒆪𒀭", 4104},
+    {L"metta2", L"𒆪𒁁", 4105},
+    {L"mettu", L"𒆪𒀭", 4106},
+    {L"mettu2", L"𒆪𒁁", 4107},
+    {L"mez", L"𒈩", 4109},
+    {L"meze", L"𒀙", 4110},
+    {L"meze2", L"𒈬𒁍", 4111},
+    {L"mezeg", L"𒋄", 4112},
+    {L"mezem", L"𒋄", 4113},
+    {L"mezer", L"𒈬𒁍", 4114},
+    {L"meš", L"𒎌", 4098},
+    {L"meš2", L"𒈨", 4099},
+    {L"meš3", L"𒈩", 4100},
+    {L"meḫ", L"𒈤", 4053},
+    {L"meḫida", L"𒈬", 4054},
+    {L"meḫidi", L"𒈬", 4055},
+    {L"meḫidu", L"𒈬", 4056},
+    {L"meṣ", L"𒈩", 4097},
+    {L"meṭ", L"𒁁", 4108},
+    {L"mi", L"𒈪", 4115},
+    {L"mi2", L"𒊩", 4116},
+    {L"mi3", L"𒈨", 4117},
+    {L"mi4", L"𒃞", 4118},
+    {L"mi5", L"𒉿", 4119},
+    {L"mibulug", L"𒍏", 4120},
+    {L"mibulug2", L"𒁒", 4122},
+    {L"mibulugv1", L"𒁾", 4121},
+    {L"mid", L"𒁁", 4123},
+    {L"mid2", L"𒂍", 4124},
+    {L"midda2", L"𒆪𒁁", 4127},
+    {L"middaL", L"𒄑𒆪𒀭", 4126},
+    {L"middaM", L"𒆪𒀭", 4125},
+    {L"middu2", L"𒆪𒁁", 4130},
+    {L"midduL", L"𒄑𒆪𒀭", 4129},
+    {L"midduM", L"𒆪𒀭", 4128},
+    {L"midra", L"𒉺", 4131},
+    {L"migir", L"𒂇", 4132},
+    {L"migir2", L"𒂈", 4133},
+    {L"mil", L"𒅖", 4135},
+    {L"mili", L"𒅖", 4136},
+    {L"mili2", L"𒅲", 4137},
+    {L"millaL", L"𒍥𒅖𒌓", 4139},
+    {L"millaM", L"𒅖", 4138},
+    {L"mim", L"𒊩", 4140},
+    {L"mim2", L"𒈹", 4141},
+    {L"mim3", L"𒎙", 4142},
+    {L"mim4", L"𒊩𒈠", 4143},
+    {L"min", L"𒈫", 4144},
+    {L"min2", L"𒊩", 4145},
+    {L"min3", L"𒎙", 4146},
+    {L"min4", L"𒎏", 4147},
+    {L"min4v1", L"𒊩𒈠", 4148},
+    {L"min5", L"𒐀", 4149},
+    {L"min6", L"𒋰", 4150},
+    {L"min7", L"𒃞", 4151},
+    {L"min8", L"𒋰", 4152},
+    {L"mina", L"𒈫", 4153},
+    {L"mina3", L"𒎙", 4154},
+    {L"minbulug", L"𒍏", 4155},
+    {L"minbulug2", L"𒁒", 4157},
+    {L"minbulugv1", L"𒁾", 4156},
+    {L"mir", L"𒂇", 4158},
+    {L"mir2", L"𒅎", 4159},
+    {L"mir5", L"𒂨", 4160},
+    {L"miri", L"𒂇", 4161},
+    {L"mis", L"𒈩", 4162},
+    {L"misal", L"𒄐", 4163},
+    {L"mit", L"𒁁", 4169},
+    {L"mitta", L"𒆪𒀭", 4170},
+    {L"mitta2", L"𒆪𒁁", 4171},
+    {L"mittu", L"𒆪𒀭", 4172},
+    {L"mittu2", L"𒆪𒁁", 4173},
+    {L"mitum", L"𒆪𒀭", 4174},
+    {L"mitum2", L"𒆪𒁁", 4175},
+    {L"miš2", L"𒎌", 4167},
+    {L"miš3", L"𒄑", 4168},
+    {L"mišL", L"𒎌", 4166},
+    {L"mišM", L"𒈩", 4165},
+    {L"miḫ", L"𒈤", 4134},
+    {L"miṣ", L"𒈩", 4164},
+    {L"miṭ", L"𒁁", 4176},
+    {L"mu", L"𒈬", 4177},
+    {L"mu10", L"𒊩", 4186},
+    {L"mu11L", L"𒄘", 4188},
+    {L"mu11M", L"𒅿", 4187},
+    {L"mu12", L"𒄷𒄭", 4189},
+    {L"mu13", L"𒆀", 4190},
+    {L"mu14", L"𒀀", 4191},
+    {L"mu2", L"𒊬", 4178},
+    {L"mu3", L"𒅡", 4179},
+    {L"mu4", L"𒌆", 4180},
+    {L"mu5", L"𒉌", 4181},
+    {L"mu6", L"𒉺", 4182},
+    {L"mu7", L"𒅲", 4183},
+    {L"mu8", L"𒃻", 4184},
+    {L"mu9", L"𒄑", 4185},
+    {L"mua", L"𒉺", 4192},
+    {L"muati", L"𒉺", 4193},
+    {L"muatu", L"𒉺", 4194},
+    {L"mud", L"𒄷𒄭", 4195},
+    {L"mud2", L"𒁁", 4196},
+    {L"mud3", L"𒉯", 4197},
+    {L"mud3v1", L"𒉸", 4198},
+    {L"mud4", L"𒆸𒌋𒆕", 4199},
+    {L"mud5", L"𒋆", 4200},
+    {L"mud6", L"𒊬", 4201},
+    {L"mud7", L"𒍤𒆸", 4202},
+    {L"mud8", L"𒉳", 4203},
+    {L"mudla", L"𒁍", 4204},
+    {L"mudluL", L"𒄑𒁍", 4206},
+    {L"mudluM", L"𒁍", 4205},
+    {L"mudra3", L"𒁍", 4209},
+    {L"mudra5", L"𒋠𒁍", 4210},
+    {L"mudra6", L"𒈬𒁍", 4211},
+    {L"mudraL", L"𒈬𒁍", 4208},
+    {L"mudraM", L"𒉺", 4207},
+    {L"mudru", L"𒉺", 4212},
+    {L"mudru2", L"𒂗𒌆𒀀", 4213},
+    {L"mudru3L", L"𒌆𒁍", 4215},
+    {L"mudru3M", L"𒁍", 4214},
+    {L"mudru4L", L"𒁱", 4217},
+    {L"mudru4M", L"𒋠𒀸", 4216},
+    {L"mudru5", L"𒋠𒁍", 4218},
+    {L"mudru6", L"𒈬𒁍", 4219},
+    {L"mudrum3", L"𒁍", 4220},
+    {L"mudrum4", L"𒋠𒀸", 4221},
+    {L"mudulL", L"𒄑𒁍", 4223},
+    {L"mudulM", L"𒁍", 4222},
+    {L"mug", L"𒈮", 4224},
+    {L"mug2", L"𒊩𒆷", 4225},
+    {L"mug3", L"𒈯", 4226},
+    {L"muia", L"𒉺", 4231},
+    {L"muk", L"𒈮", 4232},
+    {L"muk3", L"𒈯", 4233},
+    {L"mul", L"𒀯", 4234},
+    {L"mul2", L"𒋼", 4235},
+    {L"mul3", L"𒄮", 4236},
+    {L"mul4", L"𒌌", 4237},
+    {L"mul5", L"𒃷", 4238},
+    {L"mulla", L"𒁍", 4239},
+    {L"mullav1", L"𒋼𒇲", 4240},
+    {L"mulu", L"𒀯", 4241},
+    {L"mulu4", L"𒃷", 4242},
+    {L"mum", L"𒌣", 4243},
+    {L"mun", L"𒁵", 4244},
+    {L"mun2", L"𒌣", 4245},
+    {L"mun4", L"𒋀", 4246},
+    {L"mun5", L"𒌋𒁵", 4247},
+    {L"mun6", L"𒌋𒁴", 4248},
+    {L"munsub", L"𒈰", 4249},
+    {L"munsub2", L"𒋁𒋦", 4250},
+    {L"munsub3", L"𒄛", 4251},
+    {L"munu", L"𒁵", 4254},
+    {L"munu2", L"𒆠𒉈", 4255},
+    {L"munu3", L"𒃅", 4256},
+    {L"munu4L", L"𒉽𒊺𒉽", 4258},
+    {L"munu4M", L"𒉽𒉽", 4257},
+    {L"munu5", L"𒉽𒊺𒉽", 4259},
+    {L"munu6", L"𒉽𒉽", 4260},
+    {L"munu9", L"𒅎𒂂", 4261},
+    {L"munus", L"𒊩", 4262},
+    {L"munuz", L"𒊩", 4263},
+    {L"munzer", L"𒆠𒀭𒋀𒆠", 4264},
+    {L"munzur", L"𒆠𒀭𒋀𒆠", 4265},
+    {L"munšub", L"𒈰", 4252},
+    {L"munšub2", L"𒋁𒋦", 4253},
+    {L"muparra", L"𒌆𒋠𒁍", 4266},
+    {L"muparrav1", L"𒌆𒋠𒋤", 4267},
+    {L"muparru", L"𒌆𒋠𒁍", 4268},
+    {L"muparruv1", L"𒌆𒋠𒋤", 4269},
+    {L"muq", L"𒈮", 4270},
+    {L"muq3", L"𒈯", 4271},
+    {L"mur", L"𒄯", 4272},
+    {L"mur10", L"𒌆", 4278},
+    {L"mur2", L"𒌘", 4273},
+    {L"mur3", L"𒅎", 4274},
+    {L"mur6", L"𒆠𒂗𒆕", 4275},
+    {L"mur7", L"𒋞", 4276},
+    {L"mur8", L"𒈱", 4277},
+    {L"murgišur", L"𒂢", 4279},
+    {L"murgu", L"𒋞", 4280},
+    {L"murgu2L", L"𒅺", 4282},
+    {L"murgu2M", L"𒈱", 4281},
+    {L"murgu3", L"𒅺", 4283},
+    {L"muri", L"𒌘", 4284},
+    {L"murim", L"𒅎", 4285},
+    {L"muru", L"𒄯", 4286},
+    {L"muru11", L"𒉞", 4294},
+    {L"muru12", L"𒆤", 4295},
+    {L"muru13", L"𒌙", 4296},
+    {L"muru2", L"𒌘", 4287},
+    {L"muru3", L"𒅎", 4288},
+    {L"muru4", L"𒌲", 4289},
+    {L"muru5", L"𒊩𒌓𒂔", 4290},
+    {L"muru6", L"𒆠𒂗𒆕", 4291},
+    {L"muru8", L"𒎙", 4292},
+    {L"muru9", L"𒅎𒂂", 4293},
+    {L"murub", L"𒊩𒆷", 4297},
+    {L"murub2", L"𒊩𒇬", 4298},
+    {L"murub3", L"𒂗𒈨𒇬", 4299},
+    {L"murub4", L"𒌘", 4300},
+    {L"murub5", L"𒊩𒍑𒁮", 4301},
+    {L"murum11", L"𒉞", 4307},
+    {L"murum4", L"𒌲", 4304},
+    {L"murum5", L"𒊩𒌓𒂔", 4305},
+    {L"murum6", L"𒆠𒂗𒆕", 4306},
+    {L"murumL", L"𒉞", 4303},
+    {L"murumM", L"𒄯", 4302},
+    {L"murumx", L"𒎂", 4308},
+    {L"mus", L"𒈲", 4309},
+    {L"mus8", L"𒄷", 4310},
+    {L"mussaL", L"𒊩𒍑𒊭", 4313},
+    {L"mussaM", L"𒊩𒍑𒊓", 4311},
+    {L"mussaMv1", L"𒊩𒍑𒁲", 4312},
+    {L"musub", L"𒈰", 4314},
+    {L"musub2", L"𒋁𒋦", 4315},
+    {L"musub3", L"𒄛", 4316},
+    {L"musug2", L"𒌑𒅗", 4317},
+    {L"musur", L"𒆠𒀭𒋀𒆠", 4318},
+    {L"mut", L"𒄷𒄭", 4346},
+    {L"mut2", L"𒁁", 4347},
+    {L"muzer", L"𒋁𒋦", 4349},
+    {L"muzir", L"𒋁𒋦", 4350},
+    {L"muzug2", L"𒌑𒅗", 4351},
+    {L"muzug4", L"𒌑𒆳𒉌𒌇𒆠", 4352},
+    {L"muzug5", L"𒆈", 4353},
+    {L"muš", L"𒈲", 4319},
+    {L"muš2", L"𒈽", 4320},
+    {L"muš3", L"𒈹", 4321},
+    {L"muš4", L"𒄮", 4322},
+    {L"muš5", L"𒋀", 4323},
+    {L"muš6", L"𒁑", 4324},
+    {L"muš7", L"𒁹", 4325},
+    {L"muš8", L"𒄷", 4326},
+    {L"muš9", L"𒈪", 4327},
+    {L"mušda", L"𒁶", 4328},
+    {L"mušdam", L"𒁶", 4329},
+    {L"mušdama", L"𒁶", 4330},
+    {L"mušdama2", L"𒈶", 4331},
+    {L"mušdama2v1", L"𒈸", 4332},
+    {L"mušdamma", L"𒁶", 4333},
+    {L"mušen", L"𒄷", 4334},
+    {L"muši", L"𒈪", 4335},
+    {L"mušku", L"𒈹", 4336},
+    {L"muštabtin", L"𒄑𒁃", 4340},
+    {L"muštaptin", L"𒁃", 4341},
+    {L"muštu", L"𒉿", 4342},
+    {L"muštu2", L"𒈬𒍑𒌆𒉿", 4343},
+    {L"muštug", L"𒉿", 4344},
+    {L"muštug2", L"𒈬𒍑𒌆𒉿", 4345},
+    {L"mušša", L"𒊩𒍑𒊭", 4337},
+    {L"muššagana", L"𒇚", 4338},
+    {L"muššagana2", L"𒇞", 4339},
+    {L"muḫ", L"𒌋𒅗", 4227},
+    {L"muḫ2", L"𒊚", 4228},
+    {L"muḫ4", L"𒊨", 4229},
+    {L"muḫaldim", L"𒈬", 4230},
+    {L"muṭ", L"𒄷𒄭", 4348},
+    {L"na", L"𒈾", 4360},
+    {L"na2", L"𒈿", 4361},
+    {L"na3", L"𒀝", 4362},
+    {L"na4", L"𒎎", 4363},
+    {L"na5", L"𒊭", 4364},
+    {L"na6", L"𒇽", 4365},
+    {L"na7", L"𒉆", 4366},
+    {L"na8", L"𒅘", 4367},
+    {L"nab", L"𒀮", 4368},
+    {L"nab2L", L"𒆳", 4370},
+    {L"nab2M", L"𒀯", 4369},
+    {L"nab3", L"𒀭𒀭", 4371},
+    {L"nab3v1", L"𒀮", 4372},
+    {L"nab4", L"𒅊", 4373},
+    {L"nad", L"𒆳", 4374},
+    {L"nad2", L"𒄿", 4375},
+    {L"nad3", L"𒈿", 4376},
+    {L"nag", L"𒅘", 4377},
+    {L"nag2", L"𒉀", 4378},
+    {L"naga", L"𒉀", 4379},
+    {L"naga2L", L"𒄤", 4381},
+    {L"naga2M", L"𒅘", 4380},
+    {L"naga3", L"𒄤", 4382},
+    {L"naga4", L"𒄣", 4383},
+    {L"nagada", L"𒑐𒁣", 4384},
+    {L"nagal", L"𒇬", 4385},
+    {L"nagar", L"𒉄", 4386},
+    {L"nagara", L"𒉄", 4387},
+    {L"nagga", L"𒀭𒈾", 4388},
+    {L"nak", L"𒅘", 4391},
+    {L"nak2", L"𒉀", 4392},
+    {L"nak3", L"𒊩𒌨", 4393},
+    {L"nam", L"𒉆", 4394},
+    {L"nam2", L"𒉇", 4395},
+    {L"nam2v1", L"𒌆", 4396},
+    {L"nam3", L"𒉏", 4397},
+    {L"nam4L", L"𒉏", 4399},
+    {L"nam4M", L"𒅊", 4398},
+    {L"namma", L"𒇉", 4400},
+    {L"nammu", L"𒇉", 4401},
+    {L"namri", L"𒌑𒆳𒍝𒈽𒆠", 4402},
+    {L"nan", L"𒄿", 4403},
+    {L"nan2", L"𒄿", 4405},
+    {L"nan2v1", L"𒌶𒆠", 4406},
+    {L"nan3", L"𒌍", 4407},
+    {L"nanam", L"𒊲", 4408},
+    {L"nanam2", L"𒊰", 4409},
+    {L"nanga", L"𒇳𒆸", 4410},
+    {L"nanga2", L"𒇲𒆸", 4411},
+    {L"nanga3", L"𒇳𒊬", 4412},
+    {L"nanga4", L"𒇲𒊬", 4413},
+    {L"nanga5", L"𒀭𒈾", 4414},
+    {L"nanga6", L"𒉀", 4415},
+    {L"nangar", L"𒉄", 4416},
+    {L"nanibgal", L"𒀭𒉀", 4417},
+    {L"nanibgal2", L"𒀭𒊺𒉀", 4418},
+    {L"nanna", L"𒌶𒆠", 4419},
+    {L"nanna2", L"𒀭𒋀𒆠", 4420},
+    {L"nanna4", L"𒌶𒆠", 4421},
+    {L"nannar", L"𒌶𒆠", 4422},
+    {L"nanv1", L"𒋀", 4404},
+    {L"nanše", L"𒀏", 4423},
+    {L"nap", L"𒀮", 4424},
+    {L"nap2", L"𒀯", 4425},
+    {L"nap3", L"𒀯", 4426},
+    {L"naq", L"𒅘", 4427},
+    {L"nar", L"𒈜", 4428},
+    {L"nar3", L"𒉪", 4429},
+    {L"nari", L"𒈜", 4430},
+    {L"nat", L"𒆳", 4433},
+    {L"nat2", L"𒄿", 4434},
+    {L"nata", L"𒆳", 4435},
+    {L"nazi", L"𒀏", 4438},
+    {L"naš", L"𒎙", 4431},
+    {L"našše", L"𒀏", 4432},
+    {L"naḫ", L"𒈛", 4389},
+    {L"naḫ2", L"𒂠", 4390},
+    {L"naṭ", L"𒆳", 4436},
+    {L"naṭ2", L"𒄿", 4437},
+    {L"ne", L"𒉈", 4439},
+    {L"ne2", L"𒉌", 4440},
+    {L"ne3", L"𒄊", 4441},
+    {L"ne3v1", L"𒊊", 4442},
+    {L"ne4", L"𒋙𒉈", 4443},
+    {L"ne5", L"𒆠𒉈", 4444},
+    {L"ne6", L"𒈾", 4445},
+    {L"ne7", L"𒈿", 4446},
+    {L"ne8", L"𒉋", 4447},
+    {L"neda", L"𒉿", 4448},
+    {L"nek2", L"𒃻", 4449},
+    {L"nem", L"𒉏", 4450},
+    {L"nem2", L"𒎏", 4451},
+    {L"nemur", L"𒆠𒉈", 4452},
+    {L"nen", L"𒎏", 4453},
+    {L"nen9", L"𒎐", 4455},
+    {L"nen9v1", L"𒊩𒈠", 4456},
+    {L"nenim", L"𒊲", 4457},
+    {L"nenkum", L"𒎏𒉽𒅊𒉣𒈨𒂬", 4458},
+    {L"nenna", L"𒇧𒇧", 4459},
+    {L"nenna2", L"𒇧", 4460},
+    {L"nenni", L"𒇧𒇧", 4461},
+    {L"nenni2", L"𒇧", 4462},
+    {L"nenni5", L"𒌃", 4463},
+    {L"nenv1", L"𒊩𒈠", 4454},
+    {L"ner", L"𒉪", 4464},
+    {L"nergal", L"𒄊𒀕𒃲", 4465},
+    {L"nergalv1", L"𒊊𒀕𒃲", 4466},
+    {L"nerigal", L"𒄊𒀕𒃲", 4467},
+    {L"nerigalv1", L"𒊊𒀕𒃲", 4468},
+    {L"nes", L"𒎙", 4469},
+    {L"nes2", L"𒄑", 4470},
+    {L"nesag", L"𒌘", 4471},
+    {L"nesag2", L"𒋃", 4472},
+    {L"nesag2v1", L"𒉠", 4473},
+    {L"nesag3", L"𒌙", 4474},
+    {L"neš", L"𒎙", 4475},
+    {L"neš2", L"𒄑", 4476},
+    {L"neša", L"𒌨𒈤", 4477},
+    {L"neṭ", L"𒍑", 4478},
+    {L"ni", L"𒉌", 4479},
+    {L"ni10", L"𒆸", 4491},
+    {L"ni2", L"𒅎", 4480},
+    {L"ni2v1", L"𒉎", 4481},
+    {L"ni3", L"𒃻", 4482},
+    {L"ni4", L"𒎏", 4483},
+    {L"ni4v1", L"𒊩𒈠", 4484},
+    {L"ni5", L"𒉈", 4485},
+    {L"ni6L", L"𒉏", 4487},
+    {L"ni6M", L"𒆸𒆸", 4486},
+    {L"ni7", L"𒉏", 4488},
+    {L"ni8", L"𒇷", 4489},
+    {L"ni9", L"𒌋𒌓𒆤", 4490},
+    {L"nib2L", L"𒊋", 4495},
+    {L"nib2M", L"𒀮", 4494},
+    {L"nibL", L"𒊊𒄨", 4493},
+    {L"nibM", L"𒊋", 4492},
+    {L"nibri", L"𒂗𒆤", 4496},
+    {L"nibru", L"𒂗𒆤", 4497},
+    {L"nid", L"𒍑", 4498},
+    {L"nida", L"𒉭", 4499},
+    {L"nidaba", L"𒊺𒉀", 4500},
+    {L"nidaba2", L"𒉀", 4501},
+    {L"nidalam", L"𒊩𒍑𒁮", 4502},
+    {L"nidalam2", L"𒍑𒁮", 4503},
+    {L"nidalam3", L"𒍑𒊩𒁮", 4504},
+    {L"nidalam4", L"𒊩𒍑", 4505},
+    {L"nidba", L"𒉻𒀭𒈹", 4506},
+    {L"nidba2", L"𒉻𒈹", 4507},
+    {L"nidlam", L"𒊩𒍑𒁮", 4508},
+    {L"nidlam2", L"𒍑𒁮", 4509},
+    {L"nidlam3", L"𒍑𒊩𒁮", 4510},
+    {L"nidlam4", L"𒊩𒍑", 4511},
+    {L"nieš", L"𒑗", 4512},
+    {L"nig", L"𒊩𒌨", 4513},
+    {L"nig2", L"𒃻", 4514},
+    {L"nig6", L"𒌋𒌓𒆤", 4515},
+    {L"niga", L"𒊺", 4516},
+    {L"niga2", L"𒇽𒊺", 4517},
+    {L"niggi", L"𒀭𒈾", 4518},
+    {L"nigi", L"𒆸𒆸", 4519},
+    {L"nigi2", L"𒆸", 4520},
+    {L"nigi7", L"𒉭𒈠", 4521},
+    {L"nigi7v1", L"𒉭𒁶", 4522},
+    {L"nigida", L"𒁹", 4523},
+    {L"nigidaeš", L"𒑗", 4524},
+    {L"nigidalimmu", L"𒐉", 4525},
+    {L"nigidamin", L"𒑖", 4526},
+    {L"nigin", L"𒆸𒆸", 4527},
+    {L"nigin10", L"𒌗𒆤", 4537},
+    {L"nigin11", L"𒇪", 4538},
+    {L"nigin2", L"𒆸", 4529},
+    {L"nigin3", L"𒌋𒌓𒆤", 4530},
+    {L"nigin4", L"𒌋𒌓", 4531},
+    {L"nigin5", L"𒇳𒆸", 4532},
+    {L"nigin6", L"𒀒", 4533},
+    {L"nigin7", L"𒇲𒆸", 4534},
+    {L"nigin8", L"𒇳𒊬", 4535},
+    {L"nigin9", L"𒇲𒊬", 4536},
+    {L"niginv1", L"𒇔", 4528},
+    {L"nigir", L"𒂇", 4539},
+    {L"nigir2", L"𒂈", 4540},
+    {L"nigir3", L"𒂛", 4541},
+    {L"nigru", L"𒅚", 4542},
+    {L"nigu", L"𒊺", 4543},
+    {L"nik", L"𒊩𒌨", 4544},
+    {L"nik2", L"𒃻", 4545},
+    {L"nik5", L"𒅘", 4546},
+    {L"nika", L"𒎔", 4547},
+    {L"nikav1", L"𒉾", 4548},
+    {L"nilimmu", L"𒐉", 4549},
+    {L"nim", L"𒉏", 4550},
+    {L"nim2", L"𒎏", 4551},
+    {L"nim2v1", L"𒊩𒈠", 4552},
+    {L"nim3", L"𒌋𒌓", 4553},
+    {L"nim4", L"𒈝", 4554},
+    {L"nim5", L"𒃻", 4555},
+    {L"nima", L"𒉏", 4556},
+    {L"nimandu", L"𒇌", 4557},
+    {L"nimen", L"𒇳𒆸", 4558},
+    {L"nimen2", L"𒆸", 4559},
+    {L"nimen3", L"𒇲𒆸", 4560},
+    {L"nimen4", L"𒇳𒊬", 4561},
+    {L"nimen5", L"𒇲𒊬", 4562},
+    {L"nimgigri", L"𒂛", 4563},
+    {L"nimgigri2", L"𒂛𒅐", 4564},
+    {L"nimgin", L"𒆸𒆸", 4565},
+    {L"nimgin10", L"𒌗𒆤", 4574},
+    {L"nimgin11", L"𒇪", 4575},
+    {L"nimgin2", L"𒆸", 4566},
+    {L"nimgin3", L"𒌋𒌓𒆤", 4567},
+    {L"nimgin4", L"𒌋𒌓", 4568},
+    {L"nimgin5", L"𒇳𒆸", 4569},
+    {L"nimgin6", L"𒀒", 4570},
+    {L"nimgin7", L"𒇲𒆸", 4571},
+    {L"nimgin8", L"𒇳𒊬", 4572},
+    {L"nimgin9", L"𒇲𒊬", 4573},
+    {L"nimgir", L"𒂇", 4576},
+    {L"nimgir2", L"𒂈", 4577},
+    {L"nimgirgirri", L"𒂛", 4578},
+    {L"nimgirgirri2", L"𒂛𒅐", 4579},
+    {L"nimin", L"𒐏", 4580},
+    {L"nimin2", L"𒀒", 4581},
+    {L"nimin3", L"𒑖", 4582},
+    {L"nimur", L"𒆠𒉈", 4583},
+    {L"nin", L"𒎏", 4584},
+    {L"nin10", L"𒊩𒋠", 4592},
+    {L"nin2", L"𒈹", 4585},
+    {L"nin3", L"𒆸𒆸", 4586},
+    {L"nin4", L"𒆸", 4587},
+    {L"nin5", L"𒐏", 4588},
+    {L"nin6", L"𒃻", 4589},
+    {L"nin7", L"𒇧𒇧", 4590},
+    {L"nin9", L"𒎐", 4591},
+    {L"nina", L"𒀏", 4593},
+    {L"nina2", L"𒁱", 4594},
+    {L"nina3", L"𒎏", 4595},
+    {L"nina3v1", L"𒊩𒈠", 4596},
+    {L"ninagal", L"𒌣", 4597},
+    {L"ninda", L"𒃻", 4598},
+    {L"ninda2", L"𒉒", 4599},
+    {L"ninda3", L"𒇌", 4600},
+    {L"ninda4", L"𒇅", 4601},
+    {L"nindar", L"𒋛𒀀", 4602},
+    {L"nindu", L"𒇅", 4603},
+    {L"nindu2", L"𒇌", 4604},
+    {L"ningi2", L"𒋇", 4607},
+    {L"ningi3", L"𒋋", 4608},
+    {L"ningiL", L"𒋋", 4606},
+    {L"ningiM", L"𒋆", 4605},
+    {L"ningidar", L"𒃻𒉺", 4609},
+    {L"ningin10", L"𒌗𒆤", 4622},
+    {L"ningin11", L"𒇪", 4623},
+    {L"ningin2L", L"𒌋𒌓", 4613},
+    {L"ningin2M", L"𒆸", 4612},
+    {L"ningin3L", L"𒌋𒌗", 4615},
+    {L"ningin3M", L"𒌋𒌓𒆤", 4614},
+    {L"ningin4", L"𒌋𒌓", 4616},
+    {L"ningin5", L"𒇳𒆸", 4617},
+    {L"ningin6", L"𒀒", 4618},
+    {L"ningin7", L"𒇲𒆸", 4619},
+    {L"ningin8", L"𒇳𒊬", 4620},
+    {L"ningin9", L"𒇲𒊬", 4621},
+    {L"ninginL", L"𒌋𒌓𒆤", 4611},
+    {L"ninginM", L"𒆸𒆸", 4610},
+    {L"nini", L"𒆸𒆸", 4624},
+    {L"nini2", L"𒍝𒂆", 4625},
+    {L"nini3", L"𒍝𒉏", 4626},
+    {L"nini4", L"𒍝𒋢", 4627},
+    {L"nini5", L"𒍝𒅁", 4628},
+    {L"ninim", L"𒊲", 4629},
+    {L"ninindu", L"𒇅", 4630},
+    {L"ninindu2", L"𒇌", 4631},
+    {L"ninkum", L"𒎏𒉽𒅊𒉣𒈨𒂬", 4632},
+    {L"ninmuš", L"𒇣", 4633},
+    {L"ninna", L"𒇧𒇧", 4634},
+    {L"ninna2", L"𒇧", 4635},
+    {L"ninni2", L"𒆸𒆸", 4636},
+    {L"ninni3", L"𒃻", 4637},
+    {L"ninni4", L"𒇧", 4638},
+    {L"ninni5", L"𒌃", 4639},
+    {L"ninni6", L"𒈹", 4640},
+    {L"ninni7", L"𒉻𒀭𒈹", 4641},
+    {L"ninni8", L"𒌁", 4642},
+    {L"ninnim4", L"𒇧", 4643},
+    {L"ninnim7", L"𒉻𒀭𒈹", 4644},
+    {L"ninnu", L"𒐐", 4645},
+    {L"ninnu2", L"𒇧𒇧", 4646},
+    {L"ninnu4", L"𒇧", 4647},
+    {L"ninta", L"𒍑", 4648},
+    {L"nintaḫ", L"𒍑", 4649},
+    {L"nintaḫ2", L"𒀴", 4650},
+    {L"nintaḫ3", L"𒊩𒍑", 4651},
+    {L"ninua", L"𒀏", 4652},
+    {L"nip2", L"𒀮", 4653},
+    {L"niq", L"𒊩𒌨", 4654},
+    {L"niq2", L"𒃻", 4655},
+    {L"nir", L"𒉪", 4656},
+    {L"nir2", L"𒍝𒂆", 4657},
+    {L"nir3", L"𒍝𒉏", 4658},
+    {L"nir4", L"𒍝𒋢", 4659},
+    {L"nir5", L"𒍝𒅁", 4660},
+    {L"nir6", L"𒄨", 4661},
+    {L"nir7", L"𒍝𒂇", 4662},
+    {L"nira", L"𒉪", 4663},
+    {L"nira3", L"𒍝𒉏", 4664},
+    {L"niraḫ", L"𒈲", 4665},
+    {L"nis", L"𒎙", 4666},
+    {L"nis2", L"𒄑", 4667},
+    {L"nisaba", L"𒊺𒉀", 4668},
+    {L"nisaba2", L"𒉀", 4669},
+    {L"nisag", L"𒌘", 4670},
+    {L"nisag2", L"𒋃", 4671},
+    {L"nisag2v1", L"𒉠", 4672},
+    {L"nisag3", L"𒌙", 4673},
+    {L"nisagga", L"𒉭𒀖", 4674},
+    {L"nisaggav1", L"𒉭𒆨", 4675},
+    {L"nisi", L"𒊬", 4676},
+    {L"nisig", L"𒊬", 4677},
+    {L"nissa", L"𒊬", 4678},
+    {L"nit", L"𒍑", 4682},
+    {L"nit2", L"𒀴", 4683},
+    {L"nita", L"𒍑", 4684},
+    {L"nita2", L"𒀴", 4685},
+    {L"nita3L", L"𒃻", 4687},
+    {L"nita3M", L"𒊩𒍑", 4686},
+    {L"nita4", L"𒃻", 4688},
+    {L"nitalam", L"𒊩𒍑𒁮", 4694},
+    {L"nitalam2", L"𒍑𒁮", 4695},
+    {L"nitalam3", L"𒍑𒊩𒁮", 4696},
+    {L"nitalam4", L"𒊩𒍑", 4697},
+    {L"nitaḫ", L"𒍑", 4689},
+    {L"nitaḫ2L", L"𒇽𒊺", 4691},
+    {L"nitaḫ2M", L"𒀴", 4690},
+    {L"nitaḫ3", L"𒊩𒍑", 4692},
+    {L"nitaḫu", L"𒍑", 4693},
+    {L"nitlam", L"𒊩𒍑𒁮", 4698},
+    {L"nitlam2L", L"𒊩𒍑", 4700},
+    {L"nitlam2M", L"𒍑𒁮", 4699},
+    {L"nitlam3", L"𒍑𒊩𒁮", 4701},
+    {L"nitlam4", L"𒊩𒍑", 4702},
+    {L"niš", L"𒎙", 4679},
+    {L"niš2", L"𒄑", 4680},
+    {L"nišakin", L"𒀉𒇲𒂟", 4681},
+    {L"niṭ", L"𒍑", 4703},
+    {L"nu", L"𒉡", 4704},
+    {L"nu10", L"𒆪", 4713},
+    {L"nu11", L"𒉢", 4714},
+    {L"nu11v1", L"𒋓", 4715},
+    {L"nu12", L"𒇻", 4716},
+    {L"nu12v1", L"𒁳", 4717},
+    {L"nu13", L"𒄴", 4718},
+    {L"nu2", L"𒈿", 4705},
+    {L"nu3", L"𒉏", 4706},
+    {L"nu4", L"𒈝", 4707},
+    {L"nu5", L"𒆰", 4708},
+    {L"nu6", L"𒉣", 4709},
+    {L"nu7", L"𒀔", 4710},
+    {L"nu8", L"𒈾", 4711},
+    {L"nu9", L"𒇷", 4712},
+    {L"nud", L"𒈿", 4719},
+    {L"nug", L"𒋐", 4720},
+    {L"nug2", L"𒋊", 4721},
+    {L"nug4", L"𒋈", 4722},
+    {L"num", L"𒉏", 4723},
+    {L"num2", L"𒈝", 4724},
+    {L"numdu", L"𒅻", 4725},
+    {L"numdum", L"𒅻", 4726},
+    {L"numdun", L"𒅻", 4727},
+    {L"numu", L"𒆰", 4728},
+    {L"numun", L"𒆰", 4729},
+    {L"numun2", L"𒍤𒆸", 4730},
+    {L"numun3", L"𒄴", 4731},
+    {L"nun", L"𒉣", 4732},
+    {L"nun2", L"𒀀𒄩𒋻𒁺", 4733},
+    {L"nun3", L"𒁍", 4734},
+    {L"nuna", L"𒉣", 4735},
+    {L"nundu", L"𒅻", 4736},
+    {L"nundum", L"𒅻", 4737},
+    {L"nundun", L"𒅻", 4738},
+    {L"nungi2", L"𒋇", 4741},
+    {L"nungi3", L"𒋋", 4742},
+    {L"nungiL", L"𒋋", 4740},
+    {L"nungiM", L"𒋆", 4739},
+    {L"nunmeli", L"𒁇𒄷𒆕", 4743},
+    {L"nunnura", L"𒁃", 4744},
+    {L"nunpe", L"𒉩", 4745},
+    {L"nunu", L"𒉭", 4746},
+    {L"nunurra", L"𒁃", 4747},
+    {L"nunurru", L"𒁃", 4748},
+    {L"nunus", L"𒉭", 4749},
+    {L"nunuz", L"𒉭", 4750},
+    {L"nunuzzi", L"𒂗𒉭𒍣𒀭𒌓", 4751},
+    {L"nur", L"𒉪", 4752},
+    {L"nura", L"𒂟", 4753},
+    {L"nuri", L"𒂟", 4754},
+    {L"nurra", L"𒈗", 4755},
+    {L"nuru", L"𒂟", 4756},
+    {L"nus", L"𒉭", 4757},
+    {L"nuska", L"𒉺𒌆", 4758},
+    {L"nuska2", L"𒉺𒇻", 4759},
+    {L"nusku", L"𒉺𒌆", 4760},
+    {L"nusku2", L"𒉺𒇻", 4761},
+    {L"nussu", L"𒇧", 4762},
+    {L"nuz", L"𒉭", 4767},
+    {L"nuška", L"𒉺𒌆", 4763},
+    {L"nuška2", L"𒉺𒇻", 4764},
+    {L"nušku", L"𒉺𒌆", 4765},
+    {L"nušku2", L"𒉺𒇻", 4766},
+    {L"pa", L"𒉺", 4774},
+    {L"pa10", L"𒅆", 4784},
+    {L"pa11", L"𒃶", 4785},
+    {L"pa12", L"𒉿", 4786},
+    {L"pa2", L"𒁀", 4775},
+    {L"pa2v1", L"𒁀𒌑", 4776},
+    {L"pa3", L"𒅆𒊒", 4777},
+    {L"pa4", L"𒉽", 4778},
+    {L"pa5", L"𒉽𒂊", 4779},
+    {L"pa6", L"𒉽𒅖", 4780},
+    {L"pa7", L"𒄷", 4781},
+    {L"pa8", L"𒋃", 4782},
+    {L"pa9", L"𒊷", 4783},
+    {L"pab", L"𒉽", 4787},
+    {L"pad", L"𒉻", 4788},
+    {L"pad2", L"𒁁", 4789},
+    {L"pad3", L"𒅆𒊒", 4790},
+    {L"pad4", L"𒅆", 4791},
+    {L"pad5", L"𒉽𒂊", 4792},
+    {L"pad6", L"𒉽𒅖", 4793},
+    {L"pada", L"𒉻", 4794},
+    {L"pag", L"𒄷", 4795},
+    {L"pagra3", L"𒈔", 4796},
+    {L"pak", L"𒄷", 4800},
+    {L"pal", L"𒁄", 4801},
+    {L"pala2L", L"𒆪𒉆𒂗", 4805},
+    {L"pala2M", L"𒉆𒂗", 4804},
+    {L"pala3L", L"𒆪𒉆𒎏", 4807},
+    {L"pala3M", L"𒉆𒎏", 4806},
+    {L"pala4", L"𒁄", 4808},
+    {L"palaL", L"𒆪𒉆𒈗", 4803},
+    {L"palaM", L"𒉆𒈗", 4802},
+    {L"palil", L"𒅆𒁺", 4809},
+    {L"palil2", L"𒅆𒂠𒁺", 4810},
+    {L"pallil", L"𒅆𒂠𒁺", 4811},
+    {L"pan", L"𒉼", 4812},
+    {L"pan2", L"𒈜", 4813},
+    {L"pan3", L"𒅆", 4814},
+    {L"pana", L"𒉼", 4815},
+    {L"pap", L"𒉽", 4816},
+    {L"papa2", L"𒆍", 4817},
+    {L"papa3", L"𒆍", 4818},
+    {L"papnun", L"𒇳", 4819},
+    {L"paq", L"𒄷", 4820},
+    {L"par", L"𒌓", 4821},
+    {L"par2", L"𒁇", 4822},
+    {L"par3", L"𒁖", 4823},
+    {L"par4", L"𒆦", 4824},
+    {L"par5", L"𒎕", 4825},
+    {L"par6", L"𒁈", 4826},
+    {L"par7", L"𒍴", 4827},
+    {L"para10L", L"𒁖", 4841},
+    {L"para10M", L"𒇸", 4839},
+    {L"para10Mv1", L"𒁈", 4840},
+    {L"para11", L"𒌓", 4842},
+    {L"para2L", L"𒁈", 4831},
+    {L"para2M", L"𒁇", 4830},
+    {L"para3", L"𒁖", 4832},
+    {L"para4", L"𒆦", 4833},
+    {L"para5", L"𒇃", 4834},
+    {L"para6", L"𒇙", 4835},
+    {L"para7", L"𒇋", 4836},
+    {L"para8", L"𒇣", 4837},
+    {L"para9", L"𒇗", 4838},
+    {L"paraL", L"𒁇", 4829},
+    {L"paraM", L"𒌓", 4828},
+    {L"parag", L"𒁈", 4843},
+    {L"parim", L"𒑐𒁽", 4844},
+    {L"parsa", L"𒆳𒋾", 4845},
+    {L"pat", L"𒉻", 4847},
+    {L"pat2", L"𒁁", 4848},
+    {L"pata", L"𒉻", 4849},
+    {L"patru", L"𒄈", 4850},
+    {L"paunun", L"𒑖𒉽", 4853},
+    {L"paš", L"𒄫", 4846},
+    {L"paḫ", L"𒈜", 4797},
+    {L"paḫ2", L"𒋳", 4798},
+    {L"paḫ3", L"𒄷", 4799},
+    {L"paṭ", L"𒉻", 4851},
+    {L"paṭ2", L"𒁁", 4852},
+    {L"pe", L"𒉿", 4854},
+    {L"pe2", L"𒁉", 4855},
+    {L"pe3", L"𒁁", 4856},
+    {L"pe4", L"𒅗", 4857},
+    {L"pe5", L"𒉈", 4858},
+    {L"pel", L"𒉈", 4859},
+    {L"pel2", L"𒉋", 4860},
+    {L"pel5", L"𒉭", 4861},
+    {L"per", L"𒌓", 4862},
+    {L"per2", L"𒎕", 4863},
+    {L"per3", L"𒄵", 4864},
+    {L"pet", L"𒂍", 4880},
+    {L"pet2", L"𒁁", 4881},
+    {L"peš", L"𒄫", 4865},
+    {L"peš10", L"𒆠𒀀", 4875},
+    {L"peš11", L"𒄩", 4876},
+    {L"peš12", L"𒌓", 4877},
+    {L"peš13", L"𒊴", 4878},
+    {L"peš2", L"𒎔", 4866},
+    {L"peš2v1", L"𒉾", 4867},
+    {L"peš3", L"𒈠", 4868},
+    {L"peš4", L"𒊯", 4869},
+    {L"peš5", L"𒆒", 4870},
+    {L"peš6", L"𒆓", 4871},
+    {L"peš7", L"𒌉", 4872},
+    {L"peš8", L"𒋗𒃶", 4873},
+    {L"peš9", L"𒌓𒀀", 4874},
+    {L"pešše", L"𒈠", 4879},
+    {L"pi", L"𒉿", 4882},
+    {L"pi10", L"𒌅", 4891},
+    {L"pi11", L"𒂍", 4892},
+    {L"pi2", L"𒁉", 4883},
+    {L"pi3", L"𒁁", 4884},
+    {L"pi4", L"𒅗", 4885},
+    {L"pi5", L"𒉈", 4886},
+    {L"pi6L", L"𒁇", 4888},
+    {L"pi6M", L"𒉋", 4887},
+    {L"pi7", L"𒂺", 4889},
+    {L"pi8", L"𒁍", 4890},
+    {L"pid", L"𒂍", 4893},
+    {L"pid2", L"𒁁", 4894},
+    {L"pig", L"𒋝", 4895},
+    {L"pik", L"𒋝", 4906},
+    {L"pil", L"𒉈", 4907},
+    {L"pil2", L"𒉋", 4908},
+    {L"pil3", L"𒄑𒉋", 4909},
+    {L"pil4", L"𒄑𒉈", 4910},
+    {L"pil5", L"𒉋", 4911},
+    {L"pil6", L"𒋓", 4912},
+    {L"pil7", L"𒄊", 4913},
+    {L"pil7v1", L"𒊊", 4914},
+    {L"pin", L"𒀳", 4915},
+    {L"piq", L"𒋝", 4916},
+    {L"pir", L"𒌓", 4917},
+    {L"pir2", L"𒎕", 4918},
+    {L"pir3", L"𒄵", 4919},
+    {L"pir6", L"𒉆", 4920},
+    {L"pirig", L"𒄊", 4921},
+    {L"pirig2", L"𒌓", 4923},
+    {L"pirig3", L"𒊌", 4924},
+    {L"pirig4", L"𒇸", 4925},
+    {L"pirigv1", L"𒊊", 4922},
+    {L"piru", L"𒂺", 4926},
+    {L"pis", L"𒄫", 4927},
+    {L"pisag", L"𒂷", 4928},
+    {L"pisag2", L"𒋃", 4929},
+    {L"pisag3", L"𒋄", 4930},
+    {L"pisan", L"𒂷", 4931},
+    {L"pisan2", L"𒋃", 4932},
+    {L"pisan3", L"𒋄", 4933},
+    {L"pit", L"𒂍", 4943},
+    {L"pit2", L"𒁁", 4944},
+    {L"pitru", L"𒂃", 4945},
+    {L"pitruv1", L"𒃮", 4946},
+    {L"piš", L"𒄫", 4934},
+    {L"piš10L", L"𒋃", 4941},
+    {L"piš10M", L"𒆠𒀀", 4940},
+    {L"piš2", L"𒎔", 4935},
+    {L"piš2v1", L"𒉾", 4936},
+    {L"piš4", L"𒊯", 4937},
+    {L"piš5", L"𒆒", 4938},
+    {L"piš6", L"𒆓", 4939},
+    {L"piša", L"𒄫", 4942},
+    {L"piḫ", L"𒈜", 4896},
+    {L"piḫu", L"𒁉𒌑𒊓𒅗𒆕", 4897},
+    {L"piḫu2L", L"𒂁𒉸", 4900},
+    {L"piḫu2M", L"𒉯", 4898},
+    {L"piḫu2Mv1", L"𒉸", 4899},
+    {L"piḫu3L", L"𒂁𒅗𒆕", 4902},
+    {L"piḫu3M", L"𒅗𒆕", 4901},
+    {L"piḫu4L", L"𒃾", 4904},
+    {L"piḫu4M", L"𒁉𒌑𒊓", 4903},
+    {L"piḫu5", L"𒁉𒍑𒊓", 4905},
+    {L"piṭ", L"𒂍", 4947},
+    {L"pu", L"𒁍", 4948},
+    {L"pu11", L"𒌑", 4954},
+    {L"pu2", L"𒇥", 4949},
+    {L"pu3", L"𒅤", 4950},
+    {L"pu4", L"𒅤", 4951},
+    {L"pu6", L"𒇀", 4952},
+    {L"pu8", L"𒌑", 4953},
+    {L"pud", L"𒍠", 4955},
+    {L"pug", L"𒈮", 4956},
+    {L"puk", L"𒈮", 4959},
+    {L"pul", L"𒇧", 4960},
+    {L"pul2", L"𒁔", 4961},
+    {L"pul3", L"𒁄", 4962},
+    {L"pumL", L"𒆃", 4964},
+    {L"pumM", L"𒅤", 4963},
+    {L"puq2", L"𒄷", 4965},
+    {L"pur", L"𒁓", 4966},
+    {L"pur13", L"𒉽𒉽", 4968},
+    {L"pur2", L"𒎕", 4967},
+    {L"puru", L"𒁓", 4969},
+    {L"pus", L"𒄫", 4970},
+    {L"puta", L"𒍠", 4975},
+    {L"pute", L"𒍠", 4976},
+    {L"puti", L"𒍠", 4977},
+    {L"putu", L"𒍠", 4978},
+    {L"puzur", L"𒌋", 4979},
+    {L"puzur2", L"𒎙", 4980},
+    {L"puzur3", L"𒌋𒍠", 4981},
+    {L"puzur4L", L"𒆃𒊭", 4983},
+    {L"puzur4M", L"𒅤𒊭", 4982},
+    {L"puzur5", L"𒅤", 4984},
+    {L"puš", L"𒆜", 4971},
+    {L"puš2", L"𒉽𒄬", 4972},
+    {L"puš3", L"𒄫", 4973},
+    {L"puš4", L"𒂆", 4974},
+    {L"puḫ", L"𒈜", 4957},
+    {L"puḫrum", L"𒄒", 4958},
+    {L"qa", L"𒋡", 4992},
+    {L"qa2", L"𒂵", 4993},
+    {L"qa3", L"𒅗", 4994},
+    {L"qa4", L"𒋗𒈫", 4995},
+    {L"qa5", L"𒂷", 4996},
+    {L"qa6", L"𒆕", 4997},
+    {L"qab", L"𒃮", 4998},
+    {L"qab2", L"𒆏", 4999},
+    {L"qab3", L"𒁕", 5000},
+    {L"qad", L"𒋗", 5001},
+    {L"qad2", L"𒋗𒈫", 5002},
+    {L"qad3", L"𒃰", 5003},
+    {L"qad4", L"𒈨", 5004},
+    {L"qad6", L"𒆐", 5005},
+    {L"qadmu", L"𒋻", 5006},
+    {L"qal", L"𒃲", 5007},
+    {L"qal2", L"𒇽", 5008},
+    {L"qal3", L"𒍇", 5009},
+    {L"qal4", L"𒄨", 5010},
+    {L"qam", L"𒃵", 5011},
+    {L"qam2", L"𒄰", 5012},
+    {L"qam3", L"𒆚", 5013},
+    {L"qan", L"𒃶", 5014},
+    {L"qan2", L"𒄀", 5015},
+    {L"qap", L"𒃮", 5016},
+    {L"qap2", L"𒆏", 5017},
+    {L"qaptu", L"𒂂", 5018},
+    {L"qaq", L"𒆕", 5019},
+    {L"qar", L"𒃼", 5020},
+    {L"qar2", L"𒋼𒀀", 5021},
+    {L"qar3", L"𒃻", 5022},
+    {L"qar4", L"𒂶", 5023},
+    {L"qar5", L"𒄫", 5024},
+    {L"qara3", L"𒃻", 5025},
+    {L"qara4", L"𒂶", 5026},
+    {L"qat", L"𒋗", 5027},
+    {L"qat2", L"𒋗𒈫", 5028},
+    {L"qat3", L"𒃰", 5029},
+    {L"qat4", L"𒈨", 5030},
+    {L"qat5", L"𒆒", 5031},
+    {L"qat6", L"𒆐", 5032},
+    {L"qat7", L"𒆑", 5033},
+    {L"qat8", L"𒆓", 5034},
+    {L"qata", L"𒋗", 5035},
+    {L"qati", L"𒋗𒈫𒎌", 5036},
+    {L"qe", L"𒆥", 5037},
+    {L"qe2", L"𒆠", 5038},
+    {L"qe3", L"𒄀", 5039},
+    {L"qe4", L"𒄄", 5040},
+    {L"qeb", L"𒄒", 5041},
+    {L"qel", L"𒆸", 5042},
+    {L"qer", L"𒄫", 5043},
+    {L"qer10", L"𒄩", 5046},
+    {L"qer3", L"𒆸", 5044},
+    {L"qer5", L"𒃼", 5045},
+    {L"qet", L"𒆤", 5047},
+    {L"qi", L"𒆥", 5048},
+    {L"qi2", L"𒆠", 5049},
+    {L"qi3", L"𒄀", 5050},
+    {L"qi4", L"𒄄", 5051},
+    {L"qi5", L"𒆤", 5052},
+    {L"qi6", L"𒆕", 5053},
+    {L"qib", L"𒄒", 5054},
+    {L"qid", L"𒆤", 5055},
+    {L"qid2", L"𒁍", 5056},
+    {L"qid3", L"𒁁", 5057},
+    {L"qid4", L"𒃰", 5058},
+    {L"qil", L"𒆸", 5059},
+    {L"qil2", L"𒄃", 5060},
+    {L"qili2", L"𒄃", 5061},
+    {L"qim", L"𒁶", 5062},
+    {L"qin", L"𒆥", 5063},
+    {L"qin2", L"𒁶", 5064},
+    {L"qin3", L"𒆳", 5065},
+    {L"qip", L"𒄒", 5066},
+    {L"qiq", L"𒍼", 5067},
+    {L"qir", L"𒄫", 5068},
+    {L"qir10", L"𒄩", 5076},
+    {L"qir2", L"𒉐", 5069},
+    {L"qir3L", L"𒌋𒀜", 5071},
+    {L"qir3M", L"𒆸", 5070},
+    {L"qir6", L"𒀘", 5072},
+    {L"qir7", L"𒄊", 5073},
+    {L"qir8", L"𒄌", 5074},
+    {L"qir9", L"𒋃", 5075},
+    {L"qiri", L"𒄫", 5077},
+    {L"qis", L"𒆧", 5078},
+    {L"qit", L"𒆤", 5080},
+    {L"qit2", L"𒁍", 5081},
+    {L"qit3", L"𒁁", 5082},
+    {L"qiš", L"𒆧", 5079},
+    {L"qiṭ", L"𒆤", 5083},
+    {L"qu", L"𒄣", 5084},
+    {L"qu2", L"𒆪", 5085},
+    {L"qu3", L"𒄖", 5086},
+    {L"qu5", L"𒆬", 5087},
+    {L"qu6", L"𒄘", 5088},
+    {L"qu7", L"𒄞", 5089},
+    {L"qub", L"𒁺", 5090},
+    {L"qub2", L"𒄽", 5091},
+    {L"qub3", L"𒄸", 5092},
+    {L"qud", L"𒋻", 5093},
+    {L"qudmu", L"𒋻", 5094},
+    {L"qul", L"𒆰", 5095},
+    {L"qul2", L"𒄢", 5096},
+    {L"qum", L"𒄣", 5097},
+    {L"qum2", L"𒉈", 5098},
+    {L"qum3", L"𒈝", 5099},
+    {L"qun", L"𒆲", 5100},
+    {L"qup", L"𒁺", 5101},
+    {L"qup2", L"𒄽", 5102},
+    {L"qup3", L"𒄸", 5103},
+    {L"qur", L"𒄥", 5104},
+    {L"qur2", L"𒆳", 5105},
+    {L"qur3", L"𒃵", 5106},
+    {L"qur4", L"𒉽", 5107},
+    {L"qut", L"𒋻", 5108},
+    {L"qutu", L"𒋻", 5109},
+    {L"ra", L"𒊏", 5117},
+    {L"ra2", L"𒁺", 5118},
+    {L"ra3", L"𒌓", 5119},
+    {L"ra4", L"𒋥", 5120},
+    {L"ra5", L"𒁍", 5121},
+    {L"ra6", L"𒀝", 5122},
+    {L"rab", L"𒊐", 5123},
+    {L"rab2", L"𒃲", 5124},
+    {L"rab3", L"𒈗", 5125},
+    {L"rab4", L"𒄨", 5126},
+    {L"raba", L"𒊐", 5127},
+    {L"rabita", L"𒂔", 5128},
+    {L"rad", L"𒋥", 5129},
+    {L"rad2", L"𒅐", 5130},
+    {L"rag", L"𒊩", 5131},
+    {L"rak", L"𒊩", 5134},
+    {L"ram", L"𒉘", 5135},
+    {L"ram2", L"𒀸", 5136},
+    {L"ram3", L"𒈥", 5137},
+    {L"rama", L"𒉘", 5138},
+    {L"raman", L"𒆳", 5139},
+    {L"ramanu", L"𒆳", 5140},
+    {L"rap", L"𒊐", 5141},
+    {L"rap2", L"𒃲", 5142},
+    {L"rapil", L"𒁩", 5143},
+    {L"rapiqu", L"𒁩", 5144},
+    {L"rapiqu2", L"𒁁", 5145},
+    {L"raq", L"𒊩", 5146},
+    {L"ras", L"𒆜", 5147},
+    {L"rat", L"𒋥", 5151},
+    {L"rat2", L"𒊩", 5152},
+    {L"rata", L"𒋥", 5153},
+    {L"razu", L"𒆳", 5155},
+    {L"raš", L"𒆜", 5148},
+    {L"raš2", L"𒌇", 5149},
+    {L"rašu", L"𒆳", 5150},
+    {L"raḫ", L"𒈛", 5132},
+    {L"raḫ2", L"𒊏", 5133},
+    {L"raṭ", L"𒋥", 5154},
+    {L"re", L"𒊑", 5156},
+    {L"re12", L"𒆕", 5161},
+    {L"re2", L"𒌷", 5157},
+    {L"re3", L"𒆸", 5158},
+    {L"re6", L"𒁺", 5159},
+    {L"re7", L"𒁻", 5160},
+    {L"reb", L"𒄨", 5162},
+    {L"red", L"𒈩", 5163},
+    {L"rem", L"𒆸", 5164},
+    {L"rem2", L"𒀖", 5165},
+    {L"reme", L"𒆸", 5166},
+    {L"reme2", L"𒀖", 5167},
+    {L"req", L"𒋆", 5168},
+    {L"res", L"𒊕", 5169},
+    {L"reš", L"𒊕", 5170},
+    {L"reʾe", L"𒉺𒇻", 5171},
+    {L"reʾi", L"𒉺𒇻", 5172},
+    {L"ri", L"𒊑", 5173},
+    {L"ri10", L"𒂔", 5182},
+    {L"ri11", L"𒄯", 5183},
+    {L"ri12L", L"𒄣", 5185},
+    {L"ri12M", L"𒆕", 5184},
+    {L"ri13", L"𒆕", 5186},
+    {L"ri2", L"𒌷", 5174},
+    {L"ri3", L"𒆸", 5175},
+    {L"ri4", L"𒍮", 5176},
+    {L"ri5", L"𒉪", 5177},
+    {L"ri6", L"𒁺", 5178},
+    {L"ri8", L"𒈶", 5179},
+    {L"ri8v1", L"𒈸", 5180},
+    {L"ri9", L"𒈕", 5181},
+    {L"rib", L"𒄨", 5187},
+    {L"rid", L"𒈩", 5188},
+    {L"rig", L"𒋆", 5189},
+    {L"rig10", L"𒑐𒁣", 5199},
+    {L"rig11", L"𒈩𒊒", 5200},
+    {L"rig13", L"𒈲", 5201},
+    {L"rig2", L"𒍮", 5190},
+    {L"rig3", L"𒋖𒄑", 5191},
+    {L"rig4", L"𒊿", 5192},
+    {L"rig5", L"𒊑", 5193},
+    {L"rig6L", L"𒃴", 5195},
+    {L"rig6M", L"𒊪", 5194},
+    {L"rig7", L"𒑐𒄸𒁺", 5196},
+    {L"rig8", L"𒑐𒄸", 5197},
+    {L"rig9", L"𒄸𒁺", 5198},
+    {L"rik", L"𒋆", 5206},
+    {L"rik13", L"𒈲", 5209},
+    {L"rik2", L"𒍮", 5207},
+    {L"rik4", L"𒊿", 5208},
+    {L"rim", L"𒆸", 5210},
+    {L"rim2", L"𒀖", 5211},
+    {L"rim3", L"𒉈𒊒", 5212},
+    {L"rim4", L"𒁽", 5213},
+    {L"rim5", L"𒀸", 5214},
+    {L"rimi", L"𒆸", 5215},
+    {L"rimi2", L"𒀖", 5216},
+    {L"rin", L"𒆸", 5217},
+    {L"rin2", L"𒂟", 5218},
+    {L"rin3", L"𒆸𒆸", 5219},
+    {L"rin4", L"𒈶", 5220},
+    {L"rin4v1", L"𒈸", 5221},
+    {L"rin5", L"𒈕", 5222},
+    {L"rin6", L"𒆜", 5223},
+    {L"rina2", L"𒂟", 5224},
+    {L"rip", L"𒄨", 5225},
+    {L"riq", L"𒋆", 5226},
+    {L"riq2", L"𒍮", 5227},
+    {L"riq4", L"𒊿", 5228},
+    {L"ris", L"𒊕", 5229},
+    {L"rit", L"𒈩", 5231},
+    {L"rit2", L"𒋥", 5232},
+    {L"riš", L"𒊕", 5230},
+    {L"riḫ", L"𒈛", 5202},
+    {L"riḫamun2", L"𒂛", 5203},
+    {L"riḫamun3", L"𒂛𒅐", 5204},
+    {L"riḫamun4", L"𒀱", 5205},
+    {L"riṭ", L"𒈩", 5233},
+    {L"ru", L"𒊒", 5234},
+    {L"ru10", L"𒋽", 5243},
+    {L"ru11", L"𒌾", 5244},
+    {L"ru12", L"𒂗", 5245},
+    {L"ru13", L"𒂘", 5246},
+    {L"ru13v1", L"𒂙", 5247},
+    {L"ru2", L"𒆕", 5235},
+    {L"ru3", L"𒀸", 5236},
+    {L"ru4", L"𒍍", 5237},
+    {L"ru5", L"𒌌", 5238},
+    {L"ru6", L"𒂔", 5239},
+    {L"ru7", L"𒌨", 5240},
+    {L"ru8", L"𒋭", 5241},
+    {L"ru9", L"𒌷", 5242},
+    {L"rub", L"𒄨", 5248},
+    {L"rud", L"𒋥", 5249},
+    {L"rug", L"𒊿", 5250},
+    {L"rug2", L"𒉆𒋢", 5251},
+    {L"ruk", L"𒊿", 5253},
+    {L"rum", L"𒀸", 5254},
+    {L"rum2", L"𒉈𒊒", 5255},
+    {L"rum3", L"𒉏", 5256},
+    {L"ruq", L"𒊿", 5257},
+    {L"ruqu", L"𒊿", 5258},
+    {L"ruš", L"𒍽", 5259},
+    {L"rušban", L"𒄞", 5260},
+    {L"rušpan", L"𒄞", 5261},
+    {L"ruḫ", L"𒈛", 5252},
+    {L"ruṭ", L"𒋥", 5262},
+    {L"sa", L"𒊓", 5269},
+    {L"sa11", L"𒋜", 5279},
+    {L"sa12", L"𒊕", 5280},
+    {L"sa14", L"𒄨", 5281},
+    {L"sa15L", L"𒌓", 5283},
+    {L"sa15M", L"𒃻", 5282},
+    {L"sa16L", L"𒃻", 5285},
+    {L"sa16M", L"𒌓", 5284},
+    {L"sa17L", L"𒅾", 5287},
+    {L"sa17M", L"𒋙𒉀", 5286},
+    {L"sa18", L"𒁉", 5288},
+    {L"sa19", L"𒊮", 5289},
+    {L"sa2", L"𒁲", 5270},
+    {L"sa20", L"𒊭", 5290},
+    {L"sa21", L"𒊾", 5291},
+    {L"sa3", L"𒍝", 5271},
+    {L"sa4", L"𒄷𒈿", 5272},
+    {L"sa4v1", L"𒄷𒄭𒈿", 5273},
+    {L"sa5", L"𒋛𒀀", 5274},
+    {L"sa6", L"𒊷", 5275},
+    {L"sa7", L"𒅊", 5276},
+    {L"sa8", L"𒀭", 5277},
+    {L"sa9", L"𒈦", 5278},
+    {L"sab", L"𒉺𒅁", 5292},
+    {L"sabad", L"𒃪", 5293},
+    {L"sabad2", L"𒂿", 5294},
+    {L"sabad3", L"𒃖", 5295},
+    {L"sabar", L"𒊾𒁇", 5296},
+    {L"sabu", L"𒋛𒀀𒁔", 5297},
+    {L"sad", L"𒆳", 5298},
+    {L"sad2", L"𒃪", 5299},
+    {L"sad3", L"𒂿", 5300},
+    {L"sad4", L"𒃖", 5301},
+    {L"sag", L"𒊕", 5302},
+    {L"sag11", L"𒆥", 5312},
+    {L"sag2", L"𒉺𒃶", 5303},
+    {L"sag3", L"𒉺", 5304},
+    {L"sag4", L"𒈗", 5305},
+    {L"sag5", L"𒋃", 5306},
+    {L"sag5v1", L"𒉠", 5307},
+    {L"sag6", L"𒍠", 5308},
+    {L"sag7", L"𒃶", 5309},
+    {L"sag8", L"𒄨", 5310},
+    {L"sag9", L"𒊷", 5311},
+    {L"saga", L"𒊕", 5313},
+    {L"sagdu", L"𒊗", 5314},
+    {L"sagdudu", L"𒇞", 5316},
+    {L"sagdul", L"𒌋𒊕", 5317},
+    {L"sagduv1", L"𒊣", 5315},
+    {L"sagga", L"𒋃", 5318},
+    {L"sagga2", L"𒅍𒈣𒂀", 5319},
+    {L"sagga3", L"𒅍𒈣𒅊", 5320},
+    {L"sagga4", L"𒅍𒂀", 5321},
+    {L"sagga5", L"𒂵𒈣𒆜𒅊", 5322},
+    {L"sagga6", L"𒂵𒈣𒅊", 5323},
+    {L"sagga7", L"𒂵𒂀", 5324},
+    {L"saggar", L"𒊕", 5325},
+    {L"saggar2", L"𒄯", 5326},
+    {L"sagi", L"𒋡𒋗𒂃", 5327},
+    {L"sagil", L"𒋗𒁹", 5328},
+    {L"sagkurun", L"𒁷𒆜𒅊", 5329},
+    {L"sagman", L"𒈦𒎙", 5330},
+    {L"sagmaš", L"𒁁𒆜", 5331},
+    {L"sagmin", L"𒈦𒎙", 5332},
+    {L"sagminx", L"𒊧", 5333},
+    {L"sagmunzer", L"𒋠𒈬𒁍", 5334},
+    {L"sagmunzir", L"𒋠𒈬𒁍", 5335},
+    {L"sagtag", L"𒀸", 5337},
+    {L"sagtag2", L"𒍻", 5338},
+    {L"sagtag3", L"𒀹", 5339},
+    {L"sagtag4", L"𒁹", 5340},
+    {L"sagtak", L"𒀸", 5341},
+    {L"sagtak2", L"𒍻", 5342},
+    {L"sagtak3", L"𒀹", 5343},
+    {L"sagtak4", L"𒁹", 5344},
+    {L"sagu", L"𒌋𒅗", 5345},
+    {L"sagus", L"𒌓𒁺", 5346},
+    {L"saguš", L"𒌓𒁺", 5347},
+    {L"sagšu", L"𒌋𒊕", 5336},
+    {L"sak", L"𒊕", 5366},
+    {L"sak3", L"𒉺", 5367},
+    {L"sak6", L"𒍠", 5368},
+    {L"sakar2", L"𒊕𒊬", 5371},
+    {L"sakarL", L"𒊬𒊕", 5370},
+    {L"sakarM", L"𒊬", 5369},
+    {L"sakkan", L"𒄊", 5372},
+    {L"sal", L"𒊩", 5373},
+    {L"sal2", L"𒁲", 5374},
+    {L"sal3", L"𒉌", 5375},
+    {L"sal4", L"𒋡", 5376},
+    {L"sala", L"𒊩", 5377},
+    {L"salugub", L"𒀸", 5378},
+    {L"salugub2", L"𒁹", 5379},
+    {L"sam", L"𒌑", 5380},
+    {L"samag2L", L"𒁾", 5385},
+    {L"samag2M", L"𒌠", 5384},
+    {L"samag3L", L"𒋃", 5388},
+    {L"samag3M", L"𒍐", 5386},
+    {L"samag3Mv1", L"𒌡", 5387},
+    {L"samag5L", L"𒅊", 5390},
+    {L"samag5M", L"𒌞", 5389},
+    {L"samag6", L"𒅊", 5391},
+    {L"samagL", L"𒌞", 5382},
+    {L"samagLv1", L"𒅊", 5383},
+    {L"samagM", L"𒁾", 5381},
+    {L"saman", L"𒂠𒋤𒉣𒂠𒌅", 5392},
+    {L"saman2", L"𒂠𒁍𒉣𒂠𒌅", 5393},
+    {L"saman3", L"𒊺𒂠𒉣𒁍", 5394},
+    {L"saman4", L"𒌋𒃶", 5395},
+    {L"saman5", L"𒉮", 5396},
+    {L"samanur", L"𒅖𒍏", 5397},
+    {L"san2", L"𒊿", 5400},
+    {L"san3", L"𒉓", 5401},
+    {L"sanL", L"𒊿", 5399},
+    {L"sanM", L"𒊕", 5398},
+    {L"sanga", L"𒋃", 5402},
+    {L"sanga2", L"𒊫", 5403},
+    {L"sanga2v1", L"𒅍𒈣𒂀", 5404},
+    {L"sanga3", L"𒅍𒈣𒅊", 5405},
+    {L"sanga4", L"𒅍𒂀", 5406},
+    {L"sanga5", L"𒂵𒈣𒆜𒅊", 5407},
+    {L"sanga6", L"𒂵𒈣𒅊", 5408},
+    {L"sanga7", L"𒂵𒂀", 5409},
+    {L"sangu", L"𒋃", 5410},
+    {L"santa", L"𒀸", 5411},
+    {L"santa2", L"𒍻", 5412},
+    {L"santa3", L"𒀹", 5413},
+    {L"santa4", L"𒁹", 5414},
+    {L"santag", L"𒀸", 5415},
+    {L"santag2", L"𒍻", 5416},
+    {L"santag3", L"𒀹", 5417},
+    {L"santag4", L"𒁹", 5418},
+    {L"santak", L"𒀸", 5419},
+    {L"santak2", L"𒍻", 5420},
+    {L"santak3", L"𒀹", 5421},
+    {L"santak4", L"𒁹", 5422},
+    {L"santan", L"𒃲𒉌", 5423},
+    {L"santana", L"𒃲𒉌", 5424},
+    {L"sap", L"𒉺𒅁", 5425},
+    {L"sap2", L"𒂟", 5426},
+    {L"sap3", L"𒉺𒇻", 5427},
+    {L"saq", L"𒊕", 5428},
+    {L"sar", L"𒊬", 5429},
+    {L"sar2", L"𒊹", 5430},
+    {L"sar3", L"𒉌", 5431},
+    {L"sar4", L"𒋤", 5432},
+    {L"sar5L", L"𒊑", 5434},
+    {L"sar5M", L"𒈹", 5433},
+    {L"sar6", L"𒇡", 5435},
+    {L"sar7", L"𒈜", 5436},
+    {L"sar8", L"𒋧", 5437},
+    {L"sara", L"𒊬", 5438},
+    {L"sas", L"𒆠𒄨", 5439},
+    {L"sasirra", L"𒋺", 5440},
+    {L"sasirrav1", L"𒉫", 5441},
+    {L"sasirrav2", L"𒆐", 5442},
+    {L"sasirrav3", L"𒆑", 5443},
+    {L"sat", L"𒆳", 5444},
+    {L"sata", L"𒆳", 5445},
+    {L"saḫ", L"𒆤", 5348},
+    {L"saḫ2", L"𒋚", 5349},
+    {L"saḫ3", L"𒂄", 5350},
+    {L"saḫ4", L"𒄗", 5351},
+    {L"saḫ5", L"𒉈", 5352},
+    {L"saḫ6", L"𒄩𒀀", 5353},
+    {L"saḫ7", L"𒀄", 5354},
+    {L"saḫa6", L"𒄩𒀀", 5355},
+    {L"saḫa7", L"𒀄", 5356},
+    {L"saḫab", L"𒋗𒁹", 5357},
+    {L"saḫab2", L"𒋗𒁹𒌍", 5358},
+    {L"saḫan", L"𒈲", 5359},
+    {L"saḫar", L"𒅖", 5360},
+    {L"saḫar2L", L"𒂡", 5362},
+    {L"saḫar2Lv1", L"𒂁𒂡", 5363},
+    {L"saḫar2M", L"𒊬", 5361},
+    {L"saḫardub", L"𒅖", 5364},
+    {L"saḫarpeš", L"𒅖", 5365},
+    {L"saṭ", L"𒆳", 5446},
+    {L"se", L"𒋛", 5447},
+    {L"se10", L"𒍝𒈹𒁲", 5451},
+    {L"se11", L"𒋝", 5452},
+    {L"se12", L"𒅊", 5453},
+    {L"se2", L"𒍣", 5448},
+    {L"se20", L"𒍢", 5454},
+    {L"se24", L"𒈺", 5455},
+    {L"se24v1", L"𒀀𒈹", 5456},
+    {L"se25", L"𒈹𒁲", 5457},
+    {L"se26", L"𒀀𒈹𒁲", 5458},
+    {L"se27", L"𒈹", 5459},
+    {L"se28", L"𒈽", 5460},
+    {L"se3", L"𒋧", 5449},
+    {L"se9", L"𒈻", 5450},
+    {L"sed", L"𒈻", 5461},
+    {L"sed2", L"𒋃", 5462},
+    {L"sed3", L"𒈺", 5463},
+    {L"sed3v1", L"𒀀𒈹", 5464},
+    {L"sed4", L"𒈹𒁲", 5465},
+    {L"sed5", L"𒀀𒈹𒁲", 5466},
+    {L"sed6", L"𒈹", 5467},
+    {L"sed7", L"𒈽", 5468},
+    {L"sed8", L"𒍝𒈹𒁲", 5469},
+    {L"sedi", L"𒈻", 5470},
+    {L"seg", L"𒋝", 5471},
+    {L"seg10", L"𒋧", 5479},
+    {L"seg11", L"𒉺𒃶", 5480},
+    {L"seg12", L"𒈬", 5481},
+    {L"seg14", L"𒅲", 5482},
+    {L"seg14v1", L"𒅝", 5483},
+    {L"seg14v2", L"𒊾", 5484},
+    {L"seg15", L"𒄨", 5485},
+    {L"seg16", L"𒃶", 5486},
+    {L"seg17", L"𒄀", 5487},
+    {L"seg17v1", L"𒆬", 5488},
+    {L"seg18", L"𒆥", 5489},
+    {L"seg2", L"𒋠", 5472},
+    {L"seg3", L"𒉺", 5473},
+    {L"seg4", L"𒋞", 5474},
+    {L"seg6", L"𒊷", 5475},
+    {L"seg7", L"𒅊", 5476},
+    {L"seg8", L"𒃰𒋺𒄑", 5477},
+    {L"seg9", L"𒋛", 5478},
+    {L"segga", L"𒊾", 5490},
+    {L"segga2", L"𒉺", 5491},
+    {L"sennu", L"𒌍", 5494},
+    {L"ser", L"𒋤", 5495},
+    {L"ser3", L"𒂡", 5496},
+    {L"sermušku", L"𒅊𒋺𒀩", 5497},
+    {L"sermuššu", L"𒅊𒋺𒀩", 5498},
+    {L"ses", L"𒋀", 5499},
+    {L"seḫ", L"𒋚", 5492},
+    {L"seḫ2", L"𒆤", 5493},
+    {L"si", L"𒋛", 5500},
+    {L"si11", L"𒋝", 5508},
+    {L"si12", L"𒅊", 5509},
+    {L"si13", L"𒉆", 5510},
+    {L"si14", L"𒂁", 5511},
+    {L"si15", L"𒋩", 5512},
+    {L"si15v1", L"𒊬", 5513},
+    {L"si16", L"𒋝", 5514},
+    {L"si17", L"𒅆", 5515},
+    {L"si18", L"𒅲", 5516},
+    {L"si18v1", L"𒅝", 5517},
+    {L"si19", L"𒆉", 5518},
+    {L"si2", L"𒍣", 5501},
+    {L"si20", L"𒍢", 5519},
+    {L"si21", L"𒄨", 5520},
+    {L"si22", L"𒄀", 5521},
+    {L"si22v1", L"𒆬", 5522},
+    {L"si23", L"𒄢", 5523},
+    {L"si3", L"𒋧", 5502},
+    {L"si4", L"𒋜", 5503},
+    {L"si5", L"𒅆𒂠", 5504},
+    {L"si6", L"𒇻", 5505},
+    {L"si7", L"𒌣", 5506},
+    {L"si8", L"𒁲", 5507},
+    {L"sib", L"𒈨", 5524},
+    {L"sib2", L"𒉺𒇻", 5525},
+    {L"sib3", L"𒍦", 5526},
+    {L"siba", L"𒉺𒇻", 5527},
+    {L"sibad", L"𒉺𒇻", 5528},
+    {L"sibir", L"𒌋𒂘", 5529},
+    {L"sibir2", L"𒂘", 5530},
+    {L"sibir2v1", L"𒂙", 5531},
+    {L"sid", L"𒈻", 5532},
+    {L"sid2", L"𒋃", 5533},
+    {L"sidug", L"𒇂", 5534},
+    {L"sidug2", L"𒇄", 5535},
+    {L"sidugga", L"𒇂", 5536},
+    {L"sidugga2", L"𒇄", 5537},
+    {L"sig", L"𒋝", 5538},
+    {L"sig10", L"𒋧", 5547},
+    {L"sig11", L"𒉺𒃶", 5548},
+    {L"sig12", L"𒈬", 5549},
+    {L"sig13", L"𒋤", 5550},
+    {L"sig14", L"𒅲", 5551},
+    {L"sig14v1", L"𒅝", 5552},
+    {L"sig14v2", L"𒊾", 5553},
+    {L"sig15", L"𒄨", 5554},
+    {L"sig16", L"𒃶", 5555},
+    {L"sig17", L"𒄀", 5556},
+    {L"sig17v1", L"𒆬", 5557},
+    {L"sig18", L"𒆥", 5558},
+    {L"sig2", L"𒋠", 5539},
+    {L"sig3", L"𒉺", 5540},
+    {L"sig4", L"𒋞", 5541},
+    {L"sig5", L"𒅆𒂟", 5542},
+    {L"sig6", L"𒊷", 5543},
+    {L"sig7", L"𒅊", 5544},
+    {L"sig8", L"𒃰𒋺𒄑", 5545},
+    {L"sig9", L"𒋛", 5546},
+    {L"siga", L"𒋝", 5559},
+    {L"siga4", L"𒋞", 5560},
+    {L"sigga", L"𒊾", 5561},
+    {L"sigga2", L"𒉺", 5562},
+    {L"sik", L"𒋝", 5568},
+    {L"sik2", L"𒋠", 5569},
+    {L"siki", L"𒋠", 5570},
+    {L"siki2", L"𒌓", 5571},
+    {L"sikil", L"𒂖", 5572},
+    {L"sikin", L"𒋁", 5573},
+    {L"sil", L"𒋻", 5574},
+    {L"sil10", L"𒂴", 5583},
+    {L"sil11", L"𒋃", 5584},
+    {L"sil2", L"𒉣", 5575},
+    {L"sil3", L"𒀭𒊨", 5576},
+    {L"sil3v1", L"𒋡", 5577},
+    {L"sil5", L"𒂬", 5578},
+    {L"sil6", L"𒂢", 5579},
+    {L"sil7", L"𒂣", 5580},
+    {L"sil8", L"𒋓", 5581},
+    {L"sil9", L"𒂤", 5582},
+    {L"sila", L"𒋻", 5586},
+    {L"sila11", L"𒋃", 5590},
+    {L"sila3", L"𒋡", 5587},
+    {L"sila4", L"𒃢", 5588},
+    {L"sila6", L"𒂢", 5589},
+    {L"silag", L"𒋃", 5591},
+    {L"silal6", L"𒂴", 5592},
+    {L"silig", L"𒍂", 5593},
+    {L"silig2", L"𒋹", 5594},
+    {L"silig2v1", L"𒋳𒌓", 5595},
+    {L"silig3", L"𒋸", 5596},
+    {L"silig3v1", L"𒋳𒌆", 5597},
+    {L"silig4", L"𒋵", 5598},
+    {L"silig4v1", L"𒋳𒄞", 5599},
+    {L"silig5", L"𒍎", 5600},
+    {L"silig6", L"𒆂", 5601},
+    {L"silig7", L"𒅭", 5602},
+    {L"silim", L"𒁲", 5603},
+    {L"silim2", L"𒄨", 5604},
+    {L"silima2", L"𒄨", 5607},
+    {L"silimaL", L"𒂁𒄨", 5606},
+    {L"silimaM", L"𒁲", 5605},
+    {L"silx", L"𒋃", 5585},
+    {L"sim", L"𒉆", 5608},
+    {L"sim2", L"𒋧", 5609},
+    {L"sim3", L"𒁲", 5610},
+    {L"sim4", L"𒆸", 5611},
+    {L"sim5", L"𒍮", 5612},
+    {L"simed", L"𒀸", 5613},
+    {L"simig", L"𒁾", 5614},
+    {L"simig2", L"𒌠", 5615},
+    {L"simig3", L"𒍐", 5616},
+    {L"simig3v1", L"𒌡", 5617},
+    {L"simig5", L"𒌞", 5618},
+    {L"simig6", L"𒅊", 5619},
+    {L"simug", L"𒌣", 5620},
+    {L"sin", L"𒌍", 5621},
+    {L"sin2", L"𒉆", 5622},
+    {L"sin3", L"𒂗𒍪", 5623},
+    {L"sin3v1", L"𒋃", 5624},
+    {L"sip", L"𒈨", 5625},
+    {L"sip2", L"𒉺𒇻", 5626},
+    {L"sip3", L"𒍦", 5627},
+    {L"sip4", L"𒉺𒅁", 5628},
+    {L"sipa", L"𒉺𒇻", 5629},
+    {L"sipa2", L"𒉺𒅁", 5630},
+    {L"sipa2v1", L"𒁈", 5631},
+    {L"sipad", L"𒉺𒇻", 5632},
+    {L"siq", L"𒋝", 5633},
+    {L"sir", L"𒋤", 5634},
+    {L"sir2", L"𒁍", 5635},
+    {L"sir3", L"𒂡", 5636},
+    {L"sir4", L"𒋓", 5637},
+    {L"sir5", L"𒉡", 5638},
+    {L"sir7", L"𒍜", 5639},
+    {L"sirara", L"𒀏", 5640},
+    {L"sirara2", L"𒌓𒈣𒀏𒋓", 5641},
+    {L"sirara2v1", L"𒌓𒈣𒀏𒋔", 5642},
+    {L"sirara3", L"𒌓𒈣𒀏𒋳", 5643},
+    {L"sirara4", L"𒌓𒈣𒀏", 5644},
+    {L"sirara5", L"𒀔", 5645},
+    {L"sirara6", L"𒌓𒈣𒀏𒆠𒋳", 5646},
+    {L"siraran", L"𒀏", 5647},
+    {L"siraš2", L"𒋇", 5650},
+    {L"siraš3", L"𒋋", 5651},
+    {L"sirašL", L"𒋋", 5649},
+    {L"sirašM", L"𒋆", 5648},
+    {L"sirim", L"𒁚", 5652},
+    {L"sirim2", L"𒂡", 5653},
+    {L"siris2", L"𒋇", 5656},
+    {L"siris3", L"𒋋", 5657},
+    {L"siris4", L"𒁉", 5658},
+    {L"siris5", L"𒁉𒈪", 5659},
+    {L"sirisL", L"𒋇", 5655},
+    {L"sirisM", L"𒋆", 5654},
+    {L"sirmušku", L"𒅊𒋺𒀩", 5660},
+    {L"sirmuššu", L"𒅊𒋺𒀩", 5661},
+    {L"sirrida", L"𒌓𒀭𒌓", 5662},
+    {L"sirru", L"𒄑𒋓", 5663},
+    {L"sirsir", L"𒁎", 5664},
+    {L"sirsirv1", L"𒁐𒀊", 5665},
+    {L"siru", L"𒋓", 5666},
+    {L"sirum", L"𒋓", 5667},
+    {L"sis", L"𒋀", 5668},
+    {L"sisi", L"𒀲𒆳𒊏", 5669},
+    {L"siskur", L"𒀬", 5670},
+    {L"siskur2", L"𒀬𒀬", 5671},
+    {L"sit2", L"𒋃", 5673},
+    {L"siu", L"𒌣", 5674},
+    {L"sizkur", L"𒀬", 5675},
+    {L"sizkur2", L"𒀬𒀬", 5676},
+    {L"siš", L"𒋀", 5672},
+    {L"siḫ", L"𒋚", 5563},
+    {L"siḫ2", L"𒆤", 5564},
+    {L"siḫ3", L"𒋦", 5565},
+    {L"siḫ4", L"𒈽", 5566},
+    {L"siḫ5", L"𒄗", 5567},
+    {L"su", L"𒋢", 5677},
+    {L"su10", L"𒈽", 5686},
+    {L"su11", L"𒅗", 5687},
+    {L"su12", L"𒋛𒀀", 5688},
+    {L"su12v1", L"𒋧", 5689},
+    {L"su13", L"𒁍", 5690},
+    {L"su14L", L"𒂅", 5692},
+    {L"su14M", L"𒍮", 5691},
+    {L"su15", L"𒁉", 5693},
+    {L"su16", L"𒁔", 5694},
+    {L"su17", L"𒂄", 5695},
+    {L"su18", L"𒂅", 5696},
+    {L"su19", L"𒁺𒁺", 5697},
+    {L"su2", L"𒍪", 5678},
+    {L"su20", L"𒋆", 5698},
+    {L"su3", L"𒋤", 5679},
+    {L"su4", L"𒋜", 5680},
+    {L"su5", L"𒆪", 5681},
+    {L"su6", L"𒅾", 5682},
+    {L"su7", L"𒇭", 5683},
+    {L"su8", L"𒁻", 5684},
+    {L"su9", L"𒋜𒀀", 5685},
+    {L"sub", L"𒅢", 5699},
+    {L"sub2", L"𒁻", 5700},
+    {L"sub3", L"𒄛", 5701},
+    {L"sub4", L"𒅡", 5702},
+    {L"sub5", L"𒈰", 5703},
+    {L"sub6", L"𒋳", 5704},
+    {L"sub7", L"𒊒", 5705},
+    {L"subar", L"𒋚", 5706},
+    {L"subar2", L"𒋨", 5707},
+    {L"subir", L"𒋚", 5708},
+    {L"subu", L"𒋳", 5709},
+    {L"subur", L"𒋚", 5710},
+    {L"subur2", L"𒈛", 5711},
+    {L"sud", L"𒋤", 5712},
+    {L"sud2", L"𒋥", 5713},
+    {L"sud3", L"𒋢𒆳𒊒", 5714},
+    {L"sud4L", L"𒆃", 5716},
+    {L"sud4M", L"𒁍", 5715},
+    {L"sud5", L"𒂬", 5717},
+    {L"suen", L"𒂗𒍪", 5718},
+    {L"suena", L"𒂗𒍪", 5719},
+    {L"sug", L"𒆹", 5720},
+    {L"sug10", L"𒁺𒁺", 5729},
+    {L"sug2", L"𒁻", 5721},
+    {L"sug3", L"𒍇", 5722},
+    {L"sug4", L"𒋤", 5723},
+    {L"sug5", L"𒂅", 5724},
+    {L"sug6", L"𒋢", 5725},
+    {L"sug7", L"𒅲", 5726},
+    {L"sug8", L"𒇭", 5727},
+    {L"sug9", L"𒉭", 5728},
+    {L"sugal7", L"𒈛", 5730},
+    {L"sugin", L"𒁁", 5731},
+    {L"sugub", L"𒀯", 5732},
+    {L"suk", L"𒆹", 5757},
+    {L"suk3", L"𒍇", 5758},
+    {L"suk5", L"𒂅", 5759},
+    {L"sukal", L"𒈛", 5760},
+    {L"sukkal", L"𒈛", 5761},
+    {L"sukkal2", L"𒊩𒄸", 5762},
+    {L"sukkal3", L"𒊩𒀠", 5763},
+    {L"suku", L"𒆹", 5764},
+    {L"suku3", L"𒍇", 5765},
+    {L"suku4", L"𒆠𒍇", 5766},
+    {L"suku5", L"𒈽", 5767},
+    {L"suku5v1", L"𒀉", 5768},
+    {L"suku6", L"𒈹", 5769},
+    {L"suku6v1", L"𒀉", 5770},
+    {L"sukud", L"𒃴", 5771},
+    {L"sukud2", L"𒈽", 5772},
+    {L"sukud3", L"𒈹", 5773},
+    {L"sukuš", L"𒈹", 5774},
+    {L"sul", L"𒂄", 5775},
+    {L"sul2", L"𒉌", 5776},
+    {L"sul3", L"𒅾", 5777},
+    {L"sul4", L"𒇭", 5778},
+    {L"sulgar", L"𒋙𒀯", 5779},
+    {L"sullat", L"𒁁", 5780},
+    {L"sullat2", L"𒉺", 5781},
+    {L"sullim", L"𒂘", 5782},
+    {L"sullimv1", L"𒂙", 5783},
+    {L"sulu", L"𒋻", 5784},
+    {L"sulug", L"𒈜", 5785},
+    {L"sulummar", L"𒆠𒊕𒁺", 5789},
+    {L"suluḫu", L"𒋠𒋤", 5786},
+    {L"suluḫu2", L"𒋠𒁍", 5787},
+    {L"suluḫu3", L"𒍤𒆸", 5788},
+    {L"sum", L"𒋧", 5790},
+    {L"sum2", L"𒍮", 5791},
+    {L"sum3", L"𒋢", 5792},
+    {L"sum4", L"𒅾", 5793},
+    {L"sum5", L"𒍦", 5794},
+    {L"sum6", L"𒋳", 5795},
+    {L"sumaš", L"𒋨", 5796},
+    {L"sumu", L"𒋧", 5797},
+    {L"sumug2L", L"𒁾", 5801},
+    {L"sumug2M", L"𒌠", 5800},
+    {L"sumug3", L"𒍐", 5802},
+    {L"sumug3v1", L"𒌡", 5803},
+    {L"sumug5", L"𒌞", 5804},
+    {L"sumug6", L"𒅊", 5805},
+    {L"sumugL", L"𒌠", 5799},
+    {L"sumugM", L"𒁾", 5798},
+    {L"sumugan", L"𒄊", 5806},
+    {L"sumugga", L"𒄊", 5807},
+    {L"sumukan", L"𒄊", 5808},
+    {L"sumun", L"𒁁", 5809},
+    {L"sumun2", L"𒄢", 5810},
+    {L"sumuna2", L"𒄢", 5811},
+    {L"sumunu2", L"𒄢", 5812},
+    {L"sumuqan", L"𒄊", 5813},
+    {L"sumur", L"𒊨", 5814},
+    {L"sumur2", L"𒋦", 5815},
+    {L"sumur3", L"𒈰", 5816},
+    {L"sun", L"𒁁", 5817},
+    {L"sun2", L"𒄢", 5818},
+    {L"sun3", L"𒋧", 5819},
+    {L"sun4", L"𒅾", 5820},
+    {L"sun5", L"𒁔", 5821},
+    {L"sun6", L"𒊿", 5822},
+    {L"sun7", L"𒄨", 5823},
+    {L"suna2", L"𒄢", 5824},
+    {L"sungin", L"𒁁", 5825},
+    {L"sup2", L"𒁻", 5826},
+    {L"suq", L"𒆹", 5827},
+    {L"sur", L"𒋩", 5828},
+    {L"sur10", L"𒈣𒅊", 5837},
+    {L"sur11", L"𒆪", 5838},
+    {L"sur12", L"𒇭", 5839},
+    {L"sur14", L"𒊕", 5840},
+    {L"sur2", L"𒊨", 5829},
+    {L"sur3", L"𒄮", 5830},
+    {L"sur4", L"𒊯", 5831},
+    {L"sur5", L"𒇲", 5832},
+    {L"sur6", L"𒆠𒃲", 5833},
+    {L"sur7", L"𒆠𒆕", 5834},
+    {L"sur8", L"𒇡", 5835},
+    {L"sur9", L"𒋪", 5836},
+    {L"sura", L"𒋪", 5841},
+    {L"sura10", L"𒈣𒅊", 5844},
+    {L"sura12", L"𒇭", 5845},
+    {L"sura13", L"𒂠𒅗", 5846},
+    {L"sura9", L"𒋪", 5843},
+    {L"surav1", L"𒈣𒅊", 5842},
+    {L"surra13", L"𒂠𒅗", 5847},
+    {L"surru2", L"𒈣𒅊", 5850},
+    {L"surruL", L"𒋩", 5849},
+    {L"surruM", L"𒋪", 5848},
+    {L"suru5", L"𒇲", 5851},
+    {L"suruengal", L"𒌓𒉣", 5852},
+    {L"surugal", L"𒌓𒉣", 5853},
+    {L"surum", L"𒉣𒇬", 5854},
+    {L"sus", L"𒈽", 5855},
+    {L"sus2", L"𒈹", 5856},
+    {L"susbu", L"𒈽𒁍", 5857},
+    {L"susbu2", L"𒈽", 5858},
+    {L"susbu3", L"𒈹𒁍", 5859},
+    {L"susbu4", L"𒈹", 5860},
+    {L"suslug", L"𒋗𒈜", 5861},
+    {L"susu", L"𒋥", 5862},
+    {L"sutu", L"𒄑𒑏", 5866},
+    {L"suz", L"𒈽", 5867},
+    {L"suzbi", L"𒈽𒁍", 5868},
+    {L"suzbu", L"𒈽𒁍", 5869},
+    {L"suzbu2", L"𒈽", 5870},
+    {L"suzbu3", L"𒈹𒁍", 5871},
+    {L"suzbu4", L"𒈹", 5872},
+    {L"suš", L"𒆪", 5863},
+    {L"suš2", L"𒉌", 5864},
+    {L"suš3", L"𒁍", 5865},
+    {L"suḫ", L"𒈽", 5733},
+    {L"suḫ10", L"𒈹", 5742},
+    {L"suḫ2", L"𒋦", 5734},
+    {L"suḫ3", L"𒋦", 5735},
+    {L"suḫ3v1", L"𒄗", 5736},
+    {L"suḫ4", L"𒆤", 5737},
+    {L"suḫ5", L"𒆪", 5738},
+    {L"suḫ6", L"𒁼", 5739},
+    {L"suḫ7", L"𒈬", 5740},
+    {L"suḫ8", L"𒉈", 5741},
+    {L"suḫirim", L"𒇮", 5744},
+    {L"suḫirin", L"𒇮", 5745},
+    {L"suḫub", L"𒀯", 5746},
+    {L"suḫub3", L"𒋗𒁹", 5748},
+    {L"suḫub4", L"𒋗𒁲", 5749},
+    {L"suḫub5", L"𒋗𒂵", 5750},
+    {L"suḫubv1", L"𒋙𒀯", 5747},
+    {L"suḫul", L"𒋙𒀯", 5751},
+    {L"suḫul2", L"𒉎𒂇𒂄", 5752},
+    {L"suḫul3", L"𒉎𒂄𒂇", 5753},
+    {L"suḫur", L"𒋦", 5754},
+    {L"suḫuš", L"𒁼", 5755},
+    {L"suḫušx", L"𒌮", 5756},
+    {L"suḫḫus", L"𒊷𒌉", 5743},
+    {L"ta", L"𒋫", 6594},
+    {L"ta2", L"𒁕", 6595},
+    {L"ta3", L"𒋳", 6596},
+    {L"ta4", L"𒁮", 6597},
+    {L"ta5", L"𒌓", 6598},
+    {L"ta6L", L"𒊑", 6600},
+    {L"ta6M", L"𒋺", 6599},
+    {L"ta7", L"𒉿", 6601},
+    {L"ta8", L"𒄭", 6602},
+    {L"tab", L"𒋰", 6603},
+    {L"tab2", L"𒄉", 6605},
+    {L"tab4", L"𒋰", 6606},
+    {L"tab5", L"𒍏", 6607},
+    {L"taba", L"𒋰", 6608},
+    {L"tabira", L"𒍏𒉄", 6609},
+    {L"tabv1", L"𒑊", 6604},
+    {L"tad", L"𒋺", 6610},
+    {L"tag", L"𒋳", 6611},
+    {L"tag2", L"𒁖", 6612},
+    {L"tag3", L"𒍴", 6613},
+    {L"tag4", L"𒋺", 6614},
+    {L"tagaL", L"𒁾", 6616},
+    {L"tagaM", L"𒋳", 6615},
+    {L"tak", L"𒋳", 6621},
+    {L"tak2", L"𒁖", 6622},
+    {L"tak3", L"𒍴", 6623},
+    {L"tak4", L"𒋺", 6624},
+    {L"tak5", L"𒋺", 6625},
+    {L"taka", L"𒋳", 6626},
+    {L"taka4", L"𒋺", 6627},
+    {L"tal", L"𒊑", 6628},
+    {L"tal2", L"𒉿", 6629},
+    {L"tal3", L"𒀸", 6630},
+    {L"tal4", L"𒁹", 6631},
+    {L"tal5", L"𒆒𒆒", 6632},
+    {L"tal5v1", L"𒆓𒆓", 6633},
+    {L"tala", L"𒊑", 6634},
+    {L"tala2", L"𒉿", 6635},
+    {L"taltal", L"𒊉", 6636},
+    {L"tam", L"𒌓", 6637},
+    {L"tam2", L"𒁮", 6638},
+    {L"tam3", L"𒁴", 6639},
+    {L"tam4", L"𒌈", 6640},
+    {L"tam5", L"𒎕", 6641},
+    {L"tam6", L"𒁶", 6642},
+    {L"tan", L"𒄨", 6643},
+    {L"tan2", L"𒃞", 6644},
+    {L"tan3", L"𒃩", 6645},
+    {L"tan3v1", L"𒌨", 6646},
+    {L"tan4", L"𒃋", 6647},
+    {L"tan6", L"𒍕", 6648},
+    {L"tan7", L"𒃃", 6649},
+    {L"tana", L"𒄨", 6650},
+    {L"tap", L"𒋰", 6651},
+    {L"tap3", L"𒄭𒂵", 6652},
+    {L"tapa", L"𒋰", 6653},
+    {L"taq", L"𒋳", 6654},
+    {L"taq2", L"𒁖", 6655},
+    {L"taq3", L"𒍴", 6656},
+    {L"tar", L"𒋻", 6657},
+    {L"tar2", L"𒁯", 6658},
+    {L"tar3", L"𒁰", 6659},
+    {L"tar5L", L"𒍣", 6661},
+    {L"tar5M", L"𒄀", 6660},
+    {L"tara", L"𒋻", 6662},
+    {L"tara3", L"𒁰", 6663},
+    {L"taraḫ", L"𒁰", 6664},
+    {L"targulL", L"𒀀𒇉", 6666},
+    {L"targulM", L"𒈣𒈮", 6665},
+    {L"tari", L"𒄥", 6667},
+    {L"taru", L"𒄥", 6668},
+    {L"taru5L", L"𒍣", 6670},
+    {L"taru5M", L"𒄀", 6669},
+    {L"tas", L"𒌨", 6671},
+    {L"taskarin", L"𒌆", 6672},
+    {L"tat", L"𒋺", 6679},
+    {L"tattab", L"𒇹", 6680},
+    {L"tattabv1", L"𒐂", 6681},
+    {L"tattam", L"𒇹", 6682},
+    {L"tattamv1", L"𒐂", 6683},
+    {L"taz", L"𒌨", 6684},
+    {L"taš", L"𒌨", 6674},
+    {L"taš2", L"𒁹", 6675},
+    {L"taš3", L"𒀾", 6676},
+    {L"taša", L"𒌨", 6677},
+    {L"taškarin", L"𒌆", 6678},
+    {L"taḫ", L"𒈭", 6617},
+    {L"taḫ2", L"𒂃", 6618},
+    {L"taḫ3", L"𒈬", 6619},
+    {L"taḫa", L"𒈭", 6620},
+    {L"taṣ", L"𒌨", 6673},
+    {L"te", L"𒋼", 6685},
+    {L"te10", L"𒁲", 6696},
+    {L"te11", L"𒉿", 6697},
+    {L"te2", L"𒎗", 6686},
+    {L"te3L", L"𒉀", 6688},
+    {L"te3M", L"𒉁", 6687},
+    {L"te4", L"𒉈", 6689},
+    {L"te5", L"𒌆", 6690},
+    {L"te6", L"𒋃", 6691},
+    {L"te7", L"𒈗", 6692},
+    {L"te8L", L"𒀉𒄷", 6694},
+    {L"te8M", L"𒀉", 6693},
+    {L"te9", L"𒋾", 6695},
+    {L"teb", L"𒁳", 6698},
+    {L"tebira", L"𒍏𒉄", 6699},
+    {L"tebiru", L"𒍏𒉄", 6700},
+    {L"teg3", L"𒋼", 6701},
+    {L"tegi", L"𒁆𒈜", 6702},
+    {L"tegi2", L"𒈜𒁆", 6704},
+    {L"tegi2v1", L"𒈜𒂀", 6705},
+    {L"tegiv1", L"𒂀𒈜", 6703},
+    {L"tel", L"𒁁", 6712},
+    {L"telmun", L"𒉌𒌇", 6713},
+    {L"telmunv1", L"𒊩𒄸", 6714},
+    {L"telmunv2", L"𒊩𒌇", 6715},
+    {L"tem", L"𒁴", 6716},
+    {L"teme", L"𒉁", 6717},
+    {L"teme2", L"𒉀", 6718},
+    {L"temen", L"𒋼", 6719},
+    {L"ten", L"𒋼", 6720},
+    {L"ten2", L"𒁷", 6721},
+    {L"ten3", L"𒂇", 6722},
+    {L"tep", L"𒁳", 6723},
+    {L"ter", L"𒌁", 6724},
+    {L"ter2", L"𒋻", 6725},
+    {L"ter3", L"𒁯", 6726},
+    {L"ter4", L"𒋛𒀀", 6727},
+    {L"ter5", L"𒉼", 6728},
+    {L"tertum", L"𒉺𒋢", 6729},
+    {L"tes2", L"𒌨", 6730},
+    {L"teš2", L"𒌨", 6732},
+    {L"tešbi", L"𒌑", 6733},
+    {L"tešlugL", L"𒇽𒆸𒄷", 6736},
+    {L"tešlugLv1", L"𒆸𒄷", 6737},
+    {L"tešlugM", L"𒇽𒆸", 6734},
+    {L"tešlugMv1", L"𒈊", 6735},
+    {L"teḫi2L", L"𒁁", 6709},
+    {L"teḫi2M", L"𒌝", 6708},
+    {L"teḫi3", L"𒉏", 6710},
+    {L"teḫi4", L"𒁁", 6711},
+    {L"teḫiL", L"𒌝", 6707},
+    {L"teḫiM", L"𒁾", 6706},
+    {L"teṣ2", L"𒌨", 6731},
+    {L"ti", L"𒋾", 6738},
+    {L"ti10", L"𒌗", 6748},
+    {L"ti2", L"𒎗", 6739},
+    {L"ti3", L"𒁴", 6740},
+    {L"ti4", L"𒁲", 6741},
+    {L"ti5", L"𒁁", 6742},
+    {L"ti6", L"𒁁", 6743},
+    {L"ti7", L"𒋼", 6744},
+    {L"ti8L", L"𒀉𒄷", 6746},
+    {L"ti8M", L"𒀉", 6745},
+    {L"ti9", L"𒉈", 6747},
+    {L"tib", L"𒁳", 6749},
+    {L"tibir", L"𒋳", 6750},
+    {L"tibir2", L"𒋷", 6751},
+    {L"tibir2v1", L"𒋳𒋗", 6752},
+    {L"tibir3", L"𒋹", 6753},
+    {L"tibir3v1", L"𒋳𒌓", 6754},
+    {L"tibir4", L"𒋸", 6755},
+    {L"tibir4v1", L"𒋳𒌆", 6756},
+    {L"tibir5", L"𒋵", 6757},
+    {L"tibir5v1", L"𒋳𒄞", 6758},
+    {L"tibira", L"𒍏𒉄", 6759},
+    {L"tibira2", L"𒅪", 6760},
+    {L"tibnuL", L"𒋾", 6762},
+    {L"tibnuM", L"𒋿", 6761},
+    {L"tibula", L"𒊮𒈫𒋻", 6763},
+    {L"tibula2", L"𒊮𒈫𒆜", 6764},
+    {L"tibula3", L"𒊮𒈫𒁲", 6765},
+    {L"tid", L"𒅎", 6766},
+    {L"tidab", L"𒁈𒉽𒊺𒉽", 6767},
+    {L"tidinu", L"𒄊𒄊", 6768},
+    {L"tidnu", L"𒊎", 6769},
+    {L"tidnuv1", L"𒄊𒄊", 6770},
+    {L"tidnuv2", L"𒊊𒊊", 6771},
+    {L"tig", L"𒄘", 6772},
+    {L"tig2", L"𒉌", 6773},
+    {L"tig4", L"𒋾", 6774},
+    {L"tigi", L"𒁆𒈜", 6775},
+    {L"tigi2", L"𒈜𒁆", 6777},
+    {L"tigi2v1", L"𒈜𒂀", 6778},
+    {L"tigidla", L"𒊮𒈫𒋻", 6779},
+    {L"tigidla2", L"𒊮𒈫𒆜", 6780},
+    {L"tigidla3", L"𒊮𒈫𒁲", 6781},
+    {L"tigiv1", L"𒂀𒈜", 6776},
+    {L"tigu", L"𒁆𒈜", 6782},
+    {L"tigu2", L"𒈜𒁆", 6784},
+    {L"tigu2v1", L"𒈜𒂀", 6785},
+    {L"tiguv1", L"𒂀𒈜", 6783},
+    {L"tik", L"𒄘", 6786},
+    {L"tik2", L"𒉌", 6787},
+    {L"tikkin", L"𒄳", 6788},
+    {L"til", L"𒁁", 6789},
+    {L"til2", L"𒇯", 6791},
+    {L"til3", L"𒋾", 6792},
+    {L"til4", L"𒀸", 6793},
+    {L"til5", L"𒁹", 6794},
+    {L"til6", L"𒆒𒆒", 6795},
+    {L"til6v1", L"𒆓𒆓", 6796},
+    {L"til7", L"𒉿", 6797},
+    {L"til8", L"𒂿", 6798},
+    {L"til9", L"𒈦", 6799},
+    {L"tila", L"𒌵", 6800},
+    {L"tila3", L"𒋾", 6801},
+    {L"tilla2", L"𒀭𒀸𒀭", 6803},
+    {L"tilla3", L"𒀭𒁹𒀭", 6804},
+    {L"tilla4", L"𒀭𒀸𒀀𒀭", 6805},
+    {L"tilla5", L"𒀸𒀀𒀭", 6806},
+    {L"tillaur10", L"𒌵", 6807},
+    {L"tillu", L"𒇯", 6808},
+    {L"tilmun", L"𒉌𒌇", 6809},
+    {L"tilmunv1", L"𒊩𒄸", 6810},
+    {L"tilmunv2", L"𒊩𒌇", 6811},
+    {L"tilv1", L"𒌀", 6790},
+    {L"tilḫar", L"𒂿", 6802},
+    {L"tim", L"𒁴", 6812},
+    {L"tim2L", L"𒋻", 6814},
+    {L"tim2M", L"𒌈", 6813},
+    {L"tim3L", L"𒌈", 6816},
+    {L"tim3M", L"𒁷", 6815},
+    {L"timua", L"𒀩", 6817},
+    {L"tin", L"𒁷", 6818},
+    {L"tin3", L"𒂇", 6819},
+    {L"tinur", L"𒇌", 6820},
+    {L"tip", L"𒁳", 6821},
+    {L"tiq", L"𒄘", 6822},
+    {L"tiq2", L"𒉌", 6823},
+    {L"tir", L"𒌁", 6824},
+    {L"tir2", L"𒋻", 6825},
+    {L"tir3", L"𒁯", 6826},
+    {L"tir4", L"𒋛𒀀", 6827},
+    {L"tir5", L"𒉼", 6828},
+    {L"tirigi", L"𒊕𒀭", 6829},
+    {L"tiru", L"𒃲𒋼", 6830},
+    {L"tirum", L"𒃲𒋼", 6831},
+    {L"tis", L"𒁹", 6832},
+    {L"tis2", L"𒌨", 6833},
+    {L"tiskarin", L"𒌆", 6834},
+    {L"titab", L"𒁈𒉽𒊺𒉽", 6841},
+    {L"titab2", L"𒈖𒉽𒉽", 6842},
+    {L"tiz", L"𒁹", 6843},
+    {L"tiz2", L"𒌨", 6844},
+    {L"tiš", L"𒁹", 6836},
+    {L"tiš2", L"𒌨", 6837},
+    {L"tiširu", L"𒌓𒅗𒈦", 6838},
+    {L"tiškarin", L"𒌆", 6839},
+    {L"tišpak", L"𒈽", 6840},
+    {L"tiṣ2", L"𒌨", 6835},
+    {L"tu", L"𒌅", 6845},
+    {L"tu10", L"𒄽", 6854},
+    {L"tu11", L"𒄸", 6855},
+    {L"tu12", L"𒌇", 6856},
+    {L"tu13", L"𒇧", 6857},
+    {L"tu14", L"𒋃", 6858},
+    {L"tu15", L"𒅎", 6859},
+    {L"tu16", L"𒂀", 6860},
+    {L"tu17", L"𒀀𒋗𒉀", 6861},
+    {L"tu18", L"𒂅", 6862},
+    {L"tu19L", L"𒆕", 6864},
+    {L"tu19M", L"𒌉", 6863},
+    {L"tu2", L"𒌓", 6846},
+    {L"tu20", L"𒆕", 6865},
+    {L"tu21", L"𒇯", 6866},
+    {L"tu22", L"𒉀", 6867},
+    {L"tu23", L"𒉂", 6868},
+    {L"tu24", L"𒂃", 6869},
+    {L"tu25", L"𒉐", 6870},
+    {L"tu3", L"𒁺", 6847},
+    {L"tu4", L"𒌈", 6848},
+    {L"tu5", L"𒋗𒉀", 6849},
+    {L"tu6", L"𒅲", 6850},
+    {L"tu7", L"𒄰", 6851},
+    {L"tu8", L"𒉏", 6852},
+    {L"tu9", L"𒌆", 6853},
+    {L"tub", L"𒁾", 6871},
+    {L"tub2", L"𒂀", 6872},
+    {L"tuba", L"𒈨", 6873},
+    {L"tuba2", L"𒀀𒄩", 6874},
+    {L"tuba3", L"𒋃", 6875},
+    {L"tubašin", L"𒆯", 6876},
+    {L"tud", L"𒌅", 6877},
+    {L"tud2", L"𒉺𒍜", 6878},
+    {L"tudu", L"𒉺𒍜", 6879},
+    {L"tug", L"𒌇", 6880},
+    {L"tug2", L"𒌆", 6881},
+    {L"tug3", L"𒂁", 6882},
+    {L"tug4", L"𒇧", 6883},
+    {L"tug7", L"𒉎𒋺", 6884},
+    {L"tug7v1", L"𒅏", 6885},
+    {L"tug8", L"𒂅", 6886},
+    {L"tugul", L"𒉄𒍞", 6887},
+    {L"tuk", L"𒌇", 6893},
+    {L"tuk2", L"𒌆", 6894},
+    {L"tuk3", L"𒂁", 6895},
+    {L"tuk4", L"𒇧", 6896},
+    {L"tuk5", L"𒋳", 6897},
+    {L"tuk7", L"𒉎𒋺", 6898},
+    {L"tuk7v1", L"𒅏", 6899},
+    {L"tuk9", L"𒁖", 6900},
+    {L"tuku", L"𒌇", 6901},
+    {L"tuku2", L"𒌆", 6902},
+    {L"tuku4", L"𒇧", 6903},
+    {L"tuku5", L"𒋳", 6904},
+    {L"tuku6", L"𒆸", 6905},
+    {L"tukul", L"𒆪", 6906},
+    {L"tukul2", L"𒄑𒆪", 6907},
+    {L"tukul3", L"𒆸", 6908},
+    {L"tukula", L"𒆪", 6909},
+    {L"tukum", L"𒋗𒃻𒌉𒇲", 6910},
+    {L"tukumbi", L"𒋗𒃻𒌉𒇲𒁉", 6911},
+    {L"tukun", L"𒋗𒃻𒌉𒇲", 6912},
+    {L"tukunbi", L"𒋗𒃻𒌉𒇲𒁉", 6913},
+    {L"tukur", L"𒆸", 6914},
+    {L"tukur2", L"𒆁", 6915},
+    {L"tukur3", L"𒆈", 6916},
+    {L"tul", L"𒌋𒌆", 6917},
+    {L"tul2", L"𒇥", 6918},
+    {L"tul3", L"𒄒", 6919},
+    {L"tul4", L"𒌉", 6920},
+    {L"tul5", L"𒇯", 6921},
+    {L"tul6", L"𒂈", 6922},
+    {L"tul7", L"𒌪", 6923},
+    {L"tul8", L"𒇀", 6924},
+    {L"tule", L"𒌋𒌆", 6925},
+    {L"tum", L"𒌈", 6926},
+    {L"tum10L", L"𒅎", 6936},
+    {L"tum10M", L"𒁮", 6935},
+    {L"tum11", L"𒉑", 6937},
+    {L"tum12L", L"𒌓", 6939},
+    {L"tum12M", L"𒌅", 6938},
+    {L"tum2", L"𒁺", 6927},
+    {L"tum3", L"𒉐", 6928},
+    {L"tum4", L"𒉏", 6929},
+    {L"tum5", L"𒆪", 6930},
+    {L"tum7", L"𒄷𒊺", 6931},
+    {L"tum8", L"𒁴", 6932},
+    {L"tum9L", L"𒁮", 6934},
+    {L"tum9M", L"𒅎", 6933},
+    {L"tuma", L"𒆪", 6940},
+    {L"tumu", L"𒅎", 6941},
+    {L"tumu2", L"𒁺", 6942},
+    {L"tumu3", L"𒉐", 6943},
+    {L"tun", L"𒄽", 6944},
+    {L"tun2", L"𒄸", 6945},
+    {L"tun3", L"𒂅", 6946},
+    {L"tun4", L"𒂄", 6947},
+    {L"tundaL", L"𒍜𒇲", 6949},
+    {L"tundaLv1", L"𒉺𒍜𒇲", 6950},
+    {L"tundaM", L"𒉺𒍜", 6948},
+    {L"tungal", L"𒀭𒂗𒍪", 6951},
+    {L"tungal2", L"𒀭𒂗𒆠", 6952},
+    {L"tunur", L"𒇌", 6953},
+    {L"tup", L"𒁾", 6954},
+    {L"tup2", L"𒂀", 6955},
+    {L"tuq", L"𒌇", 6956},
+    {L"tuq2", L"𒌆", 6957},
+    {L"tuq3", L"𒂁", 6958},
+    {L"tur", L"𒌉", 6959},
+    {L"tur2", L"𒄙", 6960},
+    {L"tur3", L"𒉣𒇬", 6961},
+    {L"tur4", L"𒄒", 6962},
+    {L"tur5", L"𒌅", 6963},
+    {L"tur6", L"𒆸", 6964},
+    {L"tur7", L"𒆪", 6965},
+    {L"tur8", L"𒁍", 6966},
+    {L"tura", L"𒌉", 6967},
+    {L"turu", L"𒌉", 6968},
+    {L"turungal", L"𒌓𒉣", 6969},
+    {L"tus", L"𒆪", 6970},
+    {L"tutke", L"𒇧𒇧", 6974},
+    {L"tutki", L"𒇧𒇧", 6975},
+    {L"tutku", L"𒇧𒇧", 6976},
+    {L"tuš", L"𒆪", 6971},
+    {L"tuš2", L"𒆪", 6972},
+    {L"tuše", L"𒀀𒁺", 6973},
+    {L"tuḫ", L"𒂃", 6888},
+    {L"tuḫ2", L"𒈭", 6889},
+    {L"tuḫ3", L"𒈬", 6890},
+    {L"tuḫu", L"𒂃", 6891},
+    {L"tuḫul", L"𒉄𒍞", 6892},
+    {L"u", L"𒌋", 7062},
+    {L"u10", L"𒁱", 7077},
+    {L"u11", L"𒄷", 7078},
+    {L"u12", L"𒌦", 7079},
+    {L"u13", L"𒄴", 7080},
+    {L"u14", L"𒌋𒂵", 7081},
+    {L"u15", L"𒋠", 7082},
+    {L"u16", L"𒌝", 7083},
+    {L"u17L", L"𒍇", 7085},
+    {L"u17M", L"𒉿", 7084},
+    {L"u18", L"𒍇", 7088},
+    {L"u19", L"𒌷", 7089},
+    {L"u2", L"𒌑", 7064},
+    {L"u20", L"𒊺", 7090},
+    {L"u21", L"𒊌", 7091},
+    {L"u22", L"𒌗", 7092},
+    {L"u23", L"𒉡", 7093},
+    {L"u2ʾL", L"𒇇", 7066},
+    {L"u2ʾM", L"𒄴", 7065},
+    {L"u3", L"𒅇", 7067},
+    {L"u3ʾL", L"𒄴", 7069},
+    {L"u3ʾM", L"𒇇", 7068},
+    {L"u4", L"𒌓", 7070},
+    {L"u5", L"𒄷𒋛", 7072},
+    {L"u6", L"𒅆𒂍", 7073},
+    {L"u7", L"𒆠𒈫", 7074},
+    {L"u8", L"𒇇", 7075},
+    {L"u9", L"𒂦", 7076},
+    {L"ua", L"𒇇", 7094},
+    {L"ua2", L"𒁱", 7095},
+    {L"ua3", L"𒋠", 7096},
+    {L"ua4", L"𒁦", 7097},
+    {L"ub", L"𒌒", 7098},
+    {L"ub2", L"𒂠", 7099},
+    {L"ub3", L"𒀚", 7100},
+    {L"ub4", L"𒇥", 7101},
+    {L"ub5L", L"𒄷𒋛", 7104},
+    {L"ub5M", L"𒀖𒋺", 7102},
+    {L"ub5Mv1", L"𒀛", 7103},
+    {L"ub6", L"𒀙", 7105},
+    {L"uba2", L"𒂠", 7106},
+    {L"uba3", L"𒀚", 7107},
+    {L"uba5", L"𒀖𒋺", 7108},
+    {L"uba5v1", L"𒀛", 7109},
+    {L"ubara", L"𒂬", 7110},
+    {L"ubi", L"𒃴", 7111},
+    {L"ubi2", L"𒋦", 7112},
+    {L"ubilla", L"𒄑𒉋", 7113},
+    {L"ubilla2", L"𒄑𒈪", 7114},
+    {L"ubisag", L"𒋃", 7115},
+    {L"ubisag2", L"𒋄", 7116},
+    {L"ubišaga", L"𒋱", 7117},
+    {L"ubri", L"𒅆𒆕", 7118},
+    {L"ubri2", L"𒅆𒁴", 7119},
+    {L"ubrim", L"𒅆𒆕", 7120},
+    {L"ubrim2", L"𒅆𒁴", 7121},
+    {L"ubu2", L"𒌒", 7124},
+    {L"ubuL", L"𒀸", 7123},
+    {L"ubuM", L"𒀹", 7122},
+    {L"ubudil", L"𒉞", 7125},
+    {L"ubudili", L"𒉞", 7126},
+    {L"ubur", L"𒁛", 7127},
+    {L"ubur2", L"𒁥", 7128},
+    {L"ubur3", L"𒁡", 7129},
+    {L"ubur4", L"𒁢", 7130},
+    {L"ubura", L"𒍻", 7131},
+    {L"uburu", L"𒍻", 7132},
+    {L"ud", L"𒌓", 7133},
+    {L"ud2", L"𒀾", 7134},
+    {L"ud3", L"𒄷𒋛", 7135},
+    {L"ud4", L"𒋸", 7136},
+    {L"ud4v1", L"𒋳𒌆", 7137},
+    {L"ud5", L"𒍚", 7138},
+    {L"ud6", L"𒌋𒂵", 7139},
+    {L"udeššu", L"𒀾", 7140},
+    {L"udinim", L"𒂫", 7141},
+    {L"udinim2", L"𒂩", 7142},
+    {L"udnim", L"𒂫", 7143},
+    {L"udnim2", L"𒂩", 7144},
+    {L"udra", L"𒀾𒀀𒀭", 7145},
+    {L"udra2", L"𒀾𒀭𒈾", 7146},
+    {L"udra3", L"𒀾𒀭", 7147},
+    {L"udu", L"𒇻", 7148},
+    {L"udu2", L"𒋗𒁁", 7149},
+    {L"udub", L"𒇛", 7150},
+    {L"udub2", L"𒋖𒄑", 7151},
+    {L"udub3", L"𒉈𒋛𒀀", 7152},
+    {L"udug", L"𒌜", 7153},
+    {L"udug2", L"𒋖𒄑", 7154},
+    {L"udul", L"𒀖𒆪", 7155},
+    {L"udul10", L"𒀖𒇻", 7164},
+    {L"udul11", L"𒑐𒁟", 7165},
+    {L"udul2", L"𒄰", 7156},
+    {L"udul3", L"𒁦", 7157},
+    {L"udul4", L"𒉺𒁦", 7158},
+    {L"udul5", L"𒁟", 7159},
+    {L"udul6", L"𒁭", 7160},
+    {L"udul7", L"𒆚", 7161},
+    {L"udul7v1", L"𒄰", 7162},
+    {L"udul9", L"𒑐𒁣", 7163},
+    {L"udun", L"𒌋𒈬", 7166},
+    {L"ug", L"𒊌", 7167},
+    {L"ug2", L"𒄊", 7168},
+    {L"ug2v1", L"𒊊", 7169},
+    {L"ug3", L"𒌦", 7170},
+    {L"ug4", L"𒌓", 7171},
+    {L"ug5", L"𒂦", 7172},
+    {L"ug6", L"𒅆𒁾", 7173},
+    {L"ug7", L"𒁁", 7174},
+    {L"ug8", L"𒈕", 7175},
+    {L"uga2", L"𒀀𒅗", 7178},
+    {L"ugaL", L"𒌑𒉀𒂵𒄷", 7177},
+    {L"ugaM", L"𒌑𒉀𒂵", 7176},
+    {L"ugab", L"𒋦", 7179},
+    {L"ugar", L"𒀀𒃼", 7180},
+    {L"ugnim", L"𒆠𒋢𒇻𒂠𒃻", 7181},
+    {L"ugra", L"𒇨", 7182},
+    {L"ugu", L"𒌋𒅗", 7183},
+    {L"ugu2", L"𒀀𒅗", 7184},
+    {L"ugu3", L"𒀀𒊕", 7185},
+    {L"ugu4", L"𒆪", 7186},
+    {L"ugu5", L"𒊨", 7187},
+    {L"ugudil", L"𒉞", 7188},
+    {L"ugudili", L"𒉞", 7189},
+    {L"ugula", L"𒉺", 7190},
+    {L"ugulu", L"𒉺", 7191},
+    {L"ugun", L"𒌋𒁯", 7192},
+    {L"ugun2", L"𒃽", 7193},
+    {L"ugun2v1", L"𒐴", 7194},
+    {L"ugun3", L"𒌋𒅗", 7195},
+    {L"ugunu", L"𒌋𒁯", 7196},
+    {L"ugunu2", L"𒃽", 7197},
+    {L"ugunu2v1", L"𒐴", 7198},
+    {L"ugur", L"𒌋𒄥", 7199},
+    {L"ugur2L", L"𒀭", 7201},
+    {L"ugur2M", L"𒅊", 7200},
+    {L"uia", L"𒌋𒐊", 7214},
+    {L"uk", L"𒊌", 7215},
+    {L"ukdin", L"𒅊𒀩", 7216},
+    {L"ukit", L"𒍻", 7217},
+    {L"ukkin", L"𒌺", 7218},
+    {L"uktin", L"𒅊𒀩", 7219},
+    {L"uku", L"𒂇", 7220},
+    {L"uku2", L"𒇳𒁺", 7221},
+    {L"uku3", L"𒌦", 7222},
+    {L"uku4", L"𒊌", 7223},
+    {L"uku5", L"𒇳𒁺𒁺", 7224},
+    {L"ukum", L"𒅖", 7225},
+    {L"ukur", L"𒄈", 7226},
+    {L"ukur2", L"𒃲𒋚", 7228},
+    {L"ukur3", L"𒇳𒁺", 7229},
+    {L"ukur4", L"𒇳𒁺𒁺", 7230},
+    {L"ukur5", L"𒅊", 7231},
+    {L"ukurin", L"𒂗𒈨𒀭𒈹", 7232},
+    {L"ukurrim", L"𒂗𒈨𒀭𒈹", 7233},
+    {L"ukurv1", L"𒌑𒄈", 7227},
+    {L"ukuš", L"𒂇𒍑", 7234},
+    {L"ukuš2", L"𒄾", 7235},
+    {L"ul", L"𒌌", 7236},
+    {L"ul10", L"𒀯", 7244},
+    {L"ul11", L"𒀭", 7245},
+    {L"ul2", L"𒉡", 7237},
+    {L"ul3", L"𒄒", 7238},
+    {L"ul4", L"𒄉", 7239},
+    {L"ul5", L"𒂬", 7240},
+    {L"ul6", L"𒌓", 7241},
+    {L"ul7", L"𒋗𒁍", 7242},
+    {L"ul8", L"𒃷", 7243},
+    {L"ula", L"𒌌", 7246},
+    {L"ula2", L"𒃪", 7247},
+    {L"ulal", L"𒁁", 7248},
+    {L"uli", L"𒅴", 7249},
+    {L"ulil", L"𒍻", 7251},
+    {L"uliv1", L"𒅴𒄀", 7250},
+    {L"ullu2", L"𒄒", 7252},
+    {L"ullu3", L"𒌌", 7253},
+    {L"ulu", L"𒌌", 7254},
+    {L"ulu2", L"𒄴𒈨𒌋", 7255},
+    {L"ulu3", L"𒍇", 7256},
+    {L"ulu4", L"𒌷", 7257},
+    {L"ulubar", L"𒉎𒃷𒄴𒈨𒌋", 7258},
+    {L"ulubar2", L"𒉎𒄴𒈨𒌋𒃷", 7259},
+    {L"ulud", L"𒂁", 7260},
+    {L"uludim", L"𒆠𒄨", 7261},
+    {L"uludim2", L"𒅊𒀩", 7262},
+    {L"uludin", L"𒆠𒄨", 7263},
+    {L"uludin2", L"𒅊𒀩", 7264},
+    {L"ulul", L"𒄒", 7265},
+    {L"ulul2", L"𒄒", 7266},
+    {L"ulumaš", L"𒉎𒃷𒄴𒈨𒌋", 7267},
+    {L"ulumaš2", L"𒉎𒄴𒈨𒌋𒃷", 7268},
+    {L"ulutim", L"𒆠𒄨", 7272},
+    {L"ulutim2", L"𒅊𒀩", 7273},
+    {L"ulutin", L"𒆠𒄨", 7274},
+    {L"ulutin2", L"𒅊𒀩", 7275},
+    {L"ulušin", L"𒁉𒀾𒀀𒀭", 7269},
+    {L"ulušin2", L"𒁉𒀾𒀭𒈾", 7270},
+    {L"ulušin3", L"𒁉𒀾𒀭", 7271},
+    {L"ulʾul", L"𒄒", 7276},
+    {L"ulʾul2", L"𒄒", 7277},
+    {L"um", L"𒌝", 7278},
+    {L"um2", L"𒌓", 7279},
+    {L"um3", L"𒋃", 7280},
+    {L"uma", L"𒍻", 7281},
+    {L"uman", L"𒄴", 7283},
+    {L"umaḫ", L"𒇦", 7282},
+    {L"umbara", L"𒂬", 7284},
+    {L"umbin", L"𒌢", 7285},
+    {L"umbisag", L"𒋃", 7286},
+    {L"umbisag2", L"𒋄", 7287},
+    {L"umma", L"𒄑𒆵", 7288},
+    {L"umma2", L"𒄱", 7289},
+    {L"umman", L"𒆠𒋢𒇻𒂠𒃻", 7290},
+    {L"ummeda", L"𒌝𒈨", 7291},
+    {L"ummeda2", L"𒌟", 7294},
+    {L"ummeda3", L"𒍏𒁕", 7295},
+    {L"ummedav1", L"𒁾𒈨", 7292},
+    {L"ummedav2", L"𒎘", 7293},
+    {L"ummu", L"𒀀𒂔𒇲", 7296},
+    {L"ummu3", L"𒀀𒂔𒇲", 7297},
+    {L"ummud", L"𒀀𒂔𒇲", 7298},
+    {L"umu", L"𒌝", 7299},
+    {L"umu2", L"𒂼", 7300},
+    {L"umum", L"𒌣", 7302},
+    {L"umun10", L"𒌋𒈬", 7316},
+    {L"umun11", L"𒆹", 7317},
+    {L"umun12", L"𒍤𒆸", 7318},
+    {L"umun2", L"𒌣", 7306},
+    {L"umun3", L"𒄴", 7307},
+    {L"umun4", L"𒀪", 7308},
+    {L"umun5", L"𒇦", 7309},
+    {L"umun6", L"𒇊", 7310},
+    {L"umun7", L"𒐌", 7311},
+    {L"umun7v1", L"𒑂", 7312},
+    {L"umun8", L"𒐅", 7313},
+    {L"umun9L", L"𒌘", 7315},
+    {L"umun9M", L"𒑁", 7314},
+    {L"umunL", L"𒐌", 7304},
+    {L"umunLv1", L"𒑂", 7305},
+    {L"umunM", L"𒌋", 7303},
+    {L"umuna12", L"𒇩", 7319},
+    {L"umuš", L"𒌆", 7320},
+    {L"umuḫ", L"𒇦", 7301},
+    {L"un", L"𒌦", 7321},
+    {L"un2", L"𒌋", 7322},
+    {L"un3", L"𒂦", 7323},
+    {L"un4", L"𒂬", 7324},
+    {L"un5", L"𒌓", 7325},
+    {L"unken", L"𒌺", 7326},
+    {L"unkin", L"𒌺", 7327},
+    {L"unu", L"𒀔", 7328},
+    {L"unu10", L"𒄃", 7341},
+    {L"unu11", L"𒍝𒈽𒀕", 7342},
+    {L"unu12", L"𒁐", 7343},
+    {L"unu2", L"𒋼𒀕", 7329},
+    {L"unu3", L"𒀖𒆪", 7330},
+    {L"unu4", L"𒌦", 7331},
+    {L"unu5", L"𒀊", 7332},
+    {L"unu6", L"𒋼𒀊", 7333},
+    {L"unu7L", L"𒌘", 7335},
+    {L"unu7M", L"𒋽𒀕", 7334},
+    {L"unu8L", L"𒄑𒍑", 7337},
+    {L"unu8M", L"𒍑", 7336},
+    {L"unu9L", L"𒄑𒆓", 7340},
+    {L"unu9M", L"𒆒", 7338},
+    {L"unu9Mv1", L"𒆓", 7339},
+    {L"unug", L"𒀔", 7344},
+    {L"unug2", L"𒋼𒀕", 7346},
+    {L"unug3", L"𒋼𒀊", 7347},
+    {L"unug4", L"𒋽𒀕", 7348},
+    {L"unugi", L"𒀐", 7349},
+    {L"unugi2", L"𒀍", 7350},
+    {L"unugv1", L"𒀕", 7345},
+    {L"up", L"𒌒", 7351},
+    {L"up2", L"𒂠", 7352},
+    {L"uq", L"𒊌", 7353},
+    {L"uq5", L"𒂦", 7354},
+    {L"ur", L"𒌨", 7355},
+    {L"ur11", L"𒀳", 7364},
+    {L"ur12", L"𒋽", 7365},
+    {L"ur13", L"𒊐𒃲", 7366},
+    {L"ur14", L"𒂑", 7367},
+    {L"ur14v1", L"𒃣", 7368},
+    {L"ur2", L"𒌫", 7356},
+    {L"ur3", L"𒃡", 7357},
+    {L"ur4", L"𒌴", 7358},
+    {L"ur5", L"𒄯", 7359},
+    {L"ur6", L"𒌌", 7360},
+    {L"ur7", L"𒉞", 7361},
+    {L"ur8", L"𒁺", 7362},
+    {L"ur9", L"𒌲", 7363},
+    {L"ura15", L"𒋀𒀕", 7369},
+    {L"ura16", L"𒋀𒀊", 7370},
+    {L"uram", L"𒋀𒀕", 7371},
+    {L"uram2", L"𒋀𒀊", 7372},
+    {L"uraš", L"𒅁", 7373},
+    {L"urbigu", L"𒌩", 7374},
+    {L"urbigu2", L"𒂛", 7375},
+    {L"urbigu3", L"𒈒", 7376},
+    {L"urbingu", L"𒌩", 7377},
+    {L"urbingu2", L"𒂛", 7378},
+    {L"urbingu3", L"𒈒", 7379},
+    {L"urda2", L"𒀵", 7382},
+    {L"urdaL", L"𒀵", 7381},
+    {L"urdaM", L"𒀴", 7380},
+    {L"urdu", L"𒀴", 7383},
+    {L"urdu2", L"𒀵", 7384},
+    {L"urgilim", L"𒉫", 7385},
+    {L"urgu", L"𒄯𒅥", 7386},
+    {L"urgu2", L"𒅺", 7387},
+    {L"uri", L"𒌵", 7388},
+    {L"uri2", L"𒋀𒀕", 7389},
+    {L"uri3", L"𒋀", 7390},
+    {L"uri3v1", L"𒌶", 7391},
+    {L"uri4", L"𒁁", 7392},
+    {L"uri5L", L"𒌵", 7394},
+    {L"uri5M", L"𒋀𒀊", 7393},
+    {L"urim", L"𒌵", 7395},
+    {L"urim2", L"𒋀𒀕", 7396},
+    {L"urim5", L"𒋀𒀊", 7397},
+    {L"urin", L"𒋀", 7398},
+    {L"urrub", L"𒂁", 7399},
+    {L"urrub2L", L"𒂁𒄨", 7401},
+    {L"urrub2M", L"𒄨", 7400},
+    {L"urrub3", L"𒄨", 7402},
+    {L"ursub", L"𒂁", 7403},
+    {L"ursub2L", L"𒂁𒄨", 7405},
+    {L"ursub2M", L"𒄨", 7404},
+    {L"urta", L"𒅁", 7407},
+    {L"uru", L"𒌷", 7408},
+    {L"uru10", L"𒊠", 7417},
+    {L"uru11", L"𒌾", 7418},
+    {L"uru12", L"𒃡", 7419},
+    {L"uru13", L"𒌨", 7420},
+    {L"uru14", L"𒋀𒀕", 7421},
+    {L"uru15", L"𒋀𒀊", 7422},
+    {L"uru16", L"𒂗", 7423},
+    {L"uru17", L"𒍇", 7424},
+    {L"uru18", L"𒌸", 7425},
+    {L"uru19", L"𒌵", 7426},
+    {L"uru2", L"𒍍", 7409},
+    {L"uru3", L"𒋀", 7410},
+    {L"uru4", L"𒀳", 7411},
+    {L"uru5", L"𒋽", 7412},
+    {L"uru6", L"𒉞", 7413},
+    {L"uru7", L"𒌲", 7414},
+    {L"uru8", L"𒌫", 7415},
+    {L"uru9", L"𒋞𒁁", 7416},
+    {L"urua", L"𒌸", 7427},
+    {L"uruaka", L"𒃰𒋺𒄑", 7428},
+    {L"urud", L"𒍏", 7429},
+    {L"uruda", L"𒍏", 7430},
+    {L"urudu", L"𒍏", 7431},
+    {L"urudu2", L"𒁾", 7432},
+    {L"urugal", L"𒀍", 7433},
+    {L"urugal2", L"𒀔", 7434},
+    {L"uruišdua", L"𒃰𒋺𒄑", 7435},
+    {L"urulla", L"𒃰𒋺𒄑", 7436},
+    {L"urum", L"𒉞", 7437},
+    {L"urum2L", L"𒌫", 7439},
+    {L"urum2M", L"𒌲", 7438},
+    {L"urum3", L"𒊠", 7440},
+    {L"urum4L", L"𒀴", 7442},
+    {L"urum4M", L"𒌯", 7441},
+    {L"urum5", L"𒋀𒀕", 7443},
+    {L"urum6", L"𒋀𒀊", 7444},
+    {L"urum7", L"𒌋𒂵", 7445},
+    {L"urum8", L"𒌱", 7446},
+    {L"urum9", L"𒌬", 7447},
+    {L"ururim", L"𒍍", 7448},
+    {L"urutamga", L"𒌾", 7451},
+    {L"urutamga2", L"𒍍", 7452},
+    {L"urušeb", L"𒍁", 7449},
+    {L"urušib", L"𒍁", 7450},
+    {L"urzub", L"𒂁", 7453},
+    {L"urzub2L", L"𒂁𒄨", 7455},
+    {L"urzub2M", L"𒄨", 7454},
+    {L"urša", L"𒄯𒁺", 7406},
+    {L"us", L"𒊻", 7456},
+    {L"us2", L"𒍑", 7458},
+    {L"us3", L"𒍚", 7459},
+    {L"us4", L"𒊍", 7460},
+    {L"us5", L"𒇇", 7461},
+    {L"usa", L"𒐍", 7462},
+    {L"usan", L"𒄛", 7464},
+    {L"usan2", L"𒄝", 7465},
+    {L"usan3", L"𒉮", 7466},
+    {L"usan4", L"𒋜", 7467},
+    {L"usan4v1", L"𒁯", 7468},
+    {L"usan5", L"𒄷", 7469},
+    {L"usar", L"𒇳𒊬", 7470},
+    {L"usar2", L"𒇲𒊬", 7471},
+    {L"usar3", L"𒇳𒆸", 7472},
+    {L"usar4", L"𒇲𒆸", 7473},
+    {L"usav1", L"𒑄", 7463},
+    {L"usduḫa", L"𒇇𒇻𒄭𒀀", 7474},
+    {L"usi", L"𒃥", 7475},
+    {L"usigi", L"𒂬", 7476},
+    {L"usil", L"𒂳", 7477},
+    {L"ussa", L"𒐍", 7478},
+    {L"ussa2", L"𒐆", 7480},
+    {L"ussa3", L"𒑅", 7481},
+    {L"ussav1", L"𒑄", 7479},
+    {L"ussu", L"𒐍", 7482},
+    {L"ussu2", L"𒐆", 7484},
+    {L"ussu3", L"𒑅", 7485},
+    {L"ussuv1", L"𒑄", 7483},
+    {L"usu", L"𒀉𒄨", 7486},
+    {L"usu2", L"𒍑", 7487},
+    {L"usud", L"𒍹", 7488},
+    {L"usug", L"𒍠𒀭", 7489},
+    {L"usug2", L"𒌑𒅗", 7490},
+    {L"usug3", L"𒊢", 7491},
+    {L"usug3v1", L"𒌑𒊕", 7492},
+    {L"usug4", L"𒌑𒆳𒉌𒌇𒆠", 7493},
+    {L"usug5", L"𒆈", 7494},
+    {L"usun", L"𒉮", 7496},
+    {L"usur", L"𒇳𒊬", 7497},
+    {L"usur2", L"𒇲𒊬", 7498},
+    {L"usur3", L"𒇳𒆸", 7499},
+    {L"usur4", L"𒇲𒆸", 7500},
+    {L"usur5", L"𒌋", 7501},
+    {L"usuḫ", L"𒊩𒇬", 7495},
+    {L"usv1", L"𒍖", 7457},
+    {L"ut", L"𒌓", 7565},
+    {L"ut2", L"𒀾", 7566},
+    {L"ut4", L"𒋸", 7567},
+    {L"ut4v1", L"𒋳𒌆", 7568},
+    {L"ut5", L"𒍚", 7569},
+    {L"ut6", L"𒌋𒂵", 7570},
+    {L"uta", L"𒌓", 7571},
+    {L"utag", L"𒍻", 7572},
+    {L"utak2", L"𒍻", 7576},
+    {L"utakL", L"𒀸", 7575},
+    {L"utakM", L"𒍻", 7574},
+    {L"utaḫ", L"𒌋𒂵", 7573},
+    {L"utima", L"𒂐", 7577},
+    {L"utima2", L"𒌖", 7579},
+    {L"utimav1", L"𒃟", 7578},
+    {L"uttu", L"𒋸", 7580},
+    {L"uttu2L", L"𒀭𒋃", 7583},
+    {L"uttu2M", L"𒋃", 7582},
+    {L"uttu3", L"𒋃", 7584},
+    {L"uttu4", L"𒈮", 7585},
+    {L"uttu4v1", L"𒈯", 7586},
+    {L"uttu5", L"𒍑𒁇", 7587},
+    {L"uttu6", L"𒆠𒇲", 7588},
+    {L"uttuku", L"𒃻𒋃", 7589},
+    {L"uttuv1", L"𒋳𒌆", 7581},
+    {L"utu", L"𒌓", 7590},
+    {L"utu2", L"𒌋𒂵", 7591},
+    {L"utu3", L"𒎙", 7592},
+    {L"utu4", L"𒆠𒆠", 7593},
+    {L"utu5", L"𒀾", 7594},
+    {L"utua", L"𒁭", 7595},
+    {L"utua2L", L"𒁖𒆨", 7597},
+    {L"utua2M", L"𒁦", 7596},
+    {L"utua3", L"𒁖𒆨", 7598},
+    {L"utudi", L"𒍙", 7599},
+    {L"utudiv1", L"𒈲", 7600},
+    {L"utug", L"𒌜", 7601},
+    {L"utug2", L"𒋖𒄑", 7602},
+    {L"utuki", L"𒍙", 7603},
+    {L"utukiv1", L"𒈲", 7604},
+    {L"utul", L"𒀖𒆪", 7605},
+    {L"utul10", L"𒀖𒇻", 7614},
+    {L"utul11", L"𒑐𒁟", 7615},
+    {L"utul2", L"𒄰", 7606},
+    {L"utul3", L"𒁦", 7607},
+    {L"utul4", L"𒉺𒁦", 7608},
+    {L"utul5", L"𒁟", 7609},
+    {L"utul6", L"𒁭", 7610},
+    {L"utul7", L"𒆚", 7611},
+    {L"utul7v1", L"𒄰", 7612},
+    {L"utul9", L"𒑐𒁣", 7613},
+    {L"uw", L"𒉿", 7617},
+    {L"uz", L"𒊻", 7618},
+    {L"uz2", L"𒍑", 7620},
+    {L"uz3", L"𒍚", 7621},
+    {L"uz4", L"𒊍", 7622},
+    {L"uz5", L"𒇇", 7623},
+    {L"uz6", L"𒍚", 7624},
+    {L"uz7", L"𒌍", 7625},
+    {L"uza", L"𒍚", 7626},
+    {L"uza3", L"𒍚", 7627},
+    {L"uzaglal", L"𒀹", 7628},
+    {L"uzalag", L"𒍻", 7629},
+    {L"uzalak", L"𒍻", 7630},
+    {L"uzduḫa", L"𒇇𒇻𒄭𒀀", 7631},
+    {L"uzu", L"𒍜", 7632},
+    {L"uzu2", L"𒉙", 7633},
+    {L"uzu3", L"𒊻", 7634},
+    {L"uzu4", L"𒌋𒌗", 7635},
+    {L"uzu5", L"𒌋𒌓", 7636},
+    {L"uzug", L"𒍠𒀭", 7637},
+    {L"uzug2", L"𒌑𒅗", 7638},
+    {L"uzug3", L"𒊢", 7639},
+    {L"uzug3v1", L"𒌑𒊕", 7640},
+    {L"uzug4", L"𒌑𒆳𒉌𒌇𒆠", 7641},
+    {L"uzug5L", L"𒊺𒄷", 7643},
+    {L"uzug5M", L"𒆈", 7642},
+    {L"uzv1", L"𒍖", 7619},
+    {L"uš", L"𒍑", 7505},
+    {L"uš10", L"𒊻", 7517},
+    {L"uš11L", L"𒊻", 7519},
+    {L"uš11M", L"𒅜", 7518},
+    {L"uš12", L"𒅜", 7520},
+    {L"uš13", L"𒅛", 7521},
+    {L"uš14", L"𒅼", 7522},
+    {L"uš15", L"𒋛𒀀", 7523},
+    {L"uš16", L"𒋗𒁁", 7524},
+    {L"uš17", L"𒄮", 7525},
+    {L"uš18", L"𒌍", 7526},
+    {L"uš19", L"𒄑", 7527},
+    {L"uš2", L"𒁁", 7507},
+    {L"uš2v1", L"𒍗", 7508},
+    {L"uš3", L"𒂑", 7509},
+    {L"uš3v1", L"𒃣", 7510},
+    {L"uš4", L"𒌆", 7511},
+    {L"uš5", L"𒉦", 7512},
+    {L"uš6", L"𒉥", 7513},
+    {L"uš7", L"𒅲", 7514},
+    {L"uš8", L"𒀳", 7515},
+    {L"uš9", L"𒁹", 7516},
+    {L"ušar", L"𒇳𒊬", 7529},
+    {L"ušar2", L"𒇲𒊬", 7530},
+    {L"ušar3", L"𒇳𒆸", 7531},
+    {L"ušar4", L"𒇲𒆸", 7532},
+    {L"ušbar", L"𒌰", 7533},
+    {L"ušbar2", L"𒉙", 7534},
+    {L"ušbar3", L"𒌲", 7535},
+    {L"ušbar4", L"𒋨", 7536},
+    {L"ušbar5", L"𒌋𒂘", 7537},
+    {L"ušbar6", L"𒉞", 7538},
+    {L"ušbar7", L"𒌱", 7539},
+    {L"ušbur", L"𒌰", 7540},
+    {L"ušbur2", L"𒉙", 7541},
+    {L"ušbur3", L"𒌲", 7542},
+    {L"ušbur4", L"𒋨", 7543},
+    {L"ušbur5", L"𒌋𒂘", 7544},
+    {L"ušbur6", L"𒉞", 7545},
+    {L"ušbur7", L"𒌱", 7546},
+    {L"ušera", L"𒇨", 7547},
+    {L"uštu", L"𒉿", 7549},
+    {L"uštu2", L"𒈬𒍑𒌆𒉿", 7550},
+    {L"uštug", L"𒉿", 7551},
+    {L"uštug2", L"𒈬𒍑𒌆𒉿", 7552},
+    {L"ušu", L"𒁔", 7553},
+    {L"ušu2", L"𒌋𒌓", 7554},
+    {L"ušu3", L"𒌍", 7555},
+    {L"ušub", L"𒋛𒀀", 7556},
+    {L"ušum", L"𒁔", 7557},
+    {L"ušumgal", L"𒃲𒁔", 7559},
+    {L"ušumx", L"𒍘", 7558},
+    {L"ušur", L"𒇳𒊬", 7560},
+    {L"ušur2", L"𒇲𒊬", 7561},
+    {L"ušur4", L"𒇲𒆸", 7562},
+    {L"ušur5", L"𒌋", 7563},
+    {L"ušuš", L"𒃠", 7564},
+    {L"ušv1", L"𒍖", 7506},
+    {L"ušx", L"𒍖", 7528},
+    {L"ušša", L"𒄮", 7548},
+    {L"uʾ", L"𒀪", 7644},
+    {L"uʾ4", L"𒌔", 7645},
+    {L"uʾa", L"𒇇𒀀", 7646},
+    {L"uʾi", L"𒇇𒀀", 7647},
+    {L"uʾu", L"𒇇𒀀", 7648},
+    {L"uḫ", L"𒄴", 7202},
+    {L"uḫ2", L"𒌔", 7203},
+    {L"uḫ3", L"𒆵", 7204},
+    {L"uḫ4", L"𒅜", 7205},
+    {L"uḫ5", L"𒀪", 7206},
+    {L"uḫ6", L"𒉎𒋙", 7207},
+    {L"uḫ7", L"𒌋𒆕", 7208},
+    {L"uḫu", L"𒄴", 7212},
+    {L"uḫu2", L"𒌔", 7213},
+    {L"uḫḫur", L"𒅆𒁉", 7209},
+    {L"uḫḫur2", L"𒅆𒂵", 7210},
+    {L"uḫḫur3", L"𒅆𒀀", 7211},
+    {L"uṣ", L"𒊻", 7502},
+    {L"uṣ2", L"𒍑", 7503},
+    {L"uṣ4", L"𒊍", 7504},
+    {L"uṭ", L"𒌓", 7616},
+    {L"wa2L", L"𒉌", 7658},
+    {L"wa2M", L"𒁀", 7657},
+    {L"wa3", L"𒌑", 7659},
+    {L"wa4", L"𒊀", 7660},
+    {L"wa6", L"𒈠", 7661},
+    {L"waL", L"𒁀", 7656},
+    {L"waM", L"𒉿", 7655},
+    {L"wan", L"𒎙", 7662},
+    {L"war", L"𒁇", 7663},
+    {L"war2", L"𒈥", 7664},
+    {L"war3", L"𒀴", 7665},
+    {L"waš", L"𒈦", 7666},
+    {L"we", L"𒉿", 7667},
+    {L"we2", L"𒊄", 7668},
+    {L"wi", L"𒉿", 7669},
+    {L"wi2L", L"𒉺", 7671},
+    {L"wi2M", L"𒊅", 7670},
+    {L"wi4", L"𒈪", 7672},
+    {L"wi5", L"𒃾", 7673},
+    {L"wil", L"𒅖", 7674},
+    {L"wir", L"𒄊", 7675},
+    {L"wiš", L"𒎌", 7676},
+    {L"wu", L"𒉿", 7677},
+    {L"wu2", L"𒊇", 7678},
+    {L"wu3", L"𒊈", 7679},
+    {L"wu4", L"𒈬", 7680},
+    {L"wuk", L"𒈮", 7681},
+    {L"wuš", L"𒈲", 7682},
+    {L"za", L"𒍝", 7689},
+    {L"za2", L"𒎎", 7690},
+    {L"za3", L"𒍠", 7691},
+    {L"za4", L"𒉣", 7692},
+    {L"za5", L"𒀭", 7693},
+    {L"za6", L"𒆉", 7694},
+    {L"za7", L"𒉌", 7695},
+    {L"za8", L"𒅾", 7696},
+    {L"zab", L"𒂟", 7697},
+    {L"zababu", L"𒍝𒈽𒀕", 7698},
+    {L"zabala", L"𒍝𒈽𒀕", 7699},
+    {L"zabala2", L"𒍝𒈹𒀕", 7700},
+    {L"zabala3", L"𒈹𒀕", 7701},
+    {L"zabala4", L"𒈹𒍝𒀕", 7702},
+    {L"zabala5", L"𒈹𒀊", 7703},
+    {L"zabala6", L"𒀊𒈹", 7704},
+    {L"zabalam", L"𒍝𒈽𒀕", 7705},
+    {L"zabalam2", L"𒍝𒈹𒀕", 7706},
+    {L"zabalam3", L"𒈹𒀕", 7707},
+    {L"zabalam4", L"𒈹𒍝𒀕", 7708},
+    {L"zabalam5", L"𒈹𒀊", 7709},
+    {L"zabalam6", L"𒀊𒈹", 7710},
+    {L"zabar", L"𒌓𒅗𒈦", 7711},
+    {L"zabar2", L"𒍭", 7712},
+    {L"zabar3", L"𒆉𒁇", 7713},
+    {L"zadim", L"𒈯", 7714},
+    {L"zadru", L"𒋃", 7715},
+    {L"zag", L"𒍠", 7716},
+    {L"zag2", L"𒉺", 7717},
+    {L"zag3", L"𒋃", 7718},
+    {L"zag3v1", L"𒉠", 7719},
+    {L"zagga", L"𒉌", 7720},
+    {L"zagga2", L"𒍝", 7721},
+    {L"zagin", L"𒍝𒆳", 7722},
+    {L"zagindur", L"𒍝𒆳𒀀", 7723},
+    {L"zak", L"𒍠", 7732},
+    {L"zak2", L"𒉺", 7733},
+    {L"zal", L"𒉌", 7734},
+    {L"zal2", L"𒇡", 7735},
+    {L"zala", L"𒉌", 7736},
+    {L"zalag", L"𒌓", 7737},
+    {L"zalag2", L"𒂟", 7738},
+    {L"zalaga", L"𒌓", 7739},
+    {L"zalaga2", L"𒂟", 7740},
+    {L"zalli", L"𒉌", 7741},
+    {L"zamin", L"𒌒𒊑", 7743},
+    {L"zamx", L"𒍡", 7742},
+    {L"zanaru", L"𒈹", 7744},
+    {L"zanaru2", L"𒍝𒈹", 7745},
+    {L"zanarum", L"𒈹", 7746},
+    {L"zanbur", L"𒁁𒆜", 7747},
+    {L"zandara", L"𒋃", 7748},
+    {L"zanga", L"𒉌", 7749},
+    {L"zannaru", L"𒈹", 7750},
+    {L"zannaru2", L"𒍝𒈹", 7751},
+    {L"zansur", L"𒇧", 7752},
+    {L"zap", L"𒂟", 7753},
+    {L"zap2", L"𒆪", 7754},
+    {L"zapaḫ", L"𒋗𒁁", 7755},
+    {L"zaq", L"𒍠", 7756},
+    {L"zaq2", L"𒉺", 7757},
+    {L"zaq4", L"𒍨", 7758},
+    {L"zar", L"𒇡", 7759},
+    {L"zar2", L"𒉌", 7760},
+    {L"zar3", L"𒋧", 7761},
+    {L"zar4", L"𒆰", 7762},
+    {L"zar5", L"𒁁", 7763},
+    {L"zar6", L"𒁁𒀸", 7764},
+    {L"zara2", L"𒁁", 7765},
+    {L"zara3", L"𒁁𒀸", 7766},
+    {L"zara5", L"𒁁", 7767},
+    {L"zara6", L"𒁁𒀸", 7768},
+    {L"zararma", L"𒌓𒀕", 7771},
+    {L"zaraḫ", L"𒊕𒉺𒆸", 7769},
+    {L"zaraḫ2", L"𒇻𒆠𒆕", 7770},
+    {L"zariḫ", L"𒇡", 7772},
+    {L"zaz", L"𒁁", 7773},
+    {L"zazana", L"𒌊", 7774},
+    {L"zazna", L"𒌊", 7775},
+    {L"zaḫ", L"𒉈", 7724},
+    {L"zaḫ2", L"𒄩𒀀", 7725},
+    {L"zaḫ3", L"𒀄", 7726},
+    {L"zaḫa2", L"𒄩𒀀", 7727},
+    {L"zaḫa3", L"𒀄", 7728},
+    {L"zaḫan2", L"𒌋𒂵", 7731},
+    {L"zaḫanL", L"𒌋𒂵", 7730},
+    {L"zaḫanM", L"𒌋𒂵𒄭", 7729},
+    {L"ze", L"𒍣", 7776},
+    {L"ze2", L"𒍢", 7777},
+    {L"ze6", L"𒀀", 7778},
+    {L"ze7", L"𒆠𒉈", 7779},
+    {L"zeb", L"𒍦", 7780},
+    {L"zed3", L"𒑐𒄭𒁁", 7781},
+    {L"zek", L"𒍨", 7783},
+    {L"zel", L"𒉣", 7784},
+    {L"zer", L"𒆰", 7785},
+    {L"zer3", L"𒈲", 7786},
+    {L"zermušku", L"𒅊𒋺𒀩", 7787},
+    {L"zermuššu", L"𒅊𒋺𒀩", 7788},
+    {L"zez", L"𒁁", 7789},
+    {L"zeze", L"𒊹", 7790},
+    {L"zeze2", L"𒂄", 7791},
+    {L"zeze3", L"𒁍", 7792},
+    {L"zeḫ", L"𒊩𒀾𒃼", 7782},
+    {L"zi", L"𒍣", 7793},
+    {L"zi2", L"𒍢", 7794},
+    {L"zi3", L"𒍥", 7795},
+    {L"zi3v1", L"𒂠", 7796},
+    {L"zi4", L"𒀓", 7797},
+    {L"zi5", L"𒅆", 7798},
+    {L"zi7", L"𒆠𒉈", 7799},
+    {L"zi8", L"𒄨", 7800},
+    {L"zib", L"𒍦", 7801},
+    {L"zib2", L"𒍨", 7802},
+    {L"zib3", L"𒄞", 7803},
+    {L"zib4", L"𒅗", 7804},
+    {L"zibin", L"𒁫", 7805},
+    {L"zibin2", L"𒁬", 7806},
+    {L"zid", L"𒍣", 7807},
+    {L"zid2", L"𒂠", 7808},
+    {L"zig", L"𒍨", 7809},
+    {L"zig2L", L"𒍣", 7811},
+    {L"zig2M", L"𒋝", 7810},
+    {L"zig3", L"𒍣", 7812},
+    {L"zigabab", L"𒀀𒃮", 7813},
+    {L"zigara", L"𒅐", 7814},
+    {L"zigaru", L"𒅐", 7815},
+    {L"zik", L"𒍨", 7817},
+    {L"zik2", L"𒋝", 7818},
+    {L"zik3", L"𒋝", 7819},
+    {L"zikara", L"𒅐", 7820},
+    {L"zikaru", L"𒅐", 7821},
+    {L"zikum", L"𒇉", 7822},
+    {L"zikuma", L"𒇉", 7825},
+    {L"zikumx", L"𒍥𒌓", 7823},
+    {L"zikumxv1", L"𒂠𒌓", 7824},
+    {L"zikura", L"𒆜𒐋", 7826},
+    {L"zil", L"𒉣", 7827},
+    {L"zil2", L"𒋳", 7828},
+    {L"zilulu", L"𒑐𒍇", 7829},
+    {L"zim", L"𒄷𒊺", 7830},
+    {L"zimbir", L"𒌓𒄒𒉣", 7831},
+    {L"zinanutu", L"𒄮", 7832},
+    {L"zip", L"𒍦", 7833},
+    {L"zipaz", L"𒈦", 7835},
+    {L"zipaḫ", L"𒈦", 7834},
+    {L"ziq", L"𒍨", 7836},
+    {L"ziq2", L"𒋝", 7837},
+    {L"ziq3", L"𒋝", 7838},
+    {L"ziqi", L"𒍨", 7839},
+    {L"zir", L"𒆰", 7840},
+    {L"zir2", L"𒂠𒅗", 7841},
+    {L"zir3", L"𒈲", 7842},
+    {L"ziri", L"𒆰", 7843},
+    {L"zirmušku", L"𒅊𒋺𒀩", 7844},
+    {L"zirmuššu", L"𒅊𒋺𒀩", 7845},
+    {L"zirru", L"𒂗𒉭𒍣𒀭𒋀𒆠", 7846},
+    {L"zis", L"𒁁", 7847},
+    {L"ziz", L"𒁁", 7848},
+    {L"ziz2", L"𒀾", 7849},
+    {L"ziz2v1", L"𒍩", 7850},
+    {L"ziz3", L"𒄮", 7851},
+    {L"ziz4", L"𒄓", 7852},
+    {L"ziz5L", L"𒋳𒋳", 7854},
+    {L"ziz5M", L"𒋳", 7853},
+    {L"zizanu", L"𒆳", 7855},
+    {L"zizna", L"𒌊", 7856},
+    {L"zizu", L"𒋳𒋳", 7857},
+    {L"ziḫ", L"𒄗", 7816},
+    {L"zu", L"𒍪", 7858},
+    {L"zu2", L"𒅗", 7859},
+    {L"zu3", L"𒍮", 7860},
+    {L"zu4", L"𒁁", 7861},
+    {L"zu5L", L"𒆉", 7864},
+    {L"zu5M", L"𒉙", 7862},
+    {L"zu5Mv1", L"𒍫", 7863},
+    {L"zu6", L"𒋤", 7865},
+    {L"zu7", L"𒂄", 7866},
+    {L"zu8", L"𒆛", 7867},
+    {L"zu9", L"𒆉", 7868},
+    {L"zub", L"𒆛", 7869},
+    {L"zub2", L"𒍦", 7870},
+    {L"zubi", L"𒆛", 7871},
+    {L"zubu", L"𒆛", 7872},
+    {L"zubud2", L"𒄪", 7875},
+    {L"zubudL", L"𒆛", 7874},
+    {L"zubudM", L"𒄪", 7873},
+    {L"zubur", L"𒍭", 7876},
+    {L"zuen", L"𒂗𒍪", 7877},
+    {L"zuena", L"𒂗𒍪", 7878},
+    {L"zug2", L"𒅗", 7881},
+    {L"zug3", L"𒊢", 7882},
+    {L"zug4", L"𒅲", 7883},
+    {L"zugL", L"𒅗", 7880},
+    {L"zugM", L"𒆹", 7879},
+    {L"zugud", L"𒄪", 7884},
+    {L"zuk", L"𒆹", 7886},
+    {L"zuku", L"𒋤", 7887},
+    {L"zukum", L"𒍤𒆸", 7888},
+    {L"zul", L"𒂄", 7889},
+    {L"zulug", L"𒈜", 7890},
+    {L"zulumḫi", L"𒋠𒋤", 7894},
+    {L"zulumḫi2", L"𒋠𒁍", 7895},
+    {L"zulumḫi3", L"𒍤𒆸", 7896},
+    {L"zuluḫu", L"𒋠𒋤", 7891},
+    {L"zuluḫu2", L"𒋠𒁍", 7892},
+    {L"zuluḫu3", L"𒍤𒆸", 7893},
+    {L"zum", L"𒍮", 7897},
+    {L"zum2", L"𒊪", 7898},
+    {L"zuq", L"𒆹", 7899},
+    {L"zur", L"𒀫", 7900},
+    {L"zur2", L"𒋪", 7901},
+    {L"zur3", L"𒈣𒅊", 7902},
+    {L"zur4", L"𒇡", 7903},
+    {L"zur5", L"𒇲", 7904},
+    {L"zur6", L"𒆃", 7905},
+    {L"zur8", L"𒅤", 7906},
+    {L"zur8v1", L"𒊭", 7907},
+    {L"zuru", L"𒀫", 7908},
+    {L"zuru10", L"𒁁𒀸", 7912},
+    {L"zuru4", L"𒇡", 7909},
+    {L"zuru5", L"𒇲", 7910},
+    {L"zuru9", L"𒁁", 7911},
+    {L"zurzub", L"𒂁", 7913},
+    {L"zurzub2", L"𒄨", 7914},
+    {L"zurzub3", L"𒂁𒄨", 7915},
+    {L"zusu", L"𒋥", 7916},
+    {L"zušu", L"𒋥", 7917},
+    {L"zuḫ", L"𒅗", 7885},
+    {L"ša", L"𒊭", 5935},
+    {L"ša10", L"𒊓", 5944},
+    {L"ša11", L"𒇽", 5945},
+    {L"ša12", L"𒊩", 5946},
+    {L"ša13", L"𒊹", 5947},
+    {L"ša14", L"𒂷", 5948},
+    {L"ša16", L"𒂠", 5949},
+    {L"ša17L", L"𒌑", 5951},
+    {L"ša17M", L"𒅇", 5950},
+    {L"ša18", L"𒁲", 5952},
+    {L"ša19", L"𒅇", 5953},
+    {L"ša2", L"𒃻", 5936},
+    {L"ša21", L"𒁉", 5954},
+    {L"ša22", L"𒄷𒈿", 5955},
+    {L"ša22v1", L"𒄷𒄭𒈿", 5956},
+    {L"ša23", L"𒁈", 5957},
+    {L"ša24", L"𒊕", 5958},
+    {L"ša25", L"𒌑", 5959},
+    {L"ša3", L"𒊮", 5937},
+    {L"ša4", L"𒁺", 5938},
+    {L"ša5", L"𒀝", 5939},
+    {L"ša6", L"𒊷", 5940},
+    {L"ša7", L"𒊑", 5941},
+    {L"ša8", L"𒊬", 5942},
+    {L"ša9", L"𒄣", 5943},
+    {L"šab", L"𒉺𒅁", 5960},
+    {L"šab2", L"𒊮", 5961},
+    {L"šab4", L"𒈨", 5962},
+    {L"šab5", L"𒉺𒇻", 5963},
+    {L"šab6", L"𒊸", 5964},
+    {L"šaba", L"𒉺𒅁", 5965},
+    {L"šabalbal", L"𒆰", 5966},
+    {L"šabra", L"𒑐𒀠", 5967},
+    {L"šad", L"𒆳", 5968},
+    {L"šad2", L"𒈬", 5969},
+    {L"šad3L", L"𒊹", 5971},
+    {L"šad3M", L"𒃻", 5970},
+    {L"šada", L"𒆳", 5972},
+    {L"šadi", L"𒆳", 5973},
+    {L"šag", L"𒊕", 5974},
+    {L"šag3", L"𒉺", 5975},
+    {L"šag4", L"𒊮", 5976},
+    {L"šag5", L"𒊷", 5977},
+    {L"šag6L", L"𒀚", 5979},
+    {L"šag6M", L"𒋝", 5978},
+    {L"šaga", L"𒇽𒃷", 5980},
+    {L"šagan", L"𒌋𒃶", 5983},
+    {L"šagar", L"𒅥", 5984},
+    {L"šagav1", L"𒇽𒃸", 5981},
+    {L"šagav2", L"𒈂", 5982},
+    {L"šaggin", L"𒄊𒀴", 5985},
+    {L"šaggina", L"𒄊𒀴", 5986},
+    {L"šagil", L"𒋗𒁹", 5987},
+    {L"šagub", L"𒀲𒀴", 5988},
+    {L"šak", L"𒊕", 5999},
+    {L"šak3", L"𒉺", 6000},
+    {L"šak6", L"𒋝", 6001},
+    {L"šakan", L"𒌋𒃶", 6002},
+    {L"šakan2", L"𒄊", 6003},
+    {L"šakan3", L"𒀲", 6004},
+    {L"šakan4L", L"𒀭𒀲", 6006},
+    {L"šakan4M", L"𒀲𒀭", 6005},
+    {L"šakan5", L"𒉮", 6007},
+    {L"šakarL", L"𒂡", 6009},
+    {L"šakarLv1", L"𒂁𒊬", 6010},
+    {L"šakarM", L"𒊬", 6008},
+    {L"šakir", L"𒅫", 6011},
+    {L"šakir3", L"𒌼", 6013},
+    {L"šakir4", L"𒅫", 6014},
+    {L"šakira", L"𒅫", 6015},
+    {L"šakira2", L"𒆠𒀭𒌓", 6017},
+    {L"šakira3", L"𒌼", 6018},
+    {L"šakirav1", L"𒍀", 6016},
+    {L"šakiri", L"𒅫", 6019},
+    {L"šakiriv1", L"𒍀", 6020},
+    {L"šakirv1", L"𒍀", 6012},
+    {L"šakkan2", L"𒄊", 6021},
+    {L"šakkan6", L"𒄊𒀴", 6022},
+    {L"šakkan7", L"𒂼", 6023},
+    {L"šakkana6", L"𒄊𒀴", 6024},
+    {L"šal", L"𒊩", 6025},
+    {L"šal2", L"𒋡", 6026},
+    {L"šal3", L"𒉌", 6027},
+    {L"šal4", L"𒂑", 6028},
+    {L"šal5", L"𒁲", 6029},
+    {L"šalambi", L"𒊮𒊬", 6030},
+    {L"šallam2", L"𒉥", 6033},
+    {L"šallamL", L"𒉥", 6032},
+    {L"šallamM", L"𒉦", 6031},
+    {L"šallur", L"𒄒", 6034},
+    {L"šam", L"𒌑", 6035},
+    {L"šam21", L"𒉛", 6038},
+    {L"šam22", L"𒉚𒀀𒀭", 6039},
+    {L"šam24", L"𒉚𒀀", 6040},
+    {L"šam25", L"𒉚", 6041},
+    {L"šam26", L"𒉓", 6042},
+    {L"šam3", L"𒉓", 6036},
+    {L"šam4", L"𒉆", 6037},
+    {L"šamag", L"𒅊", 6043},
+    {L"šamag5", L"𒅊", 6044},
+    {L"šaman", L"𒉌", 6045},
+    {L"šaman2", L"𒌋𒃶", 6046},
+    {L"šamaš", L"𒌓", 6047},
+    {L"šambilla", L"𒈪", 6048},
+    {L"šan", L"𒉓", 6049},
+    {L"šan2", L"𒋳", 6050},
+    {L"šan3", L"𒊿", 6051},
+    {L"šanaba", L"𒑛", 6052},
+    {L"šanabi", L"𒑛", 6053},
+    {L"šanabi2", L"𒐏", 6054},
+    {L"šanga", L"𒋃", 6055},
+    {L"šanga2", L"𒅍𒈣𒂀", 6057},
+    {L"šanga3", L"𒅍𒈣𒅊", 6058},
+    {L"šanga4", L"𒅍𒂀", 6059},
+    {L"šanga5", L"𒂵𒈣𒆜𒅊", 6060},
+    {L"šanga6", L"𒂵𒈣𒅊", 6061},
+    {L"šanga7", L"𒂵𒂀", 6062},
+    {L"šangav1", L"𒊷", 6056},
+    {L"šangu", L"𒋃", 6063},
+    {L"šangu2L", L"𒋃", 6065},
+    {L"šangu2M", L"𒅍𒈣𒂀", 6064},
+    {L"šangu3", L"𒅍𒈣𒅊", 6066},
+    {L"šangu4", L"𒅍𒂀", 6067},
+    {L"šangu5", L"𒂵𒈣𒆜𒅊", 6068},
+    {L"šangu6", L"𒂵𒈣𒅊", 6069},
+    {L"šangu7", L"𒂵𒂀", 6070},
+    {L"šantag4", L"𒁹", 6071},
+    {L"šantak", L"𒁹", 6072},
+    {L"šantak4", L"𒁹", 6073},
+    {L"šantan", L"𒃲𒉌", 6074},
+    {L"šantana", L"𒃲𒉌", 6075},
+    {L"šap", L"𒉺𒅁", 6076},
+    {L"šap2", L"𒉺𒇻", 6077},
+    {L"šap5", L"𒉺𒇻", 6078},
+    {L"šapra", L"𒑐𒀠", 6079},
+    {L"šaq", L"𒊕", 6080},
+    {L"šaq3", L"𒉺", 6081},
+    {L"šaqa2", L"𒋏", 6084},
+    {L"šaqaL", L"𒇽𒁉𒈜", 6083},
+    {L"šaqaM", L"𒁉𒈜", 6082},
+    {L"šaqu", L"𒁉𒈜", 6085},
+    {L"šaqu2", L"𒋏", 6086},
+    {L"šaqu3", L"𒄣", 6087},
+    {L"šar", L"𒊬", 6088},
+    {L"šar2", L"𒊹", 6089},
+    {L"šar3", L"𒈗", 6090},
+    {L"šar4", L"𒎙", 6091},
+    {L"šar5", L"𒅎", 6092},
+    {L"šar6", L"𒁈", 6093},
+    {L"šar7", L"𒋻", 6094},
+    {L"šar8", L"𒉌", 6095},
+    {L"šara", L"𒁈", 6096},
+    {L"šara2", L"𒇋", 6097},
+    {L"šara3", L"𒇣", 6098},
+    {L"šara4", L"𒇇", 6099},
+    {L"šara5", L"𒅎", 6100},
+    {L"šara6", L"𒊹", 6101},
+    {L"šara7", L"𒊬", 6102},
+    {L"šaran", L"𒁙", 6103},
+    {L"šaran2", L"𒁬", 6104},
+    {L"šardiš", L"𒄱", 6105},
+    {L"šardiši", L"𒄱", 6106},
+    {L"šargad", L"𒄲", 6107},
+    {L"šargadu", L"𒄲", 6108},
+    {L"šargeš", L"𒄱", 6109},
+    {L"šarin", L"𒁬", 6110},
+    {L"šarri", L"𒈗", 6111},
+    {L"šarru", L"𒈗", 6112},
+    {L"šarru2", L"𒎙", 6113},
+    {L"šaru", L"𒐬", 6114},
+    {L"šasL", L"𒆳", 6116},
+    {L"šasM", L"𒋀", 6115},
+    {L"šat", L"𒆳", 6123},
+    {L"šat2", L"𒈬", 6124},
+    {L"šat3", L"𒃻", 6125},
+    {L"šata", L"𒆳", 6126},
+    {L"šatam", L"𒈜", 6127},
+    {L"šattam", L"𒈜", 6128},
+    {L"šašL", L"𒆳", 6119},
+    {L"šašM", L"𒋀", 6118},
+    {L"šašamanur", L"𒅖𒍏", 6120},
+    {L"šaški", L"𒁍", 6121},
+    {L"šašku", L"𒁍", 6122},
+    {L"šaḫ", L"𒋚", 5989},
+    {L"šaḫ2", L"𒂄", 5990},
+    {L"šaḫ3L", L"𒌁", 5992},
+    {L"šaḫ3M", L"𒆤", 5991},
+    {L"šaḫa", L"𒋚", 5993},
+    {L"šaḫab", L"𒋗𒁹", 5994},
+    {L"šaḫab2", L"𒋗𒁹𒌍", 5995},
+    {L"šaḫan", L"𒆳", 5996},
+    {L"šaḫan2", L"𒈲", 5997},
+    {L"šaḫan3", L"𒂄", 5998},
+    {L"šaṣ", L"𒋀", 6117},
+    {L"šaṭ", L"𒆳", 6129},
+    {L"še", L"𒊺", 6130},
+    {L"še10", L"𒆪", 6139},
+    {L"še11", L"𒈜", 6140},
+    {L"še12", L"𒈺", 6141},
+    {L"še12v1", L"𒀀𒈹", 6142},
+    {L"še13", L"𒁺", 6143},
+    {L"še14", L"𒋃", 6144},
+    {L"še15L", L"𒉼", 6146},
+    {L"še15M", L"𒌁", 6145},
+    {L"še16L", L"𒀀𒌁", 6148},
+    {L"še16M", L"𒋀", 6147},
+    {L"še17", L"𒈹𒁲", 6149},
+    {L"še18L", L"𒄷𒈿", 6151},
+    {L"še18Lv1", L"𒄷𒄭𒈿", 6152},
+    {L"še18M", L"𒀀𒈹𒁲", 6150},
+    {L"še19L", L"𒋝", 6154},
+    {L"še19M", L"𒋧", 6153},
+    {L"še2", L"𒋛", 6131},
+    {L"še20", L"𒅆", 6155},
+    {L"še20v1", L"𒂠", 6156},
+    {L"še21L", L"𒋧", 6159},
+    {L"še21M", L"𒄷𒈿", 6157},
+    {L"še21Mv1", L"𒄷𒄭𒈿", 6158},
+    {L"še22L", L"𒆜", 6161},
+    {L"še22M", L"𒂞", 6160},
+    {L"še23", L"𒈹", 6162},
+    {L"še24", L"𒈽", 6163},
+    {L"še25", L"𒆂", 6164},
+    {L"še26", L"𒅝", 6165},
+    {L"še27", L"𒋞", 6166},
+    {L"še28", L"𒅗", 6167},
+    {L"še29", L"𒇽𒃷", 6168},
+    {L"še29v1", L"𒇽𒃸", 6169},
+    {L"še29v2", L"𒈂", 6170},
+    {L"še3", L"𒂠", 6132},
+    {L"še4", L"𒈻", 6133},
+    {L"še5", L"𒍝𒈹𒁲", 6134},
+    {L"še6", L"𒉈", 6135},
+    {L"še7", L"𒀀𒀭", 6136},
+    {L"še8", L"𒋁", 6137},
+    {L"še9", L"𒋙𒀭", 6138},
+    {L"šeb", L"𒈨", 6171},
+    {L"šeb2", L"𒊒", 6172},
+    {L"šebiridaL", L"𒌑𒆳𒊏𒂡", 6174},
+    {L"šebiridaM", L"𒌑𒆳𒊏", 6173},
+    {L"šebuz", L"𒁍", 6175},
+    {L"šed", L"𒋃", 6176},
+    {L"šed10", L"𒈹𒁲", 6185},
+    {L"šed11", L"𒀀𒈹𒁲", 6186},
+    {L"šed12", L"𒈹", 6187},
+    {L"šed13", L"𒈽", 6188},
+    {L"šed14", L"𒆂", 6189},
+    {L"šed15", L"𒅝", 6190},
+    {L"šed16", L"𒋞", 6191},
+    {L"šed17", L"𒅗", 6192},
+    {L"šed3", L"𒉫", 6177},
+    {L"šed4", L"𒆑", 6178},
+    {L"šed5", L"𒆒", 6179},
+    {L"šed5v1", L"𒆓", 6180},
+    {L"šed6", L"𒆪", 6181},
+    {L"šed7", L"𒈻", 6182},
+    {L"šed8", L"𒍝𒈹𒁲", 6183},
+    {L"šed9", L"𒈺", 6184},
+    {L"šedu", L"𒄨", 6193},
+    {L"šedu2", L"𒌜", 6194},
+    {L"šedu3", L"𒀆", 6195},
+    {L"šedur", L"𒇤", 6196},
+    {L"šeg", L"𒋝", 6197},
+    {L"šeg10", L"𒆂", 6206},
+    {L"šeg11", L"𒅝", 6207},
+    {L"šeg12", L"𒋞", 6208},
+    {L"šeg13", L"𒅗", 6209},
+    {L"šeg14", L"𒉎𒀀𒀭", 6210},
+    {L"šeg3", L"𒀀𒀭", 6198},
+    {L"šeg4", L"𒀀𒋙𒉀", 6199},
+    {L"šeg5", L"𒎆", 6200},
+    {L"šeg5v1", L"𒍋", 6201},
+    {L"šeg6", L"𒉈", 6202},
+    {L"šeg7", L"𒅎", 6203},
+    {L"šeg8", L"𒋙𒉀", 6204},
+    {L"šeg9", L"𒊾", 6205},
+    {L"šega9", L"𒊾", 6211},
+    {L"šek2", L"𒋠", 6213},
+    {L"šeknu", L"𒅖𒍏", 6214},
+    {L"šel4", L"𒊩", 6215},
+    {L"šem", L"𒋆", 6216},
+    {L"šem2", L"𒉆", 6217},
+    {L"šem3", L"𒀚", 6218},
+    {L"šem4", L"𒀙", 6219},
+    {L"šem5", L"𒀘", 6220},
+    {L"šem6", L"𒀖𒋺", 6221},
+    {L"šem6v1", L"𒀛", 6222},
+    {L"šem7", L"𒅖𒍏", 6223},
+    {L"šembi", L"𒋍", 6224},
+    {L"šembizi", L"𒋆", 6225},
+    {L"šembulug", L"𒁒", 6226},
+    {L"šembulug2", L"𒋐", 6227},
+    {L"šembulug3", L"𒋌", 6228},
+    {L"šembulug4", L"𒋈", 6229},
+    {L"šembulug5", L"𒋉", 6230},
+    {L"šemešal", L"𒋑", 6231},
+    {L"šemkaš", L"𒋍", 6232},
+    {L"šemkašzi", L"𒋆", 6233},
+    {L"šemlilla", L"𒋑", 6234},
+    {L"šemmešla", L"𒋑", 6235},
+    {L"šemmug3", L"𒋈", 6238},
+    {L"šemmugL", L"𒋈", 6237},
+    {L"šemmugM", L"𒋉", 6236},
+    {L"šen", L"𒊿", 6239},
+    {L"šen2", L"𒍏", 6240},
+    {L"šen3", L"𒉆", 6241},
+    {L"šen4", L"𒁾", 6242},
+    {L"šen5", L"𒅖𒍏", 6243},
+    {L"šen6", L"𒅖", 6244},
+    {L"šenbar", L"𒊾", 6245},
+    {L"šennu", L"𒂗𒈨𒀜𒆬", 6246},
+    {L"šennur", L"𒄒", 6247},
+    {L"šeq2", L"𒋠", 6248},
+    {L"šer", L"𒋓", 6249},
+    {L"šer11", L"𒄊𒁇", 6255},
+    {L"šer2", L"𒁍", 6250},
+    {L"šer3", L"𒂡", 6251},
+    {L"šer4", L"𒍜", 6252},
+    {L"šer7", L"𒉪", 6253},
+    {L"šer9", L"𒊬", 6254},
+    {L"šerba", L"𒀩", 6256},
+    {L"šerbav1", L"𒇇", 6257},
+    {L"šerid", L"𒋳", 6258},
+    {L"šerim", L"𒋳", 6259},
+    {L"šerim2", L"𒇡", 6260},
+    {L"šerimsur", L"𒇜", 6261},
+    {L"šerin", L"𒇡", 6262},
+    {L"šerin2", L"𒇡", 6263},
+    {L"šerinsur", L"𒇡", 6264},
+    {L"šerinsur2", L"𒇜", 6265},
+    {L"šerrida", L"𒌓𒀭𒌓", 6266},
+    {L"šeru", L"𒅎", 6267},
+    {L"šes", L"𒋀", 6268},
+    {L"šesag", L"𒊺𒈗", 6269},
+    {L"šeš", L"𒋀", 6271},
+    {L"šeš2", L"𒋁", 6272},
+    {L"šeš3", L"𒀅", 6273},
+    {L"šeš4", L"𒂞", 6274},
+    {L"šeš5", L"𒀀𒅆", 6275},
+    {L"šešlam", L"𒋂", 6276},
+    {L"šešlam2", L"𒂗𒈨𒇷", 6277},
+    {L"šeššed", L"𒉫𒉫", 6278},
+    {L"šeššeg", L"𒍋𒍋", 6279},
+    {L"šeḫ", L"𒋚", 6212},
+    {L"šeṣ", L"𒋀", 6270},
+    {L"ši", L"𒅆", 6280},
+    {L"ši2", L"𒋛", 6281},
+    {L"ši3", L"𒋝", 6282},
+    {L"ši4", L"𒂠", 6283},
+    {L"ši5L", L"𒋜", 6285},
+    {L"ši5M", L"𒆪", 6284},
+    {L"ši6", L"𒋆", 6286},
+    {L"ši7", L"𒅊", 6287},
+    {L"šib", L"𒈨", 6288},
+    {L"šib2", L"𒊒", 6289},
+    {L"šib3", L"𒉺𒅁", 6290},
+    {L"šibir", L"𒌋𒂘", 6291},
+    {L"šibir2", L"𒂘", 6292},
+    {L"šibir2v1", L"𒂙", 6293},
+    {L"šid", L"𒋃", 6294},
+    {L"šid2", L"𒆐", 6295},
+    {L"šid3", L"𒋺", 6296},
+    {L"šid4", L"𒆑", 6297},
+    {L"šidi", L"𒁶", 6298},
+    {L"šidim", L"𒁶", 6299},
+    {L"šig", L"𒋝", 6300},
+    {L"šig2", L"𒋠", 6301},
+    {L"šig5", L"𒎆", 6302},
+    {L"šig6", L"𒋞", 6303},
+    {L"šigagu", L"𒀿", 6304},
+    {L"šik", L"𒋝", 6308},
+    {L"šik2", L"𒋠", 6309},
+    {L"šik6", L"𒋞", 6310},
+    {L"šika", L"𒆷", 6311},
+    {L"šikanga", L"𒀿", 6313},
+    {L"šikangu", L"𒀿", 6314},
+    {L"šikaḫara", L"𒋟", 6312},
+    {L"šikin", L"𒂁", 6315},
+    {L"šikin2L", L"𒋁", 6317},
+    {L"šikin2M", L"𒂁", 6316},
+    {L"šikin3", L"𒋁", 6318},
+    {L"šil", L"𒋻", 6319},
+    {L"šil2", L"𒋡", 6320},
+    {L"šil3", L"𒌋", 6321},
+    {L"šil4", L"𒇺", 6322},
+    {L"šilam", L"𒉦", 6323},
+    {L"šilig", L"𒍂", 6324},
+    {L"šilig5", L"𒍎", 6325},
+    {L"šilig6", L"𒆂", 6326},
+    {L"šilig7", L"𒅭", 6327},
+    {L"šillam2", L"𒉥", 6328},
+    {L"šim", L"𒋆", 6329},
+    {L"šim2", L"𒉆", 6330},
+    {L"šimbi", L"𒋍", 6331},
+    {L"šimbi2", L"𒋆", 6332},
+    {L"šimbi3", L"𒁌", 6333},
+    {L"šimbirida", L"𒌑𒆳𒊏", 6334},
+    {L"šimbizi", L"𒋆", 6335},
+    {L"šimbulug", L"𒁒", 6336},
+    {L"šimbulug2", L"𒋐", 6337},
+    {L"šimbulug3", L"𒋌", 6338},
+    {L"šimbulug4", L"𒋈", 6339},
+    {L"šimbulug5", L"𒋉", 6340},
+    {L"šimešal", L"𒋑", 6341},
+    {L"šimmešla", L"𒋑", 6342},
+    {L"šimmug", L"𒋉", 6343},
+    {L"šimmug3", L"𒋈", 6344},
+    {L"šin", L"𒊿", 6345},
+    {L"šin2", L"𒈫", 6346},
+    {L"šina", L"𒈫", 6347},
+    {L"šindilib", L"𒆯", 6348},
+    {L"šindilima", L"𒆯", 6349},
+    {L"šinig", L"𒋒", 6350},
+    {L"šip", L"𒈨", 6351},
+    {L"šip3L", L"𒍦", 6353},
+    {L"šip3M", L"𒉺𒅁", 6352},
+    {L"šiq", L"𒋝", 6354},
+    {L"šiq2", L"𒋠", 6355},
+    {L"šiq4", L"𒆂", 6356},
+    {L"šir", L"𒋓", 6357},
+    {L"šir10", L"𒈲", 6365},
+    {L"šir2", L"𒁍", 6358},
+    {L"šir3", L"𒂡", 6359},
+    {L"šir4", L"𒍜", 6360},
+    {L"šir5", L"𒉡", 6361},
+    {L"šir6", L"𒌉", 6362},
+    {L"šir8", L"𒋤", 6363},
+    {L"šir9", L"𒊬", 6364},
+    {L"šira", L"𒍜", 6366},
+    {L"širam", L"𒍜", 6367},
+    {L"širi", L"𒍜", 6368},
+    {L"širim", L"𒍜", 6369},
+    {L"širu", L"𒍜", 6370},
+    {L"širum", L"𒍜", 6371},
+    {L"šis", L"𒋀", 6372},
+    {L"šit", L"𒋃", 6376},
+    {L"šit2", L"𒆐", 6377},
+    {L"šit3", L"𒋺", 6378},
+    {L"šita", L"𒋖", 6379},
+    {L"šita2", L"𒋖𒄑", 6380},
+    {L"šita3", L"𒋥", 6381},
+    {L"šita4", L"𒌋𒆤", 6382},
+    {L"šita5", L"𒋃", 6383},
+    {L"šita6", L"𒋡", 6384},
+    {L"šiten", L"𒆠𒁺𒆕", 6385},
+    {L"šiti", L"𒋃", 6386},
+    {L"šitim", L"𒁶", 6387},
+    {L"šitim2", L"𒋃", 6388},
+    {L"šiz", L"𒋀", 6392},
+    {L"šizbu", L"𒂵", 6393},
+    {L"šiš", L"𒋀", 6374},
+    {L"šiš2", L"𒋁", 6375},
+    {L"šiḫ2", L"𒆤", 6307},
+    {L"šiḫL", L"𒆤", 6306},
+    {L"šiḫM", L"𒋚", 6305},
+    {L"šiṣ", L"𒋀", 6373},
+    {L"šiṭ", L"𒋃", 6389},
+    {L"šiṭ2", L"𒆐", 6390},
+    {L"šiṭ3", L"𒋺", 6391},
+    {L"šu", L"𒋗", 6394},
+    {L"šu10", L"𒈬", 6402},
+    {L"šu11", L"𒋢", 6403},
+    {L"šu12", L"𒆃", 6404},
+    {L"šu13", L"𒁉", 6405},
+    {L"šu14", L"𒋳", 6406},
+    {L"šu15L", L"𒋧", 6408},
+    {L"šu15M", L"𒍮", 6407},
+    {L"šu16", L"𒌋𒌓", 6409},
+    {L"šu2", L"𒋙", 6395},
+    {L"šu3", L"𒂠", 6396},
+    {L"šu4", L"𒌋", 6397},
+    {L"šu5", L"𒇟", 6398},
+    {L"šu6", L"𒇠", 6399},
+    {L"šu7L", L"𒋜", 6401},
+    {L"šu7M", L"𒃻", 6400},
+    {L"šub", L"𒊒", 6410},
+    {L"šub2", L"𒆃", 6411},
+    {L"šub3L", L"𒁲", 6413},
+    {L"šub3M", L"𒉺𒅁", 6412},
+    {L"šub4", L"𒈰", 6414},
+    {L"šub5", L"𒍤𒆸", 6415},
+    {L"šub6", L"𒋃", 6416},
+    {L"šub7", L"𒍝𒈽", 6417},
+    {L"šub8", L"𒍝𒈹", 6418},
+    {L"šuba", L"𒍝𒈽", 6419},
+    {L"šuba2", L"𒍝𒈹", 6420},
+    {L"šuba3", L"𒈹𒍝", 6421},
+    {L"šuba3v1", L"𒎍", 6422},
+    {L"šuba4", L"𒈹", 6423},
+    {L"šuba5", L"𒊒", 6424},
+    {L"šubartin", L"𒋙", 6425},
+    {L"šubtu3", L"𒆜𒆸", 6426},
+    {L"šubtu5", L"𒆜𒇥", 6427},
+    {L"šubtu6", L"𒆝", 6428},
+    {L"šubtu7", L"𒆞", 6429},
+    {L"šubul", L"𒀭", 6430},
+    {L"šubun", L"𒆠𒁉𒃻", 6431},
+    {L"šubur", L"𒋚", 6432},
+    {L"šubur2", L"𒀴", 6433},
+    {L"šubura", L"𒋚", 6434},
+    {L"šud", L"𒋤", 6435},
+    {L"šud2", L"𒁍", 6436},
+    {L"šud3", L"𒆃", 6437},
+    {L"šud4", L"𒋃", 6438},
+    {L"šude3", L"𒆃", 6439},
+    {L"šudu3", L"𒆃", 6440},
+    {L"šudug", L"𒉻", 6441},
+    {L"šudug2", L"𒄴𒈨", 6442},
+    {L"šudul", L"𒋙𒂈", 6443},
+    {L"šudul2", L"𒌋𒌆", 6444},
+    {L"šudul3", L"𒋙𒌪", 6445},
+    {L"šudul3v1", L"𒌋𒌪", 6446},
+    {L"šudul4", L"𒂈", 6447},
+    {L"šudul5", L"𒌪", 6448},
+    {L"šudul6", L"𒌋𒆤", 6449},
+    {L"šudulu", L"𒋙𒂈", 6450},
+    {L"šudum", L"𒋃", 6451},
+    {L"šudun", L"𒋙𒂈", 6452},
+    {L"šudun2", L"𒌋𒌆", 6453},
+    {L"šudun3", L"𒋙𒌪", 6454},
+    {L"šudun3v1", L"𒌋𒌪", 6455},
+    {L"šudun4", L"𒂈", 6456},
+    {L"šudun5", L"𒌪", 6457},
+    {L"šudun6", L"𒌋𒆤", 6458},
+    {L"šug", L"𒉻", 6459},
+    {L"šugbar", L"𒋗𒄨", 6460},
+    {L"šugmaš", L"𒋗𒄨", 6461},
+    {L"šuk", L"𒉻", 6466},
+    {L"šuk2", L"𒈮", 6467},
+    {L"šuk3", L"𒆹", 6468},
+    {L"šukal", L"𒈛", 6469},
+    {L"šukkal", L"𒈛", 6470},
+    {L"šukra", L"𒋗𒃸", 6471},
+    {L"šuku", L"𒉻", 6472},
+    {L"šukum", L"𒄞", 6473},
+    {L"šukun3", L"𒉻", 6474},
+    {L"šukur", L"𒅆𒆕", 6475},
+    {L"šukur2", L"𒉻", 6476},
+    {L"šul", L"𒂄", 6477},
+    {L"šul2", L"𒉌", 6478},
+    {L"šul3", L"𒁲", 6479},
+    {L"šullat", L"𒁁", 6480},
+    {L"šullat2", L"𒉺", 6481},
+    {L"šum", L"𒋳", 6482},
+    {L"šum2", L"𒋧", 6483},
+    {L"šum3", L"𒈬", 6484},
+    {L"šum4", L"𒁁", 6485},
+    {L"šum5", L"𒁔", 6486},
+    {L"šuma", L"𒁁", 6487},
+    {L"šumer", L"𒆠𒂗𒄀", 6488},
+    {L"šumerv1", L"𒆠𒅔𒄀", 6489},
+    {L"šumma", L"𒁁", 6490},
+    {L"šumu", L"𒈬", 6491},
+    {L"šumu2", L"𒋧", 6492},
+    {L"šumu3L", L"𒈬", 6494},
+    {L"šumu3M", L"𒋳", 6493},
+    {L"šumug", L"𒁾", 6495},
+    {L"šumun", L"𒁁", 6496},
+    {L"šumunda", L"𒇰𒊬", 6497},
+    {L"šun", L"𒊿", 6498},
+    {L"šun2", L"𒀯", 6499},
+    {L"šun3", L"𒄢", 6500},
+    {L"šun4", L"𒋧", 6501},
+    {L"šup", L"𒊒", 6502},
+    {L"šup2", L"𒀸", 6503},
+    {L"šup3L", L"𒀸", 6505},
+    {L"šup3M", L"𒉺𒅁", 6504},
+    {L"šuq", L"𒉻", 6506},
+    {L"šur", L"𒋩", 6507},
+    {L"šur2", L"𒊨", 6508},
+    {L"šur3", L"𒋓", 6509},
+    {L"šur4", L"𒇳𒊬", 6510},
+    {L"šur5", L"𒇲𒆸", 6511},
+    {L"šur6", L"𒇳𒆸", 6512},
+    {L"šurim", L"𒇇", 6513},
+    {L"šurim3", L"𒇇", 6514},
+    {L"šurim3v1", L"𒇆", 6515},
+    {L"šurin4", L"𒁨", 6516},
+    {L"šurin5", L"𒁬", 6517},
+    {L"šuripak", L"𒋢𒆳𒊒", 6518},
+    {L"šuripak2", L"𒇵𒊒", 6519},
+    {L"šurippak", L"𒋢𒆳𒊒", 6520},
+    {L"šurippak2", L"𒇵𒊒", 6521},
+    {L"šuru", L"𒇇", 6522},
+    {L"šuru2", L"𒇣", 6523},
+    {L"šuru3", L"𒇇", 6524},
+    {L"šuru3v1", L"𒇆", 6525},
+    {L"šuru6L", L"𒄽", 6527},
+    {L"šuru6M", L"𒋺", 6526},
+    {L"šurum", L"𒇇", 6528},
+    {L"šurum3", L"𒇇", 6529},
+    {L"šurum3v1", L"𒇆", 6530},
+    {L"šurum6", L"𒋺", 6531},
+    {L"šurun", L"𒇇", 6532},
+    {L"šurun2", L"𒇣", 6533},
+    {L"šurun3", L"𒇇", 6534},
+    {L"šurun3v1", L"𒇆", 6535},
+    {L"šurun4", L"𒁨", 6536},
+    {L"šurun5", L"𒁬", 6537},
+    {L"šurupak", L"𒋢𒆳𒊒", 6538},
+    {L"šurupak2", L"𒇵𒊒", 6539},
+    {L"šuruppak", L"𒋢𒆳𒊒", 6540},
+    {L"šuruppak2", L"𒇵𒊒", 6541},
+    {L"šut", L"𒋤", 6559},
+    {L"šut2", L"𒁍", 6560},
+    {L"šuta", L"𒇟", 6561},
+    {L"šutug", L"𒉻", 6562},
+    {L"šutug2", L"𒄴𒈨", 6563},
+    {L"šutul", L"𒋙𒂈", 6564},
+    {L"šutul2", L"𒌋𒌆", 6565},
+    {L"šutul3", L"𒋙𒌪", 6566},
+    {L"šutul3v1", L"𒌋𒌪", 6567},
+    {L"šutul4", L"𒂈", 6568},
+    {L"šutul5", L"𒌪", 6569},
+    {L"šutul6", L"𒌋𒆤", 6570},
+    {L"šutum", L"𒄀𒈾𒀊𒌌", 6571},
+    {L"šutum2", L"𒄀𒈾𒀊𒌈", 6572},
+    {L"šutun", L"𒋙𒂈", 6573},
+    {L"šutun2", L"𒌋𒌆", 6574},
+    {L"šutun3", L"𒋙𒌪", 6575},
+    {L"šutun3v1", L"𒌋𒌪", 6576},
+    {L"šutun4", L"𒂈", 6577},
+    {L"šutun5", L"𒌪", 6578},
+    {L"šutun6", L"𒌋𒆤", 6579},
+    {L"šutur", L"𒈤", 6580},
+    {L"šuturu", L"𒈤", 6581},
+    {L"šuz", L"𒋤", 6584},
+    {L"šuzbu", L"𒈽", 6585},
+    {L"šuzi", L"𒌨", 6586},
+    {L"šuš", L"𒌋", 6542},
+    {L"šuš2", L"𒋙", 6543},
+    {L"šuš3", L"𒅖", 6544},
+    {L"šuš4", L"𒋳", 6545},
+    {L"šuš5", L"𒇟", 6546},
+    {L"šuš6", L"𒇠", 6547},
+    {L"šušana", L"𒑚", 6548},
+    {L"šušana2", L"𒎙", 6549},
+    {L"šušbar", L"𒀨", 6550},
+    {L"šušgim", L"𒄞", 6551},
+    {L"šušmaš", L"𒀨", 6552},
+    {L"šušru", L"𒉽𒉽𒅄", 6553},
+    {L"šušumx", L"𒈹𒂞", 6555},
+    {L"šušur2", L"𒀽", 6558},
+    {L"šušurL", L"𒍭", 6557},
+    {L"šušurM", L"𒀼", 6556},
+    {L"šuššub", L"𒉽𒉽𒅄", 6554},
+    {L"šuḫ", L"𒈽", 6462},
+    {L"šuḫ2", L"𒋚", 6463},
+    {L"šuḫub", L"𒋙𒀯", 6464},
+    {L"šuḫub2", L"𒀯", 6465},
+    {L"šuṭ", L"𒋤", 6582},
+    {L"šuṭ2", L"𒁍", 6583},
+    {L"ʾa", L"𒀪", 7925},
+    {L"ʾa2", L"𒄴", 7926},
+    {L"ʾa3", L"𒂍", 7927},
+    {L"ʾa4L", L"𒀀", 7929},
+    {L"ʾa4M", L"𒄩", 7928},
+    {L"ʾe", L"𒀪", 7930},
+    {L"ʾe2", L"𒄴", 7931},
+    {L"ʾe3", L"𒂍", 7932},
+    {L"ʾe4", L"𒀀", 7933},
+    {L"ʾi", L"𒀪", 7934},
+    {L"ʾi2", L"𒄴", 7935},
+    {L"ʾi3", L"𒄭", 7936},
+    {L"ʾi4", L"𒀀", 7937},
+    {L"ʾu", L"𒀪", 7938},
+    {L"ʾu2", L"𒇇", 7939},
+    {L"ʾu3L", L"𒄴", 7941},
+    {L"ʾu3M", L"𒇇", 7940},
+    {L"ʾu4", L"𒀀", 7942},
+    {L"ʾu5", L"𒄷", 7943},
+    {L"ḫa", L"𒄩", 2436},
+    {L"ḫa2", L"𒄭𒀀", 2437},
+    {L"ḫa3", L"𒌋", 2438},
+    {L"ḫa4", L"𒄭", 2439},
+    {L"ḫa5", L"𒌓", 2440},
+    {L"ḫa6", L"𒄫", 2441},
+    {L"ḫa8", L"𒋖𒄑", 2442},
+    {L"ḫab", L"𒆸", 2443},
+    {L"ḫab2", L"𒇥", 2444},
+    {L"ḫaba", L"𒆸", 2445},
+    {L"ḫabrud", L"𒆢", 2446},
+    {L"ḫabrud2", L"𒆡", 2447},
+    {L"ḫabrud3", L"𒊰", 2448},
+    {L"ḫabrud4", L"𒊵", 2449},
+    {L"ḫabruda", L"𒆢", 2450},
+    {L"ḫabruda2", L"𒆡", 2451},
+    {L"ḫabruda3", L"𒊰", 2452},
+    {L"ḫabruda4", L"𒊵", 2453},
+    {L"ḫad", L"𒉺", 2454},
+    {L"ḫad2", L"𒌓", 2455},
+    {L"ḫad3", L"𒊷", 2456},
+    {L"ḫad4", L"𒆒", 2457},
+    {L"ḫad4v1", L"𒆓", 2458},
+    {L"ḫada", L"𒁬", 2459},
+    {L"ḫaia", L"𒉄", 2461},
+    {L"ḫaiu", L"𒉄", 2462},
+    {L"ḫal", L"𒄬", 2463},
+    {L"ḫal2", L"𒍮", 2464},
+    {L"ḫala", L"𒄬", 2465},
+    {L"ḫalba", L"𒈻", 2466},
+    {L"ḫalba2", L"𒍝𒈹𒁲", 2467},
+    {L"ḫalba3L", L"𒍝𒈽", 2469},
+    {L"ḫalba3M", L"𒍝𒈽𒁲", 2468},
+    {L"ḫalba4", L"𒇳𒄬", 2470},
+    {L"ḫalba5", L"𒇳𒍇", 2471},
+    {L"ḫalba6", L"𒀀𒈹𒁲", 2472},
+    {L"ḫalbi", L"𒈻", 2473},
+    {L"ḫalbi2", L"𒍝𒈹𒁲", 2474},
+    {L"ḫalbi3L", L"𒍝𒈽", 2476},
+    {L"ḫalbi3M", L"𒍝𒈽𒁲", 2475},
+    {L"ḫalbi4", L"𒇳𒄬", 2477},
+    {L"ḫalbi5", L"𒇳𒍇", 2478},
+    {L"ḫalbi6", L"𒀀𒈹𒁲", 2479},
+    {L"ḫalbu", L"𒈻", 2480},
+    {L"ḫalbu2", L"𒍝𒈹𒁲", 2481},
+    {L"ḫalbu3", L"𒍝𒈽𒁲", 2482},
+    {L"ḫalbu4", L"𒇳𒄬", 2483},
+    {L"ḫalbu5", L"𒇳𒍇", 2484},
+    {L"ḫalbu6", L"𒀀𒈹𒁲", 2485},
+    {L"ḫalib", L"𒅆𒆳", 2486},
+    {L"ḫalubba", L"𒃑", 2487},
+    {L"ḫaman", L"𒉺", 2488},
+    {L"ḫamanzer", L"𒋠𒉺𒅁", 2489},
+    {L"ḫamanzir", L"𒋠𒉺𒅁", 2490},
+    {L"ḫamun", L"𒉃", 2491},
+    {L"ḫanbruda", L"𒆢", 2492},
+    {L"ḫanbruda2", L"𒆡", 2493},
+    {L"ḫanburuda2", L"𒆡", 2496},
+    {L"ḫanburudaL", L"𒆡", 2495},
+    {L"ḫanburudaM", L"𒆢", 2494},
+    {L"ḫaniš", L"𒁁", 2497},
+    {L"ḫaniš2", L"𒈗", 2498},
+    {L"ḫaniš3", L"𒉺", 2499},
+    {L"ḫanzalub", L"𒊮𒄀", 2500},
+    {L"ḫap", L"𒆸", 2501},
+    {L"ḫap2", L"𒇥", 2502},
+    {L"ḫar", L"𒄯", 2503},
+    {L"ḫar2", L"𒄞", 2504},
+    {L"ḫar3", L"𒇽𒆸", 2505},
+    {L"ḫar3v1", L"𒈊", 2506},
+    {L"ḫar4", L"𒁚", 2507},
+    {L"ḫar6", L"𒁹", 2508},
+    {L"ḫara", L"𒄯", 2509},
+    {L"ḫara2", L"𒄞", 2510},
+    {L"ḫara3", L"𒇽𒆸", 2511},
+    {L"ḫara3v1", L"𒈊", 2512},
+    {L"ḫara4", L"𒁚", 2513},
+    {L"ḫara5L", L"𒁦", 2515},
+    {L"ḫara5M", L"𒁬", 2514},
+    {L"ḫaru", L"𒁚", 2517},
+    {L"ḫaru4", L"𒁚", 2519},
+    {L"ḫarub", L"𒁬", 2520},
+    {L"ḫaruv1", L"𒄯", 2518},
+    {L"ḫaršu", L"𒌓𒅗𒈦", 2516},
+    {L"ḫas", L"𒋻", 2521},
+    {L"ḫas2", L"𒉺", 2522},
+    {L"ḫas3", L"𒍨", 2523},
+    {L"ḫat", L"𒉺", 2531},
+    {L"ḫata", L"𒉺", 2532},
+    {L"ḫaz", L"𒋻", 2534},
+    {L"ḫaz2", L"𒉺", 2535},
+    {L"ḫazabur", L"𒌑", 2536},
+    {L"ḫaš", L"𒋻", 2526},
+    {L"ḫaš2", L"𒍨", 2527},
+    {L"ḫaš3", L"𒌓", 2528},
+    {L"ḫaš4", L"𒍮", 2529},
+    {L"ḫašḫur", L"𒈢", 2530},
+    {L"ḫaḫad", L"𒌓𒌓", 2460},
+    {L"ḫaṣ", L"𒋻", 2524},
+    {L"ḫaṣ2", L"𒉺", 2525},
+    {L"ḫaṭ", L"𒉺", 2533},
+    {L"ḫe", L"𒄭", 2537},
+    {L"ḫe2", L"𒃶", 2538},
+    {L"ḫegal", L"𒂼", 2539},
+    {L"ḫenbur", L"𒆕", 2540},
+    {L"ḫenbur2", L"𒊺𒆕", 2541},
+    {L"ḫendur", L"𒉺", 2542},
+    {L"ḫenzer", L"𒅆𒁴", 2543},
+    {L"ḫenzir", L"𒅆𒁴", 2544},
+    {L"ḫer", L"𒂡", 2545},
+    {L"ḫeš", L"𒌓", 2546},
+    {L"ḫeš2", L"𒍨", 2547},
+    {L"ḫeš5", L"𒇽𒃷", 2548},
+    {L"ḫeš5v1", L"𒇽𒃸", 2549},
+    {L"ḫeš5v2", L"𒈂", 2550},
+    {L"ḫi", L"𒄭", 2552},
+    {L"ḫi2", L"𒃶", 2553},
+    {L"ḫibira", L"𒀤", 2554},
+    {L"ḫibis", L"𒌉𒁹", 2555},
+    {L"ḫibis2", L"𒀨", 2556},
+    {L"ḫibiz", L"𒌉𒁹", 2557},
+    {L"ḫibiz2", L"𒀨", 2558},
+    {L"ḫil", L"𒄃", 2559},
+    {L"ḫil2", L"𒀸", 2560},
+    {L"ḫilib", L"𒅆𒆳", 2561},
+    {L"ḫilib2", L"𒉀", 2562},
+    {L"ḫilibu", L"𒂌", 2563},
+    {L"ḫir", L"𒂡", 2564},
+    {L"ḫir2", L"𒄯", 2565},
+    {L"ḫir4", L"𒆷", 2566},
+    {L"ḫir5", L"𒄮", 2567},
+    {L"ḫirim", L"𒆠𒄨", 2568},
+    {L"ḫirin", L"𒆠𒄨", 2569},
+    {L"ḫirin2", L"𒆯", 2570},
+    {L"ḫiš", L"𒌓", 2571},
+    {L"ḫiš2", L"𒍨", 2572},
+    {L"ḫiš3", L"𒎕", 2573},
+    {L"ḫiš4", L"𒍽", 2574},
+    {L"ḫu", L"𒄷", 2575},
+    {L"ḫu2", L"𒆭", 2576},
+    {L"ḫu3", L"𒌋", 2577},
+    {L"ḫu4", L"𒄯", 2578},
+    {L"ḫu5", L"𒈝", 2579},
+    {L"ḫub", L"𒄽", 2580},
+    {L"ḫub2", L"𒄸", 2581},
+    {L"ḫubur", L"𒉯", 2584},
+    {L"ḫuburv1", L"𒉸", 2585},
+    {L"ḫubḫub", L"𒋄", 2582},
+    {L"ḫubḫub2", L"𒋅", 2583},
+    {L"ḫud", L"𒉺", 2586},
+    {L"ḫud2", L"𒌓", 2587},
+    {L"ḫud3", L"𒄰", 2588},
+    {L"ḫud4", L"𒊷", 2589},
+    {L"ḫudbu", L"𒑐𒆕", 2590},
+    {L"ḫuduš", L"𒆭", 2591},
+    {L"ḫug", L"𒂠", 2592},
+    {L"ḫul", L"𒅆𒌨", 2594},
+    {L"ḫul2", L"𒄾", 2595},
+    {L"ḫul3", L"𒄒", 2596},
+    {L"ḫul4", L"𒅆𒌪", 2597},
+    {L"ḫulpad", L"𒅆𒌨𒊒𒃻", 2598},
+    {L"ḫulu", L"𒅆𒌨", 2599},
+    {L"ḫulum", L"𒁧", 2601},
+    {L"ḫulum2", L"𒊜", 2602},
+    {L"ḫulum3", L"𒁠", 2603},
+    {L"ḫuluḫ", L"𒈛", 2600},
+    {L"ḫum", L"𒈝", 2604},
+    {L"ḫumuzer", L"𒋠𒉺𒅁", 2606},
+    {L"ḫumuzir", L"𒋠𒉺𒅁", 2607},
+    {L"ḫumuḫ", L"𒇦", 2605},
+    {L"ḫun", L"𒂠", 2608},
+    {L"ḫunin", L"𒁠", 2609},
+    {L"ḫup", L"𒄽", 2610},
+    {L"ḫup2", L"𒄸", 2611},
+    {L"ḫurL", L"𒆳", 2613},
+    {L"ḫurM", L"𒄯", 2612},
+    {L"ḫursag", L"𒑐𒂅", 2614},
+    {L"ḫuru", L"𒄯", 2615},
+    {L"ḫus", L"𒈝", 2616},
+    {L"ḫus2", L"𒋻", 2617},
+    {L"ḫut2", L"𒌓", 2621},
+    {L"ḫuz", L"𒈝", 2623},
+    {L"ḫuš", L"𒍽", 2618},
+    {L"ḫuš2", L"𒄊", 2619},
+    {L"ḫuša", L"𒍽", 2620},
+    {L"ḫuḫud", L"𒌓𒌓", 2593},
+    {L"ḫuṭ2", L"𒌓", 2622},
+    {L"ṣa", L"𒍝", 5879},
+    {L"ṣa2", L"𒉌", 5880},
+    {L"ṣa3", L"𒀭", 5881},
+    {L"ṣab", L"𒂟", 5882},
+    {L"ṣak", L"𒍠", 5886},
+    {L"ṣal", L"𒉌", 5887},
+    {L"ṣap", L"𒂟", 5888},
+    {L"ṣapa", L"𒂟", 5889},
+    {L"ṣar", L"𒇡", 5890},
+    {L"ṣar2", L"𒀫", 5891},
+    {L"ṣar3", L"𒈲", 5892},
+    {L"ṣara", L"𒇡", 5893},
+    {L"ṣaḫ", L"𒉈", 5883},
+    {L"ṣaḫ2L", L"𒋚", 5885},
+    {L"ṣaḫ2M", L"𒆤", 5884},
+    {L"ṣe", L"𒍢", 5894},
+    {L"ṣe2", L"𒍣", 5895},
+    {L"ṣer", L"𒈲", 5898},
+    {L"ṣeri", L"𒂔", 5899},
+    {L"ṣeru", L"𒂔", 5900},
+    {L"ṣeḫ", L"𒋚", 5896},
+    {L"ṣeḫ2", L"𒉈", 5897},
+    {L"ṣi", L"𒍢", 5901},
+    {L"ṣi2", L"𒍣", 5902},
+    {L"ṣi3", L"𒋛", 5903},
+    {L"ṣi9", L"𒂠", 5904},
+    {L"ṣib", L"𒍦", 5905},
+    {L"ṣib2", L"𒍨", 5906},
+    {L"ṣibi", L"𒍦", 5907},
+    {L"ṣil", L"𒉣", 5910},
+    {L"ṣil2", L"𒈪", 5911},
+    {L"ṣil3", L"𒋻", 5912},
+    {L"ṣil4", L"𒄑𒈪", 5913},
+    {L"ṣim", L"𒍮", 5914},
+    {L"ṣin", L"𒌍", 5915},
+    {L"ṣip", L"𒍦", 5916},
+    {L"ṣip2", L"𒍨", 5917},
+    {L"ṣir", L"𒈲", 5918},
+    {L"ṣiri", L"𒈲", 5919},
+    {L"ṣiḫ", L"𒋚", 5908},
+    {L"ṣiḫ2", L"𒉈", 5909},
+    {L"ṣiṣ", L"𒁁", 5920},
+    {L"ṣu", L"𒍮", 5921},
+    {L"ṣu2", L"𒍪", 5922},
+    {L"ṣum", L"𒍮", 5923},
+    {L"ṣur", L"𒀫", 5924},
+    {L"ṣur2", L"𒊨", 5925},
+    {L"ṣur2v1", L"𒈲", 5926},
+    {L"ṣuru", L"𒀫", 5927},
+    {L"ṭa", L"𒁕", 6984},
+    {L"ṭa2", L"𒋫", 6985},
+    {L"ṭa2v1", L"𒋬", 6986},
+    {L"ṭa3", L"𒄭", 6987},
+    {L"ṭa4", L"𒁮", 6988},
+    {L"ṭab", L"𒋰", 6989},
+    {L"ṭab3", L"𒁳", 6990},
+    {L"ṭab4", L"𒍏", 6991},
+    {L"ṭab6", L"𒄭", 6992},
+    {L"ṭad", L"𒋺", 6993},
+    {L"ṭak", L"𒁖", 6996},
+    {L"ṭal", L"𒊑", 6997},
+    {L"ṭam", L"𒁮", 6998},
+    {L"ṭam2", L"𒌓", 6999},
+    {L"ṭan", L"𒄨", 7000},
+    {L"ṭap", L"𒋰", 7001},
+    {L"ṭar", L"𒋻", 7002},
+    {L"ṭar2", L"𒁯", 7003},
+    {L"ṭar3", L"𒁰", 7004},
+    {L"ṭat", L"𒋺", 7005},
+    {L"ṭaḫ", L"𒈭", 6994},
+    {L"ṭaḫ2", L"𒂃", 6995},
+    {L"ṭe", L"𒁲", 7006},
+    {L"ṭe2", L"𒎗", 7007},
+    {L"ṭe3", L"𒉈", 7008},
+    {L"ṭe4", L"𒋼", 7009},
+    {L"ṭe5", L"𒌣", 7010},
+    {L"ṭe6", L"𒋾", 7011},
+    {L"ṭem2", L"𒁶", 7012},
+    {L"ṭep", L"𒁳", 7013},
+    {L"ṭer", L"𒋛𒀀", 7014},
+    {L"ṭi", L"𒁲", 7015},
+    {L"ṭi2", L"𒎗", 7016},
+    {L"ṭi3", L"𒋾", 7017},
+    {L"ṭi4", L"𒋼", 7018},
+    {L"ṭi5", L"𒉈", 7019},
+    {L"ṭi6", L"𒉿", 7020},
+    {L"ṭib", L"𒁳", 7021},
+    {L"ṭib2", L"𒄭", 7022},
+    {L"ṭil", L"𒀸", 7023},
+    {L"ṭil2", L"𒁁", 7024},
+    {L"ṭim", L"𒁴", 7025},
+    {L"ṭim2", L"𒁶", 7026},
+    {L"ṭin", L"𒁷", 7027},
+    {L"ṭip", L"𒁳", 7028},
+    {L"ṭir", L"𒋛𒀀", 7029},
+    {L"ṭir2", L"𒋻", 7030},
+    {L"ṭir3", L"𒋩", 7031},
+    {L"ṭir4", L"𒁯", 7032},
+    {L"ṭir5", L"𒌁", 7033},
+    {L"ṭiš", L"𒁹", 7034},
+    {L"ṭu", L"𒂅", 7035},
+    {L"ṭu2", L"𒌅", 7036},
+    {L"ṭu3", L"𒁺", 7037},
+    {L"ṭu4", L"𒌈", 7038},
+    {L"ṭu5", L"𒂃", 7039},
+    {L"ṭu6", L"𒅗", 7040},
+    {L"ṭub", L"𒁾", 7041},
+    {L"ṭub2", L"𒂀", 7042},
+    {L"ṭug", L"𒂁", 7043},
+    {L"ṭuk", L"𒂁", 7045},
+    {L"ṭul", L"𒇥", 7046},
+    {L"ṭul3L", L"𒌋𒌆", 7048},
+    {L"ṭul3M", L"𒇯", 7047},
+    {L"ṭum", L"𒌈", 7049},
+    {L"ṭum2", L"𒁴", 7050},
+    {L"ṭun", L"𒂅", 7051},
+    {L"ṭup", L"𒁾", 7052},
+    {L"ṭup2", L"𒂀", 7053},
+    {L"ṭur", L"𒄙", 7054},
+    {L"ṭur2", L"𒆪", 7055},
+    {L"ṭur3", L"𒌉", 7056},
+    {L"ṭur4", L"𒄒", 7057},
+    {L"ṭur5", L"𒀀", 7058},
+    {L"ṭur6", L"𒋻", 7059},
+    {L"ṭuš", L"𒆪", 7060},
+    {L"ṭuḫ", L"𒂃", 7044},
+    {L"⫶", L"𒑳", 3},
+}};
+
+}  // namespace 𒄑𒂅𒌋
@@ -0,0 +1,344 @@
+﻿import argparse
+import csv
+import marshal
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import read_sign_list
+import remaps
+import sign_list_sources
+
+# Checks that a candidate build of the dictionary, by default that of the
+# working tree, is equivalent to a reference build, by default that of HEAD,
+# on sign_list.csv and on randomly mutated variants of it, and compares their
+# time and peak memory.
+#
+# Each build runs in a subprocess from a copy of the scripts of its revision,
+# so that the two never share a numbers module or a snapshot; the local remaps
+# and supplementary sign lists of the working tree, if any, are copied to
+# both.  The builds are equivalent on a sign list if they map the same
+# compositions to the same signs, present the dictionary in the same order,
+# or fail with the same error.  A divergence is shown with the rows of the
+# sign list from which the diverging readings come.
+#
+# The mutations shuffle the sign list in the ways that exercise the quirks of
+# the build: the order of rows determines the v suffixes, moving readings
+# between rows creates duplicates and ambiguities, and dropping rows or
+# readings removes the readings that others are disambiguated against.
+#
+# Both revisions must have read_sign_list.build(path) and
+# read_sign_list.dictionary_entries, which the worker calls; the baseline
+# built the dictionary of sign_list.csv when read_sign_list.py was imported,
+# and cannot be compared.
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Run in the directory of a build, with the sign list, the output path, and
+# the number of timed repetitions as arguments.  The peak memory is that of
+# the first build, traced, including the import of the scripts, in particular
+# of numbers.py; the time is the fastest of the untraced repetitions.
+WORKER = '''
+import marshal
+import sys
+import time
+import tracemalloc
+
+path, output, repeat = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+# The rows kept by the build, by their index, from which the Šašková indices
+# of the readings come.
+rows = {}
+
+def record_row(row_readings):
+  def recording_row_readings(row, meszl, row_index):
+    # A read_sign_list.Row, or in older builds the list of its fields.
+    fields = getattr(row, 'fields', row)
+    rows[row_index] = '%s %s (MesZL %s)' % (
+        fields[0], fields[2].split('\\n')[0], meszl.replace('\\n', ' '))
+    return row_readings(row, meszl, row_index)
+  return recording_row_readings
+
+def build():
+  read_sign_list.build(path)
+  rbc = read_sign_list.readings_by_composition
+  return ({composition: readings[0].sign
+           for composition, readings in rbc.items()},
+          {composition: rows.get(readings[0].šašková_index)
+           for composition, readings in rbc.items()},
+          [composition for composition, _ in
+           read_sign_list.dictionary_entries(rbc)])
+
+tracemalloc.start()
+try:
+  import read_sign_list
+  # The builds from before row_readings process the rows inline in build(),
+  # and their readings have no origin.
+  row_readings = getattr(read_sign_list, 'row_readings', None)
+  if row_readings:
+    read_sign_list.row_readings = record_row(row_readings)
+  result = build()
+  if row_readings:
+    read_sign_list.row_readings = row_readings
+  error = None
+except Exception as e:
+  result = ({}, {}, [])
+  error = '%s: %s' % (type(e).__name__, e)
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+times = []
+if error is None:
+  for _ in range(repeat):
+    start = time.perf_counter()
+    build()
+    times.append(time.perf_counter() - start)
+with open(output, 'wb') as file:
+  marshal.dump(result + (error, min(times) if times else None, peak), file)
+'''
+
+class Build:
+  def __init__(self, signs, origins, order, error, time, peak):
+    # The sign of each composition, and a description of the row of the sign
+    # list from which it comes, None for those that do not.
+    self.signs = signs
+    self.origins = origins
+    # The compositions of the dictionary in candidate order.
+    self.order = order
+    self.error = error
+    self.time = time
+    self.peak = peak
+
+def export_revision(revision, directory):
+  # Writes the scripts of the given revision to directory.
+  names = subprocess.run(
+      ['git', 'ls-tree', '--name-only', revision], cwd=DIRECTORY,
+      capture_output=True, check=True, text=True).stdout.split('\n')
+  for name in names:
+    if name.endswith('.py'):
+      with open(os.path.join(directory, name), 'wb') as file:
+        file.write(subprocess.run(
+            ['git', 'show', '%s:%s' % (revision, name)], cwd=DIRECTORY,
+            capture_output=True, check=True).stdout)
+
+def export_working_tree(directory):
+  for name in os.listdir(DIRECTORY):
+    if name.endswith('.py'):
+      shutil.copy(os.path.join(DIRECTORY, name), directory)
+
+def check_build(directory, name):
+  # Raises unless the scripts in directory have the functions that the worker
+  # calls.
+  with open(os.path.join(directory, 'read_sign_list.py'),
+            encoding='utf-8-sig') as file:
+    source = file.read()
+  for function in (r'build\(path\b', r'dictionary_entries\('):
+    if not re.search(r'^def ' + function, source, re.MULTILINE):
+      raise ValueError('The %s has no read_sign_list.build(path) and '
+                       'dictionary_entries, and cannot be compared' % name)
+
+def copy_local_inputs(directory):
+  # The local remaps and the supplementary sign lists, at the same place
+  # relative to the scripts.
+  for path in [remaps.LOCAL_REMAPS_PATH] + sign_list_sources.input_paths():
+    relative_path = os.path.relpath(path, DIRECTORY)
+    if os.path.exists(path) and not relative_path.startswith('..'):
+      os.makedirs(os.path.join(directory, os.path.dirname(relative_path)),
+                  exist_ok=True)
+      shutil.copy(path, os.path.join(directory, relative_path))
+
+def run_build(directory, path, repeat):
+  output = os.path.join(directory, 'build.marshal')
+  process = subprocess.run(
+      [sys.executable, '-c', WORKER, path, output, str(repeat)],
+      cwd=directory, capture_output=True, text=True)
+  if process.returncode:
+    raise RuntimeError('The build in %s crashed:\n%s' % (directory,
+                                                         process.stderr))
+  with open(output, 'rb') as file:
+    return Build(*marshal.load(file))
+
+def read_rows(path):
+  with open(path, encoding='utf-8', newline='') as file:
+    return list(csv.reader(file))
+
+def write_rows(rows, path):
+  with open(path, 'w', encoding='utf-8', newline='') as file:
+    csv.writer(file, lineterminator='\n').writerows(rows)
+
+def _split_readings(block):
+  # The top-level readings of the line of readings of a row, e.g.,
+  # (DA2, ṬA2), or None if its parentheses do not balance.
+  if not (block.startswith('(') and block.endswith(')')):
+    return None
+  readings = ['']
+  depth = 0
+  for c in block[1:-1]:
+    depth += c == '('
+    depth -= c == ')'
+    if depth < 0:
+      return None
+    if c == ',' and depth == 0:
+      readings.append('')
+    else:
+      readings[-1] += c
+  if depth:
+    return None
+  return [reading.strip() for reading in readings if reading.strip()]
+
+def _with_readings(row, readings):
+  lines = row[2].split('\n')
+  lines[1] = '(%s)' % ', '.join(readings)
+  return row[:2] + ['\n'.join(lines)] + row[3:]
+
+def mutate(rows, rng, count):
+  # The rows with count random mutations.  Only the rows of signs are
+  # mutated, and those whose readings are in balanced parentheses, since the
+  # build patches the others by MesZL number.
+  rows = [list(row) for row in rows]
+  end = next((i for i, row in enumerate(rows) if row == [''] * 6), len(rows))
+  def readings_of(i):
+    lines = rows[i][2].split('\n')
+    return _split_readings(lines[1]) if len(lines) == 3 else None
+  mutations = []
+  for _ in range(count):
+    i = rng.randrange(end)
+    j = rng.randrange(end)
+    kind = rng.choice(['drop row', 'swap rows', 'drop reading',
+                       'move reading', 'shuffle readings'])
+    meszl = rows[i][3].split('\n')[0]
+    if kind == 'drop row':
+      del rows[i]
+      end -= 1
+    elif kind == 'swap rows':
+      i = min(i, end - 2)
+      rows[i], rows[i + 1] = rows[i + 1], rows[i]
+    else:
+      readings = readings_of(i)
+      if not readings:
+        continue
+      if kind == 'drop reading':
+        del readings[rng.randrange(len(readings))]
+        if not readings:
+          continue
+      elif kind == 'move reading':
+        others = readings_of(j)
+        if others is None or i == j:
+          continue
+        others.append(readings.pop(rng.randrange(len(readings))))
+        if not readings:
+          continue
+        rows[j] = _with_readings(rows[j], others)
+      else:
+        rng.shuffle(readings)
+      rows[i] = _with_readings(rows[i], readings)
+    mutations.append('%s at MesZL %s' % (kind, meszl))
+  return rows, mutations
+
+def compare(reference, candidate, limit=10):
+  # The lines describing the divergences between the builds.
+  if reference.error or candidate.error:
+    if reference.error == candidate.error:
+      return []
+    return ['reference: %s' % (reference.error or 'success'),
+            'candidate: %s' % (candidate.error or 'success')]
+  divergences = []
+  for composition in sorted(set(reference.signs) | set(candidate.signs)):
+    old = reference.signs.get(composition)
+    new = candidate.signs.get(composition)
+    if old != new:
+      origin = (candidate.origins.get(composition) or
+                reference.origins.get(composition) or 'not from a row')
+      divergences.append('%s: %s -> %s, from %s' % (composition, old, new,
+                                                    origin))
+  if not divergences and reference.order != candidate.order:
+    first = next(i for i, (old, new) in enumerate(zip(reference.order,
+                                                      candidate.order))
+                 if old != new)
+    divergences.append('candidate order differs at rank %d: %s vs. %s' % (
+        first, reference.order[first], candidate.order[first]))
+  if len(divergences) > limit:
+    divergences[limit:] = ['... and %d more' % (len(divergences) - limit)]
+  return divergences
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Checks that the build of the working tree produces the '
+                  'same dictionary as that of a reference revision, on '
+                  'sign_list.csv and mutations of it, and compares their '
+                  'time and memory.')
+  parser.add_argument('--reference', default='HEAD',
+                      help='the git revision of the reference build')
+  parser.add_argument('--candidate',
+                      help='the git revision of the candidate build; '
+                           'defaults to the working tree')
+  parser.add_argument('--sign-list', default=read_sign_list.SIGN_LIST_PATH)
+  parser.add_argument('--variants', type=int, default=10,
+                      help='the number of mutated sign lists')
+  parser.add_argument('--mutations', type=int, default=5,
+                      help='the number of mutations of each variant')
+  parser.add_argument('--repeat', type=int, default=3,
+                      help='the number of timed builds, of which the fastest '
+                           'is reported')
+  parser.add_argument('--max-slowdown', type=float,
+                      help='fail if the candidate build of sign_list.csv is '
+                           'slower than the reference by more than this '
+                           'factor')
+  parser.add_argument('--seed', type=int, default=0)
+  args = parser.parse_args()
+
+  failed = False
+  with tempfile.TemporaryDirectory() as directory:
+    reference_directory = os.path.join(directory, 'reference')
+    candidate_directory = os.path.join(directory, 'candidate')
+    for build_directory in (reference_directory, candidate_directory):
+      os.mkdir(build_directory)
+      copy_local_inputs(build_directory)
+    export_revision(args.reference, reference_directory)
+    if args.candidate:
+      export_revision(args.candidate, candidate_directory)
+    else:
+      export_working_tree(candidate_directory)
+    check_build(reference_directory, 'reference %s' % args.reference)
+    check_build(candidate_directory,
+                'candidate %s' % (args.candidate or 'working tree'))
+
+    rows = read_rows(args.sign_list)
+    rng = random.Random(args.seed)
+    variants = [('sign_list.csv', rows, [])]
+    for i in range(args.variants):
+      variants.append(('variant %d' % (i + 1),) +
+                      mutate(rows, rng, args.mutations))
+    for name, variant_rows, mutations in variants:
+      path = os.path.join(directory, 'sign_list.csv')
+      write_rows(variant_rows, path)
+      reference = run_build(reference_directory, path, args.repeat)
+      candidate = run_build(candidate_directory, path, args.repeat)
+      divergences = compare(reference, candidate)
+      if reference.error:
+        status = 'both fail' if not divergences else 'DIVERGES'
+      else:
+        status = 'equivalent' if not divergences else 'DIVERGES'
+      timing = ''
+      if reference.time is not None and candidate.time is not None:
+        timing = ('; %.0f -> %.0f ms, peak %.1f -> %.1f MiB' % (
+            reference.time * 1000, candidate.time * 1000,
+            reference.peak / 2**20, candidate.peak / 2**20))
+      print('%s: %s%s' % (name, status, timing))
+      if mutations:
+        print('  mutations: %s' % '; '.join(mutations))
+      if reference.error and not divergences:
+        print('  %s' % reference.error)
+      for divergence in divergences:
+        print('  ' + divergence)
+      failed |= bool(divergences)
+      if (name == 'sign_list.csv' and args.max_slowdown and
+          reference.time is not None and candidate.time is not None and
+          candidate.time > reference.time * args.max_slowdown):
+        print('  candidate is %.2f times slower than the reference' % (
+            candidate.time / reference.time))
+        failed = True
+  sys.exit(1 if failed else 0)
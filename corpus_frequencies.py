@@ -0,0 +1,182 @@
+﻿import argparse
+import array
+import collections
+import concurrent.futures
+import functools
+import marshal
+import os
+import re
+import sys
+
+import snapshot
+
+# Counts the frequencies of readings in ATF corpus dumps, e.g., from CDLI or
+# Oracc, for ranking the candidates of the IME by usage.
+#
+# The dumps are split into chunks of lines that are tokenized in a process
+# pool; each chunk yields a collections.Counter of readings, and the counters
+# are merged as they complete.  The counts are written to a frequency table
+# that read_sign_list.py --frequencies loads, so that the ranking can be
+# rebuilt without reparsing the corpus.  Tables are mergeable: --merge adds the
+# counts of new dumps to an existing table.
+#
+# Readings are counted by their lowercase value, as in the composition of a
+# reading without its disambiguator: šar2, 1aš, 1/2iku.  Sign frequencies
+# depend on the sign list, so they are derived from the reading counts when
+# needed rather than stored; see sign_frequencies.
+
+# Bump this whenever the layout of the table changes.
+TABLE_VERSION = 1
+
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+# Text lines start with a line number, e.g., 1., 1'., or a+1.; the other lines
+# are structure, comments, and translations.
+_TEXT_LINE = re.compile(r"^[^\s.]+\.\s")
+_INLINE_COMMENT = re.compile(r'\(\$.*?\$\)')
+_GRAPHEME_SEPARATORS = re.compile(r'[-.+{}]')
+_NUMBER = re.compile(r'^([0-9/]+)\((.*)\)$')
+_QUALIFICATION = re.compile(r'\(.*\)$')
+_FLAGS = str.maketrans('', '', '#!?*[]⸢⸣<>')
+_SUBSCRIPTS = str.maketrans('₀₁₂₃₄₅₆₇₈₉ₓ', '0123456789x')
+
+# The ASCII spellings of C-ATF, in the order in which they are replaced.  In
+# ATF, h is ḫ.
+_ASCII_ATF = [
+  ('sz', 'š'),
+  ('s,', 'ṣ'),
+  ('t,', 'ṭ'),
+  ('h', 'ḫ'),
+  ("'", 'ʾ'),
+]
+
+_READING_CHARACTERS = re.compile(r'^[a-zšṣṭḫʾ0-9/]+$')
+
+# Cached, since a corpus uses few distinct graphemes many times over.
+@functools.lru_cache(maxsize=1 << 16)
+def normalize_grapheme(grapheme):
+  # The lowercase value for a grapheme of an ATF transliteration, or None if
+  # it is not a reading, e.g., a broken sign x or a compound |A.AN|.
+  grapheme = grapheme.lower().translate(_SUBSCRIPTS)
+  for spelling, letter in _ASCII_ATF:
+    grapheme = grapheme.replace(spelling, letter)
+  grapheme = grapheme.split('~')[0].split('@')[0]
+  number = _NUMBER.match(grapheme)
+  if number:
+    # 3(diš) is written 3, as in numbers.py; 1(aš) is 1aš.
+    count, unit = number.groups()
+    grapheme = count if unit == 'diš' else count + unit
+  else:
+    grapheme = _QUALIFICATION.sub('', grapheme)
+  if grapheme in ('x', 'n') or not _READING_CHARACTERS.match(grapheme):
+    return None
+  return grapheme
+
+def graphemes(line):
+  # The graphemes on a line of ATF, in order, as their readings, or None for
+  # those that are not readings.
+  if not _TEXT_LINE.match(line):
+    return
+  for word in _INLINE_COMMENT.sub(' ', line).split()[1:]:
+    for grapheme in _GRAPHEME_SEPARATORS.split(word.translate(_FLAGS)):
+      if grapheme:
+        yield normalize_grapheme(grapheme)
+
+def tokenize(line):
+  # The readings on a line of ATF.
+  for reading in graphemes(line):
+    if reading:
+      yield reading
+
+def _count_chunk(path, start, end):
+  counts = collections.Counter()
+  with open(path, 'rb') as file:
+    file.seek(start)
+    for line in file.read(end - start).decode('utf-8', 'replace').splitlines():
+      counts.update(tokenize(line))
+  return counts
+
+def _chunks(path, chunk_size):
+  # Byte ranges of path that start and end on line boundaries.
+  size = os.path.getsize(path)
+  with open(path, 'rb') as file:
+    start = 0
+    while start < size:
+      file.seek(min(start + chunk_size, size))
+      file.readline()
+      end = min(file.tell(), size)
+      yield start, end
+      start = end
+
+def count(paths, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+  counts = collections.Counter()
+  with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+    futures = [executor.submit(_count_chunk, path, start, end)
+               for path in paths
+               for start, end in _chunks(path, chunk_size)]
+    for future in concurrent.futures.as_completed(futures):
+      counts.update(future.result())
+  return counts
+
+def write(counts, path):
+  # The table holds the readings as one string and the counts as an array,
+  # most frequent first.
+  readings = sorted(counts, key=lambda reading: (-counts[reading], reading))
+  table = (TABLE_VERSION,
+           '\n'.join(readings),
+           array.array('Q', (counts[reading] for reading in readings)).tobytes())
+  with open(path + '.tmp', 'wb') as file:
+    file.write(marshal.dumps(table))
+  os.replace(path + '.tmp', path)
+
+def read(path):
+  # A collections.Counter of the readings in the table at path.
+  with open(path, 'rb') as file:
+    version, readings, counts = marshal.loads(file.read())
+  if version != TABLE_VERSION:
+    raise ValueError('%s is a version %d frequency table, expected %d' % (
+        path, version, TABLE_VERSION))
+  counts = array.array('Q', counts)
+  return collections.Counter(
+      dict(zip(readings.split('\n'), counts)) if readings else {})
+
+def sign_frequencies(reading_counts, readings_by_composition):
+  # The number of occurrences of each sign, as the sum of the counts of its
+  # readings.
+  counts = collections.Counter()
+  seen = set()
+  for readings in readings_by_composition.values():
+    for reading in readings:
+      key = (reading.sign, reading.value.lower())
+      if key not in seen:
+        seen.add(key)
+        counts[reading.sign] += reading_counts[reading.value.lower()]
+  return counts
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Counts readings in ATF corpus dumps into a frequency table '
+                  'for read_sign_list.py --frequencies.')
+  parser.add_argument('corpus', nargs='+', help='ATF files')
+  parser.add_argument('--output', required=True, help='the frequency table')
+  parser.add_argument('--merge', action='store_true',
+                      help='add to the counts already in --output')
+  parser.add_argument('--workers', type=int,
+                      help='the number of processes; defaults to the number '
+                           'of CPUs')
+  parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                      help='the size in bytes of the chunks given to a worker')
+  args = parser.parse_args()
+  counts = count(args.corpus, args.workers, args.chunk_size)
+  if args.merge and os.path.exists(args.output):
+    counts.update(read(args.output))
+  write(counts, args.output)
+  print('%d occurrences of %d readings' % (sum(counts.values()), len(counts)),
+        file=sys.stderr)
+  for reading, n in counts.most_common(10):
+    print('  %-10s %d' % (reading, n), file=sys.stderr)
+  model = snapshot.read()
+  if model:
+    print('Most frequent signs:', file=sys.stderr)
+    for sign, n in sign_frequencies(counts, model[0]).most_common(10):
+      print('  %-10s %d' % (sign, n), file=sys.stderr)
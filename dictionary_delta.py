@@ -0,0 +1,228 @@
+﻿import argparse
+import bisect
+import hashlib
+import marshal
+import os
+import re
+import sys
+import zlib
+
+import exporters
+import front_coding
+
+# Deltas between two builds of the dictionary, so that an install can be
+# brought up to date by shipping the changes rather than the whole of
+# Dictionary/sign_list.txt.
+#
+# A delta holds the compositions that are removed, those that are kept in
+# place but retargeted to another sign, and the entries that are inserted, with
+# their ranks in the new candidate order.  Applying a delta to the entries of
+# the old build, in candidate order, removes the former, retargets the kept
+# ones, and inserts the latter at their ranks, in increasing order of rank.
+# This reproduces the new order provided that the entries that are kept remain
+# in the same relative order; the diff therefore keeps the longest run of
+# common entries whose order is unchanged, and treats the others as moved,
+# removed and reinserted.  When the frequency ranking changes, this may be
+# most of the dictionary, but then so is the change.
+#
+# The delta file is the zlib-compressed marshal of
+#   (DELTA_VERSION, old digest, new digest, removed, retargeted, inserted),
+# where removed is a string of newline-separated compositions, retargeted is
+# a list of composition and sign strings, alternating, and inserted a list of
+# rank, composition, and sign; the digests are those of the entries of the
+# builds, so that a delta is only applied to the build from which it was
+# computed.
+
+# Bump this whenever the layout of a delta changes.
+DELTA_VERSION = 1
+
+def digest(entries):
+  # A digest of the (composition, sign) pairs in candidate order.
+  result = hashlib.sha256()
+  for composition, sign in entries:
+    result.update(('%s=%s\n' % (composition, sign)).encode('utf-8'))
+  return result.hexdigest()
+
+def _merge(old_entries, new_entries):
+  # Merges the entries of the two builds, sorted by composition.  Yields
+  # (composition, old rank, old sign, new rank, new sign), with None for the
+  # rank and sign in the build in which the composition is absent.
+  old = sorted((composition, rank, sign)
+               for rank, (composition, sign) in enumerate(old_entries))
+  new = sorted((composition, rank, sign)
+               for rank, (composition, sign) in enumerate(new_entries))
+  i = j = 0
+  while i < len(old) or j < len(new):
+    if j == len(new) or (i < len(old) and old[i][0] < new[j][0]):
+      yield old[i][0], old[i][1], old[i][2], None, None
+      i += 1
+    elif i == len(old) or new[j][0] < old[i][0]:
+      yield new[j][0], None, None, new[j][1], new[j][2]
+      j += 1
+    else:
+      yield old[i][0], old[i][1], old[i][2], new[j][1], new[j][2]
+      i += 1
+      j += 1
+
+def _longest_increasing_run(values):
+  # The indices of a longest increasing subsequence of values, which are
+  # distinct.
+  tails = []  # The index of the smallest tail of a run of each length.
+  tail_values = []
+  predecessors = [None] * len(values)
+  for i, value in enumerate(values):
+    length = bisect.bisect_left(tail_values, value)
+    if length:
+      predecessors[i] = tails[length - 1]
+    if length == len(tails):
+      tails.append(i)
+      tail_values.append(value)
+    else:
+      tails[length] = i
+      tail_values[length] = value
+  result = []
+  i = tails[-1] if tails else None
+  while i is not None:
+    result.append(i)
+    i = predecessors[i]
+  return result[::-1]
+
+class Delta:
+  def __init__(self, old_digest, new_digest, removed, retargeted, inserted):
+    self.old_digest = old_digest
+    self.new_digest = new_digest
+    # The compositions removed, including those moved.
+    self.removed = removed
+    # The (composition, new sign) pairs of the entries kept in place.
+    self.retargeted = retargeted
+    # The (rank, composition, sign) triples inserted, by increasing rank.
+    self.inserted = inserted
+
+  def __len__(self):
+    return len(self.removed) + len(self.retargeted) + len(self.inserted)
+
+def diff(old_entries, new_entries):
+  # The Delta from the old to the new (composition, sign) pairs, in candidate
+  # order.
+  removed = []
+  retargeted = []
+  inserted = []
+  common = []  # The (old rank, new rank, composition, old sign, new sign).
+  for composition, old_rank, old_sign, new_rank, new_sign in _merge(
+      old_entries, new_entries):
+    if new_rank is None:
+      removed.append(composition)
+    elif old_rank is None:
+      inserted.append((new_rank, composition, new_sign))
+    else:
+      common.append((old_rank, new_rank, composition, old_sign, new_sign))
+  common.sort()
+  kept = set(_longest_increasing_run([entry[1] for entry in common]))
+  for i, (_, new_rank, composition, old_sign, new_sign) in enumerate(common):
+    if i not in kept:
+      removed.append(composition)
+      inserted.append((new_rank, composition, new_sign))
+    elif new_sign != old_sign:
+      retargeted.append((composition, new_sign))
+  inserted.sort()
+  return Delta(digest(old_entries), digest(new_entries), removed, retargeted,
+               inserted)
+
+def apply(entries, delta):
+  # The (composition, sign) pairs, in candidate order, obtained by applying
+  # the delta to those of the old build.
+  if digest(entries) != delta.old_digest:
+    raise ValueError('The delta does not apply to this dictionary')
+  removed = set(delta.removed)
+  retargeted = dict(delta.retargeted)
+  result = [(composition, retargeted.get(composition, sign))
+            for composition, sign in entries if composition not in removed]
+  for rank, composition, sign in delta.inserted:
+    result.insert(rank, (composition, sign))
+  if digest(result) != delta.new_digest:
+    raise ValueError('The delta did not produce the expected dictionary')
+  return result
+
+def write(delta, path):
+  data = marshal.dumps((
+      DELTA_VERSION, delta.old_digest, delta.new_digest,
+      '\n'.join(delta.removed),
+      [s for entry in delta.retargeted for s in entry],
+      [x for entry in delta.inserted for x in entry]))
+  with open(path + '.tmp', 'wb') as file:
+    file.write(zlib.compress(data, 9))
+  os.replace(path + '.tmp', path)
+
+def read(path):
+  with open(path, 'rb') as file:
+    (version, old_digest, new_digest, removed, retargeted,
+     inserted) = marshal.loads(zlib.decompress(file.read()))
+  if version != DELTA_VERSION:
+    raise ValueError('%s is a version %d delta, expected %d' % (
+        path, version, DELTA_VERSION))
+  return Delta(old_digest, new_digest,
+               removed.split('\n') if removed else [],
+               list(zip(retargeted[0::2], retargeted[1::2])),
+               list(zip(inserted[0::3], inserted[1::3], inserted[2::3])))
+
+_SAMPLE_IME_ENTRY = re.compile(r'^"(.*)"="(.*)"$')
+
+def read_sample_ime(path):
+  # The entries of a dictionary in the format of Dictionary/sign_list.txt, as
+  # written by exporters.write_sample_ime.
+  entries = []
+  with open(path, encoding='utf-16', newline='') as file:
+    for line in file:
+      match = _SAMPLE_IME_ENTRY.match(line.rstrip('\r\n'))
+      if not match:
+        raise ValueError('%s: unexpected line %r' % (path, line))
+      entries.append(match.groups())
+  return entries
+
+def _format(path):
+  with open(path, 'rb') as file:
+    magic = file.read(len(front_coding.MAGIC))
+  return 'front_coded' if magic == front_coding.MAGIC else 'sample_ime'
+
+def read_entries(path):
+  # The entries of a text or front-coded dictionary.
+  if _format(path) == 'front_coded':
+    return front_coding.FrontCodedDictionary(path).entries()
+  return read_sample_ime(path)
+
+def apply_to_file(path, delta, output=None):
+  # Applies the delta to the dictionary at path, writing the result in the
+  # same format to output, by default in place.
+  output = output or path
+  entries = apply(read_entries(path), delta)
+  exporters.export(entries, [(_format(path), output)])
+  return entries
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Computes and applies deltas between builds of the '
+                  'dictionary, as text (Dictionary/sign_list.txt) or '
+                  'front-coded dictionaries.')
+  subparsers = parser.add_subparsers(dest='command', required=True)
+  diff_parser = subparsers.add_parser(
+      'diff', help='write the delta from OLD to NEW to DELTA')
+  diff_parser.add_argument('old')
+  diff_parser.add_argument('new')
+  diff_parser.add_argument('delta')
+  apply_parser = subparsers.add_parser(
+      'apply', help='apply DELTA to DICTIONARY')
+  apply_parser.add_argument('dictionary')
+  apply_parser.add_argument('delta')
+  apply_parser.add_argument('--output',
+                            help='where to write the result; defaults to '
+                                 'updating DICTIONARY in place')
+  args = parser.parse_args()
+  if args.command == 'diff':
+    delta = diff(read_entries(args.old), read_entries(args.new))
+    write(delta, args.delta)
+    print('%d removed, %d retargeted, %d inserted; %d bytes' % (
+        len(delta.removed), len(delta.retargeted), len(delta.inserted),
+        os.path.getsize(args.delta)), file=sys.stderr)
+  else:
+    entries = apply_to_file(args.dictionary, read(args.delta), args.output)
+    print('%d entries' % len(entries), file=sys.stderr)
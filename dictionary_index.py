@@ -0,0 +1,105 @@
+﻿import bisect
+import re
+
+import dictionary_delta
+import folding
+import fuzzy_lookup
+import read_sign_list
+import snapshot
+
+class DictionaryIndex:
+  # Lookups over the IME dictionary, with the results in candidate order.
+  # frequencies is as for read_sign_list.dictionary_entries.
+  def __init__(self, readings_by_composition, frequencies=None):
+    self._index(read_sign_list.dictionary_entries(readings_by_composition,
+                                                  frequencies))
+
+  @staticmethod
+  def from_entries(entries):
+    # The index of the given (composition, sign) pairs, in candidate order.
+    index = DictionaryIndex.__new__(DictionaryIndex)
+    index._index(entries)
+    return index
+
+  def _index(self, entries):
+    self.entries = entries
+    self.signs = {}
+    self.ranks = {}
+    self.compositions_by_sign = {}
+    for rank, (composition, sign) in enumerate(self.entries):
+      self.signs[composition] = sign
+      self.ranks[composition] = rank
+      self.compositions_by_sign.setdefault(sign, []).append(composition)
+    # Sorted by their lowercase, so that the compositions with a given prefix
+    # are contiguous when compared case-insensitively, as in the IME.
+    self.keys = sorted(self.signs, key=lambda composition: (
+        composition.lower(), composition))
+    self.lowercase_keys = [composition.lower() for composition in self.keys]
+    self.fuzzy_index = fuzzy_lookup.FuzzyIndex(self.keys)
+    self.compositions_by_folding = folding.folding_index(self.entries)
+
+  @staticmethod
+  def load(path=snapshot.SNAPSHOT_PATH, frequencies=None):
+    readings_by_composition, _ = snapshot.load(path)
+    return DictionaryIndex(readings_by_composition, frequencies)
+
+  def patched(self, delta):
+    # The index of this dictionary updated by the given
+    # dictionary_delta.Delta, without rebuilding the model.
+    return DictionaryIndex.from_entries(
+        dictionary_delta.apply(self.entries, delta))
+
+  def _in_candidate_order(self, compositions):
+    return [(composition, self.signs[composition])
+            for composition in sorted(compositions, key=self.ranks.get)]
+
+  def _with_prefix(self, prefix):
+    # The compositions that start with prefix, ignoring case.  No composition
+    # has a character beyond U+10FFFF.
+    prefix = prefix.lower()
+    return self.keys[
+        bisect.bisect_left(self.lowercase_keys, prefix):
+        bisect.bisect_left(self.lowercase_keys, prefix + '\U0010FFFF')]
+
+  def exact(self, composition):
+    # Case-sensitive, since galam and galaM are distinct compositions.
+    return self.signs.get(composition)
+
+  def prefix(self, prefix):
+    # Ignoring case, as the IME.
+    return self._in_candidate_order(self._with_prefix(prefix))
+
+  def wildcard(self, pattern):
+    # As CStringRange::WildcardCompare in the IME, * matches any sequence and
+    # ? any single character, ignoring case.  Only the keys sharing the
+    # literal prefix of the pattern are tested.
+    literal_prefix = re.match(r'[^*?]*', pattern)[0]
+    regex = re.compile(''.join(
+        '.*' if c == '*' else '.' if c == '?' else re.escape(c)
+        for c in pattern) + r'\Z', re.DOTALL | re.IGNORECASE)
+    return self._in_candidate_order(
+        composition for composition in self._with_prefix(literal_prefix)
+        if regex.match(composition))
+
+  def folded(self, text):
+    # The (composition, sign) pairs whose composition folds to the folding of
+    # text (see folding), in candidate order.
+    folded = folding.fold_input(text)
+    compositions = self.compositions_by_folding.get(folded)
+    if compositions is None:
+      compositions = [folded] if folded in self.signs else []
+    return [(composition, self.signs[composition])
+            for composition in compositions]
+
+  def readings(self, sign):
+    # The compositions of the given sign.
+    return self.compositions_by_sign.get(sign, [])
+
+  def fuzzy(self, query, max_distance=fuzzy_lookup.DEFAULT_MAX_DISTANCE):
+    # The [composition, sign, distance] triples for the compositions within
+    # max_distance of query (see fuzzy_lookup), nearest first, then in
+    # candidate order.
+    return [(composition, self.signs[composition], distance)
+            for distance, composition in sorted(
+                self.fuzzy_index.search(query, max_distance),
+                key=lambda result: (result[0], self.ranks[result[1]]))]
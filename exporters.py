@@ -0,0 +1,108 @@
+﻿import concurrent.futures
+import os
+
+import front_coding
+import key_transitions
+import sharded_dictionary
+import static_dictionary
+
+# Writers of the dictionary in the table formats of various input method
+# frameworks.  Each takes the (composition, sign) pairs in candidate order, as
+# returned by read_sign_list.dictionary_entries, and a path, and streams the
+# table to that path.  Register further formats in EXPORTERS.
+
+NAME = 'Xsux'
+
+def _open(path, encoding='utf-8', newline='\n'):
+  return open(path, 'w', encoding=encoding, newline=newline)
+
+def write_sample_ime(entries, path):
+  # The format of Dictionary/sign_list.txt, read by CTableDictionaryEngine.
+  with _open(path, encoding='utf-16', newline='\r\n') as file:
+    for composition, sign in entries:
+      file.write('"%s"="%s"\n' % (composition, sign))
+
+def write_tsv(entries, path):
+  with _open(path) as file:
+    for composition, sign in entries:
+      file.write('%s\t%s\n' % (composition, sign))
+
+def _key_characters(entries):
+  return ''.join(sorted({c for composition, _ in entries for c in composition}))
+
+def _max_key_length(entries):
+  return max(len(composition) for composition, _ in entries)
+
+def write_fcitx(entries, path):
+  # The text table format of libime, converted with libime_tabledict.
+  with _open(path) as file:
+    file.write('KeyCode=%s\n' % _key_characters(entries))
+    file.write('Length=%d\n' % _max_key_length(entries))
+    file.write('[Data]\n')
+    for composition, sign in entries:
+      file.write('%s %s\n' % (composition, sign))
+
+def write_ibus(entries, path):
+  # The source format of ibus-table-createdb.  Frequencies decrease in
+  # candidate order.
+  with _open(path) as file:
+    file.write('SCIM_Generic_Table_Phrase_Library_TEXT\n')
+    file.write('VERSION_1_0\n')
+    file.write('BEGIN_DEFINITION\n')
+    file.write('NAME = %s\n' % NAME)
+    file.write('LANGUAGES = akk,sux\n')
+    file.write('VALID_INPUT_CHARS = %s\n' % _key_characters(entries))
+    file.write('MAX_KEY_LENGTH = %d\n' % _max_key_length(entries))
+    file.write('END_DEFINITION\n')
+    file.write('BEGIN_TABLE\n')
+    for rank, (composition, sign) in enumerate(entries):
+      file.write('%s\t%s\t%d\n' % (composition, sign, len(entries) - rank))
+    file.write('END_TABLE\n')
+
+def write_rime(entries, path):
+  # A Rime dictionary, e.g., xsux.dict.yaml; sort: original keeps the
+  # candidate order.
+  with _open(path) as file:
+    file.write('---\n')
+    file.write('name: %s\n' % os.path.basename(path).split('.')[0])
+    file.write('version: "1"\n')
+    file.write('sort: original\n')
+    file.write('...\n\n')
+    for composition, sign in entries:
+      file.write('%s\t%s\n' % (sign, composition))
+
+EXPORTERS = {
+  'sample_ime': write_sample_ime,
+  'tsv': write_tsv,
+  'fcitx': write_fcitx,
+  'ibus': write_ibus,
+  'rime': write_rime,
+  'cpp': static_dictionary.write,
+  'front_coded': front_coding.write,
+  'key_transitions': key_transitions.write,
+  'shards': sharded_dictionary.write,
+}
+
+# The formats of several files, whose writers move them into place themselves,
+# in an order that keeps them consistent.
+SELF_REPLACING = {'shards'}
+
+def export(entries, outputs):
+  # Writes the entries in each of the given (format, path) pairs, concurrently.
+  # Each file is written under a temporary name and then moved into place, so
+  # that readers never see a partial table.
+  def run(name, path):
+    if name in SELF_REPLACING:
+      EXPORTERS[name](entries, path)
+      return
+    temporary_path = path + '.tmp'
+    EXPORTERS[name](entries, temporary_path)
+    os.replace(temporary_path, path)
+  for name, _ in outputs:
+    if name not in EXPORTERS:
+      raise ValueError('Unknown format %s; expected one of %s' % (
+          name, ', '.join(EXPORTERS)))
+  with concurrent.futures.ThreadPoolExecutor() as executor:
+    for future in [executor.submit(run, name, path)
+                   for name, path in outputs]:
+      future.result()
@@ -0,0 +1,57 @@
+﻿# Folding of compositions to ASCII, so that users who cannot easily type the
+# letters with diacritics can type šar2 as sar2, szar2, or s,ar2.
+#
+# Rather than adding the ASCII spellings to the dictionary, the folded keys are
+# looked up in a separate index from each folded key to the compositions that
+# fold to it, in candidate order.  Folding is lossy, so a folded key may have
+# several candidates: sar2 folds from sar2, šar2, and ṣar2.
+#
+# As the prefix and wildcard lookups of the IME, folding ignores case: Hi and
+# SZar2 are folded to hi and sar2, and galaM, like galam, to galam.
+
+_FOLDING = str.maketrans({
+  'š': 's',
+  'ṣ': 's',
+  'ṭ': 't',
+  'ḫ': 'h',
+  'ʾ': None,
+})
+
+# The ASCII spellings that users type for the letters with diacritics, in the
+# order in which they are replaced.  sz and s, are from ATF; the apostrophe
+# stands for the aleph, and is dropped like it.
+_ASCII_SPELLINGS = [
+  ('sz', 's'),
+  ('s,', 's'),
+  ('t,', 't'),
+  ("'", ''),
+]
+
+def fold(composition):
+  return composition.lower().translate(_FOLDING)
+
+def fold_input(text):
+  # The folded key for text typed in ASCII, or with some diacritics.
+  text = text.lower()
+  for spelling, folded in _ASCII_SPELLINGS:
+    text = text.replace(spelling, folded)
+  return fold(text)
+
+def folding_index(entries):
+  # A dict from the folded keys to the compositions that fold to them, in
+  # candidate order, given the (composition, sign) pairs in candidate order,
+  # as returned by read_sign_list.dictionary_entries.  The folded keys that
+  # are only their own folding are omitted, since they are in the dictionary
+  # as they are.
+  index = {}
+  for composition, _ in entries:
+    index.setdefault(fold(composition), []).append(composition)
+  return {folded: compositions for folded, compositions in index.items()
+          if compositions != [folded]}
+
+# Sanity checks.
+for _typed in ('sar2', 'szar2', 's,ar2', 'šar2', 'ṣar2', 'SZar2', 'Šar2'):
+  if fold_input(_typed) != 'sar2':
+    raise ValueError('%s folds to %s' % (_typed, fold_input(_typed)))
+if not all(ord(c) < 0x80 for c in fold('ʾšṣṭḫ')):
+  raise ValueError('Non-ASCII folding %s' % fold('ʾšṣṭḫ'))
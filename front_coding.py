@@ -0,0 +1,298 @@
+﻿import bisect
+import struct
+
+import folding
+
+# A compact binary form of the dictionary, for shipping to the web frontend.
+#
+# Layout, all integers little-endian:
+#   header: magic, version, block size, entry count, block count, sign count,
+#     size of the blocks in bytes, folding count, folding block count;
+#   block offsets: block count uint32, relative to the start of the blocks;
+#   folding block offsets: folding block count uint32, relative to the start
+#     of the folding blocks;
+#   sign offsets: sign count + 1 uint32, relative to the start of the pool;
+#   sign pool: the distinct signs, UTF-8, concatenated;
+#   blocks: the entries, sorted by the UTF-8 of their composition, in blocks of
+#     block size entries.  Each entry is
+#       varint shared prefix length, varint suffix length, suffix,
+#       varint sign index, varint rank,
+#     where the prefix is shared with the previous entry in the block, so that
+#     the first entry of a block has its full composition; lengths are in
+#     bytes.  The rank is the position of the entry in candidate order.
+#   folding blocks: the folded keys of folding.folding_index, sorted by their
+#     UTF-8, in blocks of block size, front-coded as above.  Each is
+#       varint shared prefix length, varint suffix length, suffix,
+#       varint candidate count, varint entry index for each candidate,
+#     where the entry index is the position of the entry among the sorted
+#     entries, and the candidates are in candidate order.  A folded key that is
+#     absent is its own only candidate, if it is an entry.
+
+MAGIC = b'XSFC'
+# Version 3 folds case in the folded keys.
+VERSION = 3
+HEADER = struct.Struct('<4sHHIIIIII')
+DEFAULT_BLOCK_SIZE = 16
+
+def _write_varint(output, n):
+  while n >= 0x80:
+    output.append(n & 0x7F | 0x80)
+    n >>= 7
+  output.append(n)
+
+def _read_varint(data, offset):
+  n = 0
+  shift = 0
+  while True:
+    byte = data[offset]
+    offset += 1
+    n |= (byte & 0x7F) << shift
+    if byte < 0x80:
+      return n, offset
+    shift += 7
+
+def _shared_prefix_length(left, right):
+  n = 0
+  for a, b in zip(left, right):
+    if a != b:
+      break
+    n += 1
+  return n
+
+def _write_blocks(keyed, block_size, write_payload):
+  # Front-codes the (key, payload) pairs, sorted by key, in blocks of
+  # block_size; returns the block offsets and the blocks.
+  blocks = bytearray()
+  block_offsets = []
+  previous = b''
+  for i, (key, payload) in enumerate(keyed):
+    if i % block_size == 0:
+      block_offsets.append(len(blocks))
+      previous = b''
+    shared = _shared_prefix_length(previous, key)
+    _write_varint(blocks, shared)
+    _write_varint(blocks, len(key) - shared)
+    blocks += key[shared:]
+    write_payload(blocks, payload)
+    previous = key
+  return block_offsets, blocks
+
+def write(entries, path, block_size=DEFAULT_BLOCK_SIZE, ranks=None):
+  # entries are the (composition, sign) pairs in candidate order, as returned
+  # by read_sign_list.dictionary_entries.  ranks are those of the entries, by
+  # default their positions; a part of a dictionary keeps the ranks of its
+  # entries in the whole.
+  if ranks is None:
+    ranks = range(len(entries))
+  keyed = sorted((composition.encode('utf-8'), (sign, rank))
+                 for rank, (composition, sign) in zip(ranks, entries))
+  sign_indices = {}
+  pool = bytearray()
+  sign_offsets = [0]
+  for _, (sign, _) in keyed:
+    if sign not in sign_indices:
+      sign_indices[sign] = len(sign_indices)
+      pool += sign.encode('utf-8')
+      sign_offsets.append(len(pool))
+  def write_entry(output, payload):
+    sign, rank = payload
+    _write_varint(output, sign_indices[sign])
+    _write_varint(output, rank)
+  block_offsets, blocks = _write_blocks(keyed, block_size, write_entry)
+
+  entry_indices = {key.decode('utf-8'): i for i, (key, _) in enumerate(keyed)}
+  folded_keyed = sorted(
+      (folded.encode('utf-8'), [entry_indices[c] for c in compositions])
+      for folded, compositions in folding.folding_index(entries).items())
+  def write_candidates(output, candidates):
+    _write_varint(output, len(candidates))
+    for entry_index in candidates:
+      _write_varint(output, entry_index)
+  folding_block_offsets, folding_blocks = _write_blocks(
+      folded_keyed, block_size, write_candidates)
+
+  with open(path, 'wb') as file:
+    file.write(HEADER.pack(MAGIC, VERSION, block_size, len(keyed),
+                           len(block_offsets), len(sign_indices), len(blocks),
+                           len(folded_keyed), len(folding_block_offsets)))
+    file.write(struct.pack('<%dI' % len(block_offsets), *block_offsets))
+    file.write(struct.pack('<%dI' % len(folding_block_offsets),
+                           *folding_block_offsets))
+    file.write(struct.pack('<%dI' % len(sign_offsets), *sign_offsets))
+    file.write(pool)
+    file.write(blocks)
+    file.write(folding_blocks)
+
+class _LazyFirstKeys:
+  # A sequence of the first keys of some blocks, for bisect, that reads only
+  # the keys that the search visits.
+  def __init__(self, first_key, count):
+    self.first_key = first_key
+    self.count = count
+
+  def __len__(self):
+    return self.count
+
+  def __getitem__(self, index):
+    return self.first_key(index)
+
+class FrontCodedDictionary:
+  # Reads a file written by write().  Only the offset tables are decoded
+  # up front; blocks and signs are decoded when a query reaches them.  data,
+  # if given, is the content of the file, already read.
+  def __init__(self, path, data=None):
+    if data is None:
+      with open(path, 'rb') as file:
+        data = file.read()
+    self.data = memoryview(data)
+    (magic, version, self.block_size, self.entry_count, block_count,
+     sign_count, blocks_size, self.folding_count,
+     folding_block_count) = HEADER.unpack_from(self.data)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError('%s is not a version %d front-coded dictionary' % (
+          path, VERSION))
+    offset = HEADER.size
+    self.block_offsets = struct.unpack_from('<%dI' % block_count, self.data,
+                                            offset)
+    offset += 4 * block_count
+    self.folding_block_offsets = struct.unpack_from(
+        '<%dI' % folding_block_count, self.data, offset)
+    offset += 4 * folding_block_count
+    self.sign_offsets = struct.unpack_from('<%dI' % (sign_count + 1),
+                                           self.data, offset)
+    offset += 4 * (sign_count + 1)
+    self.pool_start = offset
+    self.blocks_start = offset + self.sign_offsets[-1]
+    self.folding_blocks_start = self.blocks_start + blocks_size
+    self.signs = {}
+    self.first_keys = _LazyFirstKeys(self.first_key, block_count)
+    self.first_folded_keys = _LazyFirstKeys(self.first_folded_key,
+                                            folding_block_count)
+
+  def __len__(self):
+    return self.entry_count
+
+  def sign(self, index):
+    if index not in self.signs:
+      self.signs[index] = bytes(
+          self.data[self.pool_start + self.sign_offsets[index]:
+                    self.pool_start + self.sign_offsets[index + 1]]
+      ).decode('utf-8')
+    return self.signs[index]
+
+  def _block(self, offset, count, read_payload):
+    entries = []
+    key = b''
+    for _ in range(count):
+      shared, offset = _read_varint(self.data, offset)
+      length, offset = _read_varint(self.data, offset)
+      key = key[:shared] + bytes(self.data[offset:offset + length])
+      offset += length
+      payload, offset = read_payload(offset)
+      entries.append((key, *payload))
+    return entries
+
+  def _read_entry(self, offset):
+    sign_index, offset = _read_varint(self.data, offset)
+    rank, offset = _read_varint(self.data, offset)
+    return (sign_index, rank), offset
+
+  def _read_candidates(self, offset):
+    count, offset = _read_varint(self.data, offset)
+    candidates = []
+    for _ in range(count):
+      entry_index, offset = _read_varint(self.data, offset)
+      candidates.append(entry_index)
+    return (candidates,), offset
+
+  def _first_key(self, offset):
+    _, offset = _read_varint(self.data, offset)  # Always 0.
+    length, offset = _read_varint(self.data, offset)
+    return bytes(self.data[offset:offset + length])
+
+  def block(self, index):
+    # The (composition as UTF-8, sign index, rank) triples of the given block.
+    return self._block(
+        self.blocks_start + self.block_offsets[index],
+        min(self.block_size, self.entry_count - index * self.block_size),
+        self._read_entry)
+
+  def folding_block(self, index):
+    # The (folded key as UTF-8, entry indices) pairs of the given folding
+    # block.
+    return self._block(
+        self.folding_blocks_start + self.folding_block_offsets[index],
+        min(self.block_size, self.folding_count - index * self.block_size),
+        self._read_candidates)
+
+  def first_key(self, index):
+    return self._first_key(self.blocks_start + self.block_offsets[index])
+
+  def first_folded_key(self, index):
+    return self._first_key(self.folding_blocks_start +
+                           self.folding_block_offsets[index])
+
+  def entry(self, index):
+    # The (composition, sign) pair of the entry at the given position among
+    # the sorted entries.
+    key, sign_index, _ = self.block(index // self.block_size)[
+        index % self.block_size]
+    return key.decode('utf-8'), self.sign(sign_index)
+
+  def entries(self):
+    # All the (composition, sign) pairs, in candidate order.
+    ranked = []
+    for index in range(len(self.block_offsets)):
+      for key, sign_index, rank in self.block(index):
+        ranked.append((rank, key.decode('utf-8'), self.sign(sign_index)))
+    ranked.sort()
+    return [(composition, sign) for _, composition, sign in ranked]
+
+  def lookup(self, composition):
+    key = composition.encode('utf-8')
+    # The last block whose first key is not greater than the key.
+    index = bisect.bisect_right(self.first_keys, key) - 1
+    if index < 0:
+      return None
+    for entry_key, sign_index, _ in self.block(index):
+      if entry_key == key:
+        return self.sign(sign_index)
+    return None
+
+  def folded(self, text):
+    # The (composition, sign) pairs whose composition folds to the folding of
+    # text, in candidate order.
+    folded = folding.fold_input(text)
+    key = folded.encode('utf-8')
+    index = bisect.bisect_right(self.first_folded_keys, key) - 1
+    if index >= 0:
+      for folded_key, candidates in self.folding_block(index):
+        if folded_key == key:
+          return [self.entry(entry_index) for entry_index in candidates]
+    sign = self.lookup(folded)
+    return [(folded, sign)] if sign else []
+
+  def prefix(self, prefix):
+    # The (composition, sign) pairs whose composition starts with the prefix,
+    # in candidate order.
+    return [(composition, sign)
+            for _, composition, sign in self.ranked_prefix(prefix)]
+
+  def ranked_prefix(self, prefix):
+    # The (rank, composition, sign) triples whose composition starts with the
+    # prefix, by rank.
+    key = prefix.encode('utf-8')
+    # The matches may start in the block before the first block whose first
+    # key is not less than the prefix.
+    start = max(bisect.bisect_left(self.first_keys, key) - 1, 0)
+    matches = []
+    for index in range(start, len(self.block_offsets)):
+      if index > start:
+        first_key = self.first_key(index)
+        if first_key > key and not first_key.startswith(key):
+          break
+      for entry_key, sign_index, rank in self.block(index):
+        if entry_key.startswith(key):
+          matches.append((rank, entry_key.decode('utf-8'),
+                          self.sign(sign_index)))
+    return sorted(matches)
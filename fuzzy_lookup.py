@@ -0,0 +1,130 @@
+﻿# Approximate lookup of compositions, for typos in subscripts and diacritics:
+# šar2 typed as sar2, ḫi as hi, etc.
+#
+# The distance is a weighted Levenshtein distance where the substitution of a
+# letter by another letter of the same diacritic class costs less than any
+# other edit.  The search walks a trie of the keys, carrying one row of the
+# edit distance matrix per trie node, i.e., it runs the Levenshtein automaton
+# of the query on the trie; subtries whose row exceeds the bound are pruned,
+# so that only a small fraction of the keys is ever visited.
+
+# The cost of an insertion, a deletion, or an ordinary substitution.
+EDIT_COST = 2
+# The cost of a substitution within a diacritic class.
+DIACRITIC_COST = 1
+# Two edits, so that a mistyped subscript such as du11 for dug4 is found.
+DEFAULT_MAX_DISTANCE = 2 * EDIT_COST
+
+DIACRITIC_CLASSES = ['sšṣ', 'hḫ', 'tṭ']
+
+_DIACRITIC_SUBSTITUTIONS = {
+    (a, b)
+    for letters in DIACRITIC_CLASSES
+    for a in letters for b in letters if a != b
+}
+
+def substitution_cost(a, b):
+  if a == b:
+    return 0
+  if (a, b) in _DIACRITIC_SUBSTITUTIONS:
+    return DIACRITIC_COST
+  return EDIT_COST
+
+def distance(left, right):
+  # The weighted distance, by the textbook dynamic programme.
+  row = list(range(0, (len(left) + 1) * EDIT_COST, EDIT_COST))
+  for c in right:
+    previous_row = row
+    row = [previous_row[0] + EDIT_COST]
+    for i, l in enumerate(left):
+      row.append(min(row[i] + EDIT_COST,
+                     previous_row[i + 1] + EDIT_COST,
+                     previous_row[i] + substitution_cost(l, c)))
+  return row[-1]
+
+# The key under which a trie node holds the composition that ends there; no
+# composition contains the empty string as a character.
+_END = ''
+
+class FuzzyIndex:
+  def __init__(self, keys):
+    self.trie = {}
+    for key in keys:
+      node = self.trie
+      for c in key:
+        node = node.setdefault(c, {})
+      node[_END] = key
+
+  def search(self, query, max_distance=DEFAULT_MAX_DISTANCE):
+    # The (distance, key) pairs for the keys within max_distance of query,
+    # nearest first.
+    # Only the cells of the band within max_distance // EDIT_COST of the
+    # diagonal are computed, since the others need more insertions or
+    # deletions than that; they are left at the cap, limit.
+    # A character that is neither in the query nor in the diacritic class of
+    # a character of the query costs EDIT_COST to substitute anywhere, so all
+    # such children of a node share a row, computed once; in most nodes that
+    # row exceeds the bound, and only the few children whose characters are
+    # relevant to the query are visited.
+    results = []
+    limit = max_distance + 1
+    width = max_distance // EDIT_COST
+    relevant = {}
+    for c in set(query) | {b for (a, b) in _DIACRITIC_SUBSTITUTIONS
+                           if a in query}:
+      relevant[c] = [None] + [substitution_cost(q, c) for q in query]
+    other = [None] + [EDIT_COST] * len(query)
+
+    def next_row(row, depth, costs):
+      low = max(1, depth - width)
+      high = min(len(query), depth + width)
+      result = [limit] * (len(query) + 1)
+      if depth <= width:
+        result[0] = depth * EDIT_COST
+      best = result[0]
+      # min() would be clearer, but this is the inner loop.
+      for i in range(low, high + 1):
+        cell = row[i - 1] + costs[i]
+        if result[i - 1] + EDIT_COST < cell:
+          cell = result[i - 1] + EDIT_COST
+        if row[i] + EDIT_COST < cell:
+          cell = row[i] + EDIT_COST
+        if cell < best:
+          best = cell
+        result[i] = cell if cell < limit else limit
+      return result if best <= max_distance else None
+
+    stack = [(self.trie, 0, [min(i * EDIT_COST, limit)
+                             for i in range(len(query) + 1)])]
+    while stack:
+      node, depth, row = stack.pop()
+      if _END in node and row[-1] <= max_distance:
+        results.append((row[-1], node[_END]))
+      depth += 1
+      other_row = next_row(row, depth, other)
+      if other_row:
+        for c, child in node.items():
+          if c in relevant:
+            child_row = next_row(row, depth, relevant[c])
+            if child_row:
+              stack.append((child, depth, child_row))
+          elif c != _END:
+            stack.append((child, depth, other_row))
+      else:
+        for c, costs in relevant.items():
+          child = node.get(c)
+          if child:
+            child_row = next_row(row, depth, costs)
+            if child_row:
+              stack.append((child, depth, child_row))
+    results.sort()
+    return results
+
+# Sanity checks.
+if distance('sar2', 'šar2') != DIACRITIC_COST:
+  raise ValueError('Unexpected distance %d' % distance('sar2', 'šar2'))
+if distance('du11', 'dug4') != 2 * EDIT_COST:
+  raise ValueError('Unexpected distance %d' % distance('du11', 'dug4'))
+if (2 * EDIT_COST, 'dug4') not in FuzzyIndex(['du', 'dug4', 'gu4']).search(
+    'du11'):
+  raise ValueError('du11 does not find dug4')
@@ -0,0 +1,279 @@
+﻿import argparse
+import array
+import marshal
+import os
+import sys
+import time
+
+import numbers
+import snapshot
+
+# An integer encoding of the model, for batch analytics over sign lists with
+# millions of readings.
+#
+# Every distinct sign sequence, value, composition, and source is given a
+# dense integer ID by an Interner, and the readings become parallel columns of
+# IDs in array.array buffers.  The indexes of read_sign_list, dicts from
+# strings to lists of readings, become CSR indexes: for each key ID, the
+# reading IDs from offsets[key] to offsets[key + 1] in a single array of IDs,
+# in the order of the readings, as in the lists of the dicts.  Grouping is a
+# counting sort over a column, and joins go through the IDs, so that no Python
+# object is allocated per reading; the buffers can be wrapped by NumPy without
+# copying where it is available, which it is not next to our numbers.py.
+#
+# The tables are serialized as the marshal of the interned strings, newline-
+# separated, and the bytes of the columns.
+
+# Bump this whenever the layout of a serialized table changes.
+TABLE_VERSION = 1
+
+# Unsigned 32-bit IDs and offsets.
+ID_TYPE = 'I'
+
+class Interner:
+  def __init__(self, strings=()):
+    self.strings = []
+    self.ids = {}
+    for string in strings:
+      self.intern(string)
+
+  def __len__(self):
+    return len(self.strings)
+
+  def intern(self, string):
+    result = self.ids.get(string)
+    if result is None:
+      result = self.ids[string] = len(self.strings)
+      self.strings.append(string)
+    return result
+
+  def id(self, string):
+    # The ID of string, or None if it was not interned.
+    return self.ids.get(string)
+
+class CSRIndex:
+  # A map from the key IDs 0 to len(offsets) - 2 to runs of IDs.
+  def __init__(self, offsets, ids):
+    self.offsets = offsets
+    self.ids = ids
+
+  @staticmethod
+  def group(keys, key_count):
+    # The index from each key ID to the positions at which it occurs in the
+    # column keys, in increasing order: a stable counting sort.
+    offsets = array.array(ID_TYPE, [0]) * (key_count + 1)
+    for key in keys:
+      offsets[key + 1] += 1
+    for key in range(key_count):
+      offsets[key + 1] += offsets[key]
+    positions = array.array(ID_TYPE, offsets[:-1])
+    ids = array.array(ID_TYPE, [0]) * len(keys)
+    for i, key in enumerate(keys):
+      ids[positions[key]] = i
+      positions[key] += 1
+    return CSRIndex(offsets, ids)
+
+  def __len__(self):
+    return len(self.offsets) - 1
+
+  def __getitem__(self, key):
+    return self.ids[self.offsets[key]:self.offsets[key + 1]]
+
+  def sizes(self):
+    return array.array(ID_TYPE, (self.offsets[key + 1] - self.offsets[key]
+                                 for key in range(len(self))))
+
+class ReadingTable:
+  # The readings as columns of IDs: sign, value, composition, and source, with
+  # their Šašková indices, -1 for the readings that are not from Šašková.  The
+  # disambiguator is the composition less the value.  The source ID 0 stands
+  # for no source.
+  def __init__(self):
+    self.signs = Interner()
+    self.values = Interner()
+    self.compositions = Interner()
+    self.sources = Interner([''])
+    self.sign_ids = array.array(ID_TYPE)
+    self.value_ids = array.array(ID_TYPE)
+    self.composition_ids = array.array(ID_TYPE)
+    self.source_ids = array.array(ID_TYPE)
+    self.šašková_indices = array.array('i')
+    self._indexes = {}
+
+  def __len__(self):
+    return len(self.sign_ids)
+
+  def append(self, sign, value, composition, source, šašková_index):
+    self.sign_ids.append(self.signs.intern(sign))
+    self.value_ids.append(self.values.intern(value))
+    self.composition_ids.append(self.compositions.intern(composition))
+    self.source_ids.append(self.sources.intern(source or ''))
+    self.šašková_indices.append(
+        -1 if šašková_index is None else šašková_index)
+    self._indexes.clear()
+
+  @staticmethod
+  def from_records(records):
+    # records are (sign, value, composition, source, Šašková index) tuples.
+    table = ReadingTable()
+    for record in records:
+      table.append(*record)
+    return table
+
+  @staticmethod
+  def from_model(readings_by_sign):
+    # The table of the readings of read_sign_list, sign by sign, in the order
+    # of readings_by_sign.
+    return ReadingTable.from_records(
+        (reading.sign, reading.value, reading.composition(), reading.source,
+         reading.šašková_index)
+        for readings in readings_by_sign.values() for reading in readings)
+
+  def _index(self, name, column, interner):
+    if name not in self._indexes:
+      self._indexes[name] = CSRIndex.group(column, len(interner))
+    return self._indexes[name]
+
+  # The CSR counterparts of read_sign_list.readings_by_sign, readings_by_value,
+  # and readings_by_composition, from the IDs of the keys to reading IDs.
+  def by_sign(self):
+    return self._index('sign', self.sign_ids, self.signs)
+
+  def by_value(self):
+    return self._index('value', self.value_ids, self.values)
+
+  def by_composition(self):
+    return self._index('composition', self.composition_ids, self.compositions)
+
+  def reading(self, reading_id):
+    # The (sign, value, composition, source, Šašková index) of a reading.
+    return (self.signs.strings[self.sign_ids[reading_id]],
+            self.values.strings[self.value_ids[reading_id]],
+            self.compositions.strings[self.composition_ids[reading_id]],
+            self.sources.strings[self.source_ids[reading_id]] or None,
+            self.šašková_indices[reading_id]
+            if self.šašková_indices[reading_id] >= 0 else None)
+
+  def duplicates(self):
+    # The runs of reading IDs that have the same value and sign, as in the
+    # duplicate pass of read_sign_list.build.
+    result = []
+    by_value = self.by_value()
+    sign_ids = self.sign_ids
+    for value in range(len(by_value)):
+      readings = by_value[value]
+      if len(readings) < 2:
+        continue
+      by_sign = {}
+      for reading in readings:
+        by_sign.setdefault(sign_ids[reading], []).append(reading)
+      result += [run for run in by_sign.values() if len(run) > 1]
+    return result
+
+  def ambiguous_values(self):
+    # The IDs of the values read from more than one sign.
+    by_value = self.by_value()
+    sign_ids = self.sign_ids
+    return array.array(ID_TYPE, (
+        value for value in range(len(by_value))
+        if len({sign_ids[reading] for reading in by_value[value]}) > 1))
+
+  def ambiguous_compositions(self):
+    # The IDs of the compositions of more than one reading; the build rejects
+    # these.
+    sizes = self.by_composition().sizes()
+    return array.array(ID_TYPE, (composition
+                                 for composition in range(len(sizes))
+                                 if sizes[composition] > 1))
+
+  def write(self, path):
+    data = marshal.dumps((
+        TABLE_VERSION,
+        # With their counts, since [] and [''] have the same join.
+        *((len(interner), '\n'.join(interner.strings))
+          for interner in (self.signs, self.values, self.compositions,
+                           self.sources)),
+        self.sign_ids.tobytes(), self.value_ids.tobytes(),
+        self.composition_ids.tobytes(), self.source_ids.tobytes(),
+        self.šašková_indices.tobytes()))
+    with open(path + '.tmp', 'wb') as file:
+      file.write(data)
+    os.replace(path + '.tmp', path)
+
+  @staticmethod
+  def read(path):
+    with open(path, 'rb') as file:
+      data = marshal.loads(file.read())
+    if data[0] != TABLE_VERSION:
+      raise ValueError('%s is a version %d table, expected %d' % (
+          path, data[0], TABLE_VERSION))
+    table = ReadingTable()
+    for interner, (count, strings) in zip(
+        (table.signs, table.values, table.compositions, table.sources),
+        data[1:5]):
+      interner.strings = strings.split('\n') if count else []
+      interner.ids = {string: i for i, string in enumerate(interner.strings)}
+    for column, buffer in zip(
+        (table.sign_ids, table.value_ids, table.composition_ids,
+         table.source_ids, table.šašková_indices),
+        data[5:]):
+      column.frombytes(buffer)
+    return table
+
+def numeral_index(signs):
+  # The CSR counterpart of numbers.compositions_by_sign, over the sign IDs of
+  # the interner signs, to which the signs of the numerals are added, and the
+  # composition Interner.
+  compositions = Interner()
+  sign_ids = array.array(ID_TYPE)
+  for composition, sign in numbers.compositions.items():
+    compositions.intern(composition)
+    sign_ids.append(signs.intern(sign))
+  return CSRIndex.group(sign_ids, len(signs)), compositions
+
+# Sanity checks.
+_table = ReadingTable.from_records([
+    ('𒀀', 'A', 'a', None, 1), ('𒀀', 'A', 'a', 'Labat', 2),
+    ('𒀉', 'A', 'a2', None, 3), ('𒀉', 'ID', 'id', None, 3)])
+if list(_table.by_value()[_table.values.id('A')]) != [0, 1, 2]:
+  raise ValueError('Unexpected index %s' % _table.by_value().ids)
+if ([list(run) for run in _table.duplicates()] != [[0, 1]] or
+    list(_table.ambiguous_values()) != [_table.values.id('A')]):
+  raise ValueError('Unexpected duplicates %s' % _table.duplicates())
+_signs = Interner()
+_sign_index, _compositions = numeral_index(_signs)
+if [_compositions.strings[i]
+    for i in _sign_index[_signs.id(numbers.compositions['1'])]] != (
+        numbers.compositions_by_sign[numbers.compositions['1']]):
+  raise ValueError('Unexpected numeral index')
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Interns the readings of the model and reports on their '
+                  'duplicates and ambiguities.')
+  parser.add_argument('--table',
+                      help='read the readings from this table rather than '
+                           'from the snapshot')
+  parser.add_argument('--output', help='write the table to this file')
+  args = parser.parse_args()
+  start = time.perf_counter()
+  if args.table:
+    table = ReadingTable.read(args.table)
+  else:
+    table = ReadingTable.from_model(snapshot.load()[1])
+  loaded = time.perf_counter()
+  duplicates = table.duplicates()
+  ambiguous_values = table.ambiguous_values()
+  ambiguous_compositions = table.ambiguous_compositions()
+  analysed = time.perf_counter()
+  print('%d readings of %d signs: %d values, %d compositions, loaded in '
+        '%.0f ms' % (len(table), len(table.signs), len(table.values),
+                     len(table.compositions), (loaded - start) * 1000),
+        file=sys.stderr)
+  print('%d duplicate runs, %d values of several signs, %d ambiguous '
+        'compositions, in %.0f ms' % (
+            len(duplicates), len(ambiguous_values),
+            len(ambiguous_compositions), (analysed - loaded) * 1000),
+        file=sys.stderr)
+  if args.output:
+    table.write(args.output)
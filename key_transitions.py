@@ -0,0 +1,164 @@
+﻿import os
+import re
+
+# A transition table over the keys of the composition layout, from which the
+# IME can tell in constant time whether a keystroke can still lead to a
+# composition, without looking up the dictionary.
+#
+# The states are the prefixes of the compositions as typed, i.e., lowercased,
+# since the IME compares compositions case-insensitively; the initial state is
+# the empty prefix.  Each state has a mask of the keys after which some
+# composition remains reachable, bit i standing for the character at position
+# i in the layout, and whether it is itself a composition.  The states are
+# numbered breadth-first with the children of a state in key order, so that
+# the children of a state are contiguous: the state after key i is
+#   first child + popcount(mask & ((1 << i) - 1)).
+# Patterns with wildcards are not states; the IME searches the dictionary for
+# them as before.
+
+LAYOUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'Samples', 'IME', 'cpp', 'SampleIME', '𒄑𒂅𒌋',
+                           'layout.txt')
+
+# The keys of an ANSI physical layout; see ANSIPrintableVirtualKeyCodes.
+KEY_COUNT = 47
+
+def read_layout(path=LAYOUT_PATH):
+  # The characters of the lowercase layout, as GetLayoutConfiguration: the
+  # first KEY_COUNT characters of the file other than spaces and line breaks.
+  with open(path, encoding='utf-8-sig') as file:
+    characters = [c for c in file.read() if c not in ' \r\n'][:KEY_COUNT]
+  if len(characters) != KEY_COUNT:
+    raise ValueError('%s defines %d keys, expected %d' % (
+        path, len(characters), KEY_COUNT))
+  if len(set(characters)) != KEY_COUNT:
+    raise ValueError('%s has duplicate keys' % path)
+  return ''.join(characters)
+
+def untypeable(entries, layout):
+  # The compositions of the (composition, sign) pairs that cannot be typed on
+  # the layout, with the characters that are missing from it.
+  keys = set(layout)
+  result = []
+  for composition, _ in entries:
+    missing = sorted(set(composition.lower()) - keys)
+    if missing:
+      result.append((composition, missing))
+  return result
+
+def check_typeable(entries, layout_path=LAYOUT_PATH):
+  missing = untypeable(entries, read_layout(layout_path))
+  if missing:
+    raise ValueError('%d compositions cannot be typed on %s: %s' % (
+        len(missing), layout_path,
+        ', '.join('%s (%s)' % (composition, ''.join(characters))
+                  for composition, characters in missing[:10])))
+
+class TransitionTable:
+  # masks, first_children, and completes are parallel lists indexed by state.
+  def __init__(self, entries, layout):
+    missing = untypeable(entries, layout)
+    if missing:
+      raise ValueError('Cannot type %s' % missing[0][0])
+    self.layout = layout
+    self.key_indices = {c: i for i, c in enumerate(layout)}
+    trie = {}
+    for composition, _ in entries:
+      node = trie
+      for c in composition.lower():
+        node = node.setdefault(self.key_indices[c], {})
+      node[None] = True
+    self.masks = []
+    self.first_children = []
+    self.completes = []
+    # The nodes in breadth-first order; the children of a node are appended
+    # together, so that its first child is the length of the queue when it is
+    # visited.
+    queue = [trie]
+    for node in queue:
+      keys = sorted(key for key in node if key is not None)
+      mask = 0
+      for key in keys:
+        mask |= 1 << key
+      self.masks.append(mask)
+      self.first_children.append(len(queue) if keys else 0)
+      self.completes.append(None in node)
+      queue += [node[key] for key in keys]
+
+  def __len__(self):
+    return len(self.masks)
+
+  def next_state(self, state, c):
+    # The state after typing c in state, or None if no composition follows.
+    key = self.key_indices.get(c)
+    if key is None or not self.masks[state] >> key & 1:
+      return None
+    return self.first_children[state] + bin(
+        self.masks[state] & ((1 << key) - 1)).count('1')
+
+  def state(self, typed):
+    # The state after typing typed from the initial state, or None.
+    state = 0
+    for c in typed:
+      state = self.next_state(state, c)
+      if state is None:
+        return None
+    return state
+
+  def is_complete(self, state):
+    return self.completes[state]
+
+HEADER = '''\
+// Generated by read_sign_list.py from sign_list.csv and layout.txt; do not
+// edit.
+// The states are the prefixes of the compositions, numbered breadth-first; see
+// key_transitions.h.
+
+#pragma once
+
+#include <array>
+#include <string_view>
+
+#include "𒄑𒂅𒌋/key_transitions.h"
+
+namespace 𒄑𒂅𒌋 {
+
+inline constexpr std::wstring_view key_transition_layout{L"%s"};
+
+inline constexpr std::array<KeyTransitionState, %d> key_transition_table{{
+'''
+
+FOOTER = '''\
+}};
+
+}  // namespace 𒄑𒂅𒌋
+'''
+
+STATE = '    {0x%012X, %d, %s},\n'
+
+def write(entries, path, layout_path=LAYOUT_PATH):
+  table = TransitionTable(entries, read_layout(layout_path))
+  # The layout has a backslash key.
+  layout_literal = re.sub(r'(["\\])', r'\\\1', table.layout)
+  states = list(zip(table.masks, table.first_children, table.completes))
+  # The BOM lets MSVC read the file as UTF-8.
+  with open(path, 'w', encoding='utf-8-sig', newline='\n') as file:
+    file.write(HEADER % (layout_literal, len(states)))
+    for mask, first_child, complete in states:
+      file.write(STATE % (mask, first_child, 'true' if complete else 'false'))
+    file.write(FOOTER)
+  # Sanity check: the table must round-trip.
+  if read(path) != (table.layout, states):
+    raise ValueError('%s does not match the transition table' % path)
+
+def read(path):
+  # The layout and the (mask, first child, complete) triples of the table at
+  # path.
+  with open(path, encoding='utf-8-sig') as file:
+    text = file.read()
+  layout = re.sub(r'\\(.)', r'\1', re.search(
+      r'key_transition_layout\{L"((?:[^"\\]|\\.)*)"\}', text)[1])
+  return layout, [(int(mask, 16), int(first_child), complete == 'true')
+                  for mask, first_child, complete in re.findall(
+                      r'^    \{0x([0-9A-F]+), (\d+), (true|false)\},$',
+                      text, re.MULTILINE)]
@@ -0,0 +1,313 @@
+﻿import argparse
+import collections
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+import corpus_frequencies
+import dictionary_index
+import exporters
+import front_coding
+import lookup_load_test
+import read_sign_list
+import snapshot
+
+# Replays keystroke sequences against the composition model, simulating the
+# incremental lookup of the IME, and reports for each lookup structure and
+# ranking how many candidates the user is shown, where the intended sign is
+# among them, how many keystrokes the candidate list saves, and how long the
+# lookups take.  The rank of the intended sign is averaged over the keystrokes
+# after which it is among the candidates, and the first page column is the
+# share of keystrokes after which it is on the first page; once the
+# composition is typed in full it is almost always first, whatever the
+# structure or ranking.
+#
+# As in CCompositionProcessorEngine, after each keystroke the keystroke buffer
+# is looked up as a wildcard pattern, with a * appended unless it already has
+# a wildcard, and the candidates are shown in dictionary order, a page of
+# PAGE_SIZE at a time.  A candidate on the first page is selected with one
+# keystroke, a digit or the space bar, as is the composition once it is typed
+# in full, so that the keystrokes saved on a word are those left to type when
+# the intended candidate first appears on the first page.
+#
+# Every structure compares the compositions case-insensitively, as
+# CStringRange::WildcardCompare, so that galam* also finds galaM; the
+# structures over sorted keys index the lowercase compositions.  Before the
+# timings are reported, all structures are checked to return the same
+# candidates for every lookup of the replay.
+#
+# The sequences are either recorded, one per line as the keystrokes, a tab,
+# and the intended composition if it is not the keystrokes themselves; or
+# synthetic, the readings of an ATF corpus in the order of the text, or
+# compositions drawn from the dictionary, weighted by their frequencies if a
+# frequency table is given.
+
+# The selection keys 1 to 9 and 0; see SetInitialCandidateListRange.
+PAGE_SIZE = 10
+
+def _wildcard_regex(pattern, flags=0):
+  # As CStringRange::WildcardCompare, * matches any sequence and ? any single
+  # character.
+  return re.compile(''.join(
+      '.*' if c == '*' else '.' if c == '?' else re.escape(c)
+      for c in pattern) + r'\Z', re.DOTALL | flags)
+
+def _literal_prefix(pattern):
+  return re.match(r'[^*?]*', pattern)[0]
+
+class TextScan:
+  # The lookup of CTableDictionaryEngine::CollectWordForWildcard over the text
+  # dictionary, as exporters.write_sample_ime writes Dictionary/sign_list.txt,
+  # here to a temporary file.  The file is read once, as the IME maps it, and
+  # every lookup parses each of its lines and compares the key to the pattern,
+  # case-insensitively.
+  def __init__(self, entries):
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'sign_list.txt')
+      exporters.write_sample_ime(entries, path)
+      with open(path, encoding='utf-16', newline='') as file:
+        self.text = file.read()
+
+  def lookup(self, pattern):
+    regex = _wildcard_regex(pattern, re.IGNORECASE)
+    candidates = []
+    for line in self.text.split('\r\n'):
+      key, _, value = line.partition('"="')
+      if regex.match(key[1:]):
+        candidates.append((key[1:], value[:-1]))
+    return candidates
+
+class _PrefixLookup:
+  # Wildcard lookup over a structure with a prefix lookup in candidate order
+  # over the lowercase compositions: only the entries sharing the literal
+  # prefix of the pattern are compared.
+  def lookup(self, pattern):
+    literal_prefix = _literal_prefix(pattern)
+    candidates = self.prefix(literal_prefix.lower())
+    if pattern == literal_prefix + '*':
+      return candidates
+    regex = _wildcard_regex(pattern, re.IGNORECASE)
+    return [entry for entry in candidates if regex.match(entry[0])]
+
+class FrontCodedIndex(_PrefixLookup):
+  # The binary dictionary of front_coding of the lowercase compositions,
+  # written to a temporary file; the ranks of its entries give the original
+  # ones.
+  def __init__(self, entries):
+    self.entries = entries
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'dictionary.bin')
+      front_coding.write([(composition.lower(), sign)
+                          for composition, sign in entries], path)
+      self.dictionary = front_coding.FrontCodedDictionary(path)
+
+  def prefix(self, prefix):
+    return [self.entries[rank]
+            for rank, _, _ in self.dictionary.ranked_prefix(prefix)]
+
+class SortedIndex:
+  # The bisection over the sorted compositions of dictionary_index.
+  def __init__(self, readings_by_composition, frequencies):
+    self.index = dictionary_index.DictionaryIndex(readings_by_composition,
+                                                  frequencies)
+    self.lookup = self.index.wildcard
+
+class Trie(_PrefixLookup):
+  # A trie of nested dicts by character of the lowercase compositions, in
+  # which each node holds, under the '' key, the entries below it in candidate
+  # order, so that a prefix lookup is a walk down the prefix.
+  def __init__(self, entries):
+    self.root = {'': list(entries)}
+    for entry in entries:
+      node = self.root
+      for c in entry[0].lower():
+        node = node.setdefault(c, {'': []})
+        node[''].append(entry)
+
+  def prefix(self, prefix):
+    node = self.root
+    for c in prefix:
+      node = node.get(c)
+      if node is None:
+        return []
+    return node['']
+
+STRUCTURES = ['scan', 'front_coded', 'sorted', 'trie']
+
+def make_lookup(structure, readings_by_composition, frequencies):
+  entries = read_sign_list.dictionary_entries(readings_by_composition,
+                                              frequencies)
+  if structure == 'scan':
+    return TextScan(entries)
+  if structure == 'front_coded':
+    return FrontCodedIndex(entries)
+  if structure == 'sorted':
+    return SortedIndex(readings_by_composition, frequencies)
+  if structure == 'trie':
+    return Trie(entries)
+  raise ValueError('Unknown structure %s' % structure)
+
+def read_recorded(path):
+  # The (keystrokes, intended composition) pairs recorded at path.
+  with open(path, encoding='utf-8-sig') as file:
+    for line in file:
+      columns = line.rstrip('\r\n').split('\t')
+      if columns[0]:
+        yield columns[0], columns[1] if len(columns) > 1 else columns[0]
+
+def corpus_words(paths):
+  # The readings of the ATF corpora at paths, as (keystrokes, composition)
+  # pairs.
+  for path in paths:
+    with open(path, encoding='utf-8', errors='replace') as file:
+      for line in file:
+        for reading in corpus_frequencies.tokenize(line):
+          yield reading, reading
+
+def synthetic_words(readings_by_composition, entries, count, frequencies,
+                    seed):
+  # count compositions drawn from the entries, weighted by the frequencies of
+  # their readings if given.
+  rng = random.Random(seed)
+  compositions = [composition for composition, _ in entries]
+  weights = None
+  if frequencies:
+    weights = [
+        frequencies[readings_by_composition[composition][0].value.lower()] + 1
+        for composition in compositions]
+  return [(composition, composition)
+          for composition in rng.choices(compositions, weights, k=count)]
+
+class Statistics:
+  def __init__(self):
+    self.words = 0
+    self.keystrokes = 0
+    self.candidates = 0
+    # The ranks of the intended candidates after each keystroke, if among the
+    # candidates.
+    self.ranks = []
+    self.typed = 0
+    self.needed = 0
+    self.latencies = []
+
+def check_agreement(lookups, words):
+  # Raises if the lookups, by name, return different candidates for a
+  # pattern of the replay of words.
+  (reference_name, reference), *others = lookups.items()
+  for keystrokes, _ in words:
+    for length in range(1, len(keystrokes) + 1):
+      buffer = keystrokes[:length]
+      pattern = buffer if '*' in buffer or '?' in buffer else buffer + '*'
+      expected = reference.lookup(pattern)
+      for name, lookup in others:
+        candidates = lookup.lookup(pattern)
+        if candidates != expected:
+          raise ValueError('%s and %s disagree on %s: %d vs. %d candidates' % (
+              reference_name, name, pattern, len(expected), len(candidates)))
+
+def replay(lookup, words, signs):
+  # Replays the (keystrokes, composition) pairs against lookup; signs maps the
+  # intended compositions to their signs.
+  statistics = Statistics()
+  for keystrokes, composition in words:
+    intended = (composition, signs[composition])
+    needed = None
+    for length in range(1, len(keystrokes) + 1):
+      buffer = keystrokes[:length]
+      pattern = buffer if '*' in buffer or '?' in buffer else buffer + '*'
+      start = time.perf_counter()
+      candidates = lookup.lookup(pattern)
+      statistics.latencies.append(time.perf_counter() - start)
+      statistics.candidates += len(candidates)
+      try:
+        rank = candidates.index(intended)
+      except ValueError:
+        continue
+      statistics.ranks.append(rank)
+      if needed is None and rank < PAGE_SIZE:
+        needed = length
+    statistics.words += 1
+    statistics.keystrokes += len(keystrokes)
+    statistics.typed += len(keystrokes) + 1
+    statistics.needed += (needed or len(keystrokes)) + 1
+  return statistics
+
+def report(name, statistics):
+  ranks = statistics.ranks
+  latencies = sorted(statistics.latencies)
+  print('%-22s %9.1f %9.2f %8.1f%% %8.1f%% %8.3f %8.3f %8.3f' % (
+      name,
+      statistics.candidates / statistics.keystrokes,
+      sum(ranks) / len(ranks) + 1 if ranks else float('nan'),
+      100 * sum(rank < PAGE_SIZE for rank in ranks) / statistics.keystrokes,
+      100 * (statistics.typed - statistics.needed) / statistics.typed,
+      *(lookup_load_test.percentile(latencies, p) * 1000
+        for p in (50, 90, 99))))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Replays keystroke sequences against the dictionary and '
+                  'reports candidates per keystroke, the rank of the intended '
+                  'sign after each keystroke, keystrokes saved, and lookup '
+                  'latency.')
+  parser.add_argument('--recorded',
+                      help='recorded sequences, one per line as the '
+                           'keystrokes, optionally followed by a tab and the '
+                           'intended composition')
+  parser.add_argument('--corpus', nargs='+', default=[],
+                      help='ATF files whose readings are replayed')
+  parser.add_argument('--words', type=int, default=2000,
+                      help='the number of synthetic words drawn from the '
+                           'dictionary if neither --recorded nor --corpus is '
+                           'given')
+  parser.add_argument('--frequencies',
+                      type=read_sign_list.parse_frequencies,
+                      help='a frequency table from corpus_frequencies.py, for '
+                           'the frequency-ranked configurations and the '
+                           'weights of the synthetic words; defaults to the '
+                           'counts of --corpus')
+  parser.add_argument('--structures', nargs='+', choices=STRUCTURES,
+                      default=STRUCTURES)
+  parser.add_argument('--snapshot', default=snapshot.SNAPSHOT_PATH)
+  parser.add_argument('--seed', type=int, default=0)
+  args = parser.parse_args()
+
+  readings_by_composition, _ = snapshot.load(args.snapshot)
+  entries = read_sign_list.dictionary_entries(readings_by_composition)
+  signs = dict(entries)
+  frequencies = args.frequencies
+  if args.recorded:
+    words = list(read_recorded(args.recorded))
+  elif args.corpus:
+    words = list(corpus_words(args.corpus))
+    if frequencies is None:
+      frequencies = collections.Counter(
+          composition for _, composition in words)
+  else:
+    words = synthetic_words(readings_by_composition, entries, args.words,
+                            frequencies, args.seed)
+  unknown = [composition for _, composition in words
+             if composition not in signs]
+  if unknown:
+    print('Skipping %d words not in the dictionary, e.g., %s' % (
+        len(unknown), ', '.join(sorted(set(unknown))[:10])), file=sys.stderr)
+    words = [word for word in words if word[1] in signs]
+  if not words:
+    raise ValueError('No words to replay')
+
+  print('%d words, %d keystrokes; a page is %d candidates' % (
+      len(words), sum(len(keystrokes) for keystrokes, _ in words), PAGE_SIZE))
+  print('%-22s %9s %9s %9s %9s %8s %8s %8s' % (
+      'configuration', 'cand/key', 'rank', 'page 1', 'saved',
+      'p50 ms', 'p90 ms', 'p99 ms'))
+  for ranked in ([False, True] if frequencies else [False]):
+    lookups = {structure: make_lookup(structure, readings_by_composition,
+                                      frequencies if ranked else None)
+               for structure in args.structures}
+    check_agreement(lookups, words)
+    for structure, lookup in lookups.items():
+      report(structure + (' +frequency' if ranked else ''),
+             replay(lookup, words, signs))
@@ -0,0 +1,94 @@
+﻿import argparse
+import asyncio
+import json
+import random
+import time
+
+import dictionary_index
+import snapshot
+
+# Measures the throughput and latency of lookup_server.py on localhost.
+
+def percentile(sorted_values, p):
+  # Nearest-rank percentile.  We avoid the statistics module, which cannot be
+  # imported next to our numbers.py.
+  return sorted_values[min(len(sorted_values) - 1,
+                           int(p / 100 * len(sorted_values)))]
+
+def make_requests(index, count, seed):
+  # A mix of the queries made by the editor while typing.
+  rng = random.Random(seed)
+  requests = []
+  for i in range(count):
+    composition, sign = rng.choice(index.entries)
+    op = rng.choice(['exact', 'exact', 'prefix', 'prefix', 'wildcard',
+                     'readings', 'fuzzy'])
+    if op == 'exact':
+      query = composition
+    elif op == 'prefix':
+      query = composition[:rng.randint(1, len(composition))]
+    elif op == 'wildcard':
+      query = composition[:rng.randint(1, len(composition))] + '*'
+      if len(query) > 2:
+        query = query[0] + '?' + query[2:]
+    elif op == 'fuzzy':
+      query = composition.replace('š', 's').replace('ḫ', 'h')
+    else:
+      query = sign
+    requests.append({'id': i, 'op': op, 'query': query})
+  return requests
+
+async def run_connection(open_connection, requests, batch_size, latencies):
+  reader, writer = await open_connection()
+  for start in range(0, len(requests), batch_size):
+    batch = requests[start:start + batch_size]
+    sent = time.perf_counter()
+    writer.write(b''.join(
+        json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n'
+        for request in batch))
+    await writer.drain()
+    for request in batch:
+      response = json.loads(await reader.readline())
+      if response['id'] != request['id'] or 'error' in response:
+        raise ValueError('Unexpected response %s to %s' % (response, request))
+      latencies.append(time.perf_counter() - sent)
+  writer.close()
+  await writer.wait_closed()
+
+async def run(args):
+  if args.unix_socket:
+    open_connection = lambda: asyncio.open_unix_connection(args.unix_socket)
+  else:
+    open_connection = lambda: asyncio.open_connection(args.host, args.port)
+  index = dictionary_index.DictionaryIndex.load(args.snapshot)
+  requests = make_requests(index, args.requests, args.seed)
+  per_connection = -(-len(requests) // args.connections)
+  latencies = []
+  start = time.perf_counter()
+  await asyncio.gather(*(
+      run_connection(open_connection,
+                     requests[i:i + per_connection],
+                     args.batch_size,
+                     latencies)
+      for i in range(0, len(requests), per_connection)))
+  elapsed = time.perf_counter() - start
+  latencies.sort()
+  print('%d requests over %d connections in batches of %d: %.0f requests/s' % (
+      len(latencies), args.connections, args.batch_size,
+      len(latencies) / elapsed))
+  for p in (50, 90, 99, 99.9, 100):
+    print('  p%-5s %8.3f ms' % (p, percentile(latencies, p) * 1000))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Load-tests lookup_server.py.')
+  parser.add_argument('--host', default='127.0.0.1')
+  parser.add_argument('--port', type=int, default=8737)
+  parser.add_argument('--unix-socket')
+  parser.add_argument('--snapshot', default=snapshot.SNAPSHOT_PATH,
+                      help='the dictionary from which to draw queries')
+  parser.add_argument('--connections', type=int, default=8)
+  parser.add_argument('--requests', type=int, default=20000)
+  parser.add_argument('--batch-size', type=int, default=16)
+  parser.add_argument('--seed', type=int, default=0)
+  asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,161 @@
+﻿import argparse
+import asyncio
+import json
+import os
+import sys
+
+import dictionary_index
+import fuzzy_lookup
+import read_sign_list
+import sign_names
+import snapshot
+
+# A lookup server over the dictionary for local tools such as the
+# transliteration editor.
+#
+# The protocol is JSON lines over TCP or a Unix socket: each request is an
+# object {"id": ..., "op": ..., "query": ...}, where op is one of
+#   exact: the sign for the composition query, or null;
+#   prefix: the [composition, sign] pairs whose composition starts with query;
+#   wildcard: the [composition, sign] pairs matching query, where * and ? are
+#     wildcards as in the IME;
+#   readings: the compositions of the sign query;
+#   folded: the [composition, sign] pairs whose composition folds to query,
+#     typed in ASCII as sar2, szar2, or s,ar2 for šar2 (see folding);
+#   fuzzy: the [composition, sign, distance] triples for the compositions
+#     near query, for typos such as sar2 for šar2 (see fuzzy_lookup); the
+#     request may give a max_distance, by default two edits;
+#   describe: the [code point, Unicode name, numeric value, primary reading]
+#     of each code point of the sign query (see sign_names).
+# Lists are in candidate order.  As in the IME, prefix and wildcard compare
+# the compositions case-insensitively, so that galam* also finds galaM; exact
+# takes a composition as it is in the dictionary.  Each request gets the response
+# {"id": ..., "result": ...}, or {"id": ..., "error": ...}, in order.
+# The dictionary, and with it the primary readings of describe, is reloaded
+# when read_sign_list.py rewrites the snapshot; connections are unaffected.
+
+def _stamp(path):
+  try:
+    status = os.stat(path)
+  except OSError:
+    return None
+  return status.st_mtime_ns, status.st_size
+
+class LookupServer:
+  def __init__(self, snapshot_path=snapshot.SNAPSHOT_PATH, frequencies=None):
+    self.snapshot_path = snapshot_path
+    self.frequencies = frequencies
+    # Loading may rewrite a stale snapshot, so stamp it afterwards.
+    self.index, self.primary_readings = self.indexed(
+        snapshot.load(snapshot_path))
+    self.snapshot_stamp = _stamp(snapshot_path)
+
+  def indexed(self, model):
+    # The DictionaryIndex and the sign_names.primary_readings of the
+    # (readings_by_composition, readings_by_sign) of a snapshot.
+    readings_by_composition, readings_by_sign = model
+    return (dictionary_index.DictionaryIndex(readings_by_composition,
+                                             self.frequencies),
+            sign_names.primary_readings(readings_by_sign))
+
+  def answer(self, line):
+    request_id = None
+    try:
+      request = json.loads(line)
+      request_id = request.get('id')
+      op = request['op']
+      query = request['query']
+      if op == 'exact':
+        result = self.index.exact(query)
+      elif op == 'prefix':
+        result = self.index.prefix(query)
+      elif op == 'wildcard':
+        result = self.index.wildcard(query)
+      elif op == 'readings':
+        result = self.index.readings(query)
+      elif op == 'folded':
+        result = self.index.folded(query)
+      elif op == 'describe':
+        result = sign_names.describe(query, self.primary_readings)
+      elif op == 'fuzzy':
+        result = self.index.fuzzy(
+            query,
+            request.get('max_distance', fuzzy_lookup.DEFAULT_MAX_DISTANCE))
+      else:
+        raise ValueError('Unknown op %s' % op)
+      response = {'id': request_id, 'result': result}
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+      response = {'id': request_id, 'error': '%s: %s' % (type(e).__name__, e)}
+    return json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n'
+
+  async def handle(self, reader, writer):
+    # Requests are answered in batches: everything that has arrived on the
+    # connection is answered before the responses are flushed.
+    pending = b''
+    try:
+      while True:
+        data = await reader.read(1 << 16)
+        if not data:
+          break
+        *lines, pending = (pending + data).split(b'\n')
+        writer.write(b''.join(self.answer(line) for line in lines if line))
+        await writer.drain()
+    except ConnectionError:
+      pass
+    finally:
+      writer.close()
+
+  async def reload_when_rebuilt(self, interval):
+    loop = asyncio.get_running_loop()
+    while True:
+      await asyncio.sleep(interval)
+      stamp = _stamp(self.snapshot_path)
+      if stamp == self.snapshot_stamp:
+        continue
+      self.snapshot_stamp = stamp
+      model = await loop.run_in_executor(None, snapshot.read,
+                                         self.snapshot_path)
+      if model is None:
+        # Built from other inputs than ours, e.g., while read_sign_list.py is
+        # being edited; keep serving the current dictionary.
+        continue
+      index, primary_readings = await loop.run_in_executor(
+          None, self.indexed, model)
+      self.index = index
+      self.primary_readings = primary_readings
+      print('Reloaded %d entries' % len(index.entries), file=sys.stderr)
+
+async def serve(server, host, port, unix_socket, reload_interval):
+  if unix_socket:
+    listener = await asyncio.start_unix_server(server.handle, unix_socket)
+  else:
+    listener = await asyncio.start_server(server.handle, host, port)
+  print('Serving %d entries on %s' % (
+            len(server.index.entries),
+            unix_socket or '%s:%d' % (host, port)),
+        file=sys.stderr)
+  async with listener:
+    await asyncio.gather(listener.serve_forever(),
+                         server.reload_when_rebuilt(reload_interval))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Serves dictionary lookups as JSON lines.')
+  parser.add_argument('--host', default='127.0.0.1')
+  parser.add_argument('--port', type=int, default=8737)
+  parser.add_argument('--unix-socket',
+                      help='listen on this Unix socket instead of TCP')
+  parser.add_argument('--snapshot', default=snapshot.SNAPSHOT_PATH)
+  parser.add_argument('--frequencies', type=read_sign_list.parse_frequencies,
+                      metavar='PATH',
+                      help='rank the candidates by the reading counts in this '
+                           'table, as read_sign_list.py --frequencies')
+  parser.add_argument('--reload-interval', type=float, default=1,
+                      help='seconds between checks for a rebuilt snapshot')
+  args = parser.parse_args()
+  try:
+    asyncio.run(serve(LookupServer(args.snapshot, args.frequencies),
+                      args.host, args.port,
+                      args.unix_socket, args.reload_interval))
+  except KeyboardInterrupt:
+    pass
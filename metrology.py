@@ -0,0 +1,183 @@
+﻿import array
+
+import numbers
+
+# Conversion of quantities between the units of the metrological systems whose
+# numerals are in numbers.py, and decomposition of quantities into the units in
+# which texts write them, with the signs.
+#
+# Quantities are exact: they are handled as integers of the smallest
+# subdivision of the base unit of a system, e.g., eighths of iku, since the
+# fractions module cannot be imported next to our numbers.py.  For the same
+# reason NumPy is not available here; the batch API takes any iterable of
+# quantities and returns array.array columns, which NumPy can wrap without
+# copying where it is available.
+
+class Unit:
+  # A unit of size times the base unit of its system.  The counts of a numeral
+  # unit are written with the numerals numbers.compositions[count + name], and
+  # go up to max_count; those of a counted unit are written with the counting
+  # numerals, followed by the sign.
+  def __init__(self, name, size, max_count=None, sign=None):
+    self.name = name
+    self.size = size
+    self.max_count = max_count
+    self.sign = sign
+
+  def compositions(self, count):
+    if self.sign is None:
+      return [str(count) + self.name]
+    return counting_compositions(count)
+
+def counting_compositions(count):
+  # The compositions for count in the sexagesimal counting system, largest
+  # first.
+  if not 0 < count < 60 ** 4:
+    raise ValueError('Cannot write %d with the counting numerals' % count)
+  result = []
+  for place in (60 ** 3, 60 ** 2, 60, 1):
+    digit = count // place % 60
+    if digit:
+      result.append(str(digit * place))
+  return result
+
+class System:
+  # units are the Units of the system, largest first, the last being the base
+  # unit; fractions are the compositions of the fractions of the base unit
+  # that have numerals, e.g., '1/2iku', largest first, with their values in
+  # the smallest subdivision, 1/denominator of the base unit.
+  def __init__(self, name, units, fractions=(), denominator=1):
+    self.name = name
+    self.units = units
+    self.units_by_name = {unit.name: unit for unit in units}
+    self.fractions = fractions
+    self.denominator = denominator
+    # The largest quantity, in the base unit, that can be written.
+    self.limit = (units[0].max_count or 60 ** 4 - 1) * units[0].size
+    for larger, smaller in zip(units, units[1:]):
+      if (smaller.max_count is not None and
+          (smaller.max_count + 1) * smaller.size != larger.size):
+        raise ValueError('%s: %d %s is not one %s' % (
+            name, smaller.max_count + 1, smaller.name, larger.name))
+    for composition, _ in fractions:
+      if composition not in numbers.compositions:
+        raise ValueError('%s: no numeral for %s' % (name, composition))
+
+  def _subdivisions(self, quantity, unit):
+    # quantity of unit as an integer number of subdivisions of the base unit.
+    subdivisions = quantity * self.units_by_name[unit].size * self.denominator
+    rounded = round(subdivisions)
+    if abs(subdivisions - rounded) > 1e-9 * max(1, abs(subdivisions)):
+      raise ValueError('%s %s is not a multiple of 1/%d %s' % (
+          quantity, unit, self.denominator, self.units[-1].name))
+    if not 0 <= rounded <= self.limit * self.denominator:
+      raise ValueError('%s %s is out of range for %s' % (quantity, unit,
+                                                        self.name))
+    return rounded
+
+  def convert(self, quantity, from_unit, to_unit):
+    return (quantity * self.units_by_name[from_unit].size /
+            self.units_by_name[to_unit].size)
+
+  def decompose(self, quantity, unit=None):
+    # The (count, unit name) pairs of the standard writing of quantity of unit,
+    # by default the base unit, largest first, followed by the fractions of
+    # the base unit as (1, composition) pairs.
+    remainder = self._subdivisions(quantity, unit or self.units[-1].name)
+    result = []
+    for u in self.units:
+      count, remainder = divmod(remainder, u.size * self.denominator)
+      if count:
+        result.append((count, u.name))
+    for composition, value in self.fractions:
+      if remainder >= value:
+        result.append((1, composition))
+        remainder -= value
+    if remainder:
+      raise ValueError('%s %s cannot be written with the fractions of %s' % (
+          quantity, unit or self.units[-1].name, self.name))
+    return result
+
+  def compositions(self, quantity, unit=None):
+    result = []
+    for count, name in self.decompose(quantity, unit):
+      if name in self.units_by_name:
+        result += self.units_by_name[name].compositions(count)
+        if self.units_by_name[name].sign:
+          result.append(self.units_by_name[name].sign)
+      else:
+        result.append(name)
+    return result
+
+  def signs(self, quantity, unit=None):
+    # The sign sequence for quantity of unit.  Unit signs of counted units are
+    # in the result as they are.
+    return ''.join(numbers.compositions.get(composition, composition)
+                   for composition in self.compositions(quantity, unit))
+
+  def convert_many(self, quantities, from_unit, to_unit):
+    # The quantities, converted, as an array of doubles.
+    factor = (self.units_by_name[from_unit].size /
+              self.units_by_name[to_unit].size)
+    return array.array('d', (quantity * factor for quantity in quantities))
+
+  def decompose_many(self, quantities, unit=None):
+    # Decomposes a dataset of quantities of unit, by default the base unit.
+    # Returns a dict of arrays of counts by unit name, each parallel to
+    # quantities, and the list of the sign sequences; the fractions of the
+    # base unit are counted together, in subdivisions, under the name of the
+    # base unit followed by '/'.
+    # Administrative texts repeat the same quantities many times over, so each
+    # distinct quantity is decomposed once.
+    unit = unit or self.units[-1].name
+    columns = {u.name: array.array('q') for u in self.units}
+    fraction_column = columns[self.units[-1].name + '/'] = array.array('q')
+    signs = []
+    decompositions = {}
+    for quantity in quantities:
+      decomposition = decompositions.get(quantity)
+      if decomposition is None:
+        subdivisions = self._subdivisions(quantity, unit)
+        counts = []
+        for u in self.units:
+          count, subdivisions = divmod(subdivisions, u.size * self.denominator)
+          counts.append(count)
+        decomposition = decompositions[quantity] = (
+            counts, subdivisions, self.signs(quantity, unit))
+      counts, fraction, sign_sequence = decomposition
+      for u, count in zip(self.units, counts):
+        columns[u.name].append(count)
+      fraction_column.append(fraction)
+      signs.append(sign_sequence)
+    return columns, signs
+
+# Neo-Sumerian / Old Babylonian area system, in iku; see the compositions in
+# numbers.py.
+AREA = System(
+    'area',
+    [Unit('šargal', 60 * 60 * 18, max_count=59),
+     Unit('šar2', 60 * 18, max_count=59),
+     Unit('bur3', 18, max_count=59),
+     Unit('eše3', 6, max_count=2),
+     Unit('iku', 1, max_count=5)],
+    fractions=[('1/2iku', 4), ('1/4iku', 2), ('1/8iku', 1)],
+    denominator=8)
+
+# Neo-Sumerian / Old Babylonian capacity system, in sila₃, with the gur of
+# 5 barig; gur and sila₃ are counted with the counting numerals.
+CAPACITY = System(
+    'capacity',
+    [Unit('gur', 300, sign='𒄥'),
+     Unit('barig', 60, max_count=4),
+     Unit('ban2', 10, max_count=5),
+     Unit('sila3', 1, max_count=9, sign='𒋡')])
+
+SYSTEMS = {system.name: system for system in (AREA, CAPACITY)}
+
+# Sanity checks.
+if AREA.decompose(40) != [(2, 'bur3'), (4, 'iku')]:
+  raise ValueError('Unexpected decomposition %s' % AREA.decompose(40))
+if AREA.signs(25.5) != '𒌋𒑘𒀸𒀹':
+  raise ValueError('Unexpected signs %s' % AREA.signs(25.5))
+if CAPACITY.signs(1, 'gur') + CAPACITY.signs(70) != '𒁹𒄥𒁹𒑏':
+  raise ValueError('Unexpected signs %s' % CAPACITY.signs(70))
@@ -0,0 +1,402 @@
+﻿import argparse
+import array
+import bisect
+import collections
+import marshal
+import math
+import os
+import sys
+import time
+
+import corpus_frequencies
+import interning
+import keystroke_replay
+import read_sign_list
+import snapshot
+
+# An index from the last signs typed to the signs most likely to follow them,
+# for suggesting the next sign in the candidate window, e.g., 𒌓 after 𒀭 as in
+# {d}utu, or 𒈾 after 𒀀 as in a-na.
+#
+# The index is built from ATF corpora: the readings of each line are mapped to
+# their signs by the dictionary, and the n-grams of consecutive signs are
+# counted for n up to the order of the index, 3 by default.  A run of signs
+# ends at the end of a line and at a grapheme that is not a reading of the
+# dictionary, e.g., a broken sign, so that no n-gram spans a gap.  The counts
+# are keyed by the sign IDs packed into an integer, the ID of the sign i
+# places from the end weighing len(signs) ** i; on corpora whose n-grams do not
+# fit in memory, the rarest are dropped as they are counted.
+#
+# Each context, a sequence of up to order - 1 signs, keeps the top signs that
+# follow it, those seen at least min_count times, with their conditional
+# probabilities quantized to a byte.  A context whose top signs are those of
+# its backoff, the context without its first sign, adds nothing and is
+# dropped.  The remaining contexts are kept in decreasing order of frequency
+# until the index reaches its budget; since a context is at least as frequent
+# as those that extend it, the backoff of a kept context is kept.  A lookup
+# tries the longest context it has, then backs off to the shorter ones, as in
+# Katz backoff: the probability that the longer contexts leave to the signs
+# they do not predict is shared among those that a shorter context predicts,
+# in proportion to their probabilities in that context.  The suggestions are
+# then sorted by probability.
+#
+# The index is serialized as the marshal of the signs, newline-separated, and,
+# for each order, the sorted packed contexts and CSR arrays of the predicted
+# sign IDs and their scores; the budget is that of these buffers.
+
+# Bump this whenever the layout of a serialized index changes.
+INDEX_VERSION = 1
+
+DEFAULT_ORDER = 3
+DEFAULT_BUDGET = 1 << 20
+DEFAULT_MAX_NGRAMS = 1 << 22
+
+# Scores are -log2 of the probabilities in steps of 1/16 bit, so that a byte
+# covers the probabilities from 1 down to 2⁻¹⁶ within 5%.
+SCORE_STEPS = 16
+
+CONTEXT_TYPE = 'Q'
+
+def check_order(order, sign_count):
+  # The contexts of order - 1 signs are packed into a CONTEXT_TYPE.
+  bits = 8 * array.array(CONTEXT_TYPE).itemsize
+  if order < 1:
+    raise ValueError('The order must be at least 1, not %d' % order)
+  if sign_count ** (order - 1) > 1 << bits:
+    raise ValueError('The contexts of an order %d index of %d signs do not '
+                     'fit in %d bits' % (order, sign_count, bits))
+
+def quantize(probability):
+  return min(255, round(-math.log2(probability) * SCORE_STEPS))
+
+def dequantize(score):
+  return 2 ** (-score / SCORE_STEPS)
+
+def _pack(ids, base):
+  key = 0
+  for i in ids:
+    key = key * base + i
+  return key
+
+def _id_type(count):
+  return 'H' if count <= 1 << 16 else interning.ID_TYPE
+
+def sign_runs(lines, signs):
+  # The runs of consecutive signs on the ATF lines; signs maps the
+  # compositions of the dictionary to their signs.
+  for line in lines:
+    run = []
+    for reading in corpus_frequencies.graphemes(line):
+      sign = signs.get(reading)
+      if sign is None:
+        if run:
+          yield run
+        run = []
+      else:
+        run.append(sign)
+    if run:
+      yield run
+
+def corpus_lines(paths):
+  for path in paths:
+    with open(path, encoding='utf-8', errors='replace') as file:
+      yield from file
+
+class NgramCounts:
+  def __init__(self, signs, order=DEFAULT_ORDER,
+               max_ngrams=DEFAULT_MAX_NGRAMS):
+    # signs are all the signs that may occur, so that the packing is fixed.
+    self.signs = interning.Interner(sorted(set(signs)))
+    check_order(order, len(self.signs))
+    self.order = order
+    self.max_ngrams = max_ngrams
+    # The counts of the n-grams by n - 1, and for each n the count below
+    # which n-grams have been dropped.
+    self.counts = [collections.Counter() for _ in range(order)]
+    self.floors = [0] * order
+
+  def add(self, run):
+    base = len(self.signs)
+    ids = [self.signs.id(sign) for sign in run]
+    # The n-gram at i extends the (n - 1)-gram at i by the sign at i + n - 1.
+    keys = ids
+    for n in range(self.order):
+      if n:
+        keys = [key * base + i for key, i in zip(keys, ids[n:])]
+      counts = self.counts[n]
+      counts.update(keys)
+      if len(counts) > self.max_ngrams:
+        self._prune(n)
+
+  def _prune(self, n):
+    counts = self.counts[n]
+    while len(counts) > self.max_ngrams // 2:
+      self.floors[n] += 1
+      for key in [key for key, count in counts.items()
+                  if count <= self.floors[n]]:
+        del counts[key]
+
+class NextSignIndex:
+  def __init__(self, signs, levels):
+    # signs is an Interner of the signs of the index; levels holds, for each
+    # order n from 1, the (contexts, offsets, predictions, scores) of the
+    # contexts of n - 1 signs, the predictions of context i being those from
+    # offsets[i] to offsets[i + 1].
+    self.signs = signs
+    self.levels = levels
+
+  @property
+  def order(self):
+    return len(self.levels)
+
+  def size(self):
+    # The size in bytes of the buffers of the index.
+    return (sum(len(sign.encode('utf-8')) + 1 for sign in self.signs.strings) +
+            sum(buffer.itemsize * len(buffer)
+                for level in self.levels for buffer in level))
+
+  def context_count(self, n):
+    return len(self.levels[n - 1][0])
+
+  def _predictions(self, n, ids):
+    contexts, offsets, predictions, scores = self.levels[n - 1]
+    key = _pack(ids, len(self.signs))
+    i = bisect.bisect_left(contexts, key)
+    if i == len(contexts) or contexts[i] != key:
+      return None
+    return zip(predictions[offsets[i]:offsets[i + 1]],
+               scores[offsets[i]:offsets[i + 1]])
+
+  def predict(self, previous, top=keystroke_replay.PAGE_SIZE):
+    # The (sign, probability) pairs of the signs most likely to follow the
+    # signs previous, most likely first.  The context is the longest run at
+    # the end of previous of signs that the index knows.
+    ids = []
+    for sign in previous[len(previous) - (self.order - 1):]:
+      i = self.signs.id(sign)
+      ids = [] if i is None else ids + [i]
+    probabilities = {}
+    for n in range(len(ids) + 1, 0, -1):
+      predictions = self._predictions(n, ids[len(ids) - (n - 1):])
+      if predictions is None:
+        continue
+      predictions = [(sign_id, dequantize(score))
+                     for sign_id, score in predictions]
+      # The probability left by the longer contexts, and that of the signs
+      # that they predict in this context, which is not shared.
+      left = max(0, 1 - sum(probabilities.values()))
+      predicted = sum(probability for sign_id, probability in predictions
+                      if sign_id in probabilities)
+      weight = left / max(1 - predicted, left, sys.float_info.min)
+      for sign_id, probability in predictions:
+        if sign_id not in probabilities:
+          probabilities[sign_id] = weight * probability
+    return [(self.signs.strings[sign_id], probability)
+            for sign_id, probability in sorted(
+                probabilities.items(), key=lambda item: -item[1])[:top]]
+
+  def write(self, path):
+    data = marshal.dumps((
+        INDEX_VERSION, len(self.signs), '\n'.join(self.signs.strings),
+        [(buffer.typecode, buffer.tobytes())
+         for level in self.levels for buffer in level]))
+    with open(path + '.tmp', 'wb') as file:
+      file.write(data)
+    os.replace(path + '.tmp', path)
+
+  @staticmethod
+  def read(path):
+    with open(path, 'rb') as file:
+      version, count, signs, buffers = marshal.loads(file.read())
+    if version != INDEX_VERSION:
+      raise ValueError('%s is a version %d index, expected %d' % (
+          path, version, INDEX_VERSION))
+    interner = interning.Interner()
+    interner.strings = signs.split('\n') if count else []
+    interner.ids = {sign: i for i, sign in enumerate(interner.strings)}
+    buffers = [array.array(typecode, data) for typecode, data in buffers]
+    return NextSignIndex(interner, [tuple(buffers[i:i + 4])
+                                    for i in range(0, len(buffers), 4)])
+
+def build_index(counts, top=keystroke_replay.PAGE_SIZE, min_count=2,
+                budget=DEFAULT_BUDGET):
+  # The NextSignIndex of the NgramCounts, within budget bytes.
+  base = len(counts.signs)
+  id_size = array.array(_id_type(base)).itemsize
+  # For each order n, the top predictions of each context as (count, sign ID)
+  # pairs, and the number of occurrences of each context.
+  predictions = []
+  totals = []
+  for n in range(1, counts.order + 1):
+    level_predictions = collections.defaultdict(list)
+    level_totals = collections.Counter()
+    for key, count in counts.counts[n - 1].items():
+      context, sign_id = divmod(key, base)
+      level_totals[context] += count
+      if count >= min_count:
+        level_predictions[context].append((-count, sign_id))
+    for context, followers in level_predictions.items():
+      followers.sort()
+      del followers[top:]
+    predictions.append(level_predictions)
+    totals.append(level_totals)
+
+  def backoff(n, context):
+    # The predictions of the context without its first sign.
+    while n > 1:
+      n -= 1
+      context %= base ** (n - 1)
+      if context in predictions[n - 1]:
+        return predictions[n - 1][context]
+    return None
+
+  candidates = []
+  for n in range(counts.order, 0, -1):
+    level_predictions = predictions[n - 1]
+    for context in list(level_predictions):
+      followers = [sign_id for _, sign_id in level_predictions[context]]
+      fallback = backoff(n, context)
+      if n > 1 and fallback is not None and followers == [
+          sign_id for _, sign_id in fallback]:
+        del level_predictions[context]
+      else:
+        candidates.append((-totals[n - 1][context], n, context))
+  candidates.sort()
+
+  kept = [[] for _ in range(counts.order)]
+  used = set()
+  # The leading offset of each order.
+  size = counts.order * array.array(interning.ID_TYPE).itemsize
+  for _, n, context in candidates:
+    followers = predictions[n - 1][context]
+    context_ids = []
+    remainder = context
+    for _ in range(n - 1):
+      remainder, sign_id = divmod(remainder, base)
+      context_ids.append(sign_id)
+    new_signs = ({sign_id for _, sign_id in followers} |
+                 set(context_ids)) - used
+    cost = (array.array(CONTEXT_TYPE).itemsize +
+            array.array(interning.ID_TYPE).itemsize +
+            len(followers) * (id_size + 1) +
+            sum(len(counts.signs.strings[sign_id].encode('utf-8')) + 1
+                for sign_id in new_signs))
+    if size + cost > budget:
+      break
+    size += cost
+    used |= new_signs
+    kept[n - 1].append((context_ids[::-1], followers, totals[n - 1][context]))
+
+  signs = interning.Interner(sorted(counts.signs.strings[sign_id]
+                                    for sign_id in used))
+  ids = [signs.id(sign) for sign in counts.signs.strings]
+  levels = []
+  for level in kept:
+    packed = sorted((_pack([ids[i] for i in context_ids], len(signs)),
+                     followers, total)
+                    for context_ids, followers, total in level)
+    contexts = array.array(CONTEXT_TYPE)
+    offsets = array.array(interning.ID_TYPE, [0])
+    sign_ids = array.array(_id_type(len(signs)))
+    scores = array.array('B')
+    for key, followers, total in packed:
+      contexts.append(key)
+      for count, sign_id in followers:
+        sign_ids.append(ids[sign_id])
+        scores.append(quantize(-count / total))
+      offsets.append(len(sign_ids))
+    levels.append((contexts, offsets, sign_ids, scores))
+  return NextSignIndex(signs, levels)
+
+def context_signs(text, signs):
+  # The signs at the end of the ATF text of a query, e.g., {d} or a-na, from
+  # the last grapheme that is not a reading of the dictionary; signs maps the
+  # compositions to their signs.
+  result = []
+  for reading in corpus_frequencies.graphemes('1. ' + text):
+    sign = signs.get(reading)
+    result = [] if sign is None else result + [sign]
+  return result
+
+# Sanity checks.
+if abs(math.log2(dequantize(quantize(0.3)) / 0.3)) > 1 / SCORE_STEPS / 2:
+  raise ValueError('Unexpected quantization of 0.3: %d' % quantize(0.3))
+_counts = NgramCounts('𒀭𒌓𒂗𒀀𒈾')
+for _run in ['𒀭𒌓', '𒀭𒌓', '𒀭𒌓', '𒀭𒂗', '𒀀𒈾𒀭𒌓', '𒀀𒈾𒀭𒂗', '𒀀𒈾𒀭𒂗']:
+  _counts.add(list(_run))
+_index = build_index(_counts, min_count=1)
+if ([sign for sign, _ in _index.predict(['𒀭'], 2)] != ['𒌓', '𒂗'] or
+    [sign for sign, _ in _index.predict(['𒈾', '𒀭'])][0] != '𒂗'):
+  raise ValueError('Unexpected predictions %s' % _index.predict(['𒀭']))
+# After 𒀭𒀀, 𒈾 and 𒂗 each have a probability of 2/5, and 𒌓, seen once, is
+# left to the backoff 𒀀, which predicts it with 7/11; it gets the remaining
+# 1/5 and comes last.
+_counts = NgramCounts('𒀭𒀀𒈾𒂗𒌓')
+for _run in ['𒀭𒀀𒈾'] * 2 + ['𒀭𒀀𒂗'] * 2 + ['𒀭𒀀𒌓'] + ['𒀀𒌓'] * 6:
+  _counts.add(list(_run))
+_predictions = build_index(_counts).predict(['𒀭', '𒀀'])
+if (set(sign for sign, _ in _predictions[:2]) != {'𒈾', '𒂗'} or
+    _predictions[2][0] != '𒌓' or
+    sorted(_predictions, key=lambda p: -p[1]) != _predictions or
+    sum(probability for _, probability in _predictions) > 1.05):
+  raise ValueError('Unexpected predictions after backoff %s' % _predictions)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Builds and queries an index of the signs most likely to '
+                  'follow the last signs typed, from ATF corpora.')
+  subparsers = parser.add_subparsers(dest='command', required=True)
+  build_parser = subparsers.add_parser(
+      'build', help='count the n-grams of signs in the corpora and write the '
+                    'index')
+  build_parser.add_argument('corpus', nargs='+', help='ATF files')
+  build_parser.add_argument('--output', required=True, help='the index')
+  build_parser.add_argument('--order', type=int, default=DEFAULT_ORDER,
+                            help='the length of the n-grams, one more than '
+                                 'that of the longest context')
+  build_parser.add_argument('--top', type=int,
+                            default=keystroke_replay.PAGE_SIZE,
+                            help='the number of signs kept per context')
+  build_parser.add_argument('--min-count', type=int, default=2,
+                            help='drop the n-grams seen fewer times')
+  build_parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                            help='the size of the index in bytes')
+  build_parser.add_argument('--max-ngrams', type=int,
+                            default=DEFAULT_MAX_NGRAMS,
+                            help='the number of distinct n-grams of each '
+                                 'order counted before the rarest are '
+                                 'dropped')
+  query_parser = subparsers.add_parser(
+      'query', help='print the signs most likely to follow CONTEXT')
+  query_parser.add_argument('index')
+  query_parser.add_argument('context', help='the ATF of the signs typed, '
+                                            'e.g., {d} or a-na')
+  query_parser.add_argument('--top', type=int,
+                            default=keystroke_replay.PAGE_SIZE)
+  args = parser.parse_args()
+
+  readings_by_composition, _ = snapshot.load()
+  signs = dict(read_sign_list.dictionary_entries(readings_by_composition))
+  if args.command == 'build':
+    start = time.perf_counter()
+    counts = NgramCounts(signs.values(), args.order, args.max_ngrams)
+    for run in sign_runs(corpus_lines(args.corpus), signs):
+      counts.add(run)
+    counted = time.perf_counter()
+    index = build_index(counts, args.top, args.min_count, args.budget)
+    index.write(args.output)
+    print('%d signs, %s n-grams counted in %.1f s' % (
+        sum(counts.counts[0].values()),
+        ' + '.join(str(len(level)) for level in counts.counts),
+        counted - start), file=sys.stderr)
+    print('%s contexts of %d signs, %d bytes, in %.1f s' % (
+        ' + '.join(str(index.context_count(n))
+                   for n in range(1, index.order + 1)),
+        len(index.signs), index.size(), time.perf_counter() - counted),
+        file=sys.stderr)
+  else:
+    index = NextSignIndex.read(args.index)
+    context = context_signs(args.context, signs)
+    print('After %s:' % (''.join(context) or 'nothing'))
+    for sign, probability in index.predict(context, args.top):
+      print('  %s %6.2f%%' % (sign, probability * 100))
@@ -1,10 +1,5 @@
 ﻿
-import codecs
-import re
-import sys
-import unicodedata
-
-sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
+import sign_names
 
 BASIC_FRACTIONS = {
   "1/2": ['𒈦'],
@@ -167,12 +162,7 @@ BÁN_NUMERALS = [
 ]
 
 def numeric_value(c):
-  if len(c) > 1:
-    return None
-  try:
-    return unicodedata.numeric(c)
-  except ValueError:
-    return None
+  return sign_names.numeric(c)
 
 
 # Sanity check.
@@ -0,0 +1,140 @@
+﻿import os
+
+# Remaps of the signs of individual readings of sign_list.csv, for the
+# disunifications that Šašková’s list does not make, applied by
+# read_sign_list.row_readings.
+#
+# A rule applies to the readings with its value whose sign is its sign, or, for
+# a component rule, has its sign as a component; it replaces that sign with its
+# new sign.  The rules are indexed by (sign, value), and the component rules by
+# value, so that finding the rule for a reading takes a dictionary lookup.
+# The rule applied to a reading is recorded as reading.remap.
+#
+# Local rules are read from local_remaps.tsv, next to this file, if it exists:
+# lines sign<TAB>value<TAB>new sign<TAB>reason[<TAB>component], where the last
+# column, if present, makes it a component rule; # starts a comment line.
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+LOCAL_REMAPS_PATH = os.path.join(DIRECTORY, 'local_remaps.tsv')
+
+class Remap:
+  def __init__(self, sign, value, new_sign, reason, component=False):
+    self.sign = sign
+    self.value = value
+    self.new_sign = new_sign
+    self.reason = reason
+    self.component = component
+
+  def apply(self, reading):
+    if self.component:
+      reading.sign = reading.sign.replace(self.sign, self.new_sign)
+    else:
+      reading.sign = self.new_sign
+    reading.remap = self
+
+  def __repr__(self):
+    return '%s %s → %s (%s)' % (self.value, self.sign, self.new_sign,
+                               self.reason)
+
+_rules_by_sign_and_value = {}
+_component_rules_by_value = {}
+
+def add(rule):
+  if rule.component:
+    rules = _component_rules_by_value.setdefault(rule.value, [])
+    if any(other.sign == rule.sign for other in rules):
+      raise ValueError('Conflicting remaps of %s in %s' % (rule.value,
+                                                          rule.sign))
+    rules.append(rule)
+  else:
+    if (rule.sign, rule.value) in _rules_by_sign_and_value:
+      raise ValueError('Conflicting remaps of %s %s' % (rule.value, rule.sign))
+    _rules_by_sign_and_value[rule.sign, rule.value] = rule
+
+def find(sign, value):
+  # The rule that applies to a reading with the given sign and value, or None.
+  rule = _rules_by_sign_and_value.get((sign, value))
+  if rule:
+    return rule
+  for rule in _component_rules_by_value.get(value, ()):
+    if rule.sign in sign:
+      return rule
+  return None
+
+# See the comments in read_sign_list.row_readings re. DUN₃ 𒂅, DUN₃ gunû 𒂆,
+# and DUN₃ gunû gunû 𒂇: the readings of GIN₂, which Šašková gives for 𒂅, are
+# split between 𒂅 and 𒂆 in every sign of which it is a component.
+DUN3_VARIANTS = {
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0068/o0000160/index.html
+  'DU5': '𒂅',
+  'DUG5': '𒂅',
+  'DUN3': '𒂅',
+  'SU18': '𒂅',
+  'SUG5': '𒂅',
+  'TU18': '𒂅',
+  'TUN3': '𒂅',
+  'TUG8': '𒂅',
+  'ṬU': '𒂅',
+  # In Borger, not in Oracc.  Adding it where the SUG reading is.
+  'SUK5': '𒂅',
+  # Labat-only readings, not in Oracc; adding those to the variant with the
+  # DUN/TUN and SU readings.
+  'SU14': '𒂅',
+  'ṬUN': '𒂅',
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0068/o0000161/index.html
+  'AGA3': '𒂆',
+  'GE11': '𒂆',
+  'GI11': '𒂆',
+  'GIG4': '𒂆',
+  'GIM2': '𒂆',
+  'GIN2': '𒂆',
+  'PUŠ4': '𒂆',
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0080/o0002178/index.html
+  'ḪURSAG': '𒂅',
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0071/o0001279/index.html
+  'AGARIN3': '𒂆',
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0071/o0001367/index.html
+  'GILGAMEŠ': '𒂆',
+  'GILGAMES': '𒂆',
+  # http://oracc.museum.upenn.edu/ogsl/signlist/l0090/o0002642/index.html
+  'NIR2': '𒂆',
+  # Labat-only reading, not in Oracc.
+  'NINI2': '𒂆',
+}
+
+# Deal with the disunification of 60 and 1 in Unicode.
+SIXTY = 'disunification of 60 and 1'
+for rule in [
+    # Readings given for 60 in MesZL 748.
+    Remap('𒁹', 'GEŠ2', '𒐕', SIXTY),
+    Remap('𒁹', 'GIŠ2', '𒐕', SIXTY),
+    Remap('𒁹', 'GEŠTA', '𒐕', SIXTY),
+    # Labat-only readings for 60n.
+    Remap('𒐊', 'GEŠIA', '𒐙', SIXTY),
+    Remap('𒐋', 'GEŠAŠ', '𒐚', SIXTY),
+    Remap('𒐌', 'GEŠUMUN', '𒐛', SIXTY),
+    Remap('𒑂', 'GEŠUMUN', '𒐛', SIXTY),
+    Remap('𒐍', 'GEŠUSSU', '𒐜', SIXTY),
+    Remap('𒑄', 'GEŠUSSU', '𒐜', SIXTY),
+    Remap('𒑆', 'GEŠILIMMU', '𒐝', SIXTY),
+  ]:
+  add(rule)
+
+for value, variant in DUN3_VARIANTS.items():
+  add(Remap('𒂆', value, variant, 'DUN₃ split', component=True))
+
+def read_local_rules(path=LOCAL_REMAPS_PATH):
+  with open(path, encoding='utf-8-sig') as file:
+    for line_number, line in enumerate(file, 1):
+      line = line.rstrip('\r\n')
+      if not line.strip() or line.startswith('#'):
+        continue
+      columns = line.split('\t')
+      if len(columns) not in (4, 5):
+        raise ValueError('%s:%d: expected 4 or 5 columns, got %r' % (
+            path, line_number, line))
+      yield Remap(*columns[:4], component=len(columns) == 5)
+
+if os.path.exists(LOCAL_REMAPS_PATH):
+  for rule in read_local_rules():
+    add(rule)
@@ -0,0 +1,177 @@
+﻿import hashlib
+import heapq
+import json
+import os
+import re
+
+import front_coding
+import numbers
+
+# The dictionary split into shards by the first character of the
+# compositions, so that a consumer loads only the shards that its queries
+# reach, rather than every reading up front.  The numerals of numbers.py, most
+# of which a session never types, have a shard of their own.
+#
+# The shards are front-coded dictionaries (see front_coding) that keep the
+# ranks of their entries in the whole dictionary, so that the results of
+# several shards merge in candidate order.  They are written next to a JSON
+# manifest,
+#   {"version": MANIFEST_VERSION, "entries": entry count,
+#    "shards": [{"name": ..., "file": ..., "sha256": ..., "entries": ...,
+#                "first_characters": ...}, ...]},
+# where the file of a shard is relative to the directory of the manifest, and
+# first_characters are those with which its compositions start, by which
+# queries are routed.
+#
+# A shard file is named after its shard and the hash of its content, so that a
+# rebuild never overwrites a file that a manifest refers to.  write() writes
+# the new shards, then replaces the manifest atomically, and only then removes
+# the orphaned shard files, those to which neither the new manifest nor the
+# one that it replaced refers; a reader thus sees either build whole, and one
+# that read the previous manifest can still load its shards until the next
+# rebuild.  A directory holds a single sharded dictionary.  A shard is checked
+# against its hash when it is loaded, so that a reader whose manifest is older
+# still fails rather than mixing builds.
+
+# Bump this whenever the layout of the manifest changes.
+MANIFEST_VERSION = 1
+
+NUMERALS = 'numerals'
+
+_SHARD_FILE = re.compile(r'^shard_\w+\.fc$')
+
+def shard_name(composition):
+  if composition in numbers.compositions:
+    return NUMERALS
+  return '%04x' % ord(composition[0])
+
+def shard_file(name, digest):
+  return 'shard_%s_%s.fc' % (name, digest[:16])
+
+def _sha256(data):
+  return hashlib.sha256(data).hexdigest()
+
+def _manifest_files(path):
+  # The shard files to which the manifest at path refers, if it can be read.
+  try:
+    with open(path, encoding='utf-8') as file:
+      return {shard['file'] for shard in json.load(file)['shards']}
+  except (OSError, ValueError, KeyError, TypeError):
+    return set()
+
+def write(entries, path):
+  # entries are the (composition, sign) pairs in candidate order, as returned
+  # by read_sign_list.dictionary_entries; path is that of the manifest, which
+  # is replaced atomically, so exporters.export does not move it.
+  directory = os.path.dirname(os.path.abspath(path))
+  os.makedirs(directory, exist_ok=True)
+  shards = {}
+  for rank, (composition, sign) in enumerate(entries):
+    shards.setdefault(shard_name(composition), []).append(
+        (rank, composition, sign))
+  manifest = {'version': MANIFEST_VERSION, 'entries': len(entries),
+              'shards': []}
+  for name, shard in sorted(shards.items()):
+    temporary_path = os.path.join(directory, 'shard_%s.fc.tmp' % name)
+    front_coding.write([(composition, sign) for _, composition, sign in shard],
+                       temporary_path, ranks=[rank for rank, _, _ in shard])
+    with open(temporary_path, 'rb') as file:
+      digest = _sha256(file.read())
+    # An unchanged shard replaces itself with the same content.
+    os.replace(temporary_path,
+               os.path.join(directory, shard_file(name, digest)))
+    manifest['shards'].append({
+        'name': name,
+        'file': shard_file(name, digest),
+        'sha256': digest,
+        'entries': len(shard),
+        'first_characters': ''.join(sorted(
+            {composition[0] for _, composition, _ in shard})),
+    })
+  referenced = _manifest_files(path) | {
+      shard['file'] for shard in manifest['shards']}
+  with open(path + '.tmp', 'w', encoding='utf-8', newline='\n') as file:
+    json.dump(manifest, file, ensure_ascii=False, indent=1)
+    file.write('\n')
+  os.replace(path + '.tmp', path)
+  for name in os.listdir(directory):
+    if _SHARD_FILE.match(name) and name not in referenced:
+      os.remove(os.path.join(directory, name))
+
+class ShardedDictionary:
+  # Reads a manifest written by write().  Only the manifest is read up front;
+  # a shard is loaded when a query first reaches a character with which its
+  # compositions start.
+  def __init__(self, path):
+    self.directory = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8') as file:
+      manifest = json.load(file)
+    if manifest.get('version') != MANIFEST_VERSION:
+      raise ValueError('%s is not a version %d manifest' % (
+          path, MANIFEST_VERSION))
+    self.entry_count = manifest['entries']
+    self.manifest_shards = manifest['shards']
+    self.shards_by_character = {}
+    for shard in self.manifest_shards:
+      for c in shard['first_characters']:
+        self.shards_by_character.setdefault(c, []).append(shard)
+    self.loaded = {}
+
+  def __len__(self):
+    return self.entry_count
+
+  def shard(self, shard):
+    # The FrontCodedDictionary of the given shard of the manifest.
+    name = shard['name']
+    if name not in self.loaded:
+      path = os.path.join(self.directory, shard['file'])
+      try:
+        with open(path, 'rb') as file:
+          data = file.read()
+      except FileNotFoundError:
+        data = None
+      if data is None or _sha256(data) != shard['sha256']:
+        raise ValueError('%s does not match its manifest; the dictionary was '
+                         'rebuilt since' % path)
+      self.loaded[name] = front_coding.FrontCodedDictionary(path, data)
+    return self.loaded[name]
+
+  def _shards(self, prefix):
+    # The shards that may hold compositions with the given prefix.
+    if prefix:
+      return [self.shard(shard)
+              for shard in self.shards_by_character.get(prefix[0], [])]
+    return [self.shard(shard) for shard in self.manifest_shards]
+
+  def exact(self, composition):
+    for shard in self._shards(composition[:1]):
+      sign = shard.lookup(composition)
+      if sign is not None:
+        return sign
+    return None
+
+  def _ranked_prefix(self, prefix):
+    return heapq.merge(*(shard.ranked_prefix(prefix)
+                         for shard in self._shards(prefix)))
+
+  def prefix(self, prefix):
+    # The (composition, sign) pairs whose composition starts with the prefix,
+    # in candidate order.
+    return [(composition, sign)
+            for _, composition, sign in self._ranked_prefix(prefix)]
+
+  def wildcard(self, pattern):
+    # As DictionaryIndex.wildcard, but case-sensitive, as are prefix and the
+    # routing of queries by first character; only the shards that hold the
+    # literal prefix of the pattern are loaded.
+    literal_prefix = re.match(r'[^*?]*', pattern)[0]
+    regex = re.compile(''.join(
+        '.*' if c == '*' else '.' if c == '?' else re.escape(c)
+        for c in pattern) + r'\Z', re.DOTALL)
+    return [(composition, sign)
+            for _, composition, sign in self._ranked_prefix(literal_prefix)
+            if regex.match(composition)]
+
+  def entries(self):
+    # All the (composition, sign) pairs, in candidate order.
+    return self.prefix('')
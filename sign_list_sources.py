@@ -0,0 +1,234 @@
+﻿import configparser
+import os
+import re
+
+# Merging of supplementary sign lists into the readings of sign_list.csv.
+#
+# The supplements are listed in sign_list_sources.ini, next to this file, if
+# it exists; each section is a source:
+#   [Local]
+#   format = tsv
+#   path = local_readings.tsv
+#   disambiguator = B
+#   priority = 40
+# The path is relative to the configuration file; the formats are those of
+# ADAPTERS.  The disambiguator is appended to the composition of the readings
+# of that source when they diverge from those of other sources, as M, L, A for
+# the sources cited in sign_list.csv.  A section named after one of these only
+# sets its priority, e.g.,
+#   [Labat]
+#   priority = 35
+#
+# Readings are joined on their normalized (value, sign), so that merging is
+# linear in the number of readings: a reading already attested keeps the
+# attestation of the source with the highest priority, and a new one is added.
+# A reading given more than once in sign_list.csv, e.g., by MesZL and Labat,
+# is attested anew as a whole, so that its duplicates remain consistent.
+# A supplement may also move a reading to another sign, for disunifications
+# of our own.
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCES_PATH = os.path.join(DIRECTORY, 'sign_list_sources.ini')
+
+# The sources cited in the comments of sign_list.csv, see
+# read_sign_list.SOURCES, with their disambiguators and default priorities.
+# Readings of sign_list.csv without a source are from MesZL.
+BUILTIN_SOURCES = {
+  'MesZL': ('M', 30),
+  'ABZ': ('A', 20),
+  'Labat': ('L', 10),
+}
+DEFAULT_SOURCE = 'MesZL'
+
+class Source:
+  def __init__(self, name, disambiguator, priority, format=None, path=None):
+    self.name = name
+    self.disambiguator = disambiguator
+    self.priority = priority
+    self.format = format
+    self.path = path
+
+_SUBSCRIPTS = str.maketrans('₀₁₂₃₄₅₆₇₈₉ₓ', '0123456789x')
+
+def normalize_value(value):
+  # The value in the style of sign_list.csv, ŠAR2, DAGx, from that style or
+  # from ATF, šar₂, szar2, dagₓ.
+  value = value.strip().upper()
+  for spelling, letter in (('SZ', 'Š'), ('S,', 'Ṣ'), ('T,', 'Ṭ'), ('H', 'Ḫ'),
+                           ("'", 'ʾ'), ('’', 'ʾ')):
+    value = value.replace(spelling, letter)
+  return value.translate(_SUBSCRIPTS)
+
+def read_tsv(path):
+  # Lines sign<TAB>value[<TAB>comment[<TAB>from sign]], where the last column
+  # moves the reading from that sign to this one; # starts a comment line.
+  with open(path, encoding='utf-8-sig') as file:
+    for line_number, line in enumerate(file, 1):
+      line = line.rstrip('\r\n')
+      if not line.strip() or line.startswith('#'):
+        continue
+      columns = line.split('\t')
+      if len(columns) < 2 or len(columns) > 4:
+        raise ValueError('%s:%d: expected 2 to 4 columns, got %r' % (
+            path, line_number, line))
+      columns += [''] * (4 - len(columns))
+      yield tuple(columns)
+
+def read_ogsl(path):
+  # An OGSL-style export: @sign or @form, followed by @ucun, the sign, and @v,
+  # its values; forms end with @@, and signs with @end sign.  Deprecated
+  # values, @v-, are skipped, as are the values of signs without @ucun.
+  signs = []
+  with open(path, encoding='utf-8-sig') as file:
+    for line in file:
+      fields = line.split()
+      if not fields:
+        continue
+      tag = fields[0]
+      if tag in ('@sign', '@form'):
+        signs.append(None)
+      elif tag in ('@@', '@end'):
+        if signs:
+          signs.pop()
+      elif tag == '@ucun' and signs and len(fields) > 1:
+        signs[-1] = fields[1]
+      elif tag in ('@v', '@v?') and signs and signs[-1]:
+        values = [field for field in fields[1:] if not field.startswith('%')]
+        if values:
+          yield signs[-1], re.sub(r'[\[\]?]', '', values[0]), '', ''
+
+ADAPTERS = {
+  'tsv': read_tsv,
+  'ogsl': read_ogsl,
+}
+
+def load_sources(path=SOURCES_PATH):
+  # The sources, builtin and supplementary; only the former if there is no
+  # configuration at path.
+  sources = {name: Source(name, disambiguator, priority)
+             for name, (disambiguator, priority) in BUILTIN_SOURCES.items()}
+  if not os.path.exists(path):
+    return list(sources.values())
+  config = configparser.ConfigParser()
+  with open(path, encoding='utf-8-sig') as file:
+    config.read_file(file)
+  for name in config.sections():
+    section = config[name]
+    if name in sources:
+      sources[name].priority = section.getint('priority',
+                                              sources[name].priority)
+      continue
+    for key in ('format', 'path', 'disambiguator', 'priority'):
+      if key not in section:
+        raise ValueError('%s: source %s has no %s' % (path, name, key))
+    if section['format'] not in ADAPTERS:
+      raise ValueError('%s: source %s has unknown format %s' % (
+          path, name, section['format']))
+    sources[name] = Source(
+        name, section['disambiguator'], section.getint('priority'),
+        section['format'],
+        os.path.join(os.path.dirname(os.path.abspath(path)), section['path']))
+  disambiguators = {}
+  for source in sources.values():
+    # The disambiguator must survive the lowercasing of the composition
+    # filter in read_sign_list.dictionary_entries, and be unambiguous.
+    if not re.match('^[BDGPTKQZMNRLWJAEIU]$', source.disambiguator):
+      raise ValueError('%s: source %s has invalid disambiguator %r' % (
+          path, source.name, source.disambiguator))
+    if source.disambiguator in disambiguators:
+      raise ValueError('%s: sources %s and %s have the same disambiguator' % (
+          path, disambiguators[source.disambiguator], source.name))
+    disambiguators[source.disambiguator] = source.name
+  return list(sources.values())
+
+def input_paths(path=SOURCES_PATH):
+  # The files on which the merged readings depend, besides sign_list.csv.
+  if not os.path.exists(path):
+    return []
+  return [path] + [source.path for source in load_sources(path)
+                   if source.path]
+
+def merge(sources, readings_by_sign, readings_by_value, reading_type,
+          first_index, adapters=ADAPTERS):
+  # Merges the readings of the supplementary sources into readings_by_sign and
+  # readings_by_value, by decreasing priority.  New readings are constructed
+  # with reading_type, read_sign_list.Reading, with Šašková indices from
+  # first_index on, so that they come after those of sign_list.csv when
+  # disambiguated by variant.
+  priorities = {source.name: source.priority for source in sources}
+  def priority(reading):
+    return priorities[reading.source or DEFAULT_SOURCE]
+  # The readings of each (value, sign), with their duplicates.
+  index = {}
+  for readings in readings_by_sign.values():
+    for reading in readings:
+      if reading.keep:
+        index.setdefault((reading.value.lower(), reading.sign), []).append(
+            reading)
+  next_index = first_index
+  for source in sorted((source for source in sources if source.format),
+                       key=lambda source: -source.priority):
+    for sign, value, comment, from_sign in adapters[source.format](
+        source.path):
+      value = normalize_value(value)
+      key = (value.lower(), sign)
+      if from_sign:
+        moved = index.pop((value.lower(), from_sign), None)
+        if moved is None:
+          raise ValueError('%s: no reading %s of %s to move to %s' % (
+              source.name, value, from_sign, sign))
+        for reading in moved:
+          readings_by_sign[from_sign].remove(reading)
+          reading.sign = sign
+          readings_by_sign.setdefault(sign, []).append(reading)
+          if key in index:
+            reading.keep = False
+        if key not in index:
+          index[key] = moved
+        continue
+      existing = index.get(key)
+      if existing:
+        if source.priority > max(priority(reading) for reading in existing):
+          for reading in existing:
+            reading.source = source.name
+            reading.comment = comment or reading.comment
+        continue
+      reading = reading_type(sign, next_index)
+      next_index += 1
+      reading.value = value
+      reading.comment = comment
+      reading.source = source.name
+      index[key] = [reading]
+      readings_by_sign.setdefault(sign, []).append(reading)
+      readings_by_value.setdefault(value, []).append(reading)
+
+# Sanity checks.
+class _Reading:
+  def __init__(self, sign, šašková_index):
+    self.sign = sign
+    self.šašková_index = šašková_index
+    self.value = ''
+    self.comment = ''
+    self.source = ''
+    self.keep = True
+
+def _readings(sign, value, sources):
+  readings = []
+  for i, source in enumerate(sources):
+    readings.append(_Reading(sign, i))
+    readings[-1].value = value
+    readings[-1].source = source
+  return readings
+
+# A reading of sign_list.csv from MesZL and from Labat, attested anew by a
+# supplement, and one moved by it.
+_readings_by_sign = {'𒍨': _readings('𒍨', 'ZIG', ['', 'Labat']),
+                     '𒀸': _readings('𒀸', 'AŠ', ['', 'Labat'])}
+merge([Source('MesZL', 'M', 30), Source('Labat', 'L', 10),
+       Source('Local', 'B', 40, 'list',
+              [('𒍨', 'zig', '', ''), ('𒁹', 'aš', '', '𒀸')])],
+      _readings_by_sign, {}, _Reading, 2, {'list': iter})
+if ([reading.source for reading in _readings_by_sign['𒍨']] !=
+    ['Local', 'Local'] or _readings_by_sign['𒀸'] or
+    [reading.keep for reading in _readings_by_sign['𒁹']] != [True, True]):
+  raise ValueError('Unexpected merge of duplicate readings')
@@ -0,0 +1,162 @@
+﻿import array
+import marshal
+import math
+import os
+import unicodedata
+
+# A table of the cuneiform code points, with their Unicode names, numeric
+# values, and primary readings, i.e., the first reading of the code point as a
+# sign in the dictionary.
+#
+# The table is stored in sign_names.table, next to this file, and loaded on
+# first use.  The Unicode columns depend only on the version of the Unicode
+# character database, and are rebuilt from unicodedata when it changes; the
+# readings depend on the dictionary, and are rebuilt from the snapshot when
+# its inputs change, the first time a reading is asked for.  Columns are
+# stored as a string of newline-separated entries and an array of doubles,
+# NaN where there is no numeric value.
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+TABLE_PATH = os.path.join(DIRECTORY, 'sign_names.table')
+
+# Bump this whenever the layout of the table changes.
+TABLE_VERSION = 1
+
+# The Cuneiform, Cuneiform Numbers and Punctuation, and Early Dynastic
+# Cuneiform blocks.
+FIRST = 0x12000
+LAST = 0x1254F
+
+_PREFIXES = ('CUNEIFORM SIGN ', 'CUNEIFORM NUMERIC SIGN ',
+             'CUNEIFORM PUNCTUATION SIGN ')
+
+class _Table:
+  def __init__(self):
+    self.unidata_version = None
+    self.names = None
+    self.numerics = None
+    self.readings_hash = None
+    self.readings = None
+    # Whether the readings have been checked against the snapshot inputs by
+    # this process.
+    self.readings_checked = False
+
+  def load(self, path):
+    try:
+      with open(path, 'rb') as file:
+        (version, self.unidata_version, names, numerics, self.readings_hash,
+         readings) = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+      return
+    if version != TABLE_VERSION:
+      self.unidata_version = None
+      return
+    self.names = names.split('\n')
+    self.numerics = array.array('d', numerics)
+    self.readings = readings.split('\n') if readings is not None else None
+
+  def save(self, path):
+    data = marshal.dumps((TABLE_VERSION, self.unidata_version,
+                          '\n'.join(self.names), self.numerics.tobytes(),
+                          self.readings_hash,
+                          '\n'.join(self.readings)
+                          if self.readings is not None else None))
+    try:
+      with open(path + '.tmp', 'wb') as file:
+        file.write(data)
+      os.replace(path + '.tmp', path)
+    except OSError:
+      pass  # A read-only install rebuilds the table in memory each time.
+
+  def build_unicode_columns(self):
+    self.unidata_version = unicodedata.unidata_version
+    self.names = []
+    self.numerics = array.array('d')
+    for code_point in range(FIRST, LAST + 1):
+      c = chr(code_point)
+      self.names.append(unicodedata.name(c, ''))
+      self.numerics.append(unicodedata.numeric(c, math.nan))
+
+  def build_readings(self, readings_hash):
+    import snapshot
+    _, readings_by_sign = snapshot.load()
+    self.readings_hash = readings_hash
+    readings = primary_readings(readings_by_sign)
+    self.readings = [readings.get(chr(code_point), '')
+                     for code_point in range(FIRST, LAST + 1)]
+
+_table = None
+
+def _loaded():
+  global _table
+  if _table is None:
+    table = _Table()
+    table.load(TABLE_PATH)
+    if table.unidata_version != unicodedata.unidata_version:
+      table.build_unicode_columns()
+      table.readings = None
+      table.save(TABLE_PATH)
+    _table = table
+  return _table
+
+def _index(c):
+  if len(c) != 1 or not FIRST <= ord(c) <= LAST:
+    return None
+  return ord(c) - FIRST
+
+def name(c):
+  # The Unicode name of c, or None if c is not an assigned cuneiform code
+  # point.
+  index = _index(c)
+  if index is None:
+    return None
+  return _loaded().names[index] or None
+
+def short_name(c):
+  # The Unicode name without the CUNEIFORM ... SIGN prefix, for diagnostics.
+  full_name = name(c)
+  if full_name is None:
+    return c
+  for prefix in _PREFIXES:
+    if full_name.startswith(prefix):
+      return full_name[len(prefix):]
+  return full_name
+
+def numeric(c):
+  # The numeric value of c, or None if it has none or is not a cuneiform code
+  # point.
+  index = _index(c)
+  if index is None:
+    return None
+  value = _loaded().numerics[index]
+  return None if math.isnan(value) else value
+
+def primary_readings(readings_by_sign):
+  # The primary readings of the cuneiform code points that are signs of
+  # readings_by_sign, by code point.
+  return {sign: readings[0].value for sign, readings in readings_by_sign.items()
+          if readings and _index(sign) is not None}
+
+def primary_reading(c):
+  # The first reading of c in the dictionary, as its value in sign_list.csv,
+  # or None.  May build the dictionary if the snapshot is stale.
+  index = _index(c)
+  if index is None:
+    return None
+  table = _loaded()
+  if not table.readings_checked:
+    import snapshot
+    readings_hash = snapshot.input_hash()
+    if table.readings is None or table.readings_hash != readings_hash:
+      table.build_readings(readings_hash)
+      table.save(TABLE_PATH)
+    table.readings_checked = True
+  return table.readings[index] or None
+
+def describe(sign, readings=None):
+  # The (code point, Unicode name, numeric value, primary reading) of each
+  # character of sign.  readings, if given, are the primary_readings of the
+  # dictionary, which is then neither loaded nor built.
+  return [(c, name(c), numeric(c),
+           primary_reading(c) if readings is None else readings.get(c))
+          for c in sign]
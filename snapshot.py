@@ -0,0 +1,107 @@
+﻿import hashlib
+import marshal
+import os
+
+import remaps
+import sign_list_sources
+
+# Bump this whenever the layout of the snapshot changes.
+SNAPSHOT_VERSION = 1
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(DIRECTORY, 'sign_list.snapshot')
+
+# The model depends on the scripts as much as on the sign list, so changing
+# any of these invalidates the snapshot, as does changing the local remaps or
+# the supplementary sign lists of sign_list_sources.
+INPUTS = ['sign_list.csv', 'numbers.py', 'read_sign_list.py', 'remaps.py',
+          'sign_list_sources.py']
+
+def input_hash():
+  digest = hashlib.sha256()
+  local_remaps = ([remaps.LOCAL_REMAPS_PATH]
+                  if os.path.exists(remaps.LOCAL_REMAPS_PATH) else [])
+  for name in INPUTS + local_remaps + sign_list_sources.input_paths():
+    path = os.path.join(DIRECTORY, name)
+    with open(path, 'rb') as file:
+      content = file.read()
+    # Relative, so that moving the checkout keeps the snapshot valid.
+    digest.update(os.path.relpath(path, DIRECTORY).encode('utf-8'))
+    digest.update(len(content).to_bytes(8, 'little'))
+    digest.update(content)
+  return digest.hexdigest()
+
+def write(readings_by_sign, path=SNAPSHOT_PATH):
+  # The snapshot holds flat columns rather than one tuple per reading, which
+  # keeps marshal from allocating a container per reading on load.
+  # readings_by_composition is not stored: it is recomputed from
+  # readings_by_sign, in the same order as the build does.
+  signs = []
+  counts = []
+  columns = ([], [], [], [], [])
+  for sign, readings in readings_by_sign.items():
+    signs.append(sign)
+    counts.append(len(readings))
+    for reading in readings:
+      columns[0].append(reading.value)
+      columns[1].append(reading.comment)
+      columns[2].append(reading.source)
+      columns[3].append(reading.disambiguator)
+      columns[4].append(reading.šašková_index)
+  data = marshal.dumps((SNAPSHOT_VERSION, input_hash(), signs, counts) +
+                       tuple(columns))
+  # Write to a temporary file first, so that concurrent loaders never see a
+  # partial snapshot.
+  temporary_path = path + '.tmp'
+  with open(temporary_path, 'wb') as file:
+    file.write(data)
+  os.replace(temporary_path, path)
+
+def read(path=SNAPSHOT_PATH):
+  # Returns (readings_by_composition, readings_by_sign), or None if the
+  # snapshot is missing, from another version, or stale.
+  import read_sign_list
+  try:
+    with open(path, 'rb') as file:
+      data = marshal.loads(file.read())
+  except (OSError, EOFError, ValueError, TypeError):
+    return None
+  if (not isinstance(data, tuple) or len(data) != 9 or
+      data[0] != SNAPSHOT_VERSION or data[1] != input_hash()):
+    return None
+  (_, _, signs, counts,
+   values, comments, sources, disambiguators, šašková_indices) = data
+  readings_by_sign = {}
+  i = 0
+  for sign, count in zip(signs, counts):
+    readings = readings_by_sign[sign] = []
+    for _ in range(count):
+      reading = read_sign_list.Reading(sign, šašková_indices[i])
+      reading.value = values[i]
+      reading.comment = comments[i]
+      reading.source = sources[i]
+      reading.disambiguator = disambiguators[i]
+      readings.append(reading)
+      i += 1
+  readings_by_composition = {}
+  for readings in readings_by_sign.values():
+    for reading in readings:
+      readings_by_composition.setdefault(reading.composition(), []).append(
+          reading)
+  return readings_by_composition, readings_by_sign
+
+def load(path=SNAPSHOT_PATH):
+  # Returns (readings_by_composition, readings_by_sign), from the snapshot if
+  # it is up to date, otherwise by rebuilding the dictionary, in which case the
+  # snapshot is rewritten.
+  model = read(path)
+  if model is not None:
+    return model
+  import read_sign_list
+  read_sign_list.build()
+  try:
+    write(read_sign_list.readings_by_sign, path)
+  except OSError:
+    pass  # A read-only install still gets the rebuilt model.
+  return (read_sign_list.readings_by_composition,
+          read_sign_list.readings_by_sign)
@@ -0,0 +1,72 @@
+﻿import re
+
+# Writes the IME dictionary as a constexpr C++ array, for use by
+# 𒄑𒂅𒌋/static_dictionary.cpp, so that the IME need not read nor parse
+# sign_list.txt.  CTableDictionaryEngine does not use it yet: it still scans
+# sign_list.txt, case-insensitively.
+#
+# The prefix ranges are found by bisection at run time rather than emitted with
+# the table: they would take an entry per prefix, more than the table has
+# compositions, to save a few comparisons per keystroke.
+# static_dictionary_check checks the generated table and its lookups, prefix
+# ranges included, against the Python model.
+
+HEADER = '''\
+// Generated by read_sign_list.py from sign_list.csv; do not edit.
+// The entries are sorted by UTF-16 code units, so that a composition can be
+// found by binary search, and the compositions with a given prefix form a
+// contiguous range.  Their ranks are their positions in candidate order.
+
+#pragma once
+
+#include <array>
+
+#include "𒄑𒂅𒌋/static_dictionary.h"
+
+namespace 𒄑𒂅𒌋 {
+
+inline constexpr std::array<StaticDictionaryEntry, %d> static_dictionary{{
+'''
+
+FOOTER = '''\
+}};
+
+}  // namespace 𒄑𒂅𒌋
+'''
+
+ENTRY = '    {L"%s", L"%s", %d},\n'
+
+def utf16_order(entry):
+  # The order of std::wstring_view on Windows.  For compositions this is the
+  # same as the order of Python strings, since they lie in the BMP.
+  return entry[0].encode('utf-16-be')
+
+def sorted_entries(entries):
+  # Given the (composition, sign) pairs in candidate order, returns
+  # (composition, sign, rank) triples in table order.
+  return sorted(((composition, sign, rank)
+                 for rank, (composition, sign) in enumerate(entries)),
+                key=utf16_order)
+
+def write(entries, path):
+  entries = sorted_entries(entries)
+  for composition, sign, _ in entries:
+    if any(c in '"\\' for c in composition + sign):
+      raise ValueError('Cannot write %s=%s as a C++ literal' % (
+          composition, sign))
+  # The BOM lets MSVC read the file as UTF-8.
+  with open(path, 'w', encoding='utf-8-sig', newline='\n') as file:
+    file.write(HEADER % len(entries))
+    for entry in entries:
+      file.write(ENTRY % entry)
+    file.write(FOOTER)
+  # Sanity check: the table must round-trip to the dictionary.
+  if read(path) != entries:
+    raise ValueError('%s does not match the dictionary' % path)
+
+def read(path):
+  with open(path, encoding='utf-8-sig') as file:
+    return [(composition, sign, int(rank))
+            for composition, sign, rank in re.findall(
+                r'^    \{L"([^"]*)", L"([^"]*)", (\d+)\},$',
+                file.read(), re.MULTILINE)]
@@ -0,0 +1,152 @@
+﻿import argparse
+import bisect
+import os
+import subprocess
+import sys
+import tempfile
+
+import read_sign_list
+import snapshot
+import static_dictionary
+import transcription_check
+
+# Checks the generated 𒄑𒂅𒌋/static_dictionary_table.h against the Python
+# model: the table must hold the entries of read_sign_list.dictionary_entries
+# in UTF-16 order with their ranks in candidate order, and the lookups of
+# 𒄑𒂅𒌋/static_dictionary.cpp over it, which the generator does not run, must
+# find every composition and, for every prefix of a composition, exactly the
+# compositions with that prefix.
+#
+# The lookups are emulated in Python as in the C++, by bisection of the table
+# in UTF-16 order; with --cpp, the C++ itself is compiled and run on the
+# generated table, as by transcription_check.
+
+TABLE_PATH = os.path.join(transcription_check.SAMPLE_IME_DIRECTORY, '𒄑𒂅𒌋',
+                          'static_dictionary_table.h')
+
+# Reads UTF-8 queries, one per line, on stdin; prints for each the sign that
+# LookUpComposition finds, or an empty line, and the positions in the table of
+# the range that EntriesWithPrefix returns.
+DRIVER = r'''
+#include <codecvt>
+#include <iostream>
+#include <locale>
+#include <string>
+
+#include "𒄑𒂅𒌋/static_dictionary.cpp"
+
+int main() {
+  std::wstring_convert<std::codecvt_utf8<wchar_t>> utf8;
+  std::string line;
+  while (std::getline(std::cin, line)) {
+    std::wstring const query = utf8.from_bytes(line);
+    auto const sign = 𒄑𒂅𒌋::LookUpComposition(query);
+    auto const entries = 𒄑𒂅𒌋::EntriesWithPrefix(query);
+    std::cout << (sign ? utf8.to_bytes(std::wstring(*sign)) : "") << '\t'
+              << entries.data() - 𒄑𒂅𒌋::static_dictionary.data() << '\t'
+              << entries.data() + entries.size() -
+                     𒄑𒂅𒌋::static_dictionary.data() << '\n';
+  }
+}
+'''
+
+def prefixes(entries):
+  # The prefixes of the compositions, including the empty one, and the
+  # compositions themselves.
+  return sorted({composition[:length] for composition, _ in entries
+                 for length in range(len(composition) + 1)})
+
+def table_lookups(table, queries):
+  # The (sign or '', begin, end) of LookUpComposition and EntriesWithPrefix
+  # for each query, emulated over the (composition, sign, rank) triples of
+  # the table.
+  keys = [static_dictionary.utf16_order(entry) for entry in table]
+  results = []
+  for query in queries:
+    key = query.encode('utf-16-be')
+    begin = bisect.bisect_left(keys, key)
+    end = begin
+    while end < len(keys) and keys[end].startswith(key):
+      end += 1
+    found = begin < len(table) and table[begin][0] == query
+    results.append((table[begin][1] if found else '', begin, end))
+  return results
+
+def cpp_lookups(table_path, queries):
+  # As table_lookups, by the C++ over the table at table_path.
+  with tempfile.TemporaryDirectory() as directory:
+    # The table is included from the 𒄑𒂅𒌋 directory of the include path.
+    os.mkdir(os.path.join(directory, '𒄑𒂅𒌋'))
+    with open(table_path, 'rb') as source, open(
+        os.path.join(directory, '𒄑𒂅𒌋', 'static_dictionary_table.h'),
+        'wb') as copy:
+      copy.write(source.read())
+    driver = os.path.join(directory, 'driver.cpp')
+    binary = os.path.join(directory, 'driver')
+    with open(driver, 'w', encoding='utf-8') as file:
+      file.write(DRIVER)
+    subprocess.run([transcription_check.compiler(), '-std=c++20', '-O1', '-w',
+                    '-I', directory,
+                    '-I', transcription_check.SAMPLE_IME_DIRECTORY,
+                    driver, '-o', binary], check=True)
+    output = subprocess.run(
+        [binary], input=''.join(query + '\n' for query in queries).encode(
+            'utf-8'), capture_output=True, check=True).stdout.decode('utf-8')
+  return [(sign, int(begin), int(end)) for sign, begin, end in
+          (line.split('\t') for line in output.split('\n')[:len(queries)])]
+
+def check(entries, table_path, cpp=False):
+  # The lines describing the divergences between the table at table_path and
+  # the (composition, sign) pairs in candidate order.
+  table = static_dictionary.read(table_path)
+  expected_table = static_dictionary.sorted_entries(entries)
+  if table != expected_table:
+    first = next((i for i, (entry, expected) in enumerate(
+                      zip(table, expected_table)) if entry != expected),
+                 min(len(table), len(expected_table)))
+    return ['%s has %d entries, expected %d, and differs at %d: %s vs. %s' % (
+        table_path, len(table), len(expected_table), first,
+        table[first] if first < len(table) else None,
+        expected_table[first] if first < len(expected_table) else None)]
+  signs = dict(entries)
+  queries = prefixes(entries)
+  lookups = [('Python', table_lookups(table, queries))]
+  if cpp:
+    lookups.append(('C++', cpp_lookups(table_path, queries)))
+  divergences = []
+  for name, results in lookups:
+    for query, (sign, begin, end) in zip(queries, results):
+      # The completions, in candidate order, as the IME shows them.
+      completions = [composition for composition, _, _ in
+                     sorted(table[begin:end], key=lambda entry: entry[2])]
+      expected = [composition for composition, _ in entries
+                  if composition.startswith(query)]
+      if sign != signs.get(query, '') or completions != expected:
+        divergences.append(
+            '%s: %s finds %r and %d completions, expected %r and %d' % (
+                name, query, sign, len(completions), signs.get(query, ''),
+                len(expected)))
+  return divergences
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Checks the generated static dictionary table against the '
+                  'Python model, including its lookups and prefix ranges.')
+  parser.add_argument('--table', default=TABLE_PATH)
+  parser.add_argument('--cpp', action='store_true',
+                      help='also compile and run 𒄑𒂅𒌋/static_dictionary.cpp '
+                           'over the table; requires a C++20 compiler')
+  parser.add_argument('--frequencies', type=read_sign_list.parse_frequencies,
+                      metavar='PATH',
+                      help='the frequency table with which the table was '
+                           'generated, if any')
+  args = parser.parse_args()
+  readings_by_composition, _ = snapshot.load()
+  entries = read_sign_list.dictionary_entries(readings_by_composition,
+                                              args.frequencies)
+  divergences = check(entries, args.table, args.cpp)
+  for divergence in divergences[:20]:
+    print(divergence)
+  print('%d entries, %d prefixes, %d divergences' % (
+      len(entries), len(prefixes(entries)), len(divergences)))
+  sys.exit(1 if divergences else 0)
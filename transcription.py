@@ -0,0 +1,91 @@
+﻿# A port of the candidate ordering from 𒄑𒂅𒌋/transcription.cpp, so that the
+# dictionary can be written in the order in which the IME presents candidates.
+# Keep this in sync with 𒄑𒂅𒌋::OrderingKey; transcription_check.py compares
+# the two on every composition of the dictionary.
+
+import functools
+
+ʾALEPH = 'ʾ'
+
+# Publication years, by source disambiguator; see 𒄑𒂅𒌋::Sources().
+SOURCE_DATES = {
+  'A': 1978,  # Borger, ABZ.
+  'L': 1976,  # Labat.
+  'M': 2004,  # Borger, MesZL.
+}
+
+ALPHABET = {
+  c: i for i, c in enumerate([
+      'a', 'b', 'd', 'e', 'g', 'ḫ', 'i', 'j', 'k', 'l', 'm', 'n',
+      'p', 'q', 'r', 's', 'ṣ', 'š', 't', 'ṭ', 'u', 'w', 'z', ʾALEPH])
+}
+
+# std::numeric_limits<int>::max(), the key of ₓ.
+INT_MAX = 2 ** 31 - 1
+
+READING_NUMERIC = 'ReadingNumeric'
+FRACTION_SLASH = 'FractionSlash'
+READING_ALPHABETIC = 'ReadingAlphabetic'
+SOURCE = 'Source'
+VARIANT = 'Variant'
+
+def ordering_key(composition):
+  # Compares like the std::tuple returned by 𒄑𒂅𒌋::OrderingKey; the
+  # std::optional source order is a tuple that is empty when it has no value.
+  # See the C++ for the treatment of fractions.
+  reading = []
+  source_order = ()
+  variant = 0
+  last_category = None
+  for c in composition:
+    if c in ALPHABET:
+      if last_category != READING_ALPHABETIC:
+        reading.append([])
+      reading[-1].append(ALPHABET[c])
+      last_category = READING_ALPHABETIC
+    elif '0' <= c <= '9':
+      if last_category == VARIANT:
+        variant = variant * 10 + int(c)
+      else:
+        if last_category == READING_NUMERIC:
+          reading[-1][-1] *= 10
+        elif last_category == FRACTION_SLASH:
+          reading[-1].append(0)
+        else:
+          reading.append([0])
+        reading[-1][-1] += int(c)
+        last_category = READING_NUMERIC
+    elif c == 'x':
+      reading.append([INT_MAX])
+      last_category = READING_NUMERIC
+    elif c in SOURCE_DATES:
+      source_order = (-SOURCE_DATES[c],)
+      last_category = SOURCE
+    elif c == '/':
+      last_category = FRACTION_SLASH
+    elif c == 'v':
+      last_category = VARIANT
+  # The C++ compares alphabet indices to the code point of ʾ here, so that it
+  # drops the number 702 rather than the aleph (see the TODO there); we do the
+  # same so that the orders agree.
+  alephless_reading = [
+      [c for c in word if c != ord(ʾALEPH)] for word in reading]
+  return (alephless_reading, reading, source_order, variant)
+
+def inputs_ordered(left, right):
+  return ordering_key(left) < ordering_key(right)
+
+# Cached, since rebuilds in read_sign_list.py --watch sort mostly the same
+# compositions every time.
+@functools.lru_cache(maxsize=None)
+def candidate_order(composition):
+  # Distinct compositions may have the same ordering key, e.g., the
+  # punctuation : and ⫶; break ties by the composition itself so that the
+  # output is deterministic.
+  return ordering_key(composition), composition
+
+# Sanity check, from the comment in 𒄑𒂅𒌋::OrderingKey.
+_FRACTIONS_IN_ORDER = ['1', '1iku', '1/2', '1/2iku', '1/4', '1/4iku', '2']
+if sorted(_FRACTIONS_IN_ORDER, key=ordering_key) != _FRACTIONS_IN_ORDER:
+  raise ValueError('Unexpected order %s' %
+                   sorted(_FRACTIONS_IN_ORDER, key=ordering_key))
@@ -0,0 +1,153 @@
+﻿import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import read_sign_list
+import snapshot
+import transcription
+
+# Checks that transcription.py orders the compositions as the IME does, by
+# compiling 𒄑𒂅𒌋/transcription.cpp with a driver that prints its OrderingKey
+# for every composition of the dictionary, and comparing these keys with those
+# of transcription.ordering_key.  The IME shows the candidates in the order of
+# sign_list.txt without sorting them, so a divergence changes what users see.
+#
+# The driver also sorts the compositions, given in candidate order, with
+# InputsOrdered, stably; since ties keep their order, the result must be the
+# candidate order itself.
+
+SAMPLE_IME_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'Samples', 'IME', 'cpp', 'SampleIME')
+
+# Reads UTF-8 compositions, one per line, on stdin; prints the OrderingKey of
+# each, then a line with the compositions in the order of InputsOrdered, by
+# their positions in the input.  A key is printed as its readings, words
+# separated by / and integers by dots, and its alephless readings, source
+# order, and variant, separated by |; an absent source order is empty.
+DRIVER = r'''
+#include <algorithm>
+#include <codecvt>
+#include <iostream>
+#include <locale>
+#include <numeric>
+#include <string>
+#include <vector>
+
+#include "𒄑𒂅𒌋/transcription.cpp"
+
+namespace {
+
+std::string Format(std::vector<std::vector<int>> const& reading) {
+  std::string result;
+  for (int i = 0; i < reading.size(); ++i) {
+    if (i > 0) {
+      result += '/';
+    }
+    for (int j = 0; j < reading[i].size(); ++j) {
+      if (j > 0) {
+        result += '.';
+      }
+      result += std::to_string(reading[i][j]);
+    }
+  }
+  return result;
+}
+
+}  // namespace
+
+int main() {
+  std::wstring_convert<std::codecvt_utf8<wchar_t>> utf8;
+  std::vector<std::wstring> compositions;
+  std::string line;
+  while (std::getline(std::cin, line)) {
+    compositions.push_back(utf8.from_bytes(line));
+  }
+  for (auto const& composition : compositions) {
+    auto const& [alephless_reading, reading, source_order, variant] =
+        𒄑𒂅𒌋::OrderingKey(composition);
+    std::cout << Format(alephless_reading) << '|' << Format(reading) << '|'
+              << (source_order ? std::to_string(*source_order) : "") << '|'
+              << variant << '\n';
+  }
+  std::vector<int> order(compositions.size());
+  std::iota(order.begin(), order.end(), 0);
+  std::stable_sort(order.begin(), order.end(), [&](int left, int right) {
+    return 𒄑𒂅𒌋::InputsOrdered(compositions[left], compositions[right]);
+  });
+  for (int const i : order) {
+    std::cout << i << ' ';
+  }
+  std::cout << '\n';
+}
+'''
+
+def _format(reading):
+  return '/'.join('.'.join(str(c) for c in word) for word in reading)
+
+def format_key(key):
+  # The key of transcription.ordering_key as printed by the driver.
+  alephless_reading, reading, source_order, variant = key
+  return '%s|%s|%s|%d' % (_format(alephless_reading), _format(reading),
+                          source_order[0] if source_order else '', variant)
+
+def compiler():
+  result = os.environ.get('CXX') or shutil.which('g++') or shutil.which(
+      'clang++')
+  if not result:
+    raise ValueError('No C++ compiler; set CXX')
+  return result
+
+def cpp_keys(compositions):
+  # The ordering keys of the compositions, as printed by the driver, and the
+  # positions of the compositions in the order of InputsOrdered.
+  with tempfile.TemporaryDirectory() as directory:
+    source = os.path.join(directory, 'driver.cpp')
+    binary = os.path.join(directory, 'driver')
+    with open(source, 'w', encoding='utf-8') as file:
+      file.write(DRIVER)
+    subprocess.run([compiler(), '-std=c++20', '-O1', '-w',
+                    '-I', SAMPLE_IME_DIRECTORY, source, '-o', binary],
+                   check=True)
+    output = subprocess.run(
+        [binary], input=''.join(c + '\n' for c in compositions).encode(
+            'utf-8'), capture_output=True, check=True).stdout.decode('utf-8')
+  *keys, order = output.split('\n')[:len(compositions) + 1]
+  return keys, [int(i) for i in order.split()]
+
+def check(compositions):
+  # The lines describing the divergences between transcription.py and
+  # transcription.cpp on the compositions, given in candidate order.
+  keys, order = cpp_keys(compositions)
+  divergences = []
+  for composition, key in zip(compositions, keys):
+    expected = format_key(transcription.ordering_key(composition))
+    if key != expected:
+      divergences.append('%s: OrderingKey %s, ordering_key %s' % (
+          composition, key, expected))
+  if order != list(range(len(compositions))):
+    first = next(rank for rank, i in enumerate(order) if i != rank)
+    divergences.append(
+        'InputsOrdered puts %s at rank %d, where the dictionary has %s' % (
+            compositions[order[first]], first, compositions[first]))
+  return divergences
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Checks that the candidate order of transcription.py '
+                  'agrees with 𒄑𒂅𒌋/transcription.cpp on every composition '
+                  'of the dictionary; requires a C++20 compiler, $CXX, g++, '
+                  'or clang++.')
+  parser.parse_args()
+  readings_by_composition, _ = snapshot.load()
+  compositions = [composition for composition, _ in
+                  read_sign_list.dictionary_entries(readings_by_composition)]
+  divergences = check(compositions)
+  for divergence in divergences[:20]:
+    print(divergence)
+  print('%d compositions, %d divergences' % (len(compositions),
+                                             len(divergences)))
+  sys.exit(1 if divergences else 0)
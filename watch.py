@@ -0,0 +1,36 @@
+﻿import os
+import time
+
+# Polls files for modifications, for read_sign_list.py --watch.
+
+def _stamp(path):
+  try:
+    status = os.stat(path)
+  except OSError:
+    return None
+  return status.st_mtime_ns, status.st_size
+
+def watch(paths, on_change, interval=0.1, debounce=0.3):
+  # Calls on_change with the set of the paths that changed, once the files
+  # have not changed for debounce seconds, so that a burst of saves results in
+  # a single call.  paths is a list of paths, or a function returning one,
+  # which is called again after each call of on_change, so that the files
+  # watched may depend on those that changed.  Never returns.
+  current_paths = paths if callable(paths) else lambda: paths
+  stamps = {path: _stamp(path) for path in current_paths()}
+  changed = set()
+  last_change = None
+  while True:
+    time.sleep(interval)
+    for path in stamps:
+      stamp = _stamp(path)
+      if stamp != stamps[path]:
+        stamps[path] = stamp
+        changed.add(path)
+        last_change = time.monotonic()
+    if changed and time.monotonic() - last_change >= debounce:
+      on_change(changed)
+      changed = set()
+      # The files that are newly watched were read by on_change as they are.
+      stamps = {path: stamps[path] if path in stamps else _stamp(path)
+                for path in current_paths()}